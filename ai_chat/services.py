@@ -595,6 +595,7 @@ def _gather_quote_delivery_data_for_followup_ids(followup_ids, user):
         [user],
         actor=user,
         record_limit=None,
+        sections=('delivery', 'quote'),
     )
     for ledger in [account_ledger]:
         for record in ledger.get('quoteRecords') or []:
@@ -798,6 +799,10 @@ def _email_log_address(email, primary, fallback):
 
 
 def _email_log_body_text(email, limit=700):
+    from reporting.services.email_text import email_text_is_current
+
+    if email_text_is_current(email) and email.body_text:
+        return _compact_memory_text(email.body_text, limit)
     body = email.body or ''
     if not body and email.body_html:
         body = re.sub(r'<[^>]+>', ' ', email.body_html)
@@ -835,8 +840,8 @@ def gather_email_data_for_followups(followups, user, months=6, limit=20):
     기존 EmailLog의 FollowUp/Schedule 연결만 사용하며, 고객이 보낸 수신 메일을 우선한다.
     영업 담당자가 보낸 메일은 고객 답장 스레드 맥락 또는 최근 발신 맥락으로 최대 2건만 포함한다.
     """
-    from django.db.models import Q
     from reporting.models import EmailLog
+    from reporting.services.email_index import VISIBLE_IN_ANALYSIS, emails_in_order, recent_email_ids
 
     followup_list = list(followups)
     followup_ids = [followup.id for followup in followup_list if followup and followup.id]
@@ -852,25 +857,17 @@ def gather_email_data_for_followups(followups, user, months=6, limit=20):
         }
 
     cutoff_dt = timezone.now() - timedelta(days=months * 30)
-    qs = EmailLog.objects.filter(
-        Q(followup_id__in=followup_ids)
-        | Q(schedule__followup_id__in=followup_ids)
-    ).filter(
-        Q(received_at__gte=cutoff_dt)
-        | Q(sent_at__gte=cutoff_dt)
-        | Q(created_at__gte=cutoff_dt)
-    ).filter(
-        Q(followup__user=user)
-        | Q(schedule__followup__user=user)
-        | Q(user=user)
-        | Q(sender=user)
-    ).exclude(
-        is_trashed=True,
-    ).select_related(
-        'followup',
-        'schedule',
-        'schedule__followup',
-    ).distinct().order_by('-received_at', '-sent_at', '-created_at')[:max(limit * 3, limit)]
+    email_ids = recent_email_ids(
+        user,
+        visible_in=VISIBLE_IN_ANALYSIS,
+        followup_ids=followup_ids,
+        since=cutoff_dt,
+        limit=max(limit * 3, limit),
+    )
+    qs = emails_in_order(
+        email_ids,
+        EmailLog.objects.select_related('followup', 'schedule', 'schedule__followup'),
+    )
 
     rows = []
     for email in qs:
@@ -1304,6 +1301,7 @@ def gather_prepayment_data(followups):
         followup_list,
         scope_users,
         record_limit=None,
+        sections=('prepayment', 'usage'),
     )
 
     result = []
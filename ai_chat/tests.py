@@ -441,81 +441,82 @@ class AIEmailAndStageActionContextTests(TestCase):
             meeting_researcher_quote='다음 미팅 전에 제품 자료를 보내주세요.',
         )
         now = timezone.now()
-        EmailLog.objects.create(
-            user=user,
-            sender=user,
-            followup=quote_followup,
-            email_type='sent',
-            is_sent=True,
-            status='sent',
-            from_email='sales@example.com',
-            to_email='customer@example.com',
-            sender_email='sales@example.com',
-            recipient_email='customer@example.com',
-            subject='견적 조건 안내',
-            body='먼저 보낸 견적 조건 안내입니다.',
-            thread_id='thread-quote',
-            sent_at=now - timedelta(minutes=2),
-        )
-        EmailLog.objects.create(
-            user=user,
-            sender=user,
-            followup=meeting_followup,
-            email_type='sent',
-            is_sent=True,
-            status='sent',
-            from_email='sales@example.com',
-            to_email='meeting@example.com',
-            sender_email='sales@example.com',
-            recipient_email='meeting@example.com',
-            subject='비교표 전달',
-            body='최근 보낸 제품 비교표입니다.',
-            thread_id='thread-meeting-outbound',
-            sent_at=now - timedelta(minutes=3),
-        )
-        EmailLog.objects.create(
-            user=user,
-            sender=user,
-            followup=meeting_followup,
-            email_type='sent',
-            is_sent=True,
-            status='sent',
-            from_email='sales@example.com',
-            to_email='meeting@example.com',
-            sender_email='sales@example.com',
-            recipient_email='meeting@example.com',
-            subject='제외될 세 번째 발신',
-            body='세 번째 발신은 AI 컨텍스트에서 제외되어야 합니다.',
-            thread_id='thread-old-outbound',
-            sent_at=now - timedelta(minutes=4),
-        )
-        EmailLog.objects.create(
-            user=user,
-            followup=quote_followup,
-            email_type='received',
-            is_sent=False,
-            status='received',
-            from_email='customer@example.com',
-            to_email='sales@example.com',
-            sender_email='customer@example.com',
-            recipient_email='sales@example.com',
-            subject='견적 검토 회신',
-            body='가격 조정 가능 여부와 5월 말 납기 가능 여부를 확인 부탁드립니다.',
-            thread_id='thread-quote',
-            received_at=now,
-        )
-        EmailLog.objects.create(
-            user=user,
-            followup=meeting_followup,
-            email_type='received',
-            is_sent=False,
-            status='received',
-            from_email='meeting@example.com',
-            to_email='sales@example.com',
-            subject='미팅 후 자료 요청',
-            body='미팅에서 설명한 제품 비교표와 다음 미팅 가능 일정을 보내주세요.',
-            received_at=now - timedelta(minutes=1),
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            EmailLog.objects.create(
+                user=user,
+                sender=user,
+                followup=quote_followup,
+                email_type='sent',
+                is_sent=True,
+                status='sent',
+                from_email='sales@example.com',
+                to_email='customer@example.com',
+                sender_email='sales@example.com',
+                recipient_email='customer@example.com',
+                subject='견적 조건 안내',
+                body='먼저 보낸 견적 조건 안내입니다.',
+                thread_id='thread-quote',
+                sent_at=now - timedelta(minutes=2),
+            )
+            EmailLog.objects.create(
+                user=user,
+                sender=user,
+                followup=meeting_followup,
+                email_type='sent',
+                is_sent=True,
+                status='sent',
+                from_email='sales@example.com',
+                to_email='meeting@example.com',
+                sender_email='sales@example.com',
+                recipient_email='meeting@example.com',
+                subject='비교표 전달',
+                body='최근 보낸 제품 비교표입니다.',
+                thread_id='thread-meeting-outbound',
+                sent_at=now - timedelta(minutes=3),
+            )
+            EmailLog.objects.create(
+                user=user,
+                sender=user,
+                followup=meeting_followup,
+                email_type='sent',
+                is_sent=True,
+                status='sent',
+                from_email='sales@example.com',
+                to_email='meeting@example.com',
+                sender_email='sales@example.com',
+                recipient_email='meeting@example.com',
+                subject='제외될 세 번째 발신',
+                body='세 번째 발신은 AI 컨텍스트에서 제외되어야 합니다.',
+                thread_id='thread-old-outbound',
+                sent_at=now - timedelta(minutes=4),
+            )
+            EmailLog.objects.create(
+                user=user,
+                followup=quote_followup,
+                email_type='received',
+                is_sent=False,
+                status='received',
+                from_email='customer@example.com',
+                to_email='sales@example.com',
+                sender_email='customer@example.com',
+                recipient_email='sales@example.com',
+                subject='견적 검토 회신',
+                body='가격 조정 가능 여부와 5월 말 납기 가능 여부를 확인 부탁드립니다.',
+                thread_id='thread-quote',
+                received_at=now,
+            )
+            EmailLog.objects.create(
+                user=user,
+                followup=meeting_followup,
+                email_type='received',
+                is_sent=False,
+                status='received',
+                from_email='meeting@example.com',
+                to_email='sales@example.com',
+                subject='미팅 후 자료 요청',
+                body='미팅에서 설명한 제품 비교표와 다음 미팅 가능 일정을 보내주세요.',
+                received_at=now - timedelta(minutes=1),
+            )
         analysis = AIDepartmentAnalysis.objects.create(user=user, department=department)
         captured = {}
 
@@ -564,18 +565,19 @@ class AIEmailAndStageActionContextTests(TestCase):
         followup = FollowUp.objects.get(user=user, department=department)
         followup.pipeline_stage = 'quote'
         followup.save(update_fields=['pipeline_stage'])
-        EmailLog.objects.create(
-            user=user,
-            followup=followup,
-            email_type='received',
-            is_sent=False,
-            status='received',
-            from_email='buyer@example.com',
-            to_email='sales@example.com',
-            subject='견적 답장',
-            body='예산은 가능하지만 결제 조건과 납기 일정을 다시 받고 싶습니다.',
-            received_at=timezone.now(),
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            EmailLog.objects.create(
+                user=user,
+                followup=followup,
+                email_type='received',
+                is_sent=False,
+                status='received',
+                from_email='buyer@example.com',
+                to_email='sales@example.com',
+                subject='견적 답장',
+                body='예산은 가능하지만 결제 조건과 납기 일정을 다시 받고 싶습니다.',
+                received_at=timezone.now(),
+            )
         analysis = AIDepartmentAnalysis.objects.create(user=user, department=department)
         captured = {}
 
@@ -0,0 +1,53 @@
+/**
+ * vite build 직후 dist/assets의 압축 가능한 파일 옆에 .br/.gz를 미리 만들어 둔다.
+ * Django(sales_project.frontend_views.react_asset)는 이 파일을 그대로 내려보내므로
+ * 요청 스레드에서 번들을 다시 압축하지 않는다. 의존성 없이 node:zlib만 사용.
+ */
+import { brotliCompressSync, constants as zlibConstants, gzipSync } from 'node:zlib';
+import { existsSync, readdirSync, readFileSync, statSync, writeFileSync } from 'node:fs';
+import { extname, join } from 'node:path';
+import { fileURLToPath } from 'node:url';
+
+const __dirname = fileURLToPath(new URL('.', import.meta.url));
+const assetsDir = join(__dirname, '..', 'dist', 'assets');
+
+// sales_project/frontend_views.py 의 COMPRESSIBLE_EXTENSIONS 와 맞춘다.
+const compressibleExtensions = new Set(['.css', '.html', '.js', '.json', '.map', '.svg', '.txt']);
+
+function walk(dir) {
+  return readdirSync(dir, { withFileTypes: true }).flatMap((entry) => {
+    const fullPath = join(dir, entry.name);
+    return entry.isDirectory() ? walk(fullPath) : [fullPath];
+  });
+}
+
+if (!existsSync(assetsDir)) {
+  console.log(`precompress: ${assetsDir} 없음, 건너뜀`);
+  process.exit(0);
+}
+
+let count = 0;
+for (const filePath of walk(assetsDir)) {
+  if (!compressibleExtensions.has(extname(filePath))) {
+    continue;
+  }
+  const source = readFileSync(filePath);
+  const sourceMtime = statSync(filePath).mtimeMs;
+  const variants = [
+    [`${filePath}.br`, () => brotliCompressSync(source, {
+      params: {
+        [zlibConstants.BROTLI_PARAM_QUALITY]: zlibConstants.BROTLI_MAX_QUALITY,
+        [zlibConstants.BROTLI_PARAM_SIZE_HINT]: source.length,
+      },
+    })],
+    [`${filePath}.gz`, () => gzipSync(source, { level: 9 })],
+  ];
+  for (const [targetPath, compress] of variants) {
+    if (existsSync(targetPath) && statSync(targetPath).mtimeMs >= sourceMtime) {
+      continue;
+    }
+    writeFileSync(targetPath, compress());
+  }
+  count += 1;
+}
+console.log(`precompress: ${count}개 자산의 .br/.gz 생성`);
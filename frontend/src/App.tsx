@@ -168,6 +168,7 @@ import type {
   CustomersData,
 } from './api/accounts';
 import {
+  CUSTOMER_DETAIL_LAZY_SECTIONS,
   createCompany as createCompanyRecord,
   createCustomer as createCustomerRecord,
   createDepartment as createDepartmentRecord,
@@ -177,6 +178,7 @@ import {
   loadAccountDetailData,
   loadCustomerDetailData,
   loadCustomersData,
+  mergeCustomerDetailSections,
   saveAccountContact,
   updateAccountInfo,
   updateCompany as updateCompanyRecord,
@@ -14825,15 +14827,25 @@ export function App() {
     }
     let alive = true;
     setCustomerDetailLoading(true);
+    // 고객 상세는 핵심 구간을 먼저 그리고, 원장·첨부·선결제는 이어서 따로 불러온다.
     const detailRequest = accountDetailId
       ? loadAccountDetailData(accountDetailId)
-      : loadCustomerDetailData(customerDetailId as number);
+      : loadCustomerDetailData(customerDetailId as number, ['core']);
     detailRequest.then((data) => {
       if (!alive) {
         return;
       }
       setCustomerDetailData(data);
       setCustomerDetailLoading(false);
+      if (accountDetailId || data.error) {
+        return;
+      }
+      loadCustomerDetailData(customerDetailId as number, CUSTOMER_DETAIL_LAZY_SECTIONS).then((sectionsData) => {
+        if (!alive) {
+          return;
+        }
+        setCustomerDetailData((current) => (current ? mergeCustomerDetailSections(current, sectionsData) : current));
+      });
     });
     return () => {
       alive = false;
@@ -12,6 +12,7 @@ export type {
   CompanyManagementDepartment,
   CompanyManagementSalesman,
   CompanyManageResponse,
+  CompanyMoveTargetsData,
   CustomerAccountContact,
   CustomerAccountManagementConfig,
   CustomerAccountSummary,
@@ -38,6 +39,7 @@ export type {
 } from './legacy';
 
 export {
+  CUSTOMER_DETAIL_LAZY_SECTIONS,
   createCompany,
   createCustomer,
   createDepartment,
@@ -46,9 +48,12 @@ export {
   deleteDepartmentRecord,
   loadAccountDetailData,
   loadCompanyManagementData,
+  loadCompanyManagementDepartments,
   loadCustomerDetailData,
   loadCustomersData,
+  mergeCustomerDetailSections,
   saveAccountContact,
+  searchCompanyMoveTargets,
   updateAccountInfo,
   updateCompany,
   updateCustomer,
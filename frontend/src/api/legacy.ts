@@ -357,6 +357,14 @@ export type CompanyManagementData = {
     blockedCompanies: number;
     blockedDepartments: number;
   };
+  pagination: {
+    page: number;
+    pageSize: number;
+    totalPages: number;
+    totalCount: number;
+    hasNext: boolean;
+    hasPrevious: boolean;
+  };
   links: {
     companies: string;
     customers: string;
@@ -365,9 +373,15 @@ export type CompanyManagementData = {
     legacyCompanies: string;
     legacyManagerCompanies: string;
   };
+  expandedCompanyId: number | null;
   companies: CompanyManagementCompany[];
   departments: CompanyManagementDepartment[];
-  departmentMoveCompanies: CustomerCompanyOption[];
+};
+
+export type CompanyMoveTargetsData = {
+  companies: CustomerCompanyOption[];
+  hasMore: boolean;
+  error?: string;
 };
 
 export type CustomersData = {
@@ -3076,6 +3090,14 @@ const emptyCompanyManagementData: CompanyManagementData = {
     blockedCompanies: 0,
     blockedDepartments: 0,
   },
+  pagination: {
+    page: 1,
+    pageSize: 50,
+    totalPages: 1,
+    totalCount: 0,
+    hasNext: false,
+    hasPrevious: false,
+  },
   links: {
     companies: '/companies/',
     customers: '/customers/',
@@ -3084,9 +3106,9 @@ const emptyCompanyManagementData: CompanyManagementData = {
     legacyCompanies: '/reporting/companies/',
     legacyManagerCompanies: '/reporting/manager/companies/',
   },
+  expandedCompanyId: null,
   companies: [],
   departments: [],
-  departmentMoveCompanies: [],
 };
 
 const emptyCustomerDetailData: CustomerDetailData = {
@@ -4167,10 +4189,14 @@ function normalizeCompanyManagementCompany(company: CompanyManagementCompany): C
 export async function loadCompanyManagementData(params: {
   q?: string;
   departmentId?: string;
+  page?: number;
+  expandCompanyId?: number | null;
 } = {}): Promise<CompanyManagementData> {
   const query = new URLSearchParams();
   if (params.q) query.set('q', params.q);
   if (params.departmentId) query.set('department_id', params.departmentId);
+  if (params.page) query.set('page', String(params.page));
+  if (params.expandCompanyId) query.set('expand', String(params.expandCompanyId));
   try {
     const response = await fetch(`/reporting/api/companies/manage/${query.toString() ? `?${query.toString()}` : ''}`, {
       credentials: 'include',
@@ -4189,7 +4215,6 @@ export async function loadCompanyManagementData(params: {
       throw new Error(payload.error || payload.message || `Companies API unavailable: ${response.status}`);
     }
     const companies = (payload.companies ?? []).map(normalizeCompanyManagementCompany);
-    const departmentMoveCompanies = payload.departmentMoveCompanies ?? companies;
     return {
       ...emptyCompanyManagementData,
       ...payload,
@@ -4209,13 +4234,16 @@ export async function loadCompanyManagementData(params: {
         ...emptyCompanyManagementData.metrics,
         ...(payload.metrics ?? {}),
       },
+      pagination: {
+        ...emptyCompanyManagementData.pagination,
+        ...(payload.pagination ?? {}),
+      },
       links: normalizeHrefFields({
         ...emptyCompanyManagementData.links,
         ...(payload.links ?? {}),
       }, ['companies', 'customers', 'createCompany', 'createDepartment', 'legacyCompanies', 'legacyManagerCompanies']),
       companies,
-      departments: (payload.departments ?? companies.flatMap((company) => company.departments)).map(normalizeCompanyManagementDepartment),
-      departmentMoveCompanies,
+      departments: (payload.departments ?? []).map(normalizeCompanyManagementDepartment),
     };
   } catch (error) {
     return {
@@ -4226,6 +4254,52 @@ export async function loadCompanyManagementData(params: {
   }
 }
 
+export async function loadCompanyManagementDepartments(companyId: number): Promise<CompanyManagementDepartment[]> {
+  const response = await fetch(`/reporting/api/companies/manage/${companyId}/departments/`, {
+    credentials: 'include',
+    headers: {
+      Accept: 'application/json',
+    },
+  });
+  redirectIfLoginRequired(response);
+  const payload = (await response.json().catch(() => ({}))) as {
+    success?: boolean;
+    error?: string;
+    departments?: CompanyManagementDepartment[];
+  };
+  redirectIfLoginRequired(response, payload);
+  if (!response.ok || payload.success === false) {
+    throw new Error(payload.error || `Departments API unavailable: ${response.status}`);
+  }
+  return (payload.departments ?? []).map(normalizeCompanyManagementDepartment);
+}
+
+export async function searchCompanyMoveTargets(q: string, limit = 12): Promise<CompanyMoveTargetsData> {
+  const query = new URLSearchParams({ limit: String(limit) });
+  if (q) query.set('q', q);
+  try {
+    const response = await fetch(`/reporting/api/companies/manage/move-targets/?${query.toString()}`, {
+      credentials: 'include',
+      headers: {
+        Accept: 'application/json',
+      },
+    });
+    redirectIfLoginRequired(response);
+    const payload = (await response.json()) as CompanyMoveTargetsData & { success?: boolean };
+    redirectIfLoginRequired(response, payload);
+    if (!response.ok || payload.success === false) {
+      throw new Error(payload.error || `Move targets API unavailable: ${response.status}`);
+    }
+    return { companies: payload.companies ?? [], hasMore: Boolean(payload.hasMore) };
+  } catch (error) {
+    return {
+      companies: [],
+      hasMore: false,
+      error: error instanceof Error ? error.message : 'Move targets API unavailable',
+    };
+  }
+}
+
 export async function createCustomer(
   payload: CustomerCreatePayload,
   submitUrl = '/reporting/api/followups/create/',
@@ -4722,8 +4796,29 @@ async function loadCustomerDetailFromUrl(apiUrl: string, errorPrefix: string): P
   }
 }
 
-export async function loadCustomerDetailData(customerId: number): Promise<CustomerDetailData> {
-  return loadCustomerDetailFromUrl(`/reporting/api/customers/${customerId}/`, 'Customer detail');
+export const CUSTOMER_DETAIL_LAZY_SECTIONS = ['records', 'files', 'ledger'] as const;
+
+export async function loadCustomerDetailData(
+  customerId: number,
+  sections?: readonly string[],
+): Promise<CustomerDetailData> {
+  const query = sections?.length ? `?sections=${sections.join(',')}` : '';
+  return loadCustomerDetailFromUrl(`/reporting/api/customers/${customerId}/${query}`, 'Customer detail');
+}
+
+export function mergeCustomerDetailSections(
+  core: CustomerDetailData,
+  lazy: CustomerDetailData,
+): CustomerDetailData {
+  if (lazy.error) {
+    return { ...core, error: core.error || lazy.error };
+  }
+  return {
+    ...core,
+    prepaymentSummary: lazy.prepaymentSummary,
+    operationalRecords: lazy.operationalRecords,
+    attachments: lazy.attachments,
+  };
 }
 
 export async function loadAccountDetailData(departmentId: number): Promise<CustomerDetailData> {
@@ -2,6 +2,8 @@ import { assertSuccessfulJsonPayload, fetchJson } from './shared';
 
 export type RevenuePeriod = 'year' | 'quarter' | 'month';
 
+export type RevenueGrouping = 'account' | 'owner' | 'month' | 'product';
+
 export type RevenueDetailItem = {
   kind: 'delivery' | 'prepayment';
   date: string | null;
@@ -13,6 +15,21 @@ export type RevenueDetailItem = {
   href: string;
 };
 
+export type RevenueDetailGroup = {
+  key: string;
+  label: string;
+  total: number;
+  deliveryTotal: number;
+  prepaymentTotal: number;
+  itemCount: number;
+};
+
+export type RevenueDetailItemsPage = {
+  items: RevenueDetailItem[];
+  nextCursor: string | null;
+  hasMore: boolean;
+};
+
 export type RevenueDetailData = {
   success?: boolean;
   source: 'django' | 'unavailable';
@@ -24,13 +41,18 @@ export type RevenueDetailData = {
     end: string;
   };
   scope: { label: string };
+  grouping: {
+    value: RevenueGrouping;
+    label: string;
+    options: Array<{ value: RevenueGrouping; label: string }>;
+  };
   summary: {
     total: number;
     deliveryTotal: number;
     prepaymentTotal: number;
     itemCount: number;
   };
-  items: RevenueDetailItem[];
+  groups: RevenueDetailGroup[];
 };
 
 const emptyRevenueDetailData: RevenueDetailData = {
@@ -38,19 +60,46 @@ const emptyRevenueDetailData: RevenueDetailData = {
   source: 'unavailable',
   period: { value: 'year', label: '', start: '', end: '' },
   scope: { label: '' },
+  grouping: { value: 'account', label: '', options: [] },
   summary: { total: 0, deliveryTotal: 0, prepaymentTotal: 0, itemCount: 0 },
-  items: [],
+  groups: [],
 };
 
-export async function loadRevenueDetail(period: RevenuePeriod = 'year'): Promise<RevenueDetailData> {
+export async function loadRevenueDetail(
+  period: RevenuePeriod = 'year',
+  grouping: RevenueGrouping = 'account',
+): Promise<RevenueDetailData> {
   const query = new URLSearchParams();
   if (period) query.set('period', period);
+  if (grouping) query.set('group', grouping);
   const href = `/reporting/api/revenue-detail/${query.toString() ? `?${query.toString()}` : ''}`;
   const { response, payload } = await fetchJson<RevenueDetailData>(href, {}, '매출 내역 API unavailable');
   assertSuccessfulJsonPayload(response, payload, '매출 내역 API unavailable', { requireDjangoSource: true });
   return {
     ...emptyRevenueDetailData,
     ...payload,
+    grouping: payload.grouping ?? emptyRevenueDetailData.grouping,
+    groups: payload.groups ?? [],
+  };
+}
+
+export async function loadRevenueDetailItems(params: {
+  period: RevenuePeriod;
+  grouping: RevenueGrouping;
+  key: string;
+  cursor?: string | null;
+}): Promise<RevenueDetailItemsPage> {
+  const query = new URLSearchParams({ period: params.period, group: params.grouping, key: params.key });
+  if (params.cursor) query.set('cursor', params.cursor);
+  const { response, payload } = await fetchJson<RevenueDetailItemsPage & { success?: boolean }>(
+    `/reporting/api/revenue-detail/items/?${query.toString()}`,
+    {},
+    '매출 내역 API unavailable',
+  );
+  assertSuccessfulJsonPayload(response, payload, '매출 내역 API unavailable');
+  return {
     items: payload.items ?? [],
+    nextCursor: payload.nextCursor ?? null,
+    hasMore: Boolean(payload.hasMore),
   };
 }
@@ -2,6 +2,7 @@ import {
   AlertTriangle,
   Building2,
   Check,
+  ChevronLeft,
   ChevronRight,
   Loader2,
   Pencil,
@@ -17,11 +18,14 @@ import {
   CompanyManagementCompany,
   CompanyManagementData,
   CompanyManagementDepartment,
+  CustomerCompanyOption,
   createCompany as createCompanyRecord,
   createDepartment as createDepartmentRecord,
   deleteCompanyRecord,
   deleteDepartmentRecord,
   loadCompanyManagementData,
+  loadCompanyManagementDepartments,
+  searchCompanyMoveTargets,
   updateCompany as updateCompanyRecord,
   updateDepartment as updateDepartmentRecord,
 } from '../../api/accounts';
@@ -129,7 +133,6 @@ function CompanyRow({
 }
 
 function DepartmentRow({
-  companyOptions,
   department,
   editCompanyId,
   editName,
@@ -142,7 +145,6 @@ function DepartmentRow({
   onEditStart,
   onEditSubmit,
 }: {
-  companyOptions: Array<{ id: number; name: string; canManage?: boolean; manageMessage?: string }>;
   department: CompanyManagementDepartment;
   editCompanyId: string;
   editName: string;
@@ -155,26 +157,42 @@ function DepartmentRow({
   onEditStart: (department: CompanyManagementDepartment) => void;
   onEditSubmit: (department: CompanyManagementDepartment) => void;
 }) {
-  const moveOptions = companyOptions.some((company) => company.id === department.companyId)
-    ? companyOptions
-    : [{ id: department.companyId, name: department.companyName, canManage: true }, ...companyOptions];
   const selectedMoveCompanyId = Number(editCompanyId || department.companyId);
-  const selectedMoveCompany = moveOptions.find((company) => company.id === selectedMoveCompanyId) ?? null;
   const [companySearch, setCompanySearch] = useState('');
+  const [selectedMoveCompanyName, setSelectedMoveCompanyName] = useState(department.companyName);
+  const [moveTargets, setMoveTargets] = useState<CustomerCompanyOption[]>([]);
+  const [moveTargetsLoading, setMoveTargetsLoading] = useState(false);
 
   useEffect(() => {
     if (editing) {
-      setCompanySearch(selectedMoveCompany?.name || department.companyName || '');
+      setCompanySearch(department.companyName || '');
+      setSelectedMoveCompanyName(department.companyName);
     }
-  }, [department.companyName, department.id, editing, selectedMoveCompany?.name]);
+  }, [department.companyName, department.id, editing]);
 
-  const companySearchTerm = companySearch.trim().toLowerCase();
-  const visibleMoveOptions = moveOptions
-    .filter((company) => (
-      !companySearchTerm || company.name.toLowerCase().includes(companySearchTerm)
-    ))
-    .slice(0, 12);
-  const selectedMoveCompanyName = selectedMoveCompany?.name || department.companyName || '업체/학교 미지정';
+  // 이동 대상은 전체 업체 목록을 내려받지 않고 검색어로 서버에서 찾는다.
+  useEffect(() => {
+    if (!editing) {
+      return undefined;
+    }
+    let cancelled = false;
+    setMoveTargetsLoading(true);
+    const timeout = window.setTimeout(() => {
+      void searchCompanyMoveTargets(companySearch.trim()).then((result) => {
+        if (cancelled) return;
+        setMoveTargets(result.companies);
+        setMoveTargetsLoading(false);
+      });
+    }, 200);
+    return () => {
+      cancelled = true;
+      window.clearTimeout(timeout);
+    };
+  }, [companySearch, editing]);
+
+  const visibleMoveOptions = moveTargets.some((company) => company.id === department.companyId)
+    ? moveTargets
+    : [{ id: department.companyId, name: department.companyName, canManage: true }, ...moveTargets];
 
   return (
     <article className="company-management-department-row">
@@ -192,7 +210,7 @@ function DepartmentRow({
                 <span>소속 업체/학교</span>
                 <div className="company-management-move-current">
                   <small>선택됨</small>
-                  <strong>{selectedMoveCompanyName}</strong>
+                  <strong>{selectedMoveCompanyName || '업체/학교 미지정'}</strong>
                 </div>
                 <div className="company-management-move-search">
                   <Search size={15} />
@@ -204,6 +222,7 @@ function DepartmentRow({
                   />
                 </div>
                 <div className="company-management-move-results">
+                  {moveTargetsLoading ? <Loader2 className="spin-icon" size={14} /> : null}
                   {visibleMoveOptions.length > 0 ? visibleMoveOptions.map((company) => {
                     const disabled = company.canManage === false && company.id !== department.companyId;
                     const selected = company.id === selectedMoveCompanyId;
@@ -215,6 +234,7 @@ function DepartmentRow({
                         onClick={() => {
                           if (disabled) return;
                           onEditCompanyChange(String(company.id));
+                          setSelectedMoveCompanyName(company.name);
                           setCompanySearch(company.name);
                         }}
                         title={disabled ? company.manageMessage || '이동할 수 없습니다.' : ''}
@@ -269,7 +289,10 @@ export function CompanyManagementPage() {
   const [data, setData] = useState<CompanyManagementData | null>(null);
   const [loading, setLoading] = useState(true);
   const [query, setQuery] = useState(initialSearch);
+  const [page, setPage] = useState(0);
   const [selectedCompanyId, setSelectedCompanyId] = useState('');
+  const [departmentsByCompany, setDepartmentsByCompany] = useState<Record<number, CompanyManagementDepartment[]>>({});
+  const [departmentsLoading, setDepartmentsLoading] = useState(false);
   const [departmentQuery, setDepartmentQuery] = useState('');
   const [companyCreateName, setCompanyCreateName] = useState('');
   const [departmentCreateName, setDepartmentCreateName] = useState('');
@@ -283,13 +306,22 @@ export function CompanyManagementPage() {
   const [error, setError] = useState('');
   const departmentIdParam = useMemo(initialDepartmentId, []);
 
-  const refreshData = async () => {
+  // page 0 은 첫 로드: 서버가 department_id 부서가 있는 페이지를 고른다.
+  const refreshData = async (expandCompanyId: string = selectedCompanyId) => {
     setLoading(true);
     const nextData = await loadCompanyManagementData({
       q: query,
       departmentId: departmentIdParam,
+      page: page || undefined,
+      expandCompanyId: Number(expandCompanyId) || null,
     });
     setData(nextData);
+    setDepartmentsByCompany(
+      nextData.expandedCompanyId ? { [nextData.expandedCompanyId]: nextData.departments } : {},
+    );
+    if (!page && nextData.pagination.page > 1) {
+      setPage(nextData.pagination.page);
+    }
     setLoading(false);
   };
 
@@ -298,34 +330,59 @@ export function CompanyManagementPage() {
       void refreshData();
     }, 200);
     return () => window.clearTimeout(timeout);
-  }, [query]);
+  }, [query, page]);
 
   useEffect(() => {
     if (!data || selectedCompanyId) {
       return;
     }
-    const departmentMatch = departmentIdParam
-      ? data.departments.find((department) => String(department.id) === departmentIdParam)
-      : null;
-    const firstCompanyId = departmentMatch?.companyId ?? data.companies[0]?.id;
+    const firstCompanyId = data.expandedCompanyId ?? data.companies[0]?.id;
     if (firstCompanyId) {
       setSelectedCompanyId(String(firstCompanyId));
     }
-  }, [data, departmentIdParam, selectedCompanyId]);
-
-  const selectedCompany = data?.companies.find((company) => String(company.id) === selectedCompanyId) ?? data?.companies[0] ?? null;
-  const departmentMoveCompanies = useMemo(() => {
-    const options = data?.departmentMoveCompanies?.length
-      ? data.departmentMoveCompanies
-      : (data?.companies ?? []);
-    const seen = new Set<number>();
-    return options.filter((company) => {
-      if (seen.has(company.id)) return false;
-      seen.add(company.id);
-      return true;
-    });
-  }, [data]);
-  const visibleDepartments = (selectedCompany?.departments ?? []).filter((department) => {
+  }, [data, selectedCompanyId]);
+
+  const selectedCompany = data?.companies.find((company) => String(company.id) === selectedCompanyId)
+    ?? data?.companies.find((company) => company.id === data.expandedCompanyId)
+    ?? data?.companies[0]
+    ?? null;
+  const selectedDepartments = selectedCompany ? departmentsByCompany[selectedCompany.id] : undefined;
+
+  // 펼치지 않은 업체는 선택할 때 부서 목록을 따로 불러온다.
+  useEffect(() => {
+    if (!selectedCompany || selectedDepartments) {
+      return undefined;
+    }
+    let cancelled = false;
+    const companyId = selectedCompany.id;
+    setDepartmentsLoading(true);
+    loadCompanyManagementDepartments(companyId)
+      .then((departments) => {
+        if (!cancelled) {
+          setDepartmentsByCompany((current) => ({ ...current, [companyId]: departments }));
+        }
+      })
+      .catch((loadError) => {
+        if (!cancelled) {
+          setError(loadError instanceof Error ? loadError.message : '부서/연구실을 불러오지 못했습니다.');
+        }
+      })
+      .finally(() => {
+        if (!cancelled) {
+          setDepartmentsLoading(false);
+        }
+      });
+    return () => {
+      cancelled = true;
+    };
+  }, [selectedCompany?.id, selectedDepartments]);
+
+  const changePage = (nextPage: number) => {
+    setSelectedCompanyId('');
+    setPage(nextPage);
+  };
+
+  const visibleDepartments = (selectedDepartments ?? []).filter((department) => {
     const term = departmentQuery.trim().toLowerCase();
     if (!term) return true;
     return [department.name, department.companyName, department.createdByName].join(' ').toLowerCase().includes(term);
@@ -336,13 +393,13 @@ export function CompanyManagementPage() {
     setError('');
   };
 
-  const runAction = async (key: string, action: () => Promise<void>) => {
+  const runAction = async (key: string, action: () => Promise<string | void>) => {
     if (savingKey) return;
     setSavingKey(key);
     resetFeedback();
     try {
-      await action();
-      await refreshData();
+      const expandCompanyId = await action();
+      await refreshData(expandCompanyId ?? selectedCompanyId);
     } catch (actionError) {
       setError(actionError instanceof Error ? actionError.message : '작업에 실패했습니다.');
     } finally {
@@ -359,6 +416,7 @@ export function CompanyManagementPage() {
       if (result.company?.id) {
         setSelectedCompanyId(String(result.company.id));
       }
+      return result.company?.id ? String(result.company.id) : undefined;
       setMessage(result.message || '업체/학교를 추가했습니다.');
     });
   };
@@ -410,12 +468,14 @@ export function CompanyManagementPage() {
       setDepartmentEditId(null);
       setDepartmentEditName('');
       setDepartmentEditCompanyId('');
+      setMessage(result.message || '부서/연구실 정보가 수정되었습니다.');
       if (targetCompanyId !== department.companyId) {
         setQuery('');
         setDepartmentQuery('');
         setSelectedCompanyId(String(targetCompanyId));
+        return String(targetCompanyId);
       }
-      setMessage(result.message || '부서/연구실 정보가 수정되었습니다.');
+      return undefined;
     });
   };
 
@@ -427,10 +487,12 @@ export function CompanyManagementPage() {
     if (!window.confirm(`"${company.name}" 업체/학교를 삭제할까요?`)) return;
     void runAction(`company-${company.id}`, async () => {
       const result = await deleteCompanyRecord(company.id, company.deleteUrl);
+      setMessage(result.message || '업체/학교가 삭제되었습니다.');
       if (String(company.id) === selectedCompanyId) {
         setSelectedCompanyId('');
+        return '';
       }
-      setMessage(result.message || '업체/학교가 삭제되었습니다.');
+      return undefined;
     });
   };
 
@@ -522,7 +584,14 @@ export function CompanyManagementPage() {
       <section className="dashboard-panel company-management-toolbar">
         <label className="search-box company-management-search">
           <Search size={17} />
-          <input onChange={(event) => setQuery(event.target.value)} placeholder="업체, 부서, 담당자 검색" value={query} />
+          <input
+            onChange={(event) => {
+              setQuery(event.target.value);
+              changePage(1);
+            }}
+            placeholder="업체, 부서, 담당자 검색"
+            value={query}
+          />
         </label>
         {!readOnly ? (
           <div className="company-management-create">
@@ -542,7 +611,7 @@ export function CompanyManagementPage() {
               <span className="eyebrow">Companies</span>
               <h2>업체/학교</h2>
             </div>
-            <span className="customer-manage-count">{formatNumber(data.companies.length)}개</span>
+            <span className="customer-manage-count">{formatNumber(data.pagination.totalCount)}개</span>
           </div>
           {data.companies.length === 0 ? (
             <DashboardEmpty label="조건에 맞는 업체/학교가 없습니다" />
@@ -566,6 +635,19 @@ export function CompanyManagementPage() {
               ))}
             </div>
           )}
+          {data.pagination.totalPages > 1 ? (
+            <div className="products-pagination company-management-pagination">
+              <button disabled={loading || !data.pagination.hasPrevious} onClick={() => changePage(data.pagination.page - 1)} type="button">
+                <ChevronLeft size={15} />
+                이전
+              </button>
+              <span>{formatNumber(data.pagination.page)} / {formatNumber(data.pagination.totalPages)} 페이지</span>
+              <button disabled={loading || !data.pagination.hasNext} onClick={() => changePage(data.pagination.page + 1)} type="button">
+                다음
+                <ChevronRight size={15} />
+              </button>
+            </div>
+          ) : null}
         </section>
 
         <section className="dashboard-panel company-management-detail-panel">
@@ -592,13 +674,17 @@ export function CompanyManagementPage() {
                   </div>
                 ) : null}
               </div>
-              {visibleDepartments.length === 0 ? (
+              {departmentsLoading && !selectedDepartments ? (
+                <div className="dashboard-loading compact">
+                  <Loader2 className="spin-icon" size={18} />
+                  <span>부서/연구실을 불러오는 중입니다</span>
+                </div>
+              ) : visibleDepartments.length === 0 ? (
                 <DashboardEmpty label="조건에 맞는 부서/연구실이 없습니다" />
               ) : (
                 <div className="company-management-department-list">
                   {visibleDepartments.map((department) => (
                     <DepartmentRow
-                      companyOptions={departmentMoveCompanies}
                       department={department}
                       editCompanyId={departmentEditCompanyId}
                       editName={departmentEditName}
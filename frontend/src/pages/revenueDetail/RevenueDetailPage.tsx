@@ -1,6 +1,13 @@
-import { AlertTriangle, CircleDollarSign, Loader2, RefreshCw } from 'lucide-react';
-import { useCallback, useEffect, useState } from 'react';
-import { loadRevenueDetail, type RevenueDetailData, type RevenuePeriod } from '../../api/revenueDetail';
+import { AlertTriangle, ChevronDown, ChevronRight, CircleDollarSign, Loader2, RefreshCw } from 'lucide-react';
+import { Fragment, useCallback, useEffect, useState } from 'react';
+import {
+  loadRevenueDetail,
+  loadRevenueDetailItems,
+  type RevenueDetailData,
+  type RevenueDetailItemsPage,
+  type RevenueGrouping,
+  type RevenuePeriod,
+} from '../../api/revenueDetail';
 
 const formatNumber = (value: number | null | undefined) => new Intl.NumberFormat('ko-KR').format(Number(value || 0));
 const formatWon = (value: number | null | undefined) => `${formatNumber(value)}원`;
@@ -23,26 +30,47 @@ function normalizePeriod(value: string | null): RevenuePeriod {
   return 'year';
 }
 
+function normalizeGrouping(value: string | null): RevenueGrouping {
+  if (value === 'owner' || value === 'month' || value === 'product') {
+    return value;
+  }
+  return 'account';
+}
+
+const groupingOptions: Array<{ value: RevenueGrouping; label: string }> = [
+  { value: 'account', label: '계정별' },
+  { value: 'owner', label: '담당자별' },
+  { value: 'month', label: '월별' },
+  { value: 'product', label: '품목별' },
+];
+
+type ExpandedGroup = RevenueDetailItemsPage & { loading: boolean };
+
 export function RevenueDetailPage() {
   const [period, setPeriod] = useState<RevenuePeriod>(() =>
     normalizePeriod(new URLSearchParams(window.location.search).get('period')),
   );
+  const [grouping, setGrouping] = useState<RevenueGrouping>(() =>
+    normalizeGrouping(new URLSearchParams(window.location.search).get('group')),
+  );
   const [data, setData] = useState<RevenueDetailData | null>(null);
+  const [expanded, setExpanded] = useState<Record<string, ExpandedGroup>>({});
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState('');
 
   const refresh = useCallback(async () => {
     setLoading(true);
     setError('');
+    setExpanded({});
     try {
-      const nextData = await loadRevenueDetail(period);
+      const nextData = await loadRevenueDetail(period, grouping);
       setData(nextData);
     } catch (fetchError) {
       setError(fetchError instanceof Error ? fetchError.message : '매출 내역을 불러오지 못했습니다.');
     } finally {
       setLoading(false);
     }
-  }, [period]);
+  }, [grouping, period]);
 
   useEffect(() => {
     void refresh();
@@ -51,9 +79,40 @@ export function RevenueDetailPage() {
   useEffect(() => {
     const params = new URLSearchParams();
     if (period !== 'year') params.set('period', period);
+    if (grouping !== 'account') params.set('group', grouping);
     const queryString = params.toString();
     window.history.replaceState(null, '', `/revenue/${queryString ? `?${queryString}` : ''}`);
-  }, [period]);
+  }, [grouping, period]);
+
+  // 내역 행은 그룹을 펼칠 때, 그리고 "더 보기"를 누를 때 한 페이지씩 불러온다.
+  const loadGroupItems = async (key: string, cursor: string | null = null) => {
+    setExpanded((current) => ({
+      ...current,
+      [key]: { items: current[key]?.items ?? [], nextCursor: cursor, hasMore: false, loading: true },
+    }));
+    try {
+      const page = await loadRevenueDetailItems({ period, grouping, key, cursor });
+      setExpanded((current) => (current[key] ? {
+        ...current,
+        [key]: { ...page, items: [...current[key].items, ...page.items], loading: false },
+      } : current));
+    } catch (fetchError) {
+      setError(fetchError instanceof Error ? fetchError.message : '매출 내역을 불러오지 못했습니다.');
+      setExpanded((current) => (current[key] ? { ...current, [key]: { ...current[key], loading: false } } : current));
+    }
+  };
+
+  const toggleGroup = (key: string) => {
+    if (expanded[key]) {
+      setExpanded((current) => {
+        const next = { ...current };
+        delete next[key];
+        return next;
+      });
+      return;
+    }
+    void loadGroupItems(key);
+  };
 
   const summary = data?.summary;
 
@@ -83,6 +142,18 @@ export function RevenueDetailPage() {
             이번 달
           </button>
         </div>
+        <div className="revenue-detail-tabs">
+          {groupingOptions.map((option) => (
+            <button
+              className={`revenue-detail-tab${grouping === option.value ? ' active' : ''}`}
+              key={option.value}
+              onClick={() => setGrouping(option.value)}
+              type="button"
+            >
+              {option.label}
+            </button>
+          ))}
+        </div>
         <span className="revenue-detail-period-label">
           {data ? `${data.period.label} (${formatDateLabel(data.period.start)} ~ ${formatDateLabel(data.period.end)})` : ''}
         </span>
@@ -123,42 +194,83 @@ export function RevenueDetailPage() {
         <table className="revenue-detail-table">
           <thead>
             <tr>
-              <th>날짜</th>
-              <th>구분</th>
-              <th>계정</th>
-              <th>내역</th>
-              <th>담당자</th>
+              <th>{data?.grouping.label || '그룹'}</th>
+              <th>건수</th>
+              <th>납품</th>
+              <th>선결제</th>
               <th>금액</th>
             </tr>
           </thead>
           <tbody>
             {loading && !data ? (
               <tr>
-                <td colSpan={6}>
+                <td colSpan={5}>
                   <Loader2 className="spin-icon" size={18} /> 데이터를 불러오는 중입니다
                 </td>
               </tr>
-            ) : data?.items.length ? (
-              data.items.map((item, index) => (
-                <tr key={`${item.kind}-${item.href}-${index}`}>
-                  <td>{formatDateLabel(item.date)}</td>
-                  <td>
-                    <span className={`revenue-detail-kind ${item.kind}`}>
-                      {item.kind === 'delivery' ? '납품' : '선결제'}
-                    </span>
-                  </td>
-                  <td>{item.accountLabel}</td>
-                  <td>
-                    <a href={item.href}>{item.itemName}</a>
-                    {item.quantity ? <small>{formatNumber(item.quantity)}개</small> : null}
-                  </td>
-                  <td>{item.owner}</td>
-                  <td className="revenue-detail-amount">{formatWon(item.amount)}</td>
-                </tr>
-              ))
+            ) : data?.groups.length ? (
+              data.groups.map((group) => {
+                const groupItems = expanded[group.key];
+                return (
+                  <Fragment key={group.key}>
+                    <tr className="revenue-detail-group-row">
+                      <td>
+                        <button className="revenue-detail-group-toggle" onClick={() => toggleGroup(group.key)} type="button">
+                          {groupItems ? <ChevronDown size={14} /> : <ChevronRight size={14} />}
+                          {group.label}
+                        </button>
+                      </td>
+                      <td>{formatNumber(group.itemCount)}건</td>
+                      <td className="revenue-detail-amount">{formatWon(group.deliveryTotal)}</td>
+                      <td className="revenue-detail-amount">{formatWon(group.prepaymentTotal)}</td>
+                      <td className="revenue-detail-amount">{formatWon(group.total)}</td>
+                    </tr>
+                    {groupItems ? (
+                      <tr className="revenue-detail-items-row">
+                        <td colSpan={5}>
+                          <table className="revenue-detail-table">
+                            <tbody>
+                              {groupItems.items.map((item, index) => (
+                                <tr key={`${item.kind}-${item.href}-${index}`}>
+                                  <td>{formatDateLabel(item.date)}</td>
+                                  <td>
+                                    <span className={`revenue-detail-kind ${item.kind}`}>
+                                      {item.kind === 'delivery' ? '납품' : '선결제'}
+                                    </span>
+                                  </td>
+                                  <td>{item.accountLabel}</td>
+                                  <td>
+                                    <a href={item.href}>{item.itemName}</a>
+                                    {item.quantity ? <small>{formatNumber(item.quantity)}개</small> : null}
+                                  </td>
+                                  <td>{item.owner}</td>
+                                  <td className="revenue-detail-amount">{formatWon(item.amount)}</td>
+                                </tr>
+                              ))}
+                            </tbody>
+                          </table>
+                          {groupItems.loading ? (
+                            <span className="revenue-detail-items-status">
+                              <Loader2 className="spin-icon" size={14} /> 내역을 불러오는 중입니다
+                            </span>
+                          ) : groupItems.hasMore ? (
+                            <button
+                              className="route-secondary-action"
+                              onClick={() => void loadGroupItems(group.key, groupItems.nextCursor)}
+                              type="button"
+                            >
+                              더 보기 ({formatNumber(groupItems.items.length)} / {formatNumber(group.itemCount)}건)
+                            </button>
+                          ) : null}
+                        </td>
+                      </tr>
+                    ) : null}
+                  </Fragment>
+                );
+              })
             ) : (
               <tr>
-                <td colSpan={6}>이 기간에 완료된 매출이 없습니다</td>
+                <td colSpan={5}>이 기간에 완료된 매출이 없습니다</td>
               </tr>
             )}
           </tbody>
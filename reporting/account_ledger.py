@@ -2,11 +2,29 @@
 
 from decimal import Decimal, InvalidOperation
 
-from django.db.models import Count, Prefetch, Q, QuerySet
+from django.db import connections
+from django.db.models import (
+    BigIntegerField,
+    Case,
+    Count,
+    DecimalField,
+    F,
+    IntegerField,
+    OuterRef,
+    Prefetch,
+    Q,
+    QuerySet,
+    Subquery,
+    Sum,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import Coalesce, RowNumber
 from django.urls import reverse
 from django.utils import timezone
 
-from .models import FollowUp, History, Prepayment, PrepaymentUsage, Quote, Schedule
+from .models import DeliveryItem, FollowUp, History, Prepayment, PrepaymentUsage, Quote, QuoteItem, Schedule
 
 
 DELIVERY_PAYMENT_NORMAL = Schedule.DELIVERY_PAYMENT_TYPE_NORMAL
@@ -540,30 +558,116 @@ def _date_filter_kwargs(field_name, date_from=None, date_to=None):
     return filters
 
 
-def account_operational_ledgers_for_followups(
-    followups,
-    scope_users,
-    *,
-    date_from=None,
-    date_to=None,
-    actor=None,
-    record_limit=50,
-):
-    """Build shared delivery/quote/prepayment ledgers keyed by department account."""
-    followups = list(followups)
-    followup_ids = [followup.id for followup in followups]
-    account_key_by_followup_id = {
-        followup.id: account_key_for_followup(followup)
-        for followup in followups
-    }
-    ledgers = {
-        account_key_for_followup(followup): _empty_account_ledger()
-        for followup in followups
+LEDGER_SECTIONS = ('delivery', 'quote', 'prepayment', 'usage')
+DELIVERY_LEDGER_ORDER = ('-visit_date', '-visit_time', '-id')
+QUOTE_LEDGER_ORDER = ('-quote_date', '-created_at', '-id')
+PREPAYMENT_LEDGER_ORDER = ('-payment_date', '-created_at', '-id')
+USAGE_LEDGER_ORDER = ('-used_at', '-id')
+
+
+def _order_expressions(fields):
+    return [
+        F(field[1:]).desc() if field.startswith('-') else F(field).asc()
+        for field in fields
+    ]
+
+
+def _account_partition(department_expression, followup_field):
+    """Window partition matching ``account_key_for_followup``: department, else followup."""
+    department_expression = F(department_expression) if isinstance(department_expression, str) else department_expression
+    return [
+        department_expression,
+        Case(
+            When(Q(**{f'{followup_field}__isnull': False}) & Q(_ledger_department__isnull=True), then=F(followup_field)),
+            default=Value(None),
+            output_field=BigIntegerField(),
+        ),
+    ]
+
+
+def top_record_ids_per_account(queryset, department_expression, followup_field, order_by, limit):
+    """Return ids of the newest ``limit`` rows per account, or ``None`` for "all rows".
+
+    Uses ``ROW_NUMBER() OVER (PARTITION BY account ...)`` so only the visible
+    records are ever loaded with their deep prefetches. Backends without window
+    support (old SQLite) rank the narrow ``(id, account)`` rows in Python instead.
+    """
+    if limit is None:
+        return None
+    department_expression = F(department_expression) if isinstance(department_expression, str) else department_expression
+    queryset = queryset.order_by().annotate(_ledger_department=department_expression)
+    partition_by = _account_partition('_ledger_department', followup_field)
+    if connections[queryset.db].features.supports_over_clause:
+        return set(
+            queryset.annotate(
+                _ledger_rank=Window(
+                    RowNumber(),
+                    partition_by=partition_by,
+                    order_by=_order_expressions(order_by),
+                ),
+            ).filter(_ledger_rank__lte=limit).values_list('id', flat=True)
+        )
+
+    ranked_ids = set()
+    counts = {}
+    rows = queryset.annotate(
+        _ledger_account_followup=partition_by[1],
+    ).order_by(*order_by).values_list('id', '_ledger_department', '_ledger_account_followup')
+    for record_id, department_id, followup_id in rows.iterator():
+        key = (department_id, followup_id)
+        if counts.get(key, 0) < limit:
+            counts[key] = counts.get(key, 0) + 1
+            ranked_ids.add(record_id)
+    return ranked_ids
+
+
+def _aggregate_subquery(queryset, group_field, aggregate, output_field):
+    return Subquery(
+        queryset.order_by().values(group_field).annotate(value=aggregate).values('value')[:1],
+        output_field=output_field,
+    )
+
+
+def _schedule_item_stat_annotations():
+    items = DeliveryItem.objects.filter(schedule_id=OuterRef('pk'))
+    return {
+        'ledger_item_count': _aggregate_subquery(items, 'schedule_id', Count('id'), IntegerField()),
+        'ledger_item_total': _aggregate_subquery(items, 'schedule_id', Sum('total_price'), DecimalField()),
+        'ledger_item_unpriced': _aggregate_subquery(
+            items.filter(total_price__isnull=True), 'schedule_id', Count('id'), IntegerField(),
+        ),
     }
-    if not followup_ids:
-        return ledgers
 
-    service_history_prefetch = Prefetch(
+
+def _schedule_row_total_is_exact(row, *, history_fallback=False) -> bool:
+    """True when the SQL item sum equals what the record payload would report.
+
+    Schedules without their own items, with unpriced items or, for deliveries,
+    with a non-positive sum fall back to history data and stay on the Python path.
+    """
+    if not row['ledger_item_count'] or row['ledger_item_unpriced']:
+        return False
+    return not history_fallback or money_int(row['ledger_item_total']) > 0
+
+
+def _delivery_row_payment(row):
+    """Scalar mirror of ``delivery_payment_payload`` → (uses_prepayment, prepayment_amount)."""
+    usage_total = money_int(row['ledger_usage_total'])
+    direct_amount = money_int(row['prepayment_amount'])
+    uses_prepayment = bool(
+        row['use_prepayment']
+        or row['prepayment_id']
+        or direct_amount > 0
+        or row['ledger_usage_count']
+        or usage_total > 0
+        or row['delivery_payment_type'] == DELIVERY_PAYMENT_PREPAYMENT
+        or row['delivery_payment_status'] == DELIVERY_PAYMENT_STATUS_PREPAYMENT
+    )
+    return uses_prepayment, (usage_total or direct_amount) if uses_prepayment else 0
+
+
+def _ledger_history_prefetch():
+    return Prefetch(
         'histories',
         queryset=History.objects.filter(
             parent_history__isnull=True,
@@ -571,155 +675,334 @@ def account_operational_ledgers_for_followups(
         to_attr='_account_ledger_histories',
     )
 
-    delivery_schedules = list(
-        Schedule.objects.filter(
-            followup_id__in=followup_ids,
-            user__in=scope_users,
-            activity_type='delivery',
-            **_date_filter_kwargs('visit_date', date_from, date_to),
-        ).exclude(status='cancelled').select_related(
+
+def _collect_delivery_ledger(ledgers, account_key_by_followup_id, base_queryset, record_limit):
+    usages = PrepaymentUsage.objects.filter(schedule_id=OuterRef('pk'))
+    rows = list(
+        base_queryset.annotate(
+            **_schedule_item_stat_annotations(),
+            ledger_usage_count=_aggregate_subquery(usages, 'schedule_id', Count('id'), IntegerField()),
+            ledger_usage_total=_aggregate_subquery(usages, 'schedule_id', Sum('amount'), DecimalField()),
+        ).order_by(*DELIVERY_LEDGER_ORDER).values(
+            'id', 'followup_id', 'visit_date', 'use_prepayment', 'prepayment_id', 'prepayment_amount',
+            'delivery_payment_type', 'delivery_payment_status',
+            'ledger_item_count', 'ledger_item_total', 'ledger_item_unpriced',
+            'ledger_usage_count', 'ledger_usage_total',
+        )
+    )
+    top_ids = top_record_ids_per_account(
+        base_queryset, 'followup__department_id', 'followup_id', DELIVERY_LEDGER_ORDER, record_limit,
+    )
+    payload_ids = {
+        row['id'] for row in rows
+        if top_ids is None or row['id'] in top_ids or not _schedule_row_total_is_exact(row, history_fallback=True)
+    }
+    records_by_id = {
+        schedule.id: delivery_record_payload(schedule)
+        for schedule in Schedule.objects.filter(id__in=payload_ids).select_related(
             'user', 'followup', 'followup__company', 'followup__department', 'prepayment',
         ).prefetch_related(
             'delivery_items_set__product',
-            service_history_prefetch,
+            _ledger_history_prefetch(),
             Prefetch(
                 'prepayment_usages',
                 queryset=PrepaymentUsage.objects.select_related(
                     'prepayment', 'prepayment__customer',
                 ).order_by('id'),
             ),
-        ).order_by('-visit_date', '-visit_time', '-id')
-    )
-    for schedule in delivery_schedules:
-        ledger = ledgers.get(account_key_by_followup_id.get(schedule.followup_id))
+        )
+    } if payload_ids else {}
+
+    for row in rows:
+        ledger = ledgers.get(account_key_by_followup_id.get(row['followup_id']))
         if not ledger:
             continue
-        record = delivery_record_payload(schedule)
+        record = records_by_id.get(row['id'])
+        if record is not None:
+            total_amount = record.get('totalAmount') or 0
+            uses_prepayment = record.get('paymentSource') == 'prepayment'
+            prepayment_amount = record.get('prepaymentAmount') or 0
+        else:
+            total_amount = money_int(row['ledger_item_total'])
+            uses_prepayment, prepayment_amount = _delivery_row_payment(row)
         metrics = ledger['metrics']
-        total_amount = record.get('totalAmount') or 0
         metrics['deliveryRecords'] += 1
         metrics['deliveryCount'] += 1
         metrics['deliveryAmount'] += total_amount
-        _update_latest(metrics, 'lastDeliveryDate', schedule.visit_date)
-        if record.get('paymentSource') == 'prepayment':
+        _update_latest(metrics, 'lastDeliveryDate', row['visit_date'])
+        if uses_prepayment:
             metrics['prepaymentDeliveryRecords'] += 1
             metrics['prepaymentDeliveryCount'] += 1
             metrics['prepaymentDeliveryAmount'] += total_amount
-            metrics['prepaymentUsedAmount'] += record.get('prepaymentAmount') or 0
+            metrics['prepaymentUsedAmount'] += prepayment_amount
         else:
             metrics['normalDeliveryRecords'] += 1
             metrics['normalDeliveryCount'] += 1
             metrics['normalDeliveryAmount'] += total_amount
-        _append_limited(ledger['deliveryRecords'], record, record_limit)
-
-    quote_schedules_by_id = set()
-    quote_records = list(
-        Quote.objects.filter(
-            followup_id__in=followup_ids,
-            user__in=scope_users,
-            **_date_filter_kwargs('quote_date', date_from, date_to),
-        ).select_related(
-            'schedule', 'followup', 'followup__company', 'followup__department', 'user',
-        ).prefetch_related('items__product').order_by('-quote_date', '-created_at', '-id')
+        if record is not None and (top_ids is None or row['id'] in top_ids):
+            _append_limited(ledger['deliveryRecords'], record, record_limit)
+
+
+def _collect_quote_ledger(ledgers, account_key_by_followup_id, quote_queryset, schedule_queryset, record_limit):
+    items = QuoteItem.objects.filter(quote_id=OuterRef('pk'))
+    quote_rows = list(
+        quote_queryset.annotate(
+            ledger_item_count=_aggregate_subquery(items, 'quote_id', Count('id'), IntegerField()),
+            ledger_item_subtotal=_aggregate_subquery(items, 'quote_id', Sum('subtotal'), DecimalField()),
+        ).order_by(*QUOTE_LEDGER_ORDER).values(
+            'id', 'followup_id', 'schedule_id', 'quote_date', 'total_amount',
+            'ledger_item_count', 'ledger_item_subtotal',
+        )
+    )
+    top_quote_ids = top_record_ids_per_account(
+        quote_queryset, 'followup__department_id', 'followup_id', QUOTE_LEDGER_ORDER, record_limit,
     )
-    for quote in quote_records:
-        ledger = ledgers.get(account_key_by_followup_id.get(quote.followup_id))
+    visible_quote_ids = [row['id'] for row in quote_rows if top_quote_ids is None or row['id'] in top_quote_ids]
+    quote_records_by_id = {
+        quote.id: quote_record_payload(quote)
+        for quote in Quote.objects.filter(id__in=visible_quote_ids).select_related(
+            'schedule', 'followup', 'followup__company', 'followup__department', 'user',
+        ).prefetch_related('items__product')
+    } if visible_quote_ids else {}
+
+    quote_schedule_ids = set()
+    for row in quote_rows:
+        ledger = ledgers.get(account_key_by_followup_id.get(row['followup_id']))
         if not ledger:
             continue
-        if quote.schedule_id:
-            quote_schedules_by_id.add(quote.schedule_id)
-        record = quote_record_payload(quote)
+        if row['schedule_id']:
+            quote_schedule_ids.add(row['schedule_id'])
+        record = quote_records_by_id.get(row['id'])
         metrics = ledger['metrics']
         metrics['quoteRecords'] += 1
         metrics['quoteCount'] += 1
-        metrics['quoteAmount'] += record.get('totalAmount') or 0
-        metrics['quoteItemCount'] += record.get('itemCount') or 0
-        _update_latest(metrics, 'lastQuoteDate', quote.quote_date)
-        _append_limited(ledger['quoteRecords'], record, record_limit)
-
-    quote_schedules = list(
-        Schedule.objects.filter(
-            followup_id__in=followup_ids,
-            user__in=scope_users,
-            activity_type='quote',
-            **_date_filter_kwargs('visit_date', date_from, date_to),
-        ).exclude(
-            id__in=quote_schedules_by_id,
-        ).select_related(
+        metrics['quoteAmount'] += money_int(row['total_amount']) or money_int(row['ledger_item_subtotal'])
+        metrics['quoteItemCount'] += row['ledger_item_count'] or 0
+        _update_latest(metrics, 'lastQuoteDate', row['quote_date'])
+        if record is not None:
+            _append_limited(ledger['quoteRecords'], record, record_limit)
+
+    schedule_queryset = schedule_queryset.exclude(id__in=quote_schedule_ids)
+    schedule_rows = list(
+        schedule_queryset.annotate(**_schedule_item_stat_annotations()).order_by(*DELIVERY_LEDGER_ORDER).values(
+            'id', 'followup_id', 'visit_date', 'expected_revenue',
+            'ledger_item_count', 'ledger_item_total', 'ledger_item_unpriced',
+        )
+    )
+    top_schedule_ids = top_record_ids_per_account(
+        schedule_queryset, 'followup__department_id', 'followup_id', DELIVERY_LEDGER_ORDER, record_limit,
+    )
+    payload_ids = {
+        row['id'] for row in schedule_rows
+        if top_schedule_ids is None or row['id'] in top_schedule_ids or not _schedule_row_total_is_exact(row)
+    }
+    schedule_records_by_id = {
+        schedule.id: quote_schedule_record_payload(schedule)
+        for schedule in Schedule.objects.filter(id__in=payload_ids).select_related(
             'user', 'followup', 'followup__company', 'followup__department',
         ).prefetch_related(
             'delivery_items_set__product',
-            service_history_prefetch,
-        ).order_by('-visit_date', '-visit_time', '-id')
-    )
-    for schedule in quote_schedules:
-        ledger = ledgers.get(account_key_by_followup_id.get(schedule.followup_id))
+            _ledger_history_prefetch(),
+        )
+    } if payload_ids else {}
+
+    for row in schedule_rows:
+        ledger = ledgers.get(account_key_by_followup_id.get(row['followup_id']))
         if not ledger:
             continue
-        record = quote_schedule_record_payload(schedule)
+        record = schedule_records_by_id.get(row['id'])
+        if record is not None:
+            total_amount = record.get('totalAmount') or 0
+            item_count = record.get('itemCount') or 0
+        else:
+            total_amount = money_int(row['ledger_item_total'])
+            if total_amount <= 0 and row['expected_revenue']:
+                total_amount = money_int(row['expected_revenue'])
+            item_count = row['ledger_item_count'] or 0
         metrics = ledger['metrics']
         metrics['quoteRecords'] += 1
         metrics['quoteCount'] += 1
-        metrics['quoteAmount'] += record.get('totalAmount') or 0
-        metrics['quoteItemCount'] += record.get('itemCount') or 0
-        _update_latest(metrics, 'lastQuoteDate', schedule.visit_date)
-        _append_limited(ledger['quoteRecords'], record, record_limit)
+        metrics['quoteAmount'] += total_amount
+        metrics['quoteItemCount'] += item_count
+        _update_latest(metrics, 'lastQuoteDate', row['visit_date'])
+        if record is not None and (top_schedule_ids is None or row['id'] in top_schedule_ids):
+            _append_limited(ledger['quoteRecords'], record, record_limit)
 
-    department_ids = [followup.department_id for followup in followups if followup.department_id]
-    prepayments = list(
-        Prepayment.objects.filter(
-            created_by__in=scope_users,
-        ).filter(
-            Q(customer_id__in=followup_ids) | Q(department_id__in=department_ids)
-        ).select_related(
+
+def _prepayment_row_account_key(department_id, customer_id, account_key_by_followup_id):
+    return f'department:{department_id}' if department_id else account_key_by_followup_id.get(customer_id)
+
+
+def _collect_prepayment_ledger(ledgers, account_key_by_followup_id, base_queryset, actor, record_limit):
+    rows = list(
+        base_queryset.order_by(*PREPAYMENT_LEDGER_ORDER).values(
+            'id', 'department_id', 'customer_id', 'amount', 'balance', 'payment_date',
+        )
+    )
+    top_ids = top_record_ids_per_account(
+        base_queryset,
+        Coalesce('department_id', 'customer__department_id'),
+        'customer_id',
+        PREPAYMENT_LEDGER_ORDER,
+        record_limit,
+    )
+    visible_ids = [row['id'] for row in rows if top_ids is None or row['id'] in top_ids]
+    prepayments_by_id = {
+        prepayment.id: prepayment
+        for prepayment in Prepayment.objects.filter(id__in=visible_ids).select_related(
             'department', 'department__company', 'company',
             'customer', 'customer__company', 'customer__department', 'created_by',
         ).annotate(
             usage_count=Count('usages', distinct=True),
-        ).distinct().order_by('-payment_date', '-created_at', '-id')
-    )
-    for prepayment in prepayments:
-        account_key = (
-            f'department:{prepayment.department_id}'
-            if prepayment.department_id else account_key_by_followup_id.get(prepayment.customer_id)
         )
-        ledger = ledgers.get(account_key)
+    } if visible_ids else {}
+
+    for row in rows:
+        ledger = ledgers.get(_prepayment_row_account_key(row['department_id'], row['customer_id'], account_key_by_followup_id))
         if not ledger:
             continue
-        record = prepayment_item_payload(prepayment, actor or prepayment.created_by)
+        amount = money_int(row['amount'])
+        balance = money_int(row['balance'])
         metrics = ledger['metrics']
         metrics['prepaymentRecords'] += 1
         metrics['prepaymentCount'] += 1
-        metrics['prepaymentAmount'] += record.get('amount') or 0
-        metrics['prepaymentBalance'] += record.get('balance') or 0
-        metrics['prepaymentUsedTotal'] += record.get('usedAmount') or 0
-        _update_latest(metrics, 'lastPrepaymentDate', prepayment.payment_date)
-        _append_limited(ledger['prepaymentRecords'], record, record_limit)
-
-    usages = list(
-        PrepaymentUsage.objects.filter(
-            Q(prepayment__department_id__in=department_ids) |
-            Q(prepayment__department__isnull=True, prepayment__customer_id__in=followup_ids),
-            prepayment__created_by__in=scope_users,
-        ).select_related(
-            'prepayment', 'prepayment__customer', 'prepayment__department', 'schedule',
-        ).prefetch_related('schedule__delivery_items_set').order_by('-used_at', '-id')
-    )
-    for usage in usages:
-        prepayment = usage.prepayment
-        account_key = (
-            f'department:{prepayment.department_id}'
-            if prepayment and prepayment.department_id else account_key_by_followup_id.get(prepayment.customer_id if prepayment else None)
+        metrics['prepaymentAmount'] += amount
+        metrics['prepaymentBalance'] += balance
+        metrics['prepaymentUsedTotal'] += max(amount - balance, 0)
+        _update_latest(metrics, 'lastPrepaymentDate', row['payment_date'])
+        prepayment = prepayments_by_id.get(row['id'])
+        if prepayment is not None:
+            _append_limited(
+                ledger['prepaymentRecords'],
+                prepayment_item_payload(prepayment, actor or prepayment.created_by),
+                record_limit,
+            )
+
+
+def _collect_usage_ledger(ledgers, account_key_by_followup_id, base_queryset, record_limit):
+    rows = list(
+        base_queryset.order_by(*USAGE_LEDGER_ORDER).values(
+            'id', 'amount', 'prepayment__department_id', 'prepayment__customer_id',
         )
-        ledger = ledgers.get(account_key)
+    )
+    top_ids = top_record_ids_per_account(
+        base_queryset,
+        Coalesce('prepayment__department_id', 'prepayment__customer__department_id'),
+        'prepayment__customer_id',
+        USAGE_LEDGER_ORDER,
+        record_limit,
+    )
+    visible_ids = [row['id'] for row in rows if top_ids is None or row['id'] in top_ids]
+    usages_by_id = {
+        usage.id: usage
+        for usage in PrepaymentUsage.objects.filter(id__in=visible_ids).select_related(
+            'prepayment', 'prepayment__customer', 'prepayment__department', 'schedule',
+        ).prefetch_related('schedule__delivery_items_set')
+    } if visible_ids else {}
+
+    for row in rows:
+        ledger = ledgers.get(_prepayment_row_account_key(
+            row['prepayment__department_id'], row['prepayment__customer_id'], account_key_by_followup_id,
+        ))
         if not ledger:
             continue
-        record = prepayment_usage_drilldown_payload(usage)
         metrics = ledger['metrics']
         metrics['prepaymentUsageRecords'] += 1
         metrics['prepaymentUsageCount'] += 1
-        metrics['prepaymentUsageAmount'] += record.get('amount') or 0
-        _append_limited(ledger['prepaymentUsageRecords'], record, record_limit)
+        metrics['prepaymentUsageAmount'] += money_int(row['amount'])
+        usage = usages_by_id.get(row['id'])
+        if usage is not None:
+            _append_limited(ledger['prepaymentUsageRecords'], prepayment_usage_drilldown_payload(usage), record_limit)
+
+
+def account_operational_ledgers_for_followups(
+    followups,
+    scope_users,
+    *,
+    date_from=None,
+    date_to=None,
+    actor=None,
+    record_limit=50,
+    sections=None,
+):
+    """Build shared delivery/quote/prepayment ledgers keyed by department account.
+
+    Metrics are computed for every in-scope row from narrow ``values()`` rows
+    (item, usage and quote-line sums are SQL subqueries). Only the newest
+    ``record_limit`` records per account, picked with a window function, are
+    loaded with their deep prefetches and rendered as payloads. ``sections``
+    limits the work to a subset of ``LEDGER_SECTIONS``.
+    """
+    followups = list(followups)
+    followup_ids = [followup.id for followup in followups]
+    sections = set(sections or LEDGER_SECTIONS)
+    account_key_by_followup_id = {
+        followup.id: account_key_for_followup(followup)
+        for followup in followups
+    }
+    ledgers = {
+        account_key_for_followup(followup): _empty_account_ledger()
+        for followup in followups
+    }
+    if not followup_ids:
+        return ledgers
+
+    if 'delivery' in sections:
+        _collect_delivery_ledger(
+            ledgers,
+            account_key_by_followup_id,
+            Schedule.objects.filter(
+                followup_id__in=followup_ids,
+                user__in=scope_users,
+                activity_type='delivery',
+                **_date_filter_kwargs('visit_date', date_from, date_to),
+            ).exclude(status='cancelled'),
+            record_limit,
+        )
+
+    if 'quote' in sections:
+        _collect_quote_ledger(
+            ledgers,
+            account_key_by_followup_id,
+            Quote.objects.filter(
+                followup_id__in=followup_ids,
+                user__in=scope_users,
+                **_date_filter_kwargs('quote_date', date_from, date_to),
+            ),
+            Schedule.objects.filter(
+                followup_id__in=followup_ids,
+                user__in=scope_users,
+                activity_type='quote',
+                **_date_filter_kwargs('visit_date', date_from, date_to),
+            ),
+            record_limit,
+        )
+
+    department_ids = [followup.department_id for followup in followups if followup.department_id]
+    if 'prepayment' in sections:
+        _collect_prepayment_ledger(
+            ledgers,
+            account_key_by_followup_id,
+            Prepayment.objects.filter(
+                created_by__in=scope_users,
+            ).filter(
+                Q(customer_id__in=followup_ids) | Q(department_id__in=department_ids)
+            ),
+            actor,
+            record_limit,
+        )
+
+    if 'usage' in sections:
+        _collect_usage_ledger(
+            ledgers,
+            account_key_by_followup_id,
+            PrepaymentUsage.objects.filter(
+                Q(prepayment__department_id__in=department_ids) |
+                Q(prepayment__department__isnull=True, prepayment__customer_id__in=followup_ids),
+                prepayment__created_by__in=scope_users,
+            ),
+            record_limit,
+        )
 
     return ledgers
 
@@ -732,6 +1015,7 @@ def account_operational_ledger_for_followups(
     date_to=None,
     actor=None,
     record_limit=50,
+    sections=None,
 ):
     """Return one combined ledger for a department account or a supplied followup set."""
     ledgers = account_operational_ledgers_for_followups(
@@ -741,6 +1025,7 @@ def account_operational_ledger_for_followups(
         date_to=date_to,
         actor=actor,
         record_limit=record_limit,
+        sections=sections,
     )
     combined = _empty_account_ledger()
     for ledger in ledgers.values():
@@ -751,7 +1036,10 @@ def account_operational_ledger_for_followups(
                 _update_latest(combined['metrics'], key, value)
         for section in ['deliveryRecords', 'quoteRecords', 'prepaymentRecords', 'prepaymentUsageRecords']:
             combined[section].extend(ledger.get(section) or [])
-    combined['deliveryRecords'].sort(key=lambda row: (row.get('date') or '', row.get('id') or 0), reverse=True)
+    combined['deliveryRecords'].sort(
+        key=lambda row: (row.get('date') or '', row.get('time') or '', row.get('id') or 0),
+        reverse=True,
+    )
     combined['quoteRecords'].sort(key=lambda row: (row.get('date') or '', row.get('id') or 0), reverse=True)
     combined['prepaymentRecords'].sort(key=lambda row: (row.get('paymentDate') or '', row.get('id') or 0), reverse=True)
     combined['prepaymentUsageRecords'].sort(key=lambda row: (row.get('usedAt') or '', row.get('id') or 0), reverse=True)
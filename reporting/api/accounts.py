@@ -11,6 +11,8 @@ from reporting.views import (  # noqa: F401
     account_detail_summary_api,
     account_update_api,
     companies_management_api,
+    company_management_departments_api,
+    company_management_move_targets_api,
     company_create_api,
     company_delete_api,
     company_update_api,
@@ -24,7 +24,9 @@ from django.views.decorators.http import require_http_methods
 from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import ensure_csrf_cookie
 
+from reporting.db_routing import read_only_view
 from reporting.models import DeliveryItem, History, Schedule
+from reporting.services.db_pool import EXPORT_STATEMENT_TIMEOUT_MS, REPORT_STATEMENT_TIMEOUT_MS, statement_timeout
 from reporting.funnel_views import (
     PIPELINE_STAGES,
     _pipeline_account_followup,
@@ -473,9 +475,11 @@ def _weekly_payload(request):
 
 # ===================================================================== 뷰
 
+@read_only_view
 @never_cache
 @ensure_csrf_cookie
 @require_http_methods(["GET"])
+@statement_timeout(REPORT_STATEMENT_TIMEOUT_MS)
 def pipeline_sheet_weekly_api(request):
     """계정별 주간 활동."""
     auth_response = _api_login_required_response(request)
@@ -572,8 +576,10 @@ def _write_info_sheet(wb, request, weekly):
     ws.column_dimensions['B'].width = 42
 
 
+@read_only_view
 @never_cache
 @require_http_methods(["GET"])
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
 def pipeline_sheet_export_api(request):
     """파이프라인 시트를 워크북 하나로 내려받는다.
 
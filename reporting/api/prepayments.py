@@ -1885,7 +1885,7 @@ def _prepayment_account_representative_for_request(request, department):
 
     own_prepayment_customer_ids = Prepayment.objects.filter(
         _prepayment_department_filter(department),
-        created_by__in=scope_users,
+        created_by_id__in=scope_user_ids(scope_users),
     ).values('customer_id')
     return (
         FollowUp.objects.filter(pk__in=own_prepayment_customer_ids)
@@ -18,6 +18,7 @@ from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_http_methods
 
 from reporting.models import DeliveryItem, History, Schedule
+from reporting.services.user_scope import scope_user_ids
 from reporting.views import (
     _api_login_required_response,
     _date_or_none,
@@ -202,15 +203,16 @@ def _receivables_sync_history(item):
         History.objects.filter(schedule=schedule, action_type='delivery_schedule').update(tax_invoice_issued=True)
 
 
-def _receivables_scope_users(request):
+def _receivables_scope_user_ids(request):
     profile = get_user_profile(request.user)
+    accessible_ids = scope_user_ids(get_accessible_users(request.user, request))
     if profile.can_view_all_users():
-        return get_accessible_users(request.user, request)
-    return get_accessible_users(request.user, request).filter(id=request.user.id)
+        return accessible_ids
+    return tuple(user_id for user_id in accessible_ids if user_id == request.user.id)
 
 
 def _receivables_queryset(request):
-    scope_users = _receivables_scope_users(request)
+    scope_ids = _receivables_scope_user_ids(request)
     prepayment_filter = (
         Q(schedule__use_prepayment=True)
         | Q(schedule__prepayment__isnull=False)
@@ -244,8 +246,8 @@ def _receivables_queryset(request):
             'receivable_settled_by',
         )
         .filter(
-            Q(schedule__activity_type='delivery', schedule__user__in=scope_users)
-            | Q(schedule__isnull=True, history__action_type='delivery_schedule', history__user__in=scope_users)
+            Q(schedule__activity_type='delivery', schedule__user_id__in=scope_ids)
+            | Q(schedule__isnull=True, history__action_type='delivery_schedule', history__user_id__in=scope_ids)
         )
         .exclude(prepayment_filter)
         .distinct()
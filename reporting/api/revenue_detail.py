@@ -5,16 +5,29 @@
 계산해서, 여기서 보여주는 내역 합계가 대시보드 상단 숫자와 항상 일치하게 한다.
 완료(completed)된 납품과 선결제만 "실제 매출"로 센다 — 예정(scheduled) 납품은
 아직 실제로 일어나지 않아 취소·변경될 수 있으므로 제외한다.
+
+- ``revenue_detail_api`` 는 계정/담당자/월/품목별 합계만 SQL 집계로 돌려준다.
+  상단 합계도 같은 집계 결과를 더한 값이다.
+- ``revenue_detail_items_api`` 는 사용자가 펼친 그룹의 내역 행을
+  ``(날짜, 구분, id)`` 커서로 한 페이지씩 돌려준다.
 """
 
+import base64
+import binascii
 from datetime import date, timedelta
+from heapq import merge
 
+from django.contrib.auth.models import User
+from django.db.models import Count, DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
 from django.http import JsonResponse
 from django.utils import timezone
 from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_http_methods
 
-from reporting.models import DeliveryItem, Prepayment, Schedule
+from reporting.db_routing import read_only_view
+from reporting.models import DeliveryItem, Department, Prepayment
+from reporting.services.user_scope import scope_user_ids
 from reporting.views import (
     _api_login_required_response,
     _dashboard_scope_users,
@@ -23,6 +36,28 @@ from reporting.views import (
     get_user_profile,
 )
 
+REVENUE_ITEMS_PAGE_SIZE = 50
+REVENUE_ITEMS_MAX_PAGE_SIZE = 200
+
+# 그룹 기준별 (라벨, 납품 그룹 식, 선결제 그룹 식). 품목별의 선결제는 한 그룹으로 묶는다.
+REVENUE_GROUPINGS = {
+    'account': (
+        '계정별',
+        Coalesce('schedule__followup__department_id', 'schedule__department_id'),
+        Coalesce('department_id', 'customer__department_id'),
+    ),
+    'owner': ('담당자별', F('schedule__user_id'), F('created_by_id')),
+    'month': ('월별', TruncMonth('schedule__visit_date'), TruncMonth('payment_date')),
+    'product': ('품목별', F('item_name'), None),
+}
+PREPAYMENT_GROUP_KEY = 'prepayment'
+NO_GROUP_KEY = 'none'
+# 품목명은 사용자가 입력한 값이라 'prepayment'·'none' 과 겹치지 않게 접두사를 붙인다.
+PRODUCT_GROUP_PREFIX = 'item:'
+
+# 같은 날짜 안에서는 납품을 선결제보다 먼저 보여준다.
+_KIND_RANK = {'delivery': 1, 'prepayment': 0}
+
 
 def _period_bounds(period, today):
     if period == 'month':
@@ -58,105 +93,326 @@ def _account_label(followup, department):
     return ' / '.join(part for part in [company_name, department_name or customer_name] if part) or '고객 미지정'
 
 
-@never_cache
-@require_http_methods(["GET"])
-def revenue_detail_api(request):
-    """대시보드 매출 카드가 가리키는 실제 내역 — 완료 납품 + 선결제만."""
-    auth_response = _api_login_required_response(request)
-    if auth_response:
-        return auth_response
-
+def _revenue_querysets(request):
+    """요청의 조회 범위·기간에 해당하는 (완료 납품 품목, 선결제) 쿼리셋과 응답 공통 필드."""
     user_profile = get_user_profile(request.user)
     scope_users, selected_user = _dashboard_scope_users(request, user_profile)
+    scope_ids = scope_user_ids(scope_users)
     today = timezone.localdate()
     period = request.GET.get('period') if request.GET.get('period') in ('year', 'quarter', 'month') else 'year'
     start, end, period_label = _period_bounds(period, today)
 
     delivery_items = DeliveryItem.objects.filter(
-        schedule__in=Schedule.objects.filter(user__in=scope_users),
+        schedule__user_id__in=scope_ids,
         schedule__activity_type='delivery',
         schedule__status='completed',
         schedule__visit_date__gte=start,
         schedule__visit_date__lt=end,
-    ).select_related(
-        'schedule', 'schedule__user',
-        'schedule__followup', 'schedule__followup__company', 'schedule__followup__department',
-        'schedule__department', 'schedule__department__company',
     )
-
     prepayments = Prepayment.objects.filter(
-        created_by__in=scope_users,
+        created_by_id__in=scope_ids,
         payment_date__gte=start,
         payment_date__lt=end,
-    ).exclude(status='cancelled').select_related(
-        'customer', 'customer__company', 'customer__department', 'company', 'department', 'created_by',
+    ).exclude(status='cancelled')
+
+    scope_label = (
+        _user_display_name(selected_user) if selected_user
+        else (f'{user_profile.company.name} 팀' if user_profile.company else '전체')
     )
+    context = {
+        'period': {
+            'value': period,
+            'label': period_label,
+            'start': start.isoformat(),
+            'end': (end - timedelta(days=1)).isoformat(),
+        },
+        'scope': {'label': scope_label},
+    }
+    return delivery_items, prepayments, context
 
-    items = []
-    delivery_total = 0
-    for delivery_item in delivery_items:
-        schedule = delivery_item.schedule
-        followup = schedule.followup if schedule.followup_id else None
-        department = (
-            followup.department if followup is not None and followup.department_id
-            else (schedule.department if schedule.department_id else None)
-        )
-        amount = _money_int(delivery_item.total_price)
-        delivery_total += amount
-        items.append({
-            'kind': 'delivery',
-            'date': schedule.visit_date.isoformat() if schedule.visit_date else None,
-            'accountLabel': _account_label(followup, department),
-            'itemName': delivery_item.item_name,
-            'quantity': delivery_item.quantity,
-            'amount': amount,
-            'owner': _user_display_name(schedule.user) if schedule.user_id else '',
-            'href': f'/schedules/{schedule.id}/',
-        })
 
-    prepayment_total = 0
-    for prepayment in prepayments:
-        followup = prepayment.customer if prepayment.customer_id else None
-        department = (
-            prepayment.department if prepayment.department_id
-            else (followup.department if followup is not None and followup.department_id else None)
-        )
-        amount = _money_int(prepayment.amount)
-        prepayment_total += amount
-        items.append({
-            'kind': 'prepayment',
-            'date': prepayment.payment_date.isoformat() if prepayment.payment_date else None,
-            'accountLabel': _account_label(followup, department),
-            'itemName': f'선결제 · {prepayment.get_payment_method_display()}',
-            'quantity': None,
-            'amount': amount,
-            'owner': _user_display_name(prepayment.created_by) if prepayment.created_by_id else '',
-            'href': f'/prepayments/{prepayment.id}/',
+def _grouping(request):
+    grouping = request.GET.get('group')
+    return grouping if grouping in REVENUE_GROUPINGS else 'account'
+
+
+def _group_key(grouping, value):
+    if value is None or value == '':
+        return NO_GROUP_KEY
+    if grouping == 'product':
+        return f'{PRODUCT_GROUP_PREFIX}{value}'
+    if grouping == 'month':
+        return value.strftime('%Y-%m')
+    return str(value)
+
+
+def _group_value(grouping, key):
+    """그룹 키를 그룹 식과 비교할 값으로 되돌린다. 잘못된 키는 ``ValueError``."""
+    if key == NO_GROUP_KEY:
+        return None
+    if grouping == 'month':
+        year, month = key.split('-')
+        return date(int(year), int(month), 1)
+    if grouping in ('account', 'owner'):
+        return int(key)
+    if grouping == 'product' and key.startswith(PRODUCT_GROUP_PREFIX):
+        return key[len(PRODUCT_GROUP_PREFIX):]
+    raise ValueError(key)
+
+
+def _aggregate_groups(queryset, expression, amount_field):
+    """``{그룹 값: (금액 합계, 건수)}`` — 그룹 식이 없으면 전체를 ``None`` 키 하나로."""
+    totals = {
+        'amount': Coalesce(Sum(amount_field), Value(0), output_field=DecimalField(max_digits=20, decimal_places=0)),
+        'count': Count('id'),
+    }
+    if expression is None:
+        row = queryset.aggregate(**totals)
+        return {None: (row['amount'], row['count'])} if row['count'] else {}
+    rows = queryset.annotate(group_value=expression).order_by().values('group_value').annotate(**totals)
+    return {row['group_value']: (row['amount'], row['count']) for row in rows}
+
+
+def _group_labels(grouping, keys):
+    if grouping == 'account':
+        department_ids = [int(key) for key in keys if key != NO_GROUP_KEY]
+        labels = {
+            str(department.id): _account_label(None, department)
+            for department in Department.objects.filter(id__in=department_ids).select_related('company')
+        }
+        labels[NO_GROUP_KEY] = '부서 미지정'
+        return labels
+    if grouping == 'owner':
+        user_ids = [int(key) for key in keys if key != NO_GROUP_KEY]
+        labels = {str(user.id): _user_display_name(user) for user in User.objects.filter(id__in=user_ids)}
+        labels[NO_GROUP_KEY] = '담당자 미지정'
+        return labels
+    if grouping == 'month':
+        return {key: f'{int(key[:4])}년 {int(key[5:])}월' for key in keys if key != NO_GROUP_KEY}
+    labels = {key: key[len(PRODUCT_GROUP_PREFIX):] for key in keys if key.startswith(PRODUCT_GROUP_PREFIX)}
+    labels[PREPAYMENT_GROUP_KEY] = '선결제'
+    labels[NO_GROUP_KEY] = '품목명 미지정'
+    return labels
+
+
+def _revenue_groups(grouping, delivery_items, prepayments):
+    _label, delivery_expression, prepayment_expression = REVENUE_GROUPINGS[grouping]
+    groups = {}
+
+    def group_for(key):
+        return groups.setdefault(key, {
+            'key': key, 'label': '', 'total': 0, 'deliveryTotal': 0, 'prepaymentTotal': 0, 'itemCount': 0,
         })
 
-    items.sort(key=lambda entry: entry['date'] or '', reverse=True)
+    for value, (amount, count) in _aggregate_groups(delivery_items, delivery_expression, 'total_price').items():
+        group = group_for(_group_key(grouping, value))
+        group['deliveryTotal'] += _money_int(amount)
+        group['itemCount'] += count
+    for value, (amount, count) in _aggregate_groups(prepayments, prepayment_expression, 'amount').items():
+        key = PREPAYMENT_GROUP_KEY if prepayment_expression is None else _group_key(grouping, value)
+        group = group_for(key)
+        group['prepaymentTotal'] += _money_int(amount)
+        group['itemCount'] += count
 
-    scope_label = (
-        _user_display_name(selected_user) if selected_user
-        else (f'{user_profile.company.name} 팀' if user_profile.company else '전체')
+    labels = _group_labels(grouping, list(groups))
+    for group in groups.values():
+        group['total'] = group['deliveryTotal'] + group['prepaymentTotal']
+        group['label'] = labels.get(group['key']) or group['key']
+    if grouping == 'month':
+        return sorted(groups.values(), key=lambda group: group['key'])
+    return sorted(groups.values(), key=lambda group: (-group['total'], group['label']))
+
+
+def _filter_group(grouping, key, delivery_items, prepayments):
+    """펼친 그룹 ``key`` 에 속한 행만 남긴 (납품, 선결제) 쿼리셋."""
+    _label, delivery_expression, prepayment_expression = REVENUE_GROUPINGS[grouping]
+    if grouping == 'product':
+        if key == PREPAYMENT_GROUP_KEY:
+            return delivery_items.none(), prepayments
+        return delivery_items.filter(item_name=_group_value(grouping, key) or ''), prepayments.none()
+    value = _group_value(grouping, key)
+    group_filter = {'group_value__isnull': True} if value is None else {'group_value': value}
+    return (
+        delivery_items.annotate(group_value=delivery_expression).filter(**group_filter),
+        prepayments.annotate(group_value=prepayment_expression).filter(**group_filter),
+    )
+
+
+def encode_line_cursor(line_date, kind, pk) -> str:
+    raw = f'{line_date.isoformat()}|{kind}|{pk}'.encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_line_cursor(token):
+    """``(date, kind, pk)`` for a token from :func:`encode_line_cursor`, or ``None``."""
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        date_text, kind, pk_text = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8').split('|', 2)
+        line_date = date.fromisoformat(date_text)
+        pk = int(pk_text)
+    except (binascii.Error, UnicodeError, ValueError):
+        return None
+    if kind not in _KIND_RANK:
+        return None
+    return line_date, kind, pk
+
+
+def _after_cursor(queryset, date_field, kind, cursor):
+    """``(날짜, 구분 순위, id)`` 내림차순에서 커서 다음 행들."""
+    if cursor is None:
+        return queryset
+    cursor_date, cursor_kind, cursor_pk = cursor
+    before = Q(**{f'{date_field}__lt': cursor_date})
+    if _KIND_RANK[kind] < _KIND_RANK[cursor_kind]:
+        return queryset.filter(before | Q(**{date_field: cursor_date}))
+    if _KIND_RANK[kind] == _KIND_RANK[cursor_kind]:
+        return queryset.filter(before | Q(**{date_field: cursor_date, 'id__lt': cursor_pk}))
+    return queryset.filter(before)
+
+
+def _delivery_line(delivery_item):
+    schedule = delivery_item.schedule
+    followup = schedule.followup if schedule.followup_id else None
+    department = (
+        followup.department if followup is not None and followup.department_id
+        else (schedule.department if schedule.department_id else None)
+    )
+    return {
+        'kind': 'delivery',
+        'date': schedule.visit_date.isoformat() if schedule.visit_date else None,
+        'accountLabel': _account_label(followup, department),
+        'itemName': delivery_item.item_name,
+        'quantity': delivery_item.quantity,
+        'amount': _money_int(delivery_item.total_price),
+        'owner': _user_display_name(schedule.user) if schedule.user_id else '',
+        'href': f'/schedules/{schedule.id}/',
+    }
+
+
+def _prepayment_line(prepayment):
+    followup = prepayment.customer if prepayment.customer_id else None
+    department = (
+        prepayment.department if prepayment.department_id
+        else (followup.department if followup is not None and followup.department_id else None)
+    )
+    return {
+        'kind': 'prepayment',
+        'date': prepayment.payment_date.isoformat() if prepayment.payment_date else None,
+        'accountLabel': _account_label(followup, department),
+        'itemName': f'선결제 · {prepayment.get_payment_method_display()}',
+        'quantity': None,
+        'amount': _money_int(prepayment.amount),
+        'owner': _user_display_name(prepayment.created_by) if prepayment.created_by_id else '',
+        'href': f'/prepayments/{prepayment.id}/',
+    }
+
+
+def _revenue_line_page(delivery_items, prepayments, cursor_token, limit):
+    """납품·선결제를 날짜 내림차순으로 합친 ``limit`` 행과 다음 커서.
+
+    두 쿼리 모두 커서 다음 ``limit + 1`` 행만 읽고, 이미 정렬된 두 목록을 합친다.
+    """
+    cursor = decode_line_cursor(cursor_token)
+    deliveries = list(
+        _after_cursor(delivery_items, 'schedule__visit_date', 'delivery', cursor)
+        .select_related(
+            'schedule', 'schedule__user',
+            'schedule__followup', 'schedule__followup__company', 'schedule__followup__department',
+            'schedule__department', 'schedule__department__company',
+        )
+        .order_by('-schedule__visit_date', '-id')[:limit + 1]
+    )
+    prepayment_rows = list(
+        _after_cursor(prepayments, 'payment_date', 'prepayment', cursor)
+        .select_related('customer', 'customer__company', 'customer__department', 'company', 'department', 'created_by')
+        .order_by('-payment_date', '-id')[:limit + 1]
     )
+    lines = list(merge(
+        ((item.schedule.visit_date, _KIND_RANK['delivery'], item.id, 'delivery', item) for item in deliveries),
+        ((prepayment.payment_date, _KIND_RANK['prepayment'], prepayment.id, 'prepayment', prepayment)
+         for prepayment in prepayment_rows),
+        key=lambda line: line[:3],
+        reverse=True,
+    ))[:limit + 1]
+    has_more = len(lines) > limit
+    lines = lines[:limit]
+    next_cursor = encode_line_cursor(lines[-1][0], lines[-1][3], lines[-1][2]) if has_more else None
+    items = [
+        _delivery_line(row) if kind == 'delivery' else _prepayment_line(row)
+        for _date, _rank, _pk, kind, row in lines
+    ]
+    return items, next_cursor
+
+
+@read_only_view
+@never_cache
+@require_http_methods(["GET"])
+def revenue_detail_api(request):
+    """대시보드 매출 카드가 가리키는 실제 매출 — 완료 납품 + 선결제의 그룹별 합계."""
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    delivery_items, prepayments, context = _revenue_querysets(request)
+    grouping = _grouping(request)
+    groups = _revenue_groups(grouping, delivery_items, prepayments)
+    delivery_total = sum(group['deliveryTotal'] for group in groups)
+    prepayment_total = sum(group['prepaymentTotal'] for group in groups)
 
     return JsonResponse({
         'success': True,
         'source': 'django',
         'generatedAt': timezone.now().isoformat(),
-        'period': {
-            'value': period,
-            'label': period_label,
-            'start': start.isoformat(),
-            'end': (end - timedelta(days=1)).isoformat(),
+        **context,
+        'grouping': {
+            'value': grouping,
+            'label': REVENUE_GROUPINGS[grouping][0],
+            'options': [{'value': value, 'label': spec[0]} for value, spec in REVENUE_GROUPINGS.items()],
         },
-        'scope': {'label': scope_label},
         'summary': {
             'total': delivery_total + prepayment_total,
             'deliveryTotal': delivery_total,
             'prepaymentTotal': prepayment_total,
-            'itemCount': len(items),
+            'itemCount': sum(group['itemCount'] for group in groups),
         },
+        'groups': groups,
+    })
+
+
+@read_only_view
+@never_cache
+@require_http_methods(["GET"])
+def revenue_detail_items_api(request):
+    """매출 드릴다운에서 펼친 그룹(``group``/``key``)의 내역 행 한 페이지.
+
+    ``key`` 가 없으면 기간 전체 내역을 준다. ``cursor`` 는 직전 응답의 ``nextCursor``.
+    """
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    delivery_items, prepayments, _context = _revenue_querysets(request)
+    grouping = _grouping(request)
+    key = request.GET.get('key') or ''
+    if key:
+        try:
+            delivery_items, prepayments = _filter_group(grouping, key, delivery_items, prepayments)
+        except ValueError:
+            return JsonResponse({'success': False, 'error': '잘못된 그룹입니다.'}, status=400)
+    try:
+        limit = int(request.GET.get('limit') or REVENUE_ITEMS_PAGE_SIZE)
+    except ValueError:
+        limit = REVENUE_ITEMS_PAGE_SIZE
+    limit = max(1, min(limit, REVENUE_ITEMS_MAX_PAGE_SIZE))
+
+    items, next_cursor = _revenue_line_page(delivery_items, prepayments, request.GET.get('cursor'), limit)
+    return JsonResponse({
+        'success': True,
+        'grouping': grouping,
+        'key': key,
         'items': items,
+        'nextCursor': next_cursor,
+        'hasMore': next_cursor is not None,
     })
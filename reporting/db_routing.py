@@ -0,0 +1,120 @@
+"""읽기 전용 요청을 읽기 복제본(replica) DB 로 보내는 라우터와 미들웨어.
+
+분석 도구(salesnote-mcp 읽기 토큰)와 무거운 리포트 조회가 영업 담당자의 저장 요청과
+같은 primary 연결을 다투지 않게 한다.
+
+- ``DATABASES`` 에 ``READ_REPLICA_ALIAS``(기본 ``replica``) 가 없으면 아무것도 하지 않는다.
+- 복제본으로 가는 요청: GET/HEAD 이면서
+  (1) ``Authorization: Bearer`` 로 ``READONLY_ALLOWED_URL_NAMES`` 뷰를 부르거나
+  (2) 뷰가 :func:`read_only_view` 로 표시된 경우.
+- 쓰기는 항상 ``default``. 같은 브라우저가 POST 등 쓰기 요청을 보내면
+  ``READ_REPLICA_STICKY_SECONDS`` 동안 쿠키로 primary 에 고정해, 방금 저장한 내용이
+  복제 지연 때문에 안 보이는 일이 없게 한다(read-your-writes).
+- 관리 명령·Celery 작업은 :func:`read_replica` 블록으로 같은 라우팅을 쓸 수 있다.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .readonly_api import READONLY_ALLOWED_URL_NAMES
+
+PRIMARY_STICKY_COOKIE = 'salesnote_db_primary'
+SAFE_METHODS = {'GET', 'HEAD', 'OPTIONS', 'TRACE'}
+READ_ONLY_METHODS = {'GET', 'HEAD'}
+
+_read_alias = ContextVar('reporting_read_alias', default=None)
+
+
+def replica_alias():
+    """설정된 복제본 alias. 없으면 ``None``."""
+    alias = getattr(settings, 'READ_REPLICA_ALIAS', 'replica')
+    return alias if alias and alias in connections.settings else None
+
+
+def current_read_alias():
+    """현재 요청(블록)의 ORM 읽기가 쓰는 alias."""
+    return _read_alias.get() or DEFAULT_DB_ALIAS
+
+
+@contextmanager
+def read_replica():
+    """블록 안의 ORM 읽기를 복제본으로 보낸다(복제본이 없으면 primary)."""
+    token = _read_alias.set(replica_alias())
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+def read_only_view(view_func):
+    """뷰를 읽기 전용으로 표시한다. 세션 요청도 복제본에서 읽는다."""
+    @wraps(view_func)
+    def wrapped(*args, **kwargs):
+        return view_func(*args, **kwargs)
+    wrapped.reporting_read_only = True
+    return wrapped
+
+
+class ReadReplicaRouter:
+    """읽기는 현재 요청이 고른 alias, 쓰기와 마이그레이션은 ``default``."""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 primary 와 같은 데이터라 두 alias 의 객체를 서로 연결해도 된다.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본 스키마는 primary 에서 복제된다.
+        return None if db == DEFAULT_DB_ALIAS else False
+
+
+def _is_read_only_request(request, view_func):
+    if request.method not in READ_ONLY_METHODS:
+        return False
+    if request.COOKIES.get(PRIMARY_STICKY_COOKIE):
+        return False
+    if getattr(view_func, 'reporting_read_only', False):
+        return True
+    url_name = getattr(getattr(request, 'resolver_match', None), 'url_name', None)
+    has_bearer = request.headers.get('Authorization', '').lower().startswith('bearer ')
+    return has_bearer and url_name in READONLY_ALLOWED_URL_NAMES
+
+
+class ReadReplicaMiddleware:
+    """읽기 전용 요청의 ORM 읽기를 복제본으로 보내고, 쓰기 뒤에는 primary 에 고정한다."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        try:
+            response = self.get_response(request)
+        finally:
+            token = getattr(request, '_read_replica_token', None)
+            if token is not None:
+                _read_alias.reset(token)
+        if request.method not in SAFE_METHODS and replica_alias():
+            response.set_cookie(
+                PRIMARY_STICKY_COOKIE,
+                '1',
+                max_age=getattr(settings, 'READ_REPLICA_STICKY_SECONDS', 10),
+                httponly=True,
+                samesite='Lax',
+                secure=getattr(settings, 'SESSION_COOKIE_SECURE', False),
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        alias = replica_alias()
+        if alias and _is_read_only_request(request, view_func):
+            request._read_replica_token = _read_alias.set(alias)
+            request.read_replica_alias = alias
+        return None
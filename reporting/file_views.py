@@ -1,13 +1,12 @@
 # 파일 관리 관련 뷰들
 from django.shortcuts import get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
-from django.http import FileResponse, JsonResponse, Http404, HttpResponse
+from django.http import JsonResponse, Http404, HttpResponse
 from django.contrib import messages
 from django.views.decorators.http import require_POST
 from django.urls import reverse
 from .models import HistoryFile, History
-import os
-import mimetypes
+from .services.file_delivery import serve_file
 
 
 def _can_manage_history_files(user, history):
@@ -55,22 +54,17 @@ def file_download_view(request, file_id):
             raise Http404("파일에 접근할 권한이 없습니다.")
         
         # 파일이 존재하는지 확인
-        if not os.path.exists(history_file.file.path):
+        if not history_file.file.storage.exists(history_file.file.name):
             messages.error(request, '파일을 찾을 수 없습니다.')
             return redirect('reporting:history_detail', pk=history_file.history.pk)
         
-        # 파일 다운로드 응답 생성
-        response = FileResponse(
-            open(history_file.file.path, 'rb'),
-            as_attachment=True,
-            filename=history_file.original_filename
+        # Range/조건부 요청 처리 및 프록시(X-Accel-Redirect/X-Sendfile) 위임
+        response = serve_file(
+            request,
+            history_file.file.path,
+            filename=history_file.original_filename,
         )
         
-        # MIME 타입 설정
-        content_type, _ = mimetypes.guess_type(history_file.original_filename)
-        if content_type:
-            response['Content-Type'] = content_type
-        
         return response
         
     except Exception as e:
@@ -91,9 +85,9 @@ def file_delete_view(request, file_id):
                 'error': '파일을 삭제할 권한이 없습니다.'
             }, status=403)
         
-        # 물리적 파일 삭제
-        if os.path.exists(history_file.file.path):
-            os.remove(history_file.file.path)
+        # 물리적 파일 삭제 (저장소 API 경유: 공유 블롭은 마지막 참조가 지워질 때만 삭제)
+        if history_file.file:
+            history_file.file.delete(save=False)
         
         # 데이터베이스에서 파일 정보 삭제
         filename = history_file.original_filename
@@ -345,7 +339,6 @@ def schedule_file_download(request, file_id):
     """일정 파일 다운로드"""
     try:
         from .models import ScheduleFile
-        from django.http import FileResponse
         file_obj = get_object_or_404(ScheduleFile, id=file_id)
         
         # 권한 체크
@@ -353,9 +346,16 @@ def schedule_file_download(request, file_id):
         if not can_access_user_data(request.user, file_obj.schedule.user):
             return HttpResponse('이 파일에 접근할 권한이 없습니다.', status=403)
         
-        # FileResponse로 스트리밍 (전체 메모리 로드 방지)
-        response = FileResponse(file_obj.file.open('rb'), content_type='application/octet-stream')
-        response['Content-Disposition'] = f'attachment; filename="{file_obj.original_filename}"'
+        if not file_obj.file or not file_obj.file.storage.exists(file_obj.file.name):
+            return HttpResponse('파일을 찾을 수 없습니다.', status=404)
+
+        # Range/조건부 요청 처리 및 프록시(X-Accel-Redirect/X-Sendfile) 위임
+        response = serve_file(
+            request,
+            file_obj.file.path,
+            filename=file_obj.original_filename,
+            content_type='application/octet-stream',
+        )
         return response
         
     except Exception:
@@ -20,6 +20,8 @@ from .models import (
     DeliveryItem, FunnelTarget, Quote
 )
 from .readonly_api import readonly_bearer_or_login_required
+from .db_routing import read_only_view
+from .services.db_pool import REPORT_STATEMENT_TIMEOUT_MS, statement_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -1859,9 +1861,11 @@ def pipeline_followups_queryset(request, today=None):
     )
 
 
+@read_only_view
 @readonly_bearer_or_login_required
 @require_GET
 @ensure_csrf_cookie
+@statement_timeout(REPORT_STATEMENT_TIMEOUT_MS)
 def pipeline_command_center_api(request):
     """React 파일럿용 읽기 전용 파이프라인 데이터 API."""
     today = timezone.localdate()
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from reporting.models import EmailLog
+from reporting.services.email_text import EMAIL_TEXT_PARSER_VERSION, refresh_email_text
+
+
+class Command(BaseCommand):
+    help = (
+        "Derive EmailLog.body_text/body_preview for rows whose text_parser_version "
+        "is older than the current email text parser."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows updated per bulk_update. Defaults to 500.',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=0,
+            help='Maximum number of stale rows to process. 0 means no limit.',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count stale rows.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, int(options['batch_size'] or 500))
+        limit = max(0, int(options['limit'] or 0))
+        stale = EmailLog.objects.exclude(text_parser_version=EMAIL_TEXT_PARSER_VERSION).order_by('id')
+        total = stale.count()
+        if options['dry_run']:
+            self.stdout.write(f'stale={total} parser_version={EMAIL_TEXT_PARSER_VERSION}')
+            return
+
+        processed = 0
+        last_id = 0
+        fields = ['body_text', 'body_preview', 'text_parser_version']
+        while not limit or processed < limit:
+            size = batch_size if not limit else min(batch_size, limit - processed)
+            batch = list(stale.filter(id__gt=last_id).only('id', 'body', 'body_html', 'text_parser_version')[:size])
+            if not batch:
+                break
+            for email in batch:
+                refresh_email_text(email)
+            EmailLog.objects.bulk_update(batch, fields)
+            processed += len(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f'updated={processed}/{total}')
+
+        self.stdout.write(self.style.SUCCESS(f'done updated={processed} parser_version={EMAIL_TEXT_PARSER_VERSION}'))
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from reporting.models import DeliveryItem, QuoteItemAllocation
+from reporting.services.quote_allocations import build_legacy_allocations, sync_delivery_schedule_allocations
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild quote-to-delivery allocation rows. Linked delivery lines are re-synced; "
+        "delivery lines saved before quote links existed are matched once to the same owner's "
+        "quotes for the same customer by item identity (oldest quote first) and stored as legacy rows."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skip-legacy', action='store_true', help='Only re-sync linked delivery lines.')
+        parser.add_argument('--dry-run', action='store_true', help='Count legacy matches without writing them.')
+
+    def handle(self, *args, **options):
+        schedule_ids = list(
+            DeliveryItem.objects.filter(schedule__isnull=False)
+            .exclude(source_quote_item__isnull=True, source_quote_schedule__isnull=True)
+            .order_by()
+            .values_list('schedule_id', flat=True)
+            .distinct()
+        )
+        if not options['dry_run']:
+            for index, schedule_id in enumerate(schedule_ids, start=1):
+                with transaction.atomic():
+                    sync_delivery_schedule_allocations(schedule_id)
+                if index % 200 == 0:
+                    self.stdout.write(f'linked schedules={index}/{len(schedule_ids)}')
+        self.stdout.write(f'linked schedules={len(schedule_ids)}')
+
+        if options['skip_legacy']:
+            self.stdout.write(self.style.SUCCESS('done (legacy matching skipped)'))
+            return
+
+        matched = self._match_legacy(dry_run=options['dry_run'])
+        verb = 'would match' if options['dry_run'] else 'matched'
+        self.stdout.write(self.style.SUCCESS(f'legacy {verb}={matched}'))
+
+    def _match_legacy(self, dry_run):
+        unlinked = (
+            DeliveryItem.objects.filter(
+                schedule__activity_type='delivery',
+                source_quote_item__isnull=True,
+                source_quote_schedule__isnull=True,
+                quote_allocation__isnull=True,
+            )
+            .exclude(schedule__status='cancelled')
+            .select_related('schedule')
+            .order_by('id')
+        )
+        rows = build_legacy_allocations(unlinked)
+        if rows and not dry_run:
+            QuoteItemAllocation.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from reporting.models import UserProfile
+from reporting.services.perf_benchmark import DEFAULT_ENDPOINTS, compare_to_baseline, run_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the main React APIs in-process (p50/p95 latency, query count, peak memory) "
+        "and write a JSON baseline; --compare fails on regressions against an earlier baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='', help='User to log in as. Defaults to the first perf-data manager.')
+        parser.add_argument('--endpoint', action='append', default=[], help=f'URL name (repeatable). Defaults to {", ".join(DEFAULT_ENDPOINTS)}.')
+        parser.add_argument('--iterations', type=int, default=20)
+        parser.add_argument('--warmup', type=int, default=2)
+        parser.add_argument('--output', default='output/perf/baseline.json')
+        parser.add_argument('--compare', default='', help='Earlier baseline JSON to compare against.')
+        parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative p95 growth. Defaults to 0.25.')
+
+    def handle(self, *args, **options):
+        user = self._user(options['username'])
+        result = run_benchmark(
+            user,
+            endpoints=options['endpoint'] or DEFAULT_ENDPOINTS,
+            iterations=max(1, options['iterations']),
+            warmup=max(0, options['warmup']),
+            log=self.stdout.write,
+        )
+
+        output_path = Path(options['output'])
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+        self.stdout.write(f'baseline written to {output_path}')
+
+        if options['compare']:
+            baseline = json.loads(Path(options['compare']).read_text(encoding='utf-8'))
+            regressions = compare_to_baseline(result, baseline, tolerance=options['tolerance'])
+            if regressions:
+                raise CommandError('performance regressions:\n' + '\n'.join(regressions))
+        self.stdout.write(self.style.SUCCESS(f"done endpoints={len(result['endpoints'])}"))
+
+    def _user(self, username):
+        User = get_user_model()
+        if username:
+            try:
+                return User.objects.get(username=username)
+            except User.DoesNotExist:
+                raise CommandError(f'User not found: {username}')
+        profile = (
+            UserProfile.objects.filter(role='manager', user__username__startswith='perf')
+            .select_related('user')
+            .order_by('user_id')
+            .first()
+        )
+        if profile is None:
+            raise CommandError('No perf-data manager found; run seed_perf_data or pass --username.')
+        return profile.user
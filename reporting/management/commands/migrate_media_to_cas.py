@@ -0,0 +1,73 @@
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import storages
+from django.core.management.base import BaseCommand, CommandError
+
+from reporting.models import MediaReference
+from reporting.services.media_storage import ContentAddressedStorage
+
+
+DEFAULT_EXCLUDES = ('backups', 'blobs', 'blob-cache')
+
+
+class Command(BaseCommand):
+    help = (
+        "Copy files under MEDIA_ROOT into the content-addressed media storage, keeping their "
+        "storage names. Files already indexed with the same size are skipped, so the command "
+        "can be re-run after an interruption."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--source', default='', help='Source directory. Defaults to MEDIA_ROOT.')
+        parser.add_argument(
+            '--exclude',
+            action='append',
+            default=None,
+            help=f"Top-level directory to skip (repeatable). Defaults to {', '.join(DEFAULT_EXCLUDES)}.",
+        )
+        parser.add_argument('--limit', type=int, default=0, help='Maximum number of files to copy. 0 means no limit.')
+        parser.add_argument('--dry-run', action='store_true', help='Only count files that would be copied.')
+
+    def handle(self, *args, **options):
+        source = Path(options['source'] or settings.MEDIA_ROOT)
+        if not source.is_dir():
+            raise CommandError(f'{source} is not a directory.')
+        excludes = set(options['exclude'] or DEFAULT_EXCLUDES)
+        limit = max(0, options['limit'] or 0)
+
+        storage = storages['default']
+        if not isinstance(storage, ContentAddressedStorage):
+            storage = ContentAddressedStorage()
+
+        indexed = dict(MediaReference.objects.values_list('name', 'blob__size'))
+        copied = skipped = 0
+        for path in self._iter_files(source, excludes):
+            name = path.relative_to(source).as_posix()
+            if indexed.get(name) == path.stat().st_size:
+                skipped += 1
+                continue
+            if limit and copied >= limit:
+                break
+            if not options['dry_run']:
+                with path.open('rb') as handle:
+                    storage.store(name, File(handle, name=name))
+            copied += 1
+            if copied % 100 == 0:
+                self.stdout.write(f'copied={copied} skipped={skipped}')
+
+        verb = 'would copy' if options['dry_run'] else 'copied'
+        self.stdout.write(self.style.SUCCESS(f'{verb}={copied} skipped={skipped}'))
+
+    def _iter_files(self, source, excludes):
+        for root, dirs, files in os.walk(source):
+            root_path = Path(root)
+            if root_path == source:
+                dirs[:] = [name for name in dirs if name not in excludes]
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.startswith('.'):
+                    continue
+                yield root_path / filename
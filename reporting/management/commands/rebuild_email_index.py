@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+
+from reporting.models import EmailContextIndex, EmailLog
+from reporting.services.email_index import sync_email_index_for_ids
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild EmailContextIndex rows (the per-user EmailLog index used by the AI "
+        "email context builders) from EmailLog, FollowUp and Schedule links."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Emails re-indexed per batch. Defaults to 500.',
+        )
+        parser.add_argument(
+            '--missing-only',
+            action='store_true',
+            help='Only index emails that have no index rows yet.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, int(options['batch_size'] or 500))
+        emails = EmailLog.objects.order_by('id')
+        if options['missing_only']:
+            emails = emails.exclude(id__in=EmailContextIndex.objects.values('email_id'))
+        email_ids = list(emails.values_list('id', flat=True))
+        total = len(email_ids)
+
+        processed = 0
+        rows = 0
+        for start in range(0, total, batch_size):
+            chunk = email_ids[start:start + batch_size]
+            rows += sync_email_index_for_ids(chunk, batch_size=batch_size)
+            processed += len(chunk)
+            self.stdout.write(f'indexed={processed}/{total}')
+
+        self.stdout.write(self.style.SUCCESS(f'done emails={processed} rows={rows}'))
@@ -0,0 +1,65 @@
+from datetime import datetime, time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from reporting.models import OpportunityTracking
+from reporting.services.opportunity_revenue import (
+    opportunity_ids_changed_since,
+    recompute_opportunity_revenue,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute OpportunityTracking backlog_amount / actual_revenue from delivery "
+        "schedules and their delivery items with grouped queries and bulk updates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            help=(
+                'Only opportunities whose own row, schedules or delivery items changed at or '
+                'after this date/datetime (ISO 8601). Defaults to all opportunities.'
+            ),
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Opportunities recomputed per batch. Defaults to 500.',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = max(1, int(options['batch_size'] or 500))
+        since = self._parse_since(options.get('since'))
+        if since is None:
+            opportunity_ids = list(OpportunityTracking.objects.order_by('id').values_list('id', flat=True))
+        else:
+            opportunity_ids = sorted(opportunity_ids_changed_since(since))
+        total = len(opportunity_ids)
+
+        processed = 0
+        changed = 0
+        for start in range(0, total, batch_size):
+            chunk = opportunity_ids[start:start + batch_size]
+            changed += recompute_opportunity_revenue(chunk, batch_size=batch_size)
+            processed += len(chunk)
+            self.stdout.write(f'recomputed={processed}/{total}')
+
+        self.stdout.write(self.style.SUCCESS(f'done opportunities={processed} changed={changed}'))
+
+    def _parse_since(self, value):
+        if not value:
+            return None
+        parsed = parse_datetime(value)
+        if parsed is None:
+            parsed_date = parse_date(value)
+            if parsed_date is None:
+                raise CommandError(f'--since 값을 해석할 수 없습니다: {value}')
+            parsed = datetime.combine(parsed_date, time.min)
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
@@ -0,0 +1,53 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reporting.services.jsonl_backup import (
+    MANIFEST_NAME,
+    BackupVerificationError,
+    backup_chain,
+    restore_backup,
+    verify_backup,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Restore a JSONL backup directory written by simple_backup --format=jsonl. "
+        "Incremental backups are applied on top of their base chain."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('backup_dir', help='Backup directory containing manifest.json.')
+        parser.add_argument('--database', default='default', help='Database alias to load into.')
+        parser.add_argument('--no-verify', action='store_true', help='Skip sha256 verification of part files.')
+        parser.add_argument('--dry-run', action='store_true', help='Only verify checksums and print the chain.')
+
+    def handle(self, *args, **options):
+        backup_dir = Path(options['backup_dir'])
+        if not (backup_dir / MANIFEST_NAME).is_file():
+            raise CommandError(f'{backup_dir} has no {MANIFEST_NAME}.')
+
+        try:
+            chain = backup_chain(backup_dir)
+            for path, manifest in chain:
+                self.stdout.write(f"{manifest['kind']} {path.name} rows={manifest['total_rows']}")
+                if options['dry_run'] and not options['no_verify']:
+                    verify_backup(path, manifest)
+            if options['dry_run']:
+                self.stdout.write(self.style.SUCCESS('verified'))
+                return
+
+            started = time.perf_counter()
+            rows = restore_backup(
+                backup_dir,
+                verify=not options['no_verify'],
+                database=options['database'],
+                verbosity=max(0, options['verbosity'] - 1),
+            )
+        except (BackupVerificationError, FileNotFoundError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f'restored rows={rows} seconds={elapsed:.2f}'))
@@ -0,0 +1,83 @@
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from reporting.services.perf_data import PerfDataConflict, PerfDataOptions, delete_perf_data, seed_perf_data
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic sales organisation (users, customers, departments, contacts and "
+        "years of schedules, history, quotes, delivery lines and prepayments) for load and "
+        "regression benchmarks. See benchmark_api."
+    )
+
+    def add_arguments(self, parser):
+        defaults = PerfDataOptions()
+        parser.add_argument('--users', type=int, default=defaults.users)
+        parser.add_argument('--companies', type=int, default=defaults.companies)
+        parser.add_argument('--departments-per-company', type=int, default=defaults.departments_per_company)
+        parser.add_argument('--followups', type=int, default=defaults.followups)
+        parser.add_argument('--years', type=int, default=defaults.years)
+        parser.add_argument(
+            '--schedules-per-followup',
+            type=float,
+            default=defaults.schedules_per_followup,
+            help='Average schedules per contact; activity is skewed towards a few contacts.',
+        )
+        parser.add_argument('--products', type=int, default=defaults.products)
+        parser.add_argument('--prepayment-ratio', type=float, default=defaults.prepayment_ratio)
+        parser.add_argument('--seed', type=int, default=defaults.seed, help='Random seed; the same seed gives the same data.')
+        parser.add_argument('--organization', default=defaults.organization)
+        parser.add_argument('--output', default='', help='Optional JSON summary path (users, password, row counts).')
+        parser.add_argument(
+            '--allow-production',
+            action='store_true',
+            help='Allow seeding when production-like environment variables are present.',
+        )
+
+    def handle(self, *args, **options):
+        if self._looks_like_production() and not options['allow_production']:
+            raise CommandError(
+                'Refusing to seed performance data in a production-like environment. '
+                'Pass --allow-production only for an explicitly isolated database.'
+            )
+
+        perf_options = PerfDataOptions(
+            users=max(1, options['users']),
+            companies=max(1, options['companies']),
+            departments_per_company=max(1, options['departments_per_company']),
+            followups=max(1, options['followups']),
+            years=max(1, options['years']),
+            schedules_per_followup=max(0.0, options['schedules_per_followup']),
+            products=max(0, options['products']),
+            prepayment_ratio=min(1.0, max(0.0, options['prepayment_ratio'])),
+            seed=options['seed'],
+            organization=options['organization'],
+        )
+        try:
+            delete_perf_data(perf_options.organization)
+        except PerfDataConflict as exc:
+            raise CommandError(str(exc)) from exc
+        summary = seed_perf_data(perf_options, log=self.stdout.write)
+
+        if options['output']:
+            output_path = Path(options['output'])
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding='utf-8')
+            self.stdout.write(f'summary written to {output_path}')
+        counts = ' '.join(f'{key}={value}' for key, value in summary['counts'].items())
+        self.stdout.write(self.style.SUCCESS(f'done {counts}'))
+
+    def _looks_like_production(self):
+        if getattr(settings, 'DEBUG', False):
+            return False
+        return bool(
+            os.environ.get('RAILWAY_ENVIRONMENT')
+            or os.environ.get('RAILWAY_PROJECT_ID')
+            or os.environ.get('RAILWAY_SERVICE_ID')
+            or os.environ.get('DATABASE_URL')
+        )
@@ -8,6 +8,8 @@ from django.core.management import call_command
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 
+from reporting.services.jsonl_backup import MANIFEST_NAME, export_backup, latest_manifest, read_manifest
+
 
 BACKUP_PREFIX = 'sales_note_backup_'
 
@@ -19,9 +21,24 @@ class Command(BaseCommand):
         parser.add_argument('--output-dir', default='', help='Directory for backup artifacts.')
         parser.add_argument(
             '--format',
-            choices=('auto', 'json', 'pgdump'),
+            choices=('auto', 'jsonl', 'json', 'pgdump'),
             default='auto',
-            help='Backup format. auto uses pg_dump when DATABASE_URL and pg_dump are available.',
+            help=(
+                'Backup format. auto uses pg_dump when DATABASE_URL and pg_dump are available, '
+                'otherwise streaming gzip JSONL. json is the legacy single dumpdata document.'
+            ),
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='jsonl only: export rows changed since the newest JSONL backup in --output-dir.',
+        )
+        parser.add_argument('--chunk-size', type=int, default=2000, help='jsonl only: rows fetched per query.')
+        parser.add_argument(
+            '--rows-per-file',
+            type=int,
+            default=50000,
+            help='jsonl only: rows per compressed part file.',
         )
         parser.add_argument('--keep', type=int, default=7, help='Number of recent backup files to keep.')
         parser.add_argument(
@@ -38,15 +55,25 @@ class Command(BaseCommand):
         backup_format = self._resolve_format(options['format'], database_url)
         timestamp = timezone.now().strftime('%Y%m%d_%H%M%S')
 
+        if options['incremental'] and backup_format != 'jsonl':
+            raise CommandError('--incremental is only supported with --format=jsonl.')
+
         if backup_format == 'pgdump':
             backup_path = output_dir / f'{BACKUP_PREFIX}{timestamp}.dump'
             self._run_pg_dump(database_url, backup_path)
+        elif backup_format == 'jsonl':
+            backup_path = output_dir / f'{BACKUP_PREFIX}{timestamp}'
+            suffix = 2
+            while backup_path.exists():
+                backup_path = output_dir / f'{BACKUP_PREFIX}{timestamp}_{suffix}'
+                suffix += 1
+            self._run_jsonl(backup_path, options)
         else:
             backup_path = output_dir / f'{BACKUP_PREFIX}{timestamp}.json'
             self._run_dumpdata(backup_path)
 
         self._apply_retention(output_dir, options['keep'])
-        size_bytes = backup_path.stat().st_size if backup_path.exists() else 0
+        size_bytes = self._artifact_size(backup_path)
         self.stdout.write(
             self.style.SUCCESS(
                 f'Backup written: {backup_path} ({backup_format}, {size_bytes} bytes)'
@@ -68,7 +95,7 @@ class Command(BaseCommand):
             return requested_format
         if database_url and shutil.which('pg_dump'):
             return 'pgdump'
-        return 'json'
+        return 'jsonl'
 
     def _run_pg_dump(self, database_url, backup_path):
         if not database_url:
@@ -89,6 +116,28 @@ class Command(BaseCommand):
             check=True,
         )
 
+    def _run_jsonl(self, backup_path, options):
+        base = None
+        if options['incremental']:
+            base = latest_manifest(backup_path.parent, BACKUP_PREFIX)
+            if base[0] is None:
+                raise CommandError('No previous JSONL backup found for --incremental; run a full backup first.')
+        manifest = export_backup(
+            backup_path,
+            base=base,
+            chunk_size=max(1, options['chunk_size']),
+            rows_per_file=max(1, options['rows_per_file']),
+        )
+        self.stdout.write(
+            f"{manifest['kind']} backup rows={manifest['total_rows']} "
+            f"models={len(manifest['models'])} base={manifest['base_backup'] or '-'}"
+        )
+
+    def _artifact_size(self, backup_path):
+        if backup_path.is_dir():
+            return sum(path.stat().st_size for path in backup_path.iterdir() if path.is_file())
+        return backup_path.stat().st_size if backup_path.exists() else 0
+
     def _run_dumpdata(self, backup_path):
         with backup_path.open('w', encoding='utf-8') as handle:
             call_command(
@@ -108,9 +157,26 @@ class Command(BaseCommand):
         if keep <= 0:
             return
         backups = sorted(
-            [path for path in output_dir.glob(f'{BACKUP_PREFIX}*') if path.is_file()],
+            [
+                path for path in output_dir.glob(f'{BACKUP_PREFIX}*')
+                if path.is_file() or (path / MANIFEST_NAME).is_file()
+            ],
             key=lambda path: path.stat().st_mtime,
             reverse=True,
         )
-        for old_backup in backups[keep:]:
-            old_backup.unlink()
+        kept = set(backups[:keep])
+        # 남겨 둔 증분 백업이 참조하는 기준 백업은 지우지 않는다.
+        pending = [path for path in kept if path.is_dir()]
+        while pending:
+            base_name = read_manifest(pending.pop()).get('base_backup')
+            base_path = output_dir / base_name if base_name else None
+            if base_path is not None and base_path.is_dir() and base_path not in kept:
+                kept.add(base_path)
+                pending.append(base_path)
+        for old_backup in backups:
+            if old_backup in kept:
+                continue
+            if old_backup.is_dir():
+                shutil.rmtree(old_backup)
+            else:
+                old_backup.unlink()
@@ -1,6 +1,5 @@
 import time
 import logging
-import os
 import pytz
 from django.utils.deprecation import MiddlewareMixin
 from django.contrib.auth.models import AnonymousUser
@@ -30,122 +29,52 @@ class CompanyFilterMiddleware(MiddlewareMixin):
         super().__init__(get_response)
     
     def process_request(self, request):
-        """요청 처리 시 사용자의 회사 정보를 request에 추가 (세션 캐싱 적용)"""
-        
+        """요청 처리 시 사용자의 회사 정보를 request에 추가 (공유 캐시 적용)
+
+        역할·회사·관리자 필터 선택은 (사용자, 신원 버전, 선택값) 키로 공유 캐시에
+        저장되고, 회사/사용자 객체는 뷰가 실제로 필드를 읽을 때만 조회됩니다.
+        """
+        request.user_company = None
+        request.user_company_id = None
+        request.user_company_name = None
+        request.is_hanagwahak = False
+        request.is_admin = False
+
         # 사용자 인증 확인
-        if hasattr(request, 'user') and not isinstance(request.user, AnonymousUser):
-            # 세션 캐시 체크 (DB 조회 최소화)
-            cache_key = f'user_profile_{request.user.id}'
-            if cache_key in request.session:
-                cached_data = request.session[cache_key]
-                request.user_company = cached_data.get('company_id')
-                request.user_company_name = cached_data.get('company_name')
-                request.is_admin = cached_data.get('is_admin', False)
-                request.is_hanagwahak = cached_data.get('is_hanagwahak', False)
-                return None
-            
-            try:
-                # select_related로 한 번에 조회 (N+1 방지)
-                if hasattr(request.user, 'userprofile'):
-                    profile = request.user.userprofile
-                    # Admin 사용자는 모든 데이터에 접근 가능
-                    if profile.role == 'admin':
-                        # 관리자 필터링: 세션에서 선택한 회사/사용자 가져오기
-                        selected_company_id = request.session.get('admin_selected_company')
-                        selected_user_id = request.session.get('admin_selected_user')
-                        
-                        request.user_company = None  # 기본값: 전체 접근
-                        request.user_company_name = 'Admin (전체 접근)'
-                        request.is_hanagwahak = True  # 관리자는 항상 모든 기능 접근 가능
-                        request.is_admin = True
-                        
-                        # 관리자가 특정 회사를 선택한 경우
-                        if selected_company_id:
-                            from reporting.models import UserCompany
-                            try:
-                                selected_company = UserCompany.objects.get(id=selected_company_id)
-                                request.admin_filter_company = selected_company
-                                request.admin_filter_company_name = selected_company.name
-                            except UserCompany.DoesNotExist:
-                                request.admin_filter_company = None
-                                request.admin_filter_company_name = None
-                        else:
-                            request.admin_filter_company = None
-                            request.admin_filter_company_name = None
-                        
-                        # 관리자가 특정 사용자를 선택한 경우
-                        if selected_user_id:
-                            from django.contrib.auth import get_user_model
-                            User = get_user_model()
-                            try:
-                                selected_user = User.objects.get(id=selected_user_id)
-                                request.admin_filter_user = selected_user
-                                request.admin_filter_user_name = selected_user.get_full_name() or selected_user.username
-                            except User.DoesNotExist:
-                                request.admin_filter_user = None
-                                request.admin_filter_user_name = None
-                        else:
-                            request.admin_filter_user = None
-                            request.admin_filter_user_name = None
-                        
-                        # 세션 캐시 저장 (관리자는 캐싱하지 않음 - 필터 변경이 즉시 반영되어야 함)
-                        # request.session[cache_key] = {...}  # 주석 처리
-                    
-                    # 일반 사용자 - 회사 정보 조회
-                    elif profile.company:
-                        company = profile.company
-                        request.user_company = company
-                        request.user_company_name = company.name
-                        request.is_admin = False
-                        
-                        # 하나과학 체크 간소화 (성능 개선)
-                        company_name_lower = company.name.lower().replace(' ', '')
-                        request.is_hanagwahak = (
-                            '하나과학' in company_name_lower or 
-                            'hanagwahak' in company_name_lower or
-                            (os.environ.get('HANAGWAHAK_COMPANY_IDS', '').find(str(company.id)) != -1)
-                        )
-                        
-                        # 세션 캐시 저장
-                        request.session[cache_key] = {
-                            'company_id': company.id,
-                            'company_name': company.name,
-                            'is_admin': False,
-                            'is_hanagwahak': request.is_hanagwahak
-                        }
-                    else:
-                        # 회사 정보 없음
-                        request.user_company = None
-                        request.user_company_name = None
-                        request.is_hanagwahak = False
-                        request.is_admin = False
-                        
-                        request.session[cache_key] = {
-                            'company_id': None,
-                            'company_name': None,
-                            'is_admin': False,
-                            'is_hanagwahak': False
-                        }
-                        
-                else:
-                    # UserProfile 없음
-                    request.user_company = None
-                    request.user_company_name = None
-                    request.is_hanagwahak = False
-                    request.is_admin = False
-                    
-            except Exception as e:
-                logger.error(f"[MIDDLEWARE] 사용자 프로필 조회 오류: {e}")
-                request.user_company = None
-                request.user_company_name = None
-                request.is_hanagwahak = False
-                request.is_admin = False
-        else:
+        if not hasattr(request, 'user') or isinstance(request.user, AnonymousUser):
+            return None
+
+        try:
+            from django.contrib.auth import get_user_model
+            from reporting.models import UserCompany
+            from reporting.services.request_identity import identity_context_for, lazy_model_instance
+
+            selected_company_id = request.session.get('admin_selected_company')
+            selected_user_id = request.session.get('admin_selected_user')
+            context = identity_context_for(request.user, selected_company_id, selected_user_id)
+
+            request.user_company = lazy_model_instance(UserCompany, context['company_id'])
+            request.user_company_id = context['company_id']
+            request.user_company_name = context['company_name']
+            request.is_hanagwahak = context['is_hanagwahak']
+            request.is_admin = context['is_admin']
+
+            if context['is_admin']:
+                # 관리자 필터링: 세션에서 선택한 회사/사용자 (선택 변경은 캐시 키에 포함되어 즉시 반영)
+                request.admin_filter_company_id = context['admin_filter_company_id']
+                request.admin_filter_company = lazy_model_instance(UserCompany, context['admin_filter_company_id'])
+                request.admin_filter_company_name = context['admin_filter_company_name']
+                request.admin_filter_user_id = context['admin_filter_user_id']
+                request.admin_filter_user = lazy_model_instance(get_user_model(), context['admin_filter_user_id'])
+                request.admin_filter_user_name = context['admin_filter_user_name']
+        except Exception as e:
+            logger.error(f"[MIDDLEWARE] 사용자 프로필 조회 오류: {e}")
             request.user_company = None
+            request.user_company_id = None
             request.user_company_name = None
             request.is_hanagwahak = False
             request.is_admin = False
-        
+
         return None
 
 class PerformanceMonitoringMiddleware(MiddlewareMixin):
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-18 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0124_followup_pipeline_probability_override'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaillog',
+            name='body_preview',
+            field=models.CharField(blank=True, default='', max_length=320, verbose_name='본문 미리보기'),
+        ),
+        migrations.AddField(
+            model_name='emaillog',
+            name='body_text',
+            field=models.TextField(blank=True, default='', help_text='HTML 본문에서 추출한 표시용 텍스트', verbose_name='본문 텍스트'),
+        ),
+        migrations.AddField(
+            model_name='emaillog',
+            name='text_parser_version',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='본문 텍스트 파서 버전'),
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 5.2.3 on 2026-10-18 23:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def _index_rows(email, EmailContextIndex):
+    # reporting.services.email_index.email_index_rows 의 사본 (과거 모델로만 동작해야 한다).
+    happened_at = email.received_at or email.sent_at or email.created_at
+    if happened_at is None:
+        return []
+    if email.email_type == 'received':
+        is_inbound = True
+    elif email.email_type == 'sent':
+        is_inbound = False
+    else:
+        is_inbound = not email.is_sent
+
+    schedule = email.schedule if email.schedule_id else None
+    workspace_ids = {email.user_id, email.sender_id}
+    analysis_ids = {email.user_id, email.sender_id}
+    contexts = []
+    if email.followup_id:
+        workspace_ids.add(email.followup.user_id)
+        analysis_ids.add(email.followup.user_id)
+        contexts.append((email.followup_id, email.followup.department_id))
+    if schedule is not None:
+        workspace_ids.add(schedule.user_id)
+        if schedule.followup_id:
+            analysis_ids.add(schedule.followup.user_id)
+            contexts.append((schedule.followup_id, schedule.followup.department_id))
+        if schedule.department_id:
+            contexts.append((None, schedule.department_id))
+    contexts = list(dict.fromkeys(contexts)) or [(None, None)]
+
+    return [
+        EmailContextIndex(
+            email_id=email.id,
+            owner_user_id=owner_id,
+            followup_id=followup_id,
+            department_id=department_id,
+            happened_at=happened_at,
+            is_inbound=is_inbound,
+            is_trashed=bool(email.is_trashed),
+            workspace_visible=owner_id in workspace_ids,
+            analysis_visible=owner_id in analysis_ids,
+        )
+        for owner_id in sorted((workspace_ids | analysis_ids) - {None})
+        for followup_id, department_id in contexts
+    ]
+
+
+def rebuild_email_context_index(apps, schema_editor):
+    EmailLog = apps.get_model('reporting', 'EmailLog')
+    EmailContextIndex = apps.get_model('reporting', 'EmailContextIndex')
+
+    EmailContextIndex.objects.all().delete()
+    email_ids = list(EmailLog.objects.order_by('id').values_list('id', flat=True))
+    for start in range(0, len(email_ids), BATCH_SIZE):
+        emails = EmailLog.objects.filter(id__in=email_ids[start:start + BATCH_SIZE]).select_related(
+            'followup',
+            'schedule',
+            'schedule__followup',
+        )
+        rows = [row for email in emails for row in _index_rows(email, EmailContextIndex)]
+        EmailContextIndex.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0125_emaillog_body_text'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailContextIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('happened_at', models.DateTimeField(verbose_name='발생 일시')),
+                ('is_inbound', models.BooleanField(default=False, verbose_name='수신 여부')),
+                ('is_trashed', models.BooleanField(default=False, verbose_name='휴지통')),
+                ('workspace_visible', models.BooleanField(default=False, verbose_name='AI 업무공간 노출')),
+                ('analysis_visible', models.BooleanField(default=False, verbose_name='AI 고객 분석 노출')),
+                ('department', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='reporting.department', verbose_name='연결 부서')),
+                ('email', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='context_index_rows', to='reporting.emaillog', verbose_name='이메일')),
+                ('followup', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='reporting.followup', verbose_name='연결 고객')),
+                ('owner_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='관련 사용자')),
+            ],
+            options={
+                'verbose_name': '이메일 컨텍스트 인덱스',
+                'verbose_name_plural': '이메일 컨텍스트 인덱스 목록',
+                'indexes': [models.Index(fields=['followup', '-happened_at'], name='email_ctx_followup_idx'), models.Index(fields=['owner_user', 'followup', '-happened_at'], name='email_ctx_owner_fu_idx'), models.Index(fields=['owner_user', 'department', '-happened_at'], name='email_ctx_owner_dept_idx')],
+            },
+        ),
+        # 기존 메일을 한 번에 색인한다. 되돌릴 때는 테이블이 통째로 지워진다.
+        migrations.RunPython(rebuild_email_context_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.3 on 2026-10-18 23:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0126_email_context_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaBlob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sha256', models.CharField(max_length=64, unique=True, verbose_name='SHA-256')),
+                ('size', models.BigIntegerField(default=0, verbose_name='크기(바이트)')),
+                ('content_type', models.CharField(blank=True, max_length=255, verbose_name='콘텐츠 타입')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+            ],
+            options={
+                'verbose_name': '미디어 블롭',
+                'verbose_name_plural': '미디어 블롭 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='MediaReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=500, unique=True, verbose_name='저장 이름')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('blob', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='references', to='reporting.mediablob', verbose_name='블롭')),
+            ],
+            options={
+                'verbose_name': '미디어 참조',
+                'verbose_name_plural': '미디어 참조 목록',
+            },
+        ),
+    ]
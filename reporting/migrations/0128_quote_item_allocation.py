@@ -0,0 +1,94 @@
+# Generated by Django 5.2.3 on 2026-10-19 00:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _quote_item_identity(item):
+    # reporting.services.quote_allocations.quote_item_identity 의 이 시점 사본.
+    return (
+        item.product_id or 0,
+        (item.item_name or '').strip().lower(),
+        (item.unit or '').strip().lower(),
+        str(item.unit_price or ''),
+        str(item.discount_rate or ''),
+        str(item.discount_unit_price or ''),
+        str(item.quote_group or '').strip()[:100],
+    )
+
+
+def build_quote_item_allocations(apps, schema_editor):
+    # 견적 연결(source_quote_item/source_quote_schedule)이 있는 행만 채운다.
+    # 연결 없는 기존 납품의 추정 매칭은 backfill_quote_allocations 명령이 한다.
+    # 과거 모델만 써야 하므로 reporting.services.quote_allocations.build_allocations 를 옮겨 적었다.
+    DeliveryItem = apps.get_model('reporting', 'DeliveryItem')
+    QuoteItemAllocation = apps.get_model('reporting', 'QuoteItemAllocation')
+    items = list(
+        DeliveryItem.objects.filter(schedule__isnull=False)
+        .filter(models.Q(source_quote_item__isnull=False) | models.Q(source_quote_schedule__isnull=False))
+        .order_by('id')
+    )
+    for start in range(0, len(items), 1000):
+        chunk = items[start:start + 1000]
+        linked_ids = {item.source_quote_item_id for item in chunk if item.source_quote_item_id}
+        quote_schedule_by_item_id = dict(
+            DeliveryItem.objects.filter(id__in=linked_ids, schedule__isnull=False).values_list('id', 'schedule_id')
+        ) if linked_ids else {}
+        quote_schedule_ids = {item.source_quote_schedule_id for item in chunk if not item.source_quote_item_id}
+        by_identity = {}
+        if quote_schedule_ids:
+            for quote_item in DeliveryItem.objects.filter(schedule_id__in=quote_schedule_ids).order_by('id'):
+                by_identity.setdefault((quote_item.schedule_id, _quote_item_identity(quote_item)), []).append(quote_item)
+
+        rows = []
+        for item in chunk:
+            if item.source_quote_item_id:
+                quote_schedule_id = quote_schedule_by_item_id.get(item.source_quote_item_id)
+                if not quote_schedule_id:
+                    continue
+                quote_item_id = item.source_quote_item_id
+                source = 'linked'
+            else:
+                quote_schedule_id = item.source_quote_schedule_id
+                candidates = by_identity.get((quote_schedule_id, _quote_item_identity(item)), [])
+                quote_item_id = candidates[0].id if candidates else None
+                source = 'schedule'
+            rows.append(QuoteItemAllocation(
+                quote_schedule_id=quote_schedule_id,
+                quote_item_id=quote_item_id,
+                delivery_schedule_id=item.schedule_id,
+                delivery_item_id=item.id,
+                quantity=item.quantity or 0,
+                source=source,
+            ))
+        QuoteItemAllocation.objects.bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0127_media_blob_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuoteItemAllocation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(default=0, verbose_name='배분 수량')),
+                ('source', models.CharField(choices=[('linked', '견적 품목 연결'), ('schedule', '견적 일정 연결'), ('legacy', '기존 납품 매칭')], default='linked', max_length=20, verbose_name='연결 방식')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+                ('delivery_item', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='quote_allocation', to='reporting.deliveryitem', verbose_name='납품 품목')),
+                ('delivery_schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='delivery_item_allocations', to='reporting.schedule', verbose_name='납품 일정')),
+                ('quote_item', models.ForeignKey(blank=True, help_text='견적 일정만 연결되고 일치하는 품목이 없으면 비어 있습니다.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='delivery_allocations', to='reporting.deliveryitem', verbose_name='견적 품목')),
+                ('quote_schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='quote_item_allocations', to='reporting.schedule', verbose_name='견적 일정')),
+            ],
+            options={
+                'verbose_name': '견적 품목 납품 배분',
+                'verbose_name_plural': '견적 품목 납품 배분 목록',
+                'indexes': [models.Index(fields=['quote_schedule', 'quote_item'], name='quote_alloc_quote_idx')],
+            },
+        ),
+        migrations.RunPython(build_quote_item_allocations, migrations.RunPython.noop),
+    ]
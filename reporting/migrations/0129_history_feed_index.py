@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-19 02:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reporting', '0128_quote_item_allocation'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='history',
+            index=models.Index(condition=models.Q(('parent_history__isnull', True)), fields=['-created_at', '-id'], name='hist_top_created_id_idx'),
+        ),
+    ]
@@ -1009,6 +1009,12 @@ class History(models.Model):
             models.Index(fields=['department', 'parent_history', '-created_at'], name='hist_dept_parent_created_idx'),
             models.Index(fields=['user', 'next_action_date'], name='hist_user_next_idx'),
             models.Index(fields=['schedule', '-created_at'], name='hist_sched_created_idx'),
+            # 영업노트 피드 커서: ORDER BY created_at DESC, id DESC 와 같은 순서의 최상위 기록
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(parent_history__isnull=True),
+                name='hist_top_created_id_idx',
+            ),
         ]
 
 
@@ -1530,7 +1536,8 @@ class DeliveryItem(models.Model):
             rounding=ROUND_HALF_UP,
         )
 
-    def save(self, *args, **kwargs):
+    def apply_pricing(self):
+        """제품 정보·할인단가·총액을 채운다 (save 와 일괄 저장 경로가 공유)."""
         # product가 선택된 경우 제품 정보로 자동 채우기
         if self.product:
             self.item_name = self.product.product_code
@@ -1571,6 +1578,9 @@ class DeliveryItem(models.Model):
             from decimal import Decimal
             subtotal = effective_unit_price * self.quantity
             self.total_price = subtotal * Decimal('1.1')  # 부가세 10% 추가
+
+    def save(self, *args, **kwargs):
+        self.apply_pricing()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -1587,6 +1597,57 @@ class DeliveryItem(models.Model):
         ]
 
 
+class QuoteItemAllocation(models.Model):
+    """납품 품목이 어느 견적 품목(또는 견적 일정)을 얼마나 소진했는지 기록하는 배분 원장"""
+    SOURCE_CHOICES = [
+        ('linked', '견적 품목 연결'),
+        ('schedule', '견적 일정 연결'),
+        ('legacy', '기존 납품 매칭'),
+    ]
+
+    quote_schedule = models.ForeignKey(
+        Schedule,
+        on_delete=models.CASCADE,
+        related_name='quote_item_allocations',
+        verbose_name="견적 일정",
+    )
+    quote_item = models.ForeignKey(
+        DeliveryItem,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='delivery_allocations',
+        verbose_name="견적 품목",
+        help_text="견적 일정만 연결되고 일치하는 품목이 없으면 비어 있습니다.",
+    )
+    delivery_schedule = models.ForeignKey(
+        Schedule,
+        on_delete=models.CASCADE,
+        related_name='delivery_item_allocations',
+        verbose_name="납품 일정",
+    )
+    delivery_item = models.OneToOneField(
+        DeliveryItem,
+        on_delete=models.CASCADE,
+        related_name='quote_allocation',
+        verbose_name="납품 품목",
+    )
+    quantity = models.PositiveIntegerField(default=0, verbose_name="배분 수량")
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES, default='linked', verbose_name="연결 방식")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "견적 품목 납품 배분"
+        verbose_name_plural = "견적 품목 납품 배분 목록"
+        indexes = [
+            models.Index(fields=['quote_schedule', 'quote_item'], name='quote_alloc_quote_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.quote_item_id or self.quote_schedule_id} ← {self.delivery_item_id} ({self.quantity})"
+
+
 # ============================================
 # 펀넬 관리 시스템 모델들
 # ============================================
@@ -2063,55 +2124,17 @@ class OpportunityTracking(models.Model):
         self.save()
     
     def update_revenue_amounts(self):
-        """관련 일정들로부터 수주 금액과 실제 매출 계산"""
-        from decimal import Decimal
-        from django.db.models import Sum
-        
-        # backlog_amount: closing 단계일 때만 예정된 납품 일정들의 DeliveryItem 합계
-        # (won 단계에서는 이미 실제 매출로 전환되므로 backlog에 포함 안 함)
-        if self.current_stage == 'closing':
-            from .models import DeliveryItem
-            
-            # 예정된(scheduled) 납품 일정만 조회
-            backlog_schedules = self.schedules.filter(
-                status='scheduled',
-                activity_type='delivery'
-            )
-            
-            # DeliveryItem의 total_price 합산
-            backlog_total = DeliveryItem.objects.filter(
-                schedule__in=backlog_schedules
-            ).aggregate(total=Sum('total_price'))['total'] or Decimal('0')
-            
-            self.backlog_amount = backlog_total
-        else:
-            # closing이 아닌 단계에서는 backlog_amount를 0으로 설정
-            self.backlog_amount = Decimal('0')
-        
-        # 실제 매출: won 단계이고 완료됨(completed) 상태의 납품 일정들의 DeliveryItem 총액
-        if self.current_stage == 'won':
-            from .models import DeliveryItem
-            completed_schedules = self.schedules.filter(
-                status='completed',
-                activity_type='delivery'
-            )
-            
-            # DeliveryItem에서 실제 납품 금액 계산
-            delivery_total = DeliveryItem.objects.filter(
-                schedule__in=completed_schedules
-            ).aggregate(total=Sum('total_price'))['total'] or Decimal('0')
-            
-            # expected_revenue가 있으면 그것도 고려
-            schedule_revenue = sum(
-                s.expected_revenue for s in completed_schedules if s.expected_revenue
-            ) or Decimal('0')
-            
-            # 둘 중 큰 값 사용 (DeliveryItem이 더 정확함)
-            self.actual_revenue = delivery_total if delivery_total > 0 else schedule_revenue
-        else:
-            # won 단계가 아니면 actual_revenue는 None
-            self.actual_revenue = None
-        
+        """관련 일정들로부터 수주 금액과 실제 매출 계산
+
+        - backlog_amount: closing 단계일 때만 예정된 납품 일정들의 DeliveryItem 합계
+          (won 단계에서는 이미 실제 매출로 전환되므로 backlog에 포함 안 함)
+        - actual_revenue: won 단계일 때 완료된 납품 일정들의 DeliveryItem 총액,
+          없으면 해당 일정들의 예상 매출 합계. won 이 아니면 None
+        여러 기회를 한 번에 갱신할 때는 services.opportunity_revenue 를 쓴다.
+        """
+        from .services.opportunity_revenue import revenue_amounts
+
+        self.backlog_amount, self.actual_revenue = revenue_amounts({self.id: self.current_stage})[self.id]
         self.save()
     
     def save(self, *args, **kwargs):
@@ -2508,6 +2531,10 @@ class EmailLog(models.Model):
     subject = models.CharField(max_length=500, verbose_name="제목")
     body = models.TextField(verbose_name="본문")
     body_html = models.TextField(blank=True, verbose_name="HTML 본문")
+    # 표시/AI 컨텍스트용 파생 텍스트 (reporting.services.email_text 참고)
+    body_text = models.TextField(blank=True, default='', verbose_name="본문 텍스트", help_text="HTML 본문에서 추출한 표시용 텍스트")
+    body_preview = models.CharField(max_length=320, blank=True, default='', verbose_name="본문 미리보기")
+    text_parser_version = models.PositiveSmallIntegerField(default=0, verbose_name="본문 텍스트 파서 버전")
     
     # 첨부 서류
     document_template = models.ForeignKey(
@@ -2593,6 +2620,26 @@ class EmailLog(models.Model):
     def __str__(self):
         type_str = "발신" if self.email_type == 'sent' else "수신"
         return f"[{type_str}] {self.subject} → {self.recipient_email}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._email_text_source = (instance.__dict__.get('body'), instance.__dict__.get('body_html'))
+        return instance
+
+    def save(self, *args, **kwargs):
+        """본문이 바뀌었거나 파서 버전이 낮으면 표시용 텍스트를 다시 만든다."""
+        from reporting.services.email_text import email_text_is_current, refresh_email_text
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'body', 'body_html'} & set(update_fields):
+            source = (self.body, self.body_html)
+            if not email_text_is_current(self) or getattr(self, '_email_text_source', None) != source:
+                changed = refresh_email_text(self)
+                if update_fields is not None:
+                    kwargs['update_fields'] = set(update_fields) | set(changed)
+        super().save(*args, **kwargs)
+        self._email_text_source = (self.__dict__.get('body'), self.__dict__.get('body_html'))
     
     class Meta:
         verbose_name = "이메일"
@@ -2604,6 +2651,36 @@ class EmailLog(models.Model):
         ]
 
 
+class EmailContextIndex(models.Model):
+    """AI 컨텍스트 조회용 EmailLog 인덱스 (메일 × 관련 사용자 × 고객/부서 문맥당 1행).
+
+    EmailLog 의 관련 사용자 OR 조건과 (고객 | 일정 고객 | 일정 부서) OR 조건을 미리 풀어 둔다.
+    AI 업무공간과 AI 고객 분석은 볼 수 있는 관련 사용자 범위가 달라 행마다 따로 표시한다.
+    행은 EmailLog/FollowUp/Schedule 저장 커밋 후 reporting.services.email_index 가 다시 만든다.
+    """
+    email = models.ForeignKey(EmailLog, on_delete=models.CASCADE, related_name='context_index_rows', verbose_name="이메일")
+    owner_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+', verbose_name="관련 사용자")
+    followup = models.ForeignKey('FollowUp', on_delete=models.SET_NULL, null=True, blank=True, related_name='+', verbose_name="연결 고객")
+    department = models.ForeignKey('Department', on_delete=models.SET_NULL, null=True, blank=True, related_name='+', verbose_name="연결 부서")
+    happened_at = models.DateTimeField(verbose_name="발생 일시")
+    is_inbound = models.BooleanField(default=False, verbose_name="수신 여부")
+    is_trashed = models.BooleanField(default=False, verbose_name="휴지통")
+    workspace_visible = models.BooleanField(default=False, verbose_name="AI 업무공간 노출")
+    analysis_visible = models.BooleanField(default=False, verbose_name="AI 고객 분석 노출")
+
+    class Meta:
+        verbose_name = "이메일 컨텍스트 인덱스"
+        verbose_name_plural = "이메일 컨텍스트 인덱스 목록"
+        indexes = [
+            models.Index(fields=['followup', '-happened_at'], name='email_ctx_followup_idx'),
+            models.Index(fields=['owner_user', 'followup', '-happened_at'], name='email_ctx_owner_fu_idx'),
+            models.Index(fields=['owner_user', 'department', '-happened_at'], name='email_ctx_owner_dept_idx'),
+        ]
+
+    def __str__(self):
+        return f"EmailContextIndex(email={self.email_id}, owner={self.owner_user_id})"
+
+
 class ScheduledEmail(models.Model):
     """발송 예정 메일 큐."""
     STATUS_CHOICES = [
@@ -3069,3 +3146,33 @@ class TaxInvoiceRequest(models.Model):
             'on_hold':       'info',
         }.get(self.status, 'secondary')
 
+
+
+class MediaBlob(models.Model):
+    """콘텐츠 주소 기반 미디어 저장소의 블롭 (본문 sha256 으로 식별)"""
+    sha256 = models.CharField(max_length=64, unique=True, verbose_name="SHA-256")
+    size = models.BigIntegerField(default=0, verbose_name="크기(바이트)")
+    content_type = models.CharField(max_length=255, blank=True, verbose_name="콘텐츠 타입")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+
+    class Meta:
+        verbose_name = "미디어 블롭"
+        verbose_name_plural = "미디어 블롭 목록"
+
+    def __str__(self):
+        return f"{self.sha256[:12]} ({self.size} bytes)"
+
+
+class MediaReference(models.Model):
+    """FileField 저장 이름 → 미디어 블롭 매핑"""
+    name = models.CharField(max_length=500, unique=True, verbose_name="저장 이름")
+    blob = models.ForeignKey(MediaBlob, on_delete=models.PROTECT, related_name='references', verbose_name="블롭")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "미디어 참조"
+        verbose_name_plural = "미디어 참조 목록"
+
+    def __str__(self):
+        return self.name
@@ -16,6 +16,8 @@ READONLY_ALLOWED_URL_NAMES = {
     "demo_records_api",
     "notes_summary_api",
     "notes_detail_api",
+    "notes_feed_api",
+    "notes_metrics_api",
     "schedules_summary_api",
     "schedules_calendar_api",
     "schedules_detail_api",
@@ -16,6 +16,7 @@ from reporting.account_ledger import (  # noqa: F401
     DELIVERY_PAYMENT_STATUS_NORMAL,
     DELIVERY_PAYMENT_STATUS_PREPAYMENT,
     DELIVERY_PAYMENT_STATUS_SETTLED,
+    LEDGER_SECTIONS,
     account_followups_for_department,
     account_followups_for_followup,
     account_key_for_followup,
@@ -41,6 +42,7 @@ from reporting.account_ledger import (  # noqa: F401
     schedule_items,
     schedule_items_total,
     sync_schedule_delivery_payment_type,
+    top_record_ids_per_account,
     user_display_name,
 )
 
@@ -0,0 +1,280 @@
+"""In-process autocomplete index for company and department names.
+
+The create forms call ``company_autocomplete``/``department_autocomplete`` on
+every keystroke. Instead of an ``icontains`` scan joined to a same-company user
+subquery, each process keeps one small index per tenant scope (a ``UserCompany``
+id, or ``None`` for admins who see everything): normalized names loaded once
+with ``values_list`` and searched in memory.
+
+Matching keeps the old substring semantics and adds Hangul initial-consonant
+(초성) search, so ``ㅅㅇㄷ`` and ``서ㅇ대`` both find ``서울대``. Results are
+ranked exact > prefix > substring on the name, then matches on a department's
+contact fields (manager, customer name, email); shorter names first within a
+rank.
+
+The index is versioned per scope through the shared cache like the user-scope
+cache: a ``Company``/``Department``/``FollowUp`` change that touches an indexed
+field bumps the version of the tenant that owns the row and of the admin scope
+(see ``reporting.signals``), and every process rebuilds those copies lazily on
+the next request. Other tenants keep their indexes. A TTL also catches bulk
+writes that bypass signals.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from . import versioned_cache
+from .user_scope import user_scope_cache_version
+
+AUTOCOMPLETE_VERSION_KEY = 'reporting:autocomplete:version'
+AUTOCOMPLETE_INDEX_TTL = 300
+AUTOCOMPLETE_MAX_SCOPES = 32
+
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_HANGUL_BASE = 0xAC00
+_SYLLABLES_PER_CHOSUNG = 21 * 28
+
+_indexes = OrderedDict()
+_lock = threading.Lock()
+
+
+def _version_key(user_company_id):
+    return f'{AUTOCOMPLETE_VERSION_KEY}:{"all" if user_company_id is None else user_company_id}'
+
+
+def autocomplete_index_version(user_company_id=None) -> int:
+    return versioned_cache.version(_version_key(user_company_id))
+
+
+def invalidate_autocomplete_index(user_company_ids=()) -> None:
+    """Make every process rebuild the indexes of ``user_company_ids`` and the admin scope on the next search."""
+    for user_company_id in {None, *user_company_ids}:
+        versioned_cache.bump(_version_key(user_company_id))
+
+
+def autocomplete_scope_ids(*, creator_ids=(), company_ids=(), department_ids=()) -> set:
+    """``UserCompany`` ids whose index lists rows created by / under these ids.
+
+    Tenant indexes follow the creator of the customer company, as in
+    :func:`_build_scope_index`.
+    """
+    from reporting.models import Company, Department, UserProfile
+
+    scope_ids = set()
+    creator_ids = {pk for pk in creator_ids if pk}
+    company_ids = {pk for pk in company_ids if pk}
+    department_ids = {pk for pk in department_ids if pk}
+    if creator_ids:
+        scope_ids.update(UserProfile.objects.filter(user_id__in=creator_ids).values_list('company_id', flat=True))
+    if company_ids:
+        scope_ids.update(
+            Company.objects.filter(id__in=company_ids).values_list('created_by__userprofile__company_id', flat=True)
+        )
+    if department_ids:
+        scope_ids.update(
+            Department.objects.filter(id__in=department_ids)
+            .values_list('company__created_by__userprofile__company_id', flat=True)
+        )
+    scope_ids.discard(None)
+    return scope_ids
+
+
+def normalize(text) -> str:
+    """NFC, casefolded, whitespace removed: ``'서울 대'`` and ``'서울대'`` match."""
+    return ''.join(unicodedata.normalize('NFC', text or '').casefold().split())
+
+
+def compile_query(query):
+    """Return ``(needle, pattern)`` for a raw query.
+
+    Plain queries search with ``str.find`` on ``needle``. Queries that contain
+    an initial consonant get a regex in which that consonant matches itself or
+    any syllable starting with it.
+    """
+    needle = normalize(query)
+    if not any(char in CHOSUNG for char in needle):
+        return needle, None
+    parts = []
+    for char in needle:
+        index = CHOSUNG.find(char)
+        if index < 0:
+            parts.append(re.escape(char))
+            continue
+        first = _HANGUL_BASE + index * _SYLLABLES_PER_CHOSUNG
+        parts.append(f'[{char}{chr(first)}-{chr(first + _SYLLABLES_PER_CHOSUNG - 1)}]')
+    return needle, re.compile(''.join(parts))
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    id: int
+    name: str
+    key: str
+    extra_keys: tuple = ()
+    company_id: int = None
+    company_name: str = ''
+
+
+class KeyTable:
+    """Keys joined into one newline-delimited string, scanned with ``str.find``/``re``.
+
+    Scanning one string keeps the per-key loop in C; a leading newline anchors
+    prefix searches and ``bisect`` over the key offsets maps a hit to its owner.
+    """
+
+    def __init__(self, keys):
+        self.owners = []
+        self.starts = []
+        parts = []
+        offset = 1
+        for owner, key in keys:
+            self.owners.append(owner)
+            self.starts.append(offset)
+            parts.append(key)
+            offset += len(key) + 1
+        self.text = '\n' + '\n'.join(parts) + '\n'
+
+    def owners_matching(self, needle, pattern, *, prefix=False):
+        """Yield owners of keys containing the query (starting with it if ``prefix``), in table order."""
+        text, starts = self.text, self.starts
+        if prefix:
+            needle = '\n' + needle
+            pattern = re.compile('\n' + pattern.pattern) if pattern is not None else None
+        position = 0
+        while True:
+            if pattern is None:
+                hit = text.find(needle, position)
+            else:
+                match = pattern.search(text, position)
+                hit = match.start() if match else -1
+            if hit < 0:
+                return
+            slot = bisect_right(starts, hit + 1 if prefix else hit) - 1
+            yield self.owners[slot]
+            position = starts[slot + 1] - 1 if slot + 1 < len(starts) else len(text)
+
+
+@dataclass
+class ScopeIndex:
+    version: tuple
+    built_at: float
+    companies: tuple
+    departments: tuple
+    company_keys: KeyTable
+    department_keys: KeyTable
+    contact_keys: KeyTable
+
+
+def _search(entries, names, contacts, query, limit, company_id=None):
+    """Name prefix hits, then name substring hits, then contact prefix/substring hits.
+
+    Entries are stored shortest name first (an exact match is the shortest
+    prefix hit), so every pass is already ranked and stops after ``limit``.
+    """
+    needle, pattern = compile_query(query)
+    if not needle:
+        return []
+    passes = [(names, True), (names, False)]
+    if contacts is not None:
+        passes += [(contacts, True), (contacts, False)]
+    found = []
+    seen = set()
+    for table, prefix in passes:
+        for owner in table.owners_matching(needle, pattern, prefix=prefix):
+            entry = entries[owner]
+            if owner in seen or (company_id is not None and entry.company_id != company_id):
+                continue
+            seen.add(owner)
+            found.append(entry)
+            if len(found) >= limit:
+                return found
+    return found
+
+
+def _ranked(entries):
+    return tuple(sorted(entries, key=lambda entry: (len(entry.key), entry.name, entry.id)))
+
+
+def _build_scope_index(user_company_id, version) -> ScopeIndex:
+    from reporting.models import Company, Department, FollowUp
+
+    companies = Company.objects.all()
+    departments = Department.objects.all()
+    contacts = FollowUp.objects.filter(department__isnull=False)
+    if user_company_id is not None:
+        companies = companies.filter(created_by__userprofile__company_id=user_company_id)
+        departments = departments.filter(company__created_by__userprofile__company_id=user_company_id)
+        contacts = contacts.filter(department__company__created_by__userprofile__company_id=user_company_id)
+
+    extra_keys = {}
+    for department_id, *values in contacts.values_list('department_id', 'manager', 'customer_name', 'email'):
+        keys = extra_keys.setdefault(department_id, set())
+        keys.update(normalize(value) for value in values if value)
+
+    company_entries = _ranked(
+        IndexEntry(id=pk, name=name, key=normalize(name))
+        for pk, name in companies.values_list('id', 'name')
+    )
+    department_entries = _ranked(
+        IndexEntry(
+            id=pk,
+            name=name,
+            key=normalize(name),
+            extra_keys=tuple(sorted(extra_keys.get(pk, ()))),
+            company_id=company_id,
+            company_name=company_name,
+        )
+        for pk, name, company_id, company_name in departments.values_list(
+            'id', 'name', 'company_id', 'company__name',
+        )
+    )
+    return ScopeIndex(
+        version=version,
+        built_at=time.monotonic(),
+        companies=company_entries,
+        departments=department_entries,
+        company_keys=KeyTable(enumerate(entry.key for entry in company_entries)),
+        department_keys=KeyTable(enumerate(entry.key for entry in department_entries)),
+        contact_keys=KeyTable(
+            (owner, key) for owner, entry in enumerate(department_entries) for key in entry.extra_keys
+        ),
+    )
+
+
+def get_scope_index(user_company_id) -> ScopeIndex:
+    """This process's index for ``user_company_id``, rebuilt when stale."""
+    version = (autocomplete_index_version(user_company_id), user_scope_cache_version())
+    with _lock:
+        index = _indexes.get(user_company_id)
+        if index is not None and index.version == version and time.monotonic() - index.built_at < AUTOCOMPLETE_INDEX_TTL:
+            _indexes.move_to_end(user_company_id)
+            return index
+    index = _build_scope_index(user_company_id, version)
+    with _lock:
+        _indexes[user_company_id] = index
+        _indexes.move_to_end(user_company_id)
+        while len(_indexes) > AUTOCOMPLETE_MAX_SCOPES:
+            _indexes.popitem(last=False)
+    return index
+
+
+def search_companies(user_company_id, query, *, limit=10):
+    index = get_scope_index(user_company_id)
+    return _search(index.companies, index.company_keys, None, query, limit)
+
+
+def search_departments(user_company_id, query, *, company_id=None, limit=10):
+    index = get_scope_index(user_company_id)
+    return _search(
+        index.departments, index.department_keys, index.contact_keys, query, limit, company_id=company_id,
+    )
+
+
+def clear_local_indexes() -> None:
+    with _lock:
+        _indexes.clear()
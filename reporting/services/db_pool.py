@@ -0,0 +1,123 @@
+"""Connection-pool metrics and per-view statement timeouts.
+
+Production runs Django's psycopg connection pool (``OPTIONS['pool']`` in
+``settings_production``): gunicorn threads check a connection out per request
+instead of each thread pinning its own persistent one. :func:`pool_stats`
+reports the pool's counters for the readiness endpoint.
+
+Every pooled connection starts with the deployment-wide ``statement_timeout``.
+Heavy views (exports, pipeline reports) opt into a different budget with
+:func:`statement_timeout`. It applies to the connection the request reads
+from (the replica for read-only views, see ``reporting.db_routing``), is set
+just before the view's first query on it, and the previous value is restored
+before the connection goes back to the pool. A statement cancelled by the timeout turns
+into a 503 JSON response and is counted per view, so a runaway report query
+cannot hold a connection for the whole gunicorn timeout.
+
+Both are no-ops on SQLite (development and tests).
+"""
+
+import logging
+import threading
+from collections import Counter
+from functools import wraps
+
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, OperationalError, connections
+from django.http import JsonResponse
+
+from reporting.db_routing import current_read_alias
+
+logger = logging.getLogger(__name__)
+
+EXPORT_STATEMENT_TIMEOUT_MS = 90_000
+REPORT_STATEMENT_TIMEOUT_MS = 60_000
+QUERY_CANCELED_SQLSTATE = '57014'
+
+_timeouts = Counter()
+_timeouts_lock = threading.Lock()
+
+
+def _is_statement_timeout(exc) -> bool:
+    cause = exc.__cause__
+    return (getattr(cause, 'sqlstate', None) or getattr(cause, 'pgcode', None)) == QUERY_CANCELED_SQLSTATE
+
+
+def _set_statement_timeout(connection, value):
+    """Set the session ``statement_timeout`` and return the previous value."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT current_setting('statement_timeout'), set_config('statement_timeout', %s, false)",
+            [str(value)],
+        )
+        return cursor.fetchone()[0]
+
+
+def statement_timeout(milliseconds, *, using=None):
+    """Run the view with ``statement_timeout = milliseconds`` on PostgreSQL.
+
+    ``using`` defaults to the request's read alias. Nothing is set until the
+    view queries that connection, so a request rejected before its first query
+    (failed auth, bad parameters) does not open one.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            connection = connections[using or current_read_alias()]
+            if connection.vendor != 'postgresql':
+                return view_func(request, *args, **kwargs)
+            state = {}
+
+            def set_before_first_query(execute, sql, params, many, context):
+                if 'previous' not in state:
+                    state['previous'] = None  # 아래 SET 쿼리 자체는 그대로 통과시킨다.
+                    state['previous'] = _set_statement_timeout(connection, int(milliseconds))
+                return execute(sql, params, many, context)
+
+            try:
+                with connection.execute_wrapper(set_before_first_query):
+                    return view_func(request, *args, **kwargs)
+            except OperationalError as exc:
+                if not _is_statement_timeout(exc):
+                    raise
+                with _timeouts_lock:
+                    _timeouts[view_func.__name__] += 1
+                logger.warning('statement timeout (%sms) in %s: %s', milliseconds, view_func.__name__, request.path)
+                return JsonResponse({
+                    'success': False,
+                    'error': 'query_timeout',
+                    'message': '조회가 너무 오래 걸려 중단되었습니다. 기간이나 조건을 좁혀 다시 시도해 주세요.',
+                }, status=503)
+            finally:
+                if state.get('previous') is not None:
+                    try:
+                        _set_statement_timeout(connection, state['previous'])
+                    except DatabaseError:
+                        # 복구할 수 없는 연결은 풀에 돌려보내지 않고 닫는다.
+                        connection.close()
+        return wrapped
+    return decorator
+
+
+def statement_timeout_counts() -> dict:
+    with _timeouts_lock:
+        return dict(_timeouts)
+
+
+def pool_stats(using=DEFAULT_DB_ALIAS):
+    """This process's pool counters, or ``None`` when pooling is off."""
+    pool = getattr(connections[using], 'pool', None)
+    if pool is None:
+        return None
+    stats = pool.get_stats()
+    return {
+        'minSize': stats.get('pool_min', 0),
+        'maxSize': stats.get('pool_max', 0),
+        'size': stats.get('pool_size', 0),
+        'available': stats.get('pool_available', 0),
+        'waiting': stats.get('requests_waiting', 0),
+        'checkouts': stats.get('requests_num', 0),
+        'waits': stats.get('requests_queued', 0),
+        'waitMs': stats.get('requests_wait_ms', 0),
+        'checkoutTimeouts': stats.get('requests_errors', 0),
+        'connectionsLost': stats.get('connections_lost', 0),
+    }
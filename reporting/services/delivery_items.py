@@ -0,0 +1,212 @@
+"""Bulk persistence for schedule/history delivery-item lines.
+
+Saving a quote or delivery used to delete every line and ``create()`` the new
+ones one at a time. Each ``DeliveryItem.save()`` priced the row and each
+``post_save``/``post_delete`` signal recomputed the product ``total_sold`` and
+the schedule's ``OpportunityTracking`` totals, so a 50-line quote cost hundreds
+of queries inside one locking transaction.
+
+:func:`persist_delivery_items` prices all lines in memory
+(``DeliveryItem.apply_pricing``), diffs them against the existing rows and
+applies one ``bulk_create``, one ``bulk_update`` and one delete while the
+per-row signals are deferred. The product sales counts and the opportunity
+totals are then recomputed once per product / schedule, ending in the same
+state as the per-row path, and the quote allocation rows of the schedule are
+rewritten.
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .quote_allocations import sync_delivery_schedule_allocations, sync_quote_schedule_allocations
+
+_deferred = threading.local()
+
+DELIVERY_ITEM_UPDATE_FIELDS = (
+    'product',
+    'source_quote_schedule',
+    'source_quote_item',
+    'item_name',
+    'quantity',
+    'unit',
+    'unit_price',
+    'discount_rate',
+    'discount_unit_price',
+    'total_price',
+    'tax_invoice_issued',
+    'card_payment_received',
+    'receivable_settled',
+    'receivable_settled_at',
+    'receivable_settled_by',
+    'quote_group',
+    'notes',
+    'option_description',
+    'updated_at',
+)
+
+
+@contextmanager
+def defer_delivery_item_signals():
+    """Make the DeliveryItem signal receivers no-ops inside the block."""
+    _deferred.depth = getattr(_deferred, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _deferred.depth -= 1
+
+
+def delivery_item_signals_deferred() -> bool:
+    return getattr(_deferred, 'depth', 0) > 0
+
+
+def schedule_delivery_total(schedule):
+    """Schedule + linked history lines, VAT-inclusive (rows without total use unit price × 1.1)."""
+    from reporting.models import DeliveryItem
+
+    total = Decimal('0')
+    items = DeliveryItem.objects.filter(schedule=schedule) | DeliveryItem.objects.filter(history__schedule=schedule)
+    for total_price, unit_price, quantity in items.values_list('total_price', 'unit_price', 'quantity'):
+        if total_price:
+            total += total_price
+        elif unit_price and quantity:
+            total += unit_price * quantity * Decimal('1.1')
+    return total
+
+
+def apply_delivery_total_to_opportunity(opportunity, schedule):
+    """납품 품목 합계를 수주 금액으로 반영하고, 합계가 있으면 won 단계로 옮긴다."""
+    total_delivery_amount = schedule_delivery_total(schedule)
+    if total_delivery_amount <= 0:
+        return
+    opportunity.actual_revenue = total_delivery_amount
+
+    if opportunity.current_stage != 'won':
+        old_stage = opportunity.current_stage
+        opportunity.current_stage = 'won'
+        opportunity.stage_entry_date = date.today()
+
+        if opportunity.stage_history is None:
+            opportunity.stage_history = []
+
+        # 이전 단계 종료
+        for stage_entry in opportunity.stage_history:
+            if stage_entry.get('stage') == old_stage and not stage_entry.get('exited'):
+                stage_entry['exited'] = date.today().isoformat()
+
+        opportunity.stage_history.append({
+            'stage': 'won',
+            'entered': date.today().isoformat(),
+            'exited': None,
+            'note': f'납품 완료 (Schedule ID: {schedule.id})'
+        })
+
+    opportunity.save()
+
+
+def _owner_kwargs(owner):
+    from reporting.models import History, Schedule
+
+    if isinstance(owner, Schedule):
+        return {'schedule': owner}
+    if isinstance(owner, History):
+        return {'history': owner}
+    raise TypeError(f'Unsupported delivery item owner: {type(owner)!r}')
+
+
+def _target_schedule(owner):
+    from reporting.models import Schedule
+
+    if isinstance(owner, Schedule):
+        return owner
+    return owner.schedule if owner.schedule_id else None
+
+
+def _product_quantities(items):
+    quantities = {}
+    for item in items:
+        if item.product_id:
+            quantities[item.product_id] = quantities.get(item.product_id, 0) + item.quantity
+    return quantities
+
+
+def persist_delivery_items(owner, rows):
+    """Replace ``owner``'s delivery lines with ``rows``; returns ``(created, updated, deleted)``.
+
+    ``owner`` is a ``Schedule`` or ``History``. Each row is a dict of
+    ``DeliveryItem`` field values describing the full desired line (fields left
+    out take their model defaults, as with ``create()``); an optional
+    ``_existing_item_id`` keeps that existing row's id. Existing ids are only
+    reused while they stay in submission order, so ``order_by('id')`` keeps
+    returning the lines in the order they were sent. Call inside a transaction.
+    """
+    from reporting.models import DeliveryItem, Product
+
+    owner_kwargs = _owner_kwargs(owner)
+    existing = {
+        item.id: item
+        for item in DeliveryItem.objects.select_for_update().filter(**owner_kwargs).order_by('id')
+    }
+    now = timezone.now()
+
+    to_create, to_update = [], []
+    kept_ids = set()
+    last_kept_id = 0
+    for row in rows:
+        row = dict(row)
+        existing_id = row.pop('_existing_item_id', None)
+        item = DeliveryItem(**owner_kwargs, **row)
+        item.apply_pricing()
+        current = existing.get(existing_id)
+        if current is not None and not to_create and existing_id > last_kept_id and existing_id not in kept_ids:
+            item.pk = current.pk
+            item.created_at = current.created_at
+            item.updated_at = now
+            to_update.append(item)
+            kept_ids.add(existing_id)
+            last_kept_id = existing_id
+        else:
+            to_create.append(item)
+
+    removed = [item for item_id, item in existing.items() if item_id not in kept_ids]
+    with defer_delivery_item_signals():
+        if removed:
+            DeliveryItem.objects.filter(id__in=[item.id for item in removed]).delete()
+        if to_update:
+            DeliveryItem.objects.bulk_update(to_update, DELIVERY_ITEM_UPDATE_FIELDS)
+        if to_create:
+            DeliveryItem.objects.bulk_create(to_create)
+
+    # 제품 판매횟수: 완료된 납품 일정의 품목만 반영한다. 행 단위 경로는 삭제 후
+    # 재생성이었으므로 (기존 - 삭제분, 0 하한) + 신규분 이 최종값이다.
+    from reporting.models import Schedule
+
+    if isinstance(owner, Schedule) and owner.activity_type == 'delivery' and owner.status == 'completed':
+        removed_quantities = _product_quantities(list(existing.values()))
+        added_quantities = _product_quantities(to_update + to_create)
+        for product_id in sorted(set(removed_quantities) | set(added_quantities)):
+            Product.objects.filter(id=product_id).update(
+                total_sold=Greatest(F('total_sold') - removed_quantities.get(product_id, 0), Value(0))
+                + added_quantities.get(product_id, 0),
+            )
+
+    if isinstance(owner, Schedule):
+        sync_delivery_schedule_allocations(owner.id)
+        sync_quote_schedule_allocations(owner.id)
+
+    schedule = _target_schedule(owner)
+    if schedule is not None and schedule.activity_type == 'delivery' and schedule.opportunity_id:
+        # 행 단위 신호와 같이 schedule에 캐시된 인스턴스를 갱신해야 이후 schedule 저장
+        # 경로가 이전 금액으로 덮어쓰지 않는다.
+        opportunity = schedule.opportunity
+        if existing:
+            opportunity.update_revenue_amounts()
+        if to_update or to_create:
+            apply_delivery_total_to_opportunity(opportunity, schedule)
+
+    return len(to_create), len(to_update), len(removed)
@@ -0,0 +1,49 @@
+"""Per-company document template availability, cached per company version.
+
+The schedule detail drawer (document actions and commercial checks) asks how
+many active ``DocumentTemplate`` rows the user's company has per document type.
+That answer is identical for every schedule of the company and only changes
+when a template is saved or deleted, so it is cached under a per-company
+version that the ``DocumentTemplate`` and ``UserCompany`` signals bump (see
+``reporting.signals``).
+"""
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from . import versioned_cache
+
+TEMPLATE_COUNTS_TIMEOUT = 3600
+
+
+def _version_key(company_id) -> str:
+    return f'reporting:document-templates:version:{company_id}'
+
+
+def company_template_cache_version(company_id) -> int:
+    return versioned_cache.version(_version_key(company_id))
+
+
+def invalidate_company_template_counts(company_id) -> None:
+    if not company_id:
+        return
+    versioned_cache.bump(_version_key(company_id))
+
+
+def company_template_counts(company_id) -> dict:
+    """``{document_type: active template count}`` for ``company_id``."""
+    if not company_id:
+        return {}
+    key = versioned_cache.make_key(_version_key(company_id), 'reporting:document-templates', company_id, 'counts')
+    counts = cache.get(key)
+    if counts is None:
+        from reporting.models import DocumentTemplate
+
+        counts = {
+            row['document_type']: row['count']
+            for row in DocumentTemplate.objects.filter(company_id=company_id, is_active=True)
+            .values('document_type')
+            .annotate(count=Count('id'))
+        }
+        cache.set(key, counts, TEMPLATE_COUNTS_TIMEOUT)
+    return counts
@@ -0,0 +1,178 @@
+"""Denormalized EmailLog index for AI context builders.
+
+The AI workspace and the AI chat analysis both ask for "the latest N emails of
+these customers that this user may see". On ``EmailLog`` that is an OR across
+the related users joined with an OR across the email's own customer, its
+schedule's customer and the schedule's department, so no index applies and the
+database sorts every candidate row.
+
+``EmailContextIndex`` stores those joins resolved ahead of time: one row per
+(email, related user, customer/department context) with the timestamp and
+direction. The two builders never shared one visibility rule, so each row also
+records which of them may show the email to that user:
+
+- AI workspace: author, sender, customer owner, schedule owner
+- AI chat analysis: author, sender, customer owner, schedule customer owner
+
+Context rows cover every path the old queries matched: the email's customer,
+the schedule's customer and the schedule's own department. :func:`recent_email_ids`
+reads ``(owner_user, followup|department, -happened_at)`` directly and returns
+each email once.
+
+Rows are rebuilt after commit whenever an ``EmailLog`` is saved or a linked
+``FollowUp`` / ``Schedule`` changes owner, customer or department (see
+``reporting.signals``); ``rebuild_email_index`` re-syncs existing data.
+"""
+
+from django.db import transaction
+
+VISIBLE_IN_WORKSPACE = 'workspace'
+VISIBLE_IN_ANALYSIS = 'analysis'
+VISIBILITY_FIELDS = {
+    VISIBLE_IN_WORKSPACE: 'workspace_visible',
+    VISIBLE_IN_ANALYSIS: 'analysis_visible',
+}
+
+
+def email_happened_at(email):
+    return email.received_at or email.sent_at or email.created_at
+
+
+def email_is_inbound(email) -> bool:
+    if email.email_type == 'received':
+        return True
+    if email.email_type == 'sent':
+        return False
+    return not email.is_sent
+
+
+def email_visibility(email):
+    """``{user_id: (workspace_visible, analysis_visible)}`` for ``email``."""
+    schedule = email.schedule if email.schedule_id else None
+    workspace_ids = {email.user_id, email.sender_id}
+    analysis_ids = {email.user_id, email.sender_id}
+    if email.followup_id:
+        workspace_ids.add(email.followup.user_id)
+        analysis_ids.add(email.followup.user_id)
+    if schedule is not None:
+        workspace_ids.add(schedule.user_id)
+        if schedule.followup_id:
+            analysis_ids.add(schedule.followup.user_id)
+    return {
+        user_id: (user_id in workspace_ids, user_id in analysis_ids)
+        for user_id in (workspace_ids | analysis_ids) - {None}
+    }
+
+
+def email_contexts(email):
+    """(followup_id, department_id) pairs the email matches, in the old OR order."""
+    schedule = email.schedule if email.schedule_id else None
+    contexts = []
+    if email.followup_id:
+        contexts.append((email.followup_id, email.followup.department_id))
+    if schedule is not None:
+        if schedule.followup_id:
+            contexts.append((schedule.followup_id, schedule.followup.department_id))
+        if schedule.department_id:
+            contexts.append((None, schedule.department_id))
+    contexts = list(dict.fromkeys(contexts))
+    return contexts or [(None, None)]
+
+
+def email_index_rows(email, index_model=None):
+    """Unsaved ``EmailContextIndex`` rows for ``email`` (linked objects must be loaded)."""
+    if index_model is None:
+        from reporting.models import EmailContextIndex as index_model
+
+    happened_at = email_happened_at(email)
+    if happened_at is None:
+        return []
+    is_inbound = email_is_inbound(email)
+    visibility = email_visibility(email)
+    return [
+        index_model(
+            email_id=email.id,
+            owner_user_id=owner_id,
+            followup_id=followup_id,
+            department_id=department_id,
+            happened_at=happened_at,
+            is_inbound=is_inbound,
+            is_trashed=bool(email.is_trashed),
+            workspace_visible=visibility[owner_id][0],
+            analysis_visible=visibility[owner_id][1],
+        )
+        for owner_id in sorted(visibility)
+        for followup_id, department_id in email_contexts(email)
+    ]
+
+
+def sync_email_index_for_ids(email_ids, batch_size=500) -> int:
+    """Rebuild index rows for ``email_ids``; returns the number of rows written."""
+    from reporting.models import EmailContextIndex, EmailLog
+
+    email_ids = sorted({email_id for email_id in (email_ids or []) if email_id})
+    written = 0
+    for start in range(0, len(email_ids), batch_size):
+        chunk = email_ids[start:start + batch_size]
+        emails = EmailLog.objects.filter(id__in=chunk).select_related(
+            'followup',
+            'schedule',
+            'schedule__followup',
+        ).only(
+            'id', 'user_id', 'sender_id', 'followup_id', 'schedule_id',
+            'email_type', 'is_sent', 'is_trashed', 'received_at', 'sent_at', 'created_at',
+            'followup__user_id', 'followup__department_id',
+            'schedule__user_id', 'schedule__department_id', 'schedule__followup_id',
+            'schedule__followup__user_id', 'schedule__followup__department_id',
+        )
+        rows = [row for email in emails for row in email_index_rows(email)]
+        with transaction.atomic():
+            EmailContextIndex.objects.filter(email_id__in=chunk).delete()
+            EmailContextIndex.objects.bulk_create(rows, batch_size=batch_size)
+        written += len(rows)
+    return written
+
+
+def sync_email_index_on_commit(resolve_email_ids):
+    """Rebuild the rows of ``resolve_email_ids()`` after the current transaction commits.
+
+    The ids are resolved inside the callback so a save that is rolled back costs
+    nothing, and the lookup query runs outside the request's transaction.
+    """
+    transaction.on_commit(lambda: sync_email_index_for_ids(list(resolve_email_ids())))
+
+
+def recent_email_ids(user, *, visible_in, followup_ids=None, department_id=None, since=None, limit=10):
+    """Ids of the newest non-trashed emails ``user`` may see in ``visible_in``, newest first.
+
+    ``visible_in`` is :data:`VISIBLE_IN_WORKSPACE` or :data:`VISIBLE_IN_ANALYSIS`.
+    ``followup_ids`` narrows to those customers, otherwise ``department_id`` to
+    one department.
+    """
+    from reporting.models import EmailContextIndex
+
+    user_id = getattr(user, 'id', user)
+    if not user_id or limit <= 0:
+        return []
+    queryset = EmailContextIndex.objects.filter(
+        owner_user_id=user_id,
+        is_trashed=False,
+        **{VISIBILITY_FIELDS[visible_in]: True},
+    )
+    if followup_ids:
+        queryset = queryset.filter(followup_id__in=list(followup_ids))
+    elif department_id:
+        queryset = queryset.filter(department_id=department_id)
+    if since is not None:
+        queryset = queryset.filter(happened_at__gte=since)
+
+    # 한 메일이 여러 고객 문맥에 걸리면 행이 여러 개다. happened_at 은 메일마다 하나라
+    # (email_id, happened_at) DISTINCT 가 메일 단위 중복 제거다.
+    rows = queryset.order_by('-happened_at', '-email_id').values_list('email_id', 'happened_at').distinct()[:limit]
+    return [email_id for email_id, _happened_at in rows]
+
+
+def emails_in_order(email_ids, queryset):
+    """Fetch ``email_ids`` from ``queryset`` and return them in the given order."""
+    by_id = queryset.in_bulk(list(email_ids))
+    return [by_id[email_id] for email_id in email_ids if email_id in by_id]
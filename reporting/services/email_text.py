@@ -0,0 +1,179 @@
+"""Plain-text derivation for EmailLog bodies.
+
+Rendering an email for display or AI context runs a regex pipeline over the raw
+HTML (unescape, style/script stripping, quoted-reply stripping, tag rewriting,
+``strip_tags`` and line normalisation). ``EmailLog`` stores the result in
+``body_text``/``body_preview`` together with ``text_parser_version`` so readers
+use the stored text and the pipeline only re-runs when the body or
+``EMAIL_TEXT_PARSER_VERSION`` changes (see the ``backfill_email_text`` command).
+
+Bump ``EMAIL_TEXT_PARSER_VERSION`` whenever the pipeline output changes.
+"""
+
+import html
+import re
+
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+EMAIL_TEXT_PARSER_VERSION = 1
+EMAIL_BODY_TEXT_LIMIT = 12000
+EMAIL_PREVIEW_LIMIT = 300
+
+
+def strip_html_style_blocks(value):
+    text = str(value or '')
+    text = re.sub(r'(?is)<\s*style\b[^>]*>.*?<\s*/\s*style\s*>', ' ', text)
+    text = re.sub(r'(?is)<\s*script\b[^>]*>.*?<\s*/\s*script\s*>', ' ', text)
+    return text
+
+
+def strip_css_text_artifacts(value):
+    text = str(value or '')
+    selector_pattern = r'(?:p|div|span|body|td|table|tr|a|li|ul|ol)'
+    css_prop_pattern = r'(?:margin|padding|font|color|line-height|mso-|text-|background|border|white-space)'
+    text = re.sub(
+        rf'(?im)^\s*{selector_pattern}\s*\{{[^{{}}\n]*{css_prop_pattern}[^{{}}\n]*\}}\s*$',
+        '',
+        text,
+    )
+    text = re.sub(
+        rf'(?i)\b{selector_pattern}\s*\{{[^{{}}]*(?:margin|padding|font|mso-)[^{{}}]*\}}\s*',
+        '',
+        text,
+    )
+    return text
+
+
+def looks_like_email_html(value):
+    text = str(value or '')
+    if not text.strip():
+        return False
+    candidates = [text]
+    unescaped = html.unescape(text)
+    if unescaped != text:
+        candidates.append(unescaped)
+    html_pattern = re.compile(
+        r'(?is)<\s*(?:!doctype|html|head|body|style|script|meta|div|p|br|span|table|tbody|tr|td|blockquote)\b'
+    )
+    return any(html_pattern.search(candidate) for candidate in candidates)
+
+
+def strip_quoted_html_for_display(raw_html):
+    """React 메일 상세 표시에서는 Gmail/Outlook 인용 체인을 숨긴다."""
+    quote_patterns = [
+        r'(?is)<div[^>]+class=["\'][^"\']*gmail_quote[^"\']*["\'][^>]*>.*$',
+        r'(?is)<div[^>]+id=["\']mail-editor-reference-message-container["\'][^>]*>.*$',
+        r'(?is)<div[^>]+class=["\'][^"\']*ms-outlook-mobile-reference-message[^"\']*["\'][^>]*>.*$',
+        r'(?is)<blockquote\b[^>]*>.*$',
+    ]
+    cut_positions = []
+    for pattern in quote_patterns:
+        match = re.search(pattern, raw_html)
+        if match and match.start() >= 20:
+            cut_positions.append(match.start())
+
+    if not cut_positions:
+        return raw_html
+    return raw_html[:min(cut_positions)]
+
+
+def strip_quoted_text_for_display(text):
+    quote_patterns = [
+        r'\n\s*\d{4}년\s+\d{1,2}월\s+\d{1,2}일.{0,500}?(님이 작성:|wrote:)',
+        r'\n\s*On .{1,500}? wrote:',
+        r'\n\s*-{2,}\s*Original Message\s*-{2,}',
+        r'\n\s*-----Original Message-----',
+        r'\n\s*보낸 사람\s*:',
+        r'\n\s*From\s*:',
+        r'\n\s*Sent\s*:',
+        r'\n\s*받는 사람\s*:',
+        r'\n\s*To\s*:',
+        r'\n\s*Get Outlook for',
+        r'\n\s*받기 Mac용 Outlook',
+    ]
+    cut_positions = []
+    for pattern in quote_patterns:
+        match = re.search(pattern, text, flags=re.IGNORECASE)
+        if match and match.start() >= 20:
+            cut_positions.append(match.start())
+
+    if not cut_positions:
+        return text
+    return text[:min(cut_positions)].rstrip()
+
+
+def _normalize_lines(text):
+    lines = [' '.join(line.split()) for line in text.split('\n')]
+    normalized = []
+    previous_blank = False
+    for line in lines:
+        if not line:
+            if not previous_blank and normalized:
+                normalized.append('')
+            previous_blank = True
+            continue
+        normalized.append(line)
+        previous_blank = False
+    return '\n'.join(normalized).strip()
+
+
+def email_html_to_display_text(value, limit=EMAIL_BODY_TEXT_LIMIT, strip_quotes=True):
+    raw = html.unescape(str(value or ''))
+    raw = strip_html_style_blocks(raw)
+    if strip_quotes:
+        raw = strip_quoted_html_for_display(raw)
+    text = re.sub(r'(?i)<\s*br\s*/?\s*>', '\n', raw)
+    text = re.sub(r'(?i)<\s*/\s*(p|div|li|tr|h[1-6]|blockquote|section|article|table|head|body|html)\s*>', '\n', text)
+    text = re.sub(r'(?i)<\s*li(?:\s[^>]*)?>', '- ', text)
+    text = strip_tags(text)
+    text = html.unescape(text).replace('\xa0', ' ')
+    text = strip_css_text_artifacts(text)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return Truncator(strip_quoted_text_for_display(_normalize_lines(text))).chars(limit)
+
+
+def derive_email_body_text(body_html, body, limit=EMAIL_BODY_TEXT_LIMIT):
+    raw = body_html or body or ''
+    if body_html or looks_like_email_html(raw):
+        return email_html_to_display_text(raw, limit=limit)
+
+    text = html.unescape(raw).replace('\xa0', ' ')
+    text = strip_css_text_artifacts(text)
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return Truncator(strip_quoted_text_for_display(_normalize_lines(text))).chars(limit)
+
+
+def derive_email_preview(body_html, body, limit=EMAIL_PREVIEW_LIMIT):
+    raw = body_html or body or ''
+    if body_html or looks_like_email_html(raw):
+        text = email_html_to_display_text(raw, limit=limit)
+    else:
+        text = strip_tags(strip_html_style_blocks(raw)).replace('\xa0', ' ')
+        text = strip_css_text_artifacts(text)
+    return Truncator(' '.join(text.split())).chars(limit)
+
+
+def email_text_is_current(email) -> bool:
+    return getattr(email, 'text_parser_version', 0) == EMAIL_TEXT_PARSER_VERSION
+
+
+def refresh_email_text(email):
+    """Re-derive and assign the stored text fields; returns the changed field names."""
+    email.body_text = derive_email_body_text(email.body_html, email.body)
+    email.body_preview = derive_email_preview(email.body_html, email.body)
+    email.text_parser_version = EMAIL_TEXT_PARSER_VERSION
+    return ['body_text', 'body_preview', 'text_parser_version']
+
+
+def email_body_text(email, limit=EMAIL_BODY_TEXT_LIMIT):
+    """Display text for ``email``; uses the stored text unless it is stale or too short."""
+    if email_text_is_current(email) and limit <= EMAIL_BODY_TEXT_LIMIT:
+        return Truncator(email.body_text or '').chars(limit)
+    return derive_email_body_text(email.body_html, email.body, limit=limit)
+
+
+def email_text_preview(email, limit=160):
+    if email_text_is_current(email) and limit <= EMAIL_PREVIEW_LIMIT:
+        return Truncator(email.body_preview or '').chars(limit)
+    return derive_email_preview(email.body_html, email.body, limit=limit)
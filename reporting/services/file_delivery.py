@@ -0,0 +1,245 @@
+"""Attachment delivery with HTTP Range, conditional requests and proxy hand-off.
+
+History and schedule attachments live on the local media volume and can be
+tens of megabytes. ``serve_file`` answers a download in one of three ways:
+
+* ``FILE_DELIVERY_BACKEND = 'x-accel'``: return an empty response with
+  ``X-Accel-Redirect`` (nginx) pointing at ``FILE_DELIVERY_ACCEL_PREFIX`` + the
+  path relative to ``MEDIA_ROOT``; the proxy sends the bytes and handles Range.
+* ``FILE_DELIVERY_BACKEND = 'x-sendfile'``: same with ``X-Sendfile`` and the
+  absolute path (Apache / lighttpd).
+* otherwise the file (or the requested byte range) is returned as a
+  ``FileResponse`` over a real file descriptor with an exact Content-Length,
+  so gunicorn's ``wsgi.file_wrapper`` transmits it with ``os.sendfile``
+  instead of copying blocks through Python.
+
+Every variant carries a stat-based ``ETag``/``Last-Modified`` and honours
+``If-None-Match``, ``If-Modified-Since``, ``Range`` and ``If-Range``.
+Permission checks stay in the views; this module only delivers bytes.
+
+``serve_file`` can also answer small files from a :class:`BytesLRU` (used by the
+public ``/media/`` view in ``sales_project.media_views``), so hot logos and
+template thumbnails skip the disk entirely.
+"""
+
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+class BytesLRU:
+    """Thread-safe LRU of ``bytes`` bounded by their total size."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+            return content
+
+    def put(self, key, content, max_bytes):
+        if len(content) > max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = content
+            self._size += len(content)
+            while self._size > max_bytes and self._entries:
+                _key, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def file_etag(stat_result) -> str:
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def parse_byte_range(header, size):
+    """Return ``(start, end)`` (inclusive) for a single-range header.
+
+    ``None`` means "ignore the header and send everything" (absent, malformed
+    or multi-range); ``False`` means the range is unsatisfiable (416).
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0:
+            return False
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+def _if_range_matches(request, etag, mtime):
+    value = request.META.get('HTTP_IF_RANGE')
+    if not value:
+        return True
+    value = value.strip()
+    if value.startswith(('"', 'W/')):
+        return value == etag
+    parsed = parse_http_date_safe(value)
+    return parsed is not None and int(mtime) <= parsed
+
+
+def _not_modified(request, etag, mtime):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        candidates = [item.strip() for item in if_none_match.split(',')]
+        return '*' in candidates or etag in candidates or f'W/{etag}' in candidates
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE') or '')
+    return if_modified_since is not None and int(mtime) <= if_modified_since
+
+
+class FileRange:
+    """Read-limited view over an open file for a single byte range.
+
+    ``fileno()`` and the seek position are those of the underlying file, so a
+    sendfile-capable server sends exactly ``Content-Length`` bytes from the
+    current offset; the pure-Python fallback stops reading at the range end.
+    """
+
+    def __init__(self, file, start, length):
+        self._file = file
+        self._remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self._remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def close(self):
+        self._file.close()
+
+
+def _content_disposition(filename, as_attachment):
+    disposition = 'attachment' if as_attachment else 'inline'
+    try:
+        filename.encode('ascii')
+        return f'{disposition}; filename="{filename}"'
+    except UnicodeEncodeError:
+        return f"{disposition}; filename*=utf-8''{quote(filename)}"
+
+
+def _proxy_response(path, backend):
+    response = HttpResponse()
+    if backend == 'x-accel':
+        media_root = os.path.realpath(settings.MEDIA_ROOT)
+        relative = os.path.relpath(os.path.realpath(path), media_root).replace(os.sep, '/')
+        prefix = getattr(settings, 'FILE_DELIVERY_ACCEL_PREFIX', '/protected-media/')
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + quote(relative)
+    else:
+        response['X-Sendfile'] = path
+    return response
+
+
+def _cached_bytes(path, stat_result, memory_cache, max_bytes):
+    key = (path, stat_result.st_mtime_ns, stat_result.st_size)
+    content = memory_cache.get(key)
+    if content is None:
+        with open(path, 'rb') as file:
+            content = file.read()
+        memory_cache.put(key, content, max_bytes)
+    return content
+
+
+def serve_file(request, path, *, filename, content_type=None, as_attachment=True,
+               cache_control=None, memory_cache=None, memory_cache_bytes=0, memory_cache_max_file=0):
+    """Deliver ``path`` (an absolute file under ``MEDIA_ROOT``) to ``request``.
+
+    ``memory_cache`` (a :class:`BytesLRU` holding at most ``memory_cache_bytes``)
+    serves files up to ``memory_cache_max_file`` bytes from memory instead of
+    the file descriptor. ``cache_control`` is copied to every response,
+    including 304s.
+    """
+    stat_result = os.stat(path)
+    etag = file_etag(stat_result)
+    mtime = stat_result.st_mtime
+    content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    if _not_modified(request, etag, mtime):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        if cache_control:
+            response['Cache-Control'] = cache_control
+        return response
+
+    backend = (getattr(settings, 'FILE_DELIVERY_BACKEND', '') or '').lower()
+    size = stat_result.st_size
+    if backend in ('x-accel', 'x-sendfile'):
+        response = _proxy_response(path, backend)
+        response['Content-Type'] = content_type
+    else:
+        byte_range = None
+        if request.method in ('GET', 'HEAD') and _if_range_matches(request, etag, mtime):
+            byte_range = parse_byte_range(request.META.get('HTTP_RANGE'), size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            response['Accept-Ranges'] = 'bytes'
+            return response
+
+        if memory_cache is not None and size <= min(memory_cache_max_file, memory_cache_bytes):
+            content = _cached_bytes(path, stat_result, memory_cache, memory_cache_bytes)
+            if byte_range is None:
+                response = HttpResponse(content, content_type=content_type)
+            else:
+                start, end = byte_range
+                response = HttpResponse(content[start:end + 1], content_type=content_type, status=206)
+                response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        else:
+            file = open(path, 'rb')
+            if byte_range is None:
+                response = FileResponse(file, content_type=content_type)
+                response['Content-Length'] = str(size)
+            else:
+                start, end = byte_range
+                length = end - start + 1
+                response = FileResponse(FileRange(file, start, length), content_type=content_type, status=206)
+                response['Content-Length'] = str(length)
+                response['Content-Range'] = f'bytes {start}-{end}/{size}'
+
+    if cache_control:
+        response['Cache-Control'] = cache_control
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(mtime)
+    response['Content-Disposition'] = _content_disposition(filename, as_attachment)
+    return response
@@ -0,0 +1,397 @@
+"""Content-addressed media storage shared by every web replica.
+
+``FileSystemStorage`` keeps uploads on the one volume mounted at
+``MEDIA_ROOT``, so a second replica cannot see files the first one wrote.
+``ContentAddressedStorage`` keeps Django's storage API (``FileField`` names are
+unchanged) but splits a file into
+
+* a blob named by the sha256 of its bytes, kept in a pluggable
+  :class:`BlobStore` (:class:`LocalBlobStore` for a shared directory,
+  :class:`S3BlobStore` for any S3-compatible object store), and
+* ``MediaBlob``/``MediaReference`` rows mapping the storage name to the blob.
+
+Identical uploads share one blob, blobs are immutable (so any replica may cache
+them locally), and a blob is removed only when its last reference is deleted.
+
+Configure it with ``STORAGES['default'] = {'BACKEND':
+'reporting.services.media_storage.ContentAddressedStorage', 'OPTIONS':
+{'blob_store': {...}}}`` or ``MEDIA_BLOB_STORE`` (see ``blob_store_from_config``)
+and copy existing files with ``migrate_media_to_cas``.
+"""
+
+import hashlib
+import hmac
+import mimetypes
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import quote, urljoin, urlsplit
+from urllib.request import Request, urlopen
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import Storage
+from django.db import transaction
+from django.utils.deconstruct import deconstructible
+from django.utils.encoding import filepath_to_uri
+
+HASH_CHUNK_SIZE = 1024 * 1024
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def blob_relative_path(digest) -> str:
+    return f'{digest[:2]}/{digest[2:4]}/{digest}'
+
+
+class BlobStore:
+    """Immutable blobs keyed by sha256 hex digest."""
+
+    def exists(self, digest) -> bool:
+        raise NotImplementedError
+
+    def save(self, digest, content, size):
+        """Store ``content`` (a readable file positioned at 0) under ``digest``."""
+        raise NotImplementedError
+
+    def open(self, digest):
+        raise NotImplementedError
+
+    def delete(self, digest):
+        raise NotImplementedError
+
+    def local_path(self, digest):
+        """A local filesystem path holding the blob's bytes."""
+        raise NotImplementedError('This blob store has no local path.')
+
+
+class LocalBlobStore(BlobStore):
+    """Blobs under ``root/ab/cd/<digest>``; safe on a directory shared between replicas."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def _path(self, digest):
+        return self.root / blob_relative_path(digest)
+
+    def exists(self, digest):
+        return self._path(digest).is_file()
+
+    def save(self, digest, content, size):
+        path = self._path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                shutil.copyfileobj(content, handle, HASH_CHUNK_SIZE)
+            # 같은 digest 는 같은 내용이므로 동시에 써도 마지막 rename 이 이긴다.
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    def open(self, digest):
+        return open(self._path(digest), 'rb')
+
+    def delete(self, digest):
+        try:
+            self._path(digest).unlink()
+        except FileNotFoundError:
+            pass
+
+    def local_path(self, digest):
+        return str(self._path(digest))
+
+
+class S3BlobStore(BlobStore):
+    """Blobs in an S3-compatible bucket (path-style requests, AWS Signature V4).
+
+    Uses only the standard library. ``local_path`` downloads into
+    ``cache_dir`` once; blobs never change, so the cache needs no invalidation.
+    """
+
+    def __init__(self, endpoint_url, bucket, access_key, secret_key, region='us-east-1',
+                 prefix='', cache_dir=None, timeout=60):
+        self.endpoint_url = endpoint_url.rstrip('/')
+        self.bucket = bucket
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region or 'us-east-1'
+        self.prefix = prefix.strip('/')
+        self.cache = LocalBlobStore(cache_dir) if cache_dir else None
+        self.timeout = timeout
+
+    def _key(self, digest):
+        key = f'blobs/{blob_relative_path(digest)}'
+        return f'{self.prefix}/{key}' if self.prefix else key
+
+    def _signing_key(self, datestamp):
+        key = ('AWS4' + self.secret_key).encode('utf-8')
+        for part in (datestamp, self.region, 's3', 'aws4_request'):
+            key = hmac.new(key, part.encode('utf-8'), hashlib.sha256).digest()
+        return key
+
+    def _request(self, method, digest, data=None, payload_hash=None, extra_headers=None):
+        payload_hash = payload_hash or hashlib.sha256(b'').hexdigest()
+        canonical_uri = quote(f'/{self.bucket}/{self._key(digest)}', safe='/~')
+        host = urlsplit(self.endpoint_url).netloc
+        now = datetime.now(dt_timezone.utc)
+        amz_date = now.strftime('%Y%m%dT%H%M%SZ')
+        datestamp = now.strftime('%Y%m%d')
+
+        headers = {'host': host, 'x-amz-content-sha256': payload_hash, 'x-amz-date': amz_date}
+        headers.update({name.lower(): value for name, value in (extra_headers or {}).items()})
+        signed_headers = ';'.join(sorted(headers))
+        canonical_headers = ''.join(f'{name}:{str(headers[name]).strip()}\n' for name in sorted(headers))
+        canonical_request = '\n'.join([method, canonical_uri, '', canonical_headers, signed_headers, payload_hash])
+        scope = f'{datestamp}/{self.region}/s3/aws4_request'
+        string_to_sign = '\n'.join([
+            'AWS4-HMAC-SHA256',
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode('utf-8')).hexdigest(),
+        ])
+        signature = hmac.new(self._signing_key(datestamp), string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+        headers['authorization'] = (
+            f'AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, '
+            f'SignedHeaders={signed_headers}, Signature={signature}'
+        )
+        headers.pop('host')
+        request = Request(self.endpoint_url + canonical_uri, data=data, method=method, headers=headers)
+        return urlopen(request, timeout=self.timeout)
+
+    def exists(self, digest):
+        try:
+            with self._request('HEAD', digest):
+                return True
+        except HTTPError as exc:
+            if exc.code == 404:
+                return False
+            raise
+
+    def save(self, digest, content, size):
+        # 블롭 이름이 곧 본문 sha256 이므로 서명용 payload hash 를 다시 계산하지 않는다.
+        headers = {'content-length': str(size)}
+        with self._request('PUT', digest, data=content, payload_hash=digest, extra_headers=headers):
+            pass
+
+    def open(self, digest):
+        if self.cache is not None and self.cache.exists(digest):
+            return self.cache.open(digest)
+        return self._request('GET', digest)
+
+    def delete(self, digest):
+        try:
+            with self._request('DELETE', digest):
+                pass
+        except HTTPError as exc:
+            if exc.code != 404:
+                raise
+        if self.cache is not None:
+            self.cache.delete(digest)
+
+    def local_path(self, digest):
+        if self.cache is None:
+            return super().local_path(digest)
+        if not self.cache.exists(digest):
+            with self._request('GET', digest) as response:
+                self.cache.save(digest, response, None)
+        return self.cache.local_path(digest)
+
+
+def blob_store_from_config(config=None):
+    """Build a blob store from ``config`` (default ``settings.MEDIA_BLOB_STORE``).
+
+    ``{'BACKEND': 'local', 'LOCATION': ...}`` or ``{'BACKEND': 's3',
+    'ENDPOINT_URL': ..., 'BUCKET': ..., 'ACCESS_KEY_ID': ..., 'SECRET_ACCESS_KEY':
+    ..., 'REGION': ..., 'PREFIX': ..., 'CACHE_DIR': ...}``.
+    """
+    if isinstance(config, BlobStore):
+        return config
+    config = dict(config or getattr(settings, 'MEDIA_BLOB_STORE', None) or {})
+    backend = (config.get('BACKEND') or 'local').lower()
+    media_root = Path(settings.MEDIA_ROOT)
+    if backend == 'local':
+        return LocalBlobStore(config.get('LOCATION') or media_root / 'blobs')
+    if backend == 's3':
+        return S3BlobStore(
+            endpoint_url=config['ENDPOINT_URL'],
+            bucket=config['BUCKET'],
+            access_key=config.get('ACCESS_KEY_ID', ''),
+            secret_key=config.get('SECRET_ACCESS_KEY', ''),
+            region=config.get('REGION') or 'us-east-1',
+            prefix=config.get('PREFIX', ''),
+            cache_dir=config.get('CACHE_DIR', media_root / 'blob-cache'),
+        )
+    raise ValueError(f'Unknown media blob store backend: {backend}')
+
+
+def hash_content(content):
+    """Return ``(digest, size, spooled_copy)`` for a Django ``File``/file object."""
+    if hasattr(content, 'seek'):
+        try:
+            content.seek(0)
+        except (OSError, ValueError):
+            pass
+    digest = hashlib.sha256()
+    size = 0
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    chunks = content.chunks(HASH_CHUNK_SIZE) if hasattr(content, 'chunks') else iter(
+        lambda: content.read(HASH_CHUNK_SIZE), b''
+    )
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        digest.update(chunk)
+        size += len(chunk)
+        spooled.write(chunk)
+    spooled.seek(0)
+    return digest.hexdigest(), size, spooled
+
+
+@deconstructible
+class ContentAddressedStorage(Storage):
+    """Django storage backed by sha256-named blobs and a ``MediaReference`` index."""
+
+    def __init__(self, blob_store=None, base_url=None):
+        self._blob_store_config = blob_store
+        self._blob_store = None
+        self._base_url = base_url
+
+    @property
+    def blob_store(self):
+        if self._blob_store is None:
+            self._blob_store = blob_store_from_config(self._blob_store_config)
+        return self._blob_store
+
+    @property
+    def base_url(self):
+        base_url = self._base_url if self._base_url is not None else settings.MEDIA_URL
+        if base_url and not base_url.endswith('/'):
+            base_url += '/'
+        return base_url
+
+    def _reference(self, name):
+        from reporting.models import MediaReference
+
+        return MediaReference.objects.select_related('blob').filter(name=name).first()
+
+    def _blob_digest(self, name):
+        reference = self._reference(name)
+        if reference is None:
+            raise FileNotFoundError(name)
+        return reference.blob.sha256
+
+    def store(self, name, content):
+        """Point ``name`` at ``content``'s blob, writing the blob if it is new."""
+        from reporting.models import MediaBlob, MediaReference
+
+        digest, size, spooled = hash_content(content)
+        try:
+            with transaction.atomic():
+                blob, created = MediaBlob.objects.select_for_update().get_or_create(
+                    sha256=digest,
+                    defaults={'size': size, 'content_type': mimetypes.guess_type(name)[0] or ''},
+                )
+                # 새 행이면 파일이 남아 있어도 다시 쓴다. 지워지는 중인 블롭일 수 있다.
+                if created or not self.blob_store.exists(digest):
+                    self.blob_store.save(digest, spooled, size)
+                previous = MediaReference.objects.filter(name=name).values_list('blob_id', flat=True).first()
+                MediaReference.objects.update_or_create(name=name, defaults={'blob': blob})
+                if previous and previous != blob.id:
+                    self._release_blob(previous)
+        finally:
+            spooled.close()
+        return name
+
+    def _release_blob(self, blob_id):
+        from reporting.models import MediaBlob, MediaReference
+
+        blob = MediaBlob.objects.select_for_update().filter(id=blob_id).first()
+        if blob is None or MediaReference.objects.filter(blob_id=blob_id).exists():
+            return
+        digest = blob.sha256
+        blob.delete()
+        transaction.on_commit(lambda: self._delete_orphan_blob(digest))
+
+    def _delete_orphan_blob(self, digest):
+        """Delete ``digest``'s bytes unless a ``store()`` has referenced it again since.
+
+        ``store()`` locks (or creates) the blob row before it looks at the file,
+        so holding that row lock, on a placeholder row when none exists, orders
+        this delete against a concurrent upload of the same bytes.
+        """
+        from reporting.models import MediaBlob, MediaReference
+
+        with transaction.atomic():
+            blob, created = MediaBlob.objects.select_for_update().get_or_create(sha256=digest)
+            if not created and MediaReference.objects.filter(blob=blob).exists():
+                return
+            self.blob_store.delete(digest)
+            blob.delete()
+
+    def _save(self, name, content):
+        return self.store(name, content)
+
+    def _open(self, name, mode='rb'):
+        if 'w' in mode or 'a' in mode or '+' in mode:
+            raise ValueError('Content-addressed media is read-only; save a new file instead.')
+        return File(self.blob_store.open(self._blob_digest(name)), name=name)
+
+    def delete(self, name):
+        from reporting.models import MediaReference
+
+        if not name:
+            raise ValueError('The name must be given to delete().')
+        with transaction.atomic():
+            reference = MediaReference.objects.select_for_update().filter(name=name).first()
+            if reference is None:
+                return
+            blob_id = reference.blob_id
+            reference.delete()
+            self._release_blob(blob_id)
+
+    def exists(self, name):
+        from reporting.models import MediaReference
+
+        return MediaReference.objects.filter(name=name).exists()
+
+    def size(self, name):
+        reference = self._reference(name)
+        if reference is None:
+            raise FileNotFoundError(name)
+        return reference.blob.size
+
+    def path(self, name):
+        return self.blob_store.local_path(self._blob_digest(name))
+
+    def url(self, name):
+        return urljoin(self.base_url, filepath_to_uri(name).lstrip('/'))
+
+    def listdir(self, path):
+        from reporting.models import MediaReference
+
+        prefix = path.strip('/') + '/' if path.strip('/') else ''
+        directories, files = set(), []
+        for name in MediaReference.objects.filter(name__startswith=prefix).values_list('name', flat=True):
+            head, _, tail = name[len(prefix):].partition('/')
+            if tail:
+                directories.add(head)
+            else:
+                files.append(head)
+        return sorted(directories), sorted(files)
+
+    def get_modified_time(self, name):
+        reference = self._reference(name)
+        if reference is None:
+            raise FileNotFoundError(name)
+        return reference.updated_at
+
+    def get_created_time(self, name):
+        reference = self._reference(name)
+        if reference is None:
+            raise FileNotFoundError(name)
+        return reference.created_at
@@ -0,0 +1,59 @@
+"""Single-query conditional metrics for summary APIs.
+
+Dashboard-style endpoints used to call ``count()`` once per metric on the same
+base queryset (``total``, ``active``, one per status, ...), one round trip
+each. :func:`aggregate_metrics` compiles named metrics into a single
+``aggregate(Count(..., filter=Q(...)), Sum(..., filter=Q(...)))`` query::
+
+    aggregate_metrics(
+        schedules,
+        total=count_metric(),
+        scheduled=count_metric(status='scheduled'),
+        overdue=count_metric(status='scheduled', visit_date__lt=today),
+        revenue=sum_metric('delivery_amount', status='completed'),
+    )
+
+Conditions are ``Q`` objects and/or lookup keyword arguments, ANDed together.
+Empty sums come back as ``0`` rather than ``None``.
+"""
+
+from dataclasses import dataclass
+
+from django.db.models import Count, Q, Sum
+
+
+@dataclass(frozen=True)
+class Metric:
+    function: type
+    field: str
+    condition: Q = None
+    distinct: bool = False
+
+    def expression(self):
+        extra = {'filter': self.condition} if self.condition is not None else {}
+        if self.function is Count:
+            extra['distinct'] = self.distinct
+        return self.function(self.field, **extra)
+
+
+def _condition(conditions, lookups):
+    condition = Q(*conditions, **lookups)
+    return condition if condition else None
+
+
+def count_metric(*conditions, field='pk', distinct=False, **lookups) -> Metric:
+    """Rows matching the conditions (all rows when there are none)."""
+    return Metric(Count, field, _condition(conditions, lookups), distinct)
+
+
+def sum_metric(field, *conditions, **lookups) -> Metric:
+    """Sum of ``field`` over rows matching the conditions."""
+    return Metric(Sum, field, _condition(conditions, lookups))
+
+
+def aggregate_metrics(queryset, **metrics) -> dict:
+    """Evaluate every named metric over ``queryset`` in one query."""
+    values = queryset.order_by().aggregate(
+        **{name: metric.expression() for name, metric in metrics.items()}
+    )
+    return {name: value or 0 for name, value in values.items()}
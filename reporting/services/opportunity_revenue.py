@@ -0,0 +1,108 @@
+"""Set-based ``OpportunityTracking`` backlog / actual revenue recomputation.
+
+``backlog_amount`` is the delivery-line total of scheduled delivery schedules
+while the opportunity is in ``closing``; ``actual_revenue`` is the line total
+of completed delivery schedules once it is ``won`` (falling back to those
+schedules' ``expected_revenue``). :func:`revenue_amounts` computes both for any
+number of opportunities with two grouped queries, and
+:func:`recompute_opportunity_revenue` writes the changed rows back with
+``bulk_update``. ``OpportunityTracking.update_revenue_amounts`` uses the same
+computation for a single instance.
+"""
+
+from decimal import Decimal
+
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+GRADE_STAGES = ('won', 'lost', 'quote_lost')
+
+
+def revenue_amounts(stages_by_id):
+    """``{opportunity_id: (backlog_amount, actual_revenue)}`` for ``{id: current_stage}``."""
+    from reporting.models import DeliveryItem, Schedule
+
+    closing_ids = [opportunity_id for opportunity_id, stage in stages_by_id.items() if stage == 'closing']
+    won_ids = [opportunity_id for opportunity_id, stage in stages_by_id.items() if stage == 'won']
+
+    item_totals = {}
+    if closing_ids or won_ids:
+        rows = (
+            DeliveryItem.objects.filter(schedule__activity_type='delivery')
+            .filter(
+                Q(schedule__opportunity_id__in=closing_ids, schedule__status='scheduled')
+                | Q(schedule__opportunity_id__in=won_ids, schedule__status='completed')
+            )
+            .values('schedule__opportunity_id')
+            .annotate(total=Sum('total_price'))
+        )
+        item_totals = {row['schedule__opportunity_id']: row['total'] or Decimal('0') for row in rows}
+
+    schedule_revenue = {}
+    if won_ids:
+        rows = (
+            Schedule.objects.filter(opportunity_id__in=won_ids, activity_type='delivery', status='completed')
+            .values('opportunity_id')
+            .annotate(total=Sum('expected_revenue'))
+        )
+        schedule_revenue = {row['opportunity_id']: row['total'] or Decimal('0') for row in rows}
+
+    amounts = {}
+    for opportunity_id, stage in stages_by_id.items():
+        backlog = item_totals.get(opportunity_id, Decimal('0')) if stage == 'closing' else Decimal('0')
+        actual = None
+        if stage == 'won':
+            delivery_total = item_totals.get(opportunity_id, Decimal('0'))
+            actual = delivery_total if delivery_total > 0 else schedule_revenue.get(opportunity_id, Decimal('0'))
+        amounts[opportunity_id] = (backlog, actual)
+    return amounts
+
+
+def recompute_opportunity_revenue(opportunity_ids, *, batch_size=500):
+    """Recompute and bulk-update ``opportunity_ids``; returns the number of changed rows."""
+    from reporting.models import FollowUp, OpportunityTracking
+
+    opportunity_ids = sorted(set(opportunity_ids))
+    changed_count = 0
+    for start in range(0, len(opportunity_ids), batch_size):
+        opportunities = list(
+            OpportunityTracking.objects.filter(id__in=opportunity_ids[start:start + batch_size])
+            .only('id', 'followup_id', 'current_stage', 'backlog_amount', 'actual_revenue')
+        )
+        amounts = revenue_amounts({opportunity.id: opportunity.current_stage for opportunity in opportunities})
+        now = timezone.now()
+        changed = []
+        for opportunity in opportunities:
+            backlog, actual = amounts[opportunity.id]
+            if opportunity.backlog_amount == backlog and opportunity.actual_revenue == actual:
+                continue
+            opportunity.backlog_amount = backlog
+            opportunity.actual_revenue = actual
+            opportunity.updated_at = now
+            changed.append(opportunity)
+        if not changed:
+            continue
+        OpportunityTracking.objects.bulk_update(changed, ['backlog_amount', 'actual_revenue', 'updated_at'])
+        changed_count += len(changed)
+
+        # save() 경로처럼 수주/실주 기회가 바뀐 고객의 등급을 다시 계산한다.
+        followup_ids = {opportunity.followup_id for opportunity in changed if opportunity.current_stage in GRADE_STAGES}
+        for followup in FollowUp.objects.filter(id__in=followup_ids):
+            followup.calculate_customer_grade()
+    return changed_count
+
+
+def opportunity_ids_changed_since(since):
+    """Opportunities whose own row, schedules or schedule delivery lines changed at or after ``since``."""
+    from reporting.models import DeliveryItem, OpportunityTracking, Schedule
+
+    ids = set(OpportunityTracking.objects.filter(updated_at__gte=since).values_list('id', flat=True))
+    ids.update(
+        Schedule.objects.filter(updated_at__gte=since, opportunity__isnull=False)
+        .values_list('opportunity_id', flat=True)
+    )
+    ids.update(
+        DeliveryItem.objects.filter(updated_at__gte=since, schedule__opportunity__isnull=False)
+        .values_list('schedule__opportunity_id', flat=True)
+    )
+    return ids
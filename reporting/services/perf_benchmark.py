@@ -0,0 +1,113 @@
+"""In-process API benchmark with a JSON baseline for regression comparison.
+
+Each endpoint is requested through ``django.test.Client`` as one logged-in
+user: warm-up requests first, then ``iterations`` timed requests (p50/p95/mean
+latency), one run under a ``connection.execute_wrapper`` for the query count and one
+under ``tracemalloc`` for peak Python memory. Latency runs are never traced,
+so tracing overhead does not leak into the timings.
+
+:func:`compare_to_baseline` flags endpoints whose p95 grew beyond a tolerance
+or whose query count grew at all.
+"""
+
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+DEFAULT_ENDPOINTS = (
+    'dashboard_summary_api',
+    'customers_summary_api',
+    'pipeline_command_center_api',
+    'schedules_calendar_api',
+    'receivables_api',
+    'notes_summary_api',
+)
+
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def benchmark_endpoint(client, url, *, iterations=20, warmup=2):
+    for _ in range(warmup):
+        client.get(url)
+
+    latencies = []
+    status_code = None
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = client.get(url)
+        latencies.append((time.perf_counter() - started) * 1000)
+        status_code = response.status_code
+
+    # queries_log 는 DEBUG·maxlen 에 따라 비거나 잘리므로 실행 래퍼로 직접 센다.
+    query_count = 0
+
+    def count_query(execute, sql, params, many, context):
+        nonlocal query_count
+        query_count += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        client.get(url)
+
+    tracemalloc.start()
+    try:
+        client.get(url)
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'url': url,
+        'status': status_code,
+        'p50Ms': round(_percentile(latencies, 0.50), 2),
+        'p95Ms': round(_percentile(latencies, 0.95), 2),
+        'meanMs': round(statistics.fmean(latencies), 2),
+        'queries': query_count,
+        'peakMemoryKb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmark(user, *, endpoints=DEFAULT_ENDPOINTS, iterations=20, warmup=2, log=None):
+    """Benchmark ``endpoints`` (URL names in the ``reporting`` namespace) as ``user``."""
+    log = log or (lambda message: None)
+    client = Client(SERVER_NAME='localhost')
+    client.force_login(user)
+    results = {}
+    for name in endpoints:
+        results[name] = benchmark_endpoint(
+            client, reverse(f'reporting:{name}'), iterations=iterations, warmup=warmup,
+        )
+        result = results[name]
+        log(f"{name}: p50={result['p50Ms']}ms p95={result['p95Ms']}ms queries={result['queries']} "
+            f"peak={result['peakMemoryKb']}KB status={result['status']}")
+    return {
+        'generatedAt': timezone.now().isoformat(),
+        'database': connection.vendor,
+        'user': user.get_username(),
+        'iterations': iterations,
+        'endpoints': results,
+    }
+
+
+def compare_to_baseline(current, baseline, *, tolerance=0.25):
+    """Human-readable regressions of ``current`` against ``baseline``; empty when none."""
+    regressions = []
+    for name, result in current['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if not previous:
+            continue
+        if result['p95Ms'] > previous['p95Ms'] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95Ms']}ms -> {result['p95Ms']}ms")
+        if result['queries'] > previous['queries']:
+            regressions.append(f"{name}: queries {previous['queries']} -> {result['queries']}")
+    return regressions
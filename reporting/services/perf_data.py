@@ -0,0 +1,346 @@
+"""Synthetic CRM data for load and regression benchmarks.
+
+``seed_perf_data`` builds one ``UserCompany`` with realistic Korean customer,
+department and contact names and several years of schedules, history, quotes,
+delivery lines and prepayments. Activity is skewed: a few accounts and
+salespeople carry most of the volume (Zipf-like weights), like production.
+Rows are written with ``bulk_create`` (delivery lines go through
+``DeliveryItem.apply_pricing`` first), so signal-driven side tables are not
+maintained; run ``recompute_opportunity_revenue`` or the backfill commands when
+a benchmark needs them.
+
+Everything is driven by one ``random.Random(seed)`` so the same options give
+the same data set. :func:`delete_perf_data` removes a previous run by its
+organisation name, touching only the ``perf<seed>_`` users it created.
+"""
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+PERF_PASSWORD = 'PerfPass123!'
+BATCH_SIZE = 1000
+PERF_USERNAME_PATTERN = r'^perf[0-9]+_'
+
+FAMILY_NAMES = '김이박최정강조윤장임한오서신권황안송류전홍고문양손배백허유남심노하곽성차주우구민진나지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹제모탁국어은편용예경봉사부황보'
+GIVEN_NAME_SYLLABLES = '민서지현준우하윤도연수진영호성은재혜경태동주아예원승희정훈석미나소유빈선상철규'
+INSTITUTIONS = (
+    '서울대학교', '연세대학교', '고려대학교', 'KAIST', '포항공과대학교', '성균관대학교', '한양대학교',
+    '경북대학교', '부산대학교', '전남대학교', '충남대학교', '서울대학교병원', '삼성서울병원', '서울아산병원',
+    '세브란스병원', '한국생명공학연구원', '한국과학기술연구원', '한국화학연구원', '국립암센터', '질병관리청',
+    '삼성바이오로직스', '셀트리온', 'SK바이오사이언스', '녹십자', '유한양행', '한미약품', '종근당',
+)
+DEPARTMENT_NAMES = (
+    '분자생물학 연구실', '세포생물학 연구실', '면역학 연구실', '유전체 연구실', '단백질공학 연구실',
+    '약리학 연구실', '미생물학 연구실', '신경과학 연구실', '병리과', '진단검사의학과', '임상시험센터',
+    '바이오공정팀', '품질관리팀', '분석화학팀', '구매팀', '중앙실험실', '동물실험센터', '줄기세포 연구실',
+)
+PRODUCT_PREFIXES = ('PCR', 'ELISA', 'WB', 'CELL', 'FBS', 'TIP', 'TUBE', 'PIPET', 'ANTI', 'KIT', 'MEDIA', 'ENZ')
+UNITS = ('EA', 'BOX', 'PK', 'KIT', 'SET')
+MEETING_NOTES = (
+    '신규 실험 셋업 관련 시약 문의', '기존 제품 재구매 일정 확인', '경쟁사 대비 단가 비교 요청',
+    '연구비 집행 일정 공유', '데모 장비 사용 후기 청취', '대량 구매 할인 조건 협의', '납기 지연 불만 응대',
+)
+PIPELINE_STAGES = (('potential', 30), ('contact', 25), ('quote', 20), ('negotiation', 10), ('won', 10), ('lost', 5))
+ACTIVITY_TYPES = (('customer_meeting', 45), ('quote', 25), ('delivery', 25), ('service', 5))
+
+
+@dataclass
+class PerfDataOptions:
+    users: int = 10
+    companies: int = 50
+    departments_per_company: int = 3
+    followups: int = 500
+    years: int = 3
+    schedules_per_followup: float = 12.0
+    products: int = 200
+    prepayment_ratio: float = 0.1
+    seed: int = 42
+    organization: str = 'Perf Sales Org'
+
+
+def _weighted(rng, choices):
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights, k=1)[0]
+
+
+def _zipf_weights(count, exponent=1.1):
+    return [1 / ((rank + 1) ** exponent) for rank in range(count)]
+
+
+def _person_name(rng):
+    return rng.choice(FAMILY_NAMES) + ''.join(rng.choices(GIVEN_NAME_SYLLABLES, k=2))
+
+
+def _bulk(model, rows):
+    return model.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+
+
+class PerfDataConflict(Exception):
+    """합성 데이터가 아닌 사용자가 있는 조직을 지우려고 할 때."""
+
+
+def delete_perf_data(organization):
+    """``organization`` 에서 이전 실행이 만든 사용자·거래처·활동을 지운다.
+
+    지우는 대상은 ``perf<seed>_`` 사용자와 그들이 만든 행뿐이다. 조직에 그 밖의 사용자가
+    하나라도 있으면(실제 테넌트와 이름이 겹친 경우) 아무것도 지우지 않고
+    :class:`PerfDataConflict` 를 낸다.
+    """
+    from reporting.models import Company, Product, UserCompany, UserProfile
+
+    User = get_user_model()
+    profiles = UserProfile.objects.filter(company__name=organization)
+    real_users = list(
+        profiles.exclude(user__username__regex=PERF_USERNAME_PATTERN).values_list('user__username', flat=True)[:5]
+    )
+    if real_users:
+        raise PerfDataConflict(
+            f'organization {organization!r} has non-perf users ({", ".join(real_users)}); refusing to delete it'
+        )
+    user_ids = list(
+        User.objects.filter(id__in=profiles.values('user_id'), username__regex=PERF_USERNAME_PATTERN)
+        .values_list('id', flat=True)
+    )
+    Company.objects.filter(created_by_id__in=user_ids).delete()
+    # 제품의 생성자 FK 는 SET_NULL 이라 사용자와 함께 지워지지 않는다.
+    Product.objects.filter(created_by_id__in=user_ids).delete()
+    User.objects.filter(id__in=user_ids).delete()
+    UserCompany.objects.filter(name=organization, userprofile__isnull=True).delete()
+
+
+@transaction.atomic
+def seed_perf_data(options=None, *, log=None):
+    """Create the data set described by ``options``; returns a summary dict."""
+    from reporting.models import (
+        Company,
+        DeliveryItem,
+        Department,
+        FollowUp,
+        History,
+        Prepayment,
+        Product,
+        Quote,
+        Schedule,
+        UserCompany,
+        UserProfile,
+    )
+
+    options = options or PerfDataOptions()
+    log = log or (lambda message: None)
+    rng = random.Random(options.seed)
+    today = timezone.localdate()
+    start_date = today - timedelta(days=365 * options.years)
+    span_days = (today - start_date).days + 60
+
+    User = get_user_model()
+    user_company = UserCompany.objects.create(name=options.organization)
+    slug = f'perf{options.seed}'
+    users = []
+    for index in range(options.users):
+        role = 'admin' if index == 0 else 'manager' if index <= max(1, options.users // 8) else 'salesman'
+        name = _person_name(rng)
+        user = User.objects.create_user(
+            username=f'{slug}_{role}_{index:03d}',
+            password=PERF_PASSWORD,
+            email=f'{slug}_{index:03d}@example.test',
+            first_name=name[1:],
+            last_name=name[0],
+        )
+        UserProfile.objects.create(
+            user=user, company=user_company, role=role,
+            can_download_excel=role != 'salesman', can_use_ai=role != 'salesman',
+        )
+        users.append(user)
+    salespeople = [user for user in users if user.userprofile.role != 'admin'] or users
+    salesperson_weights = _zipf_weights(len(salespeople), exponent=0.8)
+    log(f'users={len(users)}')
+
+    products = _bulk(Product, [
+        Product(
+            product_code=f'{slug.upper()}-{rng.choice(PRODUCT_PREFIXES)}-{index:05d}',
+            unit=rng.choice(UNITS),
+            standard_price=Decimal(rng.choice((12, 35, 58, 90, 150, 320, 780, 1500))) * 1000,
+            created_by=users[0],
+        )
+        for index in range(options.products)
+    ])
+    product_weights = _zipf_weights(len(products))
+    log(f'products={len(products)}')
+
+    companies = _bulk(Company, [
+        Company(name=f'{rng.choice(INSTITUTIONS)} {index + 1}', created_by=rng.choice(users))
+        for index in range(options.companies)
+    ])
+    departments = _bulk(Department, [
+        Department(
+            company=company,
+            name=name,
+            address=f'{company.name} {rng.randint(1, 12)}동 {rng.randint(101, 999)}호',
+            created_by=company.created_by,
+        )
+        for company in companies
+        for name in rng.sample(DEPARTMENT_NAMES, k=min(options.departments_per_company, len(DEPARTMENT_NAMES)))
+    ])
+    department_weights = _zipf_weights(len(departments))
+    log(f'companies={len(companies)} departments={len(departments)}')
+
+    followups = []
+    for index in range(options.followups):
+        department = rng.choices(departments, weights=department_weights, k=1)[0]
+        owner = rng.choices(salespeople, weights=salesperson_weights, k=1)[0]
+        followups.append(FollowUp(
+            user=owner,
+            user_company=user_company,
+            company_id=department.company_id,
+            department=department,
+            customer_name=_person_name(rng),
+            manager=_person_name(rng) + ' 교수',
+            phone_number=f'010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}',
+            email=f'{slug}.contact{index}@example.test',
+            priority=rng.choice(('urgent', 'followup', 'scheduled', 'long_term')),
+            pipeline_stage=_weighted(rng, PIPELINE_STAGES),
+            customer_grade=rng.choice(('VIP', 'A', 'B', 'B', 'C', 'C', 'D')),
+        ))
+    followups = _bulk(FollowUp, followups)
+    followup_weights = _zipf_weights(len(followups), exponent=0.9)
+    log(f'followups={len(followups)}')
+
+    schedules = []
+    total_schedules = int(options.schedules_per_followup * len(followups))
+    for _ in range(total_schedules):
+        followup = rng.choices(followups, weights=followup_weights, k=1)[0]
+        activity_type = _weighted(rng, ACTIVITY_TYPES)
+        visit_date = start_date + timedelta(days=rng.randrange(span_days))
+        if visit_date > today:
+            status = 'scheduled'
+        else:
+            status = 'cancelled' if rng.random() < 0.05 else 'completed' if rng.random() < 0.9 else 'scheduled'
+        schedules.append(Schedule(
+            user=followup.user,
+            company=user_company,
+            followup=followup,
+            department_id=followup.department_id,
+            visit_date=visit_date,
+            visit_time=time(rng.randint(9, 17), rng.choice((0, 30))),
+            status=status,
+            activity_type=activity_type,
+            notes=rng.choice(MEETING_NOTES),
+            expected_revenue=Decimal(rng.randint(1, 200)) * 50000 if activity_type in ('quote', 'delivery') else None,
+            probability=rng.choice((20, 50, 80)) if activity_type == 'quote' else None,
+        ))
+    schedules = _bulk(Schedule, schedules)
+    log(f'schedules={len(schedules)}')
+
+    items = []
+    quotes = []
+    for schedule in schedules:
+        if schedule.activity_type not in ('quote', 'delivery'):
+            continue
+        for _ in range(rng.choices((1, 2, 3, 5, 8), weights=(35, 30, 20, 10, 5), k=1)[0]):
+            product = rng.choices(products, weights=product_weights, k=1)[0] if products else None
+            item = DeliveryItem(
+                schedule=schedule,
+                product=product,
+                item_name=product.product_code if product else '기타 소모품',
+                quantity=rng.choices((1, 2, 5, 10, 50), weights=(40, 25, 20, 10, 5), k=1)[0],
+                unit=product.unit if product else 'EA',
+                unit_price=product.standard_price if product else Decimal('10000'),
+                discount_rate=rng.choice((0, 0, 0, 5, 10, 15)),
+                tax_invoice_issued=schedule.visit_date < today - timedelta(days=30) or rng.random() < 0.3,
+                receivable_settled=schedule.visit_date < today - timedelta(days=90) or rng.random() < 0.4,
+            )
+            item.apply_pricing()
+            items.append(item)
+        if schedule.activity_type == 'quote':
+            quotes.append(Quote(
+                quote_number=f'{slug.upper()}-Q{schedule.id:07d}',
+                schedule=schedule,
+                followup_id=schedule.followup_id,
+                user_id=schedule.user_id,
+                valid_until=schedule.visit_date + timedelta(days=30),
+                stage=rng.choice(('sent', 'sent', 'review', 'negotiation', 'approved', 'rejected', 'expired')),
+                total_amount=schedule.expected_revenue or 0,
+            ))
+    _bulk(DeliveryItem, items)
+    _bulk(Quote, quotes)
+    log(f'delivery_items={len(items)} quotes={len(quotes)}')
+
+    histories = []
+    action_types = {'customer_meeting': 'customer_meeting', 'quote': 'quote', 'delivery': 'delivery_schedule', 'service': 'service'}
+    for schedule in schedules:
+        if schedule.status != 'completed':
+            continue
+        histories.append(History(
+            user_id=schedule.user_id,
+            company=user_company,
+            followup_id=schedule.followup_id,
+            department_id=schedule.department_id,
+            schedule=schedule,
+            action_type=action_types[schedule.activity_type],
+            content=f'{schedule.notes} ({schedule.visit_date:%m/%d})',
+            delivery_amount=schedule.expected_revenue if schedule.activity_type == 'delivery' else None,
+            delivery_date=schedule.visit_date if schedule.activity_type == 'delivery' else None,
+            meeting_date=schedule.visit_date if schedule.activity_type == 'customer_meeting' else None,
+        ))
+    for _ in range(len(followups)):
+        followup = rng.choices(followups, weights=followup_weights, k=1)[0]
+        histories.append(History(
+            user_id=followup.user_id,
+            company=user_company,
+            followup=followup,
+            department_id=followup.department_id,
+            action_type='memo',
+            content=rng.choice(MEETING_NOTES),
+        ))
+    histories = _bulk(History, histories)
+    # auto_now_add 를 덮어써 활동 시각을 일정 날짜로 되돌린다.
+    schedule_dates = {schedule.id: schedule.visit_date for schedule in schedules}
+    current_tz = timezone.get_current_timezone()
+    for history in histories:
+        activity_date = schedule_dates.get(history.schedule_id) or start_date + timedelta(days=rng.randrange(span_days - 60))
+        history.created_at = timezone.make_aware(datetime.combine(activity_date, time(18, 0)), current_tz)
+    History.objects.bulk_update(histories, ['created_at'], batch_size=BATCH_SIZE)
+    log(f'histories={len(histories)}')
+
+    prepayments = []
+    for department in rng.sample(departments, k=int(len(departments) * options.prepayment_ratio)):
+        contacts = [followup for followup in followups if followup.department_id == department.id]
+        if not contacts:
+            continue
+        amount = Decimal(rng.choice((1, 2, 3, 5, 10))) * 1000000
+        prepayments.append(Prepayment(
+            department=department,
+            customer=contacts[0],
+            company_id=department.company_id,
+            amount=amount,
+            balance=amount * Decimal(rng.choice((0, 25, 50, 100))) / 100,
+            payment_date=start_date + timedelta(days=rng.randrange(span_days - 60)),
+            payment_method=rng.choice(('transfer', 'card', 'cash')),
+            payer_name=contacts[0].customer_name,
+            created_by_id=contacts[0].user_id,
+        ))
+    _bulk(Prepayment, prepayments)
+    log(f'prepayments={len(prepayments)}')
+
+    return {
+        'organization': options.organization,
+        'password': PERF_PASSWORD,
+        'users': {user.username: user.userprofile.role for user in users},
+        'counts': {
+            'companies': len(companies),
+            'departments': len(departments),
+            'followups': len(followups),
+            'schedules': len(schedules),
+            'deliveryItems': len(items),
+            'quotes': len(quotes),
+            'histories': len(histories),
+            'prepayments': len(prepayments),
+            'products': len(products),
+        },
+    }
@@ -0,0 +1,254 @@
+"""Quote-to-delivery allocation ledger (``QuoteItemAllocation``).
+
+Each delivery line imported from a quote records which quote line it consumed
+and how much. Remaining quote quantities and the "fully delivered" state are
+then grouped sums over this table, instead of re-scanning every delivery
+schedule and re-matching item identities each time a delivery is edited or a
+quote is opened.
+
+Rows are rewritten when a schedule's lines are saved
+(``persist_delivery_items`` calls :func:`sync_delivery_schedule_allocations`
+and :func:`sync_quote_schedule_allocations`) and by the ``DeliveryItem``
+signals on the per-row path. Cancelled or non-delivery schedules are filtered
+when reading, so status changes need no upkeep.
+
+``source`` values:
+
+* ``linked``: the line points at a quote line (``source_quote_item``).
+* ``schedule``: the line only points at a quote schedule and is matched to the
+  first quote line with the same identity; without a match ``quote_item`` stays
+  empty so the quote still shows import activity.
+* ``legacy``: written only by ``backfill_quote_allocations`` for delivery
+  lines without any quote link, matched by identity to the same owner's
+  quotes for the same customer (oldest quote first, only while the quote line
+  has quantity left). Saves never run this matching.
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db.models import Q, Sum
+
+
+def quote_item_identity(item):
+    """Key used to match a delivery line to a quote line without an explicit link."""
+    return (
+        item.product_id or 0,
+        (item.item_name or '').strip().lower(),
+        (item.unit or '').strip().lower(),
+        str(item.unit_price or ''),
+        str(item.discount_rate or ''),
+        str(item.discount_unit_price or ''),
+        str(getattr(item, 'quote_group', '') or '').strip()[:100],
+    )
+
+
+def quote_items_by_identity(quote_schedule_ids):
+    """``{(quote_schedule_id, identity): [quote items in id order]}``."""
+    from reporting.models import DeliveryItem
+
+    by_identity = {}
+    if not quote_schedule_ids:
+        return by_identity
+    for item in DeliveryItem.objects.filter(schedule_id__in=quote_schedule_ids).order_by('id'):
+        by_identity.setdefault((item.schedule_id, quote_item_identity(item)), []).append(item)
+    return by_identity
+
+
+def build_allocations(delivery_items):
+    """Unsaved ``linked``/``schedule`` rows for schedule-owned delivery lines."""
+    from reporting.models import DeliveryItem as item_model, QuoteItemAllocation as allocation_model
+
+    items = [
+        item for item in delivery_items
+        if item.pk and item.schedule_id and (item.source_quote_item_id or item.source_quote_schedule_id)
+    ]
+    if not items:
+        return []
+
+    linked_ids = {item.source_quote_item_id for item in items if item.source_quote_item_id}
+    quote_schedule_by_item_id = dict(
+        item_model.objects.filter(id__in=linked_ids, schedule__isnull=False).values_list('id', 'schedule_id')
+    ) if linked_ids else {}
+    by_identity = quote_items_by_identity({
+        item.source_quote_schedule_id
+        for item in items
+        if not item.source_quote_item_id
+    })
+
+    rows = []
+    for item in items:
+        if item.source_quote_item_id:
+            quote_schedule_id = quote_schedule_by_item_id.get(item.source_quote_item_id)
+            if not quote_schedule_id:
+                continue
+            quote_item_id = item.source_quote_item_id
+            source = 'linked'
+        else:
+            quote_schedule_id = item.source_quote_schedule_id
+            candidates = by_identity.get((quote_schedule_id, quote_item_identity(item)), [])
+            quote_item_id = candidates[0].id if candidates else None
+            source = 'schedule'
+        rows.append(allocation_model(
+            quote_schedule_id=quote_schedule_id,
+            quote_item_id=quote_item_id,
+            delivery_schedule_id=item.schedule_id,
+            delivery_item_id=item.pk,
+            quantity=item.quantity or 0,
+            source=source,
+        ))
+    return rows
+
+
+def build_legacy_allocations(delivery_items):
+    """Unsaved ``legacy`` rows for unlinked delivery lines (``schedule`` must be loaded).
+
+    Lines are offered to their schedule owner's quotes for the same customer
+    (or without a customer), oldest first. Each line is assigned to at most one
+    quote line, and only while that line's allocated quantity (stored rows plus
+    the rows built here) is below its quoted quantity.
+    """
+    from reporting.models import DeliveryItem, QuoteItemAllocation, Schedule
+
+    unlinked = defaultdict(list)
+    for item in delivery_items:
+        unlinked[(item.schedule.user_id, item.schedule.followup_id)].append(item)
+    if not unlinked:
+        return []
+
+    user_ids = {user_id for user_id, _followup_id in unlinked}
+    followup_ids = {followup_id for _user_id, followup_id in unlinked if followup_id}
+    quote_schedules = list(
+        Schedule.objects.filter(activity_type='quote', user_id__in=user_ids)
+        .filter(Q(followup_id__in=followup_ids) | Q(followup__isnull=True))
+        .order_by('visit_date', 'id')
+        .values_list('id', 'user_id', 'followup_id')
+    )
+    quote_items = defaultdict(lambda: defaultdict(list))
+    for quote_item in DeliveryItem.objects.filter(
+        schedule_id__in=[schedule_id for schedule_id, _user_id, _followup_id in quote_schedules],
+    ).order_by('id'):
+        quote_items[quote_item.schedule_id][quote_item_identity(quote_item)].append(quote_item)
+    delivered, _active = allocated_quantities(list(quote_items))
+
+    consumed = set()
+    rows = []
+    for quote_schedule_id, user_id, followup_id in quote_schedules:
+        by_identity = quote_items.get(quote_schedule_id)
+        if not by_identity:
+            continue
+        if followup_id:
+            offered = unlinked.get((user_id, followup_id), [])
+        else:
+            offered = sorted(
+                (item for (owner_id, _customer_id), items in unlinked.items() if owner_id == user_id for item in items),
+                key=lambda item: item.id,
+            )
+        for item in offered:
+            if item.id in consumed:
+                continue
+            for quote_item in by_identity.get(quote_item_identity(item), []):
+                if delivered[quote_item.id] >= (quote_item.quantity or 0):
+                    continue
+                delivered[quote_item.id] += item.quantity or 0
+                consumed.add(item.id)
+                rows.append(QuoteItemAllocation(
+                    quote_schedule_id=quote_schedule_id,
+                    quote_item_id=quote_item.id,
+                    delivery_schedule_id=item.schedule_id,
+                    delivery_item_id=item.id,
+                    quantity=item.quantity or 0,
+                    source='legacy',
+                ))
+                break
+    return rows
+
+
+def _replace_allocations(stale, rows):
+    from reporting.models import QuoteItemAllocation
+
+    stale.delete()
+    if rows:
+        QuoteItemAllocation.objects.bulk_create(rows)
+
+
+def sync_delivery_schedule_allocations(schedule_id):
+    """Rewrite the rows of ``schedule_id``'s own lines; legacy rows of still-unlinked lines stay."""
+    from reporting.models import DeliveryItem, QuoteItemAllocation
+
+    rows = build_allocations(DeliveryItem.objects.filter(schedule_id=schedule_id).filter(
+        Q(source_quote_item__isnull=False) | Q(source_quote_schedule__isnull=False)
+    ))
+    _replace_allocations(
+        QuoteItemAllocation.objects.filter(delivery_schedule_id=schedule_id).filter(
+            ~Q(source='legacy') | Q(delivery_item_id__in=[row.delivery_item_id for row in rows])
+        ),
+        rows,
+    )
+
+
+def sync_quote_schedule_allocations(quote_schedule_id):
+    """Re-match ``schedule`` rows after the lines of quote ``quote_schedule_id`` changed."""
+    from reporting.models import DeliveryItem, QuoteItemAllocation
+
+    items = list(DeliveryItem.objects.filter(
+        source_quote_schedule_id=quote_schedule_id,
+        source_quote_item__isnull=True,
+        schedule__isnull=False,
+    ))
+    if not items:
+        return
+    _replace_allocations(
+        QuoteItemAllocation.objects.filter(delivery_item_id__in=[item.id for item in items]),
+        build_allocations(items),
+    )
+
+
+def sync_delivery_item_allocation(item):
+    """Per-row path: rewrite the row of one saved delivery line."""
+    from reporting.models import QuoteItemAllocation
+
+    rows = build_allocations([item])
+    stale = QuoteItemAllocation.objects.filter(delivery_item_id=item.pk)
+    if not rows:
+        stale = stale.exclude(source='legacy')
+    _replace_allocations(stale, rows)
+
+
+def allocated_quantities(quote_schedule_ids, *, exclude_delivery_schedule_id=None, legacy_quote_schedule_ids=None):
+    """Return ``(quantity_by_quote_item_id, active_quote_schedule_ids)``.
+
+    Only rows of non-cancelled delivery schedules count. ``legacy`` rows count
+    for the quote schedules in ``legacy_quote_schedule_ids`` (``None``: all).
+    """
+    from reporting.models import QuoteItemAllocation
+
+    quantities = defaultdict(Decimal)
+    active_schedule_ids = set()
+    quote_schedule_ids = list(quote_schedule_ids)
+    if not quote_schedule_ids:
+        return quantities, active_schedule_ids
+
+    queryset = QuoteItemAllocation.objects.filter(
+        quote_schedule_id__in=quote_schedule_ids,
+        delivery_schedule__activity_type='delivery',
+    ).exclude(delivery_schedule__status='cancelled')
+    if exclude_delivery_schedule_id:
+        queryset = queryset.exclude(delivery_schedule_id=exclude_delivery_schedule_id)
+
+    rows = queryset.values('quote_schedule_id', 'quote_item_id', 'source').annotate(total=Sum('quantity'))
+    for row in rows:
+        quote_schedule_id = row['quote_schedule_id']
+        if (
+            row['source'] == 'legacy'
+            and legacy_quote_schedule_ids is not None
+            and quote_schedule_id not in legacy_quote_schedule_ids
+        ):
+            continue
+        total = Decimal(str(row['total'] or 0))
+        # 견적 일정 연결·기존 매칭은 건수만으로, 품목 연결은 수량이 있을 때 활동으로 본다.
+        if row['source'] != 'linked' or total:
+            active_schedule_ids.add(quote_schedule_id)
+        if row['quote_item_id']:
+            quantities[row['quote_item_id']] += total
+    return quantities, active_schedule_ids
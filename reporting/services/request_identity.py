@@ -0,0 +1,135 @@
+"""Shared-cache identity context for ``CompanyFilterMiddleware``.
+
+Every request needs the same small facts about the signed-in user: role,
+company id/name, the 하나과학 flag and, for admins, which company/user filter is
+selected. They are cached as plain data in the shared cache backend, keyed by
+(user id, identity version, admin selection), so a request does not touch
+``UserProfile``/``UserCompany``/``User`` rows before the view starts.
+
+The version is bumped on ``UserProfile``, ``UserCompany`` and ``User`` changes
+(see ``reporting.signals``), which also covers company renames that the old
+per-session cache never picked up.
+"""
+
+import os
+
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
+from . import versioned_cache
+
+IDENTITY_CACHE_VERSION_KEY = 'reporting:identity:version'
+IDENTITY_CACHE_TIMEOUT = 600
+
+
+def identity_cache_version() -> int:
+    return versioned_cache.version(IDENTITY_CACHE_VERSION_KEY)
+
+
+def invalidate_identity_cache() -> None:
+    versioned_cache.bump(IDENTITY_CACHE_VERSION_KEY)
+
+
+def identity_cache_key(user_id, selected_company_id=None, selected_user_id=None) -> str:
+    return versioned_cache.make_key(
+        IDENTITY_CACHE_VERSION_KEY,
+        'reporting:identity',
+        user_id,
+        selected_company_id or None,
+        selected_user_id or None,
+    )
+
+
+def is_hanagwahak_company(company_id, company_name) -> bool:
+    company_name_lower = (company_name or '').lower().replace(' ', '')
+    return (
+        '하나과학' in company_name_lower
+        or 'hanagwahak' in company_name_lower
+        or (os.environ.get('HANAGWAHAK_COMPANY_IDS', '').find(str(company_id)) != -1)
+    )
+
+
+def build_identity_context(user, selected_company_id=None, selected_user_id=None):
+    """Read the identity facts for ``user`` from the database as plain data."""
+    from django.contrib.auth import get_user_model
+
+    from reporting.models import UserCompany, UserProfile
+
+    context = {
+        'has_profile': False,
+        'role': None,
+        'company_id': None,
+        'company_name': None,
+        'is_admin': False,
+        'is_hanagwahak': False,
+        'admin_filter_company_id': None,
+        'admin_filter_company_name': None,
+        'admin_filter_user_id': None,
+        'admin_filter_user_name': None,
+    }
+    profile = UserProfile.objects.select_related('company').filter(user_id=user.id).first()
+    if profile is None:
+        return context
+
+    context['has_profile'] = True
+    context['role'] = profile.role
+    if profile.role == 'admin':
+        context.update({
+            'company_name': 'Admin (전체 접근)',
+            'is_admin': True,
+            'is_hanagwahak': True,  # 관리자는 항상 모든 기능 접근 가능
+        })
+        if selected_company_id:
+            selected_company = UserCompany.objects.filter(id=selected_company_id).values('id', 'name').first()
+            if selected_company:
+                context['admin_filter_company_id'] = selected_company['id']
+                context['admin_filter_company_name'] = selected_company['name']
+        if selected_user_id:
+            selected_user = get_user_model().objects.filter(id=selected_user_id).first()
+            if selected_user:
+                context['admin_filter_user_id'] = selected_user.id
+                context['admin_filter_user_name'] = selected_user.get_full_name() or selected_user.username
+    elif profile.company_id:
+        context.update({
+            'company_id': profile.company_id,
+            'company_name': profile.company.name,
+            'is_hanagwahak': is_hanagwahak_company(profile.company_id, profile.company.name),
+        })
+    return context
+
+
+def identity_context_for(user, selected_company_id=None, selected_user_id=None):
+    """Cached :func:`build_identity_context`; only a cache miss touches the DB."""
+    key = identity_cache_key(user.id, selected_company_id, selected_user_id)
+    context = cache.get(key)
+    if context is None:
+        context = build_identity_context(user, selected_company_id, selected_user_id)
+        cache.set(key, context, IDENTITY_CACHE_TIMEOUT)
+    return context
+
+
+class LazyModelInstance(SimpleLazyObject):
+    """Model row that is only fetched when a view reads a field other than its pk.
+
+    Truthiness and ``id``/``pk`` are answered from the cached identity context, so
+    ``if request.admin_filter_user:`` checks and id filters never hit the database.
+    """
+
+    def __init__(self, model, pk):
+        self.__dict__['_lazy_pk'] = pk
+        super().__init__(lambda: model.objects.filter(pk=pk).first())
+
+    def __bool__(self):
+        return True
+
+    def __getattr__(self, name):
+        if name in ('id', 'pk'):
+            return self.__dict__['_lazy_pk']
+        return super().__getattr__(name)
+
+
+def lazy_model_instance(model, pk):
+    """Resolve ``model`` row ``pk`` only when a view touches it; ``None`` when unset."""
+    if not pk:
+        return None
+    return LazyModelInstance(model, pk)
@@ -0,0 +1,89 @@
+"""Cached user-scope resolution for permission-scoped APIs.
+
+Nearly every API resolves "which users' data may this request see" before it
+filters anything. The answer is a short list of user ids, so it is computed once
+per (request user, role, company, admin filter, selection) and cached as a flat
+id tuple. Downstream queries filter with ``user_id__in=<tuple>`` instead of
+embedding the ``UserProfile`` subquery into every statement.
+
+The cache is versioned: any ``UserProfile`` or ``User`` save/delete bumps the
+version (see ``reporting.signals``), so role, company and active-flag changes
+are visible on the next request. Scopes are always resolved on the primary:
+a request routed to a lagging read replica would otherwise store a stale scope
+under the new version for ``SCOPE_CACHE_TIMEOUT``.
+"""
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from . import versioned_cache
+
+SCOPE_CACHE_VERSION_KEY = 'reporting:user-scope:version'
+SCOPE_CACHE_TIMEOUT = 300
+REQUEST_SCOPE_ATTR = '_user_scope_ids_cache'
+
+
+def user_scope_cache_version() -> int:
+    return versioned_cache.version(SCOPE_CACHE_VERSION_KEY)
+
+
+def invalidate_user_scope_cache() -> None:
+    """Drop every cached scope by moving to a new cache version."""
+    versioned_cache.bump(SCOPE_CACHE_VERSION_KEY)
+
+
+def user_scope_cache_key(kind, *parts) -> str:
+    return versioned_cache.make_key(SCOPE_CACHE_VERSION_KEY, 'reporting:user-scope', kind, *parts)
+
+
+def resolve_scope_user_ids(request, kind, parts, resolver) -> tuple:
+    """Return the cached id tuple for ``kind``/``parts``, computing it via ``resolver``.
+
+    ``resolver`` returns a ``User`` queryset; it only runs on a cache miss, and
+    always against the primary even when the request reads the replica. The
+    result is memoized on the request as well, so one request never asks the
+    shared cache twice for the same scope.
+    """
+    key = user_scope_cache_key(kind, *parts)
+    memo = getattr(request, REQUEST_SCOPE_ATTR, None) if request is not None else None
+    if memo is not None and key in memo:
+        return memo[key]
+
+    user_ids = cache.get(key)
+    if user_ids is None:
+        user_ids = tuple(resolver().using(DEFAULT_DB_ALIAS).order_by('id').values_list('id', flat=True).distinct())
+        cache.set(key, user_ids, SCOPE_CACHE_TIMEOUT)
+    else:
+        user_ids = tuple(user_ids)
+
+    if request is not None:
+        if memo is None:
+            memo = {}
+            setattr(request, REQUEST_SCOPE_ATTR, memo)
+        memo[key] = user_ids
+    return user_ids
+
+
+def scoped_users_queryset(user_ids, *, select_profile=False):
+    """Return a ``User`` queryset over ``user_ids`` that remembers the flat tuple."""
+    from django.contrib.auth.models import User
+
+    queryset = User.objects.filter(id__in=user_ids)
+    if select_profile:
+        queryset = queryset.select_related('userprofile')
+    queryset.scope_user_ids = tuple(user_ids)
+    return queryset
+
+
+def scope_user_ids(users) -> tuple:
+    """Flat user-id tuple for a scope queryset, list or id collection.
+
+    Querysets built by :func:`scoped_users_queryset` carry their ids, so this is
+    free for the common case. Other querysets fall back to one ``values_list``.
+    """
+    cached = getattr(users, 'scope_user_ids', None)
+    if cached is not None:
+        return cached
+    if hasattr(users, 'values_list'):
+        return tuple(users.values_list('id', flat=True))
+    return tuple(getattr(user, 'id', user) for user in users)
@@ -0,0 +1,34 @@
+"""Version counters for caches that are invalidated by bumping, not by deleting.
+
+Several read caches (user scope, request identity, document template counts,
+autocomplete indexes) cannot enumerate the keys they would have to delete.
+Each keeps an integer counter under a version key in the shared cache, embeds
+it in every data key, and a signal handler :func:`bump`-s the counter when the
+underlying rows change. Old entries are simply never read again and expire on
+their own timeout.
+"""
+
+from django.core.cache import cache
+
+
+def version(version_key) -> int:
+    """Current counter under ``version_key``; starts at 1 and never expires."""
+    current = cache.get(version_key)
+    if current is None:
+        cache.add(version_key, 1, None)
+        current = cache.get(version_key) or 1
+    return current
+
+
+def bump(version_key) -> None:
+    """Move ``version_key`` to a new version so every key built on it goes stale."""
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        cache.set(version_key, 2, None)
+
+
+def make_key(version_key, prefix, *parts) -> str:
+    """``<prefix>:v<version>:<part>:<part>...``; ``None`` parts become empty segments."""
+    normalized = ':'.join('' if part is None else str(part) for part in parts)
+    return f'{prefix}:v{version(version_key)}:{normalized}'
@@ -4,13 +4,29 @@
 - 납품 완료 시 파이프라인 카드를 '수주'로 자동 이동
 - Schedule 삭제 시 연결된 OpportunityTracking도 삭제
 - DeliveryItem 생성/삭제 시 Product 판매횟수 자동 업데이트
+- User/UserProfile 변경 시 사용자 범위(scope) 캐시 무효화
+- User/UserProfile/UserCompany 변경 시 미들웨어 신원(identity) 캐시 무효화
+- EmailLog/FollowUp/Schedule 변경 시 AI 메일 컨텍스트 인덱스 재구성
+- DeliveryItem 저장/삭제 시 견적 품목 납품 배분 원장 갱신
+- DocumentTemplate/UserCompany 변경 시 회사별 서류 템플릿 개수 캐시 무효화
+- Company/Department/FollowUp 변경 시 업체·부서 자동완성 인덱스 무효화
 """
 import logging
 
-from django.db.models.signals import post_save, pre_save, post_delete
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save, pre_save, post_delete, pre_delete
 from django.dispatch import receiver
 from datetime import date
-from .models import FollowUp, History, OpportunityTracking, Schedule, DeliveryItem
+from .models import Company, Department, DocumentTemplate, EmailLog, FollowUp, History, OpportunityTracking, Schedule, DeliveryItem, UserCompany, UserProfile
+from .services.autocomplete_index import autocomplete_scope_ids, invalidate_autocomplete_index
+from .services.delivery_items import apply_delivery_total_to_opportunity, delivery_item_signals_deferred
+from .services.document_templates import invalidate_company_template_counts
+from .services.email_index import sync_email_index_on_commit
+from .services.quote_allocations import sync_delivery_item_allocation, sync_quote_schedule_allocations
+from .services.request_identity import invalidate_identity_cache
+from .services.user_scope import invalidate_user_scope_cache
 
 logger = logging.getLogger(__name__)
 
@@ -342,6 +358,9 @@ def update_product_sales_count_on_create(sender, instance, created, **kwargs):
     1. 연결된 Product의 판매횟수 증가 (납품 완료 시에만)
     2. Schedule의 OpportunityTracking 수주 금액 업데이트
     """
+    if delivery_item_signals_deferred():
+        # 일괄 저장 경로가 커밋 전에 키별로 한 번씩 재계산한다.
+        return
     if created and instance.product and instance.schedule:
         # 1. 제품 판매횟수 증가 (납품 완료 시에만)
         if instance.schedule.activity_type == 'delivery' and instance.schedule.status == 'completed':
@@ -357,57 +376,9 @@ def update_product_sales_count_on_create(sender, instance, created, **kwargs):
         target_schedule = instance.history.schedule
     
     if target_schedule and target_schedule.activity_type == 'delivery':
-        # Schedule에 연결된 OpportunityTracking 찾기
+        # Schedule에 연결된 OpportunityTracking 수주 금액/단계 갱신 (Schedule + History 품목 합계)
         if hasattr(target_schedule, 'opportunity') and target_schedule.opportunity:
-            opportunity = target_schedule.opportunity
-            
-            # 해당 Schedule의 모든 DeliveryItem 총액 계산 (Schedule + History)
-            total_delivery_amount = 0
-            from decimal import Decimal
-            
-            # Schedule의 DeliveryItem
-            for item in target_schedule.delivery_items_set.all():
-                if item.total_price:
-                    total_delivery_amount += item.total_price
-                elif item.unit_price and item.quantity:
-                    total_delivery_amount += item.unit_price * item.quantity * Decimal('1.1')
-            
-            # History의 DeliveryItem
-            for history in target_schedule.histories.all():
-                for item in history.delivery_items_set.all():
-                    if item.total_price:
-                        total_delivery_amount += item.total_price
-                    elif item.unit_price and item.quantity:
-                        total_delivery_amount += item.unit_price * item.quantity * Decimal('1.1')
-            
-            # OpportunityTracking의 actual_revenue 업데이트
-            if total_delivery_amount > 0:
-                opportunity.actual_revenue = total_delivery_amount
-                
-                # won 단계가 아니면 won으로 변경
-                if opportunity.current_stage != 'won':
-                    old_stage = opportunity.current_stage
-                    opportunity.current_stage = 'won'
-                    opportunity.stage_entry_date = date.today()
-                    
-                    # stage_history 업데이트
-                    if opportunity.stage_history is None:
-                        opportunity.stage_history = []
-                    
-                    # 이전 단계 종료
-                    for stage_entry in opportunity.stage_history:
-                        if stage_entry.get('stage') == old_stage and not stage_entry.get('exited'):
-                            stage_entry['exited'] = date.today().isoformat()
-                    
-                    # won 단계 추가
-                    opportunity.stage_history.append({
-                        'stage': 'won',
-                        'entered': date.today().isoformat(),
-                        'exited': None,
-                        'note': f'납품 완료 (Schedule ID: {target_schedule.id})'
-                    })
-                
-                opportunity.save()
+            apply_delivery_total_to_opportunity(target_schedule.opportunity, target_schedule)
 
 
 @receiver(post_delete, sender=DeliveryItem)
@@ -417,6 +388,8 @@ def update_product_sales_count_on_delete(sender, instance, **kwargs):
     1. 연결된 Product의 판매횟수 감소 (납품 완료 시에만)
     2. Schedule의 OpportunityTracking 수주 금액 재계산 (Schedule + History 포함)
     """
+    if delivery_item_signals_deferred():
+        return
     # 1. 제품 판매횟수 감소 (납품 완료 시에만)
     if instance.product_id and instance.schedule_id:
         try:
@@ -463,3 +436,199 @@ def update_product_sales_count_on_delete(sender, instance, **kwargs):
         except Exception:
             # 기타 예외 무시
             pass
+
+
+@receiver(post_save, sender=DeliveryItem)
+def sync_quote_allocation_on_item_save(sender, instance, created, raw=False, **kwargs):
+    """행 단위로 저장된 납품/견적 품목의 견적 배분 행을 다시 쓴다."""
+    if raw or delivery_item_signals_deferred() or not instance.schedule_id:
+        return
+    if not (created and not instance.source_quote_item_id and not instance.source_quote_schedule_id):
+        sync_delivery_item_allocation(instance)
+    # 견적 품목이 바뀌면 견적 일정만 연결된 납품 행을 다시 매칭한다.
+    sync_quote_schedule_allocations(instance.schedule_id)
+
+
+@receiver(post_delete, sender=DeliveryItem)
+def sync_quote_allocation_on_item_delete(sender, instance, **kwargs):
+    if delivery_item_signals_deferred() or not instance.schedule_id:
+        return
+    sync_quote_schedule_allocations(instance.schedule_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_user_scope_on_membership_change(sender, instance, **kwargs):
+    """역할·소속 회사·활성 여부가 바뀌면 캐시된 사용자 범위를 모두 버린다."""
+    if sender is User and kwargs.get('update_fields') == frozenset({'last_login'}):
+        # 로그인마다 저장되는 last_login 은 범위와 무관하다.
+        return
+    invalidate_user_scope_cache()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+@receiver(post_save, sender=UserCompany)
+@receiver(post_delete, sender=UserCompany)
+def invalidate_identity_on_account_change(sender, instance, **kwargs):
+    """역할·회사명·관리자 필터 대상이 바뀌면 미들웨어 신원 캐시를 모두 버린다."""
+    if sender is User and kwargs.get('update_fields') == frozenset({'last_login'}):
+        return
+    invalidate_identity_cache()
+
+
+@receiver(post_save, sender=DocumentTemplate)
+@receiver(post_delete, sender=DocumentTemplate)
+def invalidate_template_counts_on_template_change(sender, instance, **kwargs):
+    """서류 템플릿이 바뀌면 해당 회사의 템플릿 개수 캐시를 버린다."""
+    invalidate_company_template_counts(instance.company_id)
+
+
+@receiver(post_save, sender=UserCompany)
+@receiver(post_delete, sender=UserCompany)
+def invalidate_template_counts_on_company_change(sender, instance, **kwargs):
+    # 회사가 삭제된 뒤 같은 id로 다시 만들어져도 이전 개수를 쓰지 않도록 한다.
+    invalidate_company_template_counts(instance.pk)
+
+
+# 모델별 (자동완성 인덱스에 들어가는 필드, 인덱스 범위(테넌트)를 정하는 필드, autocomplete_scope_ids 인자).
+AUTOCOMPLETE_INDEXED_FIELDS = {
+    Company: (('name',), 'created_by_id', 'creator_ids'),
+    Department: (('name',), 'company_id', 'company_ids'),
+    FollowUp: (('manager', 'customer_name', 'email'), 'department_id', 'department_ids'),
+}
+
+
+def _autocomplete_field_values(sender, instance):
+    index_fields, scope_field, _scope_arg = AUTOCOMPLETE_INDEXED_FIELDS[sender]
+    return {field: getattr(instance, field) for field in (*index_fields, scope_field)}
+
+
+def _invalidate_autocomplete_scopes(sender, scope_values):
+    _index_fields, _scope_field, scope_arg = AUTOCOMPLETE_INDEXED_FIELDS[sender]
+    scope_ids = autocomplete_scope_ids(**{scope_arg: scope_values})
+    invalidate_autocomplete_index(scope_ids)
+    # 커밋 전에 다른 프로세스가 옛 데이터로 다시 만들었을 수 있으므로 커밋 후 한 번 더 버린다.
+    transaction.on_commit(lambda: invalidate_autocomplete_index(scope_ids))
+
+
+@receiver(pre_save, sender=Company)
+@receiver(pre_save, sender=Department)
+@receiver(pre_save, sender=FollowUp)
+def remember_autocomplete_fields(sender, instance, raw=False, update_fields=None, **kwargs):
+    """저장 전 자동완성 인덱스 필드 값을 기억해 두고, 실제로 바뀐 저장만 인덱스를 버린다."""
+    instance.__dict__.pop('_autocomplete_previous', None)
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    fields = list(_autocomplete_field_values(sender, instance))
+    if update_fields is not None:
+        touched = set(fields) | {field.removesuffix('_id') for field in fields}
+        if not touched & set(update_fields):
+            return
+    instance._autocomplete_previous = sender.objects.filter(pk=instance.pk).values(*fields).first() or {}
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=FollowUp)
+def invalidate_autocomplete_on_name_change(sender, instance, created, raw=False, **kwargs):
+    """업체·부서명이나 부서 검색에 쓰는 담당자 정보가 바뀌면 그 테넌트의 자동완성 인덱스를 버린다."""
+    if raw:
+        return
+    current = _autocomplete_field_values(sender, instance)
+    previous = {} if created else instance.__dict__.pop('_autocomplete_previous', None)
+    if previous is None or previous == current:
+        return
+    scope_field = AUTOCOMPLETE_INDEXED_FIELDS[sender][1]
+    _invalidate_autocomplete_scopes(sender, {current[scope_field], previous.get(scope_field)})
+
+
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=FollowUp)
+def invalidate_autocomplete_on_delete(sender, instance, **kwargs):
+    scope_field = AUTOCOMPLETE_INDEXED_FIELDS[sender][1]
+    _invalidate_autocomplete_scopes(sender, {getattr(instance, scope_field)})
+
+
+EMAIL_INDEX_EMAIL_FIELDS = frozenset({
+    'user', 'user_id', 'sender', 'sender_id', 'followup', 'followup_id', 'schedule', 'schedule_id',
+    'email_type', 'is_sent', 'is_trashed', 'received_at', 'sent_at',
+})
+# 메일 인덱스 행에 풀어 둔 고객·일정 필드. 이 값이 실제로 바뀐 저장만 연결 메일을 다시 색인한다.
+EMAIL_INDEX_RELATED_FIELDS = {
+    FollowUp: ('user_id', 'department_id'),
+    Schedule: ('user_id', 'followup_id', 'department_id'),
+}
+
+
+def _touches_email_index(update_fields, indexed_fields):
+    return update_fields is None or bool(set(update_fields) & indexed_fields)
+
+
+@receiver(post_save, sender=EmailLog)
+def sync_email_index_on_email_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    """메일 저장 커밋 후 AI 컨텍스트 인덱스 행을 다시 만든다."""
+    if raw or not _touches_email_index(update_fields, EMAIL_INDEX_EMAIL_FIELDS):
+        return
+    email_id = instance.id
+    sync_email_index_on_commit(lambda: [email_id])
+
+
+@receiver(pre_save, sender=FollowUp)
+@receiver(pre_save, sender=Schedule)
+def remember_email_index_fields(sender, instance, raw=False, update_fields=None, **kwargs):
+    """저장 전 담당자·고객·부서 값을 기억해 두고, 실제로 바뀐 저장만 메일 인덱스를 다시 만든다."""
+    instance.__dict__.pop('_email_index_previous', None)
+    if raw or instance._state.adding or instance.pk is None:
+        return
+    fields = EMAIL_INDEX_RELATED_FIELDS[sender]
+    if update_fields is not None:
+        touched = set(fields) | {field.removesuffix('_id') for field in fields}
+        if not touched & set(update_fields):
+            return
+    instance._email_index_previous = sender.objects.filter(pk=instance.pk).values(*fields).first() or {}
+
+
+def _email_index_fields_changed(sender, instance):
+    previous = instance.__dict__.pop('_email_index_previous', None)
+    if previous is None:
+        return False
+    return any(previous.get(field) != getattr(instance, field) for field in EMAIL_INDEX_RELATED_FIELDS[sender])
+
+
+@receiver(post_save, sender=FollowUp)
+def sync_email_index_on_followup_change(sender, instance, created, raw=False, **kwargs):
+    """고객 담당자·부서가 바뀌면 커밋 후 연결된 메일의 인덱스 행을 다시 만든다."""
+    if raw or created or not _email_index_fields_changed(sender, instance):
+        return
+    followup_id = instance.id
+    sync_email_index_on_commit(lambda: EmailLog.objects.filter(
+        Q(followup_id=followup_id) | Q(schedule__followup_id=followup_id)
+    ).values_list('id', flat=True))
+
+
+@receiver(post_save, sender=Schedule)
+def sync_email_index_on_schedule_change(sender, instance, created, raw=False, **kwargs):
+    """일정 담당자·고객·부서가 바뀌면 커밋 후 연결된 메일의 인덱스 행을 다시 만든다."""
+    if raw or created or not _email_index_fields_changed(sender, instance):
+        return
+    schedule_id = instance.id
+    sync_email_index_on_commit(lambda: EmailLog.objects.filter(schedule_id=schedule_id).values_list('id', flat=True))
+
+
+@receiver(pre_delete, sender=Schedule)
+def remember_schedule_emails_for_index(sender, instance, **kwargs):
+    # 삭제 후에는 EmailLog.schedule 이 NULL 이 되어 연결 메일을 찾을 수 없다.
+    instance._email_index_ids = list(EmailLog.objects.filter(schedule_id=instance.id).values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Schedule)
+def sync_email_index_on_schedule_delete(sender, instance, **kwargs):
+    email_ids = getattr(instance, '_email_index_ids', None) or []
+    if email_ids:
+        sync_email_index_on_commit(lambda: email_ids)
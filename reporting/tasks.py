@@ -48,6 +48,9 @@ def cleanup_old_files_task(self):
     errors = []
     
     for root, dirs, files in os.walk(media_root):
+        if os.path.abspath(root) == os.path.abspath(media_root):
+            # 콘텐츠 주소 저장소 블롭은 참조 색인으로만 지운다 (reporting.services.media_storage).
+            dirs[:] = [name for name in dirs if name != 'blobs']
         for filename in files:
             filepath = os.path.join(root, filename)
             relative_path = os.path.relpath(filepath, media_root)
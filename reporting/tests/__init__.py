@@ -0,0 +1,5 @@
+"""reporting 앱 테스트.
+
+영역별 ``test_*.py`` 모듈로 나뉘어 있고, 공용 데이터 빌더는 :mod:`reporting.tests.factories`,
+테스트 러너는 :mod:`reporting.tests.runner` 에 있다.
+"""
@@ -0,0 +1,97 @@
+"""reporting 테스트 공용 데이터 빌더.
+
+클래스 단위로 한 번만 만드는 데이터는 ``setUpTestData`` 에서 이 빌더로 만들고,
+테스트마다 달라지는 데이터만 ``setUp``/테스트 본문에서 만든다. Django 가 테스트마다
+트랜잭션을 되돌리고 클래스 속성 모델 인스턴스를 복사하므로 테스트 안에서 고쳐도 된다.
+
+시드 명령과 함께 쓰는 묶음 데이터(계정 원장)는 ``reporting.services.test_fixtures`` 에
+있고, 테스트는 이 모듈을 통해서만 가져다 쓴다.
+"""
+import datetime
+from urllib.parse import urljoin
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    FollowUp,
+    History,
+    Schedule,
+    UserProfile,
+)
+from reporting.services.test_fixtures import create_account_ledger_fixture  # noqa: F401
+
+
+FRONTEND_BASE_URL = 'https://sales-note-frontend-production.up.railway.app/'
+
+
+def frontend_url(path):
+    return urljoin(FRONTEND_BASE_URL, path.lstrip('/'))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 헬퍼: 역할이 있는 사용자 생성
+# ─────────────────────────────────────────────────────────────────────────────
+
+def make_user(username, password='TestPass123!', role='salesman',
+              can_use_ai=False, can_download_excel=False, company=None):
+    """테스트용 사용자 생성 헬퍼"""
+    user = User.objects.create_user(username=username, password=password)
+    profile, _ = UserProfile.objects.get_or_create(user=user)
+    profile.role = role
+    profile.can_use_ai = can_use_ai
+    profile.can_download_excel = can_download_excel
+    if company:
+        profile.company = company
+    profile.save()
+    return user
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 빌더: 고객사 → 부서 → 고객 → 일정/기록
+# ─────────────────────────────────────────────────────────────────────────────
+
+def make_department(owner, name):
+    """``{name} 회사`` 고객사와 ``{name} 연구실`` 부서 생성"""
+    customer_company = Company.objects.create(name=f'{name} 회사', created_by=owner)
+    return Department.objects.create(
+        company=customer_company,
+        name=f'{name} 연구실',
+        created_by=owner,
+    )
+
+
+def make_customer(owner, name, **fields):
+    """부서까지 새로 만든 ``owner`` 담당 고객(FollowUp) 생성. 나머지 필드는 그대로 넘긴다."""
+    department = fields.pop('department', None) or make_department(owner, name)
+    fields.setdefault('user_company', owner.userprofile.company)
+    fields.setdefault('customer_name', f'{name} 담당자')
+    return FollowUp.objects.create(
+        user=owner,
+        company=department.company,
+        department=department,
+        **fields,
+    )
+
+
+def make_schedule(owner, followup, **fields):
+    """``owner`` 소속 회사로 고객 일정 생성. 날짜·시간 기본값은 오늘 09:00."""
+    fields.setdefault('visit_date', timezone.localdate())
+    fields.setdefault('visit_time', datetime.time(9, 0))
+    return Schedule.objects.create(
+        user=owner,
+        company=owner.userprofile.company,
+        followup=followup,
+        **fields,
+    )
+
+
+def make_history(owner, followup, **fields):
+    """``owner`` 소속 회사로 영업 기록(History) 생성"""
+    return History.objects.create(
+        user=owner,
+        company=owner.userprofile.company,
+        followup=followup,
+        **fields,
+    )
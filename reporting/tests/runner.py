@@ -0,0 +1,193 @@
+"""reporting 테스트 러너.
+
+- 프로세스(병렬 실행 시 워커)마다 임시 MEDIA_ROOT·tempfile 디렉터리를 따로 쓴다.
+  테스트가 저장소의 ``media/`` 를 더럽히지 않고, 워커끼리 파일 경로가 겹치지 않는다.
+- 비밀번호 해시는 MD5 로 바꾼다. 기본 PBKDF2 는 사용자 한 명에 0.5초 이상 걸린다.
+- tblib 이 없어도 ``--parallel`` 에서 실패 traceback 을 문자열로 넘긴다.
+- 끝나면 느린 테스트 클래스 순위를 출력하고, ``--timing-report`` 로 JSON 을 남긴다.
+  클래스 시간에는 ``setUpClass``/``setUpTestData`` 가 포함된다.
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+import traceback
+import unittest
+from collections import defaultdict
+from pathlib import Path
+
+from django.test import override_settings
+from django.test import runner as django_runner
+from django.test.runner import DiscoverRunner, ParallelTestSuite, RemoteTestResult, RemoteTestRunner
+
+TEMP_ROOT_ENV = 'REPORTING_TEST_TEMP_ROOT'
+TEST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+_process_override = None
+
+
+def _isolate_process(name):
+    """현재 프로세스의 MEDIA_ROOT 와 tempfile 기본 경로를 ``<root>/<name>`` 아래로 옮긴다."""
+    global _process_override
+    base = Path(os.environ[TEMP_ROOT_ENV]) / name
+    (base / 'media').mkdir(parents=True, exist_ok=True)
+    (base / 'tmp').mkdir(parents=True, exist_ok=True)
+    if _process_override is not None:
+        _process_override.disable()
+    _process_override = override_settings(
+        MEDIA_ROOT=str(base / 'media'),
+        PASSWORD_HASHERS=TEST_PASSWORD_HASHERS,
+    )
+    _process_override.enable()
+    tempfile.tempdir = str(base / 'tmp')
+
+
+def _release_process():
+    global _process_override
+    if _process_override is not None:
+        _process_override.disable()
+        _process_override = None
+    tempfile.tempdir = None
+
+
+def _init_worker(*args, **kwargs):
+    # multiprocessing 초기화 함수라 모듈 수준에 둔다.
+    django_runner._init_worker(*args, **kwargs)
+    _isolate_process(f'worker-{django_runner._worker_id}')
+
+
+class RemoteTestError(Exception):
+    """tblib 없이 워커에서 넘길 수 없는 예외를 traceback 문자열로 대신한다."""
+
+
+class TimedRemoteTestResult(RemoteTestResult):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_stop = time.perf_counter()
+
+    def _picklable(self, err):
+        try:
+            self._confirm_picklable(err)
+        except Exception:
+            error = RemoteTestError(''.join(traceback.format_exception(*err)).rstrip())
+            return RemoteTestError, error, None
+        return err
+
+    def addError(self, test, err):
+        super().addError(test, self._picklable(err))
+
+    def addFailure(self, test, err):
+        super().addFailure(test, self._picklable(err))
+
+    def addSubTest(self, test, subtest, err):
+        if err is not None:
+            err = self._picklable(err)
+        super().addSubTest(test, subtest, err)
+
+    def stopTest(self, test):
+        now = time.perf_counter()
+        self.events.append(('addTestTiming', self.test_index, now - self._last_stop))
+        self._last_stop = now
+        super().stopTest(test)
+
+
+class TimedRemoteTestRunner(RemoteTestRunner):
+    resultclass = TimedRemoteTestResult
+
+
+class ReportingParallelTestSuite(ParallelTestSuite):
+    init_worker = _init_worker
+    runner_class = TimedRemoteTestRunner
+
+
+class TimedTextTestResult(unittest.TextTestResult):
+    """테스트별 소요 시간(직전 테스트 종료 이후)을 모은다. 병렬이면 워커가 잰 값을 쓴다."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.test_timings = {}
+        self._last_stop = None
+
+    def startTestRun(self):
+        super().startTestRun()
+        self._last_stop = time.perf_counter()
+
+    def addTestTiming(self, test, elapsed):
+        self.test_timings[test.id()] = elapsed
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        now = time.perf_counter()
+        if self._last_stop is not None:
+            self.test_timings.setdefault(test.id(), now - self._last_stop)
+        self._last_stop = now
+
+    def class_timings(self):
+        totals = defaultdict(lambda: {'seconds': 0.0, 'tests': 0})
+        for test_id, elapsed in self.test_timings.items():
+            class_id = test_id.split(' ')[0].rsplit('.', 1)[0]
+            totals[class_id]['seconds'] += elapsed
+            totals[class_id]['tests'] += 1
+        return sorted(
+            ({'class': name, 'seconds': round(item['seconds'], 3), 'tests': item['tests']}
+             for name, item in totals.items()),
+            key=lambda item: item['seconds'],
+            reverse=True,
+        )
+
+
+class ReportingTestRunner(DiscoverRunner):
+    parallel_test_suite = ReportingParallelTestSuite
+
+    def __init__(self, slowest=10, timing_report=None, **kwargs):
+        super().__init__(**kwargs)
+        self.slowest = slowest
+        self.timing_report = timing_report
+        self._temp_root = None
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--slowest', type=int, default=10,
+            help='Print the N slowest test classes after the run (0 disables).',
+        )
+        parser.add_argument(
+            '--timing-report', metavar='PATH',
+            help='Write per-class and per-test timings to PATH as JSON.',
+        )
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._temp_root = tempfile.mkdtemp(prefix='reporting-tests-')
+        os.environ[TEMP_ROOT_ENV] = self._temp_root
+        _isolate_process('main')
+
+    def teardown_test_environment(self, **kwargs):
+        _release_process()
+        os.environ.pop(TEMP_ROOT_ENV, None)
+        shutil.rmtree(self._temp_root, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
+
+    def get_resultclass(self):
+        return super().get_resultclass() or TimedTextTestResult
+
+    def run_suite(self, suite, **kwargs):
+        result = super().run_suite(suite, **kwargs)
+        if isinstance(result, TimedTextTestResult):
+            self.report_timings(result)
+        return result
+
+    def report_timings(self, result):
+        classes = result.class_timings()
+        if self.slowest > 0 and classes:
+            self.log(f'\nSlowest {min(self.slowest, len(classes))} test classes:')
+            for item in classes[:self.slowest]:
+                self.log(f"  {item['seconds']:8.2f}s  {item['tests']:4d} tests  {item['class']}")
+        if self.timing_report:
+            Path(self.timing_report).write_text(json.dumps({
+                'classes': classes,
+                'tests': {test_id: round(elapsed, 4) for test_id, elapsed in sorted(result.test_timings.items())},
+            }, ensure_ascii=False, indent=2))
+            self.log(f'Timing report written to {self.timing_report}')
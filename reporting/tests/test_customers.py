@@ -0,0 +1,2543 @@
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    DemoRecord,
+    DocumentGenerationLog,
+    FollowUp,
+    Product,
+    UserCompany,
+)
+from reporting.services.autocomplete_index import clear_local_indexes, search_companies
+from reporting.tests.factories import (
+    create_account_ledger_fixture,
+    make_customer,
+    make_department,
+    make_history,
+    make_user,
+)
+
+
+class DemoRecordsApiTests(TestCase):
+    """Demo management API regression tests."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user_company = UserCompany.objects.create(name='데모테스트회사')
+        self.user = make_user('demo-user', company=self.user_company)
+        self.manager = make_user('demo-manager', role='manager', company=self.user_company)
+        self.company = Company.objects.create(name='데모고객사', created_by=self.user)
+        self.department = Department.objects.create(company=self.company, name='데모연구실', created_by=self.user)
+        self.followup = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.user_company,
+            customer_name='데모담당자',
+            company=self.company,
+            department=self.department,
+        )
+        self.product = Product.objects.create(
+            product_code='DEMO-PRODUCT-1',
+            unit='EA',
+            standard_price=1000000,
+            created_by=self.user,
+        )
+
+    def test_demo_records_api_requires_login_json(self):
+        response = self.client.get(reverse('reporting:demo_records_api'))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_create_and_list_product_linked_demo_record(self):
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:demo_record_create_api'),
+            data=json.dumps({
+                'departmentId': self.department.id,
+                'customerId': self.followup.id,
+                'productId': self.product.id,
+                'quantity': 2,
+                'status': 'active',
+                'startDate': '2026-06-01',
+                'expectedReturnDate': '2026-06-30',
+                'notes': '현장 데모',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        created = DemoRecord.objects.get()
+        self.assertEqual(created.product, self.product)
+        self.assertEqual(created.product_name, self.product.product_code)
+        self.assertEqual(created.followup, self.followup)
+
+        list_response = self.client.get(reverse('reporting:demo_records_api'), {'status': 'all'})
+        payload = list_response.json()
+        self.assertEqual(list_response.status_code, 200)
+        self.assertEqual(payload['summary']['total'], 1)
+        self.assertEqual(payload['demos'][0]['productName'], self.product.product_code)
+        self.assertEqual(payload['demos'][0]['customerName'], '데모담당자')
+        self.assertEqual(payload['options']['accounts'][0]['departmentId'], self.department.id)
+        self.assertEqual(payload['options']['products'][0]['id'], self.product.id)
+
+    def test_customer_detail_includes_demo_summary(self):
+        DemoRecord.objects.create(
+            company=self.company,
+            department=self.department,
+            followup=self.followup,
+            product=self.product,
+            product_name=self.product.product_code,
+            quantity=1,
+            status='scheduled',
+            owner=self.user,
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_detail_summary_api', args=[self.followup.id]))
+
+        self.assertEqual(response.status_code, 200)
+        demo_summary = response.json()['demoSummary']
+        self.assertEqual(demo_summary['metrics']['total'], 1)
+        self.assertEqual(demo_summary['demos'][0]['productName'], self.product.product_code)
+        self.assertEqual(demo_summary['links']['demos'], f'/demos/?department={self.department.id}')
+
+    def test_manager_cannot_create_demo_record(self):
+        self.client.force_login(self.manager)
+
+        response = self.client.post(
+            reverse('reporting:demo_record_create_api'),
+            data=json.dumps({
+                'departmentId': self.department.id,
+                'productId': self.product.id,
+                'quantity': 1,
+                'status': 'active',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(DemoRecord.objects.count(), 0)
+
+
+class EmployeeManagementApiTests(TestCase):
+    """React user/employee management API tests for admin and manager roles."""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='직원관리API회사')
+        self.other_company = UserCompany.objects.create(name='직원관리API타사회사')
+        self.manager = make_user('employee-api-manager', role='manager', company=self.company)
+        self.salesman = make_user('employee-api-sales', role='salesman', company=self.company)
+        self.coworker = make_user('employee-api-coworker', role='salesman', company=self.company)
+        self.other_user = make_user('employee-api-other', role='salesman', company=self.other_company)
+        self.url = reverse('reporting:employees_management_api')
+
+    def test_employee_management_api_requires_manager(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+        self.client.force_login(self.salesman)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['error'], 'management_required')
+
+    def test_employee_management_api_lists_same_company_people(self):
+        self.coworker.first_name = '길동'
+        self.coworker.last_name = '홍'
+        self.coworker.email = 'coworker@example.com'
+        self.coworker.save(update_fields=['first_name', 'last_name', 'email'])
+        profile = self.coworker.userprofile
+        profile.can_download_excel = True
+        profile.can_use_ai = True
+        profile.created_by = self.manager
+        profile.save(update_fields=['can_download_excel', 'can_use_ai', 'created_by'])
+        self.salesman.is_active = False
+        self.salesman.save(update_fields=['is_active'])
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['scope']['canManage'])
+        self.assertEqual(payload['scope']['companyName'], self.company.name)
+        ids = {item['id'] for item in payload['employees']}
+        self.assertIn(self.manager.id, ids)
+        self.assertIn(self.salesman.id, ids)
+        self.assertIn(self.coworker.id, ids)
+        self.assertNotIn(self.other_user.id, ids)
+        self.assertEqual(payload['metrics']['totalEmployees'], 3)
+        self.assertEqual(payload['metrics']['inactiveEmployees'], 1)
+        coworker_payload = next(item for item in payload['employees'] if item['id'] == self.coworker.id)
+        self.assertEqual(coworker_payload['name'], '길동 홍')
+        self.assertTrue(coworker_payload['canDownloadExcel'])
+        self.assertTrue(coworker_payload['canUseAi'])
+        self.assertEqual(coworker_payload['createdByName'], self.manager.username)
+        self.assertEqual(coworker_payload['editHref'], f'/employees/?employee={self.coworker.id}&edit=1')
+        self.assertEqual(coworker_payload['updateHref'], reverse('reporting:employees_update_api', args=[self.coworker.id]))
+        self.assertEqual(coworker_payload['toggleActiveHref'], reverse('reporting:employees_toggle_active_api', args=[self.coworker.id]))
+        manager_payload = next(item for item in payload['employees'] if item['id'] == self.manager.id)
+        self.assertEqual(manager_payload['editHref'], '')
+        self.assertTrue(manager_payload['isCurrentUser'])
+
+    def test_employee_management_api_filters_by_search_and_role(self):
+        self.coworker.first_name = '필터'
+        self.coworker.last_name = '대상'
+        self.coworker.save(update_fields=['first_name', 'last_name'])
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url, {'q': '필터', 'role': 'salesman'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['filters']['q'], '필터')
+        self.assertEqual(payload['filters']['role'], 'salesman')
+        self.assertEqual([item['id'] for item in payload['employees']], [self.coworker.id])
+
+    def test_admin_employee_management_api_lists_all_and_filters_company(self):
+        admin = make_user('employee-api-admin', role='admin')
+        self.client.force_login(admin)
+
+        response = self.client.get(self.url, {'company': str(self.other_company.id)})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['scope']['mode'], 'admin')
+        self.assertTrue(payload['scope']['canChangeRole'])
+        self.assertEqual(payload['filters']['company'], str(self.other_company.id))
+        ids = {item['id'] for item in payload['employees']}
+        self.assertIn(self.other_user.id, ids)
+        self.assertNotIn(self.salesman.id, ids)
+        self.assertGreaterEqual(len(payload['options']['companies']), 2)
+
+    def test_manager_can_create_salesman_only_in_own_company(self):
+        self.client.force_login(self.manager)
+        response = self.client.post(
+            reverse('reporting:employees_create_api'),
+            data=json.dumps({
+                'username': 'employee-api-created',
+                'password': 'secret-password',
+                'passwordConfirm': 'secret-password',
+                'role': 'manager',
+                'companyName': self.other_company.name,
+                'canUseAi': True,
+                'canDownloadExcel': True,
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        created = User.objects.get(username='employee-api-created')
+        profile = created.userprofile
+        self.assertEqual(profile.role, 'salesman')
+        self.assertEqual(profile.company_id, self.company.id)
+        self.assertFalse(profile.can_use_ai)
+        self.assertTrue(profile.can_download_excel)
+        self.assertEqual(payload['employee']['companyId'], self.company.id)
+
+    def test_manager_cannot_update_other_company_employee(self):
+        self.client.force_login(self.manager)
+        response = self.client.post(
+            reverse('reporting:employees_update_api', args=[self.other_user.id]),
+            data=json.dumps({'username': 'blocked-other-company'}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_manager_update_keeps_role_company_and_ai_fixed(self):
+        self.client.force_login(self.manager)
+        response = self.client.post(
+            reverse('reporting:employees_update_api', args=[self.coworker.id]),
+            data=json.dumps({
+                'username': 'employee-api-coworker-updated',
+                'role': 'manager',
+                'companyName': self.other_company.name,
+                'canUseAi': True,
+                'canDownloadExcel': True,
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.coworker.refresh_from_db()
+        profile = self.coworker.userprofile
+        self.assertEqual(self.coworker.username, 'employee-api-coworker-updated')
+        self.assertEqual(profile.role, 'salesman')
+        self.assertEqual(profile.company_id, self.company.id)
+        self.assertFalse(profile.can_use_ai)
+        self.assertTrue(profile.can_download_excel)
+
+    def test_admin_can_create_update_and_toggle_user(self):
+        admin = make_user('employee-api-admin-mutate', role='admin')
+        self.client.force_login(admin)
+        create_response = self.client.post(
+            reverse('reporting:employees_create_api'),
+            data=json.dumps({
+                'username': 'employee-api-admin-created',
+                'password': 'secret-password',
+                'passwordConfirm': 'secret-password',
+                'role': 'manager',
+                'companyId': str(self.company.id),
+                'canUseAi': True,
+                'canDownloadExcel': True,
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(create_response.status_code, 201)
+        created = User.objects.get(username='employee-api-admin-created')
+        self.assertEqual(created.userprofile.role, 'manager')
+        self.assertTrue(created.userprofile.can_use_ai)
+
+        update_response = self.client.post(
+            reverse('reporting:employees_update_api', args=[created.id]),
+            data=json.dumps({
+                'username': 'employee-api-admin-updated',
+                'role': 'salesman',
+                'companyName': self.other_company.name,
+                'canUseAi': False,
+                'canDownloadExcel': False,
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(update_response.status_code, 200)
+        created.refresh_from_db()
+        created.userprofile.refresh_from_db()
+        self.assertEqual(created.username, 'employee-api-admin-updated')
+        self.assertEqual(created.userprofile.role, 'salesman')
+        self.assertEqual(created.userprofile.company_id, self.other_company.id)
+        self.assertFalse(created.userprofile.can_use_ai)
+
+        toggle_response = self.client.post(
+            reverse('reporting:employees_toggle_active_api', args=[created.id]),
+            data=json.dumps({'isActive': False}),
+            content_type='application/json',
+        )
+        self.assertEqual(toggle_response.status_code, 200)
+        created.refresh_from_db()
+        self.assertFalse(created.is_active)
+
+
+class ReactReportsProfileBusinessCardApiTests(TestCase):
+    """Reports/profile/business card React API regression tests."""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='Hana CRM')
+        self.user = make_user(
+            'react-api-user',
+            password='TestPass123!',
+            company=self.company,
+            can_download_excel=True,
+        )
+        self.manager = make_user('react-api-manager', role='manager', company=self.company)
+        self.other = make_user('react-api-other', company=self.company)
+        self.customer_company = Company.objects.create(name='고객사 A', created_by=self.user)
+        self.department = Department.objects.create(
+            company=self.customer_company,
+            name='연구실 A',
+            created_by=self.user,
+        )
+        self.followup = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            company=self.customer_company,
+            department=self.department,
+            customer_name='김고객',
+            email='customer@example.com',
+            pipeline_stage='quote',
+        )
+
+    def test_common_account_ledger_feeds_reports_customer_detail_and_ai(self):
+        from ai_chat.services import gather_prepayment_data, gather_quote_delivery_data
+        from reporting.services.account_ledger import account_operational_ledger_for_followups
+
+        today = timezone.localdate()
+        create_account_ledger_fixture(
+            self.user,
+            user_company=self.company,
+            company=self.customer_company,
+            department=self.department,
+            today=today,
+            prefix='ledgercommon',
+        )
+        shared_followups = FollowUp.objects.filter(user=self.user, department=self.department)
+        service_ledger = account_operational_ledger_for_followups(
+            shared_followups,
+            [self.user],
+            actor=self.user,
+            record_limit=None,
+        )
+        service_metrics = service_ledger['metrics']
+        self.assertEqual(service_metrics['deliveryRecords'], 2)
+        self.assertEqual(service_metrics['deliveryAmount'], 90000)
+        self.assertEqual(service_metrics['prepaymentDeliveryRecords'], 1)
+        self.assertEqual(service_metrics['prepaymentUsedAmount'], 60000)
+        self.assertEqual(service_metrics['quoteRecords'], 1)
+        self.assertEqual(service_metrics['quoteAmount'], 110000)
+        self.assertEqual(service_metrics['prepaymentRecords'], 1)
+        self.assertEqual(service_metrics['prepaymentBalance'], 40000)
+
+        self.client.force_login(self.user)
+        account_response = self.client.get(reverse('reporting:account_detail_summary_api', args=[self.department.id]))
+        self.assertEqual(account_response.status_code, 200)
+        account_metrics = account_response.json()['operationalRecords']['metrics']
+        self.assertEqual(account_metrics['deliveryRecords'], service_metrics['deliveryRecords'])
+        self.assertEqual(account_metrics['quoteRecords'], service_metrics['quoteRecords'])
+        self.assertEqual(account_metrics['prepaymentRecords'], service_metrics['prepaymentRecords'])
+        self.assertEqual(account_metrics['prepaymentUsedAmount'], service_metrics['prepaymentUsedAmount'])
+
+        ai_quote_delivery = gather_quote_delivery_data(self.department, self.user)
+        self.assertEqual(ai_quote_delivery['summary']['total_deliveries'], service_metrics['deliveryRecords'])
+        self.assertEqual(ai_quote_delivery['summary']['total_delivery_amount'], service_metrics['deliveryAmount'])
+        self.assertEqual(ai_quote_delivery['summary']['total_quotes'], service_metrics['quoteRecords'])
+        self.assertEqual(ai_quote_delivery['summary']['total_quote_amount'], service_metrics['quoteAmount'])
+        self.assertIn('common_account_ledger', {row['ledgerSource'] for row in ai_quote_delivery['deliveries']})
+
+        ai_prepayments = gather_prepayment_data(shared_followups)
+        self.assertEqual(ai_prepayments['summary']['total_count'], service_metrics['prepaymentRecords'])
+        self.assertEqual(ai_prepayments['summary']['total_remaining_balance'], service_metrics['prepaymentBalance'])
+
+    def test_account_ledger_limits_records_per_account_with_full_metrics(self):
+        from django.db import connection
+        from reporting.services.account_ledger import account_operational_ledger_for_followups
+
+        create_account_ledger_fixture(
+            self.user,
+            user_company=self.company,
+            company=self.customer_company,
+            department=self.department,
+            today=timezone.localdate(),
+            prefix='ledgerlimit',
+        )
+        shared_followups = FollowUp.objects.filter(user=self.user, department=self.department)
+        full = account_operational_ledger_for_followups(shared_followups, [self.user], record_limit=None)
+        limited = account_operational_ledger_for_followups(shared_followups, [self.user], record_limit=1)
+
+        self.assertEqual(limited['metrics'], full['metrics'])
+        self.assertEqual(len(full['deliveryRecords']), 2)
+        self.assertEqual(limited['deliveryRecords'], full['deliveryRecords'][:1])
+
+        with patch.object(connection.features, 'supports_over_clause', False):
+            fallback = account_operational_ledger_for_followups(shared_followups, [self.user], record_limit=1)
+        self.assertEqual(fallback['metrics'], full['metrics'])
+        self.assertEqual(
+            [row['id'] for row in fallback['deliveryRecords']],
+            [row['id'] for row in limited['deliveryRecords']],
+        )
+
+    def test_profile_api_update_and_password_change(self):
+        self.client.force_login(self.user)
+
+        update_response = self.client.post(
+            reverse('reporting:profile_api_update'),
+            data=json.dumps({
+                'username': 'react-profile-user',
+                'firstName': '길동',
+                'lastName': '홍',
+                'email': 'profile@example.com',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(update_response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.username, 'react-profile-user')
+        self.assertEqual(self.user.email, 'profile@example.com')
+
+        password_response = self.client.post(
+            reverse('reporting:profile_api_password'),
+            data=json.dumps({
+                'oldPassword': 'TestPass123!',
+                'newPassword1': 'NewPass12345!',
+                'newPassword2': 'NewPass12345!',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(password_response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('NewPass12345!'))
+
+
+class CustomersSummaryApiTests(TestCase):
+    """React 고객 화면 읽기 API 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = UserCompany.objects.create(name='고객API회사')
+        cls.other_company = UserCompany.objects.create(name='고객API타사회사')
+        cls.user = make_user('customers_api_me', role='salesman', company=cls.company)
+        cls.coworker = make_user('customers_api_coworker', role='salesman', company=cls.company)
+        cls.manager = make_user('customers_api_manager', role='manager', company=cls.company)
+        cls.admin = make_user('customers_api_admin', role='admin', company=cls.company)
+        cls.other_user = make_user('customers_api_other', role='salesman', company=cls.other_company)
+        cls.url = reverse('reporting:customers_summary_api')
+
+    def setUp(self):
+        self.client = Client()
+
+    def _create_customer(self, owner, name, priority='urgent', stage='quote'):
+        followup = make_customer(
+            owner,
+            name,
+            manager=f'{name} 책임',
+            priority=priority,
+            pipeline_stage=stage,
+            customer_grade='A',
+            ai_score=80,
+        )
+        make_history(
+            owner,
+            followup,
+            action_type='customer_meeting',
+            content=f'{name} 고객 상담',
+            next_action='다음 연락',
+            next_action_date=timezone.localdate() - timedelta(days=1),
+        )
+        return followup
+
+    def test_customers_summary_api_requires_login_json(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_customers_summary_api_uses_salesman_own_scope(self):
+        own = self._create_customer(self.user, '내고객')
+        coworker = self._create_customer(self.coworker, '동료고객')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['customers']}
+        self.assertIn(own.id, ids)
+        self.assertNotIn(coworker.id, ids)
+        self.assertEqual(payload['metrics']['totalCustomers'], 1)
+        self.assertTrue(payload['create']['canCreate'])
+        self.assertEqual(payload['links']['createCustomer'], '/customers/?create=1')
+        self.assertEqual(payload['create']['submitUrl'], reverse('reporting:followup_create_ajax'))
+        self.assertEqual(payload['create']['companySubmitUrl'], reverse('reporting:company_create_api'))
+        self.assertEqual(payload['create']['departmentSubmitUrl'], reverse('reporting:department_create_api'))
+        company_option = next(option for option in payload['create']['companies'] if option['id'] == own.company_id)
+        self.assertTrue(company_option['canManage'])
+        self.assertFalse(company_option['canDelete'])
+        self.assertEqual(company_option['updateUrl'], reverse('reporting:company_update_api', args=[own.company_id]))
+        self.assertEqual(company_option['deleteUrl'], reverse('reporting:company_delete_api', args=[own.company_id]))
+        self.assertIn('부서', company_option['deleteMessage'])
+        department_option = next(option for option in payload['create']['departments'] if option['id'] == own.department_id)
+        self.assertTrue(department_option['canManage'])
+        self.assertFalse(department_option['canDelete'])
+        self.assertEqual(department_option['updateUrl'], reverse('reporting:department_update_api', args=[own.department_id]))
+        self.assertEqual(department_option['deleteUrl'], reverse('reporting:department_delete_api', args=[own.department_id]))
+        self.assertIn('담당자', department_option['deleteMessage'])
+        self.assertIn('내고객 책임', department_option['searchText'])
+
+    def test_customers_summary_api_returns_department_account_rows(self):
+        from datetime import time, timedelta
+        from reporting.models import FollowUp, Schedule
+
+        target = self._create_customer(self.user, '계정고객')
+        sibling = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='계정고객 추가담당',
+            manager='계정고객 추가책임',
+            company=target.company,
+            department=target.department,
+            priority='scheduled',
+            pipeline_stage='contact',
+        )
+        Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=sibling,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(11, 0),
+            activity_type='customer_meeting',
+            status='scheduled',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        customer_ids = {item['id'] for item in payload['customers']}
+        self.assertIn(target.id, customer_ids)
+        self.assertIn(sibling.id, customer_ids)
+        self.assertEqual(payload['metrics']['totalCustomers'], 2)
+        self.assertEqual(payload['metrics']['totalAccounts'], 1)
+        self.assertEqual(payload['metrics']['filteredAccounts'], 1)
+        self.assertEqual(len(payload['accounts']), 1)
+        account = payload['accounts'][0]
+        self.assertEqual(account['id'], target.department_id)
+        self.assertEqual(account['accountId'], target.department_id)
+        self.assertEqual(account['accountType'], 'department')
+        self.assertIn(account['representativeCustomerId'], {target.id, sibling.id})
+        self.assertEqual(account['customer'], target.department.name)
+        self.assertEqual(account['href'], f'/accounts/{target.department_id}/')
+        self.assertIn(account['customerHref'], {
+            reverse('reporting:followup_detail', args=[target.id]),
+            reverse('reporting:followup_detail', args=[sibling.id]),
+        })
+        self.assertEqual(account['contactCount'], 2)
+        self.assertIn('계정고객 담당자', account['contactPreview'])
+        self.assertIn('계정고객 추가담당', account['contactPreview'])
+        self.assertEqual(account['activityCount'], 1)
+        self.assertEqual(account['scheduleCount'], 1)
+        self.assertEqual(account['upcomingScheduleCount'], 1)
+
+    def test_customers_summary_api_search_includes_empty_department_accounts(self):
+        from reporting.models import Company, Department
+
+        company = Company.objects.create(name='서울시 보건환경연구원', created_by=self.user)
+        department = Department.objects.create(
+            company=company,
+            name='감염병 검사 연구실',
+            notes='담당자 등록 전 계정',
+            created_by=self.user,
+        )
+        self._create_customer(self.user, '검색제외고객')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url, {'q': '서울시 보건'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['filters']['q'], '서울시 보건')
+        self.assertEqual(payload['metrics']['filteredCustomers'], 0)
+        self.assertEqual(payload['metrics']['filteredAccounts'], 1)
+        self.assertEqual(payload['pagination']['totalRows'], 1)
+        self.assertEqual(payload['pagination']['accountRows'], 1)
+        self.assertEqual(payload['customers'], [])
+        self.assertEqual(len(payload['accounts']), 1)
+        account = payload['accounts'][0]
+        self.assertEqual(account['id'], department.id)
+        self.assertEqual(account['accountId'], department.id)
+        self.assertEqual(account['accountType'], 'department')
+        self.assertIsNone(account['representativeCustomerId'])
+        self.assertEqual(account['customer'], '담당자 없음')
+        self.assertEqual(account['company'], '서울시 보건환경연구원')
+        self.assertEqual(account['department'], '감염병 검사 연구실')
+        self.assertEqual(account['contactCount'], 0)
+        self.assertEqual(account['href'], f'/accounts/{department.id}/')
+        self.assertEqual(account['createScheduleHref'], f'/schedules/?create=1&department={department.id}')
+
+    def test_department_autocomplete_finds_department_by_pi_manager_name(self):
+        target = self._create_customer(self.user, 'PI검색고객')
+        target.manager = '김PI교수'
+        target.save(update_fields=['manager'])
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:department_autocomplete'), {
+            'q': '김PI',
+            'company': target.company_id,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        department_ids = {item['id'] for item in response.json()['results']}
+        self.assertIn(target.department_id, department_ids)
+
+    def test_customers_summary_api_defaults_to_latest_updated_first(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from reporting.models import FollowUp
+
+        older = self._create_customer(self.user, '오래된고객')
+        newer = self._create_customer(self.user, '최근고객')
+        FollowUp.objects.filter(pk=older.pk).update(
+            updated_at=timezone.now() - timedelta(days=5),
+            created_at=timezone.now() - timedelta(days=5),
+        )
+        FollowUp.objects.filter(pk=newer.pk).update(
+            updated_at=timezone.now(),
+            created_at=timezone.now(),
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['customers'][0]['id'], newer.id)
+
+    def test_customers_summary_api_filters_search_owner_and_priority(self):
+        target = self._create_customer(self.user, 'PCR핵심', priority='urgent')
+        self._create_customer(self.user, '일반', priority='scheduled')
+        self._create_customer(self.coworker, '동료PCR', priority='urgent')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url, {
+            'q': 'PCR',
+            'owner': str(self.user.id),
+            'priority': 'urgent',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = [item['id'] for item in payload['customers']]
+        self.assertEqual(ids, [target.id])
+        self.assertEqual(payload['filters']['q'], 'PCR')
+        self.assertTrue(any(option['id'] == self.user.id for option in payload['options']['owners']))
+
+    def test_customers_summary_api_filters_company_grade_stage_and_score_level(self):
+        target = self._create_customer(self.user, '정밀필터', priority='urgent', stage='quote')
+        target.customer_grade = 'VIP'
+        target.ai_score = 95
+        target.save(update_fields=['customer_grade', 'ai_score'])
+        other = self._create_customer(self.user, '정밀제외', priority='scheduled', stage='potential')
+        other.customer_grade = 'C'
+        other.ai_score = 15
+        other.save(update_fields=['customer_grade', 'ai_score'])
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url, {
+            'company': str(target.company_id),
+            'grade': 'VIP',
+            'stage': 'quote',
+            'level': 'critical',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = [item['id'] for item in payload['customers']]
+        self.assertEqual(ids, [target.id])
+        self.assertEqual(payload['filters']['company'], str(target.company_id))
+        self.assertEqual(payload['filters']['grade'], 'VIP')
+        self.assertEqual(payload['filters']['stage'], 'quote')
+        self.assertEqual(payload['filters']['level'], 'critical')
+        company_option = next(option for option in payload['options']['companies'] if option['id'] == target.company_id)
+        self.assertEqual(company_option['name'], target.company.name)
+        self.assertTrue(any(option['value'] == 'VIP' for option in payload['options']['grades']))
+        self.assertTrue(any(option['value'] == 'critical' for option in payload['options']['scoreLevels']))
+
+    def test_customers_summary_api_returns_row_policy_pagination_and_export_links(self):
+        from urllib.parse import parse_qs, urlparse
+
+        profile = self.user.userprofile
+        profile.can_download_excel = True
+        profile.save(update_fields=['can_download_excel'])
+        for index in range(12):
+            self._create_customer(self.user, f'페이징{index:02d}', priority='scheduled')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url, {
+            'mode': 'contact',
+            'page': '2',
+            'page_size': '10',
+            'q': '페이징',
+            'priority': 'scheduled',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['filters']['mode'], 'contact')
+        self.assertEqual(payload['pagination']['rowMode'], 'contact')
+        self.assertEqual(payload['pagination']['page'], 2)
+        self.assertEqual(payload['pagination']['pageSize'], 10)
+        self.assertEqual(payload['pagination']['totalRows'], 12)
+        self.assertEqual(payload['pagination']['totalPages'], 2)
+        self.assertEqual(len(payload['customers']), 2)
+        self.assertTrue(any(option['value'] == 'account' for option in payload['options']['rowModes']))
+        self.assertTrue(any(option['value'] == 'contact' for option in payload['options']['rowModes']))
+        self.assertTrue(payload['export']['canDownload'])
+        full_query = parse_qs(urlparse(payload['export']['fullUrl']).query)
+        basic_query = parse_qs(urlparse(payload['export']['basicUrl']).query)
+        self.assertEqual(full_query['search'], ['페이징'])
+        self.assertEqual(full_query['priority'], ['scheduled'])
+        self.assertEqual(basic_query['search'], ['페이징'])
+
+    def test_customers_summary_api_manager_sees_same_company_only(self):
+        own = self._create_customer(self.user, '회사내고객')
+        coworker = self._create_customer(self.coworker, '회사내동료')
+        other = self._create_customer(self.other_user, '타사고객')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['customers']}
+        self.assertIn(own.id, ids)
+        self.assertIn(coworker.id, ids)
+        self.assertNotIn(other.id, ids)
+        priority_ids = {item['id'] for item in payload['priorityCustomers']}
+        self.assertIn(own.id, priority_ids)
+        self.assertTrue(payload['scope']['canViewAll'])
+        self.assertFalse(payload['create']['canCreate'])
+
+    def test_customers_summary_api_admin_sees_all_company_data(self):
+        own = self._create_customer(self.user, '관리자회사내')
+        other = self._create_customer(self.other_user, '관리자타사')
+        self.client.force_login(self.admin)
+
+        response = self.client.get(self.url, {'mode': 'contact'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['customers']}
+        self.assertIn(own.id, ids)
+        self.assertIn(other.id, ids)
+        self.assertTrue(payload['scope']['canViewAll'])
+        self.assertTrue(payload['create']['canCreate'])
+
+    def test_customers_summary_api_includes_activity_and_schedule_snapshot(self):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import History, Schedule
+
+        target = self._create_customer(self.user, '일정있는고객', priority='urgent')
+        History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            action_type='quote',
+            content='견적 재확인',
+            next_action='견적 후속',
+            next_action_date=timezone.localdate() + timedelta(days=2),
+        )
+        upcoming = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 30),
+            activity_type='quote',
+            status='scheduled',
+            location='고객 연구실',
+        )
+        Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate() - timedelta(days=3),
+            visit_time=time(9, 0),
+            activity_type='customer_meeting',
+            status='completed',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        customer = next(item for item in payload['customers'] if item['id'] == target.id)
+        self.assertEqual(customer['activityCount'], 2)
+        self.assertEqual(customer['scheduleCount'], 2)
+        self.assertEqual(customer['upcomingScheduleCount'], 1)
+        self.assertEqual(customer['overdueActionCount'], 1)
+        self.assertEqual(customer['upcomingSchedule']['id'], upcoming.id)
+        self.assertEqual(customer['upcomingSchedule']['activityLabel'], '견적 제출')
+        self.assertEqual(customer['upcomingSchedule']['time'], '10:30')
+        self.assertEqual(
+            customer['upcomingSchedule']['createHistoryHref'],
+            f'/notes/?create=1&customer={target.id}&schedule={upcoming.id}',
+        )
+        self.assertEqual(
+            customer['upcomingSchedule']['djangoCreateHistoryHref'],
+            reverse('reporting:history_create_from_schedule', args=[upcoming.id]),
+        )
+        self.assertEqual(payload['metrics']['scheduledCustomers'], 1)
+
+    def test_customers_apis_exclude_stale_quote_submission_overdue_count(self):
+        from datetime import time, timedelta
+        from decimal import Decimal
+        from reporting.models import History, Schedule
+
+        today = timezone.localdate()
+        target = self._create_customer(self.user, '견적완료고객')
+        History.objects.filter(followup=target).update(reviewed_at=timezone.now())
+        stale_history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            action_type='customer_meeting',
+            content='견적서 제출 예정',
+            next_action='견적서 및 비교표 제출',
+            next_action_date=today - timedelta(days=1),
+        )
+        active_history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            action_type='customer_meeting',
+            content='견적 검토 상황 확인',
+            next_action='견적 검토 여부 확인',
+            next_action_date=today - timedelta(days=1),
+        )
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=today,
+            visit_time=time(10, 30),
+            activity_type='quote',
+            status='scheduled',
+            expected_revenue=Decimal('770000'),
+        )
+        DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='quotation',
+            schedule=quote_schedule,
+            user=self.user,
+            transaction_number='CUSTOMER-ST-Q-001',
+            output_format='pdf',
+        )
+        self.client.force_login(self.user)
+
+        list_response = self.client.get(self.url)
+
+        self.assertEqual(list_response.status_code, 200)
+        customer = next(item for item in list_response.json()['customers'] if item['id'] == target.id)
+        self.assertEqual(customer['overdueActionCount'], 1)
+        self.assertEqual(customer['nextAction'], '견적 검토 여부 확인')
+        self.assertNotEqual(customer['nextAction'], stale_history.next_action)
+
+        detail_response = self.client.get(reverse('reporting:customer_detail_summary_api', args=[target.id]))
+
+        self.assertEqual(detail_response.status_code, 200)
+        detail_payload = detail_response.json()
+        overdue_ids = {item['id'] for item in detail_payload['overdueActions']}
+        self.assertNotIn(stale_history.id, overdue_ids)
+        self.assertIn(active_history.id, overdue_ids)
+        self.assertEqual(detail_payload['metrics']['overdueActions'], 1)
+
+    def test_followup_create_ajax_creates_customer_for_salesman(self):
+        from reporting.models import Company, Department, FollowUp
+
+        customer_company = Company.objects.create(name='빠른등록 회사', created_by=self.user)
+        department = Department.objects.create(
+            company=customer_company,
+            name='빠른등록 연구실',
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:followup_create_ajax'), {
+            'customer_name': '빠른등록 담당자',
+            'company': str(customer_company.id),
+            'department': str(department.id),
+            'priority': 'urgent',
+            'manager': '빠른 책임',
+            'phone_number': '010-0000-0000',
+            'email': 'quick@example.com',
+            'notes': 'React 빠른 등록',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['href'], f"/customers/{payload['followup_id']}/")
+        followup = FollowUp.objects.get(id=payload['followup_id'])
+        self.assertEqual(followup.customer_name, '빠른등록 담당자')
+        self.assertEqual(followup.user, self.user)
+        self.assertEqual(followup.user_company, self.company)
+        self.assertEqual(followup.priority, 'scheduled')
+
+    def test_followup_create_ajax_blocks_manager(self):
+        from reporting.models import Company, Department
+
+        customer_company = Company.objects.create(name='매니저차단 회사', created_by=self.user)
+        department = Department.objects.create(
+            company=customer_company,
+            name='매니저차단 연구실',
+            created_by=self.user,
+        )
+        self.client.force_login(self.manager)
+
+        response = self.client.post(reverse('reporting:followup_create_ajax'), {
+            'customer_name': '매니저 생성 시도',
+            'company': str(customer_company.id),
+            'department': str(department.id),
+            'priority': 'urgent',
+        })
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()['success'])
+
+    def test_company_and_department_create_apis_create_records_for_salesman(self):
+        from reporting.models import Company, Department
+
+        self.client.force_login(self.user)
+
+        company_response = self.client.post(reverse('reporting:company_create_api'), {
+            'name': 'React인라인 회사',
+        })
+
+        self.assertEqual(company_response.status_code, 200)
+        company_payload = company_response.json()
+        self.assertTrue(company_payload['success'])
+        company = Company.objects.get(id=company_payload['company']['id'])
+        self.assertEqual(company.name, 'React인라인 회사')
+        self.assertEqual(company.created_by, self.user)
+
+        department_response = self.client.post(reverse('reporting:department_create_api'), {
+            'company_id': str(company.id),
+            'name': 'React인라인 연구실',
+        })
+
+        self.assertEqual(department_response.status_code, 200)
+        department_payload = department_response.json()
+        self.assertTrue(department_payload['success'])
+        department = Department.objects.get(id=department_payload['department']['id'])
+        self.assertEqual(department.company, company)
+        self.assertEqual(department.name, 'React인라인 연구실')
+        self.assertEqual(department.created_by, self.user)
+
+    def test_company_and_department_create_apis_block_manager(self):
+        from reporting.models import Company
+
+        customer_company = Company.objects.create(name='매니저업체차단 회사', created_by=self.user)
+        self.client.force_login(self.manager)
+
+        company_response = self.client.post(reverse('reporting:company_create_api'), {
+            'name': '매니저 신규 업체',
+        })
+        department_response = self.client.post(reverse('reporting:department_create_api'), {
+            'company_id': str(customer_company.id),
+            'name': '매니저 신규 부서',
+        })
+
+        self.assertEqual(company_response.status_code, 403)
+        self.assertFalse(company_response.json()['success'])
+        self.assertEqual(department_response.status_code, 403)
+        self.assertFalse(department_response.json()['success'])
+
+    def test_department_create_api_blocks_other_company(self):
+        from reporting.models import Company
+
+        other_company = Company.objects.create(name='타사부서차단 회사', created_by=self.other_user)
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:department_create_api'), {
+            'company_id': str(other_company.id),
+            'name': '타사 신규 부서',
+        })
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['error'], '접근 권한이 없는 업체입니다.')
+
+    def test_company_and_department_manage_apis_update_and_delete_owner_records(self):
+        from reporting.models import Company, Department
+
+        company = Company.objects.create(name='수정전 업체', created_by=self.user)
+        department_parent = Company.objects.create(name='부서수정 부모업체', created_by=self.user)
+        department = Department.objects.create(
+            company=department_parent,
+            name='수정전 부서',
+            created_by=self.user,
+        )
+        coworker_company = Company.objects.create(name='동료수정전 업체', created_by=self.coworker)
+        coworker_department = Department.objects.create(
+            company=coworker_company,
+            name='동료수정전 부서',
+            created_by=self.coworker,
+        )
+        self.client.force_login(self.user)
+
+        company_update = self.client.post(reverse('reporting:company_update_api', args=[company.id]), {
+            'name': '수정후 업체',
+        })
+        department_update = self.client.post(reverse('reporting:department_update_api', args=[department.id]), {
+            'name': '수정후 부서',
+        })
+        coworker_company_update = self.client.post(reverse('reporting:company_update_api', args=[coworker_company.id]), {
+            'name': '동료수정후 업체',
+        })
+        coworker_department_update = self.client.post(reverse('reporting:department_update_api', args=[coworker_department.id]), {
+            'name': '동료수정후 부서',
+        })
+
+        self.assertEqual(company_update.status_code, 200)
+        self.assertTrue(company_update.json()['success'])
+        self.assertEqual(Company.objects.get(id=company.id).name, '수정후 업체')
+        self.assertEqual(department_update.status_code, 200)
+        self.assertTrue(department_update.json()['success'])
+        self.assertEqual(Department.objects.get(id=department.id).name, '수정후 부서')
+        self.assertEqual(coworker_company_update.status_code, 200)
+        self.assertTrue(coworker_company_update.json()['success'])
+        self.assertEqual(Company.objects.get(id=coworker_company.id).name, '동료수정후 업체')
+        self.assertEqual(coworker_department_update.status_code, 200)
+        self.assertTrue(coworker_department_update.json()['success'])
+        self.assertEqual(Department.objects.get(id=coworker_department.id).name, '동료수정후 부서')
+
+        department_delete = self.client.post(reverse('reporting:department_delete_api', args=[department.id]))
+        company_delete = self.client.post(reverse('reporting:company_delete_api', args=[company.id]))
+
+        self.assertEqual(department_delete.status_code, 200)
+        self.assertTrue(department_delete.json()['success'])
+        self.assertFalse(Department.objects.filter(id=department.id).exists())
+        self.assertEqual(company_delete.status_code, 200)
+        self.assertTrue(company_delete.json()['success'])
+        self.assertFalse(Company.objects.filter(id=company.id).exists())
+
+    def test_department_update_api_moves_department_to_same_scope_company_and_updates_contacts(self):
+        from django.utils import timezone
+        from reporting.models import Company, CustomerAsset, Prepayment
+
+        followup = self._create_customer(self.user, '소속이동')
+        department = followup.department
+        target_company = Company.objects.create(name='소속이동 경희대학교', created_by=self.coworker)
+        asset = CustomerAsset.objects.create(
+            company=followup.company,
+            department=department,
+            primary_followup=followup,
+            asset_name='소속이동 장비',
+            created_by=self.user,
+        )
+        prepayment = Prepayment.objects.create(
+            department=department,
+            customer=followup,
+            company=followup.company,
+            amount=100000,
+            balance=100000,
+            payment_date=timezone.localdate(),
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:department_update_api', args=[department.id]), {
+            'name': department.name,
+            'company_id': str(target_company.id),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertTrue(payload['department']['moved'])
+        self.assertEqual(payload['department']['company_id'], target_company.id)
+        self.assertEqual(payload['department']['updated_counts']['followups'], 1)
+        self.assertEqual(payload['department']['updated_counts']['assets'], 1)
+        self.assertEqual(payload['department']['updated_counts']['prepayments'], 1)
+        department.refresh_from_db()
+        followup.refresh_from_db()
+        asset.refresh_from_db()
+        prepayment.refresh_from_db()
+        self.assertEqual(department.company_id, target_company.id)
+        self.assertEqual(followup.company_id, target_company.id)
+        self.assertEqual(asset.company_id, target_company.id)
+        self.assertEqual(prepayment.company_id, target_company.id)
+
+    def test_department_update_api_blocks_move_to_other_company_scope(self):
+        from reporting.models import Company
+
+        followup = self._create_customer(self.user, '타사소속이동차단')
+        department = followup.department
+        original_company_id = department.company_id
+        other_company = Company.objects.create(name='타사소속이동 대상', created_by=self.other_user)
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:department_update_api', args=[department.id]), {
+            'name': department.name,
+            'company_id': str(other_company.id),
+        })
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()['success'])
+        department.refresh_from_db()
+        followup.refresh_from_db()
+        self.assertEqual(department.company_id, original_company_id)
+        self.assertEqual(followup.company_id, original_company_id)
+
+    def test_company_and_department_manage_apis_block_manager_and_other_user(self):
+        from reporting.models import Company, Department
+
+        company = Company.objects.create(name='수정권한차단 업체', created_by=self.user)
+        department = Department.objects.create(
+            company=company,
+            name='수정권한차단 부서',
+            created_by=self.user,
+        )
+
+        self.client.force_login(self.manager)
+        manager_company_update = self.client.post(reverse('reporting:company_update_api', args=[company.id]), {
+            'name': '매니저수정',
+        })
+        manager_department_delete = self.client.post(reverse('reporting:department_delete_api', args=[department.id]))
+
+        self.assertEqual(manager_company_update.status_code, 403)
+        self.assertFalse(manager_company_update.json()['success'])
+        self.assertEqual(manager_department_delete.status_code, 403)
+        self.assertFalse(manager_department_delete.json()['success'])
+
+        self.client.force_login(self.other_user)
+        other_company_delete = self.client.post(reverse('reporting:company_delete_api', args=[company.id]))
+        other_department_update = self.client.post(reverse('reporting:department_update_api', args=[department.id]), {
+            'name': '타사수정',
+        })
+
+        self.assertEqual(other_company_delete.status_code, 403)
+        self.assertFalse(other_company_delete.json()['success'])
+        self.assertEqual(other_department_update.status_code, 403)
+        self.assertFalse(other_department_update.json()['success'])
+
+    def test_company_and_department_delete_apis_block_records_in_use(self):
+        target = self._create_customer(self.user, '삭제차단')
+        self.client.force_login(self.user)
+
+        company_response = self.client.post(reverse('reporting:company_delete_api', args=[target.company_id]))
+        department_response = self.client.post(reverse('reporting:department_delete_api', args=[target.department_id]))
+
+        self.assertEqual(company_response.status_code, 400)
+        self.assertFalse(company_response.json()['success'])
+        self.assertIn('삭제할 수 없습니다', company_response.json()['error'])
+        self.assertEqual(department_response.status_code, 400)
+        self.assertFalse(department_response.json()['success'])
+        self.assertIn('담당자', department_response.json()['error'])
+
+    def test_companies_management_api_requires_login_json(self):
+        response = self.client.get(reverse('reporting:companies_management_api'))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_companies_management_api_salesman_owner_permissions_and_search(self):
+        from reporting.models import Company
+
+        own = self._create_customer(self.user, '업체관리내고객')
+        coworker = self._create_customer(self.coworker, '업체관리동료고객')
+        other = self._create_customer(self.other_user, '업체관리타사고객')
+        free_company = Company.objects.create(name='업체관리 삭제가능', created_by=self.user)
+        hidden_move_target = Company.objects.create(name='숨은 이동 대상', created_by=self.coworker)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:companies_management_api'), {'q': '업체관리'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['permissions']['canCreateCompany'])
+        self.assertFalse(payload['permissions']['readOnly'])
+        self.assertNotIn('companyId', payload['filters'])
+        company_ids = {company['id'] for company in payload['companies']}
+        self.assertIn(own.company_id, company_ids)
+        self.assertIn(coworker.company_id, company_ids)
+        self.assertIn(free_company.id, company_ids)
+        self.assertNotIn(hidden_move_target.id, company_ids)
+        self.assertNotIn(other.company_id, company_ids)
+        self.assertNotIn('departmentMoveCompanies', payload)
+        move_response = self.client.get(reverse('reporting:company_management_move_targets_api'), {'q': '숨은'})
+        move_company_ids = {company['id'] for company in move_response.json()['companies']}
+        self.assertEqual(move_company_ids, {hidden_move_target.id})
+
+        own_company = next(company for company in payload['companies'] if company['id'] == own.company_id)
+        coworker_company = next(company for company in payload['companies'] if company['id'] == coworker.company_id)
+        free_company_payload = next(company for company in payload['companies'] if company['id'] == free_company.id)
+        self.assertTrue(own_company['canManage'])
+        self.assertFalse(own_company['canDelete'])
+        self.assertIn('부서', own_company['deleteMessage'])
+        self.assertNotIn('href', own_company)
+        self.assertNotIn('djangoHref', own_company)
+        self.assertNotIn('departmentsUrl', own_company)
+        self.assertNotIn('customersUrl', own_company)
+        own_departments = self.client.get(
+            reverse('reporting:company_management_departments_api', args=[own.company_id]),
+        ).json()['departments']
+        self.assertTrue(own_departments[0]['canManage'])
+        self.assertIn('담당자', own_departments[0]['deleteMessage'])
+        self.assertNotIn('cleanupPreviewHref', own_departments[0])
+        self.assertTrue(coworker_company['canManage'])
+        coworker_departments = self.client.get(
+            reverse('reporting:company_management_departments_api', args=[coworker.company_id]),
+        ).json()['departments']
+        self.assertTrue(coworker_departments[0]['canManage'])
+        self.assertTrue(free_company_payload['canDelete'])
+        self.assertEqual(free_company_payload['deleteMessage'], '')
+
+    def test_companies_management_api_search_avoids_join_explosion_query(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from reporting.models import Company
+
+        self._create_customer(self.user, '서울검색내고객')
+        Company.objects.create(name='서울검색빈업체', created_by=self.user)
+        self.client.force_login(self.user)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('reporting:companies_management_api'), {'q': '서울'})
+
+        self.assertEqual(response.status_code, 200)
+        heavy_company_queries = [
+            query['sql']
+            for query in captured.captured_queries
+            if (
+                'FROM "reporting_company"' in query['sql']
+                and '"reporting_customerasset"' in query['sql']
+                and '"reporting_prepayment"' in query['sql']
+                and 'GROUP BY "reporting_company"' in query['sql']
+            )
+        ]
+        self.assertEqual(
+            heavy_company_queries,
+            [],
+            '업체 검색은 장비/선결제/담당자 count를 한 SQL에 조인해 임시 파일을 키우면 안 됩니다.',
+        )
+
+    def test_companies_management_api_manager_readonly_same_company(self):
+        own = self._create_customer(self.user, '매니저업체조회내고객')
+        coworker = self._create_customer(self.coworker, '매니저업체조회동료고객')
+        other = self._create_customer(self.other_user, '매니저업체조회타사고객')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(reverse('reporting:companies_management_api'))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertFalse(payload['permissions']['canCreateCompany'])
+        self.assertTrue(payload['permissions']['readOnly'])
+        self.assertTrue(payload['permissions']['readOnlyMessage'])
+        company_ids = {company['id'] for company in payload['companies']}
+        self.assertIn(own.company_id, company_ids)
+        self.assertIn(coworker.company_id, company_ids)
+        self.assertNotIn(other.company_id, company_ids)
+        own_company = next(company for company in payload['companies'] if company['id'] == own.company_id)
+        self.assertFalse(own_company['canManage'])
+        own_departments = self.client.get(
+            reverse('reporting:company_management_departments_api', args=[own.company_id]),
+        ).json()['departments']
+        self.assertFalse(own_departments[0]['canManage'])
+        self.assertTrue(any(salesman['username'] == self.user.username for salesman in own_company['salesmen']))
+
+    def test_companies_management_api_admin_sees_all_and_can_manage(self):
+        own = self._create_customer(self.user, '관리자업체조회내고객')
+        other = self._create_customer(self.other_user, '관리자업체조회타사고객')
+        self.client.force_login(self.admin)
+
+        response = self.client.get(reverse('reporting:companies_management_api'))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        company_ids = {company['id'] for company in payload['companies']}
+        self.assertIn(own.company_id, company_ids)
+        self.assertIn(other.company_id, company_ids)
+        self.assertTrue(payload['scope']['canViewAll'])
+        self.assertTrue(payload['permissions']['canCreateCompany'])
+        self.assertTrue(all(company['canManage'] for company in payload['companies']))
+        self.assertTrue(all(department['canManage'] for department in payload['departments']))
+
+    def test_companies_management_api_paginates_and_expands_one_company(self):
+        from reporting.models import Company
+
+        for index in range(12):
+            Company.objects.create(name=f'페이지업체 {index:02d}', created_by=self.user)
+        target = self._create_customer(self.user, '페이지업체 99')
+        self.client.force_login(self.user)
+        url = reverse('reporting:companies_management_api')
+
+        first = self.client.get(url, {'q': '페이지업체', 'page_size': 10}).json()
+        second = self.client.get(url, {'q': '페이지업체', 'page_size': 10, 'page': 2}).json()
+        selected = self.client.get(url, {'q': '페이지업체', 'page_size': 10, 'department_id': target.department_id}).json()
+
+        self.assertEqual(len(first['companies']), 10)
+        self.assertEqual(first['pagination']['totalCount'], 13)
+        self.assertTrue(first['pagination']['hasNext'])
+        self.assertEqual(first['metrics']['filteredCompanies'], 13)
+        self.assertEqual(first['metrics']['blockedCompanies'], 1)
+        self.assertEqual(first['metrics']['filteredDepartments'], 1)
+        self.assertEqual(first['expandedCompanyId'], first['companies'][0]['id'])
+        self.assertTrue(all(company['departments'] == [] for company in first['companies'][1:]))
+        self.assertEqual(
+            [company['name'] for company in second['companies']],
+            ['페이지업체 10', '페이지업체 11', '페이지업체 99 회사'],
+        )
+        self.assertEqual(selected['pagination']['page'], 2)
+        self.assertEqual(selected['expandedCompanyId'], target.company_id)
+        self.assertEqual([department['id'] for department in selected['departments']], [target.department_id])
+        target_company = next(company for company in selected['companies'] if company['id'] == target.company_id)
+        self.assertEqual(target_company['salesmen'][0]['username'], self.user.username)
+        self.assertEqual(target_company['salesmen'][0]['contactCount'], 1)
+
+    def test_company_management_departments_and_move_targets_are_scoped(self):
+        own = self._create_customer(self.user, '부서지연내고객')
+        other = self._create_customer(self.other_user, '부서지연타사고객')
+        self.client.force_login(self.user)
+
+        own_response = self.client.get(reverse('reporting:company_management_departments_api', args=[own.company_id]))
+        other_response = self.client.get(reverse('reporting:company_management_departments_api', args=[other.company_id]))
+        move_response = self.client.get(reverse('reporting:company_management_move_targets_api'), {'q': '부서지연'})
+
+        self.assertEqual(own_response.status_code, 200)
+        self.assertEqual([department['id'] for department in own_response.json()['departments']], [own.department_id])
+        self.assertEqual(other_response.status_code, 404)
+        self.assertEqual([company['id'] for company in move_response.json()['companies']], [own.company_id])
+        self.assertFalse(move_response.json()['hasMore'])
+
+    def test_company_legacy_get_routes_redirect_to_react_management(self):
+        target = self._create_customer(self.user, '업체레거시리다이렉트')
+        self.client.force_login(self.user)
+
+        list_response = self.client.get(reverse('reporting:company_list'))
+        detail_response = self.client.get(reverse('reporting:company_detail', args=[target.company_id]))
+        department_response = self.client.get(reverse('reporting:department_edit', args=[target.department_id]))
+
+        self.assertEqual(list_response.status_code, 302)
+        self.assertIn('/companies/', list_response['Location'])
+        self.assertEqual(detail_response.status_code, 302)
+        self.assertIn('/companies/', detail_response['Location'])
+        self.assertIn(f'company_id={target.company_id}', detail_response['Location'])
+        self.assertEqual(department_response.status_code, 302)
+        self.assertIn('/companies/', department_response['Location'])
+        self.assertIn(f'department_id={target.department_id}', department_response['Location'])
+
+    def test_customer_detail_summary_api_requires_login_json(self):
+        target = self._create_customer(self.user, '상세로그인')
+        url = reverse('reporting:customer_detail_summary_api', args=[target.id])
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_customer_detail_summary_api_returns_notes_and_schedules(self):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import History, HistoryFile, Schedule, ScheduleFile
+
+        target = self._create_customer(self.user, '상세고객', priority='urgent')
+        upcoming = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(11, 0),
+            activity_type='quote',
+            status='scheduled',
+            location='상세 회의실',
+        )
+        note = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            action_type='quote',
+            content='상세 견적 메모',
+            next_action='상세 후속',
+            next_action_date=timezone.localdate() + timedelta(days=1),
+        )
+        note_file_body = b'customer-note'
+        schedule_file_body = b'customer-schedule'
+        note_file = HistoryFile.objects.create(
+            history=note,
+            file=SimpleUploadedFile('customer-note.txt', note_file_body, content_type='text/plain'),
+            original_filename='customer-note.txt',
+            file_size=len(note_file_body),
+            uploaded_by=self.user,
+        )
+        schedule_file = ScheduleFile.objects.create(
+            schedule=upcoming,
+            file=SimpleUploadedFile('customer-schedule.txt', schedule_file_body, content_type='text/plain'),
+            original_filename='customer-schedule.txt',
+            file_size=len(schedule_file_body),
+            uploaded_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_detail_summary_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['customer']['id'], target.id)
+        self.assertGreaterEqual(payload['metrics']['recentNotes'], 2)
+        self.assertEqual(payload['upcomingSchedules'][0]['id'], upcoming.id)
+        self.assertEqual(payload['recentSchedules'][0]['id'], upcoming.id)
+        self.assertTrue(payload['links']['djangoDetail'].endswith(f'/followups/{target.id}/'))
+        self.assertTrue(payload['links']['djangoEdit'].endswith(f'/followups/{target.id}/edit/'))
+        self.assertEqual(payload['links']['createNote'], f'/notes/?create=1&customer={target.id}')
+        self.assertEqual(payload['links']['pipeline'], '/pipeline/')
+        self.assertEqual(payload['attachments']['metrics']['totalFiles'], 2)
+        self.assertEqual(payload['attachments']['metrics']['noteFiles'], 1)
+        self.assertEqual(payload['attachments']['metrics']['scheduleFiles'], 1)
+        attachment_types = {item['fileType'] for item in payload['attachments']['recentFiles']}
+        self.assertIn('note', attachment_types)
+        self.assertIn('schedule', attachment_types)
+        note_attachment = next(item for item in payload['attachments']['recentFiles'] if item['fileType'] == 'note')
+        schedule_attachment = next(item for item in payload['attachments']['recentFiles'] if item['fileType'] == 'schedule')
+        self.assertEqual(note_attachment['sourceHref'], f'/notes/{note.id}/')
+        self.assertEqual(note_attachment['downloadHref'], reverse('reporting:file_download', args=[note_file.id]))
+        self.assertEqual(schedule_attachment['sourceHref'], f'/schedules/{upcoming.id}/')
+        self.assertEqual(schedule_attachment['downloadHref'], reverse('reporting:schedule_file_download', args=[schedule_file.id]))
+        self.assertTrue(payload['edit']['canEdit'])
+        self.assertTrue(payload['edit']['canDelete'])
+        self.assertEqual(payload['edit']['submitUrl'], reverse('reporting:customer_update_api', args=[target.id]))
+        self.assertEqual(payload['edit']['deleteUrl'], reverse('reporting:customer_delete_api', args=[target.id]))
+        self.assertTrue(any(option['id'] == target.company_id for option in payload['edit']['companies']))
+        self.assertTrue(any(option['id'] == target.department_id for option in payload['edit']['departments']))
+
+    def test_customer_detail_summary_api_includes_scoped_prepayment_summary(self):
+        from django.utils import timezone
+        from reporting.models import Prepayment
+
+        target = self._create_customer(self.user, '상세선결제', priority='urgent')
+        first = Prepayment.objects.create(
+            customer=target,
+            company=target.company,
+            amount=100000,
+            balance=80000,
+            payment_date=timezone.localdate(),
+            payer_name='상세입금자',
+            status='active',
+            created_by=self.user,
+        )
+        second = Prepayment.objects.create(
+            customer=target,
+            company=target.company,
+            amount=50000,
+            balance=0,
+            payment_date=timezone.localdate(),
+            payer_name='상세소진',
+            status='depleted',
+            created_by=self.user,
+        )
+        coworker_prepayment = Prepayment.objects.create(
+            customer=target,
+            company=target.company,
+            amount=999000,
+            balance=999000,
+            payment_date=timezone.localdate(),
+            payer_name='동료입금자',
+            status='active',
+            created_by=self.coworker,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_detail_summary_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        summary = response.json()['prepaymentSummary']
+        self.assertEqual(summary['metrics']['totalAmount'], 150000)
+        self.assertEqual(summary['metrics']['totalBalance'], 80000)
+        self.assertEqual(summary['metrics']['totalUsed'], 70000)
+        self.assertEqual(summary['metrics']['totalCount'], 2)
+        self.assertEqual(summary['metrics']['activeCount'], 1)
+        self.assertEqual(summary['metrics']['depletedCount'], 1)
+        self.assertEqual(summary['links']['prepayments'], '/prepayments/')
+        self.assertEqual(summary['links']['accountPrepayments'], f'/prepayments/account/{target.department_id}/')
+        self.assertEqual(summary['links']['customerPrepayments'], f'/prepayments/customer/{target.id}/')
+        self.assertTrue(summary['links']['djangoCustomerPrepayments'].endswith(f'/prepayment/customer/{target.id}/'))
+        prepayment_ids = {item['id'] for item in summary['recentPrepayments']}
+        self.assertIn(first.id, prepayment_ids)
+        self.assertIn(second.id, prepayment_ids)
+        self.assertNotIn(coworker_prepayment.id, prepayment_ids)
+
+    def test_customer_detail_summary_api_includes_operational_records_with_payment_source(self):
+        from datetime import time, timedelta
+        from decimal import Decimal
+        from django.utils import timezone
+        from reporting.models import (
+            DeliveryItem,
+            FollowUp,
+            Prepayment,
+            PrepaymentUsage,
+            Product,
+            Quote,
+            QuoteItem,
+            Schedule,
+            History,
+        )
+
+        today = timezone.localdate()
+        target = self._create_customer(self.user, '운영기록고객', priority='urgent')
+        sibling = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='운영기록 같은부서 담당자',
+            manager='운영기록 같은부서 책임',
+            company=target.company,
+            department=target.department,
+            priority='scheduled',
+            pipeline_stage='quote',
+        )
+        product = Product.objects.create(
+            product_code='OP-QUOTE-001',
+            standard_price=Decimal('120000'),
+            created_by=self.user,
+        )
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=today - timedelta(days=10),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='completed',
+            notes='운영 견적 일정',
+        )
+        quote = Quote.objects.create(
+            quote_number='OP-Q-001',
+            schedule=quote_schedule,
+            followup=target,
+            user=self.user,
+            valid_until=today + timedelta(days=20),
+            stage='sent',
+            notes='운영 견적 메모',
+        )
+        QuoteItem.objects.create(
+            quote=quote,
+            product=product,
+            quantity=2,
+            unit_price=Decimal('120000'),
+        )
+        sibling_quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=sibling,
+            visit_date=today - timedelta(days=8),
+            visit_time=time(13, 0),
+            activity_type='quote',
+            status='completed',
+            notes='같은 부서 견적 일정',
+        )
+        Quote.objects.create(
+            quote_number='OP-Q-SAME-DEPT',
+            schedule=sibling_quote_schedule,
+            followup=sibling,
+            user=self.user,
+            valid_until=today + timedelta(days=20),
+            stage='sent',
+            notes='같은 부서 견적 메모',
+        )
+        service_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=today - timedelta(days=4),
+            visit_time=time(9, 30),
+            activity_type='service',
+            status='scheduled',
+            notes='장비 점검 서비스 일정',
+        )
+        service_note = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            schedule=service_schedule,
+            action_type='service',
+            service_status='received',
+            content='서비스 일정에 연결된 영업노트 메모',
+        )
+        prepayment = Prepayment.objects.create(
+            customer=target,
+            company=target.company,
+            amount=100000,
+            balance=40000,
+            payment_date=today - timedelta(days=7),
+            payer_name='운영입금자',
+            status='active',
+            created_by=self.user,
+        )
+        sibling_prepayment = Prepayment.objects.create(
+            customer=sibling,
+            company=sibling.company,
+            amount=50000,
+            balance=50000,
+            payment_date=today - timedelta(days=6),
+            payer_name='같은부서입금자',
+            status='active',
+            created_by=self.user,
+        )
+        prepaid_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=today - timedelta(days=2),
+            visit_time=time(11, 0),
+            activity_type='delivery',
+            status='completed',
+            notes='구조화된 선결제 차감',
+            use_prepayment=True,
+            prepayment=prepayment,
+            prepayment_amount=Decimal('60000'),
+        )
+        prepaid_item = DeliveryItem.objects.create(
+            schedule=prepaid_schedule,
+            item_name='선결제 납품품목',
+            quantity=1,
+            unit_price=Decimal('60000'),
+        )
+        PrepaymentUsage.objects.create(
+            prepayment=prepayment,
+            schedule=prepaid_schedule,
+            schedule_item=prepaid_item,
+            product_name='선결제 납품품목',
+            quantity=1,
+            amount=Decimal('60000'),
+            remaining_balance=Decimal('40000'),
+        )
+        normal_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=today - timedelta(days=1),
+            visit_time=time(14, 0),
+            activity_type='delivery',
+            status='completed',
+            notes='메모에 선결제라고 써도 구조화 차감 없음',
+        )
+        DeliveryItem.objects.create(
+            schedule=normal_schedule,
+            item_name='일반 납품품목',
+            quantity=1,
+            unit_price=Decimal('30000'),
+        )
+        sibling_delivery_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=sibling,
+            visit_date=today,
+            visit_time=time(15, 0),
+            activity_type='delivery',
+            status='completed',
+            notes='같은 부서 납품',
+        )
+        DeliveryItem.objects.create(
+            schedule=sibling_delivery_schedule,
+            item_name='같은 부서 납품품목',
+            quantity=1,
+            unit_price=Decimal('70000'),
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_detail_summary_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        records = payload['operationalRecords']
+        self.assertEqual(payload['account']['id'], target.department_id)
+        self.assertEqual(payload['account']['type'], 'department')
+        self.assertEqual(payload['account']['contactCount'], 2)
+        self.assertEqual(payload['account']['ledgerScopeLabel'], '부서/연구실 계정 공유 원장')
+        self.assertIn('납품, 견적, 선결제, 서비스', payload['account']['ledgerScopeDescription'])
+        contact_names = {contact['name'] for contact in payload['account']['contacts']}
+        self.assertIn('운영기록고객 담당자', contact_names)
+        self.assertIn('운영기록 같은부서 담당자', contact_names)
+        self.assertEqual(records['metrics']['serviceRecords'], 1)
+        self.assertEqual(records['metrics']['quoteRecords'], 2)
+        self.assertEqual(records['metrics']['deliveryRecords'], 3)
+        self.assertEqual(records['metrics']['prepaymentDeliveryRecords'], 1)
+        self.assertEqual(records['metrics']['normalDeliveryRecords'], 2)
+        self.assertEqual(records['metrics']['prepaymentRecords'], 2)
+        self.assertEqual(payload['prepaymentSummary']['metrics']['totalCount'], 2)
+        service_record_types = {record['recordType'] for record in records['serviceRecords']}
+        self.assertIn('service_schedule', service_record_types)
+        self.assertNotIn('service_case', service_record_types)
+        self.assertNotIn('service_history', service_record_types)
+        self.assertFalse(any(record['summary'] == service_note.content for record in records['serviceRecords']))
+        self.assertTrue(any(record['id'] == service_schedule.id and record['recordType'] == 'service_schedule' for record in records['serviceRecords']))
+        self.assertIn(service_note.id, {note['id'] for note in payload['recentNotes']})
+        quote_numbers = {record['quoteNumber'] for record in records['quoteRecords']}
+        self.assertIn('OP-Q-001', quote_numbers)
+        self.assertIn('OP-Q-SAME-DEPT', quote_numbers)
+        delivery_by_id = {item['id']: item for item in records['deliveryRecords']}
+        self.assertEqual(delivery_by_id[prepaid_schedule.id]['paymentSource'], 'prepayment')
+        self.assertEqual(delivery_by_id[prepaid_schedule.id]['paymentSourceLabel'], '선결제 차감 납품')
+        self.assertEqual(delivery_by_id[prepaid_schedule.id]['paymentStatus'], 'prepayment_deduction')
+        self.assertEqual(delivery_by_id[prepaid_schedule.id]['paymentStatusLabel'], '선결제 차감 납품')
+        self.assertEqual(delivery_by_id[prepaid_schedule.id]['prepaymentAmount'], 60000)
+        self.assertEqual(delivery_by_id[prepaid_schedule.id]['prepaymentUsages'][0]['amount'], 60000)
+        self.assertEqual(delivery_by_id[normal_schedule.id]['paymentSource'], 'normal')
+        self.assertEqual(delivery_by_id[normal_schedule.id]['paymentSourceLabel'], '일반 납품')
+        self.assertEqual(delivery_by_id[normal_schedule.id]['paymentStatus'], 'normal')
+        self.assertEqual(delivery_by_id[normal_schedule.id]['paymentStatusLabel'], '일반 납품')
+        self.assertEqual(delivery_by_id[normal_schedule.id]['prepaymentAmount'], 0)
+        self.assertIn('선결제 사용 필드와 PrepaymentUsage 기록이 없습니다.', delivery_by_id[normal_schedule.id]['paymentEvidence'])
+        self.assertEqual(delivery_by_id[sibling_delivery_schedule.id]['customerName'], '운영기록 같은부서 담당자')
+        payer_names = {record['payerName'] for record in records['prepaymentRecords']}
+        self.assertIn('운영입금자', payer_names)
+        self.assertIn('같은부서입금자', payer_names)
+
+        account_response = self.client.get(reverse('reporting:account_detail_summary_api', args=[target.department_id]))
+        self.assertEqual(account_response.status_code, 200)
+        account_payload = account_response.json()
+        self.assertEqual(account_payload['links']['accountDetail'], f'/accounts/{target.department_id}/')
+        self.assertEqual(account_payload['account']['contactCount'], 2)
+        self.assertEqual(account_payload['account']['ledgerScopeLabel'], '부서/연구실 계정 공유 원장')
+        self.assertEqual(account_payload['operationalRecords']['metrics']['deliveryRecords'], 3)
+        self.assertEqual(account_payload['operationalRecords']['metrics']['prepaymentDeliveryRecords'], 1)
+        self.assertEqual(account_payload['operationalRecords']['metrics']['normalDeliveryRecords'], 2)
+        self.assertEqual(account_payload['operationalRecords']['metrics']['quoteRecords'], 2)
+        self.assertEqual(account_payload['operationalRecords']['metrics']['prepaymentRecords'], 2)
+        self.assertEqual(account_payload['operationalRecords']['metrics']['serviceRecords'], 1)
+        self.assertNotIn('service_history', {
+            record['recordType']
+            for record in account_payload['operationalRecords']['serviceRecords']
+        })
+
+    def test_customer_delivery_records_xlsx_export_downloads_department_shared_deliveries(self):
+        from datetime import time, timedelta
+        from decimal import Decimal
+        from io import BytesIO
+        from openpyxl import load_workbook
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, FollowUp, Prepayment, PrepaymentUsage, Schedule
+
+        today = timezone.localdate()
+        target = self._create_customer(self.user, '납품엑셀고객', priority='urgent')
+        sibling = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='납품엑셀 같은부서 담당자',
+            manager='납품엑셀 같은부서 책임',
+            company=target.company,
+            department=target.department,
+            priority='scheduled',
+            pipeline_stage='quote',
+        )
+        other_target = self._create_customer(self.user, '다른납품고객', priority='urgent')
+        prepayment = Prepayment.objects.create(
+            customer=target,
+            company=target.company,
+            amount=Decimal('200000'),
+            balance=Decimal('150000'),
+            payment_date=today - timedelta(days=3),
+            payer_name='엑셀입금자',
+            created_by=self.user,
+        )
+        prepaid_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=today - timedelta(days=2),
+            visit_time=time(10, 0),
+            activity_type='delivery',
+            status='completed',
+            use_prepayment=True,
+            prepayment=prepayment,
+            prepayment_amount=Decimal('50000'),
+            notes='엑셀 선결제 납품',
+        )
+        prepaid_item = DeliveryItem.objects.create(
+            schedule=prepaid_schedule,
+            item_name='엑셀 선결제 품목',
+            quantity=2,
+            unit='EA',
+            unit_price=Decimal('25000'),
+        )
+        PrepaymentUsage.objects.create(
+            prepayment=prepayment,
+            schedule=prepaid_schedule,
+            schedule_item=prepaid_item,
+            product_name='엑셀 선결제 품목',
+            quantity=2,
+            amount=Decimal('50000'),
+            remaining_balance=Decimal('150000'),
+        )
+        normal_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=today - timedelta(days=1),
+            visit_time=time(14, 0),
+            activity_type='delivery',
+            status='completed',
+            notes='엑셀 일반 납품',
+        )
+        DeliveryItem.objects.create(
+            schedule=normal_schedule,
+            item_name='엑셀 일반 품목',
+            quantity=1,
+            unit='EA',
+            unit_price=Decimal('30000'),
+        )
+        sibling_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=sibling,
+            visit_date=today,
+            visit_time=time(13, 0),
+            activity_type='delivery',
+            status='completed',
+            notes='같은 부서 납품',
+        )
+        DeliveryItem.objects.create(
+            schedule=sibling_schedule,
+            item_name='엑셀 같은부서 품목',
+            quantity=1,
+            unit='EA',
+            unit_price=Decimal('40000'),
+        )
+        other_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=other_target,
+            visit_date=today,
+            visit_time=time(15, 0),
+            activity_type='delivery',
+            status='completed',
+        )
+        DeliveryItem.objects.create(
+            schedule=other_schedule,
+            item_name='다른 고객 품목',
+            quantity=1,
+            unit_price=Decimal('99999'),
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_delivery_records_xlsx_export_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response['Content-Type'],
+            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+        self.assertIn('attachment;', response['Content-Disposition'])
+        workbook = load_workbook(BytesIO(response.content), data_only=True)
+        sheet = workbook['납품 기록']
+        rows = list(sheet.iter_rows(values_only=True))
+        self.assertEqual(rows[0][0], '납품일')
+        self.assertEqual(rows[0][8], '결제상태')
+        item_names = {row[10] for row in rows[1:]}
+        self.assertIn('엑셀 선결제 품목', item_names)
+        self.assertIn('엑셀 일반 품목', item_names)
+        self.assertIn('엑셀 같은부서 품목', item_names)
+        self.assertNotIn('다른 고객 품목', item_names)
+        customer_names = {row[2] for row in rows[1:]}
+        self.assertIn('납품엑셀 같은부서 담당자', customer_names)
+        payment_labels = {row[7] for row in rows[1:]}
+        self.assertIn('선결제 차감 납품', payment_labels)
+        self.assertIn('일반 납품', payment_labels)
+        payment_status_labels = {row[8] for row in rows[1:]}
+        self.assertIn('선결제 차감 납품', payment_status_labels)
+        self.assertIn('일반 납품', payment_status_labels)
+        prepaid_row = next(row for row in rows[1:] if row[10] == '엑셀 선결제 품목')
+        normal_row = next(row for row in rows[1:] if row[10] == '엑셀 일반 품목')
+        self.assertEqual(prepaid_row[9], 50000)
+        self.assertIn('PrepaymentUsage 합계=50,000원', prepaid_row[17])
+        self.assertEqual(normal_row[9], 0)
+        self.assertIn('선결제 사용 필드와 PrepaymentUsage 기록이 없습니다.', normal_row[17])
+
+    def test_customer_delivery_records_xlsx_export_blocks_out_of_scope_customer(self):
+        target = self._create_customer(self.other_user, '타사납품엑셀고객')
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_delivery_records_xlsx_export_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_customer_delivery_records_xlsx_export_requires_login(self):
+        target = self._create_customer(self.user, '익명납품엑셀고객')
+
+        response = self.client.get(reverse('reporting:customer_delivery_records_xlsx_export_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/login', response['Location'])
+
+    def test_customer_detail_summary_api_excludes_customer_ai_payload(self):
+        target = self._create_customer(self.user, 'AI제거고객', priority='urgent')
+        profile = self.user.userprofile
+        profile.can_use_ai = True
+        profile.save(update_fields=['can_use_ai'])
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_detail_summary_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertNotIn('aiDepartment', payload)
+        self.assertIn('customer', payload)
+        self.assertIn('recentNotes', payload)
+
+    def test_customer_detail_summary_api_core_section_defers_heavy_sections(self):
+        target = self._create_customer(self.user, '상세코어', priority='urgent')
+        self.client.force_login(self.user)
+        url = reverse('reporting:customer_detail_summary_api', args=[target.id])
+
+        core_response = self.client.get(url, {'sections': 'core'})
+        lazy_response = self.client.get(url, {'sections': 'records,files,ledger'})
+        full_response = self.client.get(url)
+
+        self.assertEqual(core_response.status_code, 200)
+        core_payload = core_response.json()
+        self.assertEqual(core_payload['sections'], ['core'])
+        self.assertEqual(core_payload['customer']['id'], target.id)
+        self.assertEqual(core_payload['metrics']['overdueActions'], 1)
+        self.assertEqual(len(core_payload['overdueActions']), 1)
+        self.assertNotIn('operationalRecords', core_payload)
+        self.assertNotIn('attachments', core_payload)
+        self.assertNotIn('prepaymentSummary', core_payload)
+
+        lazy_payload = lazy_response.json()
+        self.assertEqual(lazy_payload['sections'], ['records', 'files', 'ledger'])
+        self.assertNotIn('customer', lazy_payload)
+        self.assertIn('operationalRecords', lazy_payload)
+        self.assertIn('attachments', lazy_payload)
+        self.assertIn('prepaymentSummary', lazy_payload)
+
+        full_payload = full_response.json()
+        self.assertEqual(full_payload['sections'], ['core', 'records', 'files', 'ledger'])
+        self.assertEqual(full_payload['metrics'], core_payload['metrics'])
+        self.assertEqual(full_payload['attachments'], lazy_payload['attachments'])
+
+    def test_customer_detail_summary_api_counts_all_upcoming_but_lists_first_schedules(self):
+        from datetime import time
+        from reporting.models import Schedule
+
+        target = self._create_customer(self.user, '예정일정다수')
+        schedules = [
+            Schedule.objects.create(
+                user=self.user,
+                company=self.company,
+                followup=target,
+                visit_date=timezone.localdate() + timedelta(days=offset),
+                visit_time=time(9, 0),
+                activity_type='customer_meeting',
+                status='scheduled',
+            )
+            for offset in range(1, 11)
+        ]
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse('reporting:customer_detail_summary_api', args=[target.id]),
+            {'sections': 'core'},
+        )
+
+        payload = response.json()
+        self.assertEqual(payload['metrics']['upcomingSchedules'], 10)
+        self.assertEqual(
+            [schedule['id'] for schedule in payload['upcomingSchedules']],
+            [schedule.id for schedule in schedules[:8]],
+        )
+
+    def test_account_detail_summary_api_includes_management_fields_and_contact_roles(self):
+        from reporting.models import FollowUp
+
+        target = self._create_customer(self.user, '계정관리필드', priority='urgent')
+        target.department.address = '공용 계정 주소'
+        target.department.notes = '공용 계정 메모'
+        target.department.save(update_fields=['address', 'notes'])
+        target.contact_role = FollowUp.CONTACT_ROLE_PI
+        target.save(update_fields=['contact_role'])
+        sibling = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='계정관리필드 세금담당',
+            manager='세금 책임',
+            company=target.company,
+            department=target.department,
+            contact_role=FollowUp.CONTACT_ROLE_TAX_INVOICE,
+            is_active=False,
+            priority='scheduled',
+            pipeline_stage='contact',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:account_detail_summary_api', args=[target.department_id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        account = payload['account']
+        self.assertEqual(account['address'], '공용 계정 주소')
+        self.assertEqual(account['notes'], '공용 계정 메모')
+        self.assertEqual(account['piContactName'], target.customer_name)
+        self.assertEqual(account['contactCount'], 2)
+        self.assertEqual(account['activeContactCount'], 1)
+        self.assertEqual(account['inactiveContactCount'], 1)
+        self.assertEqual(account['href'], f'/accounts/{target.department_id}/')
+        self.assertNotIn('cleanupPreviewHref', account)
+        self.assertTrue(account['management']['canManage'])
+        self.assertEqual(account['management']['accountSubmitUrl'], reverse('reporting:account_update_api', args=[target.department_id]))
+        self.assertEqual(account['management']['contactCreateUrl'], reverse('reporting:account_contact_create_api', args=[target.department_id]))
+        self.assertEqual(payload['links']['accountDetail'], f'/accounts/{target.department_id}/')
+        self.assertNotIn('accountCleanupPreview', payload['links'])
+        self.assertTrue(payload['permissions']['canManageAccount'])
+        self.assertTrue(payload['permissions']['canCreateNote'])
+        self.assertTrue(payload['permissions']['canCreateSchedule'])
+        role_values = {option['value'] for option in account['management']['contactRoles']}
+        self.assertEqual(role_values, {'pi', 'practitioner', 'purchasing', 'tax_invoice'})
+        contacts = {contact['id']: contact for contact in account['contacts']}
+        self.assertEqual(contacts[target.id]['contactRoleLabel'], 'PI')
+        self.assertTrue(contacts[target.id]['isActive'])
+        self.assertEqual(contacts[sibling.id]['contactRoleLabel'], '세금계산서 담당자')
+        self.assertFalse(contacts[sibling.id]['isActive'])
+        self.assertTrue(contacts[sibling.id]['updateUrl'].endswith(f'/contacts/{sibling.id}/update/'))
+
+    def test_empty_department_account_detail_allows_first_contact_creation(self):
+        from reporting.models import Company, Department, FollowUp, History
+
+        company = Company.objects.create(name='빈계정 회사', created_by=self.user)
+        department = Department.objects.create(
+            company=company,
+            name='빈계정 연구실',
+            address='빈 계정 주소',
+            notes='담당자 등록 전 메모',
+            created_by=self.user,
+        )
+        note = History.objects.create(
+            user=self.user,
+            company=self.company,
+            department=department,
+            action_type='customer_meeting',
+            content='담당자 없이 부서에 먼저 남긴 영업노트',
+            next_action='담당자 확인',
+        )
+        self.client.force_login(self.user)
+
+        detail_response = self.client.get(reverse('reporting:account_detail_summary_api', args=[department.id]))
+
+        self.assertEqual(detail_response.status_code, 200)
+        detail_payload = detail_response.json()
+        self.assertTrue(detail_payload['success'])
+        self.assertEqual(detail_payload['customer']['customer'], '담당자 없음')
+        self.assertEqual(detail_payload['customer']['accountId'], department.id)
+        self.assertEqual(detail_payload['account']['contactCount'], 0)
+        self.assertEqual(detail_payload['account']['address'], '빈 계정 주소')
+        self.assertEqual(detail_payload['account']['notes'], '담당자 등록 전 메모')
+        self.assertEqual(detail_payload['metrics']['recentNotes'], 1)
+        self.assertEqual(len(detail_payload['recentNotes']), 1)
+        self.assertEqual(detail_payload['recentNotes'][0]['id'], note.id)
+        self.assertEqual(detail_payload['recentNotes'][0]['customer'], '담당자 미등록')
+        self.assertEqual(detail_payload['recentNotes'][0]['customerHref'], f'/accounts/{department.id}/')
+        self.assertTrue(detail_payload['account']['management']['canManage'])
+        self.assertEqual(
+            detail_payload['account']['management']['contactCreateUrl'],
+            reverse('reporting:account_contact_create_api', args=[department.id]),
+        )
+        self.assertTrue(detail_payload['permissions']['canManageAccount'])
+        self.assertFalse(detail_payload['permissions']['canCreateNote'])
+        self.assertFalse(detail_payload['permissions']['canCreateSchedule'])
+
+        update_response = self.client.post(reverse('reporting:account_update_api', args=[department.id]), {
+            'company': str(company.id),
+            'department_name': '빈계정 연구실 수정',
+            'address': '수정된 빈 계정 주소',
+            'notes': '수정된 담당자 등록 전 메모',
+        })
+        self.assertEqual(update_response.status_code, 200)
+        department.refresh_from_db()
+        self.assertEqual(department.name, '빈계정 연구실 수정')
+        self.assertEqual(department.address, '수정된 빈 계정 주소')
+        self.assertEqual(department.notes, '수정된 담당자 등록 전 메모')
+
+        create_response = self.client.post(reverse('reporting:account_contact_create_api', args=[department.id]), {
+            'customer_name': '첫 담당자',
+            'contact_role': FollowUp.CONTACT_ROLE_PRACTITIONER,
+            'department': str(department.id),
+            'priority': 'scheduled',
+            'status': 'active',
+            'pipeline_stage': 'contact',
+            'phone_number': '010-0000-0000',
+            'email': 'first@example.com',
+            'is_active': 'true',
+        })
+
+        self.assertEqual(create_response.status_code, 200)
+        created = FollowUp.objects.get(id=create_response.json()['followup_id'])
+        self.assertEqual(created.user, self.user)
+        self.assertEqual(created.company, company)
+        self.assertEqual(created.department, department)
+        self.assertEqual(created.customer_name, '첫 담당자')
+        self.assertEqual(create_response.json()['accountHref'], f'/accounts/{department.id}/')
+
+    def test_empty_department_account_detail_allows_same_company_coworker_management(self):
+        from reporting.models import Company, Department, FollowUp
+
+        company = Company.objects.create(name='동료빈계정 회사', created_by=self.coworker)
+        department = Department.objects.create(
+            company=company,
+            name='동료빈계정 연구실',
+            address='동료가 등록한 주소',
+            notes='동료가 등록한 메모',
+            created_by=self.coworker,
+        )
+        self.client.force_login(self.user)
+
+        detail_response = self.client.get(reverse('reporting:account_detail_summary_api', args=[department.id]))
+
+        self.assertEqual(detail_response.status_code, 200)
+        detail_payload = detail_response.json()
+        self.assertTrue(detail_payload['account']['management']['canManage'])
+        self.assertTrue(detail_payload['permissions']['canManageAccount'])
+
+        update_response = self.client.post(reverse('reporting:account_update_api', args=[department.id]), {
+            'company': str(company.id),
+            'department_name': '동료빈계정 연구실 수정',
+            'address': '내가 수정한 주소',
+            'notes': '공동 관리 메모',
+        })
+        self.assertEqual(update_response.status_code, 200)
+        department.refresh_from_db()
+        self.assertEqual(department.name, '동료빈계정 연구실 수정')
+        self.assertEqual(department.address, '내가 수정한 주소')
+        self.assertEqual(department.notes, '공동 관리 메모')
+
+        create_response = self.client.post(reverse('reporting:account_contact_create_api', args=[department.id]), {
+            'customer_name': '공동관리 담당자',
+            'contact_role': FollowUp.CONTACT_ROLE_PRACTITIONER,
+            'department': str(department.id),
+            'status': 'active',
+            'pipeline_stage': 'contact',
+            'is_active': 'true',
+        })
+        self.assertEqual(create_response.status_code, 200)
+        created = FollowUp.objects.get(id=create_response.json()['followup_id'])
+        self.assertEqual(created.user, self.user)
+        self.assertEqual(created.company, company)
+        self.assertEqual(created.department, department)
+
+    def test_empty_department_account_keeps_manager_read_only_and_blocks_other_company(self):
+        from reporting.models import Company, Department
+
+        company = Company.objects.create(name='빈계정 권한 회사', created_by=self.user)
+        department = Department.objects.create(
+            company=company,
+            name='빈계정 권한 연구실',
+            created_by=self.user,
+        )
+
+        self.client.force_login(self.manager)
+        manager_detail = self.client.get(reverse('reporting:account_detail_summary_api', args=[department.id]))
+        self.assertEqual(manager_detail.status_code, 200)
+        manager_payload = manager_detail.json()
+        self.assertFalse(manager_payload['account']['management']['canManage'])
+        self.assertFalse(manager_payload['permissions']['canManageAccount'])
+        self.assertTrue(manager_payload['permissions']['readOnlyMessage'])
+
+        manager_create = self.client.post(reverse('reporting:account_contact_create_api', args=[department.id]), {
+            'customer_name': '차단 담당자',
+            'department': str(department.id),
+        })
+        self.assertEqual(manager_create.status_code, 403)
+
+        self.client.force_login(self.other_user)
+        other_detail = self.client.get(reverse('reporting:account_detail_summary_api', args=[department.id]))
+        self.assertEqual(other_detail.status_code, 403)
+
+    def test_account_update_api_updates_department_info_and_contact_company(self):
+        from reporting.models import Company, Department, FollowUp
+
+        target = self._create_customer(self.user, '계정정보수정', priority='scheduled')
+        next_company = Company.objects.create(name='계정정보수정 새회사', created_by=self.user)
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:account_update_api', args=[target.department_id]), {
+            'company': str(next_company.id),
+            'department_name': '계정정보수정 새연구실',
+            'address': '새 계정 주소',
+            'notes': '새 계정 메모',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        department = Department.objects.get(id=target.department_id)
+        self.assertEqual(department.company, next_company)
+        self.assertEqual(department.name, '계정정보수정 새연구실')
+        self.assertEqual(department.address, '새 계정 주소')
+        self.assertEqual(department.notes, '새 계정 메모')
+        self.assertEqual(FollowUp.objects.get(id=target.id).company, next_company)
+
+    def test_account_contact_api_creates_moves_and_inactivates_contact(self):
+        from reporting.models import Department, FollowUp
+
+        target = self._create_customer(self.user, '담당자관리', priority='urgent')
+        other_department = Department.objects.create(
+            company=target.company,
+            name='담당자관리 이동연구실',
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        create_response = self.client.post(reverse('reporting:account_contact_create_api', args=[target.department_id]), {
+            'customer_name': '구매 담당자',
+            'contact_role': FollowUp.CONTACT_ROLE_PURCHASING,
+            'department': str(target.department_id),
+            'priority': 'scheduled',
+            'status': 'active',
+            'pipeline_stage': 'contact',
+            'phone_number': '010-2222-3333',
+            'email': 'buyer@example.com',
+            'is_active': 'true',
+        })
+
+        self.assertEqual(create_response.status_code, 200)
+        created = FollowUp.objects.get(id=create_response.json()['followup_id'])
+        self.assertEqual(created.department, target.department)
+        self.assertEqual(created.contact_role, FollowUp.CONTACT_ROLE_PURCHASING)
+        self.assertTrue(created.is_active)
+
+        update_response = self.client.post(reverse('reporting:account_contact_update_api', args=[target.department_id, created.id]), {
+            'customer_name': '세금 담당자',
+            'contact_role': FollowUp.CONTACT_ROLE_TAX_INVOICE,
+            'department': str(other_department.id),
+            'priority': 'followup',
+            'status': 'paused',
+            'pipeline_stage': 'quote',
+            'phone_number': '010-4444-5555',
+            'email': 'tax@example.com',
+            'is_active': 'false',
+            'notes': '이동 및 비활성화',
+        })
+
+        self.assertEqual(update_response.status_code, 200)
+        moved = FollowUp.objects.get(id=created.id)
+        self.assertEqual(moved.customer_name, '세금 담당자')
+        self.assertEqual(moved.department, other_department)
+        self.assertEqual(moved.company, other_department.company)
+        self.assertEqual(moved.contact_role, FollowUp.CONTACT_ROLE_TAX_INVOICE)
+        self.assertFalse(moved.is_active)
+        self.assertEqual(moved.priority, 'scheduled')
+        self.assertEqual(moved.status, 'paused')
+        self.assertEqual(moved.pipeline_stage, 'quote')
+
+    def test_account_management_api_blocks_manager(self):
+        target = self._create_customer(self.user, '계정관리권한차단', priority='scheduled')
+        self.client.force_login(self.manager)
+
+        detail_response = self.client.get(reverse('reporting:account_detail_summary_api', args=[target.department_id]))
+        response = self.client.post(reverse('reporting:account_update_api', args=[target.department_id]), {
+            'company': str(target.company_id),
+            'department_name': target.department.name,
+        })
+
+        self.assertEqual(detail_response.status_code, 200)
+        detail_payload = detail_response.json()
+        self.assertFalse(detail_payload['account']['management']['canManage'])
+        self.assertFalse(detail_payload['edit']['canEdit'])
+        self.assertFalse(detail_payload['edit']['canDelete'])
+        self.assertFalse(detail_payload['permissions']['canManageAccount'])
+        self.assertFalse(detail_payload['permissions']['canCreateNote'])
+        self.assertFalse(detail_payload['permissions']['canCreateSchedule'])
+        self.assertTrue(detail_payload['permissions']['readOnlyMessage'])
+        self.assertTrue(all(not contact['canManage'] for contact in detail_payload['account']['contacts']))
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()['success'])
+
+    def test_customer_update_api_updates_customer_for_owner(self):
+        from reporting.models import Company, Department, FollowUp
+
+        target = self._create_customer(self.user, '수정대상', priority='scheduled', stage='potential')
+        next_company = Company.objects.create(name='수정가능 회사', created_by=self.user)
+        next_department = Department.objects.create(
+            company=next_company,
+            name='수정가능 연구실',
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:customer_update_api', args=[target.id]), {
+            'customer_name': '수정완료 담당자',
+            'company': str(next_company.id),
+            'department': str(next_department.id),
+            'priority': 'urgent',
+            'status': 'paused',
+            'pipeline_stage': 'quote',
+            'manager': '수정 책임',
+            'phone_number': '010-1111-2222',
+            'email': 'edited@example.com',
+            'address': '수정 주소',
+            'notes': 'React 상세 수정',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['href'], f'/customers/{target.id}/')
+        updated = FollowUp.objects.get(id=target.id)
+        self.assertEqual(updated.customer_name, '수정완료 담당자')
+        self.assertEqual(updated.company, next_company)
+        self.assertEqual(updated.department, next_department)
+        self.assertEqual(updated.priority, 'scheduled')
+        self.assertEqual(updated.status, 'paused')
+        self.assertEqual(updated.pipeline_stage, 'quote')
+        self.assertTrue(updated.pipeline_manually_set)
+        self.assertEqual(updated.email, 'edited@example.com')
+
+    def test_customer_priority_update_api_is_deprecated(self):
+        from reporting.models import FollowUp
+
+        target = self._create_customer(self.user, '우선순위폐기', priority='scheduled', stage='potential')
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:customer_priority_update', args=[target.id]), {
+            'priority': 'urgent',
+        })
+
+        self.assertEqual(response.status_code, 410)
+        payload = response.json()
+        self.assertFalse(payload['success'])
+        self.assertIn('파이프라인', payload['error'])
+        target.refresh_from_db()
+        self.assertEqual(target.priority, 'scheduled')
+        self.assertEqual(
+            FollowUp.objects.filter(priority__in=['urgent', 'followup'], id=target.id).count(),
+            0,
+        )
+
+    def test_customer_update_api_blocks_manager_and_coworker(self):
+        target = self._create_customer(self.user, '수정권한차단')
+        payload = {
+            'customer_name': '권한없는수정',
+            'company': str(target.company_id),
+            'department': str(target.department_id),
+            'priority': target.priority,
+            'status': target.status,
+            'pipeline_stage': target.pipeline_stage,
+        }
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(reverse('reporting:customer_update_api', args=[target.id]), payload)
+        self.assertEqual(manager_response.status_code, 403)
+        self.assertFalse(manager_response.json()['success'])
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(reverse('reporting:customer_update_api', args=[target.id]), payload)
+        self.assertEqual(coworker_response.status_code, 403)
+        self.assertFalse(coworker_response.json()['success'])
+
+    def test_customer_delete_api_deletes_owner_customer_and_blocks_readonly_users(self):
+        target = self._create_customer(self.user, '삭제대상')
+        blocked = self._create_customer(self.user, '삭제차단대상')
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(reverse('reporting:customer_delete_api', args=[blocked.id]))
+        self.assertEqual(manager_response.status_code, 403)
+        self.assertFalse(manager_response.json()['success'])
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(reverse('reporting:customer_delete_api', args=[blocked.id]))
+        self.assertEqual(coworker_response.status_code, 403)
+        self.assertFalse(coworker_response.json()['success'])
+
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('reporting:customer_delete_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['href'], '/customers/')
+        self.assertFalse(FollowUp.objects.filter(id=target.id).exists())
+        self.assertTrue(FollowUp.objects.filter(id=blocked.id).exists())
+
+    def test_customer_update_api_blocks_other_company_selection(self):
+        from reporting.models import Company, Department
+
+        target = self._create_customer(self.user, '타사업체수정차단')
+        other_company = Company.objects.create(name='타사업체수정 회사', created_by=self.other_user)
+        other_department = Department.objects.create(
+            company=other_company,
+            name='타사업체수정 연구실',
+            created_by=self.other_user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:customer_update_api', args=[target.id]), {
+            'customer_name': '타사변경시도',
+            'company': str(other_company.id),
+            'department': str(other_department.id),
+            'priority': target.priority,
+            'status': target.status,
+            'pipeline_stage': target.pipeline_stage,
+        })
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()['success'])
+
+    def test_customer_detail_summary_api_blocks_other_company_customer(self):
+        target = self._create_customer(self.other_user, '타사상세')
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_detail_summary_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 403)
+
+
+class AutocompleteIndexTests(TestCase):
+    """업체/부서 자동완성 인덱스: 초성 검색, 회사 범위, 순위, 변경 반영"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = UserCompany.objects.create(name='자동완성회사')
+        cls.other_company = UserCompany.objects.create(name='자동완성타사')
+        cls.user = make_user('autocomplete_me', company=cls.company)
+        cls.other_user = make_user('autocomplete_other', company=cls.other_company)
+        cls.admin = make_user('autocomplete_admin', role='admin', company=cls.company)
+        cls.snu = make_department(cls.user, '서울대학교')
+        cls.hospital = make_department(cls.user, '대학병원')
+        cls.other = make_department(cls.other_user, '서울대학교 타사')
+
+    def setUp(self):
+        self.client = Client()
+        clear_local_indexes()
+
+    def _companies(self, user, query):
+        self.client.force_login(user)
+        response = self.client.get(reverse('reporting:company_autocomplete'), {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [item['text'] for item in response.json()['results']]
+
+    def test_company_autocomplete_matches_chosung_and_mixed_query(self):
+        self.assertEqual(self._companies(self.user, 'ㅅㅇㄷ'), ['서울대학교 회사'])
+        self.assertEqual(self._companies(self.user, '서ㅇ대'), ['서울대학교 회사'])
+        self.assertEqual(self._companies(self.user, '서울 대학'), ['서울대학교 회사'])
+
+    def test_company_autocomplete_is_scoped_to_user_company_except_admin(self):
+        self.assertEqual(self._companies(self.user, '서울대'), ['서울대학교 회사'])
+        self.assertEqual(self._companies(self.other_user, '서울대'), ['서울대학교 타사 회사'])
+        self.assertEqual(self._companies(self.admin, '서울대'), ['서울대학교 회사', '서울대학교 타사 회사'])
+
+    def test_company_autocomplete_ranks_prefix_before_substring(self):
+        self.assertEqual(self._companies(self.user, '대학'), ['대학병원 회사', '서울대학교 회사'])
+
+    def test_department_autocomplete_filters_company_and_matches_contacts_by_chosung(self):
+        make_customer(self.user, '연락처', department=self.hospital, manager='김철수교수')
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:department_autocomplete'), {
+            'q': 'ㄱㅊㅅ',
+            'company': self.hospital.company_id,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [{
+            'id': self.hospital.id,
+            'text': '대학병원 회사 - 대학병원 연구실',
+            'company_id': self.hospital.company_id,
+            'company_name': '대학병원 회사',
+            'department_name': '대학병원 연구실',
+        }])
+        response = self.client.get(reverse('reporting:department_autocomplete'), {
+            'q': 'ㄱㅊㅅ',
+            'company': self.snu.company_id,
+        })
+        self.assertEqual(response.json()['results'], [])
+
+    def test_index_is_reused_until_company_changes(self):
+        self.assertEqual([entry.name for entry in search_companies(self.company.id, '서울')], ['서울대학교 회사'])
+        with self.assertNumQueries(0):
+            search_companies(self.company.id, '대학')
+
+        renamed = Company.objects.get(pk=self.snu.company_id)
+        renamed.name = '관악 서울대학교'
+        renamed.save()
+
+        self.assertEqual([entry.name for entry in search_companies(self.company.id, 'ㄱㅇ')], ['관악 서울대학교'])
+
+    def test_changes_only_rebuild_the_owning_tenant_and_admin_scope(self):
+        from reporting.services.autocomplete_index import autocomplete_index_version
+
+        def versions():
+            return [autocomplete_index_version(scope) for scope in (self.company.id, self.other_company.id, None)]
+
+        contact = make_customer(self.user, '버전연락처', department=self.hospital, manager='김버전')
+        before = versions()
+
+        contact.notes = '인덱스와 무관한 메모'
+        contact.save()
+        self.assertEqual(versions(), before)
+
+        contact.manager = '이버전'
+        contact.save()
+        after = versions()
+        self.assertEqual(after[1], before[1])
+        self.assertGreater(after[0], before[0])
+        self.assertGreater(after[2], before[2])
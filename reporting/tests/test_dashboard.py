@@ -0,0 +1,961 @@
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+from reporting.models import DocumentGenerationLog, Schedule, UserCompany
+from reporting.tests.factories import frontend_url, make_user
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 7: 대시보드 smoke 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class DashboardSmokeTests(TestCase):
+    """대시보드 legacy URL 전환 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='대시보드테스트회사')
+        self.user = make_user('dash_user', role='salesman', company=self.company)
+
+    def test_dashboard_returns_200(self):
+        """인증 후 대시보드는 React 대시보드로 이동"""
+        self.client.force_login(self.user)
+        r = self.client.get(reverse('reporting:dashboard'))
+        self.assertEqual(r.status_code, 302)
+        self.assertEqual(r['Location'], frontend_url('dashboard/'))
+
+    def test_dashboard_head_redirects_to_react(self):
+        """HEAD 요청도 템플릿 렌더링 대신 React로 이동"""
+        self.client.force_login(self.user)
+        r = self.client.head(reverse('reporting:dashboard'))
+        self.assertEqual(r.status_code, 302)
+        self.assertEqual(r['Location'], frontend_url('dashboard/'))
+
+    def test_dashboard_unauthenticated_redirects(self):
+        """미인증 대시보드 접근 → 로그인 리다이렉트"""
+        r = self.client.get(reverse('reporting:dashboard'))
+        self.assertIn(r.status_code, [301, 302])
+        self.assertIn('login', r.get('Location', ''))
+
+    def test_dashboard_api_still_returns_key_sections(self):
+        """대시보드 데이터는 React API에서 계속 제공"""
+        self.client.force_login(self.user)
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        self.assertEqual(r.status_code, 200)
+        payload = r.json()
+        self.assertEqual(payload['source'], 'django')
+        self.assertIn('metrics', payload)
+        self.assertEqual(payload['links']['operationalDashboard'], '/dashboard/')
+
+
+class DashboardSummaryApiTests(TestCase):
+    """React 대시보드 읽기 API 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='대시보드API회사')
+        self.other_company = UserCompany.objects.create(name='대시보드API타사회사')
+        self.user = make_user('dash_api_me', role='salesman', company=self.company)
+        self.coworker = make_user('dash_api_coworker', role='salesman', company=self.company)
+        self.manager = make_user('dash_api_manager', role='manager', company=self.company)
+        self.other_user = make_user('dash_api_other', role='salesman', company=self.other_company)
+        self.url = reverse('reporting:dashboard_summary_api')
+
+    def _create_customer(self, owner, name, overdue=True, today_schedule=True):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import Company, Department, FollowUp, History, Schedule
+
+        customer_company = Company.objects.create(name=f'{name} 회사', created_by=owner)
+        department = Department.objects.create(
+            company=customer_company,
+            name=f'{name} 연구실',
+            created_by=owner,
+        )
+        followup = FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name=f'{name} 담당자',
+            company=customer_company,
+            department=department,
+            priority='urgent',
+            pipeline_stage='quote',
+            customer_grade='A',
+            ai_score=82,
+        )
+        if today_schedule:
+            Schedule.objects.create(
+                user=owner,
+                company=owner.userprofile.company,
+                followup=followup,
+                visit_date=timezone.localdate(),
+                visit_time=time(10, 0),
+                status='scheduled',
+                activity_type='customer_meeting',
+                notes='오늘 미팅',
+            )
+        History.objects.create(
+            user=owner,
+            company=owner.userprofile.company,
+            followup=followup,
+            action_type='customer_meeting',
+            content=f'{name} 미팅 기록',
+            next_action='후속 전화',
+            next_action_date=timezone.localdate() - timedelta(days=1) if overdue else timezone.localdate(),
+        )
+        return followup
+
+    def test_dashboard_summary_api_requires_login_json(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_dashboard_summary_api_uses_salesman_own_scope(self):
+        own = self._create_customer(self.user, '내고객')
+        coworker = self._create_customer(self.coworker, '동료고객')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['source'], 'django')
+        self.assertEqual(payload['metrics']['totalCustomers'], 1)
+        priority_ids = {item['id'] for item in payload['priorityCustomers']}
+        self.assertIn(own.id, priority_ids)
+        self.assertNotIn(coworker.id, priority_ids)
+
+    def test_dashboard_summary_api_includes_dashboard_sections(self):
+        followup = self._create_customer(self.user, '요약고객')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['metrics']['todaySchedules'], 1)
+        self.assertEqual(payload['metrics']['overdueActions'], 1)
+        self.assertEqual(payload['today']['items'][0]['customer'], '요약고객 담당자')
+        self.assertEqual(payload['overdueActions'][0]['nextAction'], '후속 전화')
+        self.assertEqual(payload['recentActivities'][0]['customer'], '요약고객 담당자')
+        self.assertTrue(any(item['stage'] == followup.pipeline_stage for item in payload['pipelineSummary']))
+        self.assertEqual(payload['links']['createNote'], '/notes/?create=1')
+
+    def test_dashboard_summary_api_excludes_stale_quote_submission_followups(self):
+        from datetime import time, timedelta
+        from decimal import Decimal
+        from reporting.models import History
+
+        today = timezone.localdate()
+        followup = self._create_customer(
+            self.user,
+            '견적완료',
+            overdue=False,
+            today_schedule=False,
+        )
+        History.objects.filter(followup=followup).update(reviewed_at=timezone.now())
+        stale_history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=followup,
+            action_type='customer_meeting',
+            content='견적서 제출 예정',
+            next_action='견적서 및 비교표 제출',
+            next_action_date=today - timedelta(days=1),
+        )
+        active_history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=followup,
+            action_type='customer_meeting',
+            content='제출된 견적 검토 상황 확인',
+            next_action='견적 검토 여부 확인',
+            next_action_date=today - timedelta(days=1),
+        )
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=followup,
+            visit_date=today,
+            visit_time=time(10, 0),
+            status='scheduled',
+            activity_type='quote',
+            expected_revenue=Decimal('1200000'),
+        )
+        DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='quotation',
+            schedule=quote_schedule,
+            user=self.user,
+            transaction_number='DASH-ST-Q-001',
+            output_format='pdf',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        overdue_ids = {item['id'] for item in payload['overdueActions']}
+        self.assertNotIn(stale_history.id, overdue_ids)
+        self.assertIn(active_history.id, overdue_ids)
+        self.assertEqual(payload['metrics']['overdueActions'], 1)
+
+    def test_quote_submission_evidence_is_resolved_in_three_grouped_queries(self):
+        from datetime import timedelta
+        from reporting.models import History
+        from reporting.views import _history_has_quote_submission_evidence, _quote_submission_evidence_ids
+
+        today = timezone.localdate()
+        followup = self._create_customer(self.user, '견적근거일괄', overdue=False, today_schedule=False)
+        quoted_followup = self._create_customer(self.user, '견적근거기록', overdue=False, today_schedule=False)
+        lone_quote_followup = self._create_customer(self.user, '견적근거단독', overdue=False, today_schedule=False)
+        pending = [
+            History.objects.create(
+                user=self.user,
+                company=self.company,
+                followup=target,
+                action_type=action_type,
+                content='견적 요청',
+                next_action='견적서 발송',
+                next_action_date=today - timedelta(days=1),
+            )
+            for target, action_type in [
+                (followup, 'customer_meeting'),
+                (followup, 'customer_meeting'),
+                (quoted_followup, 'quote'),
+                (lone_quote_followup, 'quote'),
+            ]
+        ]
+        History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=quoted_followup,
+            action_type='quote',
+            content='견적 발송 완료',
+        )
+
+        with self.assertNumQueries(3):
+            evidence_ids = _quote_submission_evidence_ids(pending)
+
+        # 견적 History 자신은 근거가 아니며, 이후 작성된 다른 견적 History 만 근거가 된다.
+        self.assertEqual(evidence_ids, {pending[2].id})
+        self.assertFalse(_history_has_quote_submission_evidence(pending[3]))
+        for history in pending:
+            self.assertEqual(_history_has_quote_submission_evidence(history), history.id in evidence_ids)
+
+    def test_dashboard_summary_api_manager_sees_same_company_only(self):
+        own = self._create_customer(self.user, '회사내고객')
+        coworker = self._create_customer(self.coworker, '회사내동료')
+        other = self._create_customer(self.other_user, '타사고객')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['metrics']['totalCustomers'], 2)
+        priority_ids = {item['id'] for item in payload['priorityCustomers']}
+        self.assertIn(own.id, priority_ids)
+        self.assertIn(coworker.id, priority_ids)
+        self.assertNotIn(other.id, priority_ids)
+        self.assertTrue(payload['scope']['canViewAll'])
+
+    def test_dashboard_summary_api_includes_year_and_quarter_revenue(self):
+        from datetime import date, time
+        from decimal import Decimal
+        from reporting.models import DeliveryItem, Prepayment, Schedule
+
+        today = timezone.localdate()
+        quarter = ((today.month - 1) // 3) + 1
+        quarter_start_month = ((quarter - 1) * 3) + 1
+        followup = self._create_customer(
+            self.user,
+            '매출고객',
+            overdue=False,
+            today_schedule=False,
+        )
+        coworker_followup = self._create_customer(
+            self.coworker,
+            '동료매출',
+            overdue=False,
+            today_schedule=False,
+        )
+
+        def create_delivery(owner, target_followup, visit_date, unit_price):
+            schedule = Schedule.objects.create(
+                user=owner,
+                company=owner.userprofile.company,
+                followup=target_followup,
+                visit_date=visit_date,
+                visit_time=time(11, 0),
+                status='completed',
+                activity_type='delivery',
+            )
+            DeliveryItem.objects.create(
+                schedule=schedule,
+                item_name='납품품목',
+                quantity=1,
+                unit_price=Decimal(str(unit_price)),
+            )
+            return int(Decimal(str(unit_price)) * Decimal('1.1'))
+
+        def create_prepayment(owner, target_followup, payment_date, amount, status='active'):
+            Prepayment.objects.create(
+                created_by=owner,
+                customer=target_followup,
+                department=target_followup.department,
+                company=target_followup.company,
+                amount=Decimal(str(amount)),
+                balance=Decimal(str(amount)),
+                payment_date=payment_date,
+                status=status,
+            )
+            return int(Decimal(str(amount)))
+
+        expected_year = 0
+        expected_quarter = 0
+        expected_month = create_delivery(self.user, followup, today, 100000)
+        expected_year += expected_month
+        expected_quarter += expected_month
+
+        quarter_delivery = create_delivery(
+            self.user,
+            followup,
+            date(today.year, quarter_start_month, 1),
+            200000,
+        )
+        expected_year += quarter_delivery
+        expected_quarter += quarter_delivery
+        if today.month == quarter_start_month:
+            expected_month += quarter_delivery
+
+        if quarter_start_month > 1:
+            expected_year += create_delivery(
+                self.user,
+                followup,
+                date(today.year, 1, 15),
+                300000,
+            )
+
+        create_delivery(self.user, followup, date(today.year - 1, 12, 15), 400000)
+        create_delivery(self.coworker, coworker_followup, today, 500000)
+
+        monthly_prepayment = create_prepayment(self.user, followup, today, 70000)
+        expected_year += monthly_prepayment
+        expected_quarter += monthly_prepayment
+        expected_month += monthly_prepayment
+
+        quarter_prepayment = create_prepayment(
+            self.user,
+            followup,
+            date(today.year, quarter_start_month, 1),
+            80000,
+            status='depleted',
+        )
+        expected_year += quarter_prepayment
+        expected_quarter += quarter_prepayment
+        if today.month == quarter_start_month:
+            expected_month += quarter_prepayment
+
+        create_prepayment(self.user, followup, today, 90000, status='cancelled')
+        create_prepayment(self.user, followup, date(today.year - 1, 12, 15), 100000)
+        create_prepayment(self.coworker, coworker_followup, today, 500000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['metrics']['yearRevenue'], expected_year)
+        self.assertEqual(payload['metrics']['quarterRevenue'], expected_quarter)
+        self.assertEqual(payload['metrics']['monthlyRevenue'], expected_month)
+        self.assertEqual(payload['revenuePeriod']['year'], today.year)
+        self.assertEqual(payload['revenuePeriod']['quarter'], quarter)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 8.5: 대시보드 일정 표시 테스트 (Bug 2 & 3)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class DashboardScheduleDisplayTests(TestCase):
+    """React dashboard API 일정 표시 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='대시보드일정테스트회사')
+        self.salesman = make_user('dash_sched_user', role='salesman', company=self.company)
+        self.client.force_login(self.salesman)
+
+        from reporting.models import Company, Department, FollowUp, Schedule
+        from django.utils import timezone
+        from datetime import timedelta
+        import datetime
+
+        company = Company.objects.create(name='테스트고객사', created_by=self.salesman)
+        dept = Department.objects.create(name='테스트부서', company=company, created_by=self.salesman)
+        followup = FollowUp.objects.create(
+            user=self.salesman, customer_name='테스트담당자',
+            company=company, department=dept,
+        )
+        today = timezone.localdate()
+
+        # 오늘 예정 일정
+        self.today_scheduled = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=today, visit_time=datetime.time(9, 0),
+            activity_type='customer_meeting', status='scheduled',
+        )
+        # 오늘 완료된 일정
+        self.today_completed = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=today, visit_time=datetime.time(14, 0),
+            activity_type='customer_meeting', status='completed',
+        )
+        # 내일 예정 일정
+        self.tomorrow_scheduled = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=today + timedelta(days=1), visit_time=datetime.time(10, 0),
+            activity_type='customer_meeting', status='scheduled',
+        )
+        # 3일 후 완료 일정
+        self.upcoming_completed = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=today + timedelta(days=3), visit_time=datetime.time(11, 0),
+            activity_type='customer_meeting', status='completed',
+        )
+        # 8일 후 (범위 밖) 일정
+        self.out_of_range = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=today + timedelta(days=8), visit_time=datetime.time(9, 0),
+            activity_type='customer_meeting', status='scheduled',
+        )
+        # 어제 일정 (과거 - upcoming에 포함 안 됨)
+        self.yesterday = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=today - timedelta(days=1), visit_time=datetime.time(9, 0),
+            activity_type='customer_meeting', status='scheduled',
+        )
+
+    def test_dashboard_returns_200(self):
+        """대시보드 API 200 응답"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        self.assertEqual(r.status_code, 200)
+
+    def test_today_schedules_includes_scheduled(self):
+        """today.items에 오늘 예정 일정 포함"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        ids = [s['id'] for s in r.json()['today']['items']]
+        self.assertIn(self.today_scheduled.pk, ids,
+                      '오늘 예정 일정이 today.items에 포함되어야 합니다')
+
+    def test_today_schedules_includes_completed(self):
+        """today.items에 오늘 완료된 일정도 포함"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        ids = [s['id'] for s in r.json()['today']['items']]
+        self.assertIn(self.today_completed.pk, ids,
+                      '오늘 완료된 일정도 today.items에 포함되어야 합니다')
+
+    def test_upcoming_includes_tomorrow_scheduled(self):
+        """upcomingSchedules에 내일 예정 일정 포함"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        ids = [s['id'] for s in r.json()['upcomingSchedules']]
+        self.assertIn(self.tomorrow_scheduled.pk, ids,
+                      '내일 예정 일정이 upcomingSchedules에 포함되어야 합니다')
+
+    def test_upcoming_includes_completed_within_range(self):
+        """upcomingSchedules에 이번 주 완료된 일정도 포함"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        ids = [s['id'] for s in r.json()['upcomingSchedules']]
+        self.assertIn(self.upcoming_completed.pk, ids,
+                      '이번 주 완료된 일정도 upcomingSchedules에 포함되어야 합니다')
+
+    def test_upcoming_excludes_out_of_range(self):
+        """upcomingSchedules에 6일 초과 일정은 미포함"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        ids = [s['id'] for s in r.json()['upcomingSchedules']]
+        self.assertNotIn(self.out_of_range.pk, ids,
+                         '6일 초과 일정은 upcomingSchedules에 포함되지 않아야 합니다')
+
+    def test_upcoming_excludes_past_schedules(self):
+        """upcomingSchedules에 과거 일정 미포함"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        ids = [s['id'] for s in r.json()['upcomingSchedules']]
+        self.assertNotIn(self.yesterday.pk, ids,
+                         '어제 일정은 upcomingSchedules에 포함되지 않아야 합니다')
+
+    def test_schedule_count_nonzero_when_schedules_exist(self):
+        """일정이 있을 때 API 일정 지표가 0이 아님"""
+        r = self.client.get(reverse('reporting:dashboard_summary_api'))
+        metrics = r.json()['metrics']
+        self.assertGreater(int(metrics['todaySchedules']) + int(metrics['weeklySchedules']), 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# [재현] 대시보드 통합 검색 API 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class DashboardSearchAPITests(TestCase):
+    """dashboard_search_api 통합 검색 API 테스트"""
+
+    def setUp(self):
+        import datetime
+        self.client = Client()
+        # 자사 (검색 허용 범위)
+        self.company_uc = UserCompany.objects.create(name='검색테스트회사')
+        self.salesman = make_user('ds_salesman', role='salesman', company=self.company_uc)
+        self.client.force_login(self.salesman)
+
+        # 타사 (검색 제외 범위)
+        self.other_uc = UserCompany.objects.create(name='타사회사')
+        self.other_user = make_user('ds_other', role='salesman', company=self.other_uc)
+
+        from reporting.models import Company, Department, FollowUp, Schedule, History, DeliveryItem
+
+        # ── 자사 거래처/연구실/담당자 ──────────────────────────────────────
+        cust = Company.objects.create(name='검색한국대학교', created_by=self.salesman)
+        self.dept = Department.objects.create(name='PCR연구실', company=cust, created_by=self.salesman)
+        self.followup = FollowUp.objects.create(
+            user=self.salesman,
+            customer_name='김연구원',
+            company=cust,
+            department=self.dept,
+            user_company=self.company_uc,
+        )
+
+        # 납품 품목 (DeliveryItem)
+        sched = Schedule.objects.create(
+            user=self.salesman, followup=self.followup,
+            visit_date=datetime.date(2026, 5, 1),
+            visit_time=datetime.time(10, 0),
+            activity_type='delivery', status='completed',
+            notes='PCR 실험 관련 방문',
+        )
+        DeliveryItem.objects.create(
+            schedule=sched,
+            item_name='PCR 시약 키트',
+            quantity=10, unit_price=5000, total_price=50000,
+        )
+        # 활동 내역
+        History.objects.create(
+            user=self.salesman, followup=self.followup,
+            action_type='customer_meeting',
+            content='PCR 장비 데모 진행',
+        )
+
+        # ── 타사 거래처/연구실 (검색 제외 확인용) ──────────────────────────
+        other_cust = Company.objects.create(name='타사학교', created_by=self.other_user)
+        other_dept = Department.objects.create(name='PCR타부서', company=other_cust, created_by=self.other_user)
+        other_fu = FollowUp.objects.create(
+            user=self.other_user,
+            customer_name='박타사',
+            company=other_cust,
+            department=other_dept,
+            user_company=self.other_uc,
+        )
+
+    def _url(self):
+        return reverse('reporting:dashboard_search_api')
+
+    def test_requires_login(self):
+        """비로그인 시 로그인 페이지로 리다이렉트."""
+        self.client.logout()
+        r = self.client.get(self._url(), {'q': 'PCR'})
+        self.assertIn(r.status_code, [302, 401, 403])
+
+    def test_short_query_returns_400(self):
+        """1자 검색어는 400 에러를 반환."""
+        r = self.client.get(self._url(), {'q': 'P'})
+        self.assertEqual(r.status_code, 400)
+        data = r.json()
+        self.assertIn('error', data)
+
+    def test_empty_query_returns_400(self):
+        """빈 검색어는 400 에러를 반환."""
+        r = self.client.get(self._url(), {'q': ''})
+        self.assertEqual(r.status_code, 400)
+
+    def test_keyword_finds_delivery_item(self):
+        """납품 품목명 키워드로 연구실을 찾는다."""
+        r = self.client.get(self._url(), {'q': 'PCR 시약'})
+        self.assertEqual(r.status_code, 200)
+        data = r.json()
+        self.assertTrue(data['success'])
+        dept_names = [d['department_name'] for d in data['departments']]
+        self.assertIn('PCR연구실', dept_names)
+
+    def test_keyword_finds_history_content(self):
+        """활동 내용 키워드로 연구실을 찾는다."""
+        r = self.client.get(self._url(), {'q': 'PCR 장비'})
+        self.assertEqual(r.status_code, 200)
+        data = r.json()
+        self.assertTrue(data['success'])
+        dept_names = [d['department_name'] for d in data['departments']]
+        self.assertIn('PCR연구실', dept_names)
+
+    def test_other_company_excluded(self):
+        """타사 연구실은 검색 결과에 포함되지 않는다."""
+        r = self.client.get(self._url(), {'q': 'PCR타부서'})
+        self.assertEqual(r.status_code, 200)
+        data = r.json()
+        dept_names = [d['department_name'] for d in data['departments']]
+        self.assertNotIn('PCR타부서', dept_names)
+
+    def test_no_match_returns_empty_list(self):
+        """매칭 없으면 빈 리스트 반환."""
+        r = self.client.get(self._url(), {'q': '없는키워드XYZ9999'})
+        self.assertEqual(r.status_code, 200)
+        data = r.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['result_count'], 0)
+        self.assertEqual(data['departments'], [])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 대시보드 매출 드릴다운 ('진짜 매출' 내역) 검증
+# ─────────────────────────────────────────────────────────────────────────────
+
+class RevenueDetailApiTests(TestCase):
+    """대시보드 매출 카드 → 드릴다운 화면의 합계가 상단 숫자와 일치하는지 검증"""
+
+    def setUp(self):
+        from reporting.models import Company, Department, FollowUp
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='매출드릴다운회사')
+        self.user = make_user('revenue_detail_me', role='salesman', company=self.company)
+        customer_company = Company.objects.create(name='매출드릴다운업체', created_by=self.user)
+        self.department = Department.objects.create(
+            company=customer_company, name='매출드릴다운연구실', created_by=self.user,
+        )
+        self.followup = FollowUp.objects.create(
+            user=self.user, user_company=self.company, customer_name='매출드릴다운담당자',
+            company=customer_company, department=self.department, pipeline_stage='won',
+        )
+
+    def test_requires_login(self):
+        response = self.client.get(reverse('reporting:revenue_detail_api'))
+        self.assertEqual(response.status_code, 401)
+
+    def test_excludes_scheduled_delivery_and_includes_completed(self):
+        from datetime import time
+        from reporting.models import DeliveryItem, Schedule
+
+        today = timezone.localdate()
+        completed_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=today, visit_time=time(10, 0),
+            status='completed', activity_type='delivery',
+        )
+        completed_item = DeliveryItem.objects.create(
+            schedule=completed_schedule, item_name='완료납품', quantity=1, unit_price=1000000,
+        )
+        scheduled_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=today, visit_time=time(11, 0),
+            status='scheduled', activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=scheduled_schedule, item_name='예정납품', quantity=1, unit_price=9000000,
+        )
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year'})
+        items_response = self.client.get(reverse('reporting:revenue_detail_items_api'), {'period': 'year'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        item_names = [item['itemName'] for item in items_response.json()['items'] if item['kind'] == 'delivery']
+        self.assertIn('완료납품', item_names)
+        self.assertNotIn('예정납품', item_names)
+        completed_item.refresh_from_db()
+        self.assertEqual(payload['summary']['deliveryTotal'], int(completed_item.total_price))
+
+    def test_includes_prepayment_and_excludes_cancelled(self):
+        from reporting.models import Prepayment
+
+        today = timezone.localdate()
+        active_prepayment = Prepayment.objects.create(
+            customer=self.followup, company=self.followup.company, department=self.department,
+            amount=500000, balance=500000, payment_date=today, created_by=self.user,
+        )
+        Prepayment.objects.create(
+            customer=self.followup, company=self.followup.company, department=self.department,
+            amount=700000, balance=700000, payment_date=today, created_by=self.user, status='cancelled',
+        )
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year'})
+        items_response = self.client.get(reverse('reporting:revenue_detail_items_api'), {'period': 'year'})
+
+        payload = response.json()
+        self.assertEqual(payload['summary']['prepaymentTotal'], int(active_prepayment.amount))
+        prepayment_hrefs = [item['href'] for item in items_response.json()['items'] if item['kind'] == 'prepayment']
+        self.assertEqual(prepayment_hrefs, [f'/prepayments/{active_prepayment.id}/'])
+
+    def test_total_matches_dashboard_summary_metric(self):
+        from datetime import time
+        from reporting.models import DeliveryItem, Prepayment, Schedule
+
+        today = timezone.localdate()
+        schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=today, visit_time=time(10, 0),
+            status='completed', activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule, item_name='매출검증납품', quantity=1, unit_price=1200000,
+        )
+        Prepayment.objects.create(
+            customer=self.followup, company=self.followup.company, department=self.department,
+            amount=300000, balance=300000, payment_date=today, created_by=self.user,
+        )
+
+        self.client.force_login(self.user)
+        dashboard_response = self.client.get(reverse('reporting:dashboard_summary_api'))
+        detail_response = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year'})
+
+        dashboard_year_revenue = dashboard_response.json()['metrics']['yearRevenue']
+        detail_total = detail_response.json()['summary']['total']
+        self.assertEqual(detail_total, dashboard_year_revenue)
+        self.assertGreater(detail_total, 0)
+
+    def test_month_period_total_matches_dashboard_monthly_metric(self):
+        from datetime import time
+        from reporting.models import DeliveryItem, Prepayment, Schedule
+
+        today = timezone.localdate()
+        schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=today, visit_time=time(10, 0),
+            status='completed', activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule, item_name='이번달매출검증', quantity=1, unit_price=400000,
+        )
+        Prepayment.objects.create(
+            customer=self.followup, company=self.followup.company, department=self.department,
+            amount=150000, balance=150000, payment_date=today, created_by=self.user,
+        )
+
+        self.client.force_login(self.user)
+        dashboard_response = self.client.get(reverse('reporting:dashboard_summary_api'))
+        detail_response = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'month'})
+
+        dashboard_monthly_revenue = dashboard_response.json()['metrics']['monthlyRevenue']
+        payload = detail_response.json()
+        self.assertEqual(payload['period']['value'], 'month')
+        self.assertEqual(payload['summary']['total'], dashboard_monthly_revenue)
+        self.assertGreater(payload['summary']['total'], 0)
+
+    def _make_completed_delivery(self, item_name, unit_price, visit_date=None, owner=None):
+        from datetime import time
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = Schedule.objects.create(
+            user=owner or self.user, company=self.company, followup=self.followup,
+            visit_date=visit_date or timezone.localdate(), visit_time=time(10, 0),
+            status='completed', activity_type='delivery',
+        )
+        item = DeliveryItem.objects.create(
+            schedule=schedule, item_name=item_name, quantity=1, unit_price=unit_price,
+        )
+        item.refresh_from_db()
+        return item
+
+    def test_groups_are_aggregated_and_sum_to_summary(self):
+        from reporting.models import Prepayment
+
+        a1 = self._make_completed_delivery('그룹납품A', 100000)
+        a2 = self._make_completed_delivery('그룹납품A', 200000)
+        b = self._make_completed_delivery('그룹납품B', 50000)
+        total_a = int(a1.total_price) + int(a2.total_price)
+        Prepayment.objects.create(
+            customer=self.followup, company=self.followup.company, department=self.department,
+            amount=70000, balance=70000, payment_date=timezone.localdate(), created_by=self.user,
+        )
+
+        self.client.force_login(self.user)
+        account = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year'}).json()
+        product = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year', 'group': 'product'}).json()
+
+        self.assertNotIn('items', account)
+        self.assertEqual(account['grouping']['value'], 'account')
+        self.assertEqual(len(account['groups']), 1)
+        self.assertEqual(account['groups'][0]['key'], str(self.department.id))
+        self.assertEqual(account['groups'][0]['label'], '매출드릴다운업체 / 매출드릴다운연구실')
+        self.assertEqual(account['groups'][0]['itemCount'], 4)
+        self.assertEqual(account['summary']['total'], total_a + int(b.total_price) + 70000)
+
+        self.assertEqual(
+            [(group['key'], group['total'], group['itemCount']) for group in product['groups']],
+            [('item:그룹납품A', total_a, 2), ('prepayment', 70000, 1), ('item:그룹납품B', int(b.total_price), 1)],
+        )
+        self.assertEqual([group['label'] for group in product['groups']], ['그룹납품A', '선결제', '그룹납품B'])
+        self.assertEqual(sum(group['total'] for group in product['groups']), product['summary']['total'])
+
+    def test_product_names_do_not_collide_with_reserved_group_keys(self):
+        from reporting.models import Prepayment
+
+        named_prepayment = self._make_completed_delivery('prepayment', 10000)
+        named_none = self._make_completed_delivery('none', 20000)
+        unnamed = self._make_completed_delivery('', 30000)
+        Prepayment.objects.create(
+            customer=self.followup, company=self.followup.company, department=self.department,
+            amount=70000, balance=70000, payment_date=timezone.localdate(), created_by=self.user,
+        )
+
+        self.client.force_login(self.user)
+        product = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year', 'group': 'product'}).json()
+        self.assertEqual(
+            {group['key']: (group['label'], group['total']) for group in product['groups']},
+            {
+                'item:prepayment': ('prepayment', int(named_prepayment.total_price)),
+                'item:none': ('none', int(named_none.total_price)),
+                'none': ('품목명 미지정', int(unnamed.total_price)),
+                'prepayment': ('선결제', 70000),
+            },
+        )
+
+        url = reverse('reporting:revenue_detail_items_api')
+        for key, expected in (('none', ['']), ('item:none', ['none']), ('prepayment', ['선결제 · 계좌이체'])):
+            page = self.client.get(url, {'period': 'year', 'group': 'product', 'key': key}).json()
+            self.assertEqual([item['itemName'] for item in page['items']], expected, key)
+
+    def test_owner_and_month_groups(self):
+        other = make_user('revenue_detail_other', role='salesman', company=self.company)
+        today = timezone.localdate()
+        mine = self._make_completed_delivery('담당자납품', 10000, visit_date=today.replace(month=1, day=1))
+        theirs = self._make_completed_delivery('담당자납품', 20000, visit_date=today.replace(month=12, day=1), owner=other)
+
+        manager = make_user('revenue_detail_manager', role='manager', company=self.company)
+        self.client.force_login(manager)
+        owner = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year', 'group': 'owner'}).json()
+        month = self.client.get(reverse('reporting:revenue_detail_api'), {'period': 'year', 'group': 'month'}).json()
+
+        self.assertEqual(
+            {group['key']: group['total'] for group in owner['groups']},
+            {str(self.user.id): int(mine.total_price), str(other.id): int(theirs.total_price)},
+        )
+        self.assertEqual(
+            [(group['key'], group['label']) for group in month['groups']],
+            [(f'{today.year}-01', f'{today.year}년 1월'), (f'{today.year}-12', f'{today.year}년 12월')],
+        )
+
+    def test_items_are_cursor_paginated_within_a_group(self):
+        from reporting.models import Prepayment
+
+        today = timezone.localdate()
+        for index in range(5):
+            self._make_completed_delivery(f'커서납품{index}', 1000 * (index + 1), visit_date=today.replace(month=1, day=index + 1))
+        prepayment = Prepayment.objects.create(
+            customer=self.followup, company=self.followup.company, department=self.department,
+            amount=5000, balance=5000, payment_date=today.replace(month=1, day=3), created_by=self.user,
+        )
+        self._make_completed_delivery('다른품목', 9000, visit_date=today.replace(month=1, day=2))
+
+        self.client.force_login(self.user)
+        url = reverse('reporting:revenue_detail_items_api')
+        seen = []
+        cursor = ''
+        for _ in range(5):
+            page = self.client.get(url, {
+                'period': 'year', 'group': 'account', 'key': str(self.department.id), 'limit': 2, 'cursor': cursor,
+            }).json()
+            self.assertLessEqual(len(page['items']), 2)
+            seen.extend(page['items'])
+            cursor = page['nextCursor']
+            if not page['hasMore']:
+                break
+
+        self.assertIsNone(cursor)
+        self.assertEqual(len(seen), 7)
+        self.assertEqual([item['date'] for item in seen], sorted((item['date'] for item in seen), reverse=True))
+        same_day = [item['kind'] for item in seen if item['date'] == prepayment.payment_date.isoformat()]
+        self.assertEqual(same_day, ['delivery', 'prepayment'])
+
+        product_page = self.client.get(url, {'period': 'year', 'group': 'product', 'key': 'item:다른품목'}).json()
+        self.assertEqual([item['itemName'] for item in product_page['items']], ['다른품목'])
+        unprefixed = self.client.get(url, {'period': 'year', 'group': 'product', 'key': '다른품목'})
+        self.assertEqual(unprefixed.status_code, 400)
+        bad_key = self.client.get(url, {'period': 'year', 'group': 'month', 'key': 'not-a-month'})
+        self.assertEqual(bad_key.status_code, 400)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 요약 지표 단일 집계 쿼리 (metrics_query) 검증
+# ─────────────────────────────────────────────────────────────────────────────
+
+class MetricsQueryTests(TestCase):
+    """이름 붙인 조건부 count/sum 이 한 번의 aggregate 로 계산되는지 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        from datetime import timedelta
+        from reporting.models import DeliveryItem
+        from reporting.tests.factories import make_customer, make_schedule
+
+        cls.company = UserCompany.objects.create(name='지표집계회사')
+        cls.manager = make_user('metrics_manager', role='manager', company=cls.company)
+        cls.user = make_user('metrics_salesman', role='salesman', company=cls.company)
+        followup = make_customer(cls.user, '지표집계')
+        today = timezone.localdate()
+        cls.completed = make_schedule(cls.user, followup, status='completed', activity_type='delivery')
+        make_schedule(cls.user, followup, status='scheduled', visit_date=today - timedelta(days=1))
+        make_schedule(cls.user, followup, status='scheduled', visit_date=today + timedelta(days=1))
+        make_schedule(cls.user, followup, status='cancelled')
+        DeliveryItem.objects.create(schedule=cls.completed, item_name='지표품목', quantity=2, unit_price=1000)
+
+    def test_aggregate_metrics_runs_one_query(self):
+        from reporting.services.metrics_query import aggregate_metrics, count_metric, sum_metric
+        from django.db.models import Q
+
+        schedules = Schedule.objects.filter(user=self.user)
+        with self.assertNumQueries(1):
+            metrics = aggregate_metrics(
+                schedules,
+                total=count_metric(),
+                scheduled=count_metric(status='scheduled'),
+                overdue=count_metric(Q(visit_date__lt=timezone.localdate()), status='scheduled'),
+                quantity=sum_metric('delivery_items_set__quantity', status='completed'),
+                empty=sum_metric('delivery_items_set__quantity', status='missing'),
+            )
+
+        self.assertEqual(metrics, {'total': 4, 'scheduled': 2, 'overdue': 1, 'quantity': 2, 'empty': 0})
+
+    def _query_count(self, url_name):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        self.client.force_login(self.manager)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(f'reporting:{url_name}'))
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response.json()
+
+    def test_summary_apis_stay_within_query_budget(self):
+        # 지표마다 count() 를 따로 부르던 때는 각각 11·38·17 쿼리였다.
+        employee_queries, employees = self._query_count('employees_management_api')
+        dashboard_queries, dashboard = self._query_count('dashboard_summary_api')
+        calendar_queries, calendar = self._query_count('schedules_calendar_api')
+
+        self.assertLessEqual(employee_queries, 8)
+        self.assertLessEqual(dashboard_queries, 26)
+        self.assertLessEqual(calendar_queries, 11)
+        self.assertEqual(employees['metrics']['totalEmployees'], 2)
+        self.assertEqual(employees['metrics']['salesmanCount'], 1)
+        self.assertEqual(dashboard['metrics']['todaySchedules'], 1)
+        self.assertEqual(dashboard['metrics']['weeklySchedules'], 2)
+        self.assertEqual(
+            {key: calendar['metrics'][key] for key in (
+                'customerSchedules', 'scheduledSchedules', 'completedSchedules', 'cancelledSchedules', 'overdueSchedules',
+            )},
+            {
+                'customerSchedules': 4,
+                'scheduledSchedules': 2,
+                'completedSchedules': 1,
+                'cancelledSchedules': 1,
+                'overdueSchedules': 1,
+            },
+        )
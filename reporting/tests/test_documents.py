@@ -0,0 +1,857 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+from reporting.models import (
+    DocumentGenerationLog,
+    DocumentTemplate,
+    ScheduleQuoteGroupNote,
+    UserCompany,
+)
+from reporting.tests.factories import make_user, make_customer, make_schedule
+
+
+class DocumentTemplatesReactApiTests(TestCase):
+    """React 서류 템플릿 관리 API 회귀 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = UserCompany.objects.create(name='서류API회사')
+        cls.other_company = UserCompany.objects.create(name='서류API타사회사')
+        cls.admin = make_user('doc-admin', role='admin', company=cls.company)
+        cls.manager = make_user('doc-manager', role='manager', company=cls.company)
+        cls.salesman = make_user('doc-sales', role='salesman', company=cls.company)
+        cls.other_manager = make_user('doc-other-manager', role='manager', company=cls.other_company)
+        cls.list_url = reverse('reporting:document_templates_api')
+        cls.create_url = reverse('reporting:document_template_api_create')
+
+    def setUp(self):
+        self.client = Client()
+
+    def _uploaded_xlsx(self, name='template.xlsx'):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        return SimpleUploadedFile(
+            name,
+            b'fake xlsx content',
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+
+    def _create_template(self, company, name, document_type='quotation', is_default=False, created_by=None):
+        template = DocumentTemplate.objects.create(
+            company=company,
+            document_type=document_type,
+            name=name,
+            description=f'{name} 설명',
+            file=self._uploaded_xlsx(f'{name}.xlsx'),
+            file_type='xlsx',
+            is_default=is_default,
+            created_by=created_by or self.manager,
+        )
+        self.addCleanup(template.file.delete, False)
+        return template
+
+    def _create_schedule(self, owner, name='서류고객', activity_type='quote'):
+        followup = make_customer(owner, name, manager=f'{name} 책임')
+        return make_schedule(
+            owner,
+            followup,
+            visit_time=timezone.now().time(),
+            activity_type=activity_type,
+        )
+
+    def test_document_templates_api_requires_login(self):
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_schedule_document_preview_generate_and_download_are_protected(self):
+        schedule = self._create_schedule(self.manager, name='보호서류', activity_type='quote')
+        self._create_template(self.company, '보호견적서', is_default=True)
+        log = DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='quotation',
+            schedule=schedule,
+            user=self.manager,
+            transaction_number='PROTECT-001',
+            output_format='pdf',
+            file=SimpleUploadedFile('protected-quote.pdf', b'%PDF protected', content_type='application/pdf'),
+            filename='protected-quote.pdf',
+            file_size=14,
+        )
+        self.addCleanup(log.file.delete, False)
+
+        preview_url = reverse('reporting:get_document_template_data', args=['quotation', schedule.id])
+        generate_url = reverse('reporting:generate_document_pdf_format', args=['quotation', schedule.id, 'pdf'])
+        download_url = reverse('reporting:generated_document_download', args=[log.id])
+
+        anonymous_preview = self.client.get(preview_url)
+        anonymous_generate = self.client.post(generate_url)
+        anonymous_download = self.client.get(download_url)
+        self.assertEqual(anonymous_preview.status_code, 302)
+        self.assertIn('/reporting/login/', anonymous_preview['Location'])
+        self.assertEqual(anonymous_generate.status_code, 302)
+        self.assertIn('/reporting/login/', anonymous_generate['Location'])
+        self.assertEqual(anonymous_download.status_code, 302)
+        self.assertIn('/reporting/login/', anonymous_download['Location'])
+
+        self.client.force_login(self.other_manager)
+        other_preview = self.client.get(preview_url)
+        other_generate = self.client.post(generate_url)
+        other_download = self.client.get(download_url)
+        self.assertEqual(other_preview.status_code, 403)
+        self.assertEqual(other_generate.status_code, 403)
+        self.assertEqual(other_download.status_code, 403)
+
+    def test_document_templates_api_lists_same_company_and_summary(self):
+        default_template = self._create_template(self.company, '기본견적서', is_default=True)
+        delivery_template = self._create_template(self.company, '납품서', document_type='delivery_note')
+        self._create_template(self.other_company, '타사견적서', created_by=self.other_manager)
+        self.client.force_login(self.salesman)
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['source'], 'django')
+        self.assertFalse(payload['create']['canCreate'])
+        self.assertEqual({item['id'] for item in payload['templates']}, {default_template.id, delivery_template.id})
+        self.assertNotIn('타사견적서', [item['name'] for item in payload['templates']])
+        quotation_summary = next(item for item in payload['summary']['byType'] if item['type'] == 'quotation')
+        self.assertEqual(quotation_summary['count'], 1)
+        self.assertEqual(quotation_summary['defaultCount'], 1)
+        variable_tokens = {
+            variable['token']
+            for group in payload['templateVariableGroups']
+            for variable in group['variables']
+        }
+        self.assertIn('{{견적기타사항}}', variable_tokens)
+        self.assertIn('{{견적구분}}', variable_tokens)
+        self.assertIn('{{견적명}}', variable_tokens)
+        self.assertIn('{{견적제목}}', variable_tokens)
+        self.assertIn('{{품목1_옵션}}', variable_tokens)
+        self.assertIn('{{품목1_옵션설명}}', variable_tokens)
+        self.assertIn('{{품목1_적요}}', variable_tokens)
+        self.assertIn('{{품목1_기준단가}}', variable_tokens)
+        self.assertIn('{{품목1_할인율}}', variable_tokens)
+        self.assertIn('{{품목1_할인단가}}', variable_tokens)
+        self.assertEqual(payload['links']['djangoList'], reverse('reporting:document_template_list'))
+
+    def test_document_templates_api_includes_recent_generation_logs_scoped_by_company(self):
+        quote_schedule = self._create_schedule(self.manager, name='견적이력', activity_type='quote')
+        delivery_schedule = self._create_schedule(self.manager, name='납품이력', activity_type='delivery')
+        other_schedule = self._create_schedule(self.other_manager, name='타사이력', activity_type='quote')
+        quote_log = DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='quotation',
+            schedule=quote_schedule,
+            user=self.manager,
+            transaction_number='Q-20260511-001',
+            output_format='xlsx',
+        )
+        DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='delivery_note',
+            schedule=delivery_schedule,
+            user=self.manager,
+            transaction_number='D-20260511-001',
+            output_format='pdf',
+        )
+        DocumentGenerationLog.objects.create(
+            company=self.other_company,
+            document_type='quotation',
+            schedule=other_schedule,
+            user=self.other_manager,
+            transaction_number='OTHER-001',
+            output_format='xlsx',
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.get(self.list_url, {'type': 'quotation'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['summary']['generatedToday'], 1)
+        self.assertEqual(payload['summary']['recentGenerationCount'], 1)
+        self.assertEqual([item['id'] for item in payload['recentGenerations']], [quote_log.id])
+        generation = payload['recentGenerations'][0]
+        self.assertEqual(generation['transactionNumber'], 'Q-20260511-001')
+        self.assertEqual(generation['documentTypeLabel'], '견적서')
+        self.assertEqual(generation['outputFormatLabel'], 'Excel')
+        self.assertEqual(generation['createdBy'], self.manager.get_full_name() or self.manager.username)
+        self.assertEqual(generation['customerName'], '견적이력 담당자')
+        self.assertEqual(generation['customerCompany'], '견적이력 회사')
+        self.assertEqual(generation['departmentName'], '견적이력 연구실')
+        self.assertEqual(generation['schedule']['href'], f'/schedules/{quote_schedule.id}/')
+        self.assertEqual(generation['schedule']['djangoHref'], reverse('reporting:schedule_detail', args=[quote_schedule.id]))
+        self.assertNotIn('OTHER-001', [item['transactionNumber'] for item in payload['recentGenerations']])
+
+    def test_document_templates_api_filters_by_document_type(self):
+        quotation = self._create_template(self.company, '견적서')
+        self._create_template(self.company, '거래명세서', document_type='transaction_statement')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.list_url, {'type': 'quotation'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual([item['id'] for item in payload['templates']], [quotation.id])
+        self.assertTrue(payload['create']['canCreate'])
+
+    def test_document_template_create_update_delete_api(self):
+        old_default = self._create_template(self.company, '기존기본', is_default=True)
+        self.client.force_login(self.manager)
+
+        create_response = self.client.post(self.create_url, {
+            'documentType': 'quotation',
+            'name': '신규견적서',
+            'description': 'React 업로드',
+            'isDefault': 'true',
+            'file': self._uploaded_xlsx('new-template.xlsx'),
+        })
+
+        self.assertEqual(create_response.status_code, 200)
+        created_payload = create_response.json()
+        self.assertTrue(created_payload['success'])
+        created = DocumentTemplate.objects.get(pk=created_payload['template']['id'])
+        self.addCleanup(created.file.delete, False)
+        self.assertEqual(created.company, self.company)
+        self.assertEqual(created.created_by, self.manager)
+        self.assertTrue(created.is_default)
+        old_default.refresh_from_db()
+        self.assertFalse(old_default.is_default)
+
+        update_response = self.client.post(
+            reverse('reporting:document_template_api_update', args=[created.id]),
+            {
+                'documentType': 'transaction_statement',
+                'name': '수정거래명세서',
+                'description': '수정 설명',
+                'isDefault': 'false',
+            },
+        )
+
+        self.assertEqual(update_response.status_code, 200)
+        created.refresh_from_db()
+        self.assertEqual(created.document_type, 'transaction_statement')
+        self.assertEqual(created.name, '수정거래명세서')
+        self.assertFalse(created.is_default)
+
+        delete_response = self.client.post(reverse('reporting:document_template_api_delete', args=[created.id]))
+
+        self.assertEqual(delete_response.status_code, 200)
+        created.refresh_from_db()
+        self.assertFalse(created.is_active)
+
+    def test_document_template_api_blocks_salesman_mutations(self):
+        template = self._create_template(self.company, '수정불가')
+        self.client.force_login(self.salesman)
+
+        create_response = self.client.post(self.create_url, {
+            'documentType': 'quotation',
+            'name': '권한없음',
+            'file': self._uploaded_xlsx('blocked.xlsx'),
+        })
+        update_response = self.client.post(
+            reverse('reporting:document_template_api_update', args=[template.id]),
+            {'documentType': 'quotation', 'name': '수정시도'},
+        )
+        delete_response = self.client.post(reverse('reporting:document_template_api_delete', args=[template.id]))
+
+        self.assertEqual(create_response.status_code, 403)
+        self.assertEqual(update_response.status_code, 403)
+        self.assertEqual(delete_response.status_code, 403)
+
+    def test_document_template_api_blocks_other_company(self):
+        other_template = self._create_template(self.other_company, '타사서류', created_by=self.other_manager)
+        self.client.force_login(self.manager)
+
+        update_response = self.client.post(
+            reverse('reporting:document_template_api_update', args=[other_template.id]),
+            {'documentType': 'quotation', 'name': '타사수정'},
+        )
+        toggle_response = self.client.post(reverse('reporting:document_template_api_toggle_default', args=[other_template.id]))
+
+        self.assertEqual(update_response.status_code, 403)
+        self.assertEqual(toggle_response.status_code, 403)
+
+    def test_document_template_toggle_default_api_uses_existing_single_default_rule(self):
+        old_default = self._create_template(self.company, '기존기본', is_default=True)
+        new_template = self._create_template(self.company, '새기본')
+        self.client.force_login(self.salesman)
+
+        response = self.client.post(reverse('reporting:document_template_api_toggle_default', args=[new_template.id]))
+
+        self.assertEqual(response.status_code, 200)
+        new_template.refresh_from_db()
+        old_default.refresh_from_db()
+        self.assertTrue(new_template.is_default)
+        self.assertFalse(old_default.is_default)
+
+    def test_document_template_data_includes_quote_discount_and_note_variables(self):
+        from reporting.models import DeliveryItem
+
+        self.manager.first_name = '재현'
+        self.manager.last_name = '안'
+        self.manager.save(update_fields=['first_name', 'last_name'])
+        self._create_template(self.company, '견적기본', is_default=True)
+        schedule = self._create_schedule(self.manager, name='견적변수', activity_type='quote')
+        schedule.notes = '견적 메모'
+        schedule.quote_extra_notes = '전체 견적 기타사항'
+        schedule.save(update_fields=['notes', 'quote_extra_notes'])
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='PCR Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=100000,
+            discount_rate=10,
+            notes='품목 적요',
+            option_description='품목 옵션 설명',
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.get(reverse('reporting:get_document_template_data', args=['quotation', schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        variables = payload['variables']
+        self.assertEqual(variables['실무자'], '안재현')
+        self.assertEqual(variables['영업담당자'], '안재현')
+        self.assertEqual(variables['담당영업'], '안재현')
+        self.assertEqual(variables['메모'], '견적 메모')
+        self.assertEqual(variables['기타사항'], '전체 견적 기타사항')
+        self.assertEqual(variables['견적기타사항'], '전체 견적 기타사항')
+        self.assertEqual(variables['품목1_옵션'], '품목 옵션 설명')
+        self.assertEqual(variables['품목1_옵션설명'], '품목 옵션 설명')
+        self.assertEqual(variables['품목1_적요'], '품목 적요')
+        self.assertEqual(variables['품목1_비고'], '품목 적요')
+        self.assertEqual(variables['품목1_기준단가'], '100,000')
+        self.assertEqual(variables['품목1_할인율'], '10%')
+        self.assertEqual(variables['품목1_할인단가'], '90,000')
+        self.assertEqual(variables['품목1_단가'], '90,000')
+        self.assertEqual(variables['공급가액'], '180,000')
+        self.assertEqual(variables['부가세액'], '18,000')
+        self.assertEqual(variables['총액'], '198,000')
+        self.assertEqual(payload['items'][0]['unitPrice'], 90000)
+        self.assertEqual(payload['items'][0]['baseUnitPrice'], 100000)
+        self.assertEqual(payload['items'][0]['discountUnitPrice'], 90000)
+        self.assertEqual(payload['items'][0]['discountRate'], 10.0)
+        self.assertEqual(payload['items'][0]['notes'], '품목 적요')
+        self.assertEqual(payload['items'][0]['optionDescription'], '품목 옵션 설명')
+
+    def test_document_template_data_hides_quotation_base_unit_price_when_requested(self):
+        from reporting.models import DeliveryItem
+
+        self._create_template(self.company, '견적기본', is_default=True)
+        schedule = self._create_schedule(self.manager, name='기준단가숨김', activity_type='quote')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Hidden Base Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=100000,
+            discount_rate=10,
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.get(
+            reverse('reporting:get_document_template_data', args=['quotation', schedule.id]),
+            {'hide_base_unit_price': '1'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertTrue(payload['hide_base_unit_price'])
+        variables = payload['variables']
+        self.assertEqual(variables['품목1_기준단가'], '')
+        self.assertEqual(variables['품목1_할인단가'], '90,000')
+        self.assertEqual(variables['품목1_단가'], '90,000')
+        self.assertEqual(variables['공급가액'], '180,000')
+        self.assertIsNone(payload['items'][0]['baseUnitPrice'])
+        self.assertTrue(payload['items'][0]['baseUnitPriceHidden'])
+        self.assertEqual(payload['items'][0]['unitPrice'], 90000)
+        self.assertEqual(payload['items'][0]['discountUnitPrice'], 90000)
+
+    def test_document_template_data_uses_billable_unit_price_for_transaction_statement_base_token(self):
+        from reporting.models import DeliveryItem
+
+        self._create_template(self.company, '거래명세서기본', document_type='transaction_statement', is_default=True)
+        schedule = self._create_schedule(self.manager, name='거래기준단가', activity_type='delivery')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Visible Base Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            discount_rate=10,
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.get(
+            reverse('reporting:get_document_template_data', args=['transaction_statement', schedule.id]),
+            {'hide_base_unit_price': '1'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertFalse(payload['hide_base_unit_price'])
+        self.assertEqual(payload['variables']['품목1_기준단가'], '90,000')
+        self.assertEqual(payload['variables']['품목1_단가'], '90,000')
+        self.assertEqual(payload['items'][0]['baseUnitPrice'], 100000)
+        self.assertFalse(payload['items'][0]['baseUnitPriceHidden'])
+
+    def test_document_template_data_normalizes_legacy_reversed_korean_salesperson_name(self):
+        self.manager.first_name = '안'
+        self.manager.last_name = '재현'
+        self.manager.save(update_fields=['first_name', 'last_name'])
+        self._create_template(self.company, '견적담당자', is_default=True)
+        schedule = self._create_schedule(self.manager, name='담당자변수', activity_type='quote')
+        self.client.force_login(self.salesman)
+
+        response = self.client.get(reverse('reporting:get_document_template_data', args=['quotation', schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        variables = response.json()['variables']
+        self.assertEqual(variables['실무자'], '안재현')
+        self.assertEqual(variables['영업담당자'], '안재현')
+        self.assertEqual(variables['담당영업'], '안재현')
+
+    def test_document_template_data_filters_quotation_items_by_quote_group(self):
+        from reporting.models import DeliveryItem
+
+        self._create_template(self.company, '견적구분기본', is_default=True)
+        schedule = self._create_schedule(self.manager, name='견적구분변수', activity_type='quote')
+        ScheduleQuoteGroupNote.objects.create(schedule=schedule, quote_group='보상판매', notes='보상판매 조건')
+        ScheduleQuoteGroupNote.objects.create(schedule=schedule, quote_group='수리', notes='수리 조건')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Trade In Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            quote_group='보상판매',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Repair Service',
+            quantity=1,
+            unit='EA',
+            unit_price=50000,
+            quote_group='수리',
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.get(
+            reverse('reporting:get_document_template_data', args=['quotation', schedule.id]),
+            {'quote_group': '수리'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['quote_group'], '수리')
+        self.assertEqual(payload['quote_group_label'], '수리')
+        self.assertEqual(payload['variables']['견적구분'], '수리')
+        self.assertEqual(payload['variables']['견적제목'], '수리 견적서')
+        self.assertEqual(payload['variables']['견적기타사항'], '수리 조건')
+        self.assertEqual(payload['variables']['기타사항'], '수리 조건')
+        self.assertEqual(payload['item_count'], 1)
+        self.assertEqual(payload['items'][0]['name'], 'Repair Service')
+        self.assertEqual(payload['items'][0]['quoteGroup'], '수리')
+        self.assertEqual(payload['variables']['품목1_이름'], 'Repair Service')
+        self.assertNotIn('품목2_이름', payload['variables'])
+
+    def test_document_pdf_layout_helper_sets_a4_fit_to_page(self):
+        import os
+        import tempfile
+        import zipfile
+        from openpyxl import Workbook
+        from reporting.views import _ensure_xlsx_a4_print_layout
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet['A1'] = '견적서'
+        sheet['J40'] = 'A4 자동 맞춤 테스트'
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            temp_path = temp_file.name
+        self.addCleanup(lambda: os.path.exists(temp_path) and os.unlink(temp_path))
+        workbook.save(temp_path)
+
+        changed = _ensure_xlsx_a4_print_layout(temp_path)
+
+        self.assertTrue(changed)
+        with zipfile.ZipFile(temp_path, 'r') as archive:
+            sheet_xml = archive.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertIn('fitToPage="1"', sheet_xml)
+        self.assertIn('paperSize="9"', sheet_xml)
+        self.assertIn('fitToWidth="1"', sheet_xml)
+        self.assertIn('fitToHeight="0"', sheet_xml)
+        self.assertIn('left="0.25"', sheet_xml)
+
+    def test_document_base_unit_price_column_helper_hides_token_column(self):
+        import os
+        import tempfile
+        import zipfile
+        from xml.etree import ElementTree as ET
+        from openpyxl import Workbook
+        from reporting.views import _hide_xlsx_base_unit_price_columns
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet['A1'] = '품목'
+        sheet['B1'] = '기준단가'
+        sheet['C1'] = '단가'
+        sheet['A2'] = '{{품목1_이름}}'
+        sheet['B2'] = '{{품목1_기준단가}}'
+        sheet['C2'] = '{{품목1_단가}}'
+        sheet.column_dimensions['B'].width = 14
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            temp_path = temp_file.name
+        self.addCleanup(lambda: os.path.exists(temp_path) and os.unlink(temp_path))
+        workbook.save(temp_path)
+
+        changed = _hide_xlsx_base_unit_price_columns(temp_path)
+
+        self.assertTrue(changed)
+        with zipfile.ZipFile(temp_path, 'r') as archive:
+            sheet_root = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+        namespace = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+        hidden_cols = [
+            col for col in sheet_root.findall('.//s:cols/s:col', namespace)
+            if col.get('hidden') == '1'
+        ]
+        self.assertEqual([(col.get('min'), col.get('max')) for col in hidden_cols], [('2', '2')])
+
+    def test_document_generate_xlsx_hides_base_unit_price_column_when_requested(self):
+        import io
+        import zipfile
+        from xml.etree import ElementTree as ET
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from openpyxl import Workbook
+        from reporting.models import DeliveryItem
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet['A1'] = '품목'
+        sheet['B1'] = '기준단가'
+        sheet['C1'] = '단가'
+        sheet['A2'] = '{{품목1_이름}}'
+        sheet['B2'] = '{{품목1_기준단가}}'
+        sheet['C2'] = '{{품목1_단가}}'
+        output = io.BytesIO()
+        workbook.save(output)
+        template = DocumentTemplate.objects.create(
+            company=self.company,
+            document_type='quotation',
+            name='열숨김견적서',
+            file=SimpleUploadedFile(
+                'column-hide-quote.xlsx',
+                output.getvalue(),
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            ),
+            file_type='xlsx',
+            is_default=True,
+            created_by=self.manager,
+        )
+        self.addCleanup(template.file.delete, False)
+        schedule = self._create_schedule(self.manager, name='열숨김', activity_type='quote')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Column Hidden Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            discount_rate=10,
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.post(
+            reverse('reporting:generate_document_pdf_format', args=['quotation', schedule.id, 'xlsx']),
+            {'hide_base_unit_price': '1'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        with zipfile.ZipFile(io.BytesIO(response.content), 'r') as archive:
+            sheet_root = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+        namespace = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+        hidden_cols = [
+            col for col in sheet_root.findall('.//s:cols/s:col', namespace)
+            if col.get('hidden') == '1'
+        ]
+        self.assertEqual([(col.get('min'), col.get('max')) for col in hidden_cols], [('2', '2')])
+
+    def test_document_generate_transaction_statement_uses_discount_unit_price_for_base_token(self):
+        import io
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from openpyxl import Workbook, load_workbook
+        from reporting.models import DeliveryItem
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet['A1'] = '품목'
+        sheet['B1'] = '단가'
+        sheet['C1'] = '공급가액'
+        sheet['A2'] = '{{품목1_이름}}'
+        sheet['B2'] = '{{품목1_기준단가}}'
+        sheet['C2'] = '{{품목1_금액}}'
+        output = io.BytesIO()
+        workbook.save(output)
+        template = DocumentTemplate.objects.create(
+            company=self.company,
+            document_type='transaction_statement',
+            name='거래명세서단가',
+            file=SimpleUploadedFile(
+                'transaction-statement-unit-price.xlsx',
+                output.getvalue(),
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            ),
+            file_type='xlsx',
+            is_default=True,
+            created_by=self.manager,
+        )
+        self.addCleanup(template.file.delete, False)
+        schedule = self._create_schedule(self.manager, name='거래명세서단가', activity_type='delivery')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Discounted Statement Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=110000,
+            discount_unit_price=84000,
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.post(
+            reverse('reporting:generate_document_pdf_format', args=['transaction_statement', schedule.id, 'xlsx']),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        generated = load_workbook(io.BytesIO(response.content))
+        generated_sheet = generated.active
+        self.assertEqual(generated_sheet['A2'].value, 'Discounted Statement Kit')
+        self.assertEqual(generated_sheet['B2'].value, '84,000')
+        self.assertEqual(generated_sheet['C2'].value, '168,000')
+
+    def test_document_generate_xlsx_inserts_quote_item_option_rows(self):
+        import io
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from openpyxl import Workbook, load_workbook
+        from reporting.models import DeliveryItem
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet['A1'] = '품목코드'
+        sheet['B1'] = '품목명(규격)'
+        sheet['C1'] = '수량'
+        sheet['D1'] = '단가'
+        sheet['E1'] = '적요'
+        sheet['A2'] = '{{품목1_이름}}'
+        sheet['B2'] = '{{품목1_설명}}'
+        sheet['C2'] = '{{품목1_수량}}'
+        sheet['D2'] = '{{품목1_단가}}'
+        sheet['E2'] = '{{품목1_적요}}'
+        sheet['A3'] = '{{품목2_이름}}'
+        sheet['B3'] = '{{품목2_설명}}'
+        sheet['C3'] = '{{품목2_수량}}'
+        sheet['D3'] = '{{품목2_단가}}'
+        sheet['E3'] = '{{품목2_적요}}'
+        sheet['A4'] = '합계'
+        output = io.BytesIO()
+        workbook.save(output)
+        template = DocumentTemplate.objects.create(
+            company=self.company,
+            document_type='quotation',
+            name='옵션행견적서',
+            file=SimpleUploadedFile(
+                'quote-option-row.xlsx',
+                output.getvalue(),
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            ),
+            file_type='xlsx',
+            is_default=True,
+            created_by=self.manager,
+        )
+        self.addCleanup(template.file.delete, False)
+        schedule = self._create_schedule(self.manager, name='옵션행견적', activity_type='quote')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Option Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            notes='적요 A',
+            option_description='옵션 A 포함, 설치 조건 별도',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Plain Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=50000,
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.post(
+            reverse('reporting:generate_document_pdf_format', args=['quotation', schedule.id, 'xlsx']),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        generated = load_workbook(io.BytesIO(response.content))
+        generated_sheet = generated.active
+        self.assertEqual(generated_sheet['A2'].value, 'Option Kit')
+        self.assertEqual(generated_sheet['E2'].value, '적요 A')
+        self.assertEqual(generated_sheet['B3'].value, '옵션: 옵션 A 포함, 설치 조건 별도')
+        self.assertIn('B3:E3', [str(merge_range) for merge_range in generated_sheet.merged_cells.ranges])
+        self.assertEqual(generated_sheet['A4'].value, 'Plain Kit')
+        self.assertEqual(generated_sheet['A5'].value, '합계')
+
+    def test_document_generate_xlsx_replaces_quote_item_option_variables(self):
+        import io
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from openpyxl import Workbook, load_workbook
+        from reporting.models import DeliveryItem
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet['A1'] = '{{품목1_이름}}'
+        sheet['B1'] = '{{품목1_옵션설명}}'
+        output = io.BytesIO()
+        workbook.save(output)
+        template = DocumentTemplate.objects.create(
+            company=self.company,
+            document_type='quotation',
+            name='옵션견적서',
+            file=SimpleUploadedFile(
+                'quote-option.xlsx',
+                output.getvalue(),
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            ),
+            file_type='xlsx',
+            is_default=True,
+            created_by=self.manager,
+        )
+        self.addCleanup(template.file.delete, False)
+        schedule = self._create_schedule(self.manager, name='옵션견적', activity_type='quote')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Option Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            option_description='옵션 A 포함, 설치 조건 별도',
+        )
+        self.client.force_login(self.salesman)
+
+        response = self.client.post(
+            reverse('reporting:generate_document_pdf_format', args=['quotation', schedule.id, 'xlsx']),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        generated = load_workbook(io.BytesIO(response.content))
+        generated_sheet = generated.active
+        self.assertEqual(generated_sheet['A1'].value, 'Option Kit')
+        self.assertEqual(generated_sheet['B1'].value, '옵션 A 포함, 설치 조건 별도')
+
+    def test_document_item_note_layout_helper_wraps_and_expands_note_rows(self):
+        import os
+        import tempfile
+        import zipfile
+        from xml.etree import ElementTree as ET
+        from openpyxl import Workbook
+        from reporting.views import _expand_xlsx_item_note_rows
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.column_dimensions['B'].width = 12
+        sheet['B5'] = '{{품목1_적요}}'
+        long_note = (
+            '내부 세척 및 오염 제거 후 정상 볼륨 확인. '
+            '오링 마모가 심해 교체가 필요하며 수리 진행 여부 회신 요청.'
+        )
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            temp_path = temp_file.name
+        self.addCleanup(lambda: os.path.exists(temp_path) and os.unlink(temp_path))
+        workbook.save(temp_path)
+
+        changed = _expand_xlsx_item_note_rows(temp_path, {'품목1_적요': long_note})
+
+        self.assertTrue(changed)
+        with zipfile.ZipFile(temp_path, 'r') as archive:
+            styles_xml = archive.read('xl/styles.xml').decode('utf-8')
+            sheet_root = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+        namespace = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+        row = sheet_root.find(".//s:row[@r='5']", namespace)
+        cell = sheet_root.find(".//s:c[@r='B5']", namespace)
+        self.assertIsNotNone(row)
+        self.assertIsNotNone(cell)
+        self.assertEqual(row.get('customHeight'), '1')
+        self.assertGreater(float(row.get('ht')), 15.0)
+        self.assertNotEqual(cell.get('s'), '0')
+        self.assertIn('wrapText="1"', styles_xml)
+
+    def test_document_template_text_layout_helper_wraps_long_replaced_text(self):
+        import os
+        import tempfile
+        import zipfile
+        from xml.etree import ElementTree as ET
+        from openpyxl import Workbook
+        from reporting.views import _expand_xlsx_template_text_rows
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.column_dimensions['B'].width = 10
+        sheet['B4'] = '{{업체명}}'
+        long_company_name = '아주 긴 학교명 및 산학협력단 공동연구센터 세포분석실'
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            temp_path = temp_file.name
+        self.addCleanup(lambda: os.path.exists(temp_path) and os.unlink(temp_path))
+        workbook.save(temp_path)
+
+        changed = _expand_xlsx_template_text_rows(temp_path, {'업체명': long_company_name})
+
+        self.assertTrue(changed)
+        with zipfile.ZipFile(temp_path, 'r') as archive:
+            styles_xml = archive.read('xl/styles.xml').decode('utf-8')
+            sheet_root = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+
+        namespace = {'s': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+        row = sheet_root.find(".//s:row[@r='4']", namespace)
+        cell = sheet_root.find(".//s:c[@r='B4']", namespace)
+        self.assertIsNotNone(row)
+        self.assertIsNotNone(cell)
+        self.assertEqual(row.get('customHeight'), '1')
+        self.assertGreater(float(row.get('ht')), 15.0)
+        self.assertNotEqual(cell.get('s'), '0')
+        self.assertIn('wrapText="1"', styles_xml)
+
+    def test_document_bold_strip_helper_removes_bold_styles(self):
+        import os
+        import tempfile
+        import zipfile
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+        from reporting.views import _strip_xlsx_bold_formatting
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet['A1'] = '견적서'
+        sheet['A1'].font = Font(bold=True)
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+            temp_path = temp_file.name
+        self.addCleanup(lambda: os.path.exists(temp_path) and os.unlink(temp_path))
+        workbook.save(temp_path)
+
+        changed = _strip_xlsx_bold_formatting(temp_path)
+
+        self.assertTrue(changed)
+        with zipfile.ZipFile(temp_path, 'r') as archive:
+            styles_xml = archive.read('xl/styles.xml').decode('utf-8')
+        self.assertNotIn('<b ', styles_xml)
+        self.assertNotIn('<b/>', styles_xml)
+        self.assertNotIn('<b>', styles_xml)
@@ -0,0 +1,632 @@
+import tempfile
+from datetime import time
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    DocumentTemplate,
+    FollowUp,
+    History,
+    PersonalSchedule,
+    Prepayment,
+    Schedule,
+    UserCompany,
+)
+from reporting.tests.factories import FRONTEND_BASE_URL, frontend_url, make_user
+
+
+class AuthenticationSmoke(TestCase):
+    """인증 기본 smoke 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='TestPass123!',
+        )
+
+    def test_login_page_returns_200(self):
+        """로그인 페이지 접근 가능"""
+        response = self.client.get(reverse('reporting:login'))
+        self.assertEqual(response.status_code, 200)
+
+    def test_unauthenticated_followup_list_redirects(self):
+        """미인증 상태에서 거래처 목록 접근 시 로그인으로 리다이렉트"""
+        response = self.client.get(reverse('reporting:followup_list'))
+        self.assertIn(response.status_code, [302, 301])
+        self.assertIn('/login', response.get('Location', ''))
+
+    def test_login_success(self):
+        """올바른 자격 증명으로 로그인하면 프론트 CRM 대시보드로 이동"""
+        response = self.client.post(
+            reverse('reporting:login'),
+            {'username': 'testuser', 'password': 'TestPass123!'},
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            response['Location'],
+            'https://sales-note-frontend-production.up.railway.app/dashboard/',
+        )
+        self.assertEqual(str(self.client.session.get('_auth_user_id')), str(self.user.id))
+
+    def test_login_page_preserves_next_hidden_field(self):
+        """React 직접 URL에서 온 next 값은 로그인 form POST까지 유지"""
+        response = self.client.get(reverse('reporting:login'), {'next': '/customers/42/'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'name="next"', html=False)
+        self.assertContains(response, 'value="/customers/42/"', html=False)
+
+    def test_login_success_redirects_to_next_react_path(self):
+        """로그인 성공 후 상대 React next 경로로 복귀"""
+        response = self.client.post(
+            reverse('reporting:login'),
+            {
+                'username': 'testuser',
+                'password': 'TestPass123!',
+                'next': '/customers/42/',
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], '/customers/42/')
+        self.assertEqual(str(self.client.session.get('_auth_user_id')), str(self.user.id))
+
+    @override_settings(FRONTEND_PIPELINE_URL=FRONTEND_BASE_URL)
+    def test_login_success_allows_configured_frontend_absolute_next(self):
+        """프론트 운영 도메인의 absolute next URL은 허용"""
+        next_url = frontend_url('customers/?date_from=2026-05-01')
+
+        response = self.client.post(
+            reverse('reporting:login'),
+            {
+                'username': 'testuser',
+                'password': 'TestPass123!',
+                'next': next_url,
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], next_url)
+
+    def test_login_success_rejects_external_next(self):
+        """외부 도메인 next는 Django safe redirect 검증으로 차단"""
+        response = self.client.post(
+            reverse('reporting:login'),
+            {
+                'username': 'testuser',
+                'password': 'TestPass123!',
+                'next': 'https://example.com/steal',
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            response['Location'],
+            'https://sales-note-frontend-production.up.railway.app/dashboard/',
+        )
+
+    def test_login_fail_wrong_password(self):
+        """잘못된 비밀번호로 로그인 실패"""
+        response = self.client.post(
+            reverse('reporting:login'),
+            {'username': 'testuser', 'password': 'wrongpassword'},
+        )
+        self.assertEqual(response.status_code, 200)  # 로그인 페이지 재표시
+
+    def test_followup_list_authenticated(self):
+        """인증 후 거래처 목록은 React 고객 화면으로 이동"""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:followup_list'))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], frontend_url('customers/'))
+
+    def test_opportunity_list_url_removed(self):
+        """별도 영업기회 목록 URL은 제거되어야 함"""
+        self.client.force_login(self.user)
+        response = self.client.get('/reporting/opportunities/')
+        self.assertEqual(response.status_code, 404)
+
+    def test_schedule_list_authenticated(self):
+        """인증 후 일정 목록은 React 일정 화면으로 이동"""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:schedule_list'))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], frontend_url('schedules/'))
+
+    def test_schedule_calendar_authenticated(self):
+        """인증 후 일정 캘린더는 React 캘린더로 이동"""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:schedule_calendar'))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], frontend_url('schedules/calendar/'))
+
+    def test_history_list_authenticated(self):
+        """인증 후 영업 활동 목록은 React 영업노트 화면으로 이동"""
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:history_list'))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], frontend_url('notes/'))
+
+
+class BackendReactFrontendServingTests(TestCase):
+    """Django web service can serve the built React CRM shell directly."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.dist_dir = Path(self.temp_dir.name)
+        (self.dist_dir / 'assets').mkdir()
+        (self.dist_dir / 'index.html').write_text(
+            '<!doctype html><div id="root"></div><script type="module" src="/assets/app.js"></script>',
+            encoding='utf-8',
+        )
+        (self.dist_dir / 'assets' / 'app.js').write_text('console.log("crm");', encoding='utf-8')
+        self.override = override_settings(FRONTEND_DIST_DIR=self.dist_dir)
+        self.override.enable()
+
+    def tearDown(self):
+        self.override.disable()
+        self.temp_dir.cleanup()
+
+    def test_react_route_serves_index(self):
+        response = self.client.get('/dashboard/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('text/html', response['Content-Type'])
+        self.assertIn('no-cache', response['Cache-Control'])
+        self.assertContains(response, '<div id="root"></div>', html=False)
+
+    def test_react_asset_serves_immutable_gzip_static(self):
+        response = self.client.get('/assets/app.js', HTTP_ACCEPT_ENCODING='br, gzip')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('max-age=31536000', response['Cache-Control'])
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertIn('text/javascript', response['Content-Type'])
+
+    def test_react_asset_prefers_precompressed_brotli_and_answers_304(self):
+        import gzip
+
+        (self.dist_dir / 'assets' / 'app.js.br').write_bytes(b'brotli-bytes')
+
+        response = self.client.get('/assets/app.js', HTTP_ACCEPT_ENCODING='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(response.content, b'brotli-bytes')
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"') and etag.endswith('-br"'))
+
+        not_modified = self.client.get('/assets/app.js', HTTP_ACCEPT_ENCODING='gzip, br', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertIn('immutable', not_modified['Cache-Control'])
+
+        gzip_response = self.client.get('/assets/app.js', HTTP_ACCEPT_ENCODING='gzip, br;q=0', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(gzip_response.status_code, 200)
+        self.assertEqual(gzip_response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(gzip_response.content), b'console.log("crm");')
+        self.assertNotEqual(gzip_response['ETag'], etag)
+
+        with patch('sales_project.frontend_views.gzip.compress') as compress:
+            self.client.get('/assets/app.js', HTTP_ACCEPT_ENCODING='gzip')
+        compress.assert_not_called()
+
+    def test_react_index_answers_304_for_matching_etag(self):
+        response = self.client.get('/dashboard/')
+        etag = response['ETag']
+
+        not_modified = self.client.get('/customers/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertIn('no-cache', not_modified['Cache-Control'])
+
+    def test_removed_frontend_routes_stay_removed(self):
+        response = self.client.get('/downloads/')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('text/plain', response['Content-Type'])
+
+        for path in ('/mailbox/', '/business-cards/'):
+            removed_response = self.client.get(path)
+            self.assertEqual(removed_response.status_code, 404, path)
+
+    def test_backend_api_is_not_intercepted_by_react_shell(self):
+        response = self.client.get('/reporting/api/customers/')
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+
+class MediaFileServingTests(TestCase):
+    """/media/ 전용 전송 뷰: Range·ETag·캐시 헤더·프록시 위임·메모리 캐시"""
+
+    def setUp(self):
+        from sales_project import media_views
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.media_root = Path(self.temp_dir.name)
+        (self.media_root / 'generated_documents').mkdir()
+        (self.media_root / 'generated_documents' / 'quote.pdf').write_bytes(b'0123456789')
+        (self.media_root / 'document_templates').mkdir()
+        (self.media_root / 'document_templates' / 'form.xlsx').write_bytes(b'template')
+        self.override = override_settings(MEDIA_ROOT=self.media_root)
+        self.override.enable()
+        media_views._media_cache.clear()
+
+    def tearDown(self):
+        self.override.disable()
+        self.temp_dir.cleanup()
+
+    def test_media_supports_range_etag_and_immutable_cache_headers(self):
+        response = self.client.get('/media/generated_documents/quote.pdf')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), b'0123456789')
+        self.assertIn('immutable', response['Cache-Control'])
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('inline', response['Content-Disposition'])
+        etag = response['ETag']
+
+        partial = self.client.get('/media/generated_documents/quote.pdf', HTTP_RANGE='bytes=3-4')
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(b''.join(partial.streaming_content), b'34')
+
+        not_modified = self.client.get('/media/generated_documents/quote.pdf', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertIn('immutable', not_modified['Cache-Control'])
+
+        template = self.client.get('/media/document_templates/form.xlsx')
+        self.assertEqual(template['Cache-Control'], 'private, no-cache')
+        template.close()
+
+        self.assertEqual(self.client.get('/media/generated_documents/../document_templates/form.xlsx').status_code, 404)
+        self.assertEqual(self.client.get('/media/generated_documents/missing.pdf').status_code, 404)
+
+    def test_media_proxy_handoff_and_memory_cache(self):
+        with override_settings(FILE_DELIVERY_BACKEND='x-accel', FILE_DELIVERY_ACCEL_PREFIX='/protected-media/'):
+            proxied = self.client.get('/media/generated_documents/quote.pdf')
+        self.assertEqual(proxied['X-Accel-Redirect'], '/protected-media/generated_documents/quote.pdf')
+        self.assertEqual(proxied.content, b'')
+
+        with override_settings(MEDIA_MEMORY_CACHE_BYTES=1024):
+            first = self.client.get('/media/generated_documents/quote.pdf')
+            with patch('reporting.services.file_delivery.open', side_effect=AssertionError('disk read')):
+                cached = self.client.get('/media/generated_documents/quote.pdf', HTTP_RANGE='bytes=8-')
+        self.assertEqual(first.content, b'0123456789')
+        self.assertEqual(cached.status_code, 206)
+        self.assertEqual(cached.content, b'89')
+        self.assertEqual(cached['Content-Range'], 'bytes 8-9/10')
+
+
+class CoreCrmLegacyRedirectTests(TestCase):
+    """Core Django template pages should hand users to React during migration."""
+
+    def setUp(self):
+        self.client = Client()
+        self.company_profile = UserCompany.objects.create(name='React전환회사')
+        self.user = make_user('react_redirect_user', role='salesman', company=self.company_profile)
+        self.company = Company.objects.create(name='React전환고객사', created_by=self.user)
+        self.department = Department.objects.create(name='React전환부서', company=self.company, created_by=self.user)
+        self.followup = FollowUp.objects.create(
+            user=self.user,
+            company=self.company,
+            department=self.department,
+            customer_name='React전환담당자',
+        )
+        self.schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company_profile,
+            followup=self.followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(9, 0),
+            activity_type='customer_meeting',
+        )
+        self.history = History.objects.create(
+            user=self.user,
+            company=self.company_profile,
+            followup=self.followup,
+            action_type='customer_meeting',
+            content='React 전환 테스트',
+        )
+        self.prepayment = Prepayment.objects.create(
+            department=self.department,
+            customer=self.followup,
+            company=self.company,
+            amount=100000,
+            balance=80000,
+            payment_date=timezone.localdate(),
+            payment_method='transfer',
+            payer_name='React전환입금자',
+            created_by=self.user,
+        )
+        from reporting.models import Product
+        self.product = Product.objects.create(
+            product_code='REACT-PRODUCT-001',
+            description='React 전환 제품',
+            specification='전환규격',
+            unit='EA',
+            standard_price=1000,
+            created_by=self.user,
+        )
+        self.personal_schedule = PersonalSchedule.objects.create(
+            user=self.user,
+            company=self.company_profile,
+            title='React 개인 일정',
+            content='React 개인 일정 내용',
+            schedule_date=timezone.localdate(),
+            schedule_time=time(10, 0),
+        )
+        self.document_template = DocumentTemplate.objects.create(
+            company=self.company_profile,
+            document_type='quotation',
+            name='React 전환 견적서',
+            file=SimpleUploadedFile(
+                'react-template.xlsx',
+                b'react document template',
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            ),
+            file_type='xlsx',
+            created_by=self.user,
+        )
+        self.addCleanup(self.document_template.file.delete, False)
+        self.client.force_login(self.user)
+
+    def assertReactRedirect(self, url, expected):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response['Location'], frontend_url(expected))
+
+    def test_core_list_page_redirects(self):
+        self.assertReactRedirect(reverse('reporting:dashboard'), 'dashboard/')
+        self.assertReactRedirect(reverse('reporting:followup_list'), 'customers/')
+        self.assertReactRedirect(reverse('reporting:history_list'), 'notes/')
+        self.assertReactRedirect(reverse('reporting:schedule_list'), 'schedules/')
+        self.assertReactRedirect(reverse('reporting:schedule_calendar'), 'schedules/calendar/')
+        self.assertReactRedirect(reverse('reporting:funnel_pipeline'), 'pipeline/')
+        self.assertReactRedirect(reverse('reporting:prepayment_list'), 'prepayments/')
+        self.assertReactRedirect(reverse('reporting:product_list'), 'products/')
+        self.assertReactRedirect(reverse('reporting:profile'), 'profile/')
+        self.assertReactRedirect(reverse('reporting:profile_edit'), 'profile/?edit=1')
+
+    def test_core_detail_page_redirects(self):
+        self.assertReactRedirect(reverse('reporting:followup_detail', args=[self.followup.id]), f'customers/{self.followup.id}/')
+        self.assertReactRedirect(reverse('reporting:customer_detail_report', args=[self.followup.id]), f'customers/{self.followup.id}/')
+        self.assertReactRedirect(reverse('reporting:history_detail', args=[self.history.id]), f'notes/{self.history.id}/')
+        self.assertReactRedirect(reverse('reporting:schedule_detail', args=[self.schedule.id]), f'schedules/{self.schedule.id}/')
+        self.assertReactRedirect(reverse('reporting:prepayment_detail', args=[self.prepayment.id]), f'prepayments/{self.prepayment.id}/')
+        self.assertReactRedirect(reverse('reporting:prepayment_edit', args=[self.prepayment.id]), f'prepayments/{self.prepayment.id}/edit/')
+        self.assertReactRedirect(reverse('reporting:prepayment_delete', args=[self.prepayment.id]), f'prepayments/{self.prepayment.id}/?delete=1')
+        self.assertReactRedirect(reverse('reporting:prepayment_transfer', args=[self.prepayment.id]), f'prepayments/{self.prepayment.id}/?transfer=1')
+        self.assertReactRedirect(reverse('reporting:prepayment_customer', args=[self.followup.id]), f'prepayments/customer/{self.followup.id}/')
+        self.assertReactRedirect(reverse('reporting:history_delete', args=[self.history.id]), f'notes/{self.history.id}/?delete=1')
+        self.assertReactRedirect(reverse('reporting:schedule_delete', args=[self.schedule.id]), f'schedules/{self.schedule.id}/?delete=1')
+        self.assertReactRedirect(
+            reverse('reporting:personal_schedule_detail', args=[self.personal_schedule.id]),
+            f'schedules/calendar/?personal={self.personal_schedule.id}',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:personal_schedule_edit', args=[self.personal_schedule.id]),
+            f'schedules/calendar/?personal={self.personal_schedule.id}&edit=1',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:personal_schedule_delete', args=[self.personal_schedule.id]),
+            f'schedules/calendar/?personal={self.personal_schedule.id}&delete=1',
+        )
+        self.assertReactRedirect(reverse('reporting:document_template_list'), 'documents/')
+        self.assertReactRedirect(
+            reverse('reporting:document_template_edit', args=[self.document_template.id]),
+            f'documents/?template_id={self.document_template.id}&edit=1',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:document_template_delete', args=[self.document_template.id]),
+            f'documents/?template_id={self.document_template.id}&delete=1',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:document_template_toggle_default', args=[self.document_template.id]),
+            f'documents/?template_id={self.document_template.id}',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:product_edit', args=[self.product.id]),
+            f'products/?product={self.product.id}&edit=1',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:product_delete', args=[self.product.id]),
+            f'products/?product={self.product.id}&delete=1',
+        )
+
+    def test_core_create_page_redirects_preserve_relevant_query(self):
+        self.assertReactRedirect(reverse('reporting:followup_create'), 'customers/?create=1')
+        self.assertReactRedirect(
+            f"{reverse('reporting:schedule_create')}?followup={self.followup.id}&date=2026-05-20",
+            f'schedules/?customer={self.followup.id}&date=2026-05-20&create=1',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:history_create_from_schedule', args=[self.schedule.id]),
+            f'notes/?create=1&schedule={self.schedule.id}',
+        )
+        self.assertReactRedirect(reverse('reporting:prepayment_create'), 'prepayments/new/')
+        self.assertReactRedirect(
+            f"{reverse('reporting:personal_schedule_create')}?date=2026-05-20&time=10:30",
+            'schedules/calendar/?date=2026-05-20&time=10%3A30&create=personal',
+        )
+        self.assertReactRedirect(reverse('reporting:document_template_create'), 'documents/?create=1')
+        self.assertReactRedirect(reverse('reporting:product_create'), 'products/?create=1')
+        self.assertReactRedirect(reverse('reporting:product_bulk_create'), 'products/?import=1')
+
+    def test_core_filter_query_is_translated(self):
+        self.assertReactRedirect(
+            f"{reverse('reporting:followup_list')}?pipeline_stage=quote&q=Kim",
+            'customers/?stage=quote&q=Kim',
+        )
+        self.assertReactRedirect(
+            f"{reverse('reporting:prepayment_list')}?search=입금자&status=active&data_filter=all",
+            'prepayments/?q=%EC%9E%85%EA%B8%88%EC%9E%90&status=active&data_filter=all',
+        )
+        self.assertReactRedirect(
+            f"{reverse('reporting:product_list')}?search=PCR&is_active=true&sort=delivery_count",
+            'products/?q=PCR&status=active&sort=deliveryCount',
+        )
+
+    def test_user_management_legacy_routes_redirect_to_react_employees(self):
+        self.assertReactRedirect(
+            f"{reverse('reporting:user_list')}?search=kim&role=salesman",
+            'employees/?q=kim&role=salesman',
+        )
+        self.assertReactRedirect(reverse('reporting:user_create'), 'employees/?create=1')
+        self.assertReactRedirect(
+            reverse('reporting:user_edit', args=[self.user.id]),
+            f'employees/?employee={self.user.id}&edit=1',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:manager_user_list'),
+            'employees/',
+        )
+        self.assertReactRedirect(
+            reverse('reporting:manager_user_edit', args=[self.user.id]),
+            f'employees/?employee={self.user.id}&edit=1',
+        )
+
+    def test_non_get_legacy_create_action_is_not_redirected_to_react(self):
+        response = self.client.post(reverse('reporting:schedule_create'), {
+            'followup': str(self.followup.id),
+            'visit_date': '2026-05-20',
+            'activity_type': 'customer_meeting',
+        })
+        self.assertNotEqual(response.get('Location', ''), frontend_url('schedules/?create=1'))
+
+
+class ReactNavigationApiTests(TestCase):
+    """React navigation API regression tests."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user = make_user('nav-user')
+
+    def test_navigation_api_requires_login_json(self):
+        response = self.client.get(reverse('reporting:navigation_api'))
+
+        self.assertEqual(response.status_code, 401)
+        payload = response.json()
+        self.assertFalse(payload['success'])
+        self.assertEqual(payload['error'], 'login_required')
+
+    def test_navigation_api_excludes_forbidden_menu_entries(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:navigation_api'))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        items_by_id = {item['id']: item for item in payload['items']}
+        self.assertNotIn('analytics', items_by_id)
+        self.assertNotIn('dataCleanup', items_by_id)
+        self.assertNotIn('downloads', items_by_id)
+        self.assertNotIn('mail', items_by_id)
+        self.assertNotIn('businessCards', items_by_id)
+        self.assertNotIn('assets', items_by_id)
+        self.assertNotIn('services', items_by_id)
+        self.assertEqual(items_by_id['demos']['href'], '/demos/')
+        self.assertEqual(items_by_id['demos']['label'], '데모관리')
+        self.assertEqual(items_by_id['receivables']['href'], '/receivables/')
+        self.assertEqual(items_by_id['receivables']['label'], '외상고객')
+        self.assertEqual(items_by_id['pipelineSheet']['href'], '/pipeline-sheet/')
+        self.assertEqual(items_by_id['pipelineSheet']['label'], '파이프라인 시트')
+        self.assertEqual(items_by_id['profile']['href'], '/profile/')
+        self.assertEqual(items_by_id['profile']['label'], '프로필')
+        self.assertNotIn('employees', items_by_id)
+        self.assertNotIn('userAdmin', items_by_id)
+        self.assertFalse(payload['capabilities']['canManageUsers'])
+
+    def test_navigation_api_includes_employee_management_for_manager_only(self):
+        company = UserCompany.objects.create(name='직원관리메뉴회사')
+        manager = make_user('nav-manager', role='manager', company=company)
+        admin = make_user('nav-admin', role='admin', company=company)
+
+        self.client.force_login(manager)
+        manager_response = self.client.get(reverse('reporting:navigation_api'))
+        self.assertEqual(manager_response.status_code, 200)
+        manager_items = {item['id']: item for item in manager_response.json()['items']}
+        self.assertIn('employees', manager_items)
+        self.assertEqual(manager_items['employees']['label'], '직원관리')
+        self.assertEqual(manager_items['employees']['href'], '/employees/')
+        self.assertTrue(manager_response.json()['capabilities']['canManageEmployees'])
+        self.assertNotIn('userAdmin', manager_items)
+        self.assertFalse(manager_response.json()['capabilities']['canManageUsers'])
+
+        self.client.force_login(admin)
+        admin_response = self.client.get(reverse('reporting:navigation_api'))
+        admin_items = {item['id']: item for item in admin_response.json()['items']}
+        self.assertNotIn('employees', admin_items)
+        self.assertTrue(admin_response.json()['capabilities']['canManageEmployees'])
+        self.assertIn('userAdmin', admin_items)
+        self.assertEqual(admin_items['userAdmin']['label'], '사용자관리')
+        self.assertEqual(admin_items['userAdmin']['href'], '/employees/')
+        self.assertTrue(admin_response.json()['capabilities']['canManageUsers'])
+
+    def test_navigation_api_role_menu_differences(self):
+        company = UserCompany.objects.create(name='권한별메뉴회사')
+        salesman = make_user('nav-role-salesman', role='salesman', company=company)
+        manager = make_user('nav-role-manager', role='manager', company=company)
+        admin = make_user('nav-role-admin', role='admin', company=company)
+
+        self.client.force_login(salesman)
+        salesman_payload = self.client.get(reverse('reporting:navigation_api')).json()
+        salesman_ids = {item['id'] for item in salesman_payload['items']}
+        self.assertNotIn('dataCleanup', salesman_ids)
+        self.assertNotIn('downloads', salesman_ids)
+        self.assertIn('demos', salesman_ids)
+        self.assertIn('receivables', salesman_ids)
+        self.assertNotIn('mail', salesman_ids)
+        self.assertNotIn('employees', salesman_ids)
+        self.assertNotIn('userAdmin', salesman_ids)
+        self.assertFalse(salesman_payload['capabilities']['canManageUsers'])
+
+        self.client.force_login(manager)
+        manager_payload = self.client.get(reverse('reporting:navigation_api')).json()
+        manager_ids = {item['id'] for item in manager_payload['items']}
+        self.assertNotIn('dataCleanup', manager_ids)
+        self.assertNotIn('downloads', manager_ids)
+        self.assertIn('demos', manager_ids)
+        self.assertIn('receivables', manager_ids)
+        self.assertIn('employees', manager_ids)
+        self.assertNotIn('mail', manager_ids)
+        self.assertNotIn('userAdmin', manager_ids)
+        self.assertTrue(manager_payload['capabilities']['canManageEmployees'])
+
+        self.client.force_login(admin)
+        admin_payload = self.client.get(reverse('reporting:navigation_api')).json()
+        admin_ids = {item['id'] for item in admin_payload['items']}
+        self.assertNotIn('dataCleanup', admin_ids)
+        self.assertNotIn('downloads', admin_ids)
+        self.assertNotIn('mail', admin_ids)
+        self.assertIn('demos', admin_ids)
+        self.assertIn('receivables', admin_ids)
+        self.assertIn('userAdmin', admin_ids)
+        self.assertNotIn('employees', admin_ids)
+        self.assertTrue(admin_payload['capabilities']['canManageEmployees'])
+        self.assertTrue(admin_payload['capabilities']['canManageUsers'])
+
+
+class RemovedStandaloneMenuRouteTests(TestCase):
+    """Forbidden standalone menu routes should not resolve in Django."""
+
+    def test_removed_backend_menu_routes_return_404(self):
+        self.assertEqual(self.client.get('/reporting/data-cleanup/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/downloads/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/api/downloads/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/api/accounts/10/cleanup-preview/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/mailbox/inbox/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/api/mailbox/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/business-cards/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/api/business-cards/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/gmail/connect/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/imap/connect/').status_code, 404)
+        self.assertEqual(self.client.get('/reporting/api/profile/imap/connect/').status_code, 404)
+
+    def test_removed_account_cleanup_preview_frontend_route_returns_404(self):
+        self.assertEqual(self.client.get('/accounts/10/cleanup-preview/').status_code, 404)
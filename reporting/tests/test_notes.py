@@ -0,0 +1,1553 @@
+import json
+from datetime import time, timedelta
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    FollowUp,
+    History,
+    Schedule,
+    UserCompany,
+)
+from reporting.tests.factories import make_user, make_department, make_customer, make_history
+
+
+class NotesSummaryApiTests(TestCase):
+    """React 영업노트 화면 읽기 API 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = UserCompany.objects.create(name='노트API회사')
+        cls.other_company = UserCompany.objects.create(name='노트API타사회사')
+        cls.user = make_user('notes_api_me', role='salesman', company=cls.company)
+        cls.coworker = make_user('notes_api_coworker', role='salesman', company=cls.company)
+        cls.manager = make_user('notes_api_manager', role='manager', company=cls.company)
+        cls.admin = make_user('notes_api_admin', role='admin', company=cls.company)
+        cls.other_user = make_user('notes_api_other', role='salesman', company=cls.other_company)
+        cls.other_manager = make_user('notes_api_other_manager', role='manager', company=cls.other_company)
+        cls.url = reverse('reporting:notes_summary_api')
+        cls.create_url = reverse('reporting:notes_create_api')
+
+    def setUp(self):
+        self.client = Client()
+
+    def _create_note(
+        self,
+        owner,
+        name,
+        action_type='customer_meeting',
+        content='고객 상담 기록',
+        next_action='후속 연락',
+        next_action_date=None,
+        reviewed=False,
+    ):
+        followup = make_customer(owner, name, manager=f'{name} 책임', priority='urgent', pipeline_stage='quote')
+        history = make_history(
+            owner,
+            followup,
+            action_type=action_type,
+            content=content,
+            next_action=next_action,
+            next_action_date=next_action_date or timezone.localdate() - timedelta(days=1),
+            reviewed_at=timezone.now() if reviewed else None,
+            reviewer=self.manager if reviewed else None,
+        )
+        return history
+
+    def _create_department_only(self, owner, name):
+        return make_department(owner, name)
+
+    def test_notes_summary_api_requires_login_json(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_notes_summary_api_uses_salesman_own_scope(self):
+        own = self._create_note(self.user, '내노트')
+        coworker = self._create_note(self.coworker, '동료노트')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['notes']}
+        self.assertIn(own.id, ids)
+        self.assertNotIn(coworker.id, ids)
+        self.assertEqual(payload['metrics']['totalNotes'], 1)
+        note = payload['notes'][0]
+        self.assertFalse(payload['scope']['canReview'])
+        self.assertFalse(note['canReview'])
+        self.assertEqual(note['reviewToggleHref'], '')
+        self.assertEqual(note['href'], f'/notes/{own.id}/')
+        self.assertIn(f'/reporting/histories/{own.id}/', note['djangoHref'])
+
+    def test_notes_summary_api_filters_search_owner_action_review_and_next_action(self):
+        target = self._create_note(
+            self.user,
+            'PCR핵심',
+            action_type='quote',
+            content='PCR 견적 후속 필요',
+            reviewed=False,
+        )
+        self._create_note(self.user, 'PCR완료', action_type='quote', content='PCR 견적 완료', reviewed=True)
+        self._create_note(self.user, '서비스', action_type='service', content='PCR 서비스', reviewed=False)
+        self._create_note(self.coworker, 'PCR동료', action_type='quote', content='PCR 동료 건', reviewed=False)
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url, {
+            'q': 'PCR',
+            'owner': str(self.user.id),
+            'actionType': 'quote',
+            'review': 'unreviewed',
+            'nextAction': 'overdue',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = [item['id'] for item in payload['notes']]
+        self.assertEqual(ids, [target.id])
+        self.assertEqual(payload['filters']['q'], 'PCR')
+        self.assertTrue(any(option['value'] == 'quote' for option in payload['options']['actionTypes']))
+        self.assertEqual(payload['metrics']['filteredNotes'], 1)
+
+    def test_notes_summary_api_defaults_to_recent_one_month_range(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from reporting.models import History
+
+        recent = self._create_note(self.user, '최근노트')
+        old = self._create_note(self.user, '오래된노트')
+        old_created_at = timezone.now() - timedelta(days=45)
+        History.objects.filter(pk=old.id).update(created_at=old_created_at)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['notes']}
+        self.assertIn(recent.id, ids)
+        self.assertNotIn(old.id, ids)
+        self.assertEqual(payload['filters']['dateTo'], timezone.localdate().isoformat())
+
+    def test_notes_summary_api_searches_department_contact_names(self):
+        from reporting.models import FollowUp, History
+
+        department = self._create_department_only(self.user, '부서메모검색')
+        contact = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='홍길동',
+            manager='검색 책임',
+            company=department.company,
+            department=department,
+            priority='normal',
+            pipeline_stage='potential',
+        )
+        note = History.objects.create(
+            user=self.user,
+            company=self.company,
+            department=department,
+            action_type='customer_meeting',
+            content='고객 없는 부서에 남긴 방문 메모',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url, {'q': contact.customer_name})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual([item['id'] for item in payload['notes']], [note.id])
+
+    def test_notes_summary_api_manager_sees_same_company_only(self):
+        own = self._create_note(self.user, '회사내노트')
+        coworker = self._create_note(self.coworker, '회사내동료노트')
+        other = self._create_note(self.other_user, '타사노트')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['notes']}
+        self.assertIn(own.id, ids)
+        self.assertIn(coworker.id, ids)
+        self.assertNotIn(other.id, ids)
+        self.assertEqual(payload['metrics']['totalNotes'], 2)
+        self.assertTrue(payload['scope']['canViewAll'])
+
+    def test_notes_summary_api_exposes_review_metadata_for_manager(self):
+        from reporting.models import History
+
+        target = self._create_note(
+            self.user,
+            '검토대상',
+            action_type='customer_meeting',
+            content='검토가 필요한 고객 미팅',
+            reviewed=False,
+        )
+        History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            parent_history=target,
+            action_type='memo',
+            content='관리자 확인 메모',
+            created_by=self.manager,
+        )
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url, {'owner': str(self.user.id)})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        note = next(item for item in payload['notes'] if item['id'] == target.id)
+        self.assertTrue(payload['scope']['canReview'])
+        self.assertTrue(note['canReview'])
+        self.assertIn(f'/reporting/histories/{target.id}/toggle-reviewed/', note['reviewToggleHref'])
+        self.assertIsNone(note['reviewedAt'])
+        self.assertEqual(note['reviewer'], '')
+        self.assertEqual(note['replyCount'], 1)
+        self.assertEqual(note['fileCount'], 0)
+
+    def test_notes_summary_api_does_not_expose_review_action_for_admin(self):
+        target = self._create_note(
+            self.user,
+            '어드민검토제외',
+            action_type='customer_meeting',
+            content='회사 매니저만 검토 처리 가능',
+            reviewed=False,
+        )
+        self.client.force_login(self.admin)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        note = next(item for item in payload['notes'] if item['id'] == target.id)
+        self.assertFalse(payload['scope']['canReview'])
+        self.assertFalse(note['canReview'])
+        self.assertEqual(note['reviewToggleHref'], '')
+
+    def test_notes_feed_api_pages_full_history_with_cursor(self):
+        notes = [self._create_note(self.user, f'피드{index}') for index in range(5)]
+        self._create_note(self.coworker, '피드동료')
+        self.client.force_login(self.user)
+        feed_url = reverse('reporting:notes_feed_api')
+
+        seen = []
+        cursor = ''
+        for _page in range(3):
+            response = self.client.get(feed_url, {'limit': 2, 'cursor': cursor})
+            self.assertEqual(response.status_code, 200)
+            payload = response.json()
+            seen.extend(item['id'] for item in payload['notes'])
+            cursor = payload['nextCursor']
+            if not payload['hasMore']:
+                break
+
+        self.assertIsNone(cursor)
+        self.assertEqual(seen, [note.id for note in reversed(notes)])
+        row = self.client.get(feed_url, {'limit': 1}).json()['notes'][0]
+        self.assertEqual(row['detailUrl'], reverse('reporting:notes_detail_api', args=[notes[-1].id]))
+        self.assertNotIn('items', row)
+
+    def test_notes_feed_api_defaults_to_full_history(self):
+        recent = self._create_note(self.user, '최근피드')
+        old = self._create_note(self.user, '오래된피드')
+        History.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=400))
+        self.client.force_login(self.user)
+        feed_url = reverse('reporting:notes_feed_api')
+
+        feed_ids = [item['id'] for item in self.client.get(feed_url).json()['notes']]
+        month_ids = [
+            item['id']
+            for item in self.client.get(feed_url, {'dateFrom': (timezone.localdate() - timedelta(days=30)).isoformat()}).json()['notes']
+        ]
+
+        self.assertEqual(feed_ids, [recent.id, old.id])
+        self.assertEqual(month_ids, [recent.id])
+
+    def test_notes_metrics_and_create_config_are_separate_endpoints(self):
+        self._create_note(self.user, '지표노트', action_type='quote', reviewed=False)
+        self.client.force_login(self.user)
+
+        metrics = self.client.get(reverse('reporting:notes_metrics_api')).json()
+        self.assertEqual(metrics['metrics']['totalNotes'], 1)
+        self.assertEqual(metrics['metrics']['unreviewedNotes'], 1)
+        self.assertEqual(metrics['metrics']['overdueActions'], 1)
+        self.assertEqual(metrics['metrics'], self.client.get(self.url).json()['metrics'])
+
+        create_config = self.client.get(reverse('reporting:notes_create_config_api')).json()['create']
+        self.assertTrue(create_config['canCreate'])
+        self.assertEqual(create_config['submitUrl'], self.create_url)
+
+    def test_notes_summary_api_includes_react_create_options_for_salesman(self):
+        target = self._create_note(self.user, '작성대상')
+        department_only = self._create_department_only(self.user, '고객없는작성대상')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['links']['createNote'], '/notes/?create=1')
+        self.assertTrue(payload['create']['canCreate'])
+        self.assertEqual(payload['create']['submitUrl'], self.create_url)
+        customer_ids = {item['id'] for item in payload['create']['customers']}
+        department_ids = {item['id'] for item in payload['create']['departments']}
+        self.assertIn(target.followup_id, customer_ids)
+        self.assertIn(target.followup.department_id, department_ids)
+        self.assertIn(department_only.id, department_ids)
+        self.assertTrue(any(item['value'] == 'customer_meeting' for item in payload['create']['actionTypes']))
+        self.assertFalse(any(item['value'] == 'memo' for item in payload['create']['actionTypes']))
+
+    def test_notes_summary_api_department_create_options_search_contact_names(self):
+        from reporting.models import FollowUp
+
+        target = self._create_note(self.user, '부서검색대상')
+        FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='홍연구원',
+            manager='김책임교수',
+            email='researcher@example.com',
+            phone_number='010-1234-5678',
+            company=target.followup.company,
+            department=target.followup.department,
+            priority='scheduled',
+            pipeline_stage='potential',
+        )
+        FollowUp.objects.create(
+            user=self.coworker,
+            user_company=self.company,
+            customer_name='동료전용연구원',
+            company=target.followup.company,
+            department=target.followup.department,
+            priority='scheduled',
+            pipeline_stage='potential',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        department_option = next(
+            item for item in payload['create']['departments']
+            if item['id'] == target.followup.department_id
+        )
+        self.assertIn('홍연구원', department_option['searchText'])
+        self.assertIn('김책임교수', department_option['searchText'])
+        self.assertIn('researcher@example.com', department_option['searchText'])
+        self.assertIn('010-1234-5678', department_option['searchText'])
+        self.assertNotIn('동료전용연구원', department_option['searchText'])
+
+    def test_notes_summary_api_preloads_more_than_legacy_department_select_limit(self):
+        customer_company = Company.objects.create(name='대량부서선택회사', created_by=self.user)
+        target_department = None
+        for index in range(205):
+            department = Department.objects.create(
+                company=customer_company,
+                name=f'연구실 {index:03d}',
+                created_by=self.user,
+            )
+            if index == 204:
+                target_department = department
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        department_ids = {item['id'] for item in payload['create']['departments']}
+        self.assertGreater(len(payload['create']['departments']), 180)
+        self.assertIn(target_department.id, department_ids)
+
+    def test_notes_summary_api_includes_schedule_create_options_without_overdue_filter(self):
+        from datetime import time, timedelta
+        from reporting.models import DeliveryItem, Schedule
+
+        target = self._create_note(self.user, '일정옵션')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            visit_date=timezone.localdate() + timedelta(days=2),
+            visit_time=time(14, 0),
+            activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='PCR kit',
+            quantity=2,
+            unit='EA',
+            unit_price=1000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        schedule_option = next(item for item in payload['create']['schedules'] if item['id'] == schedule.id)
+        self.assertEqual(schedule_option['followupId'], target.followup_id)
+        self.assertEqual(schedule_option['suggestedActionType'], 'delivery_schedule')
+        self.assertIn('PCR kit', schedule_option['deliveryItems'])
+        self.assertEqual(schedule_option['deliveryAmount'], 2200)
+        self.assertFalse(any(option['value'] == 'overdue' for option in payload['options']['nextActionStates']))
+
+    def test_notes_summary_api_labels_service_activity_as_memo(self):
+        service_note = self._create_note(self.user, '서비스라벨', action_type='service')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        service_option = next(item for item in payload['options']['actionTypes'] if item['value'] == 'service')
+        service_count = next(item for item in payload['actionCounts'] if item['value'] == 'service')
+        note = next(item for item in payload['notes'] if item['id'] == service_note.id)
+        self.assertEqual(service_option['label'], '메모')
+        self.assertEqual(service_count['label'], '메모')
+        self.assertEqual(note['actionLabel'], '메모')
+
+    def test_notes_summary_api_marks_date_only_next_action_as_scheduled_display(self):
+        next_date = timezone.localdate() + timedelta(days=31)
+        target = self._create_note(
+            self.user,
+            '날짜만후속',
+            next_action='',
+            next_action_date=next_date,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        note = next(item for item in payload['notes'] if item['id'] == target.id)
+        self.assertEqual(note['nextAction'], '')
+        self.assertEqual(note['nextActionDisplay'], '후속 예정')
+        self.assertEqual(note['nextActionDate'], next_date.isoformat())
+
+    def test_notes_create_api_requires_login_json(self):
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_notes_create_api_creates_own_customer_note(self):
+        from django.utils import timezone
+        from reporting.models import History, Schedule
+
+        target = self._create_note(self.user, '빠른작성기준')
+        self.client.force_login(self.user)
+        followup_date = timezone.localdate()
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'actionType': 'customer_meeting',
+                'content': 'React에서 바로 작성한 영업노트',
+                'nextAction': '다음 주 견적 확인',
+                'nextActionDate': followup_date.isoformat(),
+                'activityDate': timezone.localdate().isoformat(),
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        created = History.objects.get(pk=payload['historyId'])
+        self.assertEqual(created.user, self.user)
+        self.assertEqual(created.followup_id, target.followup_id)
+        self.assertEqual(created.content, 'React에서 바로 작성한 영업노트')
+        self.assertEqual(created.next_action, '다음 주 견적 확인')
+        self.assertEqual(created.meeting_date, timezone.localdate())
+        followup_schedule = Schedule.objects.get(
+            user=self.user,
+            followup=target.followup,
+            visit_date=followup_date,
+            activity_type='customer_meeting',
+        )
+        self.assertEqual(followup_schedule.visit_time.strftime('%H:%M'), '09:00')
+        self.assertEqual(followup_schedule.status, 'scheduled')
+        self.assertIn('자동 생성: 영업노트 후속 미팅', followup_schedule.notes)
+        self.assertIn(f'/notes/{created.id}/', followup_schedule.notes)
+        self.assertEqual(created.schedule_id, followup_schedule.id)
+        self.assertTrue(payload['followupScheduleCreated'])
+        self.assertEqual(payload['followupSchedule']['id'], followup_schedule.id)
+        self.assertIn('후속 미팅 일정을 생성', payload['message'])
+
+    def test_notes_create_api_creates_department_only_note(self):
+        from django.utils import timezone
+        from reporting.models import History, Schedule
+
+        department = self._create_department_only(self.user, '고객없는노트')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': department.id,
+                'actionType': 'customer_meeting',
+                'content': '고객 등록 전 부서에 남긴 영업노트',
+                'nextAction': '담당자 확인 후 연결',
+                'activityDate': timezone.localdate().isoformat(),
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        created = History.objects.get(pk=payload['historyId'])
+        self.assertIsNone(created.followup_id)
+        self.assertEqual(created.department_id, department.id)
+        self.assertEqual(created.content, '고객 등록 전 부서에 남긴 영업노트')
+        self.assertEqual(payload['note']['customer'], '담당자 미등록')
+        self.assertEqual(payload['note']['departmentId'], department.id)
+        self.assertEqual(payload['note']['customerHref'], f'/accounts/{department.id}/')
+        self.assertEqual(Schedule.objects.count(), 0)
+
+    def test_notes_create_api_creates_department_only_followup_meeting_schedule(self):
+        from datetime import timedelta
+        from django.utils import timezone
+        from reporting.models import History, Schedule
+
+        department = self._create_department_only(self.user, '부서후속일정')
+        followup_date = timezone.localdate() + timedelta(days=3)
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': department.id,
+                'actionType': 'customer_meeting',
+                'content': '부서만 연결한 영업노트',
+                'nextAction': '담당자 만나서 요구사항 확인',
+                'nextActionDate': followup_date.isoformat(),
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        created = History.objects.get(pk=payload['historyId'])
+        followup_schedule = Schedule.objects.get(
+            user=self.user,
+            followup__isnull=True,
+            department=department,
+            visit_date=followup_date,
+            activity_type='customer_meeting',
+        )
+        self.assertEqual(created.schedule_id, followup_schedule.id)
+        self.assertEqual(followup_schedule.company, self.company)
+        self.assertIn('담당자 만나서 요구사항 확인', followup_schedule.notes)
+        self.assertTrue(payload['followupScheduleCreated'])
+        self.assertEqual(payload['followupSchedule']['departmentId'], department.id)
+
+    def test_notes_create_api_reuses_existing_followup_meeting_schedule(self):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import History, Schedule
+
+        target = self._create_note(self.user, '기존후속일정')
+        followup_date = timezone.localdate() + timedelta(days=5)
+        existing_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            department=target.followup.department,
+            visit_date=followup_date,
+            visit_time=time(14, 0),
+            activity_type='customer_meeting',
+            status='scheduled',
+            notes='이미 등록한 후속 미팅',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'actionType': 'customer_meeting',
+                'content': '기존 후속 미팅이 있는 영업노트',
+                'nextAction': '미팅에서 예산 확인',
+                'nextActionDate': followup_date.isoformat(),
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        created = History.objects.get(pk=payload['historyId'])
+        self.assertEqual(
+            Schedule.objects.filter(
+                user=self.user,
+                followup=target.followup,
+                visit_date=followup_date,
+                activity_type='customer_meeting',
+            ).count(),
+            1,
+        )
+        self.assertEqual(created.schedule_id, existing_schedule.id)
+        self.assertFalse(payload['followupScheduleCreated'])
+        self.assertEqual(payload['followupSchedule']['id'], existing_schedule.id)
+        self.assertIn('기존 후속 미팅 일정', payload['message'])
+
+    def test_notes_create_api_requires_customer_when_department_has_contacts(self):
+        target = self._create_note(self.user, '고객있는부서')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': target.followup.department_id,
+                'actionType': 'customer_meeting',
+                'content': '고객 있는 부서를 고객 없이 작성 시도',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('고객을 선택하세요', response.json()['error'])
+
+    def test_notes_create_api_links_schedule_and_uses_schedule_date(self):
+        from datetime import time, timedelta
+        from reporting.models import History, Schedule
+
+        target = self._create_note(self.user, '일정연결작성')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 30),
+            activity_type='customer_meeting',
+        )
+        other_target = self._create_note(self.user, '다른일정')
+        other_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=other_target.followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(11, 0),
+            activity_type='customer_meeting',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'scheduleId': schedule.id,
+                'actionType': 'customer_meeting',
+                'content': '일정 상세에서 작성한 영업노트',
+                'nextAction': '샘플 반응 확인',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        created = History.objects.get(pk=payload['historyId'])
+        self.assertEqual(created.schedule_id, schedule.id)
+        self.assertEqual(created.followup_id, target.followup_id)
+        self.assertEqual(created.meeting_date, schedule.visit_date)
+        self.assertEqual(payload['reactHref'], f'/notes/{created.id}/')
+
+        mismatch_response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'scheduleId': other_schedule.id,
+                'actionType': 'customer_meeting',
+                'content': '잘못된 일정 연결',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(mismatch_response.status_code, 400)
+        self.assertIn('고객이 일치하지 않습니다', mismatch_response.json()['error'])
+
+    def test_notes_create_api_links_department_only_schedule(self):
+        from datetime import time, timedelta
+        from reporting.models import History, Schedule
+
+        department = self._create_department_only(self.user, '부서일정노트')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            department=department,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 30),
+            activity_type='customer_meeting',
+        )
+        other_department = self._create_department_only(self.user, '다른부서일정')
+        other_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            department=other_department,
+            visit_date=timezone.localdate(),
+            visit_time=time(11, 0),
+            activity_type='customer_meeting',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': department.id,
+                'scheduleId': schedule.id,
+                'actionType': 'customer_meeting',
+                'content': '부서만 있는 일정 상세에서 작성한 영업노트',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        created = History.objects.get(pk=response.json()['historyId'])
+        self.assertIsNone(created.followup_id)
+        self.assertEqual(created.department_id, department.id)
+        self.assertEqual(created.schedule_id, schedule.id)
+        self.assertEqual(created.meeting_date, schedule.visit_date)
+
+        mismatch_response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': department.id,
+                'scheduleId': other_schedule.id,
+                'actionType': 'customer_meeting',
+                'content': '잘못된 부서 일정 연결',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(mismatch_response.status_code, 400)
+        self.assertIn('부서/연구실과 일정이 일치하지 않습니다', mismatch_response.json()['error'])
+
+    def test_notes_create_api_links_delivery_schedule_and_copies_delivery_summary(self):
+        from datetime import time, timedelta
+        from reporting.models import DeliveryItem, History, Schedule
+
+        target = self._create_note(self.user, '납품일정연결')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            visit_date=timezone.localdate() + timedelta(days=3),
+            visit_time=time(15, 0),
+            activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Centrifuge tube',
+            quantity=3,
+            unit='BOX',
+            unit_price=5000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'scheduleId': schedule.id,
+                'actionType': 'delivery_schedule',
+                'content': '납품 일정 완료 보고',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        created = History.objects.get(pk=response.json()['historyId'])
+        self.assertEqual(created.schedule_id, schedule.id)
+        self.assertEqual(created.delivery_date, schedule.visit_date)
+        self.assertIn('Centrifuge tube', created.delivery_items)
+        self.assertEqual(created.delivery_amount, 16500)
+
+    def test_notes_create_api_blocks_manager_and_other_owner_customer(self):
+        target = self._create_note(self.coworker, '동료작성차단')
+        coworker_department = self._create_department_only(self.coworker, '동료부서작성차단')
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'actionType': 'customer_meeting',
+                'content': '매니저 작성 시도',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(manager_response.status_code, 403)
+
+        self.client.force_login(self.user)
+        other_owner_response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'actionType': 'customer_meeting',
+                'content': '동료 고객 작성 시도',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(other_owner_response.status_code, 403)
+
+        other_department_response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': coworker_department.id,
+                'actionType': 'customer_meeting',
+                'content': '동료 부서 작성 시도',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(other_department_response.status_code, 403)
+
+    def test_notes_detail_api_returns_detail_and_edit_config(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from django.utils import timezone
+        from reporting.models import History, HistoryFile
+
+        target = self._create_note(
+            self.user,
+            '상세대상',
+            action_type='customer_meeting',
+            content='초기 상담',
+        )
+        target.meeting_date = timezone.localdate()
+        target.meeting_situation = '예산 검토 중'
+        target.meeting_next_action = '견적서 발송'
+        target.save()
+        history_file = HistoryFile.objects.create(
+            history=target,
+            file=SimpleUploadedFile('note-detail.txt', b'note detail memo', content_type='text/plain'),
+            original_filename='note-detail.txt',
+            file_size=16,
+            uploaded_by=self.user,
+        )
+        self.addCleanup(history_file.file.delete, False)
+        owner_reply = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            parent_history=target,
+            action_type='memo',
+            content='실무자 댓글',
+        )
+        manager_reply = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            parent_history=target,
+            action_type='memo',
+            content='관리자 확인 메모',
+            created_by=self.manager,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:notes_detail_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['note']['id'], target.id)
+        self.assertEqual(payload['note']['href'], f'/notes/{target.id}/')
+        self.assertEqual(payload['note']['content'], '초기 상담')
+        self.assertEqual(payload['note']['meetingSituation'], '예산 검토 중')
+        self.assertEqual(payload['links']['notes'], '/notes/')
+        self.assertIn(f'/reporting/histories/{target.id}/', payload['links']['djangoDetail'])
+        self.assertTrue(payload['edit']['canEdit'])
+        self.assertEqual(payload['edit']['submitUrl'], reverse('reporting:notes_update_api', args=[target.id]))
+        self.assertEqual(payload['links']['uploadFiles'], reverse('reporting:note_file_upload', args=[target.id]))
+        self.assertTrue(payload['note']['canDelete'])
+        self.assertEqual(payload['note']['deleteHref'], reverse('reporting:notes_delete_api', args=[target.id]))
+        self.assertEqual(payload['links']['deleteNote'], reverse('reporting:notes_delete_api', args=[target.id]))
+        self.assertEqual(payload['note']['files'][0]['id'], history_file.id)
+        self.assertEqual(payload['note']['files'][0]['deleteHref'], reverse('reporting:file_delete', args=[history_file.id]))
+        self.assertTrue(payload['comments']['canCreate'])
+        self.assertEqual(payload['comments']['submitUrl'], reverse('reporting:add_manager_memo_to_history_api', args=[target.id]))
+        owner_reply_payload = next(reply for reply in payload['note']['replies'] if reply['id'] == owner_reply.id)
+        manager_reply_payload = next(reply for reply in payload['note']['replies'] if reply['id'] == manager_reply.id)
+        self.assertEqual(owner_reply_payload['authorRole'], '댓글')
+        self.assertTrue(owner_reply_payload['canDelete'])
+        self.assertEqual(owner_reply_payload['deleteHref'], reverse('reporting:delete_manager_memo_api', args=[owner_reply.id]))
+        self.assertEqual(manager_reply_payload['authorRole'], '매니저 메모')
+        self.assertFalse(manager_reply_payload['canDelete'])
+        customer_ids = {item['id'] for item in payload['edit']['customers']}
+        self.assertIn(target.followup_id, customer_ids)
+
+    def test_notes_detail_api_manager_read_only_and_other_company_blocked(self):
+        target = self._create_note(self.user, '매니저상세', action_type='quote', content='견적 확인')
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.get(reverse('reporting:notes_detail_api', args=[target.id]))
+        self.assertEqual(manager_response.status_code, 200)
+        manager_payload = manager_response.json()
+        self.assertFalse(manager_payload['edit']['canEdit'])
+        self.assertFalse(manager_payload['note']['canDelete'])
+        self.assertTrue(manager_payload['scope']['canReview'])
+
+        self.client.force_login(self.other_manager)
+        other_response = self.client.get(reverse('reporting:notes_detail_api', args=[target.id]))
+        self.assertEqual(other_response.status_code, 403)
+
+    def test_notes_update_api_updates_owned_note(self):
+        from django.utils import timezone
+
+        target = self._create_note(self.user, '수정대상', action_type='customer_meeting', content='수정 전')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:notes_update_api', args=[target.id]),
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'actionType': 'customer_meeting',
+                'activityDate': timezone.localdate().isoformat(),
+                'content': 'React 상세에서 수정',
+                'meetingSituation': '도입 검토',
+                'meetingResearcherQuote': '다음 주에 다시 확인하겠습니다',
+                'meetingConfirmedFacts': '예산은 6월 배정',
+                'meetingObstacles': '내부 승인 필요',
+                'meetingNextAction': '승인자 연락',
+                'nextAction': '견적서 재발송',
+                'nextActionDate': timezone.localdate().isoformat(),
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['message'], '영업노트를 수정했습니다.')
+        target.refresh_from_db()
+        self.assertEqual(target.content, 'React 상세에서 수정')
+        self.assertEqual(target.meeting_situation, '')
+        self.assertEqual(target.meeting_researcher_quote, '')
+        self.assertEqual(target.meeting_confirmed_facts, '')
+        self.assertEqual(target.meeting_obstacles, '')
+        self.assertEqual(target.meeting_next_action, '')
+        self.assertEqual(target.next_action, '견적서 재발송')
+        self.assertEqual(target.meeting_date, timezone.localdate())
+
+    def test_notes_update_api_updates_department_only_note_without_customer(self):
+        from django.utils import timezone
+        from reporting.models import FollowUp, History
+
+        department = self._create_department_only(self.user, '부서수정대상')
+        FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='나중에 등록된 담당자',
+            manager='담당자',
+            company=department.company,
+            department=department,
+            priority='scheduled',
+            pipeline_stage='contact',
+        )
+        target = History.objects.create(
+            user=self.user,
+            company=self.company,
+            department=department,
+            action_type='customer_meeting',
+            content='부서-only 수정 전',
+            next_action='기존 액션',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:notes_update_api', args=[target.id]),
+            data=json.dumps({
+                'departmentId': department.id,
+                'actionType': 'customer_meeting',
+                'activityDate': timezone.localdate().isoformat(),
+                'content': '부서-only React 수정',
+                'nextAction': '담당자 확인',
+                'nextActionDate': timezone.localdate().isoformat(),
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        target.refresh_from_db()
+        self.assertIsNone(target.followup_id)
+        self.assertEqual(target.department_id, department.id)
+        self.assertEqual(target.content, '부서-only React 수정')
+        self.assertEqual(target.next_action, '담당자 확인')
+        self.assertEqual(target.meeting_date, timezone.localdate())
+        self.assertEqual(payload['note']['customer'], '담당자 미등록')
+        self.assertEqual(payload['note']['departmentId'], department.id)
+
+    def test_notes_update_api_updates_service_note_without_status(self):
+        target = self._create_note(self.user, '서비스수정대상', action_type='service', content='서비스 전')
+        target.service_status = 'received'
+        target.save(update_fields=['service_status'])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:notes_update_api', args=[target.id]),
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'actionType': 'service',
+                'content': '상태 없이 서비스 노트 수정',
+                'nextAction': '처리 내용 확인',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        target.refresh_from_db()
+        self.assertEqual(target.action_type, 'service')
+        self.assertEqual(target.content, '상태 없이 서비스 노트 수정')
+        self.assertIsNone(target.service_status)
+        self.assertEqual(payload['note']['serviceStatus'], '')
+
+    def test_notes_update_api_blocks_manager_and_other_company_customer(self):
+        target = self._create_note(self.user, '수정차단', action_type='quote', content='견적 전')
+        other_target = self._create_note(self.other_user, '타사고객', action_type='quote', content='타사')
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(
+            reverse('reporting:notes_update_api', args=[target.id]),
+            data=json.dumps({
+                'followupId': target.followup_id,
+                'actionType': 'quote',
+                'content': '매니저 수정 시도',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(manager_response.status_code, 403)
+
+        self.client.force_login(self.user)
+        other_company_response = self.client.post(
+            reverse('reporting:notes_update_api', args=[target.id]),
+            data=json.dumps({
+                'followupId': other_target.followup_id,
+                'actionType': 'quote',
+                'content': '타사 고객으로 변경 시도',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(other_company_response.status_code, 403)
+
+    def test_notes_delete_api_allows_owner_only_and_blocks_comment_delete(self):
+        from reporting.models import History
+
+        target = self._create_note(self.user, '삭제대상', action_type='quote', content='삭제할 노트')
+        delete_url = reverse('reporting:notes_delete_api', args=[target.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(delete_url)
+        self.assertEqual(manager_response.status_code, 403)
+        self.assertTrue(History.objects.filter(pk=target.id).exists())
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(delete_url)
+        self.assertEqual(coworker_response.status_code, 403)
+        self.assertTrue(History.objects.filter(pk=target.id).exists())
+
+        reply = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            parent_history=target,
+            action_type='memo',
+            content='댓글은 노트 삭제 API 대상 아님',
+        )
+        self.client.force_login(self.user)
+        reply_response = self.client.post(reverse('reporting:notes_delete_api', args=[reply.id]))
+        self.assertEqual(reply_response.status_code, 403)
+        self.assertTrue(History.objects.filter(pk=reply.id).exists())
+
+        response = self.client.post(delete_url)
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['redirect'], '/notes/')
+        self.assertFalse(History.objects.filter(pk=target.id).exists())
+
+    def test_note_file_upload_api_allows_owner_only(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import HistoryFile
+
+        target = self._create_note(self.user, '파일업로드', action_type='quote', content='견적 파일')
+        upload_url = reverse('reporting:note_file_upload', args=[target.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(upload_url, {
+            'files': SimpleUploadedFile('manager.txt', b'manager memo', content_type='text/plain'),
+        })
+        self.assertEqual(manager_response.status_code, 403)
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(upload_url, {
+            'files': SimpleUploadedFile('coworker.txt', b'coworker memo', content_type='text/plain'),
+        })
+        self.assertEqual(coworker_response.status_code, 403)
+
+        self.client.force_login(self.user)
+        response = self.client.post(upload_url, {
+            'files': SimpleUploadedFile('owner.txt', b'owner memo', content_type='text/plain'),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        history_file = HistoryFile.objects.get(history=target)
+        self.addCleanup(history_file.file.delete, False)
+        self.assertEqual(history_file.original_filename, 'owner.txt')
+        self.assertEqual(payload['files'][0]['id'], history_file.id)
+        self.assertEqual(payload['files'][0]['downloadHref'], reverse('reporting:file_download', args=[history_file.id]))
+        self.assertEqual(payload['files'][0]['deleteHref'], reverse('reporting:file_delete', args=[history_file.id]))
+
+    def test_note_file_delete_api_allows_owner_only(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import History, HistoryFile
+
+        target = self._create_note(self.user, '파일삭제', action_type='quote', content='삭제 파일')
+        history_file = HistoryFile.objects.create(
+            history=target,
+            file=SimpleUploadedFile('delete-me.txt', b'delete memo', content_type='text/plain'),
+            original_filename='delete-me.txt',
+            file_size=11,
+            uploaded_by=self.user,
+        )
+        delete_url = reverse('reporting:file_delete', args=[history_file.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(delete_url)
+        self.assertEqual(manager_response.status_code, 403)
+        self.assertTrue(HistoryFile.objects.filter(pk=history_file.id).exists())
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(delete_url)
+        self.assertEqual(coworker_response.status_code, 403)
+        self.assertTrue(HistoryFile.objects.filter(pk=history_file.id).exists())
+
+        memo = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            parent_history=target,
+            action_type='memo',
+            content='첨부 삭제 차단 댓글',
+        )
+        memo_file = HistoryFile.objects.create(
+            history=memo,
+            file=SimpleUploadedFile('memo-file.txt', b'memo file', content_type='text/plain'),
+            original_filename='memo-file.txt',
+            file_size=9,
+            uploaded_by=self.user,
+        )
+        self.addCleanup(memo_file.file.delete, False)
+        self.client.force_login(self.user)
+        memo_response = self.client.post(reverse('reporting:file_delete', args=[memo_file.id]))
+        self.assertEqual(memo_response.status_code, 403)
+        self.assertTrue(HistoryFile.objects.filter(pk=memo_file.id).exists())
+
+        response = self.client.post(delete_url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertFalse(HistoryFile.objects.filter(pk=history_file.id).exists())
+
+    def test_note_file_download_blocks_anonymous_and_out_of_scope_users(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import HistoryFile
+
+        target = self._create_note(self.user, '파일다운로드', action_type='quote', content='다운로드 파일')
+        history_file = HistoryFile.objects.create(
+            history=target,
+            file=SimpleUploadedFile('download-note.txt', b'download memo', content_type='text/plain'),
+            original_filename='download-note.txt',
+            file_size=13,
+            uploaded_by=self.user,
+        )
+        self.addCleanup(history_file.file.delete, False)
+        download_url = reverse('reporting:file_download', args=[history_file.id])
+
+        anonymous_response = self.client.get(download_url)
+        self.assertEqual(anonymous_response.status_code, 302)
+        self.assertIn('/reporting/login/', anonymous_response['Location'])
+
+        self.client.force_login(self.other_user)
+        other_response = self.client.get(download_url)
+        self.assertNotEqual(other_response.status_code, 200)
+        self.assertNotIn('attachment', other_response.get('Content-Disposition', ''))
+
+        self.client.force_login(self.user)
+        owner_response = self.client.get(download_url)
+        self.assertEqual(owner_response.status_code, 200)
+        self.assertIn('attachment', owner_response.get('Content-Disposition', ''))
+        owner_response.close()
+
+    def test_note_reply_create_api_allows_owner_and_same_company_manager(self):
+        from reporting.models import History
+
+        target = self._create_note(self.user, '댓글작성', action_type='quote', content='견적 댓글')
+        reply_url = reverse('reporting:add_manager_memo_to_history_api', args=[target.id])
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(reply_url, {'memo': '동료 댓글 시도'})
+        self.assertEqual(coworker_response.status_code, 403)
+
+        self.client.force_login(self.other_manager)
+        other_manager_response = self.client.post(reply_url, {'memo': '타사 매니저 댓글 시도'})
+        self.assertEqual(other_manager_response.status_code, 403)
+
+        self.client.force_login(self.user)
+        owner_response = self.client.post(reply_url, {'memo': '실무자 댓글'})
+        self.assertEqual(owner_response.status_code, 200)
+        owner_reply = History.objects.get(parent_history=target, content='실무자 댓글')
+        self.assertEqual(owner_reply.user, self.user)
+        self.assertIsNone(owner_reply.created_by)
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(reply_url, {'memo': '관리자 메모'})
+        self.assertEqual(manager_response.status_code, 200)
+        manager_reply = History.objects.get(parent_history=target, content='관리자 메모')
+        self.assertEqual(manager_reply.user, self.user)
+        self.assertEqual(manager_reply.created_by, self.manager)
+
+    def test_note_reply_delete_api_allows_author_only(self):
+        from reporting.models import History
+
+        target = self._create_note(self.user, '댓글삭제', action_type='quote', content='삭제 댓글')
+        owner_reply = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            parent_history=target,
+            action_type='memo',
+            content='실무자 삭제 댓글',
+        )
+        manager_reply = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target.followup,
+            parent_history=target,
+            action_type='memo',
+            content='매니저 삭제 메모',
+            created_by=self.manager,
+        )
+
+        owner_delete_url = reverse('reporting:delete_manager_memo_api', args=[owner_reply.id])
+        manager_delete_url = reverse('reporting:delete_manager_memo_api', args=[manager_reply.id])
+
+        self.client.force_login(self.manager)
+        manager_denied = self.client.delete(owner_delete_url)
+        self.assertEqual(manager_denied.status_code, 403)
+        self.assertTrue(History.objects.filter(pk=owner_reply.id).exists())
+
+        self.client.force_login(self.user)
+        owner_denied = self.client.delete(manager_delete_url)
+        self.assertEqual(owner_denied.status_code, 403)
+        self.assertTrue(History.objects.filter(pk=manager_reply.id).exists())
+
+        owner_response = self.client.delete(owner_delete_url)
+        self.assertEqual(owner_response.status_code, 200)
+        self.assertFalse(History.objects.filter(pk=owner_reply.id).exists())
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.delete(manager_delete_url)
+        self.assertEqual(manager_response.status_code, 200)
+        self.assertFalse(History.objects.filter(pk=manager_reply.id).exists())
+
+    def test_history_toggle_reviewed_allows_manager_only(self):
+        target = self._create_note(
+            self.user,
+            '토글대상',
+            action_type='quote',
+            content='견적 보고 검토',
+            reviewed=False,
+        )
+        toggle_url = reverse('reporting:history_toggle_reviewed', args=[target.id])
+
+        self.client.force_login(self.user)
+        denied = self.client.post(toggle_url)
+        self.assertEqual(denied.status_code, 403)
+
+        self.client.force_login(self.admin)
+        admin_denied = self.client.post(toggle_url)
+        self.assertEqual(admin_denied.status_code, 403)
+
+        self.client.force_login(self.other_manager)
+        other_manager_denied = self.client.post(toggle_url)
+        self.assertEqual(other_manager_denied.status_code, 403)
+
+        self.client.force_login(self.manager)
+        response = self.client.post(toggle_url)
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertTrue(payload['is_reviewed'])
+        target.refresh_from_db()
+        self.assertIsNotNone(target.reviewed_at)
+        self.assertEqual(target.reviewer, self.manager)
+
+
+class EmailLogDerivedTextTests(TestCase):
+    """EmailLog 저장 시 표시용 텍스트 파생과 백필 명령 검증"""
+
+    def setUp(self):
+        self.user = make_user('email_text_user')
+
+    def _create_email(self, **kwargs):
+        from reporting.models import EmailLog
+
+        defaults = {
+            'user': self.user,
+            'subject': '견적 문의',
+            'body': '',
+            'body_html': (
+                '<html><head><style>p { margin: 0; }</style></head><body>'
+                '<p>안녕하세요&nbsp;담당자님,</p><p>견적서 검토 부탁드립니다.</p>'
+                '<div class="gmail_quote">이전 메일 인용 내용</div></body></html>'
+            ),
+        }
+        defaults.update(kwargs)
+        return EmailLog.objects.create(**defaults)
+
+    def test_save_stores_plain_text_and_preview(self):
+        from reporting.services.email_text import EMAIL_TEXT_PARSER_VERSION, email_body_text
+
+        email = self._create_email()
+
+        self.assertEqual(email.text_parser_version, EMAIL_TEXT_PARSER_VERSION)
+        self.assertEqual(email.body_text, '안녕하세요 담당자님,\n견적서 검토 부탁드립니다.')
+        self.assertEqual(email.body_preview, '안녕하세요 담당자님, 견적서 검토 부탁드립니다.')
+        self.assertNotIn('margin', email.body_text)
+        self.assertNotIn('인용', email.body_text)
+
+        email.body_html = '<p>수정된 본문</p>'
+        email.save(update_fields=['body_html'])
+        email.refresh_from_db()
+        self.assertEqual(email.body_text, '수정된 본문')
+        self.assertEqual(email_body_text(email, limit=4), '수정된…')
+
+    def test_backfill_command_rederives_stale_rows(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+        from reporting.models import EmailLog
+        from reporting.services.email_text import EMAIL_TEXT_PARSER_VERSION
+
+        email = self._create_email(body='본문만 있는 메일', body_html='')
+        EmailLog.objects.filter(pk=email.pk).update(body_text='', body_preview='', text_parser_version=0)
+
+        call_command('backfill_email_text', stdout=StringIO())
+
+        email.refresh_from_db()
+        self.assertEqual(email.text_parser_version, EMAIL_TEXT_PARSER_VERSION)
+        self.assertEqual(email.body_text, '본문만 있는 메일')
+
+
+class EmailContextIndexTests(TestCase):
+    """AI 메일 컨텍스트 인덱스 유지와 최근 메일 조회 검증"""
+
+    def setUp(self):
+        self.company_profile = UserCompany.objects.create(name='메일인덱스회사')
+        self.owner = make_user('email_index_owner', role='salesman', company=self.company_profile)
+        self.other = make_user('email_index_other', role='salesman', company=self.company_profile)
+        self.company = Company.objects.create(name='메일인덱스고객사', created_by=self.owner)
+        self.department = Department.objects.create(name='메일인덱스부서', company=self.company, created_by=self.owner)
+        self.followup = FollowUp.objects.create(
+            user=self.owner,
+            company=self.company,
+            department=self.department,
+            customer_name='메일인덱스담당자',
+        )
+        self.second_followup = FollowUp.objects.create(
+            user=self.owner,
+            company=self.company,
+            department=self.department,
+            customer_name='메일인덱스담당자2',
+        )
+        self.schedule = Schedule.objects.create(
+            user=self.owner,
+            company=self.company_profile,
+            followup=self.second_followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(9, 0),
+            activity_type='customer_meeting',
+        )
+
+    def _create_email(self, minutes_ago, **kwargs):
+        from reporting.models import EmailLog
+
+        defaults = {
+            'user': self.other,
+            'subject': f'메일 {minutes_ago}',
+            'body': '본문',
+            'email_type': 'received',
+            'received_at': timezone.now() - timedelta(minutes=minutes_ago),
+        }
+        defaults.update(kwargs)
+        with self.captureOnCommitCallbacks(execute=True):
+            return EmailLog.objects.create(**defaults)
+
+    def test_save_resolves_followup_owner_and_direction(self):
+        from reporting.models import EmailContextIndex
+
+        email = self._create_email(5, schedule=self.schedule)
+
+        rows = EmailContextIndex.objects.filter(email=email).order_by('owner_user_id')
+        self.assertEqual([row.owner_user_id for row in rows], sorted([self.owner.id, self.other.id]))
+        self.assertTrue(all(row.followup_id == self.second_followup.id for row in rows))
+        self.assertTrue(all(row.department_id == self.department.id and row.is_inbound for row in rows))
+
+        email.is_trashed = True
+        with self.captureOnCommitCallbacks(execute=True):
+            email.save()
+        self.assertTrue(EmailContextIndex.objects.filter(email=email, is_trashed=True).exists())
+
+        self.schedule.followup = self.followup
+        with self.captureOnCommitCallbacks(execute=True):
+            self.schedule.save()
+        self.assertEqual(
+            set(EmailContextIndex.objects.filter(email=email).values_list('followup_id', flat=True)),
+            {self.followup.id},
+        )
+
+    def test_recent_email_ids_orders_by_happened_at_once_per_email(self):
+        from reporting.services.email_index import VISIBLE_IN_WORKSPACE, recent_email_ids
+
+        newest = self._create_email(1, followup=self.followup)
+        middle = self._create_email(2, followup=self.followup)
+        oldest = self._create_email(3, followup=self.followup)
+        other_customer = self._create_email(4, schedule=self.schedule)
+        self._create_email(0, followup=self.followup, is_trashed=True)
+
+        self.assertEqual(
+            recent_email_ids(
+                self.owner,
+                visible_in=VISIBLE_IN_WORKSPACE,
+                followup_ids=[self.followup.id, self.second_followup.id],
+                limit=3,
+            ),
+            [newest.id, middle.id, oldest.id],
+        )
+        self.assertEqual(
+            recent_email_ids(
+                self.owner,
+                visible_in=VISIBLE_IN_WORKSPACE,
+                followup_ids=[self.followup.id, self.second_followup.id],
+                limit=10,
+            ),
+            [newest.id, middle.id, oldest.id, other_customer.id],
+        )
+        stranger = make_user('email_index_stranger')
+        self.assertEqual(
+            recent_email_ids(stranger, visible_in=VISIBLE_IN_WORKSPACE, followup_ids=[self.followup.id]),
+            [],
+        )
+
+    def test_ai_workspace_email_context_reads_index(self):
+        from reporting.views import _ai_workspace_recent_email_context
+
+        email = self._create_email(1, followup=self.followup, subject='인덱스 견적 회신')
+
+        payload = _ai_workspace_recent_email_context(self.owner, department_id=self.department.id, limit=5)
+
+        self.assertEqual([item['subject'] for item in payload], ['인덱스 견적 회신'])
+        self.assertEqual(len(payload), 1)
+        self.assertTrue(email.context_index_rows.exists())
+
+    def test_each_builder_keeps_its_own_owner_rule(self):
+        from reporting.services.email_index import VISIBLE_IN_ANALYSIS, VISIBLE_IN_WORKSPACE, recent_email_ids
+
+        schedule_user = make_user('email_index_schedule_user', role='salesman', company=self.company_profile)
+        customer_owner = make_user('email_index_customer_owner', role='salesman', company=self.company_profile)
+        customer = FollowUp.objects.create(
+            user=customer_owner,
+            company=self.company,
+            department=self.department,
+            customer_name='메일인덱스담당자3',
+        )
+        schedule = Schedule.objects.create(
+            user=schedule_user,
+            company=self.company_profile,
+            followup=customer,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            activity_type='customer_meeting',
+        )
+        email = self._create_email(1, schedule=schedule)
+
+        # AI 업무공간은 일정 담당자에게, AI 고객 분석은 일정 고객의 담당자에게만 보였다.
+        self.assertEqual(recent_email_ids(schedule_user, visible_in=VISIBLE_IN_WORKSPACE, followup_ids=[customer.id]), [email.id])
+        self.assertEqual(recent_email_ids(schedule_user, visible_in=VISIBLE_IN_ANALYSIS, followup_ids=[customer.id]), [])
+        self.assertEqual(recent_email_ids(customer_owner, visible_in=VISIBLE_IN_WORKSPACE, followup_ids=[customer.id]), [])
+        self.assertEqual(recent_email_ids(customer_owner, visible_in=VISIBLE_IN_ANALYSIS, followup_ids=[customer.id]), [email.id])
+
+    def test_department_and_customer_filters_match_every_linked_path(self):
+        from reporting.services.email_index import VISIBLE_IN_WORKSPACE, recent_email_ids
+
+        schedule_department = Department.objects.create(name='메일인덱스일정부서', company=self.company, created_by=self.owner)
+        self.schedule.department = schedule_department
+        self.schedule.save()
+        # 메일 고객(followup)과 일정 고객(second_followup)이 다르고, 일정 부서도 따로 있다.
+        email = self._create_email(1, followup=self.followup, schedule=self.schedule)
+
+        for department in (self.department, schedule_department):
+            self.assertEqual(
+                recent_email_ids(self.owner, visible_in=VISIBLE_IN_WORKSPACE, department_id=department.id),
+                [email.id],
+            )
+        for followup in (self.followup, self.second_followup):
+            self.assertEqual(
+                recent_email_ids(self.owner, visible_in=VISIBLE_IN_WORKSPACE, followup_ids=[followup.id]),
+                [email.id],
+            )
+        self.assertEqual(
+            recent_email_ids(
+                self.owner,
+                visible_in=VISIBLE_IN_WORKSPACE,
+                followup_ids=[self.followup.id, self.second_followup.id],
+            ),
+            [email.id],
+        )
+
+    def test_index_sync_waits_for_commit_and_skips_unindexed_updates(self):
+        from reporting.models import EmailContextIndex
+
+        email = self._create_email(1, followup=self.followup)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.followup.notes = '메모만 수정'
+            self.followup.save(update_fields=['notes'])
+            self.schedule.notes = '메모만 수정'
+            self.schedule.save(update_fields=['notes'])
+            # update_fields 없는 일반 저장도 담당자·고객·부서가 그대로면 다시 색인하지 않는다.
+            self.followup.notes = '메모 다시 수정'
+            self.followup.save()
+            self.schedule.location = '장소만 수정'
+            self.schedule.save()
+            email.subject = '제목만 수정'
+            email.save(update_fields=['subject'])
+        self.assertEqual(callbacks, [])
+
+        new_owner = make_user('email_index_new_owner', role='salesman', company=self.company_profile)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.followup.user = new_owner
+            self.followup.save(update_fields=['user'])
+            self.assertFalse(EmailContextIndex.objects.filter(email=email, owner_user=new_owner).exists())
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        self.assertTrue(EmailContextIndex.objects.filter(email=email, owner_user=new_owner).exists())
@@ -0,0 +1,730 @@
+import json
+import os
+import tempfile
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase, TransactionTestCase, override_settings
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 9: 프로덕션 설정 보안 검증 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ProductionSettingsTests(TestCase):
+    """Phase 9: settings_production.py 보안 설정 유효성 검증"""
+
+    def test_session_save_every_request_disabled_by_default(self):
+        """React API 조회 요청마다 세션 row를 저장하지 않도록 기본값을 비활성화"""
+        from django.conf import settings as django_settings
+        self.assertFalse(
+            getattr(django_settings, 'SESSION_SAVE_EVERY_REQUEST', False),
+            "SESSION_SAVE_EVERY_REQUEST 기본값은 DB write volume을 줄이기 위해 False여야 합니다.",
+        )
+
+    def test_allowed_hosts_no_invalid_wildcards(self):
+        """ALLOWED_HOSTS에 Django 미지원 와일드카드(*.xxx)가 없음을 확인"""
+        from django.conf import settings as django_settings
+        for host in django_settings.ALLOWED_HOSTS:
+            self.assertFalse(
+                host.startswith('*.'),
+                f"ALLOWED_HOSTS에 미지원 와일드카드 발견: {host}"
+            )
+
+    def test_email_encryption_key_is_bytes_or_none(self):
+        """EMAIL_ENCRYPTION_KEY가 bytes 또는 None인지 확인 (문자열 금지)"""
+        from django.conf import settings as django_settings
+        key = getattr(django_settings, 'EMAIL_ENCRYPTION_KEY', 'NOT_SET')
+        if key != 'NOT_SET' and key is not None:
+            self.assertIsInstance(
+                key, bytes,
+                f"EMAIL_ENCRYPTION_KEY는 bytes여야 합니다. 현재 타입: {type(key)}"
+            )
+
+    def test_email_encryption_key_not_hardcoded_default(self):
+        """EMAIL_ENCRYPTION_KEY가 알려진 하드코딩 기본값이 아님을 확인"""
+        from django.conf import settings as django_settings
+        key = getattr(django_settings, 'EMAIL_ENCRYPTION_KEY', None)
+        # 이전에 사용된 안전하지 않은 공개 기본값
+        UNSAFE_FALLBACK = b'YXNkZmFzZGZhc2RmYXNkZmFzZGZhc2RmYXNkZmFzZGY='
+        if key is not None:
+            self.assertNotEqual(
+                key, UNSAFE_FALLBACK,
+                "EMAIL_ENCRYPTION_KEY가 알려진 안전하지 않은 기본값으로 설정되어 있습니다."
+            )
+
+    def test_hsts_seconds_env_non_negative(self):
+        """HSTS_SECONDS 환경변수가 있으면 0 이상인지 확인"""
+        import os
+        val_str = os.environ.get('HSTS_SECONDS', '0')
+        val = int(val_str)
+        self.assertGreaterEqual(val, 0, "HSTS_SECONDS는 0 이상이어야 합니다")
+
+    def test_secure_content_type_nosniff(self):
+        """프로덕션 환경(not DEBUG)에서 MIME 스니핑 방지 헤더가 활성화됨"""
+        from django.conf import settings as django_settings
+        if not django_settings.DEBUG:
+            self.assertTrue(
+                getattr(django_settings, 'SECURE_CONTENT_TYPE_NOSNIFF', False),
+                "프로덕션에서 SECURE_CONTENT_TYPE_NOSNIFF가 활성화되어야 합니다"
+            )
+
+    def test_secret_key_not_insecure_prefix_in_production(self):
+        """RAILWAY_ENVIRONMENT가 설정된 실제 프로덕션에서 django-insecure- 접두어 금지"""
+        import os
+        from django.conf import settings as django_settings
+        # RAILWAY_ENVIRONMENT가 실제로 설정된 경우에만 검증 (로컬 개발 환경 제외)
+        if os.environ.get('RAILWAY_ENVIRONMENT'):
+            self.assertFalse(
+                django_settings.SECRET_KEY.startswith('django-insecure-'),
+                "Railway 프로덕션에서 insecure SECRET_KEY(django-insecure- 접두어)를 사용하면 안 됩니다."
+            )
+
+
+class OperationsHealthTests(TestCase):
+    """운영 health/readiness endpoint smoke tests."""
+
+    def test_healthz_returns_public_liveness_without_data(self):
+        response = self.client.get('/healthz/')
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['status'], 'ok')
+        self.assertEqual(payload['service'], 'sales-note-backend')
+        self.assertNotIn('customers', payload)
+        self.assertIn('no-store', response.headers.get('Cache-Control', ''))
+
+    @override_settings(ALLOWED_HOSTS=['healthcheck.railway.app'])
+    def test_healthz_accepts_railway_healthcheck_host(self):
+        response = self.client.get('/healthz/', HTTP_HOST='healthcheck.railway.app')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'ok')
+
+    def test_readyz_returns_database_and_migration_status(self):
+        response = self.client.get('/readyz/')
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['status'], 'ok')
+        self.assertEqual(payload['checks']['database']['status'], 'ok')
+        self.assertEqual(payload['checks']['migrations']['pending'], 0)
+
+    def test_readyz_reports_database_pool_status(self):
+        payload = self.client.get('/readyz/').json()
+
+        # 테스트(SQLite)는 풀 없이 돈다. 프로덕션은 psycopg 풀 지표가 같은 자리에 실린다.
+        self.assertEqual(payload['checks']['databasePool']['status'], 'disabled')
+        self.assertEqual(payload['checks']['databasePool']['statementTimeouts'], {})
+
+    def test_backup_status_does_not_require_email_host_setting(self):
+        with patch.object(__import__('django.conf', fromlist=['settings']).settings, 'EMAIL_HOST', None, create=True):
+            response = self.client.get('/reporting/backup/status/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+
+
+class StatementTimeoutTests(TestCase):
+    """무거운 뷰의 statement_timeout 데코레이터 검증."""
+
+    def _production_database_options(self, **env):
+        import importlib
+        import sys
+
+        env = {'SECRET_KEY': 'statement-timeout-test', 'DATABASE_URL': 'postgres://user:pw@db/sales', **env}
+        with patch.dict(os.environ, env):
+            if 'SALES_NOTE_WEB_PROCESS' not in env:
+                os.environ.pop('SALES_NOTE_WEB_PROCESS', None)
+            sys.modules.pop('sales_project.settings_production', None)
+            try:
+                module = importlib.import_module('sales_project.settings_production')
+            finally:
+                sys.modules.pop('sales_project.settings_production', None)
+        return module.DATABASES['default']['OPTIONS']
+
+    def test_default_timeout_only_applies_to_web_process_connections(self):
+        web_options = self._production_database_options(SALES_NOTE_WEB_PROCESS='1')
+        self.assertIn('-c statement_timeout=30000', web_options.get('options', ''))
+
+        # migrate·관리 명령·Celery 는 wsgi 를 거치지 않으므로 제한 없이 연결한다.
+        command_options = self._production_database_options()
+        self.assertNotIn('statement_timeout', command_options.get('options', ''))
+
+    def _view(self, error=None, query=True):
+        from django.contrib.auth.models import User
+        from django.http import JsonResponse
+        from reporting.services.db_pool import statement_timeout
+
+        @statement_timeout(1234)
+        def heavy_report_view(request):
+            if query:
+                User.objects.exists()
+            if error is not None:
+                raise error
+            return JsonResponse({'success': True})
+
+        return heavy_report_view
+
+    def test_sqlite_runs_view_without_setting_timeout(self):
+        from django.test import RequestFactory
+
+        with patch('reporting.services.db_pool._set_statement_timeout') as set_timeout:
+            response = self._view()(RequestFactory().get('/report/'))
+
+        self.assertEqual(response.status_code, 200)
+        set_timeout.assert_not_called()
+
+    def test_postgres_timeout_returns_503_and_restores_previous_value(self):
+        from django.db import OperationalError, connections
+        from django.test import RequestFactory
+        from reporting.services import db_pool
+
+        class QueryCanceled(Exception):
+            sqlstate = db_pool.QUERY_CANCELED_SQLSTATE
+
+        error = OperationalError('canceling statement due to statement timeout')
+        error.__cause__ = QueryCanceled()
+        with patch.object(type(connections['default']), 'vendor', 'postgresql'), \
+                patch.object(db_pool, '_set_statement_timeout', return_value='30s') as set_timeout, \
+                patch.dict(db_pool._timeouts, clear=True):
+            response = self._view(error)(RequestFactory().get('/report/'))
+            counts = db_pool.statement_timeout_counts()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(json.loads(response.content)['error'], 'query_timeout')
+        self.assertEqual([call.args[1] for call in set_timeout.call_args_list], [1234, '30s'])
+        self.assertEqual(counts, {'heavy_report_view': 1})
+
+    def test_timeout_is_not_set_before_the_first_query(self):
+        from django.db import connections
+        from django.test import RequestFactory
+        from reporting.services import db_pool
+
+        with patch.object(type(connections['default']), 'vendor', 'postgresql'), \
+                patch.object(db_pool, '_set_statement_timeout', return_value='30s') as set_timeout:
+            response = self._view(query=False)(RequestFactory().get('/report/'))
+
+        self.assertEqual(response.status_code, 200)
+        set_timeout.assert_not_called()
+
+    def test_timeout_follows_the_read_alias(self):
+        from django.db import connections
+        from django.test import RequestFactory
+        from reporting.services import db_pool
+
+        with patch.object(type(connections['default']), 'vendor', 'postgresql'), \
+                patch.object(db_pool, 'current_read_alias', return_value='replica'), \
+                patch.object(db_pool, 'connections', {'replica': connections['default']}) as by_alias, \
+                patch.object(db_pool, '_set_statement_timeout', return_value='30s') as set_timeout:
+            self._view()(RequestFactory().get('/report/'))
+
+        self.assertIs(set_timeout.call_args_list[0].args[0], by_alias['replica'])
+
+    def test_other_operational_errors_propagate(self):
+        from django.db import OperationalError, connections
+        from django.test import RequestFactory
+        from reporting.services import db_pool
+
+        with patch.object(type(connections['default']), 'vendor', 'postgresql'), \
+                patch.object(db_pool, '_set_statement_timeout', return_value='30s') as set_timeout:
+            with self.assertRaises(OperationalError):
+                self._view(OperationalError('server closed the connection'))(RequestFactory().get('/report/'))
+
+        self.assertEqual(set_timeout.call_count, 2)
+
+
+class ReadReplicaMiddlewareTests(TestCase):
+    """읽기 복제본 라우팅 조건(reporting.db_routing) 검증."""
+
+    def _dispatch(self, request, url_name, read_only=False):
+        from django.contrib.auth.models import User
+        from django.db import router
+        from django.http import HttpResponse
+        from django.urls import ResolverMatch
+        from reporting.db_routing import ReadReplicaMiddleware, read_only_view
+
+        seen = {}
+
+        def view(request):
+            seen['alias'] = router.db_for_read(User)
+            return HttpResponse('ok')
+
+        view = read_only_view(view) if read_only else view
+        request.resolver_match = ResolverMatch(view, (), {}, url_name=url_name)
+        middleware = ReadReplicaMiddleware(lambda req: middleware.process_view(req, view, (), {}) or view(req))
+        response = middleware(request)
+        return seen['alias'], response
+
+    def test_routes_readonly_bearer_and_read_only_views_to_replica(self):
+        from django.test import RequestFactory
+
+        factory = RequestFactory()
+        bearer = {'HTTP_AUTHORIZATION': 'Bearer token'}
+        with patch('reporting.db_routing.replica_alias', return_value='replica'):
+            cases = {
+                'bearer allowed GET': self._dispatch(factory.get('/api/', **bearer), 'dashboard_summary_api'),
+                'bearer other GET': self._dispatch(factory.get('/api/', **bearer), 'company_management_api'),
+                'session GET': self._dispatch(factory.get('/api/'), 'dashboard_summary_api'),
+                'read-only view GET': self._dispatch(factory.get('/api/'), 'revenue_detail_api', read_only=True),
+                'read-only view POST': self._dispatch(factory.post('/api/'), 'revenue_detail_api', read_only=True),
+            }
+
+        aliases = {name: alias for name, (alias, _response) in cases.items()}
+        self.assertEqual(aliases, {
+            'bearer allowed GET': 'replica',
+            'bearer other GET': 'default',
+            'session GET': 'default',
+            'read-only view GET': 'replica',
+            'read-only view POST': 'default',
+        })
+
+    def test_report_routes_resolve_to_read_only_views(self):
+        from django.urls import resolve, reverse
+
+        read_only_routes = [
+            'dashboard_summary_api',
+            'customers_summary_api',
+            'notes_feed_api',
+            'pipeline_command_center_api',
+            'pipeline_sheet_weekly_api',
+            'pipeline_sheet_export_api',
+            'revenue_detail_api',
+            'revenue_detail_items_api',
+        ]
+        for name in read_only_routes:
+            with self.subTest(name=name):
+                view = resolve(reverse(f'reporting:{name}')).func
+                self.assertTrue(getattr(view, 'reporting_read_only', False))
+
+        create_view = resolve(reverse('reporting:notes_create_api')).func
+        self.assertFalse(getattr(create_view, 'reporting_read_only', False))
+
+    def test_write_requests_pin_reads_to_primary(self):
+        from django.test import RequestFactory
+        from reporting.db_routing import PRIMARY_STICKY_COOKIE
+
+        factory = RequestFactory()
+        with patch('reporting.db_routing.replica_alias', return_value='replica'):
+            _alias, response = self._dispatch(factory.post('/api/'), 'notes_create_api')
+            pinned = factory.get('/api/')
+            pinned.COOKIES[PRIMARY_STICKY_COOKIE] = '1'
+            alias, _response = self._dispatch(pinned, 'revenue_detail_api', read_only=True)
+
+        self.assertEqual(response.cookies[PRIMARY_STICKY_COOKIE]['max-age'], 10)
+        self.assertTrue(response.cookies[PRIMARY_STICKY_COOKIE]['httponly'])
+        self.assertEqual(alias, 'default')
+
+    def test_without_replica_reads_primary_and_sets_no_cookie(self):
+        from django.test import RequestFactory
+        from reporting.db_routing import PRIMARY_STICKY_COOKIE
+
+        factory = RequestFactory()
+        alias, _response = self._dispatch(factory.get('/api/'), 'revenue_detail_api', read_only=True)
+        _alias, response = self._dispatch(factory.post('/api/'), 'notes_create_api')
+
+        self.assertEqual(alias, 'default')
+        self.assertNotIn(PRIMARY_STICKY_COOKIE, response.cookies)
+
+
+class ReadReplicaSqliteTests(TransactionTestCase):
+    """SQLite 파일 두 개(default + replica 복사본)로 복제 지연과 read-your-writes 를 재현한다."""
+
+    @classmethod
+    def setUpClass(cls):
+        from django.db import connections
+
+        super().setUpClass()
+        # 테스트 DB 설정에 없는 별칭이라 러너의 DB 준비가 끝난 뒤에 등록한다.
+        handle, cls.replica_path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(handle)
+        default = connections.settings['default']
+        connections.settings['replica'] = {
+            **default,
+            'NAME': cls.replica_path,
+            'TEST': {**default['TEST'], 'MIRROR': None},
+        }
+        cls.databases = {'default', 'replica'}
+
+    @classmethod
+    def tearDownClass(cls):
+        from django.db import connections
+
+        cls.databases = {'default'}
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+        os.remove(cls.replica_path)
+        super().tearDownClass()
+
+    def _replicate(self):
+        """primary 의 현재 내용을 replica 파일로 복사한다(복제 시점)."""
+        import sqlite3
+
+        from django.db import connections
+
+        connections['replica'].close()
+        connections['default'].ensure_connection()
+        target = sqlite3.connect(self.replica_path)
+        try:
+            connections['default'].connection.backup(target)
+        finally:
+            target.close()
+
+    def setUp(self):
+        from reporting.models import UserCompany
+        from reporting.tests.factories import make_customer, make_history, make_user
+
+        self.user = make_user('replica_reader', role='salesman', company=UserCompany.objects.create(name='복제본회사'))
+        self.replicated = make_history(self.user, make_customer(self.user, '복제됨'), action_type='customer_meeting')
+        self.client.force_login(self.user)
+        self._replicate()
+        self.lagging = make_history(self.user, make_customer(self.user, '지연됨'), action_type='customer_meeting')
+
+    def _feed_ids(self):
+        from django.urls import reverse
+
+        response = self.client.get(reverse('reporting:notes_feed_api'))
+        self.assertEqual(response.status_code, 200)
+        return {note['id'] for note in response.json()['notes']}
+
+    def test_read_only_view_reads_replica_until_session_writes(self):
+        from django.urls import reverse
+        from reporting.db_routing import PRIMARY_STICKY_COOKIE
+
+        self.assertEqual(self._feed_ids(), {self.replicated.id})
+
+        response = self.client.post(reverse('reporting:notes_create_api'), {})
+
+        self.assertIn(PRIMARY_STICKY_COOKIE, response.cookies)
+        self.assertEqual(self._feed_ids(), {self.replicated.id, self.lagging.id})
+
+    def test_replica_request_resolves_user_scope_on_primary(self):
+        from django.contrib.auth.models import User
+        from django.core.cache import cache
+        from reporting.db_routing import read_replica
+        from reporting.services.user_scope import resolve_scope_user_ids, user_scope_cache_key
+        from reporting.tests.factories import make_user
+
+        # 새 동료는 primary 에만 있다. 저장 신호가 범위 캐시 버전을 올린다.
+        colleague = make_user('replica_colleague', role='salesman', company=self.user.userprofile.company)
+        key = user_scope_cache_key('company', self.user.id)
+
+        with read_replica():
+            user_ids = resolve_scope_user_ids(
+                None,
+                'company',
+                (self.user.id,),
+                lambda: User.objects.filter(userprofile__company=self.user.userprofile.company),
+            )
+
+        self.assertEqual(user_ids, (self.user.id, colleague.id))
+        self.assertEqual(cache.get(key), (self.user.id, colleague.id))
+
+    def test_writes_always_go_to_primary(self):
+        from django.urls import reverse
+        from reporting.models import History
+
+        with self.assertNumQueries(0, using='replica'):
+            self.client.post(reverse('reporting:notes_create_api'), {})
+
+        self.assertEqual(History.objects.using('replica').count(), 1)
+        self.assertEqual(History.objects.using('default').count(), 2)
+
+
+class OperationsCommandTests(TestCase):
+    """운영 자동화 management command smoke tests."""
+
+    @override_settings(DEBUG=True)
+    def test_audit_runtime_config_outputs_json_without_secret_values(self):
+        from io import StringIO
+        from django.conf import settings as django_settings
+        from django.core.management import call_command
+
+        output = StringIO()
+        call_command('audit_runtime_config', '--json', stdout=output)
+
+        payload = json.loads(output.getvalue())
+        self.assertIn(payload['status'], ('ok', 'warning'))
+        self.assertNotIn(getattr(django_settings, 'SECRET_KEY', ''), output.getvalue())
+
+    def test_simple_backup_json_writes_retained_artifact(self):
+        from tempfile import TemporaryDirectory
+        from django.core.management import call_command
+
+        with TemporaryDirectory() as temp_dir:
+            call_command('simple_backup', '--format=json', f'--output-dir={temp_dir}', '--keep=1')
+            files = os.listdir(temp_dir)
+
+        self.assertEqual(len(files), 1)
+        self.assertTrue(files[0].startswith('sales_note_backup_'))
+        self.assertTrue(files[0].endswith('.json'))
+
+    def test_simple_backup_jsonl_incremental_and_restore(self):
+        import gzip
+        from datetime import datetime, timezone as dt_timezone
+        from io import StringIO
+        from pathlib import Path
+        from tempfile import TemporaryDirectory
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from reporting.models import UserCompany
+        from reporting.services.jsonl_backup import read_manifest
+
+        kept = UserCompany.objects.create(name='백업유지회사')
+        with TemporaryDirectory() as temp_dir:
+            call_command('simple_backup', '--format=jsonl', f'--output-dir={temp_dir}', '--keep=5', stdout=StringIO())
+            full_dir = sorted(Path(temp_dir).iterdir())[0]
+            full_manifest = read_manifest(full_dir)
+            self.assertEqual(full_manifest['kind'], 'full')
+            company_entry = next(item for item in full_manifest['models'] if item['model'] == 'reporting.usercompany')
+            self.assertEqual(company_entry['rows'], UserCompany.objects.count())
+            with gzip.open(full_dir / company_entry['parts'][0]['file'], 'rt', encoding='utf-8') as handle:
+                self.assertTrue(all(json.loads(line)['model'] == 'reporting.usercompany' for line in handle))
+
+            UserCompany.objects.filter(pk=kept.pk).update(updated_at=datetime(2000, 1, 1, tzinfo=dt_timezone.utc))
+            added = UserCompany.objects.create(name='백업증분회사')
+            call_command('simple_backup', '--format=jsonl', '--incremental', f'--output-dir={temp_dir}', '--keep=1', stdout=StringIO())
+            backup_dirs = sorted(Path(temp_dir).iterdir())
+            # --keep=1 이어도 증분 백업의 기준 백업은 남는다.
+            self.assertEqual(len(backup_dirs), 2)
+            incremental_manifest = read_manifest(backup_dirs[-1])
+            self.assertEqual(incremental_manifest['base_backup'], full_dir.name)
+            company_entry = next(item for item in incremental_manifest['models'] if item['model'] == 'reporting.usercompany')
+            self.assertEqual((company_entry['mode'], company_entry['rows']), ('incremental', 1))
+
+            UserCompany.objects.filter(pk__in=[kept.pk, added.pk]).delete()
+            output = StringIO()
+            call_command('restore_backup', str(backup_dirs[-1]), stdout=output)
+            self.assertIn('restored rows=', output.getvalue())
+            self.assertEqual(
+                set(UserCompany.objects.filter(pk__in=[kept.pk, added.pk]).values_list('name', flat=True)),
+                {'백업유지회사', '백업증분회사'},
+            )
+
+            company_entry = next(item for item in full_manifest['models'] if item['model'] == 'reporting.usercompany')
+            (full_dir / company_entry['parts'][0]['file']).write_bytes(b'corrupted')
+            with self.assertRaises(CommandError):
+                call_command('restore_backup', str(backup_dirs[-1]), stdout=StringIO())
+
+
+class _FakeS3Handler(BaseHTTPRequestHandler):
+    """S3 호환 저장소 대역: 경로형 PUT/GET/HEAD/DELETE 만 처리한다."""
+
+    objects = None
+
+    def log_message(self, *args):
+        pass
+
+    def _authorized(self):
+        return (self.headers.get('Authorization') or '').startswith('AWS4-HMAC-SHA256 Credential=test-key/')
+
+    def _reply(self, status, body=b''):
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_PUT(self):
+        import hashlib
+
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if not self._authorized() or hashlib.sha256(body).hexdigest() != self.headers.get('x-amz-content-sha256'):
+            return self._reply(403)
+        self.objects[self.path] = body
+        return self._reply(200)
+
+    def do_GET(self):
+        if not self._authorized():
+            return self._reply(403)
+        if self.path not in self.objects:
+            return self._reply(404)
+        return self._reply(200, self.objects[self.path])
+
+    do_HEAD = do_GET
+
+    def do_DELETE(self):
+        self.objects.pop(self.path, None)
+        return self._reply(204)
+
+
+class ContentAddressedMediaStorageTests(TestCase):
+    """콘텐츠 주소 미디어 저장소(로컬/S3 호환 블롭)와 이전 명령 검증"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _local_storage(self):
+        from reporting.services.media_storage import ContentAddressedStorage
+
+        return ContentAddressedStorage(blob_store={'BACKEND': 'local', 'LOCATION': self.temp_dir.name})
+
+    def test_identical_uploads_share_one_blob_until_last_reference_is_deleted(self):
+        from django.core.files.base import ContentFile
+        from reporting.models import MediaBlob, MediaReference
+
+        storage = self._local_storage()
+        first = storage.save('history_files/a.txt', ContentFile(b'same bytes'))
+        second = storage.save('history_files/b.txt', ContentFile(b'same bytes'))
+        duplicate = storage.save('history_files/a.txt', ContentFile(b'other bytes'))
+
+        self.assertNotEqual(duplicate, first)
+        self.assertEqual(MediaReference.objects.count(), 3)
+        self.assertEqual(MediaBlob.objects.count(), 2)
+        with storage.open(second) as handle:
+            self.assertEqual(handle.read(), b'same bytes')
+        self.assertEqual(storage.size(first), 10)
+        self.assertEqual(storage.url(first), '/media/history_files/a.txt')
+        blob_path = storage.path(first)
+        self.assertTrue(blob_path.startswith(self.temp_dir.name))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            storage.delete(first)
+        self.assertFalse(storage.exists(first))
+        self.assertTrue(os.path.exists(blob_path))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            storage.delete(second)
+        self.assertFalse(os.path.exists(blob_path))
+        self.assertEqual(MediaBlob.objects.count(), 1)
+
+    def test_deferred_blob_delete_keeps_bytes_stored_again_before_it_runs(self):
+        from django.core.files.base import ContentFile
+        from reporting.models import MediaBlob
+
+        storage = self._local_storage()
+        first = storage.save('history_files/a.txt', ContentFile(b'same bytes'))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            storage.delete(first)
+        # 커밋 뒤 파일 삭제 콜백이 돌기 전에 같은 내용이 다시 올라온다.
+        again = storage.save('history_files/b.txt', ContentFile(b'same bytes'))
+        for callback in callbacks:
+            callback()
+
+        with storage.open(again) as handle:
+            self.assertEqual(handle.read(), b'same bytes')
+        self.assertEqual(MediaBlob.objects.count(), 1)
+
+    def test_s3_blob_store_round_trip_against_local_stand_in(self):
+        import threading
+        from http.server import ThreadingHTTPServer
+        from django.core.files.base import ContentFile
+        from reporting.services.media_storage import ContentAddressedStorage
+
+        handler = type('Handler', (_FakeS3Handler,), {'objects': {}})
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        storage = ContentAddressedStorage(blob_store={
+            'BACKEND': 's3',
+            'ENDPOINT_URL': f'http://127.0.0.1:{server.server_port}',
+            'BUCKET': 'media',
+            'ACCESS_KEY_ID': 'test-key',
+            'SECRET_ACCESS_KEY': 'test-secret',
+            'PREFIX': 'sales-note',
+            'CACHE_DIR': self.temp_dir.name,
+        })
+        name = storage.save('schedule_files/견적.pdf', ContentFile(b'%PDF-1.4 quote'))
+
+        self.assertEqual(len(handler.objects), 1)
+        self.assertTrue(next(iter(handler.objects)).startswith('/media/sales-note/blobs/'))
+        with storage.open(name) as handle:
+            self.assertEqual(handle.read(), b'%PDF-1.4 quote')
+        with open(storage.path(name), 'rb') as handle:
+            self.assertEqual(handle.read(), b'%PDF-1.4 quote')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            storage.delete(name)
+        self.assertEqual(handler.objects, {})
+
+    def test_migrate_media_command_is_resumable(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from reporting.models import MediaReference
+
+        source = Path(self.temp_dir.name) / 'media'
+        (source / 'history_files').mkdir(parents=True)
+        (source / 'backups').mkdir()
+        (source / 'history_files' / 'note.txt').write_bytes(b'note')
+        (source / 'document_templates.xlsx').write_bytes(b'template')
+        (source / 'backups' / 'dump.json').write_bytes(b'{}')
+
+        with override_settings(MEDIA_BLOB_STORE={'BACKEND': 'local', 'LOCATION': str(Path(self.temp_dir.name) / 'blobs')}):
+            output = StringIO()
+            call_command('migrate_media_to_cas', f'--source={source}', stdout=output)
+            self.assertIn('copied=2 skipped=0', output.getvalue())
+
+            output = StringIO()
+            call_command('migrate_media_to_cas', f'--source={source}', stdout=output)
+            self.assertIn('copied=0 skipped=2', output.getvalue())
+
+        self.assertEqual(
+            set(MediaReference.objects.values_list('name', flat=True)),
+            {'history_files/note.txt', 'document_templates.xlsx'},
+        )
+
+
+class PerfDataBenchmarkTests(TestCase):
+    """성능 측정용 합성 데이터 생성과 API 벤치마크 기준선 비교"""
+
+    def test_seed_refuses_to_delete_an_organization_with_real_users(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from reporting.models import Company, UserCompany
+        from reporting.tests.factories import make_user
+
+        real_org = UserCompany.objects.create(name='실제 영업팀')
+        real_user = make_user('real_sales_rep', company=real_org)
+        Company.objects.create(name='실제 거래처', created_by=real_user)
+
+        with self.assertRaises(CommandError):
+            call_command('seed_perf_data', '--organization=실제 영업팀', '--users=1', '--followups=1', stdout=StringIO())
+
+        self.assertTrue(Company.objects.filter(name='실제 거래처').exists())
+        self.assertEqual(list(UserCompany.objects.filter(name='실제 영업팀')), [real_org])
+
+    def test_seed_is_deterministic_and_benchmark_writes_comparable_baseline(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from django.core.management.base import CommandError
+        from reporting.models import DeliveryItem, FollowUp, History
+        from reporting.services.perf_benchmark import compare_to_baseline
+
+        seed_args = ['--users=3', '--companies=3', '--followups=12', '--years=1', '--schedules-per-followup=3', '--products=5']
+        call_command('seed_perf_data', *seed_args, stdout=StringIO())
+        first = sorted(FollowUp.objects.filter(user_company__name='Perf Sales Org').values_list('customer_name', flat=True))
+        call_command('seed_perf_data', *seed_args, stdout=StringIO())
+        second = sorted(FollowUp.objects.filter(user_company__name='Perf Sales Org').values_list('customer_name', flat=True))
+        self.assertEqual(first, second)
+        self.assertEqual(len(second), 12)
+        self.assertTrue(History.objects.filter(user__username__startswith='perf42_').exists())
+        self.assertFalse(DeliveryItem.objects.filter(schedule__user__username__startswith='perf42_', total_price__isnull=True).exists())
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output = Path(temp_dir) / 'baseline.json'
+            call_command(
+                'benchmark_api', '--endpoint=receivables_api', '--endpoint=notes_summary_api',
+                '--iterations=1', '--warmup=0', f'--output={output}', stdout=StringIO(),
+            )
+            baseline = json.loads(output.read_text(encoding='utf-8'))
+            self.assertEqual(baseline['endpoints']['receivables_api']['status'], 200)
+            self.assertGreater(baseline['endpoints']['notes_summary_api']['queries'], 0)
+
+            slower = json.loads(json.dumps(baseline))
+            slower['endpoints']['receivables_api']['queries'] += 5
+            self.assertEqual(len(compare_to_baseline(slower, baseline)), 1)
+
+            baseline['endpoints']['notes_summary_api']['queries'] = 0
+            output.with_name('tight.json').write_text(json.dumps(baseline), encoding='utf-8')
+            with self.assertRaises(CommandError):
+                call_command(
+                    'benchmark_api', '--endpoint=notes_summary_api', '--iterations=1', '--warmup=0',
+                    f'--output={output}', f"--compare={output.with_name('tight.json')}", stdout=StringIO(),
+                )
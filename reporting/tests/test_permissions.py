@@ -0,0 +1,914 @@
+import os
+from datetime import time
+from unittest.mock import patch
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    FollowUp,
+    Schedule,
+    UserCompany,
+)
+from reporting.tests.factories import frontend_url, make_user
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 7: 익명 사용자 URL 차단 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class AnonymousAccessTests(TestCase):
+    """익명 사용자가 모든 내부 CRM 페이지에 접근할 수 없음을 검증"""
+
+    def setUp(self):
+        self.client = Client()
+
+    def _assert_redirects_to_login(self, url):
+        response = self.client.get(url)
+        self.assertIn(
+            response.status_code, [301, 302],
+            msg=f"Expected redirect for anonymous access to {url}, got {response.status_code}"
+        )
+        location = response.get('Location', '')
+        self.assertIn('login', location, msg=f"Redirect target should be login for {url}, got {location}")
+
+    def test_dashboard_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:dashboard'))
+
+    def test_followup_list_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:followup_list'))
+
+    def test_history_list_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:history_list'))
+
+    def test_schedule_list_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:schedule_list'))
+
+    def test_schedule_calendar_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:schedule_calendar'))
+
+    def test_funnel_pipeline_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:funnel_pipeline'))
+
+    def test_document_list_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:document_template_list'))
+
+    def test_followup_excel_download_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:followup_excel_download'))
+
+    def test_followup_basic_excel_download_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:followup_basic_excel_download'))
+
+    def test_prepayment_list_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:prepayment_list'))
+
+    def test_user_list_blocked(self):
+        self._assert_redirects_to_login(reverse('reporting:user_list'))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 7: export 권한 테스트 (salesman=403, manager=200, admin=200)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ExportPermissionTests(TestCase):
+    """CSV/XLSX export 뷰의 역할별 권한 차단 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='테스트회사')
+        self.salesman = make_user('salesman1', role='salesman', company=self.company)
+        self.manager = make_user('manager1', role='manager', company=self.company)
+        self.admin = make_user('admin1', role='admin', company=self.company)
+
+    def test_followup_excel_salesman_blocked(self):
+        """followup excel download: can_download_excel=False salesman 차단"""
+        self.client.force_login(self.salesman)
+        r = self.client.get(reverse('reporting:followup_excel_download'))
+        # 권한 없으면 리다이렉트
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Salesman without excel perm should be blocked, got {r.status_code}")
+
+    def test_followup_basic_excel_salesman_blocked(self):
+        """followup basic excel download: can_download_excel=False salesman 차단"""
+        self.client.force_login(self.salesman)
+        r = self.client.get(reverse('reporting:followup_basic_excel_download'))
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Salesman without excel perm should be blocked, got {r.status_code}")
+
+    def test_followup_excel_admin_allowed(self):
+        """followup excel download: admin 허용"""
+        self.client.force_login(self.admin)
+        r = self.client.get(reverse('reporting:followup_excel_download'))
+        self.assertEqual(r.status_code, 200)
+
+    def test_followup_basic_excel_admin_allowed(self):
+        """followup basic excel download: admin 허용"""
+        self.client.force_login(self.admin)
+        r = self.client.get(reverse('reporting:followup_basic_excel_download'))
+        self.assertEqual(r.status_code, 200)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 7: AI 권한 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class AIPermissionTests(TestCase):
+    """AI 기능 접근 권한 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='테스트AI회사')
+        self.user_no_ai = make_user('no_ai_user', role='salesman',
+                                    can_use_ai=False, company=self.company)
+        self.user_with_ai = make_user('ai_user', role='salesman',
+                                      can_use_ai=True, company=self.company)
+
+    def test_ai_departments_blocked_without_permission(self):
+        """can_use_ai=False 사용자는 AI 분석 페이지에서 리다이렉트"""
+        self.client.force_login(self.user_no_ai)
+        r = self.client.get('/ai/')
+        # ai_permission_required 데코레이터가 대시보드로 리다이렉트
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"User without AI perm should be blocked, got {r.status_code}")
+
+    def test_ai_departments_accessible_with_permission(self):
+        """can_use_ai=True 사용자는 React AI 브리핑 화면으로 이동"""
+        self.client.force_login(self.user_with_ai)
+        r = self.client.get('/ai/')
+        self.assertEqual(r.status_code, 302,
+                         msg=f"User with AI perm should redirect, got {r.status_code}")
+        self.assertEqual(r['Location'], '/ai-workspace/')
+
+
+class UserScopeCacheTests(TestCase):
+    """사용자 범위 id 캐시와 무효화 검증"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from django.test import RequestFactory
+
+        cache.clear()
+        self.company = UserCompany.objects.create(name='범위캐시회사')
+        self.other_company = UserCompany.objects.create(name='범위캐시타사')
+        self.user = make_user('scope_cache_me', company=self.company)
+        self.coworker = make_user('scope_cache_coworker', company=self.company)
+        self.outsider = make_user('scope_cache_outsider', company=self.other_company)
+        self.factory = RequestFactory()
+
+    def _request(self):
+        request = self.factory.get('/reporting/api/dashboard/')
+        request.user = User.objects.select_related('userprofile').get(pk=self.user.pk)
+        return request
+
+    def test_accessible_users_reuse_flat_id_tuple_within_request(self):
+        from reporting.services.user_scope import scope_user_ids
+        from reporting.views import get_accessible_users
+
+        request = self._request()
+        users = get_accessible_users(request.user, request)
+        self.assertEqual(scope_user_ids(users), tuple(sorted([self.user.id, self.coworker.id])))
+
+        with self.assertNumQueries(0):
+            again = get_accessible_users(request.user, request)
+            self.assertEqual(scope_user_ids(again), scope_user_ids(users))
+
+    def test_profile_company_change_invalidates_cached_scope(self):
+        from reporting.services.user_scope import scope_user_ids
+        from reporting.views import get_accessible_users
+
+        first = scope_user_ids(get_accessible_users(self.user, self._request()))
+        self.assertNotIn(self.outsider.id, first)
+
+        profile = self.outsider.userprofile
+        profile.company = self.company
+        profile.save(update_fields=['company'])
+
+        second = scope_user_ids(get_accessible_users(self.user, self._request()))
+        self.assertIn(self.outsider.id, second)
+
+    def test_dashboard_scope_filters_with_flat_ids(self):
+        from reporting.services.user_scope import scope_user_ids
+        from reporting.views import _dashboard_scope_users
+
+        request = self._request()
+        request.session = {}
+        scope_users, selected_user = _dashboard_scope_users(request, request.user.userprofile)
+
+        self.assertIsNone(selected_user)
+        self.assertEqual(scope_user_ids(scope_users), (self.user.id,))
+        self.assertNotIn('userprofile', str(FollowUp.objects.filter(user_id__in=scope_user_ids(scope_users)).query))
+
+
+class RequestIdentityCacheTests(TestCase):
+    """CompanyFilterMiddleware 신원 캐시와 지연 객체 검증"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from django.test import RequestFactory
+
+        cache.clear()
+        self.company = UserCompany.objects.create(name='신원캐시회사')
+        self.user = make_user('identity_cache_me', company=self.company)
+        self.admin = make_user('identity_cache_admin', role='admin')
+        self.factory = RequestFactory()
+
+    def _process(self, user, session=None):
+        from reporting.middleware import CompanyFilterMiddleware
+
+        request = self.factory.get('/reporting/api/dashboard/')
+        request.user = user
+        request.session = session or {}
+        CompanyFilterMiddleware(lambda req: None).process_request(request)
+        return request
+
+    def test_admin_selection_is_cached_and_resolved_lazily(self):
+        session = {'admin_selected_company': self.company.id, 'admin_selected_user': self.user.id}
+        self._process(self.admin, session)
+
+        with self.assertNumQueries(0):
+            request = self._process(self.admin, session)
+            self.assertTrue(request.is_admin)
+            self.assertTrue(request.admin_filter_company)
+            self.assertEqual(request.admin_filter_company.id, self.company.id)
+            self.assertEqual(request.admin_filter_user_id, self.user.id)
+            self.assertEqual(request.admin_filter_company_name, '신원캐시회사')
+
+        with self.assertNumQueries(1):
+            self.assertEqual(request.admin_filter_user.username, 'identity_cache_me')
+
+    def test_company_rename_invalidates_cached_identity(self):
+        self.assertEqual(self._process(self.user).user_company_name, '신원캐시회사')
+
+        self.company.name = '하나과학 신원캐시'
+        self.company.save(update_fields=['name'])
+
+        request = self._process(self.user)
+        self.assertEqual(request.user_company_name, '하나과학 신원캐시')
+        self.assertTrue(request.is_hanagwahak)
+        self.assertFalse(hasattr(request, 'admin_filter_company'))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 7: 권한 격리 테스트 (can_access_user_data)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class PermissionIsolationTests(TestCase):
+    """역할 기반 데이터 격리 검증"""
+
+    def test_can_access_user_data_same_company(self):
+        """같은 회사 사용자끼리 접근 가능"""
+        from reporting.views import can_access_user_data
+        company = UserCompany.objects.create(name='같은회사')
+        u1 = make_user('user_a', company=company)
+        u2 = make_user('user_b', company=company)
+        self.assertTrue(can_access_user_data(u1, u2))
+
+    def test_can_access_user_data_different_company(self):
+        """다른 회사 사용자 접근 차단"""
+        from reporting.views import can_access_user_data
+        c1 = UserCompany.objects.create(name='회사A')
+        c2 = UserCompany.objects.create(name='회사B')
+        u1 = make_user('user_c', company=c1)
+        u2 = make_user('user_d', company=c2)
+        self.assertFalse(can_access_user_data(u1, u2))
+
+    def test_can_access_user_data_no_company(self):
+        """company=None 사용자 간 상호 접근 차단 (None == None 버그 없음)"""
+        from reporting.views import can_access_user_data
+        u1 = make_user('user_e')  # company=None
+        u2 = make_user('user_f')  # company=None
+        # 서로 다른 사용자이고 company가 None → 접근 불가
+        self.assertFalse(can_access_user_data(u1, u2))
+
+    def test_can_access_user_data_self(self):
+        """자기 자신의 데이터 항상 접근 가능"""
+        from reporting.views import can_access_user_data
+        u = make_user('user_g')
+        self.assertTrue(can_access_user_data(u, u))
+
+    def test_admin_can_access_all(self):
+        """admin은 모든 회사 사용자 데이터 접근 가능"""
+        from reporting.views import can_access_user_data
+        c1 = UserCompany.objects.create(name='회사C')
+        c2 = UserCompany.objects.create(name='회사D')
+        admin_user = make_user('admin_x', role='admin', company=c1)
+        other_user = make_user('other_x', role='salesman', company=c2)
+        self.assertTrue(can_access_user_data(admin_user, other_user))
+
+    def test_can_modify_user_data_manager_blocked(self):
+        """manager는 타인 데이터 수정 불가"""
+        from reporting.views import can_modify_user_data
+        company = UserCompany.objects.create(name='수정테스트회사')
+        mgr = make_user('mgr_x', role='manager', company=company)
+        sales = make_user('sales_x', role='salesman', company=company)
+        self.assertFalse(can_modify_user_data(mgr, sales))
+
+    def test_can_modify_user_data_salesman_own(self):
+        """salesman은 자기 자신 데이터 수정 가능"""
+        from reporting.views import can_modify_user_data
+        u = make_user('sales_own')
+        self.assertTrue(can_modify_user_data(u, u))
+
+    def test_can_modify_user_data_salesman_other_blocked(self):
+        """salesman은 타인 데이터 수정 불가"""
+        from reporting.views import can_modify_user_data
+        company = UserCompany.objects.create(name='수정테스트회사2')
+        u1 = make_user('sales_p', role='salesman', company=company)
+        u2 = make_user('sales_q', role='salesman', company=company)
+        self.assertFalse(can_modify_user_data(u1, u2))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Manager 역할 권한 검증 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ManagerRolePermissionTests(TestCase):
+    """Manager(뷰어)는 영업노트/일정/고객 데이터를 생성·수정할 수 없음을 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='테스트회사')
+        self.manager = make_user('mgr_test', role='manager', company=self.company)
+        self.salesman = make_user('slm_test', role='salesman', company=self.company)
+
+    # ── 히스토리 생성 차단 (일정 기반) ────────────────────────────────────
+
+    def test_manager_cannot_access_history_create_from_schedule(self):
+        """Manager: 일정 기반 히스토리 생성 → 리다이렉트/403 차단"""
+        from reporting.models import Company, Department, FollowUp, Schedule
+        import datetime
+        # 최소 필요 객체 생성
+        company = Company.objects.create(name='테스트업체', created_by=self.salesman)
+        dept = Department.objects.create(name='테스트부서', company=company, created_by=self.salesman)
+        followup = FollowUp.objects.create(
+            user=self.salesman, customer_name='테스트고객',
+            company=company, department=dept
+        )
+        schedule = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=datetime.date.today(),
+            visit_time=datetime.time(9, 0),
+            activity_type='customer_meeting'
+        )
+        self.client.force_login(self.manager)
+        url = reverse('reporting:history_create_from_schedule', args=[schedule.pk])
+        r = self.client.get(url)
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Manager GET history_create_from_schedule: expected redirect/403, got {r.status_code}")
+
+    def test_manager_cannot_post_history_create_from_schedule(self):
+        """Manager: 일정 기반 히스토리 생성 POST → 리다이렉트/403 차단"""
+        from reporting.models import Company, Department, FollowUp, Schedule
+        import datetime
+        company = Company.objects.create(name='테스트업체2', created_by=self.salesman)
+        dept = Department.objects.create(name='테스트부서2', company=company, created_by=self.salesman)
+        followup = FollowUp.objects.create(
+            user=self.salesman, customer_name='테스트고객2',
+            company=company, department=dept
+        )
+        schedule = Schedule.objects.create(
+            user=self.salesman, followup=followup,
+            visit_date=datetime.date.today(),
+            visit_time=datetime.time(9, 0),
+            activity_type='customer_meeting'
+        )
+        self.client.force_login(self.manager)
+        url = reverse('reporting:history_create_from_schedule', args=[schedule.pk])
+        r = self.client.post(url, {'action_type': 'customer_meeting'})
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Manager POST history_create_from_schedule: expected redirect/403, got {r.status_code}")
+
+    # ── 일정 생성 차단 ──────────────────────────────────────────────────────
+
+    def test_manager_cannot_get_schedule_create(self):
+        """Manager: 일정 생성 폼 GET → 리다이렉트(차단)"""
+        self.client.force_login(self.manager)
+        r = self.client.get(reverse('reporting:schedule_create'))
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Manager GET schedule_create: expected redirect/403, got {r.status_code}")
+
+    def test_manager_cannot_post_schedule_create(self):
+        """Manager: 일정 생성 POST → 리다이렉트(차단)"""
+        self.client.force_login(self.manager)
+        r = self.client.post(reverse('reporting:schedule_create'), {
+            'visit_date': '2026-05-01',
+            'activity_type': 'customer_meeting',
+        })
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Manager POST schedule_create: expected redirect/403, got {r.status_code}")
+
+    # ── 고객(팔로우업) 생성 차단 ────────────────────────────────────────────
+
+    def test_manager_cannot_get_followup_create(self):
+        """Manager: 고객 생성 폼 GET → 리다이렉트(차단)"""
+        self.client.force_login(self.manager)
+        r = self.client.get(reverse('reporting:followup_create'))
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Manager GET followup_create: expected redirect/403, got {r.status_code}")
+
+    def test_manager_cannot_post_followup_create(self):
+        """Manager: 고객 생성 POST → 리다이렉트(차단)"""
+        self.client.force_login(self.manager)
+        r = self.client.post(reverse('reporting:followup_create'), {
+            'customer_name': '홍길동',
+        })
+        self.assertIn(r.status_code, [302, 403],
+                      msg=f"Manager POST followup_create: expected redirect/403, got {r.status_code}")
+
+    # ── Salesman은 정상 접근 가능 (form 렌더링) ─────────────────────────────
+
+    def test_salesman_can_get_schedule_create(self):
+        """Salesman: 일정 생성 폼 GET → React 생성 화면"""
+        self.client.force_login(self.salesman)
+        r = self.client.get(reverse('reporting:schedule_create'))
+        self.assertEqual(r.status_code, 302,
+                         msg=f"Salesman GET schedule_create: expected 302, got {r.status_code}")
+        self.assertEqual(r['Location'], frontend_url('schedules/?create=1'))
+
+    def test_salesman_can_get_followup_create(self):
+        """Salesman: 고객 생성 폼 GET → React 생성 화면"""
+        self.client.force_login(self.salesman)
+        r = self.client.get(reverse('reporting:followup_create'))
+        self.assertEqual(r.status_code, 302,
+                         msg=f"Salesman GET followup_create: expected 302, got {r.status_code}")
+        self.assertEqual(r['Location'], frontend_url('customers/?create=1'))
+
+    # ── 조회는 허용 ─────────────────────────────────────────────────────────
+
+    def test_manager_can_view_history_list(self):
+        """Manager: 히스토리 목록 조회 → React 영업노트"""
+        self.client.force_login(self.manager)
+        r = self.client.get(reverse('reporting:history_list'))
+        self.assertEqual(r.status_code, 302,
+                         msg=f"Manager GET history_list: expected 302, got {r.status_code}")
+        self.assertEqual(r['Location'], frontend_url('notes/'))
+
+    def test_manager_can_view_schedule_list(self):
+        """Manager: 일정 목록 조회 → React 일정"""
+        self.client.force_login(self.manager)
+        r = self.client.get(reverse('reporting:schedule_list'))
+        self.assertEqual(r.status_code, 302,
+                         msg=f"Manager GET schedule_list: expected 302, got {r.status_code}")
+        self.assertEqual(r['Location'], frontend_url('schedules/'))
+
+    def test_manager_can_view_followup_list(self):
+        """Manager: 고객 목록 조회 → React 고객"""
+        self.client.force_login(self.manager)
+        r = self.client.get(reverse('reporting:followup_list'))
+        self.assertEqual(r.status_code, 302,
+                         msg=f"Manager GET followup_list: expected 302, got {r.status_code}")
+        self.assertEqual(r['Location'], frontend_url('customers/'))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 8: 디버그 엔드포인트 제거 확인 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class DebugEndpointTests(TestCase):
+    """Phase 8: debug/user-company/ 엔드포인트가 제거되었는지 확인"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='디버그테스트회사')
+        self.superuser = User.objects.create_superuser(
+            username='superuser_debug', password='TestPass123!'
+        )
+        self.regular_user = make_user('regular_debug', role='salesman', company=self.company)
+
+    def test_debug_endpoint_does_not_exist(self):
+        """debug/user-company/ URL이 URL 설정에 존재하지 않음"""
+        from django.urls import NoReverseMatch
+        with self.assertRaises(NoReverseMatch):
+            reverse('reporting:debug_user_company_info')
+
+    def test_debug_url_returns_404(self):
+        """debug/user-company/ 직접 접근 시 404 반환"""
+        self.client.force_login(self.superuser)
+        r = self.client.get('/reporting/debug/user-company/')
+        self.assertEqual(r.status_code, 404,
+                         msg=f"debug URL should be 404, got {r.status_code}")
+
+    def test_debug_url_anonymous_returns_404(self):
+        """미인증 사용자 debug URL 접근 시 404 반환"""
+        r = self.client.get('/reporting/debug/user-company/')
+        self.assertEqual(r.status_code, 404,
+                         msg=f"anonymous debug URL should be 404, got {r.status_code}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 8: 파일 업로드 MIME 검증 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class FileUploadValidationTests(TestCase):
+    """Phase 8: 파일 업로드 MIME 검증 및 확장자 화이트리스트 테스트"""
+
+    def _make_file(self, name, content):
+        """테스트용 가짜 InMemoryUploadedFile 생성"""
+        import io
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        return SimpleUploadedFile(name, content)
+
+    def test_valid_pdf_accepted(self):
+        """올바른 PDF 파일 (매직 바이트 + 확장자 일치) 허용"""
+        from reporting.views import validate_file_upload
+        f = self._make_file('test.pdf', b'%PDF-1.4 valid pdf content')
+        ok, msg = validate_file_upload(f)
+        self.assertTrue(ok, msg=f"Valid PDF should be accepted: {msg}")
+
+    def test_valid_jpeg_accepted(self):
+        """올바른 JPEG 파일 허용"""
+        from reporting.views import validate_file_upload
+        f = self._make_file('photo.jpg', b'\xff\xd8\xff\xe0' + b'\x00' * 100)
+        ok, msg = validate_file_upload(f)
+        self.assertTrue(ok, msg=f"Valid JPEG should be accepted: {msg}")
+
+    def test_valid_png_accepted(self):
+        """올바른 PNG 파일 허용"""
+        from reporting.views import validate_file_upload
+        f = self._make_file('image.png', b'\x89PNG\r\n\x1a\n' + b'\x00' * 100)
+        ok, msg = validate_file_upload(f)
+        self.assertTrue(ok, msg=f"Valid PNG should be accepted: {msg}")
+
+    def test_invalid_extension_rejected(self):
+        """허용되지 않은 확장자 차단"""
+        from reporting.views import validate_file_upload
+        f = self._make_file('malware.exe', b'MZ\x90\x00' + b'\x00' * 100)
+        ok, msg = validate_file_upload(f)
+        self.assertFalse(ok, msg="EXE file should be rejected")
+
+    def test_disguised_exe_as_pdf_rejected(self):
+        """EXE 파일을 PDF로 위장한 경우 차단 (MIME 스푸핑 방지)"""
+        from reporting.views import validate_file_upload
+        # .pdf 확장자지만 실제로는 EXE 매직 바이트 MZ
+        f = self._make_file('fake.pdf', b'MZ\x90\x00' + b'\x00' * 100)
+        ok, msg = validate_file_upload(f)
+        self.assertFalse(ok, msg=f"EXE disguised as PDF should be rejected: {msg}")
+
+    def test_disguised_exe_as_jpg_rejected(self):
+        """EXE 파일을 JPG로 위장한 경우 차단"""
+        from reporting.views import validate_file_upload
+        f = self._make_file('photo.jpg', b'MZ\x90\x00' + b'\x00' * 100)
+        ok, msg = validate_file_upload(f)
+        self.assertFalse(ok, msg=f"EXE disguised as JPG should be rejected: {msg}")
+
+    def test_oversized_file_rejected(self):
+        """10MB 초과 파일 차단"""
+        from reporting.views import validate_file_upload
+        import io
+        from django.core.files.uploadedfile import InMemoryUploadedFile
+        content = b'%PDF' + b'\x00' * (10 * 1024 * 1024 + 1)
+        buf = io.BytesIO(content)
+        f = InMemoryUploadedFile(buf, 'file', 'big.pdf', 'application/pdf', len(content), None)
+        ok, msg = validate_file_upload(f)
+        self.assertFalse(ok, msg="Oversized file should be rejected")
+
+    def test_valid_docx_accepted(self):
+        """올바른 DOCX 파일 (ZIP 기반) 허용"""
+        from reporting.views import validate_file_upload
+        # DOCX는 ZIP 포맷 (PK\x03\x04 시그니처)
+        f = self._make_file('report.docx', b'PK\x03\x04' + b'\x00' * 100)
+        ok, msg = validate_file_upload(f)
+        self.assertTrue(ok, msg=f"Valid DOCX should be accepted: {msg}")
+
+
+class SalesNoteReadonlyBearerApiTests(TestCase):
+    """Readonly MCP bearer token access should cover safe GET API surfaces only."""
+
+    token = 'readonly-test-token'
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='Readonly MCP 회사')
+        self.readonly_user = make_user(
+            'readonly-mcp-admin',
+            role='admin',
+            company=self.company,
+            can_use_ai=True,
+        )
+
+    def _auth_headers(self):
+        return {'HTTP_AUTHORIZATION': f'Bearer {self.token}'}
+
+    @patch.dict(os.environ, {
+        'SALES_NOTE_READONLY_TOKEN': token,
+        'SALES_NOTE_READONLY_USERNAME': 'readonly-mcp-admin',
+    })
+    def test_readonly_bearer_can_read_expanded_get_apis(self):
+        endpoints = [
+            reverse('reporting:navigation_api'),
+            reverse('reporting:dashboard_summary_api'),
+            reverse('reporting:customers_summary_api'),
+            reverse('reporting:notes_summary_api'),
+            reverse('reporting:schedules_summary_api'),
+            reverse('reporting:prepayment_api_list'),
+            reverse('reporting:product_api_list'),
+            reverse('reporting:products_management_api'),
+            reverse('reporting:document_templates_api'),
+        ]
+
+        for endpoint in endpoints:
+            with self.subTest(endpoint=endpoint):
+                response = self.client.get(endpoint, **self._auth_headers())
+                self.assertEqual(response.status_code, 200)
+                payload = response.json()
+                self.assertTrue(payload.get('success', True), payload)
+
+    @patch.dict(os.environ, {
+        'SALES_NOTE_READONLY_TOKEN': token,
+        'SALES_NOTE_READONLY_USERNAME': 'readonly-mcp-admin',
+    })
+    def test_readonly_bearer_does_not_allow_writes(self):
+        response = self.client.post(reverse('reporting:notes_create_api'), **self._auth_headers())
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+
+class WriteProxyPhase0HardeningTests(TestCase):
+    """쓰기 프록시 노출 전 하드닝(Phase 0) 회귀 테스트.
+
+    - won 보호: 견적 일정 취소 시그널이 수주(won) 기회를 강등하지 않음
+    - department_memo_api: 교차 테넌트 접근 차단
+    - department_assign_category: 연락처 없는 부서의 무검사 갭 차단
+    - personal_schedule_add_comment: 비소유자 댓글 차단
+    """
+
+    def setUp(self):
+        self.client = Client()
+        self.user_company = UserCompany.objects.create(name='하드닝회사')
+        self.owner = make_user('phase0_owner', role='salesman', company=self.user_company)
+        self.other = make_user('phase0_other', role='salesman', company=self.user_company)
+        self.other_company = UserCompany.objects.create(name='다른회사')
+        self.outsider = make_user('phase0_outsider', role='salesman', company=self.other_company)
+
+        self.company = Company.objects.create(name='하드닝고객사', created_by=self.owner)
+        self.department = Department.objects.create(
+            name='하드닝부서', company=self.company, created_by=self.owner,
+        )
+        self.followup = FollowUp.objects.create(
+            user=self.owner, customer_name='하드닝고객',
+            company=self.company, department=self.department,
+        )
+
+    def _make_quote_schedule_with_opportunity(self, stage):
+        from reporting.models import OpportunityTracking
+        opportunity = OpportunityTracking.objects.create(
+            followup=self.followup, title='하드닝 기회', current_stage=stage,
+        )
+        schedule = Schedule.objects.create(
+            user=self.owner,
+            followup=self.followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            status='scheduled',
+            activity_type='quote',
+            opportunity=opportunity,
+        )
+        return schedule, opportunity
+
+    # ── #1 won 보호 시그널 ──────────────────────────────────────────
+    def test_won_opportunity_not_demoted_when_quote_schedule_cancelled(self):
+        schedule, opportunity = self._make_quote_schedule_with_opportunity('won')
+        schedule.status = 'cancelled'
+        schedule.save()
+        opportunity.refresh_from_db()
+        self.assertEqual(
+            opportunity.current_stage, 'won',
+            '수주(won) 기회는 견적 취소로 강등되면 안 된다.',
+        )
+
+    def test_open_quote_opportunity_still_demoted_on_cancel(self):
+        # 양성 대조: 수주 전 견적 기회는 취소 시 정상적으로 quote_lost로 전환
+        schedule, opportunity = self._make_quote_schedule_with_opportunity('quote')
+        schedule.status = 'cancelled'
+        schedule.save()
+        opportunity.refresh_from_db()
+        self.assertEqual(opportunity.current_stage, 'quote_lost')
+
+    # ── #2 부서 메모 교차 테넌트 차단 ───────────────────────────────
+    def test_department_memo_api_blocks_outsider(self):
+        from reporting.models import DepartmentMemo
+        self.client.force_login(self.outsider)
+        url = reverse('reporting:department_memo_api', args=[self.department.id])
+        r = self.client.post(url, {'content': '침입 메모'})
+        self.assertEqual(r.status_code, 403)
+        self.assertFalse(
+            DepartmentMemo.objects.filter(department=self.department).exists()
+        )
+
+    def test_department_memo_api_allows_owner(self):
+        from reporting.models import DepartmentMemo
+        self.client.force_login(self.owner)
+        url = reverse('reporting:department_memo_api', args=[self.department.id])
+        r = self.client.post(url, {'content': '정상 메모'})
+        self.assertEqual(r.status_code, 200)
+        self.assertTrue(
+            DepartmentMemo.objects.filter(
+                department=self.department, content='정상 메모',
+            ).exists()
+        )
+
+    # ── #3 연락처 없는 부서 카테고리 할당 갭 ─────────────────────────
+    def test_department_assign_category_blocks_outsider_on_empty_department(self):
+        empty_dept = Department.objects.create(
+            name='빈부서', company=self.company, created_by=self.owner,
+        )
+        self.client.force_login(self.outsider)
+        url = reverse('reporting:department_assign_category', args=[empty_dept.id])
+        r = self.client.post(url, {'category_id': ''})
+        self.assertFalse(r.json().get('success'))
+
+    # ── #4 개인 일정 댓글 권한 ──────────────────────────────────────
+    def test_personal_schedule_add_comment_blocks_non_owner(self):
+        from reporting.models import PersonalSchedule
+        ps = PersonalSchedule.objects.create(
+            user=self.owner, title='비공개 일정',
+            schedule_date=timezone.localdate(), schedule_time=time(9, 0),
+        )
+        self.client.force_login(self.other)  # 같은 회사지만 salesman(전체 열람 불가)
+        url = reverse('reporting:personal_schedule_add_comment', args=[ps.id])
+        r = self.client.post(url, {'content': '남의 일정 댓글'})
+        self.assertEqual(r.status_code, 403)
+
+    def test_personal_schedule_add_comment_allows_owner(self):
+        from reporting.models import PersonalSchedule
+        ps = PersonalSchedule.objects.create(
+            user=self.owner, title='내 일정',
+            schedule_date=timezone.localdate(), schedule_time=time(9, 0),
+        )
+        self.client.force_login(self.owner)
+        url = reverse('reporting:personal_schedule_add_comment', args=[ps.id])
+        r = self.client.post(url, {'content': '내 일정 댓글'})
+        self.assertEqual(r.status_code, 200)
+
+
+class WriteBearerAuthTests(TestCase):
+    """Phase 1 쓰기 토큰 인증 인프라(`reporting/write_api.py` + WriteBearerMiddleware).
+
+    - 유효 토큰 + 화이트리스트 POST → acting 유저로 인증, CSRF 우회(이 요청만)
+    - 세션 요청은 CSRF 그대로 강제, 토큰 미설정/오류/비허용 url은 차단
+    - acting 유저는 비-staff·비-admin 이어야 함 (권한 붕괴 방지)
+    """
+
+    TOKEN = 'sekret-write-123'
+
+    def setUp(self):
+        self.user_company = UserCompany.objects.create(name='쓰기회사')
+        self.write_user = make_user('write_actor', role='salesman', company=self.user_company)
+        self.admin_user = make_user('write_admin', role='admin', company=self.user_company)
+        self.staff_user = make_user('write_staff', role='salesman', company=self.user_company)
+        self.staff_user.is_staff = True
+        self.staff_user.save(update_fields=['is_staff'])
+
+        self.company = Company.objects.create(name='쓰기고객사', created_by=self.write_user)
+        self.department = Department.objects.create(
+            name='쓰기부서', company=self.company, created_by=self.write_user,
+        )
+        self.followup = FollowUp.objects.create(
+            user=self.write_user, customer_name='쓰기고객',
+            company=self.company, department=self.department,
+        )
+
+    def _env(self, token=None, user_id=None):
+        return {
+            'SALES_NOTE_WRITE_TOKEN': self.TOKEN if token is None else token,
+            'SALES_NOTE_WRITE_USER_ID': str(self.write_user.id) if user_id is None else str(user_id),
+        }
+
+    def _make_schedule(self):
+        return Schedule.objects.create(
+            user=self.write_user, followup=self.followup,
+            visit_date=timezone.localdate(), visit_time=time(9, 0),
+            activity_type='customer_meeting',
+        )
+
+    def _post_request(self, url, token=None):
+        from django.test import RequestFactory
+        bearer = self.TOKEN if token is None else token
+        return RequestFactory().post(url, HTTP_AUTHORIZATION=f'Bearer {bearer}')
+
+    # ── authenticate_write_bearer 단위 검증 ────────────────────────────
+    def test_valid_token_on_allowlisted_url_authenticates(self):
+        from reporting.write_api import authenticate_write_bearer
+        req = self._post_request(reverse('reporting:schedules_create_api'))
+        with patch.dict(os.environ, self._env()):
+            self.assertTrue(authenticate_write_bearer(req))
+        self.assertEqual(req.user, self.write_user)
+        self.assertTrue(getattr(req, 'salesnote_write_api', False))
+
+    def test_denied_url_rejected(self):
+        # deny 세트(로그인)는 토큰으로도 인증되지 않는다.
+        from reporting.write_api import authenticate_write_bearer
+        req = self._post_request(reverse('reporting:login'))
+        with patch.dict(os.environ, self._env()):
+            self.assertFalse(authenticate_write_bearer(req))
+
+    def test_allowed_non_denied_url_authenticates(self):
+        # deny 가 아닌 임의 쓰기(notes_update_api)는 "전부 쓰기"라 인증된다.
+        from reporting.write_api import authenticate_write_bearer
+        req = self._post_request(reverse('reporting:notes_update_api', args=[999999]))
+        with patch.dict(os.environ, self._env()):
+            self.assertTrue(authenticate_write_bearer(req))
+
+    def test_get_method_rejected(self):
+        from django.test import RequestFactory
+        from reporting.write_api import authenticate_write_bearer
+        req = RequestFactory().get(
+            reverse('reporting:schedules_create_api'),
+            HTTP_AUTHORIZATION=f'Bearer {self.TOKEN}',
+        )
+        with patch.dict(os.environ, self._env()):
+            self.assertFalse(authenticate_write_bearer(req))
+
+    def test_wrong_token_rejected(self):
+        from reporting.write_api import authenticate_write_bearer
+        req = self._post_request(reverse('reporting:schedules_create_api'), token='WRONG')
+        with patch.dict(os.environ, self._env()):
+            self.assertFalse(authenticate_write_bearer(req))
+
+    def test_unset_env_token_rejected(self):
+        from reporting.write_api import authenticate_write_bearer
+        req = self._post_request(reverse('reporting:schedules_create_api'))
+        with patch.dict(os.environ, self._env(token='')):
+            self.assertFalse(authenticate_write_bearer(req))
+
+    # ── get_write_api_user 안전 검증 ───────────────────────────────────
+    def test_write_user_resolves_salesman(self):
+        from reporting.write_api import get_write_api_user
+        with patch.dict(os.environ, self._env()):
+            self.assertEqual(get_write_api_user(), self.write_user)
+
+    def test_write_user_refuses_admin_role(self):
+        from reporting.write_api import get_write_api_user
+        with patch.dict(os.environ, self._env(user_id=self.admin_user.id)):
+            self.assertIsNone(get_write_api_user())
+
+    def test_write_user_refuses_staff(self):
+        from reporting.write_api import get_write_api_user
+        with patch.dict(os.environ, self._env(user_id=self.staff_user.id)):
+            self.assertIsNone(get_write_api_user())
+
+    # ── 미들웨어 + CSRF 통합 검증 ──────────────────────────────────────
+    def test_write_token_moves_schedule_without_session_or_csrf(self):
+        schedule = self._make_schedule()
+        client = Client(enforce_csrf_checks=True)
+        url = reverse('reporting:schedule_move_api', args=[schedule.pk])
+        with patch.dict(os.environ, self._env()):
+            r = client.post(url, {'new_date': '2026-08-15'},
+                            HTTP_AUTHORIZATION=f'Bearer {self.TOKEN}')
+        self.assertEqual(r.status_code, 200)
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.visit_date.isoformat(), '2026-08-15')
+
+    def test_session_post_still_requires_csrf(self):
+        # 세션 요청은 쓰기 토큰 우회를 받지 않고 CSRF 가 그대로 강제된다.
+        schedule = self._make_schedule()
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.write_user)
+        url = reverse('reporting:schedule_move_api', args=[schedule.pk])
+        r = client.post(url, {'new_date': '2026-08-15'})  # CSRF 토큰 없음, bearer 없음
+        self.assertEqual(r.status_code, 403)
+        schedule.refresh_from_db()
+        self.assertNotEqual(schedule.visit_date.isoformat(), '2026-08-15')
+
+    def test_unset_env_token_leaves_write_path_inert(self):
+        schedule = self._make_schedule()
+        client = Client(enforce_csrf_checks=True)
+        url = reverse('reporting:schedule_move_api', args=[schedule.pk])
+        with patch.dict(os.environ, self._env(token='')):
+            r = client.post(url, {'new_date': '2026-08-15'},
+                            HTTP_AUTHORIZATION='Bearer anything')
+        self.assertIn(r.status_code, (302, 401, 403))
+        schedule.refresh_from_db()
+        self.assertNotEqual(schedule.visit_date.isoformat(), '2026-08-15')
+
+    def test_write_token_cannot_reach_denied_endpoint(self):
+        # deny 세트(로그인 POST)는 토큰이 무시되어 정상 처리되지 않는다.
+        client = Client(enforce_csrf_checks=True)
+        url = reverse('reporting:login')
+        with patch.dict(os.environ, self._env()):
+            r = client.post(url, {'username': 'x', 'password': 'y'},
+                            HTTP_AUTHORIZATION=f'Bearer {self.TOKEN}')
+        self.assertNotEqual(r.status_code, 200)
+
+    def test_destructive_action_requires_confirm_header(self):
+        # 확인 필요 액션(납품품목 교체)에 확인 헤더 없이 토큰 → 428, 뷰 미실행.
+        client = Client(enforce_csrf_checks=True)
+        url = reverse('reporting:schedules_delivery_items_update_api', args=[999999])
+        with patch.dict(os.environ, self._env()):
+            r = client.post(url, '{}', content_type='application/json',
+                            HTTP_AUTHORIZATION=f'Bearer {self.TOKEN}')
+        self.assertEqual(r.status_code, 428)
+
+    def test_destructive_action_passes_gate_with_confirm_header(self):
+        # 확인 헤더가 있으면 게이트 통과 → 뷰 실행(없는 일정이라 428 은 아님).
+        client = Client(enforce_csrf_checks=True)
+        url = reverse('reporting:schedules_delivery_items_update_api', args=[999999])
+        with patch.dict(os.environ, self._env()):
+            r = client.post(url, '{}', content_type='application/json',
+                            HTTP_AUTHORIZATION=f'Bearer {self.TOKEN}',
+                            HTTP_X_SALESNOTE_WRITE_CONFIRM='yes')
+        self.assertNotEqual(r.status_code, 428)
@@ -0,0 +1,1595 @@
+import json
+from datetime import time, timedelta
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    FollowUp,
+    DeliveryItem,
+    Schedule,
+    UserCompany,
+)
+from reporting.tests.factories import make_user, make_customer, make_schedule, make_history
+
+
+class PipelineApiTests(TestCase):
+    """React 파일럿용 파이프라인 읽기 API 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = UserCompany.objects.create(name='파이프라인API회사')
+        cls.user = make_user('pipeline_api_me', role='salesman', company=cls.company)
+        cls.coworker = make_user('pipeline_api_coworker', role='salesman', company=cls.company)
+        cls.manager = make_user('pipeline_api_manager', role='manager', company=cls.company)
+        cls.url = reverse('reporting:pipeline_command_center_api')
+        cls.move_url = reverse('reporting:funnel_pipeline_move')
+
+    def setUp(self):
+        self.client = Client()
+
+    def _create_pipeline_customer(self, owner, name, stage='quote'):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import Quote
+
+        followup = make_customer(owner, name, pipeline_stage=stage, customer_grade='A')
+        schedule = make_schedule(
+            owner,
+            followup,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 0),
+            status='scheduled',
+            activity_type='quote',
+        )
+        Quote.objects.create(
+            quote_number=f'Q-{name}',
+            schedule=schedule,
+            followup=followup,
+            user=owner,
+            valid_until=timezone.localdate() + timedelta(days=30),
+            subtotal=1000000,
+            probability=65,
+            stage='sent',
+        )
+        make_history(
+            owner,
+            followup,
+            action_type='quote',
+            content='견적 후속 필요',
+            next_action='견적서 확인 전화',
+            next_action_date=timezone.localdate() - timedelta(days=1),
+        )
+        return followup
+
+    def _create_quote_for_followup(self, followup, owner, suffix, stage, subtotal, converted=False):
+        from datetime import timedelta
+        from django.utils import timezone
+        from reporting.models import Quote
+
+        schedule = followup.schedules.first()
+        return Quote.objects.create(
+            quote_number=f'Q-{suffix}',
+            schedule=schedule,
+            followup=followup,
+            user=owner,
+            valid_until=timezone.localdate() + timedelta(days=30),
+            subtotal=subtotal,
+            probability=100 if stage in ('approved', 'converted') else 65,
+            stage=stage,
+            converted_to_delivery=converted,
+        )
+
+    def _create_delivery_item(self, schedule, item_name, unit_price, quantity=1):
+        from reporting.models import DeliveryItem
+
+        return DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name=item_name,
+            quantity=quantity,
+            unit_price=unit_price,
+        )
+
+    def _create_history_item(self, history, item_name, unit_price, quantity=1):
+        from reporting.models import DeliveryItem
+
+        return DeliveryItem.objects.create(
+            history=history,
+            item_name=item_name,
+            quantity=quantity,
+            unit_price=unit_price,
+        )
+
+    def _create_delivery_schedule(self, followup, owner, name, unit_price, quantity=1, days_delta=-1):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import Schedule
+
+        schedule = Schedule.objects.create(
+            user=owner,
+            company=owner.userprofile.company,
+            followup=followup,
+            visit_date=timezone.localdate() + timedelta(days=days_delta),
+            visit_time=time(11, 0),
+            status='completed',
+            activity_type='delivery',
+        )
+        self._create_delivery_item(schedule, name, unit_price, quantity)
+        return schedule
+
+    def test_pipeline_api_requires_login(self):
+        response = self.client.get(self.url)
+        self.assertIn(response.status_code, [301, 302, 401])
+        if response.status_code in [301, 302]:
+            self.assertIn('login', response.get('Location', ''))
+
+    def test_pipeline_api_returns_current_user_scope(self):
+        own = self._create_pipeline_customer(self.user, '내고객')
+        coworker = self._create_pipeline_customer(self.coworker, '동료고객')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['source'], 'django')
+        deal_ids = {deal['id'] for deal in payload['deals']}
+        self.assertIn(own.id, deal_ids)
+        self.assertNotIn(coworker.id, deal_ids)
+
+    def test_pipeline_api_includes_metrics_stages_and_tasks(self):
+        from django.utils import timezone
+
+        own = self._create_pipeline_customer(self.user, '지표고객')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertGreaterEqual(payload['metrics']['totalPipelineValue'], 1000000)
+        self.assertEqual(payload['metrics']['activeCount'], 1)
+        self.assertEqual(payload['metrics']['overdueCount'], 1)
+        self.assertTrue(any(stage['id'] == own.pipeline_stage for stage in payload['stages']))
+        self.assertTrue(any(task['title'] == '견적 후속 지연 고객' for task in payload['priorityTasks']))
+        deal = payload['deals'][0]
+        self.assertEqual(deal['stageLabel'], '견적 제출')
+        self.assertIn('recentActivities', deal)
+        self.assertEqual(deal['latestQuote']['amount'], 1100000)
+        self.assertEqual(deal['latestQuote']['quoteDate'], timezone.localdate().isoformat())
+        self.assertEqual(deal['nextSchedule']['type'], '견적 제출')
+        self.assertIn('csrftoken', response.cookies)
+
+    def test_pipeline_api_leaves_unentered_contact_and_potential_probability_null(self):
+        from reporting.models import Company, Department, FollowUp
+
+        customer_company = Company.objects.create(name='확률미입력회사', created_by=self.user)
+        department = Department.objects.create(
+            company=customer_company,
+            name='확률미입력연구실',
+            created_by=self.user,
+        )
+        potential = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.user.userprofile.company,
+            customer_name='잠재 고객',
+            company=customer_company,
+            department=department,
+            pipeline_stage='potential',
+        )
+        contact_company = Company.objects.create(name='접촉확률미입력회사', created_by=self.user)
+        contact_department = Department.objects.create(
+            company=contact_company,
+            name='접촉확률미입력연구실',
+            created_by=self.user,
+        )
+        contact = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.user.userprofile.company,
+            customer_name='접촉 고객',
+            company=contact_company,
+            department=contact_department,
+            pipeline_stage='contact',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        deals = {deal['id']: deal for deal in payload['deals']}
+        self.assertIsNone(deals[potential.id]['probability'])
+        self.assertIsNone(deals[contact.id]['probability'])
+        self.assertEqual(payload['metrics']['weightedPipelineValue'], 0)
+
+    def test_pipeline_api_uses_stage_relevant_quote_amount(self):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        quote_followup = self._create_pipeline_customer(self.user, '견적가격', stage='quote')
+        self._create_delivery_item(quote_followup.schedules.first(), '견적품목', 2000000)
+        self._create_quote_for_followup(
+            quote_followup, self.user, 'quote-latest-rejected', 'rejected', 3000000
+        )
+        negotiation_followup = self._create_pipeline_customer(self.user, '협상가격', stage='negotiation')
+        self._create_delivery_item(negotiation_followup.schedules.first(), '협상품목', 2000000)
+        self._create_quote_for_followup(
+            negotiation_followup, self.user, 'negotiation-active', 'negotiation', 2000000
+        )
+        self._create_quote_for_followup(
+            negotiation_followup, self.user, 'negotiation-latest-expired', 'expired', 5000000
+        )
+        won_followup = self._create_pipeline_customer(self.user, '수주가격', stage='won')
+        self._create_delivery_schedule(won_followup, self.user, '납품품목', 4000000)
+        self._create_quote_for_followup(
+            won_followup, self.user, 'won-approved', 'approved', 4000000
+        )
+        self._create_quote_for_followup(
+            won_followup, self.user, 'won-latest-draft', 'draft', 9000000
+        )
+        lost_followup = self._create_pipeline_customer(self.user, '실주가격', stage='lost')
+        self._create_delivery_item(lost_followup.schedules.first(), '실주견적품목', 1500000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        deals = {deal['id']: deal for deal in payload['deals']}
+        self.assertEqual(deals[quote_followup.id]['value'], 2200000)
+        self.assertEqual(deals[quote_followup.id]['latestQuote']['source'], '견적 일정')
+        self.assertEqual(deals[quote_followup.id]['latestQuote']['basisType'], 'schedule')
+        self.assertEqual(deals[quote_followup.id]['latestQuote']['items'][0]['itemName'], '견적품목')
+        self.assertEqual(deals[quote_followup.id]['latestQuote']['items'][0]['totalPrice'], 2200000)
+        self.assertEqual(deals[negotiation_followup.id]['value'], 2200000)
+        self.assertEqual(deals[negotiation_followup.id]['latestQuote']['source'], '견적 일정')
+        self.assertEqual(deals[negotiation_followup.id]['latestQuote']['items'][0]['itemName'], '협상품목')
+        self.assertEqual(deals[won_followup.id]['value'], 4400000)
+        self.assertEqual(deals[won_followup.id]['latestQuote']['source'], '실제 납품 매출')
+        self.assertEqual(deals[won_followup.id]['latestQuote']['basisType'], 'delivery')
+        self.assertEqual(deals[won_followup.id]['quoteComparison']['quotedAmount'], 4400000)
+        self.assertEqual(deals[won_followup.id]['quoteComparison']['actualAmount'], 4400000)
+        self.assertEqual(deals[won_followup.id]['quoteComparison']['deltaAmount'], 0)
+        self.assertEqual(deals[won_followup.id]['quoteComparison']['status'], 'match')
+        self.assertEqual(deals[lost_followup.id]['value'], 1650000)
+        self.assertEqual(deals[lost_followup.id]['latestQuote']['source'], '견적 일정')
+        self.assertEqual(deals[lost_followup.id]['latestQuote']['basisType'], 'schedule')
+        self.assertEqual(deals[lost_followup.id]['latestQuote']['quoteDate'], (timezone.localdate() + timedelta(days=1)).isoformat())
+        stages = {stage['id']: stage for stage in payload['stages']}
+        self.assertEqual(stages['won']['totalValue'], 4400000)
+        self.assertEqual(stages['lost']['totalValue'], 1650000)
+
+    def test_pipeline_api_uses_latest_quote_schedule_date_amount(self):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import Schedule
+
+        followup = self._create_pipeline_customer(self.user, '날짜별견적', stage='quote')
+        first_schedule = followup.schedules.first()
+        self._create_delivery_item(first_schedule, '과거 견적품목', 1000000)
+        second_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.user.userprofile.company,
+            followup=followup,
+            visit_date=timezone.localdate() + timedelta(days=2),
+            visit_time=time(14, 0),
+            status='scheduled',
+            activity_type='quote',
+        )
+        self._create_delivery_item(second_schedule, '최신 견적품목', 2000000)
+        same_day_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.user.userprofile.company,
+            followup=followup,
+            visit_date=timezone.localdate() + timedelta(days=2),
+            visit_time=time(15, 0),
+            status='scheduled',
+            activity_type='quote',
+        )
+        self._create_delivery_item(same_day_schedule, '같은날 견적품목', 500000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        deal = next(deal for deal in response.json()['deals'] if deal['id'] == followup.id)
+        self.assertEqual(deal['value'], 2750000)
+        self.assertEqual(deal['latestQuote']['source'], '견적 일정 2건')
+        self.assertIn('외 1건', deal['latestQuote']['number'])
+        self.assertEqual(deal['latestQuote']['basisDate'], (timezone.localdate() + timedelta(days=2)).isoformat())
+        self.assertEqual(deal['latestQuote']['quoteDate'], (timezone.localdate() + timedelta(days=2)).isoformat())
+
+    def test_pipeline_api_sums_all_delivery_dates_amount_for_won(self):
+        """계정이 여러 번 납품했으면 최근 1건이 아니라 전부 합산해야 한다."""
+        from datetime import timedelta
+        from django.utils import timezone
+
+        followup = self._create_pipeline_customer(self.user, '날짜별수주', stage='won')
+        self._create_delivery_schedule(followup, self.user, '과거납품', 1000000, days_delta=-20)
+        self._create_delivery_schedule(followup, self.user, '최신납품', 2000000, days_delta=-1)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        deal = next(deal for deal in payload['deals'] if deal['id'] == followup.id)
+        self.assertEqual(deal['value'], 3300000)
+        self.assertEqual(deal['latestQuote']['source'], '실제 납품 매출 2건')
+        self.assertEqual(deal['latestQuote']['basisType'], 'delivery')
+        self.assertEqual(deal['latestQuote']['basisDate'], (timezone.localdate() - timedelta(days=1)).isoformat())
+        self.assertIsNone(deal['latestQuote']['quoteDate'])
+        stages = {stage['id']: stage for stage in payload['stages']}
+        self.assertEqual(stages['won']['totalValue'], 3300000)
+
+    def test_pipeline_api_uses_quote_history_items_before_quote_model_fallback(self):
+        from django.utils import timezone
+
+        followup = self._create_pipeline_customer(self.user, '견적히스토리', stage='quote')
+        quote_history = followup.histories.filter(action_type='quote').first()
+        self._create_history_item(quote_history, '히스토리견적품목', 3000000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        deal = next(deal for deal in response.json()['deals'] if deal['id'] == followup.id)
+        self.assertEqual(deal['value'], 3300000)
+        self.assertEqual(deal['latestQuote']['source'], '견적 활동')
+        self.assertEqual(deal['latestQuote']['basisType'], 'history')
+        self.assertEqual(deal['latestQuote']['quoteDate'], timezone.localdate().isoformat())
+        self.assertEqual(deal['latestQuote']['items'][0]['itemName'], '히스토리견적품목')
+        self.assertEqual(deal['latestQuote']['items'][0]['totalPrice'], 3300000)
+
+    def test_pipeline_api_includes_quote_model_items_for_quote_fallback(self):
+        from reporting.models import Product, QuoteItem
+
+        followup = self._create_pipeline_customer(self.user, '견적서품목', stage='quote')
+        quote = followup.quotes.first()
+        product = Product.objects.create(
+            product_code='PIPELINE-QUOTE-ITEM',
+            unit='BOX',
+            standard_price=100000,
+            created_by=self.user,
+        )
+        QuoteItem.objects.create(
+            quote=quote,
+            product=product,
+            quantity=2,
+            unit_price=100000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        deal = next(deal for deal in response.json()['deals'] if deal['id'] == followup.id)
+        self.assertEqual(deal['latestQuote']['basisType'], 'quote')
+        self.assertEqual(deal['latestQuote']['items'][0]['itemName'], 'PIPELINE-QUOTE-ITEM')
+        self.assertEqual(deal['latestQuote']['items'][0]['quantity'], 2)
+        self.assertEqual(deal['latestQuote']['items'][0]['unit'], 'BOX')
+        self.assertEqual(deal['latestQuote']['items'][0]['totalPrice'], 200000)
+
+    def test_pipeline_api_uses_delivery_history_items_for_won_revenue(self):
+        from django.utils import timezone
+        from reporting.models import History
+
+        followup = self._create_pipeline_customer(self.user, '수주히스토리', stage='won')
+        delivery_history = History.objects.create(
+            user=self.user,
+            company=self.user.userprofile.company,
+            followup=followup,
+            action_type='delivery_schedule',
+            content='실제 납품 완료',
+            delivery_date=timezone.localdate(),
+        )
+        self._create_history_item(delivery_history, '히스토리납품품목', 5000000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        deal = next(deal for deal in response.json()['deals'] if deal['id'] == followup.id)
+        self.assertEqual(deal['value'], 5500000)
+        self.assertEqual(deal['latestQuote']['source'], '실제 납품 매출')
+        self.assertEqual(deal['latestQuote']['basisType'], 'delivery')
+        self.assertEqual(deal['quoteComparison']['quotedAmount'], 1100000)
+        self.assertEqual(deal['quoteComparison']['actualAmount'], 5500000)
+        self.assertEqual(deal['quoteComparison']['deltaAmount'], 4400000)
+        self.assertEqual(deal['quoteComparison']['deltaRate'], 400.0)
+        self.assertEqual(deal['quoteComparison']['status'], 'over')
+
+    def test_pipeline_api_keeps_same_department_followups_as_separate_deals(self):
+        """부서가 같아도 건(FollowUp)마다 카드가 따로 나와야 한다 — 부서 단위로 합치지 않는다.
+
+        예: 같은 연구실에 이미 수주한 건과 새로 시작한 견적 건이 같이 있으면
+        둘 다 각자의 카드로 보여야 한다(예전에는 '수주'가 대표로 뽑혀 나머지가
+        묻혔다).
+        """
+        from reporting.models import FollowUp
+
+        professor = self._create_pipeline_customer(self.user, '같은연구실교수', stage='quote')
+        self._create_delivery_item(professor.schedules.first(), '교수견적품목', 84000, 2)
+        researcher = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.user.userprofile.company,
+            customer_name='김종환 연구원',
+            company=professor.company,
+            department=professor.department,
+            pipeline_stage='won',
+            customer_grade='A',
+        )
+        self._create_delivery_schedule(researcher, self.user, '연구원납품품목', 84000, 2)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        deal_ids = {deal['id'] for deal in payload['deals']}
+        self.assertIn(professor.id, deal_ids)
+        self.assertIn(researcher.id, deal_ids)
+
+        professor_deal = next(deal for deal in payload['deals'] if deal['id'] == professor.id)
+        researcher_deal = next(deal for deal in payload['deals'] if deal['id'] == researcher.id)
+        self.assertEqual(professor_deal['stage'], 'quote')
+        self.assertEqual(researcher_deal['stage'], 'won')
+        self.assertEqual(researcher_deal['value'], 184800)
+        self.assertEqual(researcher_deal['latestQuote']['source'], '실제 납품 매출')
+        self.assertEqual(researcher_deal['latestQuote']['basisType'], 'delivery')
+        self.assertEqual(researcher_deal['contactCount'], 1)
+        self.assertEqual(professor_deal['contactCount'], 1)
+        # accountKey는 이제 건(FollowUp) 단위 — 부서가 같아도 겹치면 안 된다.
+        self.assertEqual(professor_deal['accountKey'], f'followup:{professor.id}')
+        self.assertEqual(researcher_deal['accountKey'], f'followup:{researcher.id}')
+        self.assertNotEqual(professor_deal['accountKey'], researcher_deal['accountKey'])
+
+        stages = {stage['id']: stage for stage in payload['stages']}
+        self.assertEqual(stages['won']['count'], 1)
+        self.assertEqual(stages['quote']['count'], 1)
+        self.assertEqual(payload['metrics']['activeCount'], 2)
+
+    def test_pipeline_api_marks_potential_overflow_after_top_ten(self):
+        for index in range(12):
+            self._create_pipeline_customer(self.user, f'잠재{index}', stage='potential')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        potential_deals = [deal for deal in response.json()['deals'] if deal['stage'] == 'potential']
+        self.assertEqual(len(potential_deals), 12)
+        self.assertEqual(sum(1 for deal in potential_deals if deal['isPotentialOverflow']), 2)
+        self.assertTrue(all('attentionScore' in deal for deal in potential_deals))
+        self.assertTrue(all('attentionReason' in deal for deal in potential_deals))
+
+    def test_pipeline_move_updates_accessible_followup_stage(self):
+        followup = self._create_pipeline_customer(self.user, '이동고객', stage='potential')
+        schedule = followup.schedules.first()
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.move_url,
+            data=json.dumps({'followup_id': followup.id, 'stage': 'quote'}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        followup.refresh_from_db()
+        self.assertEqual(followup.pipeline_stage, 'quote')
+        self.assertTrue(followup.pipeline_manually_set)
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.activity_type, 'quote')
+        self.assertEqual(schedule.status, 'scheduled')
+
+    def test_pipeline_move_only_updates_the_moved_followup(self):
+        """카드는 건 단위다 — 같은 부서의 다른 건은 드래그해도 같이 움직이면 안 된다."""
+        from reporting.models import FollowUp
+
+        followup = self._create_pipeline_customer(self.user, '계정이동고객', stage='potential')
+        related = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.user.userprofile.company,
+            customer_name='계정이동실무자',
+            company=followup.company,
+            department=followup.department,
+            pipeline_stage='contact',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.move_url,
+            data=json.dumps({'followup_id': followup.id, 'stage': 'quote'}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(response.json()['updatedCount'], 1)
+        followup.refresh_from_db()
+        related.refresh_from_db()
+        self.assertEqual(followup.pipeline_stage, 'quote')
+        self.assertEqual(related.pipeline_stage, 'contact')
+        self.assertTrue(followup.pipeline_manually_set)
+        self.assertFalse(related.pipeline_manually_set)
+
+    def test_pipeline_move_rejects_invalid_stage(self):
+        followup = self._create_pipeline_customer(self.user, '잘못된단계', stage='potential')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.move_url,
+            data=json.dumps({'followup_id': followup.id, 'stage': 'invalid'}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+        followup.refresh_from_db()
+        self.assertEqual(followup.pipeline_stage, 'potential')
+
+    def test_pipeline_move_rejects_manager(self):
+        followup = self._create_pipeline_customer(self.user, '매니저차단', stage='potential')
+        self.client.force_login(self.manager)
+
+        response = self.client.post(
+            self.move_url,
+            data=json.dumps({'followup_id': followup.id, 'stage': 'quote'}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()['success'])
+        followup.refresh_from_db()
+        self.assertEqual(followup.pipeline_stage, 'potential')
+
+    # ------------------------------------------------------------ 확률 수동 입력
+
+    def test_pipeline_probability_override_wins_over_automatic_calculation(self):
+        followup = self._create_pipeline_customer(self.user, '확률오버라이드', stage='quote')
+        self.client.force_login(self.user)
+        probability_url = reverse('reporting:funnel_pipeline_probability')
+
+        response = self.client.post(
+            probability_url,
+            data=json.dumps({'followup_id': followup.id, 'probability': 42}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(response.json()['probability'], 42)
+        followup.refresh_from_db()
+        self.assertEqual(followup.pipeline_probability_override, 42)
+
+        board_response = self.client.get(self.url)
+        deal = next(deal for deal in board_response.json()['deals'] if deal['id'] == followup.id)
+        self.assertEqual(deal['probability'], 42)
+        self.assertTrue(deal['probabilityOverridden'])
+
+    def test_pipeline_probability_clear_reverts_to_automatic(self):
+        followup = self._create_pipeline_customer(self.user, '확률해제', stage='quote')
+        followup.pipeline_probability_override = 77
+        followup.save(update_fields=['pipeline_probability_override'])
+        self.client.force_login(self.user)
+        probability_url = reverse('reporting:funnel_pipeline_probability')
+
+        response = self.client.post(
+            probability_url,
+            data=json.dumps({'followup_id': followup.id, 'probability': None}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertIsNone(response.json()['probability'])
+        followup.refresh_from_db()
+        self.assertIsNone(followup.pipeline_probability_override)
+
+        board_response = self.client.get(self.url)
+        deal = next(deal for deal in board_response.json()['deals'] if deal['id'] == followup.id)
+        self.assertFalse(deal['probabilityOverridden'])
+
+    def test_pipeline_probability_rejects_out_of_range(self):
+        followup = self._create_pipeline_customer(self.user, '확률범위', stage='quote')
+        self.client.force_login(self.user)
+        probability_url = reverse('reporting:funnel_pipeline_probability')
+
+        response = self.client.post(
+            probability_url,
+            data=json.dumps({'followup_id': followup.id, 'probability': 150}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+        followup.refresh_from_db()
+        self.assertIsNone(followup.pipeline_probability_override)
+
+    def test_pipeline_probability_requires_login(self):
+        followup = self._create_pipeline_customer(self.user, '확률로그인', stage='quote')
+        probability_url = reverse('reporting:funnel_pipeline_probability')
+
+        response = self.client.post(
+            probability_url,
+            data=json.dumps({'followup_id': followup.id, 'probability': 50}),
+            content_type='application/json',
+        )
+
+        self.assertIn(response.status_code, [301, 302, 401])
+
+    def test_pipeline_probability_rejects_manager(self):
+        followup = self._create_pipeline_customer(self.user, '확률매니저차단', stage='quote')
+        self.client.force_login(self.manager)
+        probability_url = reverse('reporting:funnel_pipeline_probability')
+
+        response = self.client.post(
+            probability_url,
+            data=json.dumps({'followup_id': followup.id, 'probability': 50}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        followup.refresh_from_db()
+        self.assertIsNone(followup.pipeline_probability_override)
+
+
+class SchedulePipelineBackfillCommandTests(TestCase):
+    """Existing schedule rows can be synced into the pipeline after deployment."""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='일정파이프라인백필회사')
+        self.user = make_user('schedule_pipeline_backfill', role='salesman', company=self.company)
+        customer_company = Company.objects.create(name='백필거래처', created_by=self.user)
+        department = Department.objects.create(
+            company=customer_company,
+            name='백필연구실',
+            created_by=self.user,
+        )
+        self.followup = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            company=customer_company,
+            department=department,
+            customer_name='백필담당자',
+            pipeline_stage='potential',
+            pipeline_manually_set=True,
+        )
+        self.schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=self.followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(14, 0),
+            status='completed',
+            activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='BACKFILL-WON',
+            quantity=1,
+            unit='EA',
+            unit_price=168000,
+        )
+
+    def test_sync_schedule_pipeline_command_dry_run_reports_delivery_won_without_saving(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        output = StringIO()
+
+        call_command(
+            'sync_schedule_pipeline',
+            '--schedule-id',
+            str(self.schedule.id),
+            '--json',
+            stdout=output,
+        )
+
+        payload = json.loads(output.getvalue())
+        self.assertEqual(payload['mode'], 'dry_run')
+        self.assertEqual(payload['changed'], 1)
+        self.assertEqual(payload['changes'][0]['fromStage'], 'potential')
+        self.assertEqual(payload['changes'][0]['toStage'], 'won')
+        self.assertFalse(payload['changes'][0]['applied'])
+        self.followup.refresh_from_db()
+        self.assertEqual(self.followup.pipeline_stage, 'potential')
+        self.assertTrue(self.followup.pipeline_manually_set)
+
+    def test_sync_schedule_pipeline_command_apply_updates_won_value_for_pipeline_api(self):
+        from io import StringIO
+
+        from django.core.management import call_command
+
+        output = StringIO()
+
+        call_command(
+            'sync_schedule_pipeline',
+            '--schedule-id',
+            str(self.schedule.id),
+            '--apply',
+            '--json',
+            stdout=output,
+        )
+
+        payload = json.loads(output.getvalue())
+        self.assertEqual(payload['mode'], 'apply')
+        self.assertEqual(payload['changed'], 1)
+        self.assertTrue(payload['changes'][0]['applied'])
+        self.followup.refresh_from_db()
+        self.assertEqual(self.followup.pipeline_stage, 'won')
+        self.assertFalse(self.followup.pipeline_manually_set)
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+
+        self.assertEqual(response.status_code, 200)
+        deal = next(item for item in response.json()['deals'] if item['id'] == self.followup.id)
+        self.assertEqual(deal['stage'], 'won')
+        self.assertEqual(deal['stageLabel'], '수주')
+        self.assertEqual(deal['value'], 184800)
+        self.assertEqual(deal['latestQuote']['basisType'], 'delivery')
+
+
+class PipelineHideCardTests(TestCase):
+    """파이프라인 카드 숨김/복원(보드에서만 제거, 데이터 보존)."""
+
+    def setUp(self):
+        self.client = Client()
+        self.company_uc = UserCompany.objects.create(name='파이프회사')
+        self.owner = make_user('pipe_owner', role='salesman', company=self.company_uc)
+        self.manager = make_user('pipe_mgr', role='manager', company=self.company_uc)
+        self.company = Company.objects.create(name='파이프고객사', created_by=self.owner)
+        self.department = Department.objects.create(
+            name='파이프부서', company=self.company, created_by=self.owner,
+        )
+        self.followup = FollowUp.objects.create(
+            user=self.owner, customer_name='파이프고객',
+            company=self.company, department=self.department,
+        )
+
+    def _pipeline(self):
+        self.client.force_login(self.owner)
+        data = self.client.get(reverse('reporting:pipeline_command_center_api')).json()
+        return (
+            [d['id'] for d in data.get('deals', [])],
+            [h['id'] for h in data.get('hiddenDeals', [])],
+        )
+
+    def _post(self, name):
+        return self.client.post(
+            reverse(name),
+            data=json.dumps({'followup_id': self.followup.id}),
+            content_type='application/json',
+        )
+
+    def test_hide_removes_from_board_and_unhide_restores(self):
+        deals, hidden = self._pipeline()
+        self.assertIn(self.followup.id, deals)
+        self.assertNotIn(self.followup.id, hidden)
+
+        self.client.force_login(self.owner)
+        self.assertEqual(self._post('reporting:funnel_pipeline_hide').status_code, 200)
+        self.followup.refresh_from_db()
+        self.assertTrue(self.followup.pipeline_hidden)
+        deals, hidden = self._pipeline()
+        self.assertNotIn(self.followup.id, deals)
+        self.assertIn(self.followup.id, hidden)
+
+        self.client.force_login(self.owner)
+        self.assertEqual(self._post('reporting:funnel_pipeline_unhide').status_code, 200)
+        self.followup.refresh_from_db()
+        self.assertFalse(self.followup.pipeline_hidden)
+        deals, hidden = self._pipeline()
+        self.assertIn(self.followup.id, deals)
+        self.assertNotIn(self.followup.id, hidden)
+
+    def test_hide_preserves_customer_record(self):
+        self.client.force_login(self.owner)
+        self._post('reporting:funnel_pipeline_hide')
+        # 숨겨도 고객 레코드는 그대로 존재
+        self.assertTrue(FollowUp.objects.filter(pk=self.followup.id).exists())
+
+    def test_manager_cannot_hide(self):
+        self.client.force_login(self.manager)
+        self.assertEqual(self._post('reporting:funnel_pipeline_hide').status_code, 403)
+
+    def test_hide_only_affects_the_targeted_followup_not_the_whole_department(self):
+        """카드는 건 단위다 — 같은 부서의 다른 건은 숨기면 같이 숨겨지면 안 된다."""
+        sibling = FollowUp.objects.create(
+            user=self.owner, customer_name='같은부서다른건',
+            company=self.company, department=self.department,
+        )
+        self.client.force_login(self.owner)
+        self.assertEqual(self._post('reporting:funnel_pipeline_hide').status_code, 200)
+        self.followup.refresh_from_db()
+        sibling.refresh_from_db()
+        self.assertTrue(self.followup.pipeline_hidden)
+        self.assertFalse(sibling.pipeline_hidden)
+
+    def test_inactive_contact_does_not_dominate_account_stage(self):
+        # 같은 계정: 활성 견적 연락처 + 비활성 수주 연락처 → 계정 단계는 '견적'(수주가 지배 X).
+        from datetime import time
+        dept = Department.objects.create(
+            name='단계부서', company=self.company, created_by=self.owner,
+        )
+        active_quote = FollowUp.objects.create(
+            user=self.owner, customer_name='활성견적', company=self.company, department=dept,
+            pipeline_stage='quote', is_active=True,
+        )
+        # 견적 단계 카드가 근거 없이 0원이면 이제 보드에서 빠지므로, 이 테스트의
+        # 실제 목적(비활성 연락처가 단계를 지배하지 않는지)을 검증하려면 근거를 심어야 한다.
+        Schedule.objects.create(
+            user=self.owner, company=self.company_uc, followup=active_quote,
+            visit_date=timezone.localdate(), visit_time=time(10, 0),
+            status='completed', activity_type='quote', expected_revenue=1000000,
+        )
+        FollowUp.objects.create(
+            user=self.owner, customer_name='비활성수주', company=self.company, department=dept,
+            pipeline_stage='won', is_active=False,
+        )
+        self.client.force_login(self.owner)
+        data = self.client.get(reverse('reporting:pipeline_command_center_api')).json()
+        account_deal = next((d for d in data['deals'] if d['id'] == active_quote.id), None)
+        self.assertIsNotNone(account_deal, '활성 견적 연락처가 대표 카드여야 한다')
+        self.assertEqual(account_deal['stage'], 'quote')
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 파이프라인 시트 API 테스트 (주간 활동)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class PipelineSheetApiTests(TestCase):
+    """파이프라인 시트: 계정별 주간 활동 검증"""
+
+    def setUp(self):
+        from datetime import timedelta
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='시트API회사')
+        self.user = make_user('sheet_api_me', role='salesman', company=self.company)
+        self.other = make_user('sheet_api_other', role='salesman', company=self.company)
+        self.weekly_url = reverse('reporting:pipeline_sheet_weekly_api')
+        # 지난 주(월~금)를 기준 주로 삼는다 — 시트 기본값과 동일.
+        today = timezone.localdate()
+        this_monday = today - timedelta(days=today.weekday())
+        self.week_start = this_monday - timedelta(days=7)
+        self.week_end = self.week_start + timedelta(days=4)
+
+    def _account(self, owner, name, stage='quote'):
+        from reporting.models import Company, Department, FollowUp
+        customer_company = Company.objects.create(name=name + '업체', created_by=owner)
+        department = Department.objects.create(
+            company=customer_company, name=name + '연구실', created_by=owner,
+        )
+        return FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name=name + '담당자',
+            company=customer_company,
+            department=department,
+            pipeline_stage=stage,
+        )
+
+    def test_weekly_api_requires_login_json(self):
+        response = self.client.get(self.weekly_url)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_weekly_api_groups_activities_by_account_within_the_week(self):
+        from datetime import timedelta
+        from reporting.models import History
+
+        followup = self._account(self.user, '주간활동')
+        History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='customer_meeting', meeting_date=self.week_start,
+            meeting_situation='신규 장비 예산 확보 중',
+            meeting_obstacles='예산 3월 확정',
+            next_action='견적서 재발행',
+            next_action_date=self.week_end + timedelta(days=3),
+        )
+        History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='memo', meeting_date=self.week_end, content='경쟁사 방문했다고 함',
+        )
+        # 기준 주 밖의 활동 — 잡히면 안 됨
+        History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='memo', meeting_date=self.week_start - timedelta(days=10),
+            content='범위 밖 메모',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.weekly_url, {'week': self.week_start.isoformat()})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['week']['start'], self.week_start.isoformat())
+        self.assertEqual(payload['week']['end'], self.week_end.isoformat())
+        row = next(r for r in payload['rows'] if r['department'].startswith('주간활동'))
+        self.assertEqual(row['activityCount'], 2)
+        bodies = [a['body'] for a in row['activities']]
+        self.assertIn('신규 장비 예산 확보 중', bodies)
+        self.assertNotIn('범위 밖 메모', bodies)
+        # 오늘 상황이 있으면 그것을, 없으면 content를 본문으로 쓴다.
+        self.assertIn('경쟁사 방문했다고 함', bodies)
+        self.assertTrue(row['hasObstacle'])
+        self.assertEqual(row['nextAction'], '견적서 재발행')
+
+    def test_weekly_api_reports_quote_and_delivery_amount_for_the_week(self):
+        """미접촉 계정 자리를 대신하는 이번 주 견적/납품 금액 합계."""
+        from datetime import time
+        from reporting.models import DeliveryItem, Schedule
+
+        followup = self._account(self.user, '주간금액')
+        Schedule.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            visit_date=self.week_start, visit_time=time(10, 0),
+            status='completed', activity_type='quote', expected_revenue=3000000,
+        )
+        delivery_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            visit_date=self.week_end, visit_time=time(11, 0),
+            status='completed', activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=delivery_schedule, item_name='장비', quantity=1, unit_price=1000000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.weekly_url, {'week': self.week_start.isoformat()})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['metrics']['quoteAmount'], 3000000)
+        self.assertEqual(payload['metrics']['deliveryAmount'], 1100000)
+        self.assertNotIn('untouchedCount', payload['metrics'])
+        self.assertNotIn('untouchedAmount', payload['metrics'])
+        self.assertNotIn('untouchedAccounts', payload)
+
+    def test_weekly_api_shows_items_label_for_quote_and_delivery_activities(self):
+        """어떤 품목을 했는지 활동 행에서 바로 보여야 한다."""
+        from datetime import time
+        from reporting.models import DeliveryItem, History, Schedule
+
+        followup = self._account(self.user, '품목표시')
+
+        quote_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            visit_date=self.week_start, visit_time=time(9, 0),
+            status='completed', activity_type='quote',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule, item_name='분광광도계', quantity=1, unit='EA', unit_price=5000000,
+        )
+
+        delivery_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            visit_date=self.week_end, visit_time=time(10, 0),
+            status='completed', activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=delivery_schedule, item_name='원심분리기', quantity=2, unit='대', unit_price=1000000,
+        )
+
+        # History가 일정에 연결돼 있을 때는 일정의 품목을 따라간다(fallback 경로).
+        history_with_schedule = History.objects.create(
+            user=self.user, company=self.company, followup=followup, schedule=delivery_schedule,
+            action_type='delivery_schedule', meeting_date=self.week_end,
+        )
+        # 레거시 자유 텍스트만 있는 경우는 그 텍스트를 그대로 보여준다.
+        History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='delivery_schedule', meeting_date=self.week_end,
+            delivery_items='레거시 품목 텍스트',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.weekly_url, {'week': self.week_start.isoformat()})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        row = next(r for r in payload['rows'] if r['department'].startswith('품목표시'))
+        labels = {(a['kind'], a['id']): a['itemsLabel'] for a in row['activities']}
+        self.assertEqual(labels[('schedule', quote_schedule.id)], '분광광도계 1EA')
+        self.assertEqual(labels[('schedule', delivery_schedule.id)], '원심분리기 2대')
+        self.assertEqual(labels[('history', history_with_schedule.id)], '원심분리기 2대')
+        self.assertIn('레거시 품목 텍스트', labels.values())
+
+    def test_weekly_api_scopes_to_own_accounts_for_salesman(self):
+        from reporting.models import History
+        mine = self._account(self.user, '내계정')
+        theirs = self._account(self.other, '남의계정')
+        for followup, owner in ((mine, self.user), (theirs, self.other)):
+            History.objects.create(
+                user=owner, company=self.company, followup=followup,
+                action_type='memo', meeting_date=self.week_start, content='주간 메모',
+            )
+        self.client.force_login(self.user)
+
+        payload = self.client.get(
+            self.weekly_url, {'week': self.week_start.isoformat()}
+        ).json()
+
+        departments = [r['department'] for r in payload['rows']]
+        self.assertTrue(any(d.startswith('내계정') for d in departments))
+        self.assertFalse(any(d.startswith('남의계정') for d in departments))
+
+    # ------------------------------------------------------------ 엑셀
+
+    def test_export_requires_login(self):
+        response = self.client.get(reverse('reporting:pipeline_sheet_export_api'))
+        self.assertEqual(response.status_code, 401)
+
+    def test_export_writes_one_row_per_activity_and_all_sheets(self):
+        """엑셀은 화면 payload를 그대로 쓴다 — 활동 1건이 한 행."""
+        import io as _io
+        from openpyxl import load_workbook
+        from reporting.models import History
+
+        followup = self._account(self.user, '엑셀')
+        History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='customer_meeting', meeting_date=self.week_start,
+            meeting_situation='데모 요청', meeting_obstacles='예산 미확정',
+        )
+        History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='memo', meeting_date=self.week_end, content='재방문 약속',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse('reporting:pipeline_sheet_export_api'),
+            {'week': self.week_start.isoformat()},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment', response['Content-Disposition'])
+        wb = load_workbook(_io.BytesIO(response.content))
+        self.assertEqual(wb.sheetnames, ['주간 활동', '다운로드 정보'])
+        weekly_ws = wb['주간 활동']
+        header = [cell.value for cell in weekly_ws[1]]
+        self.assertEqual(header[8], '품목')
+        bodies = [row[9] for row in weekly_ws.iter_rows(min_row=2, values_only=True)]
+        self.assertIn('데모 요청', bodies)
+        self.assertIn('재방문 약속', bodies)
+
+    # ------------------------------------------------------------ 인라인 수정
+
+    def _update_activity(self, kind, activity_id, patch):
+        return self.client.post(
+            reverse('reporting:pipeline_sheet_activity_update_api', args=[kind, activity_id]),
+            data=json.dumps(patch),
+            content_type='application/json',
+        )
+
+    def test_activity_update_requires_login(self):
+        response = self._update_activity('history', 1, {'body': '내용'})
+        self.assertEqual(response.status_code, 401)
+
+    def test_activity_update_rejects_invalid_kind(self):
+        self.client.force_login(self.user)
+        response = self._update_activity('quote', 1, {'body': '내용'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_activity_update_edits_history_body_obstacle_and_next_action(self):
+        from reporting.models import History
+
+        followup = self._account(self.user, '인라인수정')
+        history = History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='memo', meeting_date=self.week_start, content='원래 메모',
+        )
+        self.client.force_login(self.user)
+
+        response = self._update_activity('history', history.id, {
+            'body': '수정된 메모',
+            'obstacle': '예산 미확정',
+            'nextAction': '견적 재발행',
+            'nextActionDate': (self.week_end + timedelta(days=2)).isoformat(),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['activity']['body'], '수정된 메모')
+        self.assertEqual(payload['activity']['obstacle'], '예산 미확정')
+        self.assertEqual(payload['activity']['nextAction'], '견적 재발행')
+        history.refresh_from_db()
+        self.assertEqual(history.content, '수정된 메모')
+        self.assertEqual(history.meeting_obstacles, '예산 미확정')
+        self.assertEqual(history.next_action, '견적 재발행')
+        self.assertEqual(history.next_action_date, self.week_end + timedelta(days=2))
+
+    def test_activity_update_writes_meeting_situation_for_customer_meeting(self):
+        """`오늘 상황`이 현재 표시 필드면, 같은 필드에 계속 써야 내용이 갈라지지 않는다."""
+        from reporting.models import History
+
+        followup = self._account(self.user, '미팅수정')
+        history = History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='customer_meeting', meeting_date=self.week_start,
+            meeting_situation='기존 상황',
+        )
+        self.client.force_login(self.user)
+
+        response = self._update_activity('history', history.id, {'body': '새 상황'})
+
+        self.assertEqual(response.status_code, 200)
+        history.refresh_from_db()
+        self.assertEqual(history.meeting_situation, '새 상황')
+        self.assertEqual(history.content, None)
+
+    def test_activity_update_clears_next_action_date_when_blank(self):
+        from reporting.models import History
+
+        followup = self._account(self.user, '예정일삭제')
+        history = History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='memo', meeting_date=self.week_start, content='메모',
+            next_action='할 일', next_action_date=self.week_end,
+        )
+        self.client.force_login(self.user)
+
+        response = self._update_activity('history', history.id, {
+            'nextAction': '', 'nextActionDate': '',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        history.refresh_from_db()
+        self.assertEqual(history.next_action, '')
+        self.assertIsNone(history.next_action_date)
+
+    def test_activity_update_edits_schedule_notes(self):
+        from datetime import time
+        from reporting.models import Schedule
+
+        followup = self._account(self.user, '일정메모수정')
+        schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            visit_date=self.week_start, visit_time=time(10, 0),
+            status='scheduled', activity_type='customer_meeting',
+            notes='자동 생성: 영업노트 후속 미팅',
+        )
+        self.client.force_login(self.user)
+
+        response = self._update_activity('schedule', schedule.id, {'body': '방문 전 준비물 확인'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['activity']['body'], '방문 전 준비물 확인')
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.notes, '방문 전 준비물 확인')
+
+    def test_activity_update_blocks_editing_other_users_history(self):
+        from reporting.models import History
+
+        followup = self._account(self.other, '남의기록')
+        history = History.objects.create(
+            user=self.other, company=self.company, followup=followup,
+            action_type='memo', meeting_date=self.week_start, content='남의 메모',
+        )
+        self.client.force_login(self.user)
+
+        response = self._update_activity('history', history.id, {'body': '건드리면 안 됨'})
+
+        self.assertEqual(response.status_code, 403)
+        history.refresh_from_db()
+        self.assertEqual(history.content, '남의 메모')
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 납품 → 파이프라인 '수주' 자동 반영 검증
+# ─────────────────────────────────────────────────────────────────────────────
+
+class DeliveryPipelineSyncTests(TestCase):
+    """납품이 확인되면 카드가 자동으로 '수주'로 옮겨지는지, 여러 건이면 합산되는지 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='납품동기화회사')
+        self.user = make_user('delivery_sync_me', role='salesman', company=self.company)
+
+    def _account(self, name, department_name=None, stage='quote'):
+        from reporting.models import Company, Department, FollowUp
+        customer_company = Company.objects.create(name=name + '업체', created_by=self.user)
+        department = Department.objects.create(
+            company=customer_company, name=department_name or (name + '연구실'),
+            created_by=self.user,
+        )
+        return FollowUp.objects.create(
+            user=self.user, user_company=self.company,
+            customer_name=name + '담당자', company=customer_company,
+            department=department, pipeline_stage=stage,
+        )
+
+    def test_standalone_delivery_history_advances_followup_to_won(self):
+        from reporting.models import History
+        followup = self._account('독립납품')
+
+        History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='delivery_schedule', delivery_amount=1000000,
+        )
+
+        followup.refresh_from_db()
+        self.assertEqual(followup.pipeline_stage, 'won')
+        self.assertFalse(followup.pipeline_manually_set)
+
+    def test_standalone_delivery_history_without_followup_advances_whole_department(self):
+        from reporting.models import Company, Department, FollowUp, History
+        customer_company = Company.objects.create(name='공용업체', created_by=self.user)
+        department = Department.objects.create(
+            company=customer_company, name='공용연구실', created_by=self.user,
+        )
+        followup_a = FollowUp.objects.create(
+            user=self.user, user_company=self.company, customer_name='담당자A',
+            company=customer_company, department=department, pipeline_stage='quote',
+        )
+        followup_b = FollowUp.objects.create(
+            user=self.user, user_company=self.company, customer_name='담당자B',
+            company=customer_company, department=department, pipeline_stage='quote',
+        )
+
+        History.objects.create(
+            user=self.user, company=self.company, department=department,
+            action_type='delivery_schedule', delivery_amount=500000,
+        )
+
+        followup_a.refresh_from_db()
+        followup_b.refresh_from_db()
+        self.assertEqual(followup_a.pipeline_stage, 'won')
+        self.assertEqual(followup_b.pipeline_stage, 'won')
+
+    def test_editing_existing_delivery_history_keeps_pipeline_at_won(self):
+        """delivery_schedule 히스토리를 나중에 고쳐도(.save() 경유) '수주'를 다시 반영한다."""
+        from reporting.models import History
+        followup = self._account('납품수정')
+        history = History.objects.create(
+            user=self.user, company=self.company, followup=followup,
+            action_type='delivery_schedule', delivery_amount=100000,
+        )
+        followup.refresh_from_db()
+        self.assertEqual(followup.pipeline_stage, 'won')
+
+        # 사람이 파이프라인을 다른 단계로 되돌렸다고 가정
+        followup.pipeline_stage = 'negotiation'
+        followup.pipeline_manually_set = True
+        followup.save(update_fields=['pipeline_stage', 'pipeline_manually_set'])
+
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse('reporting:history_update_api', args=[history.id]),
+            {'content': '납품 완료', 'delivery_amount': '200000', 'delivery_items': '시약 추가'},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        followup.refresh_from_db()
+        self.assertEqual(followup.pipeline_stage, 'won')
+
+    def test_delivery_pipeline_value_sums_all_completed_deliveries_this_account(self):
+        """계정이 여러 번 납품했으면 '수주' 카드 금액에 전부 합산돼야 한다(최근 1건만 세던 버그 수정)."""
+        from datetime import time, timedelta
+        from decimal import Decimal
+        from reporting.models import DeliveryItem, Schedule
+
+        followup = self._account('복수납품', stage='won')
+        today = timezone.localdate()
+        expected_total = Decimal('0')
+        for offset, amount in ((60, 1000000), (10, 2000000)):
+            schedule = Schedule.objects.create(
+                user=self.user, company=self.company, followup=followup,
+                visit_date=today - timedelta(days=offset), visit_time=time(10, 0),
+                status='completed', activity_type='delivery',
+            )
+            # DeliveryItem.save()가 total_price를 단가*수량*1.1(부가세)로 재계산한다.
+            item = DeliveryItem.objects.create(
+                schedule=schedule, item_name='장비', quantity=1, unit_price=amount,
+            )
+            expected_total += item.total_price
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+        deal = next(item for item in response.json()['deals'] if item['id'] == followup.id)
+        self.assertEqual(deal['value'], int(expected_total))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 파이프라인 "올해것만" — 연간 리셋 + 금액 연도 스코핑 검증
+# ─────────────────────────────────────────────────────────────────────────────
+
+class PipelineYearResetTests(TestCase):
+    """매년 1월 1일 파이프라인 단계가 잠재로 리셋되고, 금액이 올해 것만 반영되는지 검증"""
+
+    def setUp(self):
+        from reporting.models import Company, Department, FollowUp
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='연간리셋회사')
+        self.user = make_user('year_reset_me', role='salesman', company=self.company)
+        customer_company = Company.objects.create(name='연간리셋업체', created_by=self.user)
+        self.department = Department.objects.create(
+            company=customer_company, name='연간리셋연구실', created_by=self.user,
+        )
+        self.followup = FollowUp.objects.create(
+            user=self.user, user_company=self.company, customer_name='연간리셋담당자',
+            company=customer_company, department=self.department, pipeline_stage='won',
+        )
+
+    def test_ensure_pipeline_year_reset_resets_all_non_potential_stages(self):
+        from datetime import date
+        from reporting.funnel_views import _ensure_pipeline_year_reset
+        from reporting.models import PipelineYearResetLog
+
+        self.followup.pipeline_manually_set = True
+        self.followup.save(update_fields=['pipeline_manually_set'])
+
+        _ensure_pipeline_year_reset(today=date(2099, 1, 1))
+
+        self.followup.refresh_from_db()
+        self.assertEqual(self.followup.pipeline_stage, 'potential')
+        self.assertFalse(self.followup.pipeline_manually_set)
+        self.assertTrue(PipelineYearResetLog.objects.filter(year=2099).exists())
+
+    def test_ensure_pipeline_year_reset_is_idempotent_within_same_year(self):
+        from datetime import date
+        from reporting.funnel_views import _ensure_pipeline_year_reset
+
+        _ensure_pipeline_year_reset(today=date(2099, 1, 1))
+
+        # 리셋 이후 올해 새 활동으로 다시 '수주'가 됐다고 가정
+        self.followup.pipeline_stage = 'won'
+        self.followup.save(update_fields=['pipeline_stage'])
+
+        _ensure_pipeline_year_reset(today=date(2099, 6, 1))
+
+        self.followup.refresh_from_db()
+        self.assertEqual(self.followup.pipeline_stage, 'won')
+
+    def test_ensure_pipeline_year_reset_fires_again_next_year(self):
+        from datetime import date
+        from reporting.funnel_views import _ensure_pipeline_year_reset
+
+        _ensure_pipeline_year_reset(today=date(2099, 1, 1))
+        self.followup.pipeline_stage = 'quote'
+        self.followup.save(update_fields=['pipeline_stage'])
+
+        _ensure_pipeline_year_reset(today=date(2100, 1, 1))
+
+        self.followup.refresh_from_db()
+        self.assertEqual(self.followup.pipeline_stage, 'potential')
+
+    def test_pipeline_command_center_api_triggers_year_reset_automatically(self):
+        from datetime import date
+        from unittest.mock import patch
+        from reporting.models import PipelineYearResetLog
+
+        PipelineYearResetLog.objects.all().delete()
+        self.client.force_login(self.user)
+
+        with patch('reporting.funnel_views.timezone.localdate', return_value=date(2099, 3, 1)):
+            response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+
+        self.assertEqual(response.status_code, 200)
+        self.followup.refresh_from_db()
+        self.assertEqual(self.followup.pipeline_stage, 'potential')
+        self.assertTrue(PipelineYearResetLog.objects.filter(year=2099).exists())
+
+    def test_pipeline_value_excludes_prior_year_delivery(self):
+        """올해 이미 리셋을 거쳐 '수주'로 재확인된 계정이, 작년 납품 금액은 빼고
+        올해 납품만 카드 금액에 반영하는지 검증한다."""
+        from datetime import date, time
+        from unittest.mock import patch
+        from reporting.funnel_views import _ensure_pipeline_year_reset
+        from reporting.models import DeliveryItem, Schedule
+
+        # 올해 리셋이 이미 끝난 상태를 만든 뒤(먼저 리셋 → 그 다음에 다시 '수주'로
+        # 확정) 리셋이 이번 API 호출에서 다시 값을 지우지 않도록 한다.
+        _ensure_pipeline_year_reset(today=date(2099, 1, 1))
+        self.followup.pipeline_stage = 'won'
+        self.followup.save(update_fields=['pipeline_stage'])
+
+        old_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=date(2020, 3, 1), visit_time=time(10, 0),
+            status='completed', activity_type='delivery',
+        )
+        DeliveryItem.objects.create(
+            schedule=old_schedule, item_name='작년 장비', quantity=1, unit_price=5000000,
+        )
+        current_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=date(2099, 2, 1), visit_time=time(10, 0),
+            status='completed', activity_type='delivery',
+        )
+        current_item = DeliveryItem.objects.create(
+            schedule=current_schedule, item_name='올해 장비', quantity=1, unit_price=1000000,
+        )
+
+        self.client.force_login(self.user)
+        with patch('reporting.funnel_views.timezone.localdate', return_value=date(2099, 3, 1)):
+            response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+
+        deal = next(item for item in response.json()['deals'] if item['id'] == self.followup.id)
+        self.assertEqual(deal['value'], int(current_item.total_price))
+
+    def test_pipeline_value_excludes_prior_year_quote(self):
+        """작년 견적은 카드 금액에서 빠지고, 올해 견적만 반영돼야 한다."""
+        from datetime import date, time
+        from unittest.mock import patch
+        from reporting.funnel_views import _ensure_pipeline_year_reset
+        from reporting.models import Quote, Schedule
+
+        _ensure_pipeline_year_reset(today=date(2099, 1, 1))
+        self.followup.pipeline_stage = 'quote'
+        self.followup.save(update_fields=['pipeline_stage'])
+
+        old_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=date(2020, 5, 1), visit_time=time(10, 0),
+            status='completed', activity_type='quote',
+        )
+        old_quote = Quote.objects.create(
+            quote_number='OLD-1', schedule=old_schedule, followup=self.followup, user=self.user,
+            valid_until=date(2020, 12, 31), subtotal=9000000, total_amount=9000000,
+        )
+        # quote_date는 auto_now_add라 생성 시점을 못 정하므로 저장 후 직접 되돌린다.
+        Quote.objects.filter(pk=old_quote.pk).update(quote_date=date(2020, 5, 1))
+
+        current_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=date(2099, 2, 1), visit_time=time(10, 0),
+            status='completed', activity_type='quote',
+        )
+        current_quote = Quote.objects.create(
+            quote_number='NEW-1', schedule=current_schedule, followup=self.followup, user=self.user,
+            valid_until=date(2099, 12, 31), subtotal=2000000, total_amount=2000000,
+        )
+        Quote.objects.filter(pk=current_quote.pk).update(quote_date=date(2099, 2, 1))
+
+        self.client.force_login(self.user)
+        with patch('reporting.funnel_views.timezone.localdate', return_value=date(2099, 3, 1)):
+            response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+
+        deal = next(item for item in response.json()['deals'] if item['id'] == self.followup.id)
+        current_quote.refresh_from_db()
+        self.assertEqual(deal['value'], int(current_quote.total_amount))
+
+    def test_pipeline_hides_advanced_stage_card_with_no_current_year_evidence(self):
+        """근거 없는 진행 단계 카드는 0원으로 남기지 말고 보드에서 아예 뺀다."""
+        from datetime import date, time
+        from unittest.mock import patch
+        from reporting.funnel_views import _ensure_pipeline_year_reset
+        from reporting.models import Quote, Schedule
+
+        _ensure_pipeline_year_reset(today=date(2099, 1, 1))
+        self.followup.pipeline_stage = 'quote'
+        self.followup.save(update_fields=['pipeline_stage'])
+
+        old_schedule = Schedule.objects.create(
+            user=self.user, company=self.company, followup=self.followup,
+            visit_date=date(2020, 5, 1), visit_time=time(10, 0),
+            status='completed', activity_type='quote',
+        )
+        old_quote = Quote.objects.create(
+            quote_number='STALE-1', schedule=old_schedule, followup=self.followup, user=self.user,
+            valid_until=date(2020, 12, 31), subtotal=9000000, total_amount=9000000,
+        )
+        Quote.objects.filter(pk=old_quote.pk).update(quote_date=date(2020, 5, 1))
+
+        self.client.force_login(self.user)
+        with patch('reporting.funnel_views.timezone.localdate', return_value=date(2099, 3, 1)):
+            response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+
+        payload = response.json()
+        self.assertFalse(any(item['id'] == self.followup.id for item in payload['deals']))
+        stages = {stage['id']: stage for stage in payload['stages']}
+        self.assertEqual(stages['quote']['count'], 0)
+
+    def test_pipeline_keeps_potential_card_with_no_evidence(self):
+        """잠재 단계는 원래 근거가 없어도 정상 — 이 규칙에서 제외되어야 한다."""
+        from datetime import date
+        from unittest.mock import patch
+        from reporting.funnel_views import _ensure_pipeline_year_reset
+
+        _ensure_pipeline_year_reset(today=date(2099, 1, 1))
+        self.followup.pipeline_stage = 'potential'
+        self.followup.pipeline_manually_set = False
+        self.followup.save(update_fields=['pipeline_stage', 'pipeline_manually_set'])
+
+        self.client.force_login(self.user)
+        with patch('reporting.funnel_views.timezone.localdate', return_value=date(2099, 3, 1)):
+            response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+
+        payload = response.json()
+        self.assertTrue(any(item['id'] == self.followup.id for item in payload['deals']))
+
+
+class OpportunityRevenueRecomputeTests(TestCase):
+    """영업 기회 수주 금액/실제 매출 일괄 재계산 검증"""
+
+    def setUp(self):
+        from reporting.models import OpportunityTracking
+
+        self.company_profile = UserCompany.objects.create(name='매출재계산회사')
+        self.owner = make_user('revenue_recompute_owner', role='salesman', company=self.company_profile)
+        self.company = Company.objects.create(name='매출재계산고객사', created_by=self.owner)
+        self.department = Department.objects.create(name='매출재계산부서', company=self.company, created_by=self.owner)
+        self.followup = FollowUp.objects.create(
+            user=self.owner,
+            company=self.company,
+            department=self.department,
+            customer_name='매출재계산담당자',
+        )
+        self.won = OpportunityTracking.objects.create(followup=self.followup, title='수주 기회', current_stage='won')
+        self.closing = OpportunityTracking.objects.create(followup=self.followup, title='클로징 기회', current_stage='closing')
+        won_delivery = self._create_delivery(self.won, 'completed')
+        DeliveryItem.objects.create(schedule=won_delivery, item_name='Won Kit', quantity=2, unit='EA', unit_price=1000)
+        closing_delivery = self._create_delivery(self.closing, 'scheduled')
+        DeliveryItem.objects.create(schedule=closing_delivery, item_name='Closing Kit', quantity=3, unit='EA', unit_price=500)
+        self._create_delivery(self.closing, 'cancelled')
+        # 품목 저장 시 납품 합계가 있으면 won으로 옮겨지므로 클로징 단계는 직접 되돌린다.
+        OpportunityTracking.objects.filter(id=self.closing.id).update(current_stage='closing')
+        self.expected = {self.won.id: (0, 2200), self.closing.id: (1650, None)}
+
+    def _create_delivery(self, opportunity, status):
+        return Schedule.objects.create(
+            user=self.owner,
+            company=self.company_profile,
+            followup=self.followup,
+            opportunity=opportunity,
+            visit_date=timezone.localdate(),
+            visit_time=time(9, 0),
+            activity_type='delivery',
+            status=status,
+        )
+
+    def _amounts(self):
+        from reporting.models import OpportunityTracking
+
+        return dict(
+            (row[0], row[1:])
+            for row in OpportunityTracking.objects.values_list('id', 'backlog_amount', 'actual_revenue')
+        )
+
+    def test_command_restores_amounts_with_grouped_queries(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from reporting.models import OpportunityTracking
+
+        OpportunityTracking.objects.update(backlog_amount=1, actual_revenue=1)
+        output = StringIO()
+        call_command('recompute_opportunity_revenue', stdout=output)
+        self.assertEqual(self._amounts(), self.expected)
+        self.assertIn('changed=2', output.getvalue())
+
+        # 기회 수와 무관하게 id 목록·기회 로드·품목 합계·일정 매출 네 번의 조회로 끝난다.
+        output = StringIO()
+        with self.assertNumQueries(4):
+            call_command('recompute_opportunity_revenue', stdout=output)
+        self.assertIn('changed=0', output.getvalue())
+
+    def test_since_only_recomputes_recently_changed_opportunities(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from reporting.models import OpportunityTracking
+
+        past = timezone.now() - timedelta(days=3)
+        OpportunityTracking.objects.update(backlog_amount=1, actual_revenue=1, updated_at=past)
+        Schedule.objects.update(updated_at=past)
+        DeliveryItem.objects.update(updated_at=past)
+        DeliveryItem.objects.filter(schedule__opportunity=self.closing).update(updated_at=timezone.now())
+
+        since = (timezone.now() - timedelta(days=1)).isoformat()
+        call_command('recompute_opportunity_revenue', f'--since={since}', stdout=StringIO())
+
+        amounts = self._amounts()
+        self.assertEqual(amounts[self.closing.id], self.expected[self.closing.id])
+        self.assertEqual(amounts[self.won.id], (1, 1))
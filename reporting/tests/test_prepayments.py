@@ -0,0 +1,770 @@
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+from reporting.models import PrepaymentLedgerEntry, UserCompany
+from reporting.tests.factories import make_user
+
+
+class PrepaymentsSummaryApiTests(TestCase):
+    """React 선결제 현황 API 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='선결제API회사')
+        self.other_company = UserCompany.objects.create(name='선결제API타사회사')
+        self.user = make_user('prepayment_api_me', role='salesman', company=self.company)
+        self.coworker = make_user('prepayment_api_coworker', role='salesman', company=self.company)
+        self.manager = make_user('prepayment_api_manager', role='manager', company=self.company)
+        self.other_user = make_user('prepayment_api_other', role='salesman', company=self.other_company)
+        self.url = reverse('reporting:prepayment_api_list')
+
+    def _create_customer(self, owner, name):
+        from reporting.models import Company, Department, FollowUp
+
+        customer_company = Company.objects.create(name=f'{name} 회사', created_by=owner)
+        department = Department.objects.create(
+            company=customer_company,
+            name=f'{name} 연구실',
+            created_by=owner,
+        )
+        return FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name=f'{name} 담당자',
+            manager=f'{name} 책임자',
+            company=customer_company,
+            department=department,
+        )
+
+    def _create_prepayment(self, owner, name, amount=100000, balance=70000, status='active', payer='입금자'):
+        from django.utils import timezone
+        from reporting.models import Prepayment
+
+        customer = self._create_customer(owner, name)
+        return Prepayment.objects.create(
+            department=customer.department,
+            customer=customer,
+            company=customer.company,
+            amount=amount,
+            balance=balance,
+            payment_date=timezone.localdate(),
+            payer_name=payer,
+            status=status,
+            created_by=owner,
+        )
+
+    def test_prepayment_summary_api_requires_login_json(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_prepayment_summary_api_defaults_to_current_user(self):
+        own = self._create_prepayment(self.user, '내선결제', amount=100000, balance=70000, payer='내입금자')
+        coworker = self._create_prepayment(self.coworker, '동료선결제', amount=200000, balance=200000, payer='동료입금자')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['scope']['dataFilter'], 'me')
+        self.assertFalse(payload['scope']['isViewingOthers'])
+        ids = {item['id'] for item in payload['prepayments']}
+        self.assertIn(own.id, ids)
+        self.assertNotIn(coworker.id, ids)
+        self.assertEqual(payload['metrics']['totalAmount'], 100000)
+        self.assertEqual(payload['metrics']['totalBalance'], 70000)
+        self.assertEqual(payload['metrics']['totalUsed'], 30000)
+        self.assertEqual(payload['links']['create'], reverse('reporting:prepayment_create'))
+        own_payload = payload['prepayments'][0]
+        self.assertEqual(own_payload['payerName'], '내입금자')
+        self.assertEqual(own_payload['customerHref'], f'/customers/{own.customer_id}/')
+        self.assertTrue(own_payload['canManage'])
+
+    def test_prepayment_summary_api_filters_team_scope_search_and_status(self):
+        own = self._create_prepayment(self.user, '내활성', amount=100000, balance=90000, status='active', payer='내입금')
+        coworker = self._create_prepayment(
+            self.coworker,
+            '동료소진',
+            amount=150000,
+            balance=0,
+            status='depleted',
+            payer='동료입금자',
+        )
+        other = self._create_prepayment(
+            self.other_user,
+            '타사소진',
+            amount=999000,
+            balance=0,
+            status='depleted',
+            payer='동료입금자',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url, {
+            'data_filter': 'all',
+            'status': 'depleted',
+            'search': '동료입금자',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['prepayments']}
+        self.assertNotIn(own.id, ids)
+        self.assertIn(coworker.id, ids)
+        self.assertNotIn(other.id, ids)
+        self.assertTrue(payload['scope']['isViewingOthers'])
+        self.assertEqual(payload['filters']['status'], 'depleted')
+        self.assertEqual(payload['metrics']['depletedCount'], 1)
+        self.assertEqual(payload['metrics']['totalAmount'], 150000)
+        self.assertEqual(payload['links']['create'], '')
+
+    def test_manager_prepayment_summary_defaults_to_company_scope_read_only(self):
+        own = self._create_prepayment(self.user, '매니저회사내선결제', amount=100000, balance=70000, payer='내입금')
+        coworker = self._create_prepayment(self.coworker, '매니저동료선결제', amount=200000, balance=50000, payer='동료입금')
+        manager_owned = self._create_prepayment(self.manager, '매니저과거선결제', amount=300000, balance=300000, payer='매니저입금')
+        other = self._create_prepayment(self.other_user, '매니저타사선결제', amount=999000, balance=999000, payer='타사입금')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['scope']['dataFilter'], 'all')
+        self.assertTrue(payload['scope']['isViewingOthers'])
+        ids = {item['id'] for item in payload['prepayments']}
+        self.assertIn(own.id, ids)
+        self.assertIn(coworker.id, ids)
+        self.assertIn(manager_owned.id, ids)
+        self.assertNotIn(other.id, ids)
+        self.assertEqual(payload['links']['create'], '')
+        self.assertEqual(payload['metrics']['totalAmount'], 600000)
+        owners = {item['ownerId']: item['ownerName'] for item in payload['prepayments']}
+        self.assertEqual(owners[self.user.id], self.user.username)
+        self.assertEqual(owners[self.coworker.id], self.coworker.username)
+        self.assertEqual(owners[self.manager.id], self.manager.username)
+        self.assertTrue(all(not item['canManage'] for item in payload['prepayments']))
+
+
+class PrepaymentDetailApiTests(TestCase):
+    """React 선결제 상세/등록/수정 API 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='선결제상세API회사')
+        self.other_company = UserCompany.objects.create(name='선결제상세API타사회사')
+        self.user = make_user('prepayment_detail_me', role='salesman', company=self.company)
+        self.coworker = make_user('prepayment_detail_coworker', role='salesman', company=self.company)
+        self.manager = make_user('prepayment_detail_manager', role='manager', company=self.company)
+        self.other_user = make_user('prepayment_detail_other', role='salesman', company=self.other_company)
+
+    def _create_customer(self, owner, name):
+        from reporting.models import Company, Department, FollowUp
+
+        customer_company = Company.objects.create(name=f'{name} 회사', created_by=owner)
+        department = Department.objects.create(
+            company=customer_company,
+            name=f'{name} 연구실',
+            created_by=owner,
+        )
+        return FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name=f'{name} 담당자',
+            company=customer_company,
+            department=department,
+        )
+
+    def _create_prepayment(self, owner, name='선결제', amount=100000, balance=70000):
+        from django.utils import timezone
+        from reporting.models import Prepayment
+
+        customer = self._create_customer(owner, name)
+        return Prepayment.objects.create(
+            department=customer.department,
+            customer=customer,
+            company=customer.company,
+            amount=amount,
+            balance=balance,
+            payment_date=timezone.localdate(),
+            payment_method='transfer',
+            payer_name=f'{name} 입금자',
+            memo='초기 메모',
+            created_by=owner,
+        )
+
+    def test_prepayment_detail_api_returns_usage_and_edit_config(self):
+        from datetime import time
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, PrepaymentUsage, Schedule
+
+        prepayment = self._create_prepayment(self.user, amount=120000, balance=90000)
+        schedule = Schedule.objects.create(
+            user=self.user,
+            followup=prepayment.customer,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            activity_type='delivery',
+            status='completed',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='테스트 품목',
+            quantity=2,
+            unit='EA',
+            unit_price=15000,
+            total_price=30000,
+        )
+        PrepaymentUsage.objects.create(
+            prepayment=prepayment,
+            schedule=schedule,
+            product_name='테스트 품목',
+            quantity=2,
+            amount=30000,
+            remaining_balance=90000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:prepayment_detail_api', args=[prepayment.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['prepayment']['id'], prepayment.id)
+        self.assertTrue(payload['edit']['canEdit'])
+        self.assertEqual(payload['metrics']['usedAmount'], 30000)
+        self.assertEqual(payload['usages'][0]['amount'], 30000)
+        self.assertEqual(payload['usages'][0]['deliveryItems'][0]['itemName'], '테스트 품목')
+        self.assertEqual(payload['links']['reactEdit'], f'/prepayments/{prepayment.id}/edit/')
+        self.assertTrue(payload['actions']['canCancel'])
+        self.assertFalse(payload['actions']['canDelete'])
+        self.assertIn('1개의 사용 내역', payload['actions']['deleteMessage'])
+        self.assertTrue(payload['actions']['canTransfer'])
+        self.assertEqual(payload['actions']['cancelUrl'], reverse('reporting:prepayment_cancel_api', args=[prepayment.id]))
+        self.assertEqual(payload['actions']['deleteUrl'], reverse('reporting:prepayment_delete_api', args=[prepayment.id]))
+        self.assertEqual(payload['actions']['transferUrl'], reverse('reporting:prepayment_transfer_api', args=[prepayment.id]))
+        self.assertIn(self.coworker.id, [user['id'] for user in payload['actions']['transferUsers']])
+
+    def test_prepayment_detail_api_blocks_other_company(self):
+        prepayment = self._create_prepayment(self.other_user)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:prepayment_detail_api', args=[prepayment.id]))
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_prepayment_create_api_creates_with_initial_balance(self):
+        from reporting.models import Prepayment
+
+        customer = self._create_customer(self.user, '등록고객')
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:prepayment_create_api'), {
+            'department': str(customer.department_id),
+            'customer': str(customer.id),
+            'amount': '250000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'transfer',
+            'payer_name': '등록 입금자',
+            'memo': 'React 등록',
+        })
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        created = Prepayment.objects.get(id=payload['prepaymentId'])
+        self.assertEqual(created.created_by, self.user)
+        self.assertEqual(int(created.amount), 250000)
+        self.assertEqual(int(created.balance), 250000)
+        self.assertEqual(created.company, customer.company)
+        self.assertEqual(created.department, customer.department)
+        self.assertEqual(payload['href'], f'/prepayments/{created.id}/')
+        self.assertTrue(
+            PrepaymentLedgerEntry.objects.filter(
+                prepayment=created,
+                department=customer.department,
+                entry_type=PrepaymentLedgerEntry.ENTRY_DEPOSIT,
+                amount=250000,
+            ).exists()
+        )
+
+    def test_prepayment_create_api_allows_account_first_without_contact_payload(self):
+        from reporting.models import Prepayment
+
+        customer = self._create_customer(self.user, '계정우선등록')
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:prepayment_create_api'), {
+            'department': str(customer.department_id),
+            'amount': '180000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'transfer',
+            'payer_name': '계정 입금자',
+        })
+
+        self.assertEqual(response.status_code, 201)
+        created = Prepayment.objects.get(id=response.json()['prepaymentId'])
+        self.assertEqual(created.department, customer.department)
+        self.assertEqual(created.customer, customer)
+        self.assertEqual(response.json()['prepayment']['departmentId'], customer.department_id)
+
+    def test_manager_cannot_create_or_manage_prepayments_even_when_owner(self):
+        from reporting.models import Prepayment
+
+        customer = self._create_customer(self.user, '매니저등록차단')
+        self.client.force_login(self.manager)
+
+        create_payload = self.client.get(reverse('reporting:prepayment_create_api')).json()
+        self.assertFalse(create_payload['create']['canCreate'])
+        self.assertEqual(create_payload['create']['submitUrl'], '')
+
+        response = self.client.post(reverse('reporting:prepayment_create_api'), {
+            'department': str(customer.department_id),
+            'customer': str(customer.id),
+            'amount': '250000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'transfer',
+            'payer_name': '매니저 입금자',
+        })
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Prepayment.objects.filter(payer_name='매니저 입금자').exists())
+
+        manager_owned = self._create_prepayment(self.manager, name='매니저과거소유')
+        detail = self.client.get(reverse('reporting:prepayment_detail_api', args=[manager_owned.id]))
+        self.assertEqual(detail.status_code, 200)
+        detail_payload = detail.json()
+        self.assertFalse(detail_payload['edit']['canEdit'])
+        self.assertFalse(detail_payload['actions']['canCancel'])
+        self.assertFalse(detail_payload['actions']['canDelete'])
+        self.assertFalse(detail_payload['actions']['canTransfer'])
+        self.assertIn('Manager 계정', detail_payload['edit']['message'])
+
+        denied_update = self.client.post(reverse('reporting:prepayment_update_api', args=[manager_owned.id]), {
+            'department': str(manager_owned.customer.department_id),
+            'customer': str(manager_owned.customer_id),
+            'amount': '100000',
+            'balance': '70000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'transfer',
+            'status': 'active',
+        })
+        self.assertEqual(denied_update.status_code, 403)
+
+        denied_cancel = self.client.post(reverse('reporting:prepayment_cancel_api', args=[manager_owned.id]), {
+            'cancel_reason': '매니저 취소 시도',
+        })
+        self.assertEqual(denied_cancel.status_code, 403)
+
+        denied_delete = self.client.post(reverse('reporting:prepayment_delete_api', args=[manager_owned.id]))
+        self.assertEqual(denied_delete.status_code, 403)
+
+        denied_transfer = self.client.post(reverse('reporting:prepayment_transfer_api', args=[manager_owned.id]), {
+            'target_user': str(self.coworker.id),
+            'reason': '매니저 이관 시도',
+        })
+        self.assertEqual(denied_transfer.status_code, 403)
+        manager_owned.refresh_from_db()
+        self.assertEqual(manager_owned.created_by, self.manager)
+
+    def test_prepayment_update_api_only_owner_and_validates_balance(self):
+        prepayment = self._create_prepayment(self.user, amount=100000, balance=80000)
+
+        self.client.force_login(self.coworker)
+        denied = self.client.post(reverse('reporting:prepayment_update_api', args=[prepayment.id]), {
+            'department': str(prepayment.customer.department_id),
+            'customer': str(prepayment.customer_id),
+            'amount': '100000',
+            'balance': '70000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'transfer',
+            'status': 'active',
+        })
+        self.assertEqual(denied.status_code, 403)
+
+        self.client.force_login(self.user)
+        invalid = self.client.post(reverse('reporting:prepayment_update_api', args=[prepayment.id]), {
+            'department': str(prepayment.customer.department_id),
+            'customer': str(prepayment.customer_id),
+            'amount': '100000',
+            'balance': '120000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'transfer',
+            'status': 'active',
+        })
+        self.assertEqual(invalid.status_code, 400)
+
+        response = self.client.post(reverse('reporting:prepayment_update_api', args=[prepayment.id]), {
+            'department': str(prepayment.customer.department_id),
+            'customer': str(prepayment.customer_id),
+            'amount': '110000',
+            'balance': '70000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'card',
+            'payer_name': '수정 입금자',
+            'status': 'active',
+            'memo': 'React 수정',
+        })
+        self.assertEqual(response.status_code, 200)
+        prepayment.refresh_from_db()
+        self.assertEqual(int(prepayment.amount), 110000)
+        self.assertEqual(int(prepayment.balance), 70000)
+        self.assertEqual(prepayment.payment_method, 'card')
+        self.assertEqual(prepayment.memo, 'React 수정')
+        self.assertTrue(
+            PrepaymentLedgerEntry.objects.filter(
+                prepayment=prepayment,
+                entry_type=PrepaymentLedgerEntry.ENTRY_ADJUSTMENT,
+                balance_before=80000,
+                balance_after=70000,
+            ).exists()
+        )
+
+    def test_prepayment_update_api_keeps_contact_auxiliary_when_omitted(self):
+        prepayment = self._create_prepayment(self.user, name='보조담당자', amount=100000, balance=80000)
+        original_customer = prepayment.customer
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:prepayment_update_api', args=[prepayment.id]), {
+            'department': str(original_customer.department_id),
+            'amount': '100000',
+            'balance': '75000',
+            'payment_date': '2026-05-10',
+            'payment_method': 'transfer',
+            'status': 'active',
+            'memo': '담당자 미지정 수정',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        prepayment.refresh_from_db()
+        self.assertEqual(prepayment.department_id, original_customer.department_id)
+        self.assertEqual(prepayment.customer_id, original_customer.id)
+        self.assertEqual(int(prepayment.balance), 75000)
+
+    def test_prepayment_cancel_api_only_owner_and_records_reason(self):
+        prepayment = self._create_prepayment(self.user)
+
+        self.client.force_login(self.coworker)
+        denied = self.client.post(reverse('reporting:prepayment_cancel_api', args=[prepayment.id]), {
+            'cancel_reason': '동료 취소 시도',
+        })
+        self.assertEqual(denied.status_code, 403)
+
+        self.client.force_login(self.user)
+        response = self.client.post(reverse('reporting:prepayment_cancel_api', args=[prepayment.id]), {
+            'cancel_reason': 'React 취소',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        prepayment.refresh_from_db()
+        self.assertEqual(prepayment.status, 'cancelled')
+        self.assertEqual(prepayment.cancel_reason, 'React 취소')
+        self.assertIsNotNone(prepayment.cancelled_at)
+        self.assertEqual(payload['prepayment']['status'], 'cancelled')
+        self.assertTrue(
+            PrepaymentLedgerEntry.objects.filter(
+                prepayment=prepayment,
+                entry_type=PrepaymentLedgerEntry.ENTRY_CANCELLATION,
+                memo='React 취소',
+            ).exists()
+        )
+
+    def test_prepayment_delete_api_blocks_used_records_and_deletes_unused(self):
+        from reporting.models import Prepayment, PrepaymentUsage
+
+        used_prepayment = self._create_prepayment(self.user)
+        PrepaymentUsage.objects.create(
+            prepayment=used_prepayment,
+            product_name='삭제 차단 품목',
+            quantity=1,
+            amount=10000,
+            remaining_balance=60000,
+        )
+        self.client.force_login(self.user)
+
+        blocked = self.client.post(reverse('reporting:prepayment_delete_api', args=[used_prepayment.id]))
+        self.assertEqual(blocked.status_code, 400)
+        self.assertTrue(Prepayment.objects.filter(id=used_prepayment.id).exists())
+
+        unused_prepayment = self._create_prepayment(self.user, name='삭제가능')
+        deleted = self.client.post(reverse('reporting:prepayment_delete_api', args=[unused_prepayment.id]))
+
+        self.assertEqual(deleted.status_code, 200)
+        self.assertTrue(deleted.json()['success'])
+        self.assertEqual(deleted.json()['href'], '/prepayments/')
+        self.assertFalse(Prepayment.objects.filter(id=unused_prepayment.id).exists())
+
+    def test_prepayment_transfer_api_moves_owner_and_appends_memo(self):
+        prepayment = self._create_prepayment(self.user)
+        self.client.force_login(self.user)
+
+        other_company_response = self.client.post(reverse('reporting:prepayment_transfer_api', args=[prepayment.id]), {
+            'target_user': str(self.other_user.id),
+            'reason': '타사 이관 시도',
+        })
+        self.assertEqual(other_company_response.status_code, 400)
+
+        response = self.client.post(reverse('reporting:prepayment_transfer_api', args=[prepayment.id]), {
+            'target_user': str(self.coworker.id),
+            'reason': '담당자 변경',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['prepayment']['ownerId'], self.coworker.id)
+        self.assertFalse(payload['prepayment']['canManage'])
+
+        prepayment.refresh_from_db()
+        self.assertEqual(prepayment.created_by, self.coworker)
+        self.assertIn('[이관]', prepayment.memo)
+        self.assertIn('담당자 변경', prepayment.memo)
+        self.assertTrue(
+            PrepaymentLedgerEntry.objects.filter(
+                prepayment=prepayment,
+                entry_type=PrepaymentLedgerEntry.ENTRY_TRANSFER,
+                actor=self.user,
+                target_user=self.coworker,
+            ).exists()
+        )
+
+        detail = self.client.get(reverse('reporting:prepayment_detail_api', args=[prepayment.id]))
+        self.assertEqual(detail.status_code, 200)
+        detail_payload = detail.json()
+        self.assertFalse(detail_payload['edit']['canEdit'])
+        self.assertFalse(detail_payload['actions']['canTransfer'])
+
+
+class PrepaymentCustomerApiTests(TestCase):
+    """React 고객별/부서별 선결제 API 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='고객별선결제API회사')
+        self.other_company = UserCompany.objects.create(name='고객별선결제API타사회사')
+        self.user = make_user('prepayment_customer_me', role='salesman', company=self.company)
+        self.coworker = make_user('prepayment_customer_coworker', role='salesman', company=self.company)
+        self.manager = make_user('prepayment_customer_manager', role='manager', company=self.company)
+        self.other_user = make_user('prepayment_customer_other', role='salesman', company=self.other_company)
+
+    def _create_department_customers(self, owner=None):
+        from reporting.models import Company, Department, FollowUp
+
+        owner = owner or self.user
+        customer_company = Company.objects.create(name=f'고객별선결제 고객사 {owner.username}', created_by=owner)
+        department = Department.objects.create(
+            company=customer_company,
+            name='공동 연구실',
+            created_by=owner,
+        )
+        first = FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name='1번 담당자',
+            company=customer_company,
+            department=department,
+        )
+        second = FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name='2번 담당자',
+            company=customer_company,
+            department=department,
+        )
+        return customer_company, department, first, second
+
+    def _create_prepayment(self, owner, customer, amount=100000, balance=70000, status='active', payer='입금자'):
+        from django.utils import timezone
+        from reporting.models import Prepayment
+
+        return Prepayment.objects.create(
+            department=customer.department,
+            customer=customer,
+            company=customer.company,
+            amount=amount,
+            balance=balance,
+            payment_date=timezone.localdate(),
+            payment_method='transfer',
+            payer_name=payer,
+            memo='고객별 메모',
+            status=status,
+            created_by=owner,
+        )
+
+    def test_customer_prepayment_api_returns_department_scope_and_metrics(self):
+        _company, department, first, second = self._create_department_customers()
+        self._create_prepayment(self.user, first, amount=100000, balance=70000, status='active', payer='첫 입금')
+        self._create_prepayment(self.user, second, amount=200000, balance=0, status='depleted', payer='둘째 입금')
+        self._create_prepayment(self.coworker, first, amount=500000, balance=500000, payer='동료 입금')
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:prepayment_customer_api', args=[first.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['scope']['mode'], 'department')
+        self.assertEqual(payload['customer']['departmentId'], department.id)
+        self.assertEqual(payload['scope']['targetUserId'], self.user.id)
+        self.assertEqual(len(payload['departmentCustomers']), 2)
+        self.assertEqual(payload['metrics']['totalAmount'], 300000)
+        self.assertEqual(payload['metrics']['totalBalance'], 70000)
+        self.assertEqual(payload['metrics']['totalUsed'], 230000)
+        self.assertEqual(payload['metrics']['totalCount'], 2)
+        self.assertEqual(payload['metrics']['activeCount'], 1)
+        self.assertEqual(payload['metrics']['depletedCount'], 1)
+        self.assertEqual([item['customerId'] for item in payload['prepayments']], [first.id, second.id])
+        self.assertEqual(payload['links']['reactAccount'], f'/prepayments/account/{department.id}/')
+        self.assertEqual(payload['links']['reactCustomer'], f'/prepayments/customer/{first.id}/')
+        self.assertEqual(payload['links']['accountDetail'], f'/accounts/{department.id}/')
+        self.assertEqual(payload['links']['djangoExcel'], reverse('reporting:prepayment_customer_excel', args=[first.id]))
+        self.assertEqual(payload['prepayments'][0]['customerPrepaymentHref'], f'/prepayments/account/{department.id}/')
+
+    def test_account_prepayment_api_returns_department_scope_and_metrics(self):
+        from datetime import time
+        from reporting.models import DeliveryItem, PrepaymentLedgerEntry, PrepaymentUsage, Schedule
+
+        _company, department, first, second = self._create_department_customers()
+        first_prepayment = self._create_prepayment(self.user, first, amount=110000, balance=90000, status='active', payer='계정 첫 입금')
+        self._create_prepayment(self.user, second, amount=220000, balance=20000, status='active', payer='계정 둘째 입금')
+        self._create_prepayment(self.coworker, first, amount=500000, balance=500000, payer='동료 입금')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            followup=first,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 30),
+            activity_type='delivery',
+            status='completed',
+            use_prepayment=True,
+            prepayment=first_prepayment,
+            prepayment_amount=20000,
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='계정 차감 품목',
+            quantity=1,
+            unit='EA',
+            unit_price=20000,
+            total_price=20000,
+        )
+        usage = PrepaymentUsage.objects.create(
+            prepayment=first_prepayment,
+            schedule=schedule,
+            product_name='계정 차감 품목',
+            quantity=1,
+            amount=20000,
+            remaining_balance=90000,
+        )
+        PrepaymentLedgerEntry.objects.create(
+            prepayment=first_prepayment,
+            department=department,
+            customer=first,
+            schedule=schedule,
+            usage=usage,
+            entry_type=PrepaymentLedgerEntry.ENTRY_DELIVERY_DEDUCTION,
+            amount=20000,
+            balance_before=110000,
+            balance_after=90000,
+            actor=self.user,
+            memo='계정 차감 테스트',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:prepayment_account_api', args=[department.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['scope']['mode'], 'department')
+        self.assertEqual(payload['customer']['departmentId'], department.id)
+        self.assertEqual(payload['scope']['targetUserId'], self.user.id)
+        self.assertEqual(payload['metrics']['totalAmount'], 330000)
+        self.assertEqual(payload['metrics']['totalBalance'], 110000)
+        self.assertEqual(payload['metrics']['totalUsed'], 220000)
+        self.assertEqual(payload['metrics']['deductionCount'], 1)
+        self.assertGreaterEqual(payload['metrics']['ledgerCount'], 1)
+        self.assertEqual([item['customerId'] for item in payload['prepayments']], [first.id, second.id])
+        self.assertEqual(payload['balanceRows'][0]['departmentId'], department.id)
+        self.assertEqual(payload['deductionRows'][0]['amount'], 20000)
+        self.assertEqual(payload['deductionRows'][0]['deliveryItems'][0]['itemName'], '계정 차감 품목')
+        self.assertEqual(payload['ledgerEntries'][0]['entryType'], PrepaymentLedgerEntry.ENTRY_DELIVERY_DEDUCTION)
+        self.assertEqual(payload['links']['reactAccount'], f'/prepayments/account/{department.id}/')
+        self.assertEqual(payload['links']['accountDetail'], f'/accounts/{department.id}/')
+        self.assertEqual(payload['links']['accountExcel'], reverse('reporting:prepayment_account_excel', args=[department.id]))
+
+        excel_response = self.client.get(reverse('reporting:prepayment_account_excel', args=[department.id]))
+        self.assertEqual(excel_response.status_code, 200)
+        self.assertIn('spreadsheetml.sheet', excel_response['Content-Type'])
+
+    def test_account_prepayment_api_allows_salesman_with_own_prepayment_and_blocks_unrelated(self):
+        _company, department, first, _second = self._create_department_customers(owner=self.coworker)
+        self._create_prepayment(self.user, first, amount=90000, balance=50000, payer='계정 접근 허용 입금')
+
+        self.client.force_login(self.user)
+        allowed = self.client.get(reverse('reporting:prepayment_account_api', args=[department.id]))
+        self.assertEqual(allowed.status_code, 200)
+        self.assertEqual(allowed.json()['metrics']['totalAmount'], 90000)
+
+        self.client.force_login(self.other_user)
+        blocked = self.client.get(reverse('reporting:prepayment_account_api', args=[department.id]))
+        self.assertEqual(blocked.status_code, 403)
+
+    def test_customer_prepayment_api_uses_selected_accessible_user_for_manager(self):
+        _company, _department, first, _second = self._create_department_customers()
+        self._create_prepayment(self.user, first, amount=100000, balance=100000, payer='내 입금')
+        self._create_prepayment(self.coworker, first, amount=250000, balance=150000, payer='동료 입금')
+        session = self.client.session
+        session['selected_user_id'] = str(self.coworker.id)
+        session.save()
+        self.client.force_login(self.manager)
+
+        response = self.client.get(reverse('reporting:prepayment_customer_api', args=[first.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['scope']['canSelectUser'])
+        self.assertEqual(payload['scope']['targetUserId'], self.coworker.id)
+        self.assertEqual(payload['metrics']['totalAmount'], 250000)
+        self.assertEqual(len(payload['prepayments']), 1)
+        self.assertEqual(payload['prepayments'][0]['ownerId'], self.coworker.id)
+
+    def test_customer_prepayment_api_manager_defaults_to_company_all_users(self):
+        _company, _department, first, _second = self._create_department_customers()
+        self._create_prepayment(self.user, first, amount=100000, balance=100000, payer='내 입금')
+        self._create_prepayment(self.coworker, first, amount=250000, balance=150000, payer='동료 입금')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(reverse('reporting:prepayment_customer_api', args=[first.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['scope']['canSelectUser'])
+        self.assertTrue(payload['scope']['isAllUsers'])
+        self.assertIsNone(payload['scope']['targetUserId'])
+        self.assertEqual(payload['metrics']['totalAmount'], 350000)
+        owner_ids = {item['ownerId'] for item in payload['prepayments']}
+        self.assertEqual(owner_ids, {self.user.id, self.coworker.id})
+        self.assertTrue(all(not item['canManage'] for item in payload['prepayments']))
+
+    def test_customer_prepayment_api_allows_salesman_with_own_prepayment_and_blocks_unrelated(self):
+        _company, _department, first, _second = self._create_department_customers(owner=self.coworker)
+        self._create_prepayment(self.user, first, amount=90000, balance=50000, payer='접근 허용 입금')
+
+        self.client.force_login(self.user)
+        allowed = self.client.get(reverse('reporting:prepayment_customer_api', args=[first.id]))
+        self.assertEqual(allowed.status_code, 200)
+        self.assertEqual(allowed.json()['metrics']['totalAmount'], 90000)
+
+        self.client.force_login(self.other_user)
+        blocked = self.client.get(reverse('reporting:prepayment_customer_api', args=[first.id]))
+        self.assertEqual(blocked.status_code, 403)
+
+    def test_customer_prepayment_api_requires_login(self):
+        _company, _department, first, _second = self._create_department_customers()
+
+        response = self.client.get(reverse('reporting:prepayment_customer_api', args=[first.id]))
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
@@ -0,0 +1,651 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, Client
+from django.urls import reverse
+from reporting.models import UserCompany
+from reporting.tests.factories import make_user
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 8.5: 제품 규격/단위 저장 테스트 (Bug 1)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ProductSpecificationSaveTests(TestCase):
+    """제품 생성/수정 시 specification 및 unit 필드가 올바르게 저장되는지 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='제품테스트회사')
+        self.salesman = make_user('prod_salesman', role='salesman', company=self.company)
+        self.client.force_login(self.salesman)
+
+    def test_product_create_saves_specification(self):
+        """일반 폼 제출로 제품 생성 시 specification 저장"""
+        from reporting.models import Product
+        response = self.client.post(
+            reverse('reporting:product_create'),
+            {
+                'product_code': 'TEST-SPEC-001',
+                'standard_price': '10000',
+                'specification': '100x200mm',
+                'unit': 'EA',
+                'is_active': 'on',
+            },
+        )
+        # 성공 시 목록으로 리다이렉트
+        self.assertIn(response.status_code, [200, 302])
+        product = Product.objects.filter(product_code='TEST-SPEC-001').first()
+        self.assertIsNotNone(product, '제품이 생성되어야 합니다')
+        self.assertEqual(product.specification, '100x200mm',
+                         '규격(specification)이 저장되어야 합니다')
+
+    def test_product_create_saves_unit(self):
+        """일반 폼 제출로 제품 생성 시 unit 저장"""
+        from reporting.models import Product
+        self.client.post(
+            reverse('reporting:product_create'),
+            {
+                'product_code': 'TEST-UNIT-001',
+                'standard_price': '5000',
+                'specification': '',
+                'unit': 'SET',
+                'is_active': 'on',
+            },
+        )
+        product = Product.objects.filter(product_code='TEST-UNIT-001').first()
+        self.assertIsNotNone(product, '제품이 생성되어야 합니다')
+        self.assertEqual(product.unit, 'SET', '단위(unit)가 저장되어야 합니다')
+
+    def test_product_edit_saves_specification(self):
+        """제품 수정 시 specification 저장"""
+        from reporting.models import Product
+        product = Product.objects.create(
+            product_code='EDIT-SPEC-001',
+            standard_price=1000,
+            specification='',
+            unit='EA',
+            created_by=self.salesman,
+        )
+        self.client.post(
+            reverse('reporting:product_edit', args=[product.pk]),
+            {
+                'product_code': 'EDIT-SPEC-001',
+                'standard_price': '1000',
+                'specification': '200x300mm',
+                'unit': 'EA',
+                'is_active': 'on',
+            },
+        )
+        product.refresh_from_db()
+        self.assertEqual(product.specification, '200x300mm',
+                         '수정된 규격(specification)이 저장되어야 합니다')
+
+    def test_product_edit_saves_unit(self):
+        """제품 수정 시 unit 저장"""
+        from reporting.models import Product
+        product = Product.objects.create(
+            product_code='EDIT-UNIT-001',
+            standard_price=1000,
+            specification='',
+            unit='EA',
+            created_by=self.salesman,
+        )
+        self.client.post(
+            reverse('reporting:product_edit', args=[product.pk]),
+            {
+                'product_code': 'EDIT-UNIT-001',
+                'standard_price': '1000',
+                'specification': '',
+                'unit': 'BOX',
+                'is_active': 'on',
+            },
+        )
+        product.refresh_from_db()
+        self.assertEqual(product.unit, 'BOX',
+                         '수정된 단위(unit)가 저장되어야 합니다')
+
+    def test_product_edit_existing_data_preserved(self):
+        """제품 수정 시 기존 데이터(가격 등)가 보존됨"""
+        from reporting.models import Product
+        from decimal import Decimal
+        product = Product.objects.create(
+            product_code='PRES-001',
+            standard_price=Decimal('9999'),
+            specification='기존규격',
+            unit='EA',
+            created_by=self.salesman,
+        )
+        self.client.post(
+            reverse('reporting:product_edit', args=[product.pk]),
+            {
+                'product_code': 'PRES-001',
+                'standard_price': '9999',
+                'specification': '새규격',
+                'unit': 'EA',
+                'is_active': 'on',
+            },
+        )
+        product.refresh_from_db()
+        self.assertEqual(product.standard_price, Decimal('9999'),
+                         '수정 후 기존 가격이 보존되어야 합니다')
+        self.assertEqual(product.specification, '새규격')
+
+
+class ProductManagementReactApiTests(TestCase):
+    """React 제품관리 API 회귀 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='제품React회사')
+        self.salesman = make_user('product-react-sales', role='salesman', company=self.company)
+        self.manager = make_user('product-react-manager', role='manager', company=self.company)
+        self.client.force_login(self.salesman)
+
+    def _uploaded_products_xlsx(self, rows, filename='products-upload.xlsx'):
+        from io import BytesIO
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        for row in rows:
+            sheet.append(row)
+        output = BytesIO()
+        workbook.save(output)
+        workbook.close()
+        output.seek(0)
+        return SimpleUploadedFile(
+            filename,
+            output.read(),
+            content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        )
+
+    def test_product_bulk_upsert_updates_existing_ecount_overlap_and_disables_promo(self):
+        import json
+        from decimal import Decimal
+        from reporting.models import Product
+
+        existing = Product.objects.create(
+            product_code='ECOUNT-001',
+            description='기존 설명',
+            specification='OLD',
+            unit='EA',
+            standard_price=Decimal('1000'),
+            is_promo=True,
+            promo_price=Decimal('800'),
+            created_by=self.salesman,
+        )
+        no_description_row = Product.objects.create(
+            product_code='ECOUNT-003',
+            description='보존할 설명',
+            specification='OLD-SPEC',
+            unit='EA',
+            standard_price=Decimal('3000'),
+            created_by=self.salesman,
+        )
+
+        response = self.client.post(
+            reverse('reporting:products_bulk_upsert_api'),
+            data=json.dumps({
+                'products': [
+                    {
+                        'productCode': 'ECOUNT-001',
+                        'description': '새 설명',
+                        'specification': 'NEW',
+                        'unit': 'BOX',
+                        'standardPrice': '1500',
+                    },
+                    {
+                        'productCode': 'ECOUNT-002',
+                        'description': '신규 설명',
+                        'specification': 'SPEC',
+                        'unit': 'SET',
+                        'standardPrice': '2500',
+                    },
+                    {
+                        'productCode': 'ECOUNT-003',
+                        'specification': 'NEW-SPEC',
+                        'unit': 'EA',
+                        'standardPrice': '3300',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['createdCount'], 1)
+        self.assertEqual(payload['updatedCount'], 2)
+        existing.refresh_from_db()
+        self.assertEqual(existing.description, '새 설명')
+        self.assertEqual(existing.specification, 'NEW')
+        self.assertEqual(existing.unit, 'BOX')
+        self.assertEqual(existing.standard_price, Decimal('1500'))
+        self.assertFalse(existing.is_promo)
+        self.assertIsNone(existing.promo_price)
+        no_description_row.refresh_from_db()
+        self.assertEqual(no_description_row.description, '보존할 설명')
+        self.assertEqual(no_description_row.specification, 'NEW-SPEC')
+        self.assertEqual(no_description_row.standard_price, Decimal('3300'))
+        created = Product.objects.get(product_code='ECOUNT-002')
+        self.assertEqual(created.created_by, self.salesman)
+
+    def test_product_current_price_ignores_legacy_promotion(self):
+        from decimal import Decimal
+        from reporting.models import Product
+
+        product = Product.objects.create(
+            product_code='PROMO-OFF-001',
+            standard_price=Decimal('1000'),
+            is_promo=True,
+            promo_price=Decimal('700'),
+            created_by=self.salesman,
+        )
+
+        response = self.client.get(reverse('reporting:product_api_list'), {'search': 'PROMO-OFF'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()['products'][0]
+        self.assertEqual(payload['current_price'], 1000.0)
+        self.assertFalse(payload['is_promo'])
+        self.assertEqual(product.get_current_price(), Decimal('1000'))
+
+    def test_product_api_list_supports_limit_and_specification_search(self):
+        from reporting.models import Product
+
+        for index in range(5):
+            Product.objects.create(
+                product_code=f'LIMIT-SEARCH-{index}',
+                specification='공통규격',
+                standard_price=1000 + index,
+                created_by=self.salesman,
+            )
+        Product.objects.create(
+            product_code='LIMIT-SPEC-ONLY',
+            specification='특수규격',
+            standard_price=2000,
+            created_by=self.salesman,
+        )
+
+        response = self.client.get(reverse('reporting:product_api_list'), {'search': '특수규격', 'limit': '2'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['count'], 1)
+        self.assertEqual(payload['totalCount'], 1)
+        self.assertFalse(payload['hasMore'])
+        self.assertEqual(payload['products'][0]['product_code'], 'LIMIT-SPEC-ONLY')
+
+        response = self.client.get(reverse('reporting:product_api_list'), {'search': 'LIMIT-SEARCH', 'limit': '2'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['count'], 2)
+        self.assertEqual(payload['totalCount'], 5)
+        self.assertTrue(payload['hasMore'])
+
+    def test_product_management_manager_is_read_only_for_company_products(self):
+        import json
+        from reporting.models import Product
+
+        product = Product.objects.create(
+            product_code='MANAGER-READONLY-001',
+            description='manager visible product',
+            standard_price=1000,
+            created_by=self.salesman,
+        )
+        other_company = UserCompany.objects.create(name='제품React타사회사')
+        other_user = make_user('product-react-other-sales', role='salesman', company=other_company)
+        Product.objects.create(
+            product_code='MANAGER-READONLY-OTHER',
+            standard_price=2000,
+            created_by=other_user,
+        )
+        self.client.force_login(self.manager)
+
+        response = self.client.get(reverse('reporting:products_management_api'), {'q': 'MANAGER-READONLY'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertFalse(payload['scope']['canManage'])
+        self.assertEqual(payload['links']['save'], '')
+        self.assertEqual(payload['links']['bulkUpsert'], '')
+        self.assertEqual(payload['links']['bulkDelete'], '')
+        self.assertEqual(payload['links']['excelImport'], '')
+        product_codes = {item['productCode'] for item in payload['products']}
+        self.assertIn(product.product_code, product_codes)
+        self.assertNotIn('MANAGER-READONLY-OTHER', product_codes)
+        visible = next(item for item in payload['products'] if item['productCode'] == product.product_code)
+        self.assertEqual(visible['createdBy'], self.salesman.username)
+
+        save_response = self.client.post(
+            reverse('reporting:product_save_api'),
+            data=json.dumps({
+                'productCode': 'MANAGER-READONLY-NEW',
+                'standardPrice': '3000',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(save_response.status_code, 403)
+
+        edit_response = self.client.post(
+            reverse('reporting:product_update_api', args=[product.id]),
+            data=json.dumps({
+                'productCode': product.product_code,
+                'standardPrice': '9999',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(edit_response.status_code, 403)
+
+        bulk_response = self.client.post(
+            reverse('reporting:products_bulk_upsert_api'),
+            data=json.dumps({'products': [{'productCode': 'MANAGER-BULK', 'standardPrice': '100'}]}),
+            content_type='application/json',
+        )
+        self.assertEqual(bulk_response.status_code, 403)
+
+        delete_response = self.client.post(
+            reverse('reporting:products_bulk_delete_api'),
+            data=json.dumps({'productCodes': [product.product_code]}),
+            content_type='application/json',
+        )
+        self.assertEqual(delete_response.status_code, 403)
+        product.refresh_from_db()
+        self.assertEqual(product.standard_price, 1000)
+
+        import_response = self.client.post(
+            reverse('reporting:products_excel_import_api'),
+            {'file': self._uploaded_products_xlsx([['품번', '기준단가'], ['MANAGER-XLSX', 1000]])},
+        )
+        self.assertEqual(import_response.status_code, 403)
+
+    def test_product_management_includes_selected_product_outside_first_page(self):
+        from reporting.models import Product
+
+        for index in range(55):
+            Product.objects.create(
+                product_code=f'PAGE-PRODUCT-{index:03d}',
+                standard_price=1000 + index,
+                created_by=self.salesman,
+            )
+        selected = Product.objects.create(
+            product_code='ZZZ-SELECTED-LEGACY',
+            standard_price=9999,
+            created_by=self.salesman,
+        )
+
+        response = self.client.get(reverse('reporting:products_management_api'), {
+            'page_size': '10',
+            'selected_product_id': selected.id,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['products'][0]['id'], selected.id)
+        self.assertIn('excelImport', payload['links'])
+
+    def test_products_excel_import_creates_and_updates_rows(self):
+        from decimal import Decimal
+        from reporting.models import Product
+
+        existing = Product.objects.create(
+            product_code='XLSX-UP-001',
+            description='기존',
+            specification='OLD',
+            unit='EA',
+            standard_price=Decimal('1000'),
+            created_by=self.salesman,
+        )
+        upload = self._uploaded_products_xlsx([
+            ['품번', '제품설명', '규격', '단위', '기준단가', '상태'],
+            ['XLSX-UP-001', '수정 설명', 'NEW', 'BOX', 1500, '활성'],
+            ['XLSX-UP-002', '신규 설명', 'SPEC', 'SET', 2500, '비활성'],
+        ])
+
+        response = self.client.post(reverse('reporting:products_excel_import_api'), {'file': upload})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['createdCount'], 1)
+        self.assertEqual(payload['updatedCount'], 1)
+        self.assertEqual(payload['errorCount'], 0)
+        existing.refresh_from_db()
+        self.assertEqual(existing.description, '수정 설명')
+        self.assertEqual(existing.specification, 'NEW')
+        self.assertEqual(existing.unit, 'BOX')
+        self.assertEqual(existing.standard_price, Decimal('1500'))
+        created = Product.objects.get(product_code='XLSX-UP-002')
+        self.assertEqual(created.created_by, self.salesman)
+        self.assertFalse(created.is_active)
+
+    def test_product_bulk_delete_deletes_unused_and_blocks_used_product(self):
+        import json
+        from reporting.models import DeliveryItem, Product
+
+        unused = Product.objects.create(product_code='DELETE-UNUSED', standard_price=1000, created_by=self.salesman)
+        used = Product.objects.create(product_code='DELETE-USED', standard_price=2000, created_by=self.salesman)
+        DeliveryItem.objects.create(product=used, item_name='사용 제품', quantity=1, unit_price=2000)
+
+        response = self.client.post(
+            reverse('reporting:products_bulk_delete_api'),
+            data=json.dumps({'productCodes': [unused.product_code, used.product_code, 'DELETE-MISSING']}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['deletedCount'], 1)
+        self.assertEqual(payload['blockedCount'], 1)
+        self.assertEqual(payload['missingCount'], 1)
+        blocked = next(item for item in payload['results'] if item['productCode'] == used.product_code)
+        self.assertTrue(blocked['canReplace'])
+        self.assertEqual(blocked['deliveryItemCount'], 1)
+        self.assertEqual(blocked['referenceCount'], 1)
+        self.assertEqual(blocked['references'][0]['referenceType'], 'deliveryItem')
+        self.assertEqual(blocked['references'][0]['itemName'], used.product_code)
+        self.assertFalse(Product.objects.filter(product_code=unused.product_code).exists())
+        self.assertTrue(Product.objects.filter(product_code=used.product_code).exists())
+
+    def test_product_delete_replaces_used_items_one_reference_at_a_time(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import Company, DeliveryItem, Department, FollowUp, Product, Quote, QuoteItem, Schedule
+
+        old = Product.objects.create(
+            product_code='DELETE-REPLACE-OLD',
+            unit='EA',
+            standard_price=2000,
+            created_by=self.salesman,
+        )
+        replacement = Product.objects.create(
+            product_code='DELETE-REPLACE-NEW',
+            unit='SET',
+            standard_price=3000,
+            created_by=self.salesman,
+        )
+        company = Company.objects.create(name='제품대체 고객사', created_by=self.salesman)
+        department = Department.objects.create(company=company, name='제품대체 연구실', created_by=self.salesman)
+        followup = FollowUp.objects.create(
+            user=self.salesman,
+            user_company=self.company,
+            customer_name='제품대체 담당자',
+            company=company,
+            department=department,
+        )
+        schedule = Schedule.objects.create(
+            user=self.salesman,
+            company=self.company,
+            followup=followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        delivery_item = DeliveryItem.objects.create(
+            schedule=schedule,
+            product=old,
+            item_name=old.product_code,
+            quantity=2,
+            unit_price=2000,
+        )
+        quote = Quote.objects.create(
+            quote_number='Q-REPLACE-001',
+            schedule=schedule,
+            followup=followup,
+            user=self.salesman,
+            valid_until=timezone.localdate() + datetime.timedelta(days=30),
+        )
+        quote_item = QuoteItem.objects.create(
+            quote=quote,
+            product=old,
+            quantity=1,
+            unit_price=2000,
+        )
+
+        blocked_response = self.client.post(
+            reverse('reporting:products_bulk_delete_api'),
+            data=json.dumps({
+                'productCodes': [old.product_code],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(blocked_response.status_code, 200)
+        blocked_payload = blocked_response.json()
+        self.assertEqual(blocked_payload['deletedCount'], 0)
+        self.assertEqual(blocked_payload['blockedCount'], 1)
+        blocked = blocked_payload['results'][0]
+        self.assertEqual(blocked['referenceCount'], 2)
+        reference_ids = {(item['referenceType'], item['referenceId']) for item in blocked['references']}
+        self.assertEqual(reference_ids, {('deliveryItem', delivery_item.id), ('quoteItem', quote_item.id)})
+
+        response = self.client.post(
+            reverse('reporting:product_replace_reference_api'),
+            data=json.dumps({
+                'productCode': old.product_code,
+                'referenceType': 'deliveryItem',
+                'referenceId': delivery_item.id,
+                'replacementProductId': replacement.id,
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertFalse(payload['deletedOriginal'])
+        self.assertEqual(payload['replacementProductCode'], replacement.product_code)
+        self.assertEqual(payload['result']['status'], 'blocked')
+        self.assertEqual(payload['result']['referenceCount'], 1)
+        delivery_item.refresh_from_db()
+        self.assertEqual(delivery_item.product, replacement)
+        self.assertEqual(delivery_item.item_name, replacement.product_code)
+        self.assertEqual(delivery_item.unit, 'SET')
+
+        response = self.client.post(
+            reverse('reporting:product_replace_reference_api'),
+            data=json.dumps({
+                'productCode': old.product_code,
+                'referenceType': 'quoteItem',
+                'referenceId': quote_item.id,
+                'replacementProductId': replacement.id,
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertTrue(payload['deletedOriginal'])
+        self.assertEqual(payload['result']['status'], 'deleted')
+        self.assertFalse(Product.objects.filter(product_code=old.product_code).exists())
+        quote_item.refresh_from_db()
+        self.assertEqual(quote_item.product, replacement)
+
+    def test_product_replace_history_delivery_item_updates_history_summary(self):
+        import json
+        from reporting.models import Company, DeliveryItem, Department, FollowUp, History, Product
+
+        old = Product.objects.create(
+            product_code='DELETE-HISTORY-OLD',
+            unit='EA',
+            standard_price=2000,
+            created_by=self.salesman,
+        )
+        replacement = Product.objects.create(
+            product_code='DELETE-HISTORY-NEW',
+            unit='BOX',
+            standard_price=3000,
+            created_by=self.salesman,
+        )
+        company = Company.objects.create(name='히스토리대체 고객사', created_by=self.salesman)
+        department = Department.objects.create(company=company, name='히스토리대체 부서', created_by=self.salesman)
+        followup = FollowUp.objects.create(
+            user=self.salesman,
+            user_company=self.company,
+            customer_name='히스토리대체 담당자',
+            company=company,
+            department=department,
+        )
+        history = History.objects.create(
+            user=self.salesman,
+            company=self.company,
+            followup=followup,
+            action_type='delivery_schedule',
+            content='납품 기록',
+        )
+        delivery_item = DeliveryItem.objects.create(
+            history=history,
+            product=old,
+            item_name=old.product_code,
+            quantity=3,
+            unit_price=2000,
+        )
+
+        blocked_response = self.client.post(
+            reverse('reporting:products_bulk_delete_api'),
+            data=json.dumps({'productCodes': [old.product_code]}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(blocked_response.status_code, 200)
+        blocked = blocked_response.json()['results'][0]
+        self.assertEqual(blocked['references'][0]['historyId'], history.id)
+
+        response = self.client.post(
+            reverse('reporting:product_replace_reference_api'),
+            data=json.dumps({
+                'productCode': old.product_code,
+                'referenceType': 'deliveryItem',
+                'referenceId': delivery_item.id,
+                'replacementProductId': replacement.id,
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['deletedOriginal'])
+        self.assertFalse(Product.objects.filter(product_code=old.product_code).exists())
+        delivery_item.refresh_from_db()
+        history.refresh_from_db()
+        self.assertEqual(delivery_item.product, replacement)
+        self.assertEqual(delivery_item.item_name, replacement.product_code)
+        self.assertEqual(delivery_item.unit, 'BOX')
+        self.assertIn(replacement.product_code, history.delivery_items)
+        self.assertEqual(int(history.delivery_amount), 6600)
+
+    def test_products_excel_export_returns_xlsx(self):
+        from reporting.models import Product
+
+        Product.objects.create(product_code='XLSX-001', description='다운로드', standard_price=1000, created_by=self.salesman)
+
+        response = self.client.get(reverse('reporting:products_excel_export_api'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            response['Content-Type'],
+        )
+        self.assertIn('products-', response['Content-Disposition'])
@@ -0,0 +1,490 @@
+import json
+from datetime import time, timedelta
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    FollowUp,
+    History,
+    DeliveryItem,
+    Prepayment,
+    PrepaymentUsage,
+    Schedule,
+    UserCompany,
+)
+from reporting.tests.factories import make_user
+
+
+class ReceivablesApiTests(TestCase):
+    """외상고객 React API tests."""
+
+    def setUp(self):
+        self.client = Client()
+        self.user_company = UserCompany.objects.create(name='외상API소속')
+        self.company = Company.objects.create(name='외상API업체', created_by=None)
+        self.department = Department.objects.create(company=self.company, name='외상API부서')
+        self.user = make_user('receivable-owner', company=self.user_company)
+        self.manager = make_user('receivable-manager', role='manager', company=self.user_company)
+        self.other_company = UserCompany.objects.create(name='외상API타사')
+        self.other_user = make_user('receivable-other', company=self.other_company)
+        self.followup = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.user_company,
+            company=self.company,
+            department=self.department,
+            customer_name='외상 담당자',
+            manager='외상 PI',
+        )
+        self.schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.user_company,
+            followup=self.followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            activity_type='delivery',
+            status='completed',
+        )
+
+    def test_receivables_api_lists_open_items_and_summary(self):
+        DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='Open Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            tax_invoice_issued=True,
+        )
+        DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='Default Credit Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=50000,
+            tax_invoice_issued=False,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:receivables_api'))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['summary']['itemCount'], 2)
+        self.assertEqual(payload['summary']['openItemCount'], 2)
+        self.assertEqual(payload['summary']['totalOutstanding'], 165000)
+        self.assertEqual(payload['summary']['totalCreditAmount'], 165000)
+        self.assertNotIn('unregistered', [status['value'] for status in payload['filters']['statuses']])
+        item_names = [item['itemName'] for item in payload['items']]
+        self.assertIn('Open Kit', item_names)
+        self.assertIn('Default Credit Kit', item_names)
+        default_item = next(item for item in payload['items'] if item['itemName'] == 'Default Credit Kit')
+        self.assertTrue(default_item['taxInvoiceIssued'])
+        self.assertEqual(default_item['statusLabel'], '외상 진행중')
+        self.assertEqual(default_item['outstandingAmount'], 55000)
+        self.assertEqual(payload['customers'][0]['outstandingAmount'], 165000)
+
+    def test_receivables_api_excludes_prepayment_delivery_items(self):
+        DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='Normal Credit Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            tax_invoice_issued=True,
+        )
+        prepayment_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.user_company,
+            followup=self.followup,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(11, 0),
+            activity_type='delivery',
+            status='completed',
+            use_prepayment=True,
+            prepayment_amount=250000,
+            delivery_payment_type=Schedule.DELIVERY_PAYMENT_TYPE_PREPAYMENT,
+            delivery_payment_status=Schedule.DELIVERY_PAYMENT_STATUS_PREPAYMENT,
+        )
+        DeliveryItem.objects.create(
+            schedule=prepayment_schedule,
+            item_name='Prepaid Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=250000,
+            tax_invoice_issued=True,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:receivables_api'), {'status': 'all'})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        item_names = [item['itemName'] for item in payload['items']]
+        self.assertIn('Normal Credit Kit', item_names)
+        self.assertNotIn('Prepaid Kit', item_names)
+        self.assertEqual(payload['summary']['itemCount'], 1)
+        self.assertEqual(payload['summary']['totalOutstanding'], 110000)
+
+    def test_receivable_item_status_api_blocks_prepayment_usage_item(self):
+        item = DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='Prepayment Usage Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            tax_invoice_issued=False,
+        )
+        prepayment = Prepayment.objects.create(
+            department=self.department,
+            customer=self.followup,
+            company=self.company,
+            amount=200000,
+            balance=90000,
+            payment_date=timezone.localdate(),
+            payment_method='transfer',
+            payer_name='외상API 선결제',
+            created_by=self.user,
+        )
+        PrepaymentUsage.objects.create(
+            prepayment=prepayment,
+            schedule=self.schedule,
+            schedule_item=item,
+            product_name=item.item_name,
+            quantity=item.quantity,
+            amount=110000,
+            remaining_balance=90000,
+        )
+        url = reverse('reporting:receivable_item_status_api', args=[item.id])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            url,
+            data=json.dumps({'taxInvoiceIssued': True}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 409)
+        payload = response.json()
+        self.assertFalse(payload['success'])
+        self.assertIn('선결제', payload['error'])
+        item.refresh_from_db()
+        self.assertFalse(item.tax_invoice_issued)
+
+    def test_receivable_item_status_api_checks_card_and_cancels(self):
+        item = DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='Status Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=100000,
+            tax_invoice_issued=False,
+        )
+        history = History.objects.create(
+            user=self.user,
+            company=self.user_company,
+            followup=self.followup,
+            schedule=self.schedule,
+            action_type='delivery_schedule',
+            tax_invoice_issued=False,
+        )
+        url = reverse('reporting:receivable_item_status_api', args=[item.id])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            url,
+            data=json.dumps({'cardPaymentReceived': True}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        item.refresh_from_db()
+        history.refresh_from_db()
+        self.assertTrue(item.tax_invoice_issued)
+        self.assertTrue(item.card_payment_received)
+        self.assertTrue(item.receivable_settled)
+        self.assertTrue(history.tax_invoice_issued)
+        self.assertEqual(response.json()['item']['outstandingAmount'], 0)
+        self.assertEqual(response.json()['item']['statusLabel'], '카드결제 완료')
+
+        card_response = self.client.post(
+            url,
+            data=json.dumps({'cardPaymentReceived': False}),
+            content_type='application/json',
+        )
+        self.assertEqual(card_response.status_code, 200)
+        item.refresh_from_db()
+        self.assertTrue(item.tax_invoice_issued)
+        self.assertFalse(item.card_payment_received)
+        self.assertFalse(item.receivable_settled)
+        self.assertEqual(card_response.json()['item']['outstandingAmount'], 220000)
+        self.assertEqual(card_response.json()['item']['statusLabel'], '외상 진행중')
+
+        cancel_response = self.client.post(
+            url,
+            data=json.dumps({'taxInvoiceIssued': False}),
+            content_type='application/json',
+        )
+        self.assertEqual(cancel_response.status_code, 200)
+        item.refresh_from_db()
+        self.assertTrue(item.tax_invoice_issued)
+        self.assertFalse(item.card_payment_received)
+        self.assertFalse(item.receivable_settled)
+        self.assertEqual(cancel_response.json()['item']['outstandingAmount'], 220000)
+
+    def test_receivable_item_status_api_locks_item_without_nullable_outer_joins(self):
+        item = DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='Join Safe Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            tax_invoice_issued=True,
+        )
+        url = reverse('reporting:receivable_item_status_api', args=[item.id])
+        self.client.force_login(self.user)
+
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                url,
+                data=json.dumps({'cardPaymentReceived': True}),
+                content_type='application/json',
+            )
+
+        self.assertEqual(response.status_code, 200)
+        item.refresh_from_db()
+        self.assertTrue(item.card_payment_received)
+        delivery_item_queries = [
+            query['sql']
+            for query in captured.captured_queries
+            if 'FROM "reporting_deliveryitem"' in query['sql']
+        ]
+        self.assertTrue(delivery_item_queries)
+        self.assertNotIn('JOIN', delivery_item_queries[0].upper())
+
+    def test_receivable_item_status_api_blocks_manager_and_other_company(self):
+        item = DeliveryItem.objects.create(
+            schedule=self.schedule,
+            item_name='Blocked Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+        )
+        url = reverse('reporting:receivable_item_status_api', args=[item.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(
+            url,
+            data=json.dumps({'taxInvoiceIssued': True}),
+            content_type='application/json',
+        )
+        self.assertEqual(manager_response.status_code, 403)
+
+        self.client.force_login(self.other_user)
+        other_response = self.client.post(
+            url,
+            data=json.dumps({'taxInvoiceIssued': True}),
+            content_type='application/json',
+        )
+        self.assertEqual(other_response.status_code, 403)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 8.6-1: 세금계산서 요청 API 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TaxInvoiceRequestAPITests(TestCase):
+    """세금계산서 요청 API (followup_tax_invoices_api / tax_invoice_update_status_api) 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='세금계산서테스트회사')
+        self.salesman = make_user('taxinv_salesman', role='salesman', company=self.company)
+        self.manager = make_user('taxinv_manager', role='manager', company=self.company)
+        self.other_salesman = make_user('taxinv_other', role='salesman', company=self.company)
+        self.client.force_login(self.salesman)
+
+        from reporting.models import Company, Department, FollowUp, Schedule
+        import datetime
+
+        cust_company = Company.objects.create(name='세금계산서고객사', created_by=self.salesman)
+        dept = Department.objects.create(name='세금계산서부서', company=cust_company, created_by=self.salesman)
+        self.followup = FollowUp.objects.create(
+            user=self.salesman, customer_name='테스트담당자',
+            company=cust_company, department=dept,
+        )
+        self.delivery_schedule = Schedule.objects.create(
+            user=self.salesman, followup=self.followup,
+            visit_date=datetime.date(2026, 6, 1),
+            visit_time=datetime.time(10, 0),
+            activity_type='delivery', status='completed',
+        )
+
+    def _url_list(self):
+        return reverse('reporting:followup_tax_invoices_api',
+                       kwargs={'followup_id': self.followup.pk})
+
+    def _url_status(self, req_id):
+        return reverse('reporting:tax_invoice_update_status_api',
+                       kwargs={'request_id': req_id})
+
+    # ── GET: 목록 조회 ─────────────────────────────────────────────────────
+
+    def test_get_list_success(self):
+        """로그인한 영업사원이 GET 요청 시 200 + success=True 반환"""
+        r = self.client.get(self._url_list())
+        self.assertEqual(r.status_code, 200)
+        data = r.json()
+        self.assertTrue(data.get('success'), 'success 필드가 True여야 합니다')
+        self.assertIn('tax_invoices', data)
+        self.assertIn('delivery_schedules', data)
+
+    def test_get_list_requires_login(self):
+        """비로그인 상태에서 GET 요청 시 리다이렉트 또는 403"""
+        self.client.logout()
+        r = self.client.get(self._url_list())
+        self.assertIn(r.status_code, [302, 403],
+                      '비로그인 요청은 302 또는 403이어야 합니다')
+
+    def test_get_list_other_company_blocked(self):
+        """다른 회사 사용자는 403 반환"""
+        other_company = UserCompany.objects.create(name='다른회사')
+        outsider = make_user('taxinv_outsider', role='salesman', company=other_company)
+        self.client.force_login(outsider)
+        r = self.client.get(self._url_list())
+        self.assertEqual(r.status_code, 403)
+
+    # ── POST: 요청 생성 ────────────────────────────────────────────────────
+
+    def test_post_create_request_removed(self):
+        """세금계산서 요청 생성은 외상고객 메뉴 전환 후 차단"""
+        r = self.client.post(self._url_list(), {
+            'schedule_id': self.delivery_schedule.pk,
+            'memo': '발행 부탁드립니다',
+        })
+        self.assertEqual(r.status_code, 410)
+        data = r.json()
+        self.assertFalse(data.get('success'))
+        self.assertEqual(data.get('redirect'), '/receivables/')
+
+    def test_post_create_duplicate_blocked_by_removed_flow(self):
+        """기존 요청 여부와 관계없이 신규 요청 생성은 차단"""
+        from reporting.models import TaxInvoiceRequest
+        TaxInvoiceRequest.objects.create(
+            followup=self.followup,
+            schedule=self.delivery_schedule,
+            status='requested',
+            requested_by=self.salesman,
+        )
+        r = self.client.post(self._url_list(), {
+            'schedule_id': self.delivery_schedule.pk,
+        })
+        self.assertEqual(r.status_code, 410)
+
+    def test_post_without_schedule_removed(self):
+        """일정 없는 세금계산서 요청 생성도 차단"""
+        r = self.client.post(self._url_list(), {'memo': '일정 없는 요청'})
+        self.assertEqual(r.status_code, 410)
+
+    # ── 상태 변경: 발행완료 ────────────────────────────────────────────────
+
+    def test_salesman_cannot_issue(self):
+        """구 세금계산서 상태 변경 API는 차단"""
+        from reporting.models import TaxInvoiceRequest
+        req = TaxInvoiceRequest.objects.create(
+            followup=self.followup, status='requested',
+            requested_by=self.salesman,
+        )
+        r = self.client.post(self._url_status(req.pk), {'status': 'issued'})
+        self.assertEqual(r.status_code, 410)
+
+    def test_manager_issue_removed(self):
+        """매니저도 구 세금계산서 상태 변경 API를 사용할 수 없음"""
+        from reporting.models import TaxInvoiceRequest
+        req = TaxInvoiceRequest.objects.create(
+            followup=self.followup, status='requested',
+            requested_by=self.salesman,
+        )
+        self.client.force_login(self.manager)
+        r = self.client.post(self._url_status(req.pk), {
+            'status': 'issued', 'memo': '발행 처리함'
+        })
+        self.assertEqual(r.status_code, 410)
+
+    # ── 상태 변경: 취소 ───────────────────────────────────────────────────
+
+    def test_requester_cancel_removed(self):
+        """요청자 본인도 구 세금계산서 요청 취소 API를 사용할 수 없음"""
+        from reporting.models import TaxInvoiceRequest
+        req = TaxInvoiceRequest.objects.create(
+            followup=self.followup, status='requested',
+            requested_by=self.salesman,
+        )
+        r = self.client.post(self._url_status(req.pk), {
+            'status': 'cancelled', 'memo': '취소 사유'
+        })
+        self.assertEqual(r.status_code, 410)
+
+    def test_other_salesman_cannot_cancel_others_request(self):
+        """다른 영업사원은 타인의 요청을 취소 불가 → 403"""
+        from reporting.models import TaxInvoiceRequest
+        req = TaxInvoiceRequest.objects.create(
+            followup=self.followup, status='requested',
+            requested_by=self.salesman,
+        )
+        self.client.force_login(self.other_salesman)
+        r = self.client.post(self._url_status(req.pk), {
+            'status': 'cancelled', 'memo': '취소'
+        })
+        self.assertEqual(r.status_code, 410)
+
+    # ── 보류 처리 ─────────────────────────────────────────────────────────
+
+    def test_manager_set_on_hold_removed(self):
+        """구 세금계산서 보류 API는 차단"""
+        from reporting.models import TaxInvoiceRequest
+        req = TaxInvoiceRequest.objects.create(
+            followup=self.followup, status='requested',
+            requested_by=self.salesman,
+        )
+        self.client.force_login(self.manager)
+        r = self.client.post(self._url_status(req.pk), {
+            'status': 'on_hold', 'memo': '검토 중'
+        })
+        self.assertEqual(r.status_code, 410)
+
+    # ── 잘못된 상태값 ─────────────────────────────────────────────────────
+
+    def test_invalid_status_value_returns_400(self):
+        """올바르지 않은 status 값은 400 반환"""
+        from reporting.models import TaxInvoiceRequest
+        req = TaxInvoiceRequest.objects.create(
+            followup=self.followup, status='requested',
+            requested_by=self.salesman,
+        )
+        self.client.force_login(self.manager)
+        r = self.client.post(self._url_status(req.pk), {'status': 'INVALID'})
+        self.assertEqual(r.status_code, 410)
+
+    # ── 404 처리 ─────────────────────────────────────────────────────────
+
+    def test_nonexistent_followup_returns_404(self):
+        """존재하지 않는 followup_id는 404 반환"""
+        r = self.client.get(
+            reverse('reporting:followup_tax_invoices_api',
+                    kwargs={'followup_id': 99999})
+        )
+        self.assertEqual(r.status_code, 404)
+
+    def test_nonexistent_request_id_returns_404(self):
+        """존재하지 않는 request_id는 404 반환"""
+        self.client.force_login(self.manager)
+        r = self.client.post(
+            reverse('reporting:tax_invoice_update_status_api',
+                    kwargs={'request_id': 99999}),
+            {'status': 'issued'},
+        )
+        self.assertEqual(r.status_code, 410)
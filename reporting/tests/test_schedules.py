@@ -0,0 +1,4175 @@
+from datetime import time
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from reporting.models import (
+    Company,
+    Department,
+    DocumentGenerationLog,
+    FollowUp,
+    DeliveryItem,
+    Schedule,
+    ScheduleQuoteGroupNote,
+    UserCompany,
+)
+from reporting.tests.factories import make_user, make_department, make_customer, make_schedule
+
+
+class QuoteItemsApiTests(TestCase):
+    """부서 기준 견적 품목 불러오기 API 검증"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='견적품목API회사')
+        self.user = make_user('quote_items_me', role='salesman', company=self.company)
+        self.coworker = make_user('quote_items_coworker', role='salesman', company=self.company)
+
+        from reporting.models import Company, Department
+
+        self.customer_company = Company.objects.create(name='견적품목 고객사', created_by=self.user)
+        self.department = Department.objects.create(
+            company=self.customer_company,
+            name='공동 연구실',
+            created_by=self.user,
+        )
+        self.other_department = Department.objects.create(
+            company=self.customer_company,
+            name='다른 연구실',
+            created_by=self.user,
+        )
+
+    def _create_followup(self, owner, name, department=None):
+        from reporting.models import FollowUp
+
+        return FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name=name,
+            company=self.customer_company,
+            department=department or self.department,
+            priority='urgent',
+            pipeline_stage='quote',
+        )
+
+    def _create_quote_schedule(self, followup, owner, item_name, unit_price, quote_group=''):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = Schedule.objects.create(
+            user=owner,
+            company=owner.userprofile.company,
+            followup=followup,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name=item_name,
+            quantity=1,
+            unit_price=unit_price,
+            quote_group=quote_group,
+        )
+        return schedule
+
+    def test_quote_items_api_returns_all_own_quotes_in_same_department(self):
+        target = self._create_followup(self.user, '대표 고객')
+        same_department = self._create_followup(self.user, '같은 부서 고객')
+        other_department = self._create_followup(self.user, '다른 부서 고객', self.other_department)
+        coworker_customer = self._create_followup(self.coworker, '동료 고객')
+        first = self._create_quote_schedule(target, self.user, 'PCR 장비', 1000000)
+        second = self._create_quote_schedule(same_department, self.user, '원심분리기', 2000000)
+        self._create_quote_schedule(other_department, self.user, '다른 부서 품목', 3000000)
+        self._create_quote_schedule(coworker_customer, self.coworker, '동료 품목', 4000000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['count'], 2)
+        schedule_ids = {item['schedule_id'] for item in payload['quotes']}
+        self.assertEqual(schedule_ids, {first.id, second.id})
+        customer_names = {item['customer_name'] for item in payload['quotes']}
+        self.assertEqual(customer_names, {'대표 고객', '같은 부서 고객'})
+
+    def test_quote_items_api_splits_same_schedule_by_quote_group(self):
+        from reporting.models import DeliveryItem
+
+        target = self._create_followup(self.user, '구분 선택 고객')
+        quote_schedule = self._create_quote_schedule(
+            target,
+            self.user,
+            '보상판매 품목',
+            1000000,
+            quote_group='보상판매',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='수리 품목',
+            quantity=1,
+            unit_price=2000000,
+            quote_group='수리',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['count'], 2)
+        options_by_group = {item['quoteGroup']: item for item in payload['quotes']}
+        self.assertEqual(set(options_by_group), {'보상판매', '수리'})
+        self.assertEqual(options_by_group['보상판매']['optionId'], f'{quote_schedule.id}:보상판매')
+        self.assertEqual(options_by_group['수리']['optionId'], f'{quote_schedule.id}:수리')
+        self.assertEqual(options_by_group['보상판매']['quoteGroupLabel'], '보상판매')
+        self.assertEqual(options_by_group['수리']['quoteGroupLabel'], '수리')
+        self.assertEqual(options_by_group['보상판매']['scheduleId'], quote_schedule.id)
+        self.assertEqual(options_by_group['수리']['scheduleId'], quote_schedule.id)
+        self.assertEqual([item['itemName'] for item in options_by_group['보상판매']['items']], ['보상판매 품목'])
+        self.assertEqual([item['itemName'] for item in options_by_group['수리']['items']], ['수리 품목'])
+
+    def test_quote_items_api_returns_react_delivery_import_fields(self):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Product, Schedule
+
+        target = self._create_followup(self.user, 'React 납품')
+        product = Product.objects.create(
+            product_code='PIP-1000',
+            unit='SET',
+            specification='1000ul',
+            description='피펫',
+            standard_price=150000,
+            created_by=self.user,
+        )
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            product=product,
+            item_name='PIP-1000',
+            quantity=3,
+            unit_price=120000,
+            discount_rate=5,
+            tax_invoice_issued=True,
+            quote_group='수리',
+            notes='오링 교체',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        quote = payload['quotes'][0]
+        quote_item = quote['items'][0]
+        self.assertEqual(quote['id'], quote_schedule.id)
+        self.assertEqual(quote['optionId'], f'{quote_schedule.id}:수리')
+        self.assertEqual(quote['scheduleId'], quote_schedule.id)
+        self.assertEqual(quote['quoteGroup'], '수리')
+        self.assertEqual(quote['quoteGroupLabel'], '수리')
+        self.assertEqual(quote['href'], f'/schedules/{quote_schedule.id}/')
+        self.assertEqual(quote['djangoHref'], reverse('reporting:schedule_detail', args=[quote_schedule.id]))
+        self.assertEqual(quote_item['id'], item.id)
+        self.assertEqual(quote_item['itemName'], 'PIP-1000')
+        self.assertEqual(quote_item['unit'], 'SET')
+        self.assertEqual(quote_item['unitPrice'], 120000.0)
+        self.assertEqual(quote_item['discountRate'], 5.0)
+        self.assertEqual(quote_item['discountUnitPrice'], 114000.0)
+        self.assertEqual(quote_item['effectiveUnitPrice'], 114000.0)
+        self.assertEqual(quote_item['productId'], product.id)
+        self.assertEqual(quote_item['productCode'], 'PIP-1000')
+        self.assertEqual(quote_item['productDescription'], '피펫')
+        self.assertEqual(quote_item['sourceQuoteScheduleId'], quote_schedule.id)
+        self.assertEqual(quote_item['sourceQuoteItemId'], item.id)
+        self.assertTrue(quote_item['taxInvoiceIssued'])
+        self.assertEqual(quote_item['quoteGroup'], '수리')
+        self.assertEqual(quote_item['quoteGroupLabel'], '수리')
+        self.assertEqual(quote_item['notes'], '오링 교체')
+
+    def test_quote_items_api_recovers_unit_price_from_legacy_total_price(self):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        target = self._create_followup(self.user, '레거시 총액 견적')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='총액만 있는 견적 품목',
+            quantity=2,
+            unit='EA',
+            unit_price=10000,
+            quote_group='수리',
+        )
+        DeliveryItem.objects.filter(pk=item.pk).update(unit_price=None, total_price=110000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        quote = payload['quotes'][0]
+        quote_item = quote['items'][0]
+        self.assertEqual(quote['remainingAmount'], 110000.0)
+        self.assertEqual(quote_item['totalPrice'], 110000.0)
+        self.assertEqual(quote_item['remainingAmount'], 110000.0)
+        self.assertEqual(quote_item['unitPrice'], 50000.0)
+        self.assertEqual(quote_item['effectiveUnitPrice'], 50000.0)
+
+    def test_quote_items_api_treats_legacy_zero_discount_unit_price_as_blank(self):
+        from datetime import time, timedelta
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        target = self._create_followup(self.user, '할인단가0 견적')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate() + timedelta(days=1),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='SO825.0002',
+            quantity=1,
+            unit='EA',
+            unit_price=379950,
+        )
+        DeliveryItem.objects.filter(pk=item.pk).update(discount_rate=0, discount_unit_price=0, total_price=0)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        quote_item = payload['quotes'][0]['items'][0]
+        self.assertIsNone(quote_item['discountUnitPrice'])
+        self.assertEqual(quote_item['discountRate'], 0.0)
+        self.assertEqual(quote_item['unitPrice'], 379950.0)
+        self.assertEqual(quote_item['effectiveUnitPrice'], 379950.0)
+        self.assertEqual(quote_item['totalPrice'], 417945.0)
+
+    def test_quote_items_api_returns_remaining_items_after_partial_delivery_import(self):
+        from datetime import time
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        target = self._create_followup(self.user, '부분 납품 고객')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='completed',
+        )
+        sold_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='판매된 견적 품목',
+            quantity=1,
+            unit='EA',
+            unit_price=30000,
+            quote_group='보상판매',
+        )
+        remaining_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='남은 견적 품목',
+            quantity=1,
+            unit='EA',
+            unit_price=90000,
+            quote_group='수리',
+        )
+        delivery_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate(),
+            visit_time=time(11, 0),
+            activity_type='delivery',
+            status='completed',
+        )
+        DeliveryItem.objects.create(
+            schedule=delivery_schedule,
+            source_quote_schedule=quote_schedule,
+            source_quote_item=sold_item,
+            item_name='판매된 견적 품목',
+            quantity=1,
+            unit='EA',
+            unit_price=30000,
+            quote_group='보상판매',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['count'], 1)
+        quote = payload['quotes'][0]
+        self.assertEqual(quote['quoteGroup'], '수리')
+        self.assertEqual(quote['items'][0]['id'], remaining_item.id)
+        self.assertEqual(quote['items'][0]['sourceQuoteItemId'], remaining_item.id)
+
+    def test_quote_items_api_exposes_partial_delivery_remaining_quantities(self):
+        from datetime import time
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        target = self._create_followup(self.user, '동일 품목 부분 납품 고객')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='completed',
+        )
+        quote_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='부분 납품 견적 품목',
+            quantity=3,
+            unit='EA',
+            unit_price=10000,
+            quote_group='보상판매',
+        )
+        delivery_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=target,
+            visit_date=timezone.localdate(),
+            visit_time=time(11, 0),
+            activity_type='delivery',
+            status='completed',
+        )
+        DeliveryItem.objects.create(
+            schedule=delivery_schedule,
+            source_quote_schedule=quote_schedule,
+            source_quote_item=quote_item,
+            item_name='부분 납품 견적 품목',
+            quantity=1,
+            unit='EA',
+            unit_price=10000,
+            quote_group='보상판매',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        quote = payload['quotes'][0]
+        item = quote['items'][0]
+        self.assertEqual(quote['deliveryStatus'], 'partial')
+        self.assertEqual(quote['deliveryStatusLabel'], '부분 납품 잔여')
+        self.assertTrue(quote['hasPartialDelivery'])
+        self.assertEqual(quote['quotedAmount'], 33000.0)
+        self.assertEqual(quote['deliveredAmount'], 11000.0)
+        self.assertEqual(quote['remainingAmount'], 22000.0)
+        self.assertEqual(item['originalQuantity'], 3.0)
+        self.assertEqual(item['deliveredQuantity'], 1.0)
+        self.assertEqual(item['remainingQuantity'], 2.0)
+        self.assertEqual(item['quantity'], 2)
+
+    def test_quote_items_api_bulk_progress_avoids_per_quote_queries(self):
+        from datetime import time
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        target = self._create_followup(self.user, '대량 견적 고객')
+        for index in range(8):
+            quote_schedule = self._create_quote_schedule(
+                target,
+                self.user,
+                f'완료 견적 품목 {index}',
+                10000 + index,
+                quote_group='수리',
+            )
+            quote_schedule.status = 'completed'
+            quote_schedule.save(update_fields=['status'])
+            quote_item = quote_schedule.delivery_items_set.first()
+            quote_item.quantity = 2
+            quote_item.save(update_fields=['quantity', 'total_price', 'updated_at'])
+            if index % 2 == 0:
+                delivery_schedule = Schedule.objects.create(
+                    user=self.user,
+                    company=self.company,
+                    followup=target,
+                    visit_date=timezone.localdate(),
+                    visit_time=time(11, 0),
+                    activity_type='delivery',
+                    status='completed',
+                )
+                DeliveryItem.objects.create(
+                    schedule=delivery_schedule,
+                    source_quote_schedule=quote_schedule,
+                    source_quote_item=quote_item,
+                    item_name=quote_item.item_name,
+                    quantity=1,
+                    unit='EA',
+                    unit_price=quote_item.unit_price,
+                    quote_group='수리',
+                )
+        for index in range(4):
+            self._create_quote_schedule(
+                target,
+                self.user,
+                f'진행 견적 품목 {index}',
+                20000 + index,
+                quote_group='보상판매',
+            )
+        self.client.force_login(self.user)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['count'], 8)
+        self.assertLessEqual(len(captured), 20)
+
+    def test_quote_items_api_excludes_completed_quote_schedules(self):
+        target = self._create_followup(self.user, '완료 제외 고객')
+        completed = self._create_quote_schedule(target, self.user, '완료된 견적 품목', 1000000)
+        completed.status = 'completed'
+        completed.save(update_fields=['status'])
+        scheduled = self._create_quote_schedule(target, self.user, '진행 중 견적 품목', 2000000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:followup_quote_items_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        schedule_ids = {item['scheduleId'] for item in payload['quotes']}
+        self.assertEqual(schedule_ids, {scheduled.id})
+
+    def test_customer_records_api_includes_quote_schedules_without_quote_model(self):
+        target = self._create_followup(self.user, '기록 대표')
+        same_department = self._create_followup(self.user, '기록 같은 부서')
+        first = self._create_quote_schedule(target, self.user, '견적A', 1000000)
+        second = self._create_quote_schedule(same_department, self.user, '견적B', 2000000)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:customer_records_api', args=[target.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['quote_count'], 2)
+        quote_ids = {item['id'] for item in payload['quotes']}
+        self.assertEqual(quote_ids, {first.id, second.id})
+        self.assertEqual(payload['total_quote_amount'], 3300000.0)
+
+
+class SchedulesSummaryApiTests(TestCase):
+    """React 일정 화면 읽기 API 검증"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = UserCompany.objects.create(name='일정API회사')
+        cls.other_company = UserCompany.objects.create(name='일정API타사회사')
+        cls.user = make_user('schedules_api_me', role='salesman', company=cls.company)
+        cls.coworker = make_user('schedules_api_coworker', role='salesman', company=cls.company)
+        cls.manager = make_user('schedules_api_manager', role='manager', company=cls.company)
+        cls.other_user = make_user('schedules_api_other', role='salesman', company=cls.other_company)
+        cls.url = reverse('reporting:schedules_summary_api')
+        cls.create_url = reverse('reporting:schedules_create_api')
+        cls.calendar_url = reverse('reporting:schedules_calendar_api')
+        cls.personal_create_url = reverse('reporting:personal_schedules_create_api')
+
+    def setUp(self):
+        self.client = Client()
+
+    def _create_customer(self, owner, name):
+        return make_customer(owner, name, manager=f'{name} 책임', priority='urgent', pipeline_stage='quote')
+
+    def _create_department_only(self, owner, name):
+        return make_department(owner, name)
+
+    def _create_schedule(
+        self,
+        owner,
+        name,
+        activity_type='customer_meeting',
+        status='scheduled',
+        visit_date=None,
+    ):
+        followup = self._create_customer(owner, name)
+        return make_schedule(
+            owner,
+            followup,
+            visit_date=visit_date or timezone.localdate(),
+            activity_type=activity_type,
+            status=status,
+            location=f'{name} 회의실',
+            notes=f'{name} 일정 메모',
+        )
+
+    def _create_personal_schedule(self, owner, title, schedule_date=None):
+        import datetime
+        from django.utils import timezone
+        from reporting.models import PersonalSchedule
+
+        return PersonalSchedule.objects.create(
+            user=owner,
+            company=owner.userprofile.company,
+            title=title,
+            content=f'{title} 내용',
+            schedule_date=schedule_date or timezone.localdate(),
+            schedule_time=datetime.time(14, 0),
+        )
+
+    def test_schedules_summary_api_requires_login_json(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_schedules_summary_api_uses_salesman_own_scope(self):
+        own = self._create_schedule(self.user, '내일정')
+        personal = self._create_personal_schedule(self.user, '내 개인 일정')
+        coworker = self._create_schedule(self.coworker, '동료일정')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {(item['type'], item['id']) for item in payload['schedules']}
+        self.assertIn(('customer', own.id), ids)
+        self.assertIn(('personal', personal.id), ids)
+        self.assertNotIn(('customer', coworker.id), ids)
+        self.assertEqual(payload['metrics']['totalSchedules'], 2)
+        self.assertTrue(payload['create']['canCreate'])
+        self.assertEqual(payload['create']['submitUrl'], self.create_url)
+        self.assertTrue(any(customer['id'] == own.followup_id for customer in payload['create']['customers']))
+        self.assertTrue(any(department['id'] == own.followup.department_id for department in payload['create']['departments']))
+        own_item = next(item for item in payload['schedules'] if item['type'] == 'customer' and item['id'] == own.id)
+        self.assertEqual(own_item['href'], f'/schedules/{own.id}/')
+        self.assertEqual(own_item['djangoHref'], reverse('reporting:schedule_detail', args=[own.id]))
+
+    def test_schedules_summary_api_includes_customerless_departments_for_create(self):
+        department = self._create_department_only(self.user, '고객없는일정대상')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        department_ids = {item['id'] for item in payload['create']['departments']}
+        customer_department_ids = {item.get('departmentId') for item in payload['create']['customers']}
+        self.assertIn(department.id, department_ids)
+        self.assertNotIn(department.id, customer_department_ids)
+
+    def test_schedules_summary_api_defaults_to_latest_schedule_first(self):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        older = self._create_schedule(
+            self.user,
+            '오래된일정',
+            visit_date=timezone.localdate() - timedelta(days=4),
+        )
+        newer = self._create_schedule(
+            self.user,
+            '최근일정',
+            visit_date=timezone.localdate() + timedelta(days=2),
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['schedules'][0]['type'], 'customer')
+        self.assertEqual(payload['schedules'][0]['id'], newer.id)
+        self.assertNotEqual(payload['schedules'][0]['id'], older.id)
+
+    def test_schedules_summary_api_filters_search_owner_status_activity_and_range(self):
+        from datetime import timedelta
+        from django.utils import timezone
+
+        target = self._create_schedule(
+            self.user,
+            'PCR핵심',
+            activity_type='quote',
+            status='scheduled',
+            visit_date=timezone.localdate() + timedelta(days=1),
+        )
+        self._create_schedule(
+            self.user,
+            'PCR완료',
+            activity_type='quote',
+            status='completed',
+            visit_date=timezone.localdate() + timedelta(days=1),
+        )
+        self._create_schedule(
+            self.user,
+            'PCR서비스',
+            activity_type='service',
+            status='scheduled',
+            visit_date=timezone.localdate() + timedelta(days=1),
+        )
+        self._create_schedule(
+            self.coworker,
+            'PCR동료',
+            activity_type='quote',
+            status='scheduled',
+            visit_date=timezone.localdate() + timedelta(days=1),
+        )
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url, {
+            'q': 'PCR',
+            'owner': str(self.user.id),
+            'status': 'scheduled',
+            'activityType': 'quote',
+            'range': 'week',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = [(item['type'], item['id']) for item in payload['schedules']]
+        self.assertEqual(ids, [('customer', target.id)])
+        self.assertEqual(payload['filters']['q'], 'PCR')
+        self.assertTrue(any(option['value'] == 'quote' for option in payload['options']['activityTypes']))
+        self.assertFalse(any(option['value'] == 'service' for option in payload['options']['activityTypes']))
+        self.assertEqual(payload['metrics']['filteredSchedules'], 1)
+
+    def test_schedules_summary_api_excludes_service_schedule_type(self):
+        self._create_schedule(self.user, '미팅일정', activity_type='customer_meeting')
+        service_schedule = self._create_schedule(self.user, '서비스일정', activity_type='service')
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['schedules'] if item['type'] == 'customer'}
+        self.assertNotIn(service_schedule.id, ids)
+        self.assertFalse(any(option['value'] == 'service' for option in payload['create']['activityTypes']))
+        self.assertFalse(any(item['value'] == 'service' for item in payload['activityCounts']))
+        self.assertEqual(payload['metrics']['customerSchedules'], 1)
+
+    def test_schedules_summary_api_manager_sees_same_company_only(self):
+        own = self._create_schedule(self.user, '회사내일정')
+        coworker = self._create_schedule(self.coworker, '회사내동료일정')
+        other = self._create_schedule(self.other_user, '타사일정')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['schedules'] if item['type'] == 'customer'}
+        self.assertIn(own.id, ids)
+        self.assertIn(coworker.id, ids)
+        self.assertNotIn(other.id, ids)
+        self.assertEqual(payload['metrics']['totalSchedules'], 2)
+        self.assertTrue(payload['scope']['canViewAll'])
+        self.assertFalse(payload['create']['canCreate'])
+
+    def test_schedules_calendar_api_requires_login_json(self):
+        response = self.client.get(self.calendar_url)
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_schedules_calendar_api_returns_month_range_items(self):
+        import datetime
+        from reporting.models import History
+
+        target_date = datetime.date(2026, 5, 10)
+        outside_date = datetime.date(2026, 6, 1)
+        own = self._create_schedule(self.user, '월간일정', visit_date=target_date)
+        personal = self._create_personal_schedule(self.user, '월간 개인 일정', schedule_date=target_date)
+        outside = self._create_schedule(self.user, '범위밖일정', visit_date=outside_date)
+        report = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=own.followup,
+            schedule=own,
+            action_type='customer_meeting',
+            content='캘린더에서 보여줄 미팅 보고 본문',
+            meeting_situation='PCR 장비 도입 검토 중',
+            meeting_confirmed_facts='예산 담당자 확인',
+            meeting_next_action='견적서 송부',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.calendar_url, {
+            'start': '2026-05-01',
+            'end': '2026-05-31',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {(item['type'], item['id']) for item in payload['schedules']}
+        self.assertIn(('customer', own.id), ids)
+        self.assertIn(('personal', personal.id), ids)
+        self.assertNotIn(('customer', outside.id), ids)
+        own_item = next(item for item in payload['schedules'] if item['type'] == 'customer' and item['id'] == own.id)
+        personal_item = next(item for item in payload['schedules'] if item['type'] == 'personal' and item['id'] == personal.id)
+        self.assertTrue(own_item['canEdit'])
+        self.assertEqual(own_item['statusUpdateHref'], reverse('reporting:schedule_status_update', args=[own.id]))
+        self.assertEqual(own_item['djangoEditHref'], reverse('reporting:schedule_edit', args=[own.id]))
+        self.assertEqual(own_item['deleteHref'], reverse('reporting:schedule_delete', args=[own.id]))
+        self.assertEqual(
+            {option['value'] for option in own_item['statusOptions']},
+            {'scheduled', 'completed', 'cancelled'},
+        )
+        self.assertEqual(own_item['reports'][0]['id'], report.id)
+        self.assertEqual(own_item['reports'][0]['content'], '캘린더에서 보여줄 미팅 보고 본문')
+        self.assertEqual(own_item['reports'][0]['meetingSituation'], 'PCR 장비 도입 검토 중')
+        self.assertEqual(own_item['reports'][0]['meetingConfirmedFacts'], '예산 담당자 확인')
+        self.assertEqual(own_item['reports'][0]['nextAction'], '견적서 송부')
+        self.assertTrue(personal_item['canEdit'])
+        self.assertEqual(personal_item['href'], f'/schedules/calendar/?personal={personal.id}&month=2026-05')
+        self.assertEqual(personal_item['deleteHref'], reverse('reporting:personal_schedules_delete_api', args=[personal.id]))
+        self.assertEqual(personal_item['djangoEditHref'], reverse('reporting:personal_schedule_edit', args=[personal.id]))
+        self.assertEqual(personal_item['statusOptions'], [])
+        self.assertEqual(personal_item['reports'], [])
+        self.assertEqual(payload['filters']['start'], '2026-05-01')
+        self.assertEqual(payload['filters']['end'], '2026-05-31')
+        self.assertEqual(payload['metrics']['totalSchedules'], 2)
+        self.assertEqual(payload['links']['calendar'], '/schedules/calendar/')
+        self.assertEqual(payload['links']['djangoCalendar'], reverse('reporting:schedule_calendar'))
+        self.assertTrue(payload['create']['canCreate'])
+        self.assertEqual(payload['create']['submitUrl'], self.create_url)
+        self.assertFalse(any(option['value'] == 'service' for option in payload['create']['activityTypes']))
+        self.assertEqual(payload['create']['personalSchedule']['submitUrl'], self.personal_create_url)
+        self.assertTrue(any(customer['id'] == own.followup_id for customer in payload['create']['customers']))
+
+    def test_schedules_calendar_api_excludes_service_schedule_type(self):
+        import datetime
+
+        target_date = datetime.date(2026, 5, 10)
+        meeting = self._create_schedule(self.user, '월간미팅', activity_type='customer_meeting', visit_date=target_date)
+        service = self._create_schedule(self.user, '월간서비스', activity_type='service', visit_date=target_date)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.calendar_url, {
+            'start': '2026-05-01',
+            'end': '2026-05-31',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['schedules'] if item['type'] == 'customer'}
+        self.assertIn(meeting.id, ids)
+        self.assertNotIn(service.id, ids)
+        self.assertEqual(payload['metrics']['customerSchedules'], 1)
+
+    def test_schedules_calendar_api_all_filter_uses_same_company_only(self):
+        import datetime
+
+        target_date = datetime.date(2026, 5, 10)
+        own = self._create_schedule(self.user, '회사내월간일정', visit_date=target_date)
+        coworker = self._create_schedule(self.coworker, '동료월간일정', visit_date=target_date)
+        own_personal = self._create_personal_schedule(self.user, '회사내개인월간일정', schedule_date=target_date)
+        coworker_personal = self._create_personal_schedule(self.coworker, '동료개인월간일정', schedule_date=target_date)
+        other = self._create_schedule(self.other_user, '타사회사월간일정', visit_date=target_date)
+        self.client.force_login(self.user)
+
+        response = self.client.get(self.calendar_url, {
+            'start': '2026-05-01',
+            'end': '2026-05-31',
+            'data_filter': 'all',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['schedules'] if item['type'] == 'customer'}
+        self.assertIn(own.id, ids)
+        self.assertIn(coworker.id, ids)
+        self.assertNotIn(other.id, ids)
+        own_item = next(item for item in payload['schedules'] if item['type'] == 'customer' and item['id'] == own.id)
+        coworker_item = next(item for item in payload['schedules'] if item['type'] == 'customer' and item['id'] == coworker.id)
+        self.assertTrue(own_item['canEdit'])
+        self.assertFalse(coworker_item['canEdit'])
+        self.assertEqual(coworker_item['statusUpdateHref'], '')
+        self.assertEqual(coworker_item['deleteHref'], '')
+        own_personal_item = next(item for item in payload['schedules'] if item['type'] == 'personal' and item['id'] == own_personal.id)
+        coworker_personal_item = next(item for item in payload['schedules'] if item['type'] == 'personal' and item['id'] == coworker_personal.id)
+        self.assertTrue(own_personal_item['canEdit'])
+        self.assertEqual(own_personal_item['deleteHref'], reverse('reporting:personal_schedules_delete_api', args=[own_personal.id]))
+        self.assertFalse(coworker_personal_item['canEdit'])
+        self.assertEqual(coworker_personal_item['deleteHref'], '')
+        self.assertEqual(payload['scope']['dataFilter'], 'all')
+        self.assertTrue(any(option['id'] == self.coworker.id for option in payload['options']['users']))
+
+    def test_schedules_calendar_api_manager_defaults_to_company_scope_without_me_filter(self):
+        import datetime
+
+        target_date = datetime.date(2026, 5, 10)
+        manager_schedule = self._create_schedule(self.manager, '매니저월간일정', visit_date=target_date)
+        coworker = self._create_schedule(self.coworker, '직원월간일정', visit_date=target_date)
+        other = self._create_schedule(self.other_user, '타사회사월간일정', visit_date=target_date)
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.calendar_url, {
+            'start': '2026-05-01',
+            'end': '2026-05-31',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = {item['id'] for item in payload['schedules'] if item['type'] == 'customer'}
+        self.assertIn(manager_schedule.id, ids)
+        self.assertIn(coworker.id, ids)
+        self.assertNotIn(other.id, ids)
+        self.assertEqual(payload['scope']['dataFilter'], 'all')
+        self.assertEqual(payload['filters']['dataFilter'], 'all')
+        filter_options = payload['options']['dataFilters']
+        self.assertEqual(filter_options[0], {'value': 'all', 'label': '직원전체'})
+        self.assertFalse(any(option['value'] == 'me' for option in filter_options))
+        self.assertFalse(payload['create']['canCreate'])
+
+    def test_schedules_calendar_api_user_filter_limits_to_selected_company_user(self):
+        import datetime
+
+        target_date = datetime.date(2026, 5, 10)
+        self._create_schedule(self.user, '내월간일정', visit_date=target_date)
+        coworker = self._create_schedule(self.coworker, '선택직원월간일정', visit_date=target_date)
+        self.client.force_login(self.manager)
+
+        response = self.client.get(self.calendar_url, {
+            'start': '2026-05-01',
+            'end': '2026-05-31',
+            'data_filter': 'user',
+            'filter_user': str(self.coworker.id),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        ids = [(item['type'], item['id']) for item in payload['schedules']]
+        self.assertEqual(ids, [('customer', coworker.id)])
+        self.assertEqual(payload['scope']['dataFilter'], 'user')
+        self.assertEqual(payload['scope']['filterUserId'], self.coworker.id)
+
+    def test_schedules_create_api_requires_login_json(self):
+        import json
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({}),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['error'], 'login_required')
+
+    def test_schedules_create_api_blocks_manager(self):
+        import json
+
+        followup = self._create_customer(self.user, '매니저차단')
+        self.client.force_login(self.manager)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'customer_meeting',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_personal_schedules_create_api_salesman_creates_own_schedule(self):
+        import json
+        from reporting.models import History, PersonalSchedule
+
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.personal_create_url,
+            data=json.dumps({
+                'title': 'React 개인 일정',
+                'content': 'React 개인 일정 내용',
+                'scheduleDate': '2026-05-10',
+                'scheduleTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        personal_schedule = PersonalSchedule.objects.get(pk=payload['scheduleId'])
+        self.assertEqual(personal_schedule.user, self.user)
+        self.assertEqual(personal_schedule.company, self.company)
+        self.assertEqual(personal_schedule.title, 'React 개인 일정')
+        self.assertEqual(personal_schedule.schedule_date.isoformat(), '2026-05-10')
+        self.assertEqual(personal_schedule.schedule_time.strftime('%H:%M'), '10:30')
+        self.assertEqual(payload['href'], f'/schedules/calendar/?personal={personal_schedule.id}&month=2026-05')
+        self.assertEqual(payload['schedule']['id'], personal_schedule.id)
+        self.assertEqual(payload['schedule']['href'], f'/schedules/calendar/?personal={personal_schedule.id}&month=2026-05')
+        self.assertTrue(payload['edit']['canEdit'])
+        self.assertEqual(
+            payload['edit']['submitUrl'],
+            reverse('reporting:personal_schedules_update_api', args=[personal_schedule.id]),
+        )
+        self.assertTrue(History.objects.filter(
+            personal_schedule=personal_schedule,
+            parent_history__isnull=True,
+            content='개인 일정: React 개인 일정',
+        ).exists())
+
+    def test_personal_schedules_create_api_blocks_manager(self):
+        import json
+        from reporting.models import PersonalSchedule
+
+        self.client.force_login(self.manager)
+
+        response = self.client.post(
+            self.personal_create_url,
+            data=json.dumps({
+                'title': '매니저 개인 일정',
+                'scheduleDate': '2026-05-10',
+                'scheduleTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(PersonalSchedule.objects.filter(title='매니저 개인 일정').exists())
+
+    def test_personal_schedules_detail_api_manager_reads_same_company_without_edit(self):
+        personal_schedule = self._create_personal_schedule(self.user, '매니저조회 개인 일정')
+        other_schedule = self._create_personal_schedule(self.other_user, '타사 개인 일정')
+        self.client.force_login(self.manager)
+
+        response = self.client.get(reverse('reporting:personal_schedules_detail_api', args=[personal_schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['schedule']['id'], personal_schedule.id)
+        self.assertEqual(payload['schedule']['href'], f'/schedules/calendar/?personal={personal_schedule.id}&month={personal_schedule.schedule_date:%Y-%m}')
+        self.assertFalse(payload['edit']['canEdit'])
+        self.assertEqual(payload['links']['deleteSchedule'], '')
+
+        denied = self.client.get(reverse('reporting:personal_schedules_detail_api', args=[other_schedule.id]))
+        self.assertEqual(denied.status_code, 403)
+
+    def test_personal_schedules_update_and_delete_api_are_owner_only(self):
+        import json
+        from reporting.models import History, PersonalSchedule
+
+        personal_schedule = self._create_personal_schedule(self.user, '수정전 개인 일정')
+        History.objects.create(
+            user=self.user,
+            company=self.company,
+            personal_schedule=personal_schedule,
+            action_type='memo',
+            content='개인 일정: 수정전 개인 일정',
+            created_by=self.user,
+        )
+        update_url = reverse('reporting:personal_schedules_update_api', args=[personal_schedule.id])
+        delete_url = reverse('reporting:personal_schedules_delete_api', args=[personal_schedule.id])
+
+        self.client.force_login(self.coworker)
+        blocked_update = self.client.post(
+            update_url,
+            data=json.dumps({
+                'title': '동료 수정 시도',
+                'scheduleDate': '2026-05-11',
+                'scheduleTime': '11:30',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(blocked_update.status_code, 403)
+        blocked_delete = self.client.post(delete_url)
+        self.assertEqual(blocked_delete.status_code, 403)
+        self.assertTrue(PersonalSchedule.objects.filter(pk=personal_schedule.id).exists())
+
+        self.client.force_login(self.user)
+        response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'title': '수정후 개인 일정',
+                'content': '수정된 개인 일정 내용',
+                'scheduleDate': '2026-05-11',
+                'scheduleTime': '11:30',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        personal_schedule.refresh_from_db()
+        self.assertEqual(personal_schedule.title, '수정후 개인 일정')
+        self.assertEqual(personal_schedule.content, '수정된 개인 일정 내용')
+        self.assertEqual(personal_schedule.schedule_date.isoformat(), '2026-05-11')
+        self.assertEqual(personal_schedule.schedule_time.strftime('%H:%M'), '11:30')
+        self.assertEqual(
+            History.objects.get(personal_schedule=personal_schedule, parent_history__isnull=True).content,
+            '개인 일정: 수정후 개인 일정',
+        )
+
+        delete_response = self.client.post(delete_url)
+        self.assertEqual(delete_response.status_code, 200)
+        self.assertTrue(delete_response.json()['success'])
+        self.assertFalse(PersonalSchedule.objects.filter(pk=personal_schedule.id).exists())
+
+    def test_schedules_create_api_salesman_creates_own_schedule(self):
+        import json
+        from reporting.models import Schedule
+
+        followup = self._create_customer(self.user, '빠른등록')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'quote',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'location': '고객 회의실',
+                'notes': '견적 일정 등록',
+                'expectedRevenue': '1200000',
+                'probability': '63',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        schedule = Schedule.objects.get(pk=payload['scheduleId'])
+        self.assertEqual(schedule.user, self.user)
+        self.assertEqual(schedule.followup, followup)
+        self.assertEqual(schedule.activity_type, 'quote')
+        self.assertEqual(schedule.location, '고객 회의실')
+        self.assertEqual(int(schedule.expected_revenue), 1200000)
+        self.assertEqual(schedule.probability, 65)
+        self.assertEqual(payload['schedule']['probability'], 65)
+        self.assertEqual(payload['schedule']['id'], schedule.id)
+        self.assertEqual(payload['href'], f'/schedules/{schedule.id}/')
+
+    def test_schedules_create_api_quote_advances_pipeline_card(self):
+        import json
+        from reporting.models import Schedule
+
+        followup = self._create_customer(self.user, '자동견적카드')
+        followup.pipeline_stage = 'contact'
+        followup.save(update_fields=['pipeline_stage'])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'quote',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'expectedRevenue': '1200000',
+                'probability': '63',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        schedule = Schedule.objects.get(pk=response.json()['scheduleId'])
+        followup.refresh_from_db()
+        self.assertEqual(schedule.activity_type, 'quote')
+        self.assertEqual(followup.pipeline_stage, 'quote')
+
+        pipeline_response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+        self.assertEqual(pipeline_response.status_code, 200)
+        deal = next(item for item in pipeline_response.json()['deals'] if item['id'] == followup.id)
+        self.assertEqual(deal['stage'], 'quote')
+        self.assertEqual(deal['stageLabel'], '견적 제출')
+        self.assertEqual(deal['value'], 1200000)
+        self.assertEqual(deal['latestQuote']['basisType'], 'schedule')
+        self.assertEqual(deal['latestQuote']['source'], '견적 일정')
+        self.assertEqual(deal['latestQuote']['quoteDate'], '2026-05-10')
+
+    def test_schedules_create_api_requires_quote_probability(self):
+        import json
+
+        followup = self._create_customer(self.user, '견적확률필수')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'quote',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'expectedRevenue': '1200000',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('견적 성공 확률은 필수입니다.', response.json()['error'])
+
+    def test_schedules_create_api_meeting_probability_is_optional_null(self):
+        import json
+        from reporting.models import Schedule
+
+        followup = self._create_customer(self.user, '미팅확률선택')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'customer_meeting',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'notes': '미팅 확률 미입력',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        schedule = Schedule.objects.get(pk=payload['scheduleId'])
+        self.assertIsNone(schedule.probability)
+        self.assertIsNone(payload['schedule']['probability'])
+
+    def test_schedules_create_api_meeting_probability_is_normalized(self):
+        import json
+        from reporting.models import Schedule
+
+        followup = self._create_customer(self.user, '미팅확률보정')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'customer_meeting',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'probability': '62',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        schedule = Schedule.objects.get(pk=payload['scheduleId'])
+        self.assertEqual(schedule.probability, 60)
+        self.assertEqual(payload['schedule']['probability'], 60)
+
+    def test_schedules_create_api_salesman_creates_department_only_schedule(self):
+        import json
+        from reporting.models import Schedule
+
+        department = self._create_department_only(self.user, '고객없는일정')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': department.id,
+                'activityType': 'customer_meeting',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'location': '부서 방문',
+                'notes': '담당자 등록 전 방문 일정',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 201)
+        payload = response.json()
+        schedule = Schedule.objects.get(pk=payload['scheduleId'])
+        self.assertEqual(schedule.user, self.user)
+        self.assertIsNone(schedule.followup_id)
+        self.assertEqual(schedule.department_id, department.id)
+        self.assertEqual(schedule.location, '부서 방문')
+        self.assertIsNone(schedule.probability)
+        self.assertIsNone(payload['schedule']['probability'])
+        self.assertEqual(payload['schedule']['customer'], '담당자 미등록')
+        self.assertEqual(payload['schedule']['departmentId'], department.id)
+        self.assertEqual(payload['schedule']['customerHref'], f'/accounts/{department.id}/')
+
+    def test_schedules_create_api_requires_customer_when_department_has_contacts(self):
+        import json
+
+        followup = self._create_customer(self.user, '고객있는일정부서')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': followup.department_id,
+                'activityType': 'customer_meeting',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('고객을 선택하세요', response.json()['error'])
+
+    def test_schedules_create_api_blocks_other_salesman_customer(self):
+        import json
+        from reporting.models import Schedule
+
+        followup = self._create_customer(self.coworker, '동료고객')
+        coworker_department = self._create_department_only(self.coworker, '동료부서')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'customer_meeting',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Schedule.objects.filter(followup=followup, user=self.user).exists())
+
+        department_response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'departmentId': coworker_department.id,
+                'activityType': 'customer_meeting',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(department_response.status_code, 403)
+        self.assertFalse(Schedule.objects.filter(department=coworker_department, user=self.user).exists())
+
+    def test_schedules_create_api_rejects_service_activity_type(self):
+        import json
+        from reporting.models import Schedule
+
+        followup = self._create_customer(self.user, '서비스차단')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            self.create_url,
+            data=json.dumps({
+                'followupId': followup.id,
+                'activityType': 'service',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Schedule.objects.filter(followup=followup, activity_type='service').exists())
+
+    def test_schedules_detail_api_returns_detail_and_edit_config(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import DeliveryItem, History, ScheduleFile
+
+        schedule = self._create_schedule(self.user, '상세일정', activity_type='delivery')
+        schedule.quote_extra_notes = '전체 견적 기타사항'
+        schedule.save(update_fields=['quote_extra_notes'])
+        History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            schedule=schedule,
+            action_type='delivery_schedule',
+            content='납품 보고',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='PCR Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=100000,
+            discount_rate=10,
+            notes='PCR 적요',
+            option_description='PCR 옵션 설명',
+        )
+        schedule_file = ScheduleFile.objects.create(
+            schedule=schedule,
+            file=SimpleUploadedFile('schedule-note.txt', b'schedule file note', content_type='text/plain'),
+            original_filename='schedule-note.txt',
+            file_size=18,
+            uploaded_by=self.user,
+        )
+        self.addCleanup(schedule_file.file.delete, False)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:schedules_detail_api', args=[schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['schedule']['id'], schedule.id)
+        self.assertEqual(payload['schedule']['href'], f'/schedules/{schedule.id}/')
+        self.assertEqual(payload['schedule']['customerHref'], f'/customers/{schedule.followup_id}/')
+        self.assertEqual(payload['schedule']['quoteExtraNotes'], '전체 견적 기타사항')
+        self.assertEqual(payload['schedule']['quoteGroupNotes'][0]['notes'], '전체 견적 기타사항')
+        self.assertTrue(payload['edit']['canEdit'])
+        self.assertEqual(payload['edit']['submitUrl'], reverse('reporting:schedules_update_api', args=[schedule.id]))
+        self.assertEqual(payload['relatedNotes'][0]['id'], schedule.histories.first().id)
+        self.assertEqual(payload['deliveryItems'][0]['itemName'], 'PCR Kit')
+        self.assertEqual(payload['deliveryItems'][0]['discountRate'], 10.0)
+        self.assertEqual(payload['deliveryItems'][0]['discountUnitPrice'], 90000)
+        self.assertEqual(payload['deliveryItems'][0]['effectiveUnitPrice'], 90000)
+        self.assertEqual(payload['deliveryItems'][0]['totalPrice'], 198000)
+        self.assertEqual(payload['deliveryItems'][0]['notes'], 'PCR 적요')
+        self.assertEqual(payload['deliveryItems'][0]['optionDescription'], 'PCR 옵션 설명')
+        self.assertEqual(payload['links']['uploadFiles'], reverse('reporting:schedule_file_upload', args=[schedule.id]))
+        self.assertEqual(payload['links']['updateDeliveryItems'], reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]))
+        self.assertEqual(payload['links']['toggleTaxInvoice'], '')
+        self.assertEqual(payload['links']['prepayments'], reverse('reporting:prepayment_api_list'))
+        self.assertEqual(payload['links']['deleteSchedule'], reverse('reporting:schedule_delete', args=[schedule.id]))
+        self.assertTrue(payload['taxInvoice']['applies'])
+        self.assertEqual(payload['taxInvoice']['status'], 'pending')
+        self.assertEqual(payload['taxInvoice']['totalCount'], 1)
+        self.assertEqual(payload['taxInvoice']['issuedCount'], 0)
+        self.assertEqual(payload['taxInvoice']['pendingCount'], 1)
+        self.assertFalse(payload['taxInvoice']['canToggle'])
+        self.assertEqual(payload['taxInvoice']['toggleUrl'], '')
+        self.assertEqual(payload['schedule']['files'][0]['id'], schedule_file.id)
+        self.assertEqual(payload['schedule']['files'][0]['deleteHref'], reverse('reporting:schedule_file_delete', args=[schedule_file.id]))
+        document_types = [item['type'] for item in payload['documents']['items']]
+        self.assertEqual(document_types, ['transaction_statement', 'delivery_note'])
+        first_document = payload['documents']['items'][0]
+        self.assertEqual(first_document['previewHref'], reverse('reporting:get_document_template_data', args=['transaction_statement', schedule.id]))
+        self.assertEqual(
+            first_document['formats'][0]['href'],
+            reverse('reporting:generate_document_pdf_format', args=['transaction_statement', schedule.id, 'pdf']),
+        )
+        self.assertEqual(
+            first_document['formats'][1]['href'],
+            reverse('reporting:generate_document_pdf_format', args=['transaction_statement', schedule.id, 'xlsx']),
+        )
+        self.assertEqual(payload['documents']['templateManagerHref'], '/documents/')
+        self.assertEqual(payload['documents']['djangoTemplateManagerHref'], reverse('reporting:document_template_list'))
+        self.assertIn('거래명세서 PDF', payload['documents']['autoAttachLabel'])
+
+    def test_schedules_detail_api_document_actions_match_activity_type(self):
+        quote_schedule = self._create_schedule(self.user, '견적서류', activity_type='quote')
+        meeting_schedule = self._create_schedule(self.user, '미팅서류없음', activity_type='customer_meeting')
+        self.client.force_login(self.user)
+
+        quote_response = self.client.get(reverse('reporting:schedules_detail_api', args=[quote_schedule.id]))
+        meeting_response = self.client.get(reverse('reporting:schedules_detail_api', args=[meeting_schedule.id]))
+
+        self.assertEqual(quote_response.status_code, 200)
+        self.assertEqual(meeting_response.status_code, 200)
+        quote_payload = quote_response.json()
+        meeting_payload = meeting_response.json()
+        self.assertTrue(quote_payload['documents']['canGenerate'])
+        self.assertEqual([item['type'] for item in quote_payload['documents']['items']], ['quotation'])
+        self.assertIn('견적서 PDF', quote_payload['documents']['autoAttachLabel'])
+        self.assertEqual(
+            quote_payload['documents']['items'][0]['formats'][1]['href'],
+            reverse('reporting:generate_document_pdf_format', args=['quotation', quote_schedule.id, 'xlsx']),
+        )
+        self.assertFalse(meeting_payload['documents']['canGenerate'])
+        self.assertEqual(meeting_payload['documents']['items'], [])
+        self.assertEqual(meeting_payload['documents']['autoAttachLabel'], '')
+
+    def test_schedules_detail_api_splits_quotation_documents_by_quote_group(self):
+        from reporting.models import DeliveryItem
+
+        quote_schedule = self._create_schedule(self.user, '복수견적서류', activity_type='quote')
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Trade In Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            quote_group='보상판매',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Repair Service',
+            quantity=1,
+            unit='EA',
+            unit_price=50000,
+            quote_group='수리',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:schedules_detail_api', args=[quote_schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        actions = response.json()['documents']['items']
+        self.assertEqual([action['quoteGroup'] for action in actions], ['보상판매', '수리'])
+        self.assertEqual([action['label'] for action in actions], ['보상판매 견적서', '수리 견적서'])
+        self.assertIn('quote_group=', actions[0]['previewHref'])
+        self.assertIn('quote_group=', actions[1]['formats'][0]['href'])
+        self.assertEqual(actions[0]['itemCount'], 1)
+
+    def test_schedules_detail_api_includes_quote_commercial_checks(self):
+        import datetime
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        quote_schedule = self._create_schedule(
+            self.user,
+            '견적정합성',
+            activity_type='quote',
+            status='completed',
+        )
+        delivered_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Trade In PCR',
+            quantity=2,
+            unit='EA',
+            unit_price=100000,
+            quote_group='보상판매',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Repair Buffer',
+            quantity=1,
+            unit='EA',
+            unit_price=50000,
+            quote_group='수리',
+        )
+        delivery_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=quote_schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(11, 0),
+            activity_type='delivery',
+            status='scheduled',
+        )
+        DeliveryItem.objects.create(
+            schedule=delivery_schedule,
+            source_quote_schedule=quote_schedule,
+            source_quote_item=delivered_item,
+            item_name='Trade In PCR',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            quote_group='보상판매',
+        )
+        log = DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='quotation',
+            schedule=quote_schedule,
+            user=self.user,
+            transaction_number='Q-CHECK-001',
+            output_format='pdf',
+            file=SimpleUploadedFile('trade-in-quote.pdf', b'%PDF quote', content_type='application/pdf'),
+            filename='trade-in-quote.pdf',
+            file_size=10,
+            quote_group='보상판매',
+        )
+        self.addCleanup(log.file.delete, False)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:schedules_detail_api', args=[quote_schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        checks = response.json()['commercialChecks']
+        self.assertTrue(checks['applies'])
+        self.assertEqual(checks['kind'], 'quote')
+        self.assertEqual(checks['summary']['quoteGroupCount'], 2)
+        self.assertEqual(checks['summary']['quoteItemCount'], 2)
+        self.assertEqual(checks['summary']['quoteAmount'], 275000)
+        self.assertEqual(checks['summary']['deliveredAmount'], 110000)
+        self.assertEqual(checks['summary']['remainingAmount'], 165000)
+        groups = {group['quoteGroup']: group for group in checks['quoteGroups']}
+        self.assertEqual(groups['보상판매']['registeredQuotationCount'], 1)
+        self.assertEqual(groups['보상판매']['fulfillmentStatus'], 'partial')
+        self.assertEqual(groups['보상판매']['deliveredAmount'], 110000)
+        self.assertEqual(groups['보상판매']['remainingAmount'], 110000)
+        self.assertEqual(groups['수리']['registeredQuotationCount'], 0)
+        codes = [warning['code'] for warning in checks['warnings']]
+        self.assertIn('missing_registered_quotation', codes)
+        self.assertIn('missing_auto_attach_candidate', codes)
+        self.assertIn('completed_quote_still_importable', codes)
+
+    def test_schedules_detail_api_query_count_does_not_grow_with_items_or_documents(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from reporting.models import DeliveryItem, DocumentGenerationLog
+
+        quote_schedule = self._create_schedule(self.user, '상세쿼리수', activity_type='quote')
+        url = reverse('reporting:schedules_detail_api', args=[quote_schedule.id])
+        self.client.force_login(self.user)
+
+        def add_rows(prefix):
+            for index in range(3):
+                DeliveryItem.objects.create(
+                    schedule=quote_schedule,
+                    item_name=f'{prefix} Kit {index}',
+                    quantity=1,
+                    unit='EA',
+                    unit_price=1000,
+                    quote_group=f'{prefix}{index}',
+                )
+                DocumentGenerationLog.objects.create(
+                    company=self.company,
+                    document_type='quotation',
+                    schedule=quote_schedule,
+                    user=self.user,
+                    transaction_number=f'Q-COUNT-{prefix}-{index}',
+                    output_format='pdf',
+                    file=f'generated/{prefix}-{index}.pdf',
+                    quote_group=f'{prefix}{index}',
+                )
+
+        add_rows('A')
+        self.assertEqual(self.client.get(url).status_code, 200)
+        with CaptureQueriesContext(connection) as first:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        add_rows('B')
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get(url)
+
+        self.assertEqual(response.json()['documents']['registeredQuotationCount'], 6)
+        self.assertEqual(len(second.captured_queries), len(first.captured_queries))
+        self.assertFalse([
+            query['sql'] for query in second.captured_queries
+            if 'reporting_documenttemplate' in query['sql']
+        ])
+
+    def test_schedules_detail_api_includes_registered_generated_documents(self):
+        schedule = self._create_schedule(self.user, '등록서류목록', activity_type='delivery')
+        log = DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='transaction_statement',
+            schedule=schedule,
+            user=self.user,
+            transaction_number='TS-20260512-001',
+            output_format='pdf',
+            file=SimpleUploadedFile('statement.pdf', b'%PDF statement', content_type='application/pdf'),
+            filename='statement.pdf',
+            file_size=14,
+        )
+        self.addCleanup(log.file.delete, False)
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:schedules_detail_api', args=[schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        documents = response.json()['documents']
+        self.assertEqual(documents['registeredDocumentCount'], 1)
+        self.assertEqual(documents['registeredQuotationCount'], 0)
+        registered = documents['registeredDocuments'][0]
+        self.assertEqual(registered['id'], log.id)
+        self.assertEqual(registered['documentType'], 'transaction_statement')
+        self.assertEqual(registered['documentTypeLabel'], '거래명세서')
+        self.assertEqual(registered['downloadHref'], reverse('reporting:generated_document_download', args=[log.id]))
+        self.assertEqual(registered['deleteHref'], reverse('reporting:generated_document_delete', args=[log.id]))
+        self.assertTrue(registered['canDelete'])
+
+    def test_schedules_detail_api_includes_delivery_commercial_checks(self):
+        from reporting.models import DeliveryItem, History
+
+        schedule = self._create_schedule(self.user, '납품정합성', activity_type='delivery')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='PCR Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=100000,
+            discount_rate=10,
+        )
+        History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            schedule=schedule,
+            action_type='delivery_schedule',
+            delivery_items='PCR Kit 2EA',
+            delivery_amount=1000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:schedules_detail_api', args=[schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        checks = response.json()['commercialChecks']
+        self.assertTrue(checks['applies'])
+        self.assertEqual(checks['kind'], 'delivery')
+        self.assertEqual(checks['summary']['deliveryItemCount'], 1)
+        self.assertEqual(checks['summary']['deliveryAmount'], 198000)
+        self.assertFalse(checks['summary']['autoAttachReady'])
+        self.assertEqual(checks['delivery']['autoAttachStatus'], 'missing')
+        self.assertEqual(checks['delivery']['historyAmountMismatches'][0]['noteAmount'], 1000)
+        self.assertEqual(checks['delivery']['historyAmountMismatches'][0]['itemAmount'], 198000)
+        codes = [warning['code'] for warning in checks['warnings']]
+        self.assertIn('missing_auto_attach_candidate', codes)
+        self.assertIn('delivery_note_amount_mismatch', codes)
+
+    def test_generated_document_delete_api_allows_owner_only(self):
+        schedule = self._create_schedule(self.user, '등록서류삭제', activity_type='quote')
+        log = DocumentGenerationLog.objects.create(
+            company=self.company,
+            document_type='quotation',
+            schedule=schedule,
+            user=self.user,
+            transaction_number='Q-20260512-001',
+            output_format='pdf',
+            file=SimpleUploadedFile('quote.pdf', b'%PDF quote', content_type='application/pdf'),
+            filename='quote.pdf',
+            file_size=10,
+            quote_group='수리',
+        )
+        self.addCleanup(log.file.delete, False)
+        delete_url = reverse('reporting:generated_document_delete', args=[log.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(delete_url)
+        self.assertEqual(manager_response.status_code, 403)
+        self.assertTrue(DocumentGenerationLog.objects.filter(pk=log.id).exists())
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(delete_url)
+        self.assertEqual(coworker_response.status_code, 403)
+        self.assertTrue(DocumentGenerationLog.objects.filter(pk=log.id).exists())
+
+        self.client.force_login(self.user)
+        response = self.client.post(delete_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertFalse(DocumentGenerationLog.objects.filter(pk=log.id).exists())
+
+    def test_schedules_detail_api_manager_read_only_and_other_company_blocked(self):
+        from reporting.models import DeliveryItem
+
+        schedule = self._create_schedule(self.user, '읽기전용', activity_type='delivery')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Read Only Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=1000,
+        )
+        self.client.force_login(self.manager)
+
+        response = self.client.get(reverse('reporting:schedules_detail_api', args=[schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['edit']['canEdit'])
+        self.assertEqual(response.json()['links']['updateDeliveryItems'], '')
+        self.assertEqual(response.json()['links']['deleteSchedule'], '')
+        self.assertEqual(response.json()['links']['toggleTaxInvoice'], '')
+        self.assertTrue(response.json()['taxInvoice']['applies'])
+        self.assertFalse(response.json()['taxInvoice']['canToggle'])
+
+        self.client.force_login(self.other_user)
+        denied = self.client.get(reverse('reporting:schedules_detail_api', args=[schedule.id]))
+        self.assertEqual(denied.status_code, 403)
+
+    def test_schedule_tax_invoice_toggle_is_removed_in_favor_of_receivables_menu(self):
+        from reporting.models import DeliveryItem, History
+
+        schedule = self._create_schedule(self.user, '세금계산서토글', activity_type='delivery')
+        first = DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Tax Kit A',
+            quantity=1,
+            unit='EA',
+            unit_price=1000,
+            tax_invoice_issued=False,
+        )
+        second = DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Tax Kit B',
+            quantity=1,
+            unit='EA',
+            unit_price=1000,
+            tax_invoice_issued=True,
+        )
+        history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            schedule=schedule,
+            action_type='delivery_schedule',
+            tax_invoice_issued=False,
+        )
+        toggle_url = reverse('reporting:toggle_schedule_delivery_tax_invoice', args=[schedule.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(toggle_url)
+        self.assertEqual(manager_response.status_code, 410)
+        self.assertIn('/receivables/', manager_response.json()['redirect'])
+
+        self.client.force_login(self.user)
+        response = self.client.post(toggle_url)
+        self.assertEqual(response.status_code, 410)
+        self.assertFalse(response.json()['success'])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        history.refresh_from_db()
+        self.assertFalse(first.tax_invoice_issued)
+        self.assertTrue(second.tax_invoice_issued)
+        self.assertFalse(history.tax_invoice_issued)
+
+    def test_schedule_delete_ajax_allows_owner_and_removes_related_history(self):
+        from reporting.models import History, Schedule
+
+        schedule = self._create_schedule(self.user, '삭제일정', activity_type='delivery')
+        related_history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            schedule=schedule,
+            action_type='delivery_schedule',
+            content='삭제될 납품 기록',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedule_delete', args=[schedule.id]),
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertFalse(Schedule.objects.filter(pk=schedule.id).exists())
+        self.assertFalse(History.objects.filter(pk=related_history.id).exists())
+
+    def test_schedule_delete_ajax_blocks_non_owner(self):
+        from reporting.models import Schedule
+
+        schedule = self._create_schedule(self.user, '타인삭제차단')
+        self.client.force_login(self.coworker)
+
+        response = self.client.post(
+            reverse('reporting:schedule_delete', args=[schedule.id]),
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(response.json()['success'])
+        self.assertTrue(Schedule.objects.filter(pk=schedule.id).exists())
+
+    def test_product_api_list_returns_accessible_product_master_data(self):
+        from reporting.models import Product
+
+        global_product = Product.objects.create(
+            product_code='MASTER-GLOBAL-PCR',
+            unit='BOX',
+            specification='96 reactions',
+            standard_price=1000,
+            created_by=None,
+        )
+        own_product = Product.objects.create(
+            product_code='MASTER-OWN-PCR',
+            unit='EA',
+            standard_price=2000,
+            created_by=self.user,
+        )
+        coworker_product = Product.objects.create(
+            product_code='MASTER-COWORKER-PCR',
+            unit='SET',
+            standard_price=3000,
+            created_by=self.coworker,
+        )
+        other_product = Product.objects.create(
+            product_code='MASTER-OTHER-PCR',
+            unit='EA',
+            standard_price=4000,
+            created_by=self.other_user,
+        )
+        inactive_product = Product.objects.create(
+            product_code='MASTER-INACTIVE-PCR',
+            unit='EA',
+            standard_price=5000,
+            is_active=False,
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:product_api_list'), {'search': 'MASTER-'})
+
+        self.assertEqual(response.status_code, 200)
+        products = response.json()['products']
+        product_codes = {product['product_code'] for product in products}
+        self.assertIn(global_product.product_code, product_codes)
+        self.assertIn(own_product.product_code, product_codes)
+        self.assertIn(coworker_product.product_code, product_codes)
+        self.assertNotIn(other_product.product_code, product_codes)
+        self.assertNotIn(inactive_product.product_code, product_codes)
+        global_payload = next(product for product in products if product['product_code'] == global_product.product_code)
+        self.assertEqual(global_payload['unit'], 'BOX')
+        self.assertEqual(global_payload['specification'], '96 reactions')
+        self.assertEqual(global_payload['current_price'], 1000.0)
+
+    def test_schedules_update_api_updates_owned_schedule(self):
+        import json
+
+        schedule = self._create_schedule(self.user, '수정전')
+        target_followup = self._create_customer(self.coworker, '수정후')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'followupId': target_followup.id,
+                'activityType': 'delivery',
+                'status': 'completed',
+                'visitDate': '2026-05-11',
+                'visitTime': '15:45',
+                'location': '수정 회의실',
+                'notes': '일정 수정 메모',
+                'expectedRevenue': '2500000',
+                'probability': '82',
+                'expectedCloseDate': '2026-06-01',
+                'purchaseConfirmed': True,
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.followup, target_followup)
+        self.assertEqual(schedule.activity_type, 'delivery')
+        self.assertEqual(schedule.status, 'completed')
+        self.assertEqual(schedule.visit_date.isoformat(), '2026-05-11')
+        self.assertEqual(schedule.visit_time.strftime('%H:%M'), '15:45')
+        self.assertEqual(schedule.location, '수정 회의실')
+        self.assertEqual(schedule.notes, '일정 수정 메모')
+        self.assertEqual(int(schedule.expected_revenue), 2500000)
+        self.assertEqual(schedule.probability, 80)
+        self.assertEqual(payload['schedule']['probability'], 80)
+        self.assertEqual(schedule.expected_close_date.isoformat(), '2026-06-01')
+        self.assertTrue(schedule.purchase_confirmed)
+        self.assertEqual(payload['schedule']['id'], schedule.id)
+        self.assertEqual(payload['message'], '일정을 수정했습니다.')
+
+    def test_schedules_update_api_delivery_completed_forces_pipeline_card_to_won(self):
+        import json
+
+        schedule = self._create_schedule(self.user, '납품완료수주', activity_type='quote')
+        schedule.followup.pipeline_stage = 'quote'
+        schedule.followup.pipeline_manually_set = True
+        schedule.followup.save(update_fields=['pipeline_stage', 'pipeline_manually_set'])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'delivery',
+                'status': 'completed',
+                'visitDate': '2026-05-11',
+                'visitTime': '15:45',
+                'location': '납품 회의실',
+                'notes': '납품 완료',
+                'expectedRevenue': '2500000',
+                'probability': '100',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        schedule.refresh_from_db()
+        schedule.followup.refresh_from_db()
+        self.assertEqual(schedule.activity_type, 'delivery')
+        self.assertEqual(schedule.status, 'completed')
+        self.assertEqual(schedule.followup.pipeline_stage, 'won')
+        self.assertFalse(schedule.followup.pipeline_manually_set)
+
+        pipeline_response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+        self.assertEqual(pipeline_response.status_code, 200)
+        deal = next(item for item in pipeline_response.json()['deals'] if item['id'] == schedule.followup_id)
+        self.assertEqual(deal['stage'], 'won')
+        self.assertEqual(deal['stageLabel'], '수주')
+
+    def test_schedules_update_api_requires_quote_probability(self):
+        import json
+
+        schedule = self._create_schedule(self.user, '견적수정확률필수', activity_type='quote')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'quote',
+                'status': 'scheduled',
+                'visitDate': '2026-05-11',
+                'visitTime': '15:45',
+                'expectedRevenue': '2500000',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('견적 성공 확률은 필수입니다.', response.json()['error'])
+
+    def test_schedules_update_api_quote_advances_pipeline_card(self):
+        import json
+
+        schedule = self._create_schedule(self.user, '견적수정카드', activity_type='customer_meeting')
+        schedule.followup.pipeline_stage = 'contact'
+        schedule.followup.save(update_fields=['pipeline_stage'])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'quote',
+                'status': 'scheduled',
+                'visitDate': '2026-05-12',
+                'visitTime': '16:15',
+                'expectedRevenue': '2500000',
+                'probability': '82',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        schedule.refresh_from_db()
+        schedule.followup.refresh_from_db()
+        self.assertEqual(schedule.activity_type, 'quote')
+        self.assertEqual(schedule.probability, 80)
+        self.assertEqual(schedule.followup.pipeline_stage, 'quote')
+
+        pipeline_response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+        self.assertEqual(pipeline_response.status_code, 200)
+        deal = next(item for item in pipeline_response.json()['deals'] if item['id'] == schedule.followup_id)
+        self.assertEqual(deal['stage'], 'quote')
+        self.assertEqual(deal['value'], 2500000)
+        self.assertEqual(deal['probability'], 80)
+
+    def test_schedules_update_api_quote_cancel_moves_pipeline_card_to_lost(self):
+        import json
+
+        schedule = self._create_schedule(self.user, '견적취소실주', activity_type='quote')
+        schedule.followup.pipeline_stage = 'quote'
+        schedule.followup.save(update_fields=['pipeline_stage'])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'quote',
+                'status': 'cancelled',
+                'visitDate': '2026-05-12',
+                'visitTime': '16:15',
+                'expectedRevenue': '2500000',
+                'probability': '75',
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        schedule.refresh_from_db()
+        schedule.followup.refresh_from_db()
+        self.assertEqual(schedule.status, 'cancelled')
+        self.assertEqual(schedule.followup.pipeline_stage, 'lost')
+
+        pipeline_response = self.client.get(reverse('reporting:pipeline_command_center_api'))
+        self.assertEqual(pipeline_response.status_code, 200)
+        deal = next(item for item in pipeline_response.json()['deals'] if item['id'] == schedule.followup_id)
+        self.assertEqual(deal['stage'], 'lost')
+        self.assertEqual(deal['stageLabel'], '실주')
+        self.assertEqual(deal['value'], 2500000)
+
+    def test_schedule_status_update_api_quote_cancel_moves_pipeline_card_to_lost(self):
+        schedule = self._create_schedule(self.user, '상태버튼견적취소', activity_type='quote')
+        schedule.followup.pipeline_stage = 'quote'
+        schedule.followup.save(update_fields=['pipeline_stage'])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedule_status_update', args=[schedule.id]),
+            data={'status': 'cancelled'},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        schedule.refresh_from_db()
+        schedule.followup.refresh_from_db()
+        self.assertEqual(schedule.status, 'cancelled')
+        self.assertEqual(schedule.followup.pipeline_stage, 'lost')
+
+    def test_schedule_status_update_api_delivery_completed_moves_pipeline_card_to_won(self):
+        schedule = self._create_schedule(self.user, '상태버튼납품완료', activity_type='delivery')
+        schedule.followup.pipeline_stage = 'quote'
+        schedule.followup.pipeline_manually_set = True
+        schedule.followup.save(update_fields=['pipeline_stage', 'pipeline_manually_set'])
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedule_status_update', args=[schedule.id]),
+            data={'status': 'completed'},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        schedule.refresh_from_db()
+        schedule.followup.refresh_from_db()
+        self.assertEqual(schedule.status, 'completed')
+        self.assertEqual(schedule.followup.pipeline_stage, 'won')
+        self.assertFalse(schedule.followup.pipeline_manually_set)
+
+    def test_prepayment_api_list_includes_same_department_and_existing_usage(self):
+        from django.utils import timezone
+        from reporting.models import FollowUp, Prepayment, PrepaymentUsage
+
+        schedule = self._create_schedule(self.user, '선결제조회', activity_type='delivery')
+        same_department_customer = FollowUp.objects.create(
+            user=self.user,
+            user_company=self.company,
+            customer_name='같은부서 고객',
+            manager='같은부서 담당',
+            company=schedule.followup.company,
+            department=schedule.followup.department,
+        )
+        other_department_customer = self._create_customer(self.user, '다른부서')
+        active_prepayment = Prepayment.objects.create(
+            customer=same_department_customer,
+            company=same_department_customer.company,
+            amount=100000,
+            balance=80000,
+            payment_date=timezone.localdate(),
+            payer_name='같은부서입금',
+            created_by=self.user,
+        )
+        selected_depleted_prepayment = Prepayment.objects.create(
+            customer=schedule.followup,
+            company=schedule.followup.company,
+            amount=40000,
+            balance=0,
+            payment_date=timezone.localdate(),
+            payer_name='기존차감',
+            status='depleted',
+            created_by=self.user,
+        )
+        PrepaymentUsage.objects.create(
+            prepayment=selected_depleted_prepayment,
+            schedule=schedule,
+            product_name='기존 납품',
+            quantity=1,
+            amount=40000,
+            remaining_balance=0,
+        )
+        Prepayment.objects.create(
+            customer=other_department_customer,
+            company=other_department_customer.company,
+            amount=50000,
+            balance=50000,
+            payment_date=timezone.localdate(),
+            payer_name='다른부서입금',
+            created_by=self.user,
+        )
+        schedule.use_prepayment = True
+        schedule.prepayment = selected_depleted_prepayment
+        schedule.prepayment_amount = 40000
+        schedule.save(update_fields=['use_prepayment', 'prepayment', 'prepayment_amount'])
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:prepayment_api_list'), {
+            'customer_id': schedule.followup_id,
+            'schedule_id': schedule.id,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        prepayments = response.json()['prepayments']
+        ids = {item['id'] for item in prepayments}
+        self.assertIn(active_prepayment.id, ids)
+        self.assertIn(selected_depleted_prepayment.id, ids)
+        selected_payload = next(item for item in prepayments if item['id'] == selected_depleted_prepayment.id)
+        self.assertEqual(selected_payload['balance'], 0)
+        self.assertEqual(selected_payload['selectedAmount'], 40000)
+        self.assertEqual(selected_payload['availableBalance'], 40000)
+
+    def test_schedules_update_api_applies_and_restores_prepayments(self):
+        import json
+        from django.utils import timezone
+        from reporting.models import Prepayment, PrepaymentUsage
+
+        schedule = self._create_schedule(self.user, '선결제수정', activity_type='delivery')
+        prepayment = Prepayment.objects.create(
+            customer=schedule.followup,
+            company=schedule.followup.company,
+            amount=100000,
+            balance=100000,
+            payment_date=timezone.localdate(),
+            payer_name='선결제고객',
+            created_by=self.user,
+        )
+        update_url = reverse('reporting:schedules_update_api', args=[schedule.id])
+        self.client.force_login(self.user)
+
+        apply_response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'delivery',
+                'status': 'scheduled',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'usePrepayment': True,
+                'prepayments': [
+                    {'id': prepayment.id, 'amount': '60000'},
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(apply_response.status_code, 200)
+        prepayment.refresh_from_db()
+        schedule.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 40000)
+        self.assertTrue(schedule.use_prepayment)
+        self.assertEqual(schedule.prepayment, prepayment)
+        self.assertEqual(int(schedule.prepayment_amount), 60000)
+        usage = PrepaymentUsage.objects.get(schedule=schedule)
+        self.assertEqual(int(usage.amount), 60000)
+        self.assertEqual(apply_response.json()['schedule']['prepaymentUsages'][0]['amount'], 60000)
+
+        restore_response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'delivery',
+                'status': 'scheduled',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'usePrepayment': False,
+                'prepayments': [],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(restore_response.status_code, 200)
+        prepayment.refresh_from_db()
+        schedule.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 100000)
+        self.assertFalse(schedule.use_prepayment)
+        self.assertIsNone(schedule.prepayment)
+        self.assertEqual(int(schedule.prepayment_amount), 0)
+        self.assertFalse(PrepaymentUsage.objects.filter(schedule=schedule).exists())
+
+    def test_schedules_update_api_blocks_over_balance_prepayment(self):
+        import json
+        from django.utils import timezone
+        from reporting.models import Prepayment, PrepaymentUsage
+
+        schedule = self._create_schedule(self.user, '선결제잔액차단', activity_type='delivery')
+        prepayment = Prepayment.objects.create(
+            customer=schedule.followup,
+            company=schedule.followup.company,
+            amount=1000,
+            balance=1000,
+            payment_date=timezone.localdate(),
+            payer_name='잔액부족',
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'delivery',
+                'status': 'scheduled',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+                'usePrepayment': True,
+                'prepayments': [
+                    {'id': prepayment.id, 'amount': '2000'},
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('잔액이 부족', response.json()['error'])
+        prepayment.refresh_from_db()
+        schedule.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 1000)
+        self.assertFalse(schedule.use_prepayment)
+        self.assertFalse(PrepaymentUsage.objects.filter(schedule=schedule).exists())
+
+    def test_schedules_update_api_blocks_manager_and_other_company_customer(self):
+        import json
+
+        schedule = self._create_schedule(self.user, '수정차단')
+        other_followup = self._create_customer(self.other_user, '타사고객')
+        update_url = reverse('reporting:schedules_update_api', args=[schedule.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'followupId': schedule.followup_id,
+                'activityType': 'customer_meeting',
+                'status': 'scheduled',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(manager_response.status_code, 403)
+
+        self.client.force_login(self.user)
+        other_company_response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'followupId': other_followup.id,
+                'activityType': 'customer_meeting',
+                'status': 'scheduled',
+                'visitDate': '2026-05-10',
+                'visitTime': '10:30',
+            }),
+            content_type='application/json',
+        )
+        self.assertEqual(other_company_response.status_code, 403)
+        schedule.refresh_from_db()
+        self.assertNotEqual(schedule.followup, other_followup)
+
+    def test_schedule_delivery_items_update_api_updates_owned_items_and_history(self):
+        import json
+        from reporting.models import DeliveryItem, History
+
+        schedule = self._create_schedule(self.user, '납품품목', activity_type='delivery')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Old Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=1000,
+        )
+        history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            schedule=schedule,
+            action_type='delivery_schedule',
+            delivery_items='old',
+            delivery_amount=1000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'quoteGroupNotes': {
+                    '보상판매': '보상판매 기타사항',
+                    '수리': '수리 기타사항',
+                },
+                'items': [
+                    {
+                        'itemName': 'PCR Kit',
+                        'quantity': 2,
+                        'unit': 'EA',
+                        'unitPrice': '100000',
+                        'discountRate': '10',
+                        'taxInvoiceIssued': True,
+                        'quoteGroup': '보상판매',
+                        'notes': 'PCR 적요',
+                        'optionDescription': 'PCR 옵션 설명',
+                    },
+                    {
+                        'itemName': 'Buffer',
+                        'quantity': 3,
+                        'unit': 'BOX',
+                        'unitPrice': '',
+                        'taxInvoiceIssued': False,
+                        'quoteGroup': '수리',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['message'], '납품 품목을 저장했습니다.')
+        items = list(DeliveryItem.objects.filter(schedule=schedule).order_by('id'))
+        self.assertEqual([item.item_name for item in items], ['PCR Kit', 'Buffer'])
+        self.assertEqual(items[0].quantity, 2)
+        self.assertEqual(items[0].unit, 'EA')
+        self.assertEqual(int(items[0].unit_price), 100000)
+        self.assertEqual(float(items[0].discount_rate), 10.0)
+        self.assertEqual(int(items[0].discount_unit_price), 90000)
+        self.assertEqual(int(items[0].get_effective_unit_price()), 90000)
+        self.assertEqual(int(items[0].total_price), 198000)
+        self.assertFalse(items[0].tax_invoice_issued)
+        self.assertEqual(items[0].quote_group, '보상판매')
+        self.assertEqual(items[0].notes, 'PCR 적요')
+        self.assertEqual(items[0].option_description, 'PCR 옵션 설명')
+        self.assertIsNone(items[1].unit_price)
+        self.assertEqual(items[1].quote_group, '수리')
+        schedule.refresh_from_db()
+        self.assertEqual(schedule.quote_extra_notes, '')
+        self.assertEqual(
+            {
+                note.quote_group: note.notes
+                for note in ScheduleQuoteGroupNote.objects.filter(schedule=schedule)
+            },
+            {'보상판매': '보상판매 기타사항', '수리': '수리 기타사항'},
+        )
+        history.refresh_from_db()
+        self.assertIn('PCR Kit', history.delivery_items)
+        self.assertIn('Buffer', history.delivery_items)
+        self.assertEqual(int(history.delivery_amount), 198000)
+        self.assertEqual(payload['deliveryItems'][0]['itemName'], 'PCR Kit')
+        self.assertEqual(payload['deliveryItems'][0]['discountRate'], 10.0)
+        self.assertEqual(payload['deliveryItems'][0]['discountUnitPrice'], 90000)
+        self.assertEqual(payload['deliveryItems'][0]['effectiveUnitPrice'], 90000)
+        self.assertEqual(payload['deliveryItems'][0]['totalPrice'], 198000)
+        self.assertEqual(payload['deliveryItems'][0]['quoteGroup'], '보상판매')
+        self.assertEqual(payload['deliveryItems'][0]['notes'], 'PCR 적요')
+        self.assertEqual(payload['deliveryItems'][0]['optionDescription'], 'PCR 옵션 설명')
+        self.assertIsNone(payload['deliveryItems'][1]['unitPrice'])
+        self.assertIsNone(payload['deliveryItems'][1]['discountUnitPrice'])
+        self.assertEqual(
+            {note['quoteGroup']: note['notes'] for note in payload['schedule']['quoteGroupNotes']},
+            {'보상판매': '보상판매 기타사항', '수리': '수리 기타사항'},
+        )
+
+    def test_schedule_delivery_items_update_api_preserves_existing_receivable_status(self):
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem
+
+        schedule = self._create_schedule(self.user, '외상상태보존', activity_type='delivery')
+        item = DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Receivable Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=100000,
+            tax_invoice_issued=True,
+            card_payment_received=True,
+            receivable_settled=True,
+            receivable_settled_at=timezone.now(),
+            receivable_settled_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'id': item.id,
+                        'itemName': 'Receivable Kit Updated',
+                        'quantity': 2,
+                        'unit': 'EA',
+                        'unitPrice': '100000',
+                        'taxInvoiceIssued': False,
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        updated = DeliveryItem.objects.get(schedule=schedule)
+        self.assertEqual(updated.item_name, 'Receivable Kit Updated')
+        self.assertTrue(updated.tax_invoice_issued)
+        self.assertTrue(updated.card_payment_received)
+        self.assertTrue(updated.receivable_settled)
+        self.assertEqual(updated.receivable_settled_by, self.user)
+
+    def test_schedule_delivery_items_update_api_keeps_ids_and_recomputes_totals_once(self):
+        import json
+        from decimal import Decimal
+        from reporting.models import DeliveryItem, OpportunityTracking, Product
+
+        schedule = self._create_schedule(self.user, '일괄저장', activity_type='delivery', status='completed')
+        opportunity = OpportunityTracking.objects.create(followup=schedule.followup, title='일괄저장 기회')
+        schedule.opportunity = opportunity
+        schedule.save(update_fields=['opportunity'])
+        product = Product.objects.create(
+            product_code='BULK-001',
+            standard_price=Decimal('10000'),
+            created_by=self.user,
+        )
+        kept = DeliveryItem.objects.create(
+            schedule=schedule, item_name='Kept', quantity=2, unit='EA', unit_price=10000, product=product,
+        )
+        removed = DeliveryItem.objects.create(schedule=schedule, item_name='Removed', quantity=1, unit='EA', unit_price=500)
+        product.refresh_from_db()
+        self.assertEqual(product.total_sold, 2)
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {'id': kept.id, 'itemName': 'Kept', 'quantity': 3, 'unit': 'EA', 'unitPrice': '10000', 'productId': product.id},
+                    {'itemName': 'Added', 'quantity': 1, 'unit': 'EA', 'unitPrice': '20000'},
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        items = list(DeliveryItem.objects.filter(schedule=schedule).order_by('id'))
+        self.assertEqual([item.id for item in items][:1], [kept.id])
+        self.assertEqual(items[1].item_name, 'Added')
+        self.assertEqual(items[0].total_price, Decimal('33000'))
+        self.assertFalse(DeliveryItem.objects.filter(id=removed.id).exists())
+        product.refresh_from_db()
+        self.assertEqual(product.total_sold, 3)
+        opportunity.refresh_from_db()
+        self.assertEqual(opportunity.actual_revenue, sum(item.total_price for item in items))
+        self.assertEqual(opportunity.current_stage, 'won')
+
+    def test_schedule_delivery_items_update_api_applies_reapplies_and_restores_prepayment(self):
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Prepayment, PrepaymentUsage
+
+        schedule = self._create_schedule(self.user, '납품품목선결제', activity_type='delivery')
+        prepayment = Prepayment.objects.create(
+            customer=schedule.followup,
+            company=schedule.followup.company,
+            amount=100000,
+            balance=100000,
+            payment_date=timezone.localdate(),
+            payer_name='선결제입금자',
+            created_by=self.user,
+        )
+        update_url = reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id])
+        self.client.force_login(self.user)
+
+        apply_response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'usePrepayment': True,
+                'prepayments': [{'id': prepayment.id, 'amount': '60000'}],
+                'items': [
+                    {
+                        'itemName': 'Prepaid Kit',
+                        'quantity': 2,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(apply_response.status_code, 200)
+        self.assertIn('선결제를 차감', apply_response.json()['message'])
+        prepayment.refresh_from_db()
+        schedule.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 40000)
+        self.assertTrue(schedule.use_prepayment)
+        self.assertEqual(schedule.prepayment, prepayment)
+        self.assertEqual(int(schedule.prepayment_amount), 60000)
+        usage = PrepaymentUsage.objects.get(schedule=schedule)
+        self.assertEqual(int(usage.amount), 60000)
+        self.assertEqual(usage.schedule_item.item_name, 'Prepaid Kit')
+        self.assertEqual(apply_response.json()['schedule']['prepaymentUsages'][0]['amount'], 60000)
+
+        reapply_response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'usePrepayment': True,
+                'prepayments': [{'id': prepayment.id, 'amount': '30000'}],
+                'items': [
+                    {
+                        'itemName': 'Prepaid Kit Updated',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(reapply_response.status_code, 200)
+        prepayment.refresh_from_db()
+        schedule.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 70000)
+        self.assertEqual(int(schedule.prepayment_amount), 30000)
+        self.assertEqual(PrepaymentUsage.objects.filter(schedule=schedule).count(), 1)
+        self.assertEqual(int(PrepaymentUsage.objects.get(schedule=schedule).amount), 30000)
+
+        restore_response = self.client.post(
+            update_url,
+            data=json.dumps({
+                'usePrepayment': False,
+                'prepayments': [],
+                'items': [
+                    {
+                        'itemName': 'Prepaid Kit Updated',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(restore_response.status_code, 200)
+        self.assertIn('선결제 차감을 해제', restore_response.json()['message'])
+        prepayment.refresh_from_db()
+        schedule.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 100000)
+        self.assertFalse(schedule.use_prepayment)
+        self.assertIsNone(schedule.prepayment)
+        self.assertEqual(int(schedule.prepayment_amount), 0)
+        self.assertFalse(PrepaymentUsage.objects.filter(schedule=schedule).exists())
+
+    def test_schedule_delivery_items_update_api_locks_only_prepayment_rows_when_applying_prepayment(self):
+        import json
+        from unittest.mock import patch
+        from django.db.models.query import QuerySet
+        from django.utils import timezone
+        from reporting.models import Prepayment
+
+        schedule = self._create_schedule(self.user, '납품선결제잠금', activity_type='delivery')
+        prepayment = Prepayment.objects.create(
+            customer=schedule.followup,
+            company=schedule.followup.company,
+            amount=100000,
+            balance=100000,
+            payment_date=timezone.localdate(),
+            payer_name='잠금입금자',
+            created_by=self.user,
+        )
+        update_url = reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id])
+        prepayment_lock_calls = []
+        original_select_for_update = QuerySet.select_for_update
+
+        def spy_select_for_update(queryset, *args, **kwargs):
+            if queryset.model is Prepayment:
+                prepayment_lock_calls.append(dict(kwargs))
+            return original_select_for_update(queryset, *args, **kwargs)
+
+        self.client.force_login(self.user)
+        with patch.object(QuerySet, 'select_for_update', spy_select_for_update):
+            response = self.client.post(
+                update_url,
+                data=json.dumps({
+                    'usePrepayment': True,
+                    'prepayments': [{'id': prepayment.id, 'amount': '60000'}],
+                    'items': [
+                        {
+                            'itemName': 'Lock Kit',
+                            'quantity': 2,
+                            'unit': 'EA',
+                            'unitPrice': '50000',
+                        },
+                    ],
+                }),
+                content_type='application/json',
+            )
+
+        self.assertEqual(response.status_code, 200, response.content.decode())
+        self.assertTrue(response.json()['success'])
+        self.assertTrue(
+            any(call.get('of') == ('self',) for call in prepayment_lock_calls),
+            prepayment_lock_calls,
+        )
+
+    def test_schedule_delivery_items_update_api_treats_zero_discount_unit_price_without_rate_as_blank(self):
+        import json
+        from reporting.models import DeliveryItem
+
+        schedule = self._create_schedule(self.user, '납품할인단가0', activity_type='delivery')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'itemName': 'SO825.0002',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '379950',
+                        'discountRate': '',
+                        'discountUnitPrice': '0',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        item = DeliveryItem.objects.get(schedule=schedule)
+        self.assertIsNone(item.discount_unit_price)
+        self.assertEqual(float(item.discount_rate), 0.0)
+        self.assertEqual(int(item.get_effective_unit_price()), 379950)
+        self.assertEqual(int(item.total_price), 417945)
+        self.assertIsNone(payload['deliveryItems'][0]['discountUnitPrice'])
+        self.assertEqual(payload['deliveryItems'][0]['effectiveUnitPrice'], 379950)
+        self.assertEqual(payload['deliveryItems'][0]['totalPrice'], 417945)
+
+    def test_schedule_delivery_items_update_api_blocks_prepayment_above_delivery_total(self):
+        import json
+        from django.utils import timezone
+        from reporting.models import Prepayment
+
+        schedule = self._create_schedule(self.user, '납품선결제상한서버', activity_type='delivery')
+        prepayment = Prepayment.objects.create(
+            customer=schedule.followup,
+            company=schedule.followup.company,
+            amount=1000000,
+            balance=1000000,
+            payment_date=timezone.localdate(),
+            payer_name='상한입금자',
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'usePrepayment': True,
+                'prepayments': [{'id': prepayment.id, 'amount': '60000'}],
+                'items': [
+                    {
+                        'itemName': 'Limit Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('납품 품목 합계', response.json()['error'])
+        prepayment.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 1000000)
+
+    def test_schedule_delivery_items_update_api_blocks_over_balance_prepayment_without_saving_items(self):
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Prepayment, PrepaymentUsage
+
+        schedule = self._create_schedule(self.user, '납품품목선결제잔액차단', activity_type='delivery')
+        original_item = DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Original Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=1000,
+        )
+        prepayment = Prepayment.objects.create(
+            customer=schedule.followup,
+            company=schedule.followup.company,
+            amount=1000,
+            balance=1000,
+            payment_date=timezone.localdate(),
+            payer_name='잔액부족입금자',
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'usePrepayment': True,
+                'prepayments': [{'id': prepayment.id, 'amount': '2000'}],
+                'items': [
+                    {
+                        'itemName': 'Blocked Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '2000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('잔액이 부족', response.json()['error'])
+        prepayment.refresh_from_db()
+        schedule.refresh_from_db()
+        self.assertEqual(int(prepayment.balance), 1000)
+        self.assertFalse(schedule.use_prepayment)
+        self.assertFalse(PrepaymentUsage.objects.filter(schedule=schedule).exists())
+        items = list(DeliveryItem.objects.filter(schedule=schedule))
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0].id, original_item.id)
+        self.assertEqual(items[0].item_name, 'Original Kit')
+
+    def test_schedule_delivery_items_update_api_marks_imported_quote_completed(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = self._create_schedule(self.user, '견적불러오기납품', activity_type='delivery')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Quoted PCR Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=50000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'sourceQuoteScheduleIds': [quote_schedule.id],
+                'items': [
+                    {
+                        'sourceQuoteScheduleId': quote_schedule.id,
+                        'itemName': 'Quoted PCR Kit',
+                        'quantity': 2,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                        'taxInvoiceIssued': False,
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['completedQuoteScheduleIds'], [quote_schedule.id])
+        self.assertIn('원본 견적 일정', payload['message'])
+        quote_schedule.refresh_from_db()
+        self.assertEqual(quote_schedule.status, 'completed')
+        self.assertEqual(DeliveryItem.objects.get(schedule=schedule).item_name, 'Quoted PCR Kit')
+
+    def test_schedule_delivery_items_update_api_marks_checked_quote_completed_without_imported_items(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = self._create_schedule(self.user, '견적체크수동납품', activity_type='delivery')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Checked Quote Kit',
+            quantity=5,
+            unit='EA',
+            unit_price=50000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'checkedQuoteScheduleIds': [quote_schedule.id],
+                'items': [
+                    {
+                        'itemName': 'Manual Delivered Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '70000',
+                        'taxInvoiceIssued': False,
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['completedQuoteScheduleIds'], [quote_schedule.id])
+        quote_schedule.refresh_from_db()
+        self.assertEqual(quote_schedule.status, 'completed')
+        delivery_item = DeliveryItem.objects.get(schedule=schedule)
+        self.assertEqual(delivery_item.item_name, 'Manual Delivered Kit')
+        self.assertIsNone(delivery_item.source_quote_schedule_id)
+        self.assertIsNone(delivery_item.source_quote_item_id)
+
+    def test_schedule_delivery_items_update_api_marks_checked_department_only_quote_completed(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        department = self._create_department_only(self.user, '부서전용견적납품')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=None,
+            department=department,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(11, 0),
+            activity_type='delivery',
+            status='scheduled',
+        )
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=None,
+            department=department,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Department Only Quote Kit',
+            quantity=3,
+            unit='EA',
+            unit_price=50000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'checkedQuoteScheduleIds': [quote_schedule.id],
+                'items': [
+                    {
+                        'itemName': 'Manual Department Delivery Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '70000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['completedQuoteScheduleIds'], [quote_schedule.id])
+        quote_schedule.refresh_from_db()
+        self.assertEqual(quote_schedule.status, 'completed')
+
+    def test_schedule_delivery_items_update_api_rejects_checked_quote_from_different_department(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        delivery_department = self._create_department_only(self.user, '납품부서')
+        quote_department = self._create_department_only(self.user, '다른견적부서')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=None,
+            department=delivery_department,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(11, 0),
+            activity_type='delivery',
+            status='scheduled',
+        )
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=None,
+            department=quote_department,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Wrong Department Quote Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=50000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'checkedQuoteScheduleIds': [quote_schedule.id],
+                'items': [
+                    {
+                        'itemName': 'Manual Delivery Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '70000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertIn('다른 고객/부서', response.json()['error'])
+        quote_schedule.refresh_from_db()
+        self.assertEqual(quote_schedule.status, 'scheduled')
+
+    def test_schedule_delivery_items_update_api_keeps_partial_imported_quote_scheduled(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, History, Schedule
+
+        schedule = self._create_schedule(self.user, '부분견적불러오기납품', activity_type='delivery')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='completed',
+        )
+        sold_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Thirty Thousand Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=30000,
+            quote_group='보상판매',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Unsold Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=70000,
+            quote_group='수리',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'sourceQuoteScheduleId': quote_schedule.id,
+                        'sourceQuoteItemId': sold_item.id,
+                        'itemName': 'Thirty Thousand Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '30000',
+                        'quoteGroup': '보상판매',
+                        'taxInvoiceIssued': False,
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['completedQuoteScheduleIds'], [])
+        quote_schedule.refresh_from_db()
+        self.assertEqual(quote_schedule.status, 'scheduled')
+        delivery_item = DeliveryItem.objects.get(schedule=schedule)
+        self.assertEqual(delivery_item.source_quote_schedule_id, quote_schedule.id)
+        self.assertEqual(delivery_item.source_quote_item_id, sold_item.id)
+        history = History.objects.get(schedule=schedule, action_type='delivery_schedule')
+        self.assertIn('Thirty Thousand Kit', history.delivery_items)
+        self.assertNotIn('Unsold Kit', history.delivery_items)
+        self.assertEqual(int(history.delivery_amount), 33000)
+
+    def test_schedule_delivery_items_update_api_rejects_over_imported_quote_quantity(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = self._create_schedule(self.user, '초과견적불러오기납품', activity_type='delivery')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        quote_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Limited Quote Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=30000,
+        )
+        previous_delivery = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(11, 0),
+            activity_type='delivery',
+            status='completed',
+        )
+        DeliveryItem.objects.create(
+            schedule=previous_delivery,
+            source_quote_schedule=quote_schedule,
+            source_quote_item=quote_item,
+            item_name='Limited Quote Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=30000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'sourceQuoteScheduleId': quote_schedule.id,
+                        'sourceQuoteItemId': quote_item.id,
+                        'itemName': 'Limited Quote Kit',
+                        'quantity': 2,
+                        'unit': 'EA',
+                        'unitPrice': '30000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('남은 견적 수량은 1EA', response.json()['error'])
+        self.assertFalse(DeliveryItem.objects.filter(schedule=schedule).exists())
+
+    def test_schedule_delivery_items_update_api_rejects_duplicate_source_quote_item_rows(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = self._create_schedule(self.user, '중복견적품목납품', activity_type='delivery')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        quote_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Duplicate Guard Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=50000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'sourceQuoteScheduleId': quote_schedule.id,
+                        'sourceQuoteItemId': quote_item.id,
+                        'itemName': 'Duplicate Guard Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                    },
+                    {
+                        'sourceQuoteScheduleId': quote_schedule.id,
+                        'sourceQuoteItemId': quote_item.id,
+                        'itemName': 'Duplicate Guard Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('견적 품목이 중복되었습니다', response.json()['error'])
+        self.assertFalse(DeliveryItem.objects.filter(schedule=schedule).exists())
+
+    def test_schedule_delivery_items_update_api_reopens_quote_when_import_link_removed(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = self._create_schedule(self.user, '견적연결해제납품', activity_type='delivery')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='completed',
+        )
+        quote_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Linked Quote Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=40000,
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            source_quote_schedule=quote_schedule,
+            source_quote_item=quote_item,
+            item_name='Linked Quote Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=40000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'itemName': 'Manual Replacement Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '10000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        quote_schedule.refresh_from_db()
+        self.assertEqual(quote_schedule.status, 'scheduled')
+        delivery_item = DeliveryItem.objects.get(schedule=schedule)
+        self.assertEqual(delivery_item.item_name, 'Manual Replacement Kit')
+        self.assertIsNone(delivery_item.source_quote_schedule_id)
+        self.assertIsNone(delivery_item.source_quote_item_id)
+
+    def test_schedule_delivery_items_update_api_collects_existing_source_quotes_without_distinct_lock(self):
+        import datetime
+        import json
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = self._create_schedule(self.user, '견적원본중복잠금회피', activity_type='delivery')
+        quote_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='completed',
+        )
+        quote_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Existing Linked Kit',
+            quantity=2,
+            unit='EA',
+            unit_price=40000,
+        )
+        for index in range(2):
+            DeliveryItem.objects.create(
+                schedule=schedule,
+                source_quote_schedule=quote_schedule,
+                source_quote_item=quote_item if index == 0 else None,
+                item_name=f'Existing Linked Kit {index}',
+                quantity=1,
+                unit='EA',
+                unit_price=40000,
+            )
+        self.client.force_login(self.user)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.post(
+                reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+                data=json.dumps({
+                    'items': [
+                        {
+                            'itemName': 'Manual Replacement Kit',
+                            'quantity': 1,
+                            'unit': 'EA',
+                            'unitPrice': '10000',
+                        },
+                    ],
+                }),
+                content_type='application/json',
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        source_quote_queries = [
+            query['sql'].upper()
+            for query in captured.captured_queries
+            if 'SOURCE_QUOTE_SCHEDULE_ID' in query['sql'].upper()
+        ]
+        self.assertTrue(source_quote_queries)
+        self.assertFalse(any('DISTINCT' in query for query in source_quote_queries))
+        quote_schedule.refresh_from_db()
+        self.assertEqual(quote_schedule.status, 'scheduled')
+
+    def test_completed_quote_items_do_not_increment_product_sold_count(self):
+        from reporting.models import DeliveryItem, Product
+
+        quote_schedule = self._create_schedule(self.user, '완료견적판매수량제외', activity_type='quote', status='completed')
+        product = Product.objects.create(
+            product_code='QUOTE-NOT-SOLD',
+            unit='EA',
+            standard_price=30000,
+            created_by=self.user,
+        )
+
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            product=product,
+            item_name='QUOTE-NOT-SOLD',
+            quantity=2,
+            unit='EA',
+            unit_price=30000,
+        )
+
+        product.refresh_from_db()
+        self.assertEqual(product.total_sold, 0)
+
+    def test_notes_detail_uses_actual_delivery_schedule_items_over_stale_history_text(self):
+        from reporting.models import DeliveryItem, History
+
+        schedule = self._create_schedule(self.user, '실제납품보고', activity_type='delivery', status='completed')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Actually Sold Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=30000,
+        )
+        history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=schedule.followup,
+            schedule=schedule,
+            action_type='delivery_schedule',
+            delivery_items='Actually Sold Kit: 1EA (33,000원)\nUnsold Kit: 1EA (77,000원)',
+            delivery_amount=110000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:notes_detail_api', args=[history.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['note']['deliveryAmount'], 33000)
+        self.assertIn('Actually Sold Kit', payload['note']['deliveryItems'])
+        self.assertNotIn('Unsold Kit', payload['note']['deliveryItems'])
+
+    def test_notes_detail_uses_actual_delivery_items_when_delivery_note_is_linked_to_quote_schedule(self):
+        import datetime
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, History, Schedule
+
+        quote_schedule = self._create_schedule(self.user, '견적연결납품노트', activity_type='quote', status='completed')
+        sold_quote_item = DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='56722',
+            quantity=1,
+            unit='EA',
+            unit_price=30000,
+            discount_unit_price=30000,
+            quote_group='수리',
+        )
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='SO447.100E',
+            quantity=1,
+            unit='EA',
+            unit_price=480000,
+            discount_unit_price=336000,
+            quote_group='보상판매',
+        )
+        delivery_schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=quote_schedule.followup,
+            visit_date=timezone.localdate() + datetime.timedelta(days=1),
+            visit_time=datetime.time(9, 0),
+            activity_type='delivery',
+            status='completed',
+        )
+        DeliveryItem.objects.create(
+            schedule=delivery_schedule,
+            item_name=sold_quote_item.item_name,
+            quantity=1,
+            unit=sold_quote_item.unit,
+            unit_price=sold_quote_item.unit_price,
+            discount_unit_price=sold_quote_item.discount_unit_price,
+            quote_group=sold_quote_item.quote_group,
+        )
+        stale_history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=quote_schedule.followup,
+            schedule=quote_schedule,
+            action_type='delivery_schedule',
+            delivery_items='56722: 1EA (33,000원)\nSO447.100E: 1EA (369,600원)',
+            delivery_amount=402600,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:notes_detail_api', args=[stale_history.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['note']['deliveryAmount'], 33000)
+        self.assertIn('56722', payload['note']['deliveryItems'])
+        self.assertNotIn('SO447.100E', payload['note']['deliveryItems'])
+
+    def test_notes_detail_does_not_count_quote_items_as_delivery_without_actual_delivery(self):
+        from reporting.models import DeliveryItem, History
+
+        quote_schedule = self._create_schedule(self.user, '견적만있는납품노트', activity_type='quote', status='completed')
+        DeliveryItem.objects.create(
+            schedule=quote_schedule,
+            item_name='Unsold Quote Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=70000,
+        )
+        stale_history = History.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=quote_schedule.followup,
+            schedule=quote_schedule,
+            action_type='delivery_schedule',
+            delivery_items='Unsold Quote Kit: 1EA (77,000원)',
+            delivery_amount=77000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('reporting:notes_detail_api', args=[stale_history.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(payload['note']['deliveryAmount'], 0)
+        self.assertEqual(payload['note']['deliveryItems'], '')
+
+    def test_schedule_delivery_items_update_api_does_not_create_delivery_history_for_quote_schedule(self):
+        import json
+        from reporting.models import DeliveryItem, History
+
+        quote_schedule = self._create_schedule(self.user, '견적품목저장노트방지', activity_type='quote')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[quote_schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'itemName': 'Quote Only Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                        'quoteGroup': '수리',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(DeliveryItem.objects.filter(schedule=quote_schedule).count(), 1)
+        self.assertFalse(
+            History.objects.filter(schedule=quote_schedule, action_type='delivery_schedule').exists()
+        )
+
+    def test_schedule_update_delivery_items_legacy_does_not_create_delivery_history_for_quote_schedule(self):
+        from reporting.models import DeliveryItem, History
+
+        quote_schedule = self._create_schedule(self.user, '레거시견적품목저장노트방지', activity_type='quote')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedule_update_delivery_items', args=[quote_schedule.id]),
+            data={
+                'delivery_items[0][name]': 'Legacy Quote Only Kit',
+                'delivery_items[0][quantity]': '1',
+                'delivery_items[0][unit_price]': '50000',
+            },
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(DeliveryItem.objects.filter(schedule=quote_schedule).count(), 1)
+        self.assertFalse(
+            History.objects.filter(schedule=quote_schedule, action_type='delivery_schedule').exists()
+        )
+
+    def test_schedule_delivery_items_update_api_rejects_coworker_source_quote_completion(self):
+        import datetime
+        import json
+        from django.utils import timezone
+        from reporting.models import DeliveryItem, Schedule
+
+        schedule = self._create_schedule(self.user, '동료견적차단납품', activity_type='delivery')
+        coworker_quote = Schedule.objects.create(
+            user=self.coworker,
+            company=self.company,
+            followup=schedule.followup,
+            visit_date=timezone.localdate(),
+            visit_time=datetime.time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        DeliveryItem.objects.create(
+            schedule=coworker_quote,
+            item_name='Coworker Quote Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=10000,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'sourceQuoteScheduleIds': [coworker_quote.id],
+                'items': [
+                    {
+                        'sourceQuoteScheduleId': coworker_quote.id,
+                        'itemName': 'Coworker Quote Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '10000',
+                        'taxInvoiceIssued': False,
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertIn('본인이 작성한 견적 일정', response.json()['error'])
+        coworker_quote.refresh_from_db()
+        self.assertEqual(coworker_quote.status, 'scheduled')
+        self.assertFalse(DeliveryItem.objects.filter(schedule=schedule).exists())
+
+    def test_schedule_delivery_items_update_api_accepts_product_master_selection(self):
+        import json
+        from reporting.models import DeliveryItem, Product
+
+        schedule = self._create_schedule(self.user, '제품선택납품', activity_type='delivery')
+        product = Product.objects.create(
+            product_code='MASTER-DELIVERY-PCR',
+            unit='BOX',
+            specification='100 tests',
+            standard_price=12345,
+            created_by=self.user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'productId': product.id,
+                        'itemName': '',
+                        'quantity': 2,
+                        'unit': '',
+                        'unitPrice': '',
+                        'taxInvoiceIssued': True,
+                        'notes': '제품 마스터 선택',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        item = DeliveryItem.objects.get(schedule=schedule)
+        self.assertEqual(item.product, product)
+        self.assertEqual(item.item_name, product.product_code)
+        self.assertEqual(item.unit, 'BOX')
+        self.assertEqual(int(item.unit_price), 12345)
+        self.assertEqual(int(item.total_price), 27159)
+        payload_item = response.json()['deliveryItems'][0]
+        self.assertEqual(payload_item['productId'], product.id)
+        self.assertEqual(payload_item['productCode'], product.product_code)
+        self.assertEqual(payload_item['productDescription'], '')
+        self.assertEqual(payload_item['unit'], 'BOX')
+        self.assertEqual(payload_item['unitPrice'], 12345)
+        self.assertEqual(payload_item['totalPrice'], 27159)
+
+    def test_schedule_delivery_items_update_api_saves_quote_groups(self):
+        import json
+        from reporting.models import DeliveryItem
+
+        schedule = self._create_schedule(self.user, '견적구분저장', activity_type='quote')
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'itemName': 'Trade In Kit',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '100000',
+                        'quoteGroup': '보상판매',
+                        'taxInvoiceIssued': False,
+                    },
+                    {
+                        'itemName': 'Repair Service',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '50000',
+                        'quoteGroup': '수리',
+                        'taxInvoiceIssued': False,
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        items = list(DeliveryItem.objects.filter(schedule=schedule).order_by('id'))
+        self.assertEqual([item.quote_group for item in items], ['보상판매', '수리'])
+        payload_items = response.json()['deliveryItems']
+        self.assertEqual([item['quoteGroup'] for item in payload_items], ['보상판매', '수리'])
+        self.assertEqual([item['quoteGroupLabel'] for item in payload_items], ['보상판매', '수리'])
+
+    def test_schedule_delivery_items_update_api_blocks_inaccessible_product(self):
+        import json
+        from reporting.models import DeliveryItem, Product
+
+        schedule = self._create_schedule(self.user, '타사제품차단', activity_type='delivery')
+        other_product = Product.objects.create(
+            product_code='MASTER-OTHER-PRIVATE',
+            unit='EA',
+            standard_price=5000,
+            created_by=self.other_user,
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(
+            reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id]),
+            data=json.dumps({
+                'items': [
+                    {
+                        'productId': other_product.id,
+                        'itemName': '허용되지 않은 제품',
+                        'quantity': 1,
+                        'unit': 'EA',
+                        'unitPrice': '5000',
+                    },
+                ],
+            }),
+            content_type='application/json',
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('선택한 제품을 찾을 수 없습니다', response.json()['error'])
+        self.assertFalse(DeliveryItem.objects.filter(schedule=schedule).exists())
+
+    def test_schedule_delivery_items_update_api_blocks_manager_and_coworker(self):
+        import json
+        from reporting.models import DeliveryItem
+
+        schedule = self._create_schedule(self.user, '납품차단', activity_type='delivery')
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='Protected Kit',
+            quantity=1,
+            unit='EA',
+            unit_price=5000,
+        )
+        update_url = reverse('reporting:schedules_delivery_items_update_api', args=[schedule.id])
+        payload = {
+            'items': [
+                {
+                    'itemName': 'Changed Kit',
+                    'quantity': 2,
+                    'unit': 'EA',
+                    'unitPrice': '10000',
+                },
+            ],
+        }
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(update_url, data=json.dumps(payload), content_type='application/json')
+        self.assertEqual(manager_response.status_code, 403)
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(update_url, data=json.dumps(payload), content_type='application/json')
+        self.assertEqual(coworker_response.status_code, 403)
+
+        self.assertEqual(DeliveryItem.objects.get(schedule=schedule).item_name, 'Protected Kit')
+
+    def test_schedule_file_upload_api_allows_owner_only(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import ScheduleFile
+
+        schedule = self._create_schedule(self.user, '파일업로드')
+        upload_url = reverse('reporting:schedule_file_upload', args=[schedule.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(upload_url, {
+            'files': SimpleUploadedFile('manager.txt', b'manager memo', content_type='text/plain'),
+        })
+        self.assertEqual(manager_response.status_code, 403)
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(upload_url, {
+            'files': SimpleUploadedFile('coworker.txt', b'coworker memo', content_type='text/plain'),
+        })
+        self.assertEqual(coworker_response.status_code, 403)
+
+        self.client.force_login(self.user)
+        response = self.client.post(upload_url, {
+            'files': SimpleUploadedFile('owner.txt', b'owner memo', content_type='text/plain'),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        schedule_file = ScheduleFile.objects.get(schedule=schedule)
+        self.addCleanup(schedule_file.file.delete, False)
+        self.assertEqual(schedule_file.original_filename, 'owner.txt')
+        self.assertEqual(payload['files'][0]['id'], schedule_file.id)
+        self.assertEqual(payload['files'][0]['downloadHref'], reverse('reporting:schedule_file_download', args=[schedule_file.id]))
+        self.assertEqual(payload['files'][0]['deleteHref'], reverse('reporting:schedule_file_delete', args=[schedule_file.id]))
+
+    def test_schedule_file_delete_api_allows_owner_only(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import ScheduleFile
+
+        schedule = self._create_schedule(self.user, '파일삭제')
+        schedule_file = ScheduleFile.objects.create(
+            schedule=schedule,
+            file=SimpleUploadedFile('delete-me.txt', b'delete memo', content_type='text/plain'),
+            original_filename='delete-me.txt',
+            file_size=11,
+            uploaded_by=self.user,
+        )
+        delete_url = reverse('reporting:schedule_file_delete', args=[schedule_file.id])
+
+        self.client.force_login(self.manager)
+        manager_response = self.client.post(delete_url)
+        self.assertEqual(manager_response.status_code, 403)
+        self.assertTrue(ScheduleFile.objects.filter(pk=schedule_file.id).exists())
+
+        self.client.force_login(self.coworker)
+        coworker_response = self.client.post(delete_url)
+        self.assertEqual(coworker_response.status_code, 403)
+        self.assertTrue(ScheduleFile.objects.filter(pk=schedule_file.id).exists())
+
+        self.client.force_login(self.user)
+        response = self.client.post(delete_url)
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertFalse(ScheduleFile.objects.filter(pk=schedule_file.id).exists())
+
+    def test_schedule_file_download_blocks_anonymous_and_out_of_scope_users(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import ScheduleFile
+
+        schedule = self._create_schedule(self.user, '파일다운로드')
+        schedule_file = ScheduleFile.objects.create(
+            schedule=schedule,
+            file=SimpleUploadedFile('schedule-download.txt', b'schedule memo', content_type='text/plain'),
+            original_filename='schedule-download.txt',
+            file_size=13,
+            uploaded_by=self.user,
+        )
+        self.addCleanup(schedule_file.file.delete, False)
+        download_url = reverse('reporting:schedule_file_download', args=[schedule_file.id])
+
+        anonymous_response = self.client.get(download_url)
+        self.assertEqual(anonymous_response.status_code, 302)
+        self.assertIn('/reporting/login/', anonymous_response['Location'])
+
+        self.client.force_login(self.other_user)
+        other_response = self.client.get(download_url)
+        self.assertEqual(other_response.status_code, 403)
+        self.assertNotIn('attachment', other_response.get('Content-Disposition', ''))
+
+        self.client.force_login(self.user)
+        owner_response = self.client.get(download_url)
+        self.assertEqual(owner_response.status_code, 200)
+        self.assertIn('attachment', owner_response.get('Content-Disposition', ''))
+        owner_response.close()
+
+    def test_schedule_file_download_supports_range_conditional_and_proxy_handoff(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from reporting.models import ScheduleFile
+
+        schedule = self._create_schedule(self.user, '파일범위')
+        schedule_file = ScheduleFile.objects.create(
+            schedule=schedule,
+            file=SimpleUploadedFile('range.bin', b'0123456789', content_type='application/octet-stream'),
+            original_filename='범위.bin',
+            file_size=10,
+            uploaded_by=self.user,
+        )
+        self.addCleanup(schedule_file.file.delete, False)
+        download_url = reverse('reporting:schedule_file_download', args=[schedule_file.id])
+        self.client.force_login(self.user)
+
+        full = self.client.get(download_url)
+        etag = full['ETag']
+        self.assertEqual(full['Accept-Ranges'], 'bytes')
+        self.assertEqual(b''.join(full.streaming_content), b'0123456789')
+        self.assertIn("filename*=utf-8''", full['Content-Disposition'])
+
+        partial = self.client.get(download_url, HTTP_RANGE='bytes=2-5', HTTP_IF_RANGE=etag)
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial['Content-Range'], 'bytes 2-5/10')
+        self.assertEqual(partial['Content-Length'], '4')
+        self.assertEqual(b''.join(partial.streaming_content), b'2345')
+
+        stale_if_range = self.client.get(download_url, HTTP_RANGE='bytes=2-5', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(stale_if_range.status_code, 200)
+        stale_if_range.close()
+
+        unsatisfiable = self.client.get(download_url, HTTP_RANGE='bytes=20-')
+        self.assertEqual(unsatisfiable.status_code, 416)
+        self.assertEqual(unsatisfiable['Content-Range'], 'bytes */10')
+
+        not_modified = self.client.get(download_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, 304)
+
+        with override_settings(FILE_DELIVERY_BACKEND='x-accel', FILE_DELIVERY_ACCEL_PREFIX='/protected-media/'):
+            proxied = self.client.get(download_url)
+        self.assertEqual(proxied.status_code, 200)
+        self.assertEqual(proxied['X-Accel-Redirect'], '/protected-media/' + schedule_file.file.name)
+        self.assertEqual(proxied.content, b'')
+
+
+class ScheduleAiCoachApiTests(TestCase):
+    """일정 AI 코치 API 검증 (AI 워크스페이스 메뉴 제거와 무관한 별도 기능, 보존)"""
+
+    def setUp(self):
+        self.client = Client()
+        self.company = UserCompany.objects.create(name='AI코치회사')
+        self.other_company = UserCompany.objects.create(name='AI코치타사회사')
+        self.user = make_user('ai_coach_me', role='salesman', can_use_ai=True, company=self.company)
+        self.no_ai_user = make_user('ai_coach_no_permission', role='salesman', can_use_ai=False, company=self.company)
+
+    def _create_customer(self, owner, name):
+        from reporting.models import Company, Department, FollowUp
+
+        customer_company = Company.objects.create(name=f'{name} 회사', created_by=owner)
+        department = Department.objects.create(
+            company=customer_company,
+            name=f'{name} 연구실',
+            created_by=owner,
+        )
+        followup = FollowUp.objects.create(
+            user=owner,
+            user_company=owner.userprofile.company,
+            customer_name=f'{name} 담당자',
+            manager=f'{name} 책임',
+            company=customer_company,
+            department=department,
+            priority='urgent',
+            customer_grade='A',
+            ai_score=88,
+        )
+        return followup, department
+
+    def test_schedule_ai_coach_requires_ai_permission(self):
+        from datetime import time
+
+        followup, _department = self._create_customer(self.no_ai_user, '일정코치권한없음')
+        schedule = Schedule.objects.create(
+            user=self.no_ai_user,
+            company=self.company,
+            followup=followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            activity_type='quote',
+            status='scheduled',
+        )
+        self.client.force_login(self.no_ai_user)
+
+        response = self.client.post(reverse('reporting:schedule_ai_coach_api', args=[schedule.id]))
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['error'], 'permission_denied')
+
+    def test_schedule_ai_coach_blocks_inaccessible_schedule(self):
+        from datetime import time
+
+        outsider = make_user('ai_coach_schedule_outsider', role='salesman', can_use_ai=True, company=self.other_company)
+        followup, _department = self._create_customer(outsider, '일정코치타사회사')
+        schedule = Schedule.objects.create(
+            user=outsider,
+            company=self.other_company,
+            followup=followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(10, 0),
+            activity_type='customer_meeting',
+            status='scheduled',
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:schedule_ai_coach_api', args=[schedule.id]))
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.json()['error'], 'permission_denied')
+
+    def test_schedule_ai_coach_returns_unsaved_fallback_for_accessible_schedule(self):
+        from datetime import time
+        from decimal import Decimal
+        from reporting.models import AIWorkspaceQuestionLog, DeliveryItem
+
+        followup, _department = self._create_customer(self.user, '일정코치')
+        schedule = Schedule.objects.create(
+            user=self.user,
+            company=self.company,
+            followup=followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(14, 30),
+            activity_type='delivery',
+            status='scheduled',
+            expected_revenue=Decimal('330000'),
+            notes='납품 품목과 세금계산서 확인 필요',
+        )
+        DeliveryItem.objects.create(
+            schedule=schedule,
+            item_name='P1000',
+            quantity=3,
+            unit='EA',
+            unit_price=Decimal('100000'),
+        )
+        self.client.force_login(self.user)
+
+        response = self.client.post(reverse('reporting:schedule_ai_coach_api', args=[schedule.id]))
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertTrue(payload['success'])
+        self.assertEqual(payload['context']['scheduleId'], schedule.id)
+        self.assertFalse(payload['context']['stored'])
+        self.assertIn('납품', payload['coach']['summary'])
+        self.assertEqual(payload['coach']['afterMeetingNoteDraft']['content'], '')
+        self.assertEqual(payload['coach']['afterMeetingNoteDraft']['nextAction'], '')
+        self.assertEqual(payload['coach']['afterMeetingNoteDraft']['actionType'], 'delivery_schedule')
+        self.assertEqual(payload['coach']['mailDraft']['subject'], '')
+        self.assertEqual(payload['coach']['mailDraft']['body'], '')
+        evidence_hrefs = {item.get('href') for item in payload['coach']['evidence']}
+        self.assertIn(f'/schedules/{schedule.id}/', evidence_hrefs)
+        self.assertIn(f'/customers/{followup.id}/', evidence_hrefs)
+        self.assertEqual(AIWorkspaceQuestionLog.objects.count(), 0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Phase 8.6-2: 부가세 모드 (VAT Mode) 테스트
+# ─────────────────────────────────────────────────────────────────────────────
+
+class ScheduleVatModeTests(TestCase):
+    """Schedule.vat_mode 필드 및 Quote.save() 부가세 계산 테스트"""
+
+    def setUp(self):
+        import datetime
+        from decimal import Decimal
+        from reporting.models import UserCompany, Company, Department, FollowUp, Schedule, Quote
+
+        self.company_uc = UserCompany.objects.create(name='VAT테스트회사')
+        self.salesman = make_user('vat_salesman', role='salesman', company=self.company_uc)
+        cust = Company.objects.create(name='VAT테스트거래처', created_by=self.salesman)
+        dept = Department.objects.create(name='VAT테스트연구실', company=cust, created_by=self.salesman)
+        self.followup = FollowUp.objects.create(
+            user=self.salesman,
+            customer_name='VAT담당자',
+            company=cust,
+            department=dept,
+            user_company=self.company_uc,
+        )
+        self.base_schedule_date = datetime.date(2026, 6, 1)
+        self.base_schedule_time = datetime.time(10, 0)
+
+    def _make_schedule(self, vat_mode='excluded'):
+        from reporting.models import Schedule
+        import datetime
+        return Schedule.objects.create(
+            user=self.salesman,
+            followup=self.followup,
+            visit_date=self.base_schedule_date,
+            visit_time=self.base_schedule_time,
+            activity_type='quote',
+            status='scheduled',
+            vat_mode=vat_mode,
+        )
+
+    def _make_quote(self, schedule, subtotal_val, probability=50):
+        import datetime
+        from decimal import Decimal
+        from reporting.models import Quote
+        return Quote.objects.create(
+            quote_number=f'Q-TEST-{schedule.pk}-{subtotal_val}',
+            schedule=schedule,
+            followup=self.followup,
+            user=self.salesman,
+            valid_until=self.base_schedule_date,
+            subtotal=subtotal_val,
+            probability=probability,
+        )
+
+    def test_default_vat_mode_is_excluded(self):
+        """vat_mode 기본값은 'excluded'이어야 한다."""
+        schedule = self._make_schedule()
+        self.assertEqual(schedule.vat_mode, 'excluded')
+
+    def test_vat_excluded_calculation(self):
+        """부가세 별도: tax = subtotal * 10%, total = subtotal + tax."""
+        from decimal import Decimal
+        schedule = self._make_schedule(vat_mode='excluded')
+        quote = self._make_quote(schedule, subtotal_val=100000)
+        self.assertEqual(quote.tax_amount, Decimal('10000'))
+        self.assertEqual(quote.total_amount, Decimal('110000'))
+
+    def test_vat_included_calculation(self):
+        """부가세 포함: total = subtotal(입력값), tax = total - total/1.1."""
+        from decimal import Decimal, ROUND_HALF_UP
+        schedule = self._make_schedule(vat_mode='included')
+        quote = self._make_quote(schedule, subtotal_val=110000)
+        supply = (Decimal('110000') / Decimal('1.1')).quantize(Decimal('1'), rounding=ROUND_HALF_UP)
+        expected_tax = Decimal('110000') - supply
+        self.assertEqual(quote.total_amount, Decimal('110000'))
+        self.assertEqual(quote.tax_amount, expected_tax)
+
+    def test_vat_none_calculation(self):
+        """부가세 없음: tax = 0, total = subtotal."""
+        from decimal import Decimal
+        schedule = self._make_schedule(vat_mode='none')
+        quote = self._make_quote(schedule, subtotal_val=100000)
+        self.assertEqual(quote.tax_amount, Decimal('0'))
+        self.assertEqual(quote.total_amount, Decimal('100000'))
+
+    def test_vat_excluded_weighted_revenue(self):
+        """부가세 별도: 가중매출 = total * probability / 100."""
+        from decimal import Decimal
+        schedule = self._make_schedule(vat_mode='excluded')
+        quote = self._make_quote(schedule, subtotal_val=100000, probability=50)
+        self.assertEqual(quote.weighted_revenue, Decimal('55000'))  # 110000 * 0.5
+
+    def test_quote_probability_is_normalized_to_five_percent_step(self):
+        """견적 성공 확률은 저장 시 가까운 5% 단위로 정규화된다."""
+        from decimal import Decimal
+
+        schedule = self._make_schedule(vat_mode='excluded')
+        quote = self._make_quote(schedule, subtotal_val=100000, probability=63)
+
+        self.assertEqual(quote.probability, 65)
+        self.assertEqual(quote.weighted_revenue, Decimal('71500'))  # 110000 * 0.65
+
+    def test_vat_none_weighted_revenue(self):
+        """부가세 없음: 가중매출 = total * probability / 100."""
+        from decimal import Decimal
+        schedule = self._make_schedule(vat_mode='none')
+        quote = self._make_quote(schedule, subtotal_val=100000, probability=50)
+        self.assertEqual(quote.weighted_revenue, Decimal('50000'))  # 100000 * 0.5
+
+    def test_schedule_form_includes_vat_mode(self):
+        """스케줄 생성 시 vat_mode가 POST 데이터로 저장된다."""
+        import datetime
+        from reporting.models import Schedule
+        self.client = Client()
+        self.client.force_login(self.salesman)
+
+        post_data = {
+            'followup': self.followup.pk,
+            'visit_date': '2026-06-10',
+            'visit_time': '10:00',
+            'activity_type': 'quote',
+            'location': '',
+            'status': 'scheduled',
+            'notes': 'VAT 모드 테스트',
+            'vat_mode': 'none',
+        }
+        r = self.client.post(reverse('reporting:schedule_create'), post_data, follow=False)
+        # 성공 시 리다이렉트
+        self.assertIn(r.status_code, [200, 302])
+        created = Schedule.objects.filter(
+            followup=self.followup, vat_mode='none'
+        ).first()
+        self.assertIsNotNone(created, 'vat_mode=none인 스케줄이 생성되어야 합니다.')
+
+
+class QuoteItemAllocationTests(TestCase):
+    """견적 품목 납품 배분 원장 유지와 남은 수량 합계 검증"""
+
+    def setUp(self):
+        self.company_profile = UserCompany.objects.create(name='배분원장회사')
+        self.owner = make_user('quote_alloc_owner', role='salesman', company=self.company_profile)
+        self.company = Company.objects.create(name='배분원장고객사', created_by=self.owner)
+        self.department = Department.objects.create(name='배분원장부서', company=self.company, created_by=self.owner)
+        self.followup = FollowUp.objects.create(
+            user=self.owner,
+            company=self.company,
+            department=self.department,
+            customer_name='배분원장담당자',
+        )
+        self.quote = self._create_schedule('quote')
+        self.quote_item = DeliveryItem.objects.create(
+            schedule=self.quote, item_name='Alloc Kit', quantity=5, unit='EA', unit_price=1000,
+        )
+
+    def _create_schedule(self, activity_type, status='scheduled'):
+        return Schedule.objects.create(
+            user=self.owner,
+            company=self.company_profile,
+            followup=self.followup,
+            visit_date=timezone.localdate(),
+            visit_time=time(9, 0),
+            activity_type=activity_type,
+            status=status,
+        )
+
+    def _delivered(self, **kwargs):
+        from reporting.views import _schedules_quote_item_imported_quantities
+
+        kwargs.setdefault('include_legacy_matches', True)
+        quantities, has_activity = _schedules_quote_item_imported_quantities(self.quote, [self.quote_item], **kwargs)
+        return quantities[self.quote_item.id], has_activity
+
+    def test_delivery_save_records_allocations_and_skips_cancelled_schedules(self):
+        from reporting.models import QuoteItemAllocation
+        from reporting.services.delivery_items import persist_delivery_items
+
+        delivery = self._create_schedule('delivery')
+        persist_delivery_items(delivery, [{
+            'item_name': 'Alloc Kit', 'quantity': 2, 'unit': 'EA', 'unit_price': 1000,
+            'source_quote_schedule': self.quote, 'source_quote_item': self.quote_item,
+        }])
+        schedule_only = self._create_schedule('delivery')
+        DeliveryItem.objects.create(
+            schedule=schedule_only, item_name='Alloc Kit', quantity=1, unit='EA', unit_price=1000,
+            source_quote_schedule=self.quote,
+        )
+
+        self.assertEqual(
+            sorted(QuoteItemAllocation.objects.values_list('source', 'quantity')),
+            [('linked', 2), ('schedule', 1)],
+        )
+        self.assertEqual(self._delivered(), (3, True))
+        self.assertEqual(self._delivered(exclude_delivery_schedule_id=delivery.id), (1, True))
+
+        schedule_only.status = 'cancelled'
+        schedule_only.save()
+        self.assertEqual(self._delivered(), (2, True))
+
+        persist_delivery_items(delivery, [])
+        self.assertEqual(self._delivered(), (0, False))
+
+    def test_backfill_matches_unlinked_deliveries_once(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from reporting.models import QuoteItemAllocation
+
+        second_quote = self._create_schedule('quote')
+        DeliveryItem.objects.create(
+            schedule=second_quote, item_name='Alloc Kit', quantity=5, unit='EA', unit_price=1000,
+        )
+        delivery = self._create_schedule('delivery')
+        legacy_item = DeliveryItem.objects.create(
+            schedule=delivery, item_name='Alloc Kit', quantity=4, unit='EA', unit_price=1000,
+        )
+        self.assertEqual(self._delivered(), (0, False))
+
+        call_command('backfill_quote_allocations', stdout=StringIO())
+        call_command('backfill_quote_allocations', stdout=StringIO())
+
+        allocation = QuoteItemAllocation.objects.get(delivery_item=legacy_item)
+        self.assertEqual((allocation.source, allocation.quote_item_id), ('legacy', self.quote_item.id))
+        self.assertEqual(self._delivered(), (4, True))
+        self.assertEqual(self._delivered(include_legacy_matches=False), (0, False))
+
+    def test_form_delivery_save_leaves_legacy_matching_to_backfill(self):
+        from io import StringIO
+        from django.core.management import call_command
+        from django.test import RequestFactory
+        from reporting.models import QuoteItemAllocation
+        from reporting.views import save_delivery_items
+
+        delivery = self._create_schedule('delivery')
+        request = RequestFactory().post('/', {
+            'delivery_items[0][name]': 'Alloc Kit',
+            'delivery_items[0][quantity]': '3',
+            'delivery_items[0][unit_price]': '1000',
+        })
+        # 폼 화면은 견적 연결 없이 품목만 보낸다. 저장은 명시 연결 행만 쓴다.
+        DeliveryItem.objects.filter(schedule=self.quote).update(unit='개')
+        save_delivery_items(request, delivery)
+        self.assertFalse(QuoteItemAllocation.objects.filter(delivery_schedule=delivery).exists())
+
+        call_command('backfill_quote_allocations', stdout=StringIO())
+        allocation = QuoteItemAllocation.objects.get(delivery_schedule=delivery)
+        self.assertEqual((allocation.source, allocation.quote_item_id, allocation.quantity), ('legacy', self.quote_item.id, 3))
@@ -4,6 +4,7 @@ from . import views
 from . import backup_api
 from . import personal_schedule_views
 from . import funnel_views
+from .db_routing import read_only_view
 from .react_redirects import (
     frontend_url,
     id_react_page,
@@ -16,8 +17,12 @@ from django.contrib.auth import views as auth_views # auth_views 임포트
 from importlib import import_module
 
 
-def lazy_view(view_path):
-    """Import rarely used view modules only when their URL is requested."""
+def lazy_view(view_path, read_only=False):
+    """Import rarely used view modules only when their URL is requested.
+
+    ``read_only`` marks the URL like ``read_only_view``: the middleware sees the
+    wrapper returned here, not the (not yet imported) view itself.
+    """
     module_path, view_name = view_path.rsplit('.', 1)
 
     def _wrapped(request, *args, **kwargs):
@@ -26,7 +31,7 @@ def lazy_view(view_path):
 
     _wrapped.__name__ = view_name
     _wrapped.__module__ = module_path
-    return _wrapped
+    return read_only_view(_wrapped) if read_only else _wrapped
 
 app_name = 'reporting'  # 앱 네임스페이스 설정
 
@@ -207,6 +212,8 @@ urlpatterns = [
     path('api/followups/<int:followup_id>/quote-items/', views.followup_quote_items_api, name='followup_quote_items_api'),
     path('api/followups/<int:followup_id>/records/', views.customer_records_api, name='customer_records_api'),
     path('api/companies/manage/', lazy_view('reporting.api.accounts.companies_management_api'), name='companies_management_api'),
+    path('api/companies/manage/move-targets/', lazy_view('reporting.api.accounts.company_management_move_targets_api'), name='company_management_move_targets_api'),
+    path('api/companies/manage/<int:company_id>/departments/', lazy_view('reporting.api.accounts.company_management_departments_api'), name='company_management_departments_api'),
     path('api/companies/create/', lazy_view('reporting.api.accounts.company_create_api'), name='company_create_api'),
     path('api/departments/create/', lazy_view('reporting.api.accounts.department_create_api'), name='department_create_api'),
     path('api/companies/<int:company_id>/update/', lazy_view('reporting.api.accounts.company_update_api'), name='company_update_api'),
@@ -331,7 +338,7 @@ urlpatterns = [
     path('api/profile/update/', views.profile_update_api, name='profile_api_update'),
     path('api/profile/password/', views.profile_password_api, name='profile_api_password'),
     path('api/followups/', views.followups_summary_api, name='followups_summary_api'),
-    path('api/customers/', lazy_view('reporting.api.accounts.customers_summary_api'), name='customers_summary_api'),
+    path('api/customers/', lazy_view('reporting.api.accounts.customers_summary_api', read_only=True), name='customers_summary_api'),
     path('api/accounts/<int:department_id>/', lazy_view('reporting.api.accounts.account_detail_summary_api'), name='account_detail_summary_api'),
     path('api/accounts/<int:department_id>/update/', lazy_view('reporting.api.accounts.account_update_api'), name='account_update_api'),
     path('api/accounts/<int:department_id>/contacts/create/', lazy_view('reporting.api.accounts.account_contact_save_api'), name='account_contact_create_api'),
@@ -343,6 +350,9 @@ urlpatterns = [
     path('api/customers/<int:followup_id>/delete/', lazy_view('reporting.api.accounts.customer_delete_api'), name='customer_delete_api'),
     path('api/notes/', views.notes_summary_api, name='notes_summary_api'),
     path('api/notes/create/', views.notes_create_api, name='notes_create_api'),
+    path('api/notes/feed/', views.notes_feed_api, name='notes_feed_api'),
+    path('api/notes/metrics/', views.notes_metrics_api, name='notes_metrics_api'),
+    path('api/notes/create-config/', views.notes_create_config_api, name='notes_create_config_api'),
     path('api/notes/<int:history_id>/', views.notes_detail_api, name='notes_detail_api'),
     path('api/notes/<int:history_id>/update/', views.notes_update_api, name='notes_update_api'),
     path('api/notes/<int:history_id>/delete/', views.notes_delete_api, name='notes_delete_api'),
@@ -561,9 +571,10 @@ urlpatterns = [
         static_react_page('pipeline/'),
     ), name='funnel_detail'),
     path('api/pipeline/', funnel_views.pipeline_command_center_api, name='pipeline_command_center_api'),
-    path('api/pipeline-sheet/weekly/', lazy_view('reporting.api.pipeline_sheet.pipeline_sheet_weekly_api'), name='pipeline_sheet_weekly_api'),
-    path('api/pipeline-sheet/export/', lazy_view('reporting.api.pipeline_sheet.pipeline_sheet_export_api'), name='pipeline_sheet_export_api'),
-    path('api/revenue-detail/', lazy_view('reporting.api.revenue_detail.revenue_detail_api'), name='revenue_detail_api'),
+    path('api/pipeline-sheet/weekly/', lazy_view('reporting.api.pipeline_sheet.pipeline_sheet_weekly_api', read_only=True), name='pipeline_sheet_weekly_api'),
+    path('api/pipeline-sheet/export/', lazy_view('reporting.api.pipeline_sheet.pipeline_sheet_export_api', read_only=True), name='pipeline_sheet_export_api'),
+    path('api/revenue-detail/', lazy_view('reporting.api.revenue_detail.revenue_detail_api', read_only=True), name='revenue_detail_api'),
+    path('api/revenue-detail/items/', lazy_view('reporting.api.revenue_detail.revenue_detail_items_api', read_only=True), name='revenue_detail_items_api'),
     path('api/pipeline-sheet/activities/<str:kind>/<int:activity_id>/update/', lazy_view('reporting.api.pipeline_sheet.pipeline_sheet_activity_update_api'), name='pipeline_sheet_activity_update_api'),
     path('funnel/api/save-target/', funnel_views.funnel_save_target, name='funnel_save_target'),
     path('funnel/api/auto-target/', funnel_views.funnel_auto_target, name='funnel_auto_target'),
@@ -5,12 +5,12 @@ from django.contrib import messages
 from django import forms
 from django.http import JsonResponse, HttpResponseForbidden, Http404, FileResponse
 from django.db import transaction
-from django.db.models import Sum, Count, Q, Prefetch, Case, IntegerField, OuterRef, Subquery, Value, When
+from django.db.models import Sum, Count, Max, F, Q, Prefetch, Case, Exists, IntegerField, OuterRef, Subquery, Value, When
 from django.core.paginator import Paginator  # 페이지네이션 추가
 from .models import FollowUp, Schedule, ScheduleFile, ScheduleQuoteGroupNote, History, AIWorkspaceActionFeedback, AIWorkspaceMemory, AIWorkspaceQuestionFeedback, AIWorkspaceQuestionLog, UserProfile, Company, Department, DepartmentMemo, HistoryFile, DeliveryItem, UserCompany, Prepayment, PrepaymentLedgerEntry, PrepaymentUsage, EmailLog, CustomerCategory, OpportunityTracking, FunnelTarget, Quote, DocumentTemplate, DocumentGenerationLog, CustomerAsset, ServiceCase, CalibrationRecord, normalize_probability_to_five
 from django.contrib.auth.views import LoginView, LogoutView
 from django.urls import reverse_lazy, reverse
-from functools import wraps
+from functools import cached_property, wraps
 from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_POST, require_http_methods
@@ -18,7 +18,17 @@ from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 from .decorators import hanagwahak_only, get_allowed_action_types, get_allowed_activity_types, filter_service_for_non_hanagwahak
+from .db_routing import read_only_view
 from .readonly_api import api_login_required_or_readonly_response
+from .services.autocomplete_index import search_companies, search_departments
+from .services.delivery_items import persist_delivery_items
+from .services.email_index import VISIBLE_IN_WORKSPACE, emails_in_order, recent_email_ids
+from .services.metrics_query import aggregate_metrics, count_metric, sum_metric
+from .services.db_pool import EXPORT_STATEMENT_TIMEOUT_MS, statement_timeout
+from .services.document_templates import company_template_counts
+from .services.email_text import email_body_text, email_text_preview
+from .services.quote_allocations import allocated_quantities, quote_item_identity
+from .services.user_scope import resolve_scope_user_ids, scope_user_ids, scoped_users_queryset
 from .services.account_ledger import (
     account_operational_ledger_for_followups,
     account_followups_for_followup,
@@ -100,8 +110,6 @@ def _prepayment_create_ledger(*args, **kwargs):
 
 def save_delivery_items(request, instance_obj):
     """납품 품목 데이터를 저장하는 함수 (스케줄 또는 히스토리)"""
-    from .models import DeliveryItem
-    
     # 인스턴스 타입 확인
     from .models import Schedule, History
     is_schedule = isinstance(instance_obj, Schedule)
@@ -111,14 +119,6 @@ def save_delivery_items(request, instance_obj):
         logger.error(f"save_delivery_items: 지원되지 않는 객체 타입: {type(instance_obj)}")
         return
     
-    # 기존 품목들 삭제 (수정 시)
-    if is_schedule:
-        existing_count = instance_obj.delivery_items_set.all().count()
-        instance_obj.delivery_items_set.all().delete()
-    else:  # is_history
-        existing_count = instance_obj.delivery_items_set.all().count()
-        instance_obj.delivery_items_set.all().delete()
-    
     # delivery_items 관련 POST 데이터만 필터링
     delivery_items_data = {}
     
@@ -141,78 +141,62 @@ def save_delivery_items(request, instance_obj):
                 logger.error(f"POST 데이터 파싱 실패: {key} = {value}, 오류: {e}")
                 continue
     
-    # 납품 품목 저장
-    created_count = 0
-    
+    from decimal import Decimal, InvalidOperation
+    from .models import Product
+
+    def _optional_decimal(raw):
+        # 빈 문자열이 아니면 0 포함 모든 숫자 허용, 변환 실패 시 None
+        if raw == '' or raw is None:
+            return None
+        try:
+            return Decimal(str(raw))
+        except (ValueError, InvalidOperation):
+            return None
+
+    product_ids = set()
+    for item_data in delivery_items_data.values():
+        try:
+            product_ids.add(int(item_data.get('product_id', '').strip()))
+        except ValueError:
+            pass
+    products = Product.objects.in_bulk(product_ids) if product_ids else {}
+
+    # 납품 품목 행 구성 (저장은 persist_delivery_items가 일괄 처리)
+    rows = []
     for index, item_data in delivery_items_data.items():
         item_name = item_data.get('name', '').strip()
         quantity = item_data.get('quantity', '').strip()
-        unit_price = item_data.get('unit_price', '').strip()
-        discount_rate = item_data.get('discount_rate', '').strip()
-        discount_unit_price = item_data.get('discount_unit_price', '').strip()
-        notes = item_data.get('notes', '').strip()
-        option_description = (
-            item_data.get('option_description', '')
-            or item_data.get('optionDescription', '')
-        ).strip()
+        if not (item_name and quantity):
+            continue
+        try:
+            row = {
+                'item_name': item_name,
+                'quantity': int(quantity),
+                'unit': '개',  # 기본값
+                'notes': item_data.get('notes', '').strip(),
+                'option_description': (
+                    item_data.get('option_description', '')
+                    or item_data.get('optionDescription', '')
+                ).strip(),
+            }
+        except (ValueError, TypeError) as e:
+            logger.error(f"납품 품목 저장 실패: {e}")
+            continue  # 잘못된 데이터는 무시
+
         product_id = item_data.get('product_id', '').strip()
-        
-        if item_name and quantity:
-            try:
-                delivery_item = DeliveryItem(
-                    item_name=item_name,
-                    quantity=int(quantity),
-                    unit='개',  # 기본값
-                )
-                
-                # 제품 연결
-                if product_id:
-                    try:
-                        from .models import Product
-                        delivery_item.product = Product.objects.get(id=int(product_id))
-                    except (Product.DoesNotExist, ValueError):
-                        pass
-                
-                # 스케줄 또는 히스토리 연결
-                if is_schedule:
-                    delivery_item.schedule = instance_obj
-                else:
-                    delivery_item.history = instance_obj
-                
-                # unit_price 저장 (빈 문자열, None이 아니면 0 포함 모든 숫자 허용)
-                if unit_price != '' and unit_price is not None:
-                    from decimal import Decimal, InvalidOperation
-                    try:
-                        # "0", "0.0", 0 모두 Decimal로 변환
-                        delivery_item.unit_price = Decimal(str(unit_price))
-                    except (ValueError, InvalidOperation):
-                        # 변환 실패 시 None으로 유지
-                        pass
-                # unit_price가 '' 또는 None이면 unit_price 필드는 None으로 유지
-                if discount_rate != '' and discount_rate is not None:
-                    from decimal import Decimal, InvalidOperation
-                    try:
-                        delivery_item.discount_rate = Decimal(str(discount_rate))
-                    except (ValueError, InvalidOperation):
-                        pass
+        if product_id.isdigit() and int(product_id) in products:
+            row['product'] = products[int(product_id)]
+        for field in ('unit_price', 'discount_rate', 'discount_unit_price'):
+            value = _optional_decimal(item_data.get(field, '').strip())
+            if value is not None:
+                row[field] = value
+        rows.append(row)
 
-                if discount_unit_price != '' and discount_unit_price is not None:
-                    from decimal import Decimal, InvalidOperation
-                    try:
-                        delivery_item.discount_unit_price = Decimal(str(discount_unit_price))
-                    except (ValueError, InvalidOperation):
-                        pass
+    # 기존 품목 교체 (삭제/수정/생성을 한 번씩)
+    with transaction.atomic():
+        persist_delivery_items(instance_obj, rows)
 
-                delivery_item.notes = notes
-                delivery_item.option_description = option_description
-                
-                delivery_item.save()
-                created_count += 1
-            except (ValueError, TypeError) as e:
-                logger.error(f"납품 품목 저장 실패: {e}")
-                continue  # 잘못된 데이터는 무시
-    
-    return created_count
+    return len(rows)
 
 # 권한 체크 데코레이터
 def role_required(allowed_roles):
@@ -422,19 +406,36 @@ def get_accessible_users(request_user, request=None):
         request: HTTP request 객체 (관리자 필터 확인용)
         
     Returns:
-        QuerySet: 접근 가능한 사용자 목록
+        QuerySet: 접근 가능한 사용자 목록 (``scope_user_ids`` 에 id 튜플 보관)
     """
     user_profile = get_user_profile(request_user)
-    
+    admin_filter_user = getattr(request, 'admin_filter_user', None) if request else None
+    admin_filter_company = getattr(request, 'admin_filter_company', None) if request else None
+    user_ids = resolve_scope_user_ids(
+        request,
+        'accessible',
+        (
+            request_user.id,
+            user_profile.role,
+            user_profile.company_id,
+            admin_filter_user.id if admin_filter_user else None,
+            admin_filter_company.id if admin_filter_company else None,
+        ),
+        lambda: _accessible_users_queryset(request_user, user_profile, admin_filter_user, admin_filter_company),
+    )
+    return scoped_users_queryset(user_ids)
+
+
+def _accessible_users_queryset(request_user, user_profile, admin_filter_user=None, admin_filter_company=None):
     if user_profile.is_admin():
         # 관리자: 필터링 적용
-        if request and hasattr(request, 'admin_filter_user') and request.admin_filter_user:
+        if admin_filter_user:
             # 특정 사용자 선택됨
-            return User.objects.filter(id=request.admin_filter_user.id)
-        elif request and hasattr(request, 'admin_filter_company') and request.admin_filter_company:
+            return User.objects.filter(id=admin_filter_user.id)
+        elif admin_filter_company:
             # 특정 회사 선택됨 - 해당 회사의 모든 실무자
             return User.objects.filter(
-                userprofile__company=request.admin_filter_company,
+                userprofile__company=admin_filter_company,
                 userprofile__role__in=['salesman', 'manager']
             )
         else:
@@ -2677,11 +2678,19 @@ def employees_management_api(request):
     else:
         status_filter = ''
 
-    total_count = users.count()
-    active_count = users.filter(is_active=True).count()
-    admin_count = users.filter(userprofile__role='admin').count() if profile.is_admin() else 0
-    manager_count = users.filter(userprofile__role='manager').count()
-    salesman_count = users.filter(userprofile__role='salesman').count()
+    user_metrics = aggregate_metrics(
+        users,
+        total=count_metric(),
+        active=count_metric(is_active=True),
+        admin=count_metric(userprofile__role='admin'),
+        manager=count_metric(userprofile__role='manager'),
+        salesman=count_metric(userprofile__role='salesman'),
+    )
+    total_count = user_metrics['total']
+    active_count = user_metrics['active']
+    admin_count = user_metrics['admin'] if profile.is_admin() else 0
+    manager_count = user_metrics['manager']
+    salesman_count = user_metrics['salesman']
     users = users.order_by('userprofile__company__name', 'userprofile__role', 'last_name', 'first_name', 'username')
 
     return JsonResponse({
@@ -3043,39 +3052,63 @@ def employees_toggle_active_api(request, user_id):
 
 
 def _dashboard_scope_users(request, user_profile):
-    """React dashboard API에서 사용할 사용자 범위를 기존 대시보드 규칙으로 계산."""
+    """React dashboard API에서 사용할 사용자 범위를 기존 대시보드 규칙으로 계산.
+
+    범위는 id 튜플로 캐시되고, 반환 queryset 의 ``scope_user_ids`` 로 그대로
+    꺼내 쓸 수 있다 (``scope_user_ids(scope_users)``).
+    """
     user_filter = request.GET.get('user') or request.session.get('selected_user_id')
     view_all = request.GET.get('view_all') == 'true'
     selected_user = None
 
     if user_profile.is_admin():
         if hasattr(request, 'admin_filter_user') and request.admin_filter_user:
-            users = User.objects.filter(id=request.admin_filter_user.id)
             selected_user = request.admin_filter_user
+            user_ids = (selected_user.id,)
         elif hasattr(request, 'admin_filter_company') and request.admin_filter_company:
-            users = User.objects.filter(
-                userprofile__company=request.admin_filter_company,
-                userprofile__role__in=['salesman', 'manager'],
-                is_active=True,
+            user_ids = resolve_scope_user_ids(
+                request,
+                'dashboard-admin-company',
+                (request.admin_filter_company.id,),
+                lambda: User.objects.filter(
+                    userprofile__company=request.admin_filter_company,
+                    userprofile__role__in=['salesman', 'manager'],
+                    is_active=True,
+                ),
             )
         elif user_filter and not view_all:
             try:
                 selected_user = User.objects.get(id=user_filter, is_active=True)
-                users = User.objects.filter(id=selected_user.id)
+                user_ids = (selected_user.id,)
             except (User.DoesNotExist, ValueError):
-                users = User.objects.filter(is_active=True)
+                user_ids = _dashboard_all_active_user_ids(request)
         else:
-            users = User.objects.filter(is_active=True)
+            user_ids = _dashboard_all_active_user_ids(request)
     elif user_profile.can_view_all_users():
-        users = get_accessible_users(request.user, request).filter(is_active=True)
+        accessible_ids = scope_user_ids(get_accessible_users(request.user, request))
+        user_ids = resolve_scope_user_ids(
+            request,
+            'dashboard-active',
+            (request.user.id, user_profile.role, user_profile.company_id),
+            lambda: User.objects.filter(id__in=accessible_ids, is_active=True),
+        )
         if user_filter and not view_all:
-            selected_user = users.filter(id=user_filter).first()
+            selected_user = User.objects.filter(id__in=user_ids, id=user_filter).first() if str(user_filter).isdigit() else None
             if selected_user:
-                users = users.filter(id=selected_user.id)
+                user_ids = (selected_user.id,)
     else:
-        users = User.objects.filter(id=request.user.id)
+        user_ids = (request.user.id,)
 
-    return users.select_related('userprofile'), selected_user
+    return scoped_users_queryset(user_ids, select_profile=True), selected_user
+
+
+def _dashboard_all_active_user_ids(request):
+    return resolve_scope_user_ids(
+        request,
+        'dashboard-all-active',
+        (),
+        lambda: User.objects.filter(is_active=True),
+    )
 
 
 def _user_display_name(user):
@@ -3236,50 +3269,109 @@ def _history_requests_quote_submission(history):
     return has_quote_document and has_submission_action
 
 
-def _history_has_quote_submission_evidence(history):
-    if not history or not history.followup_id or not history.user_id:
-        return False
-    if not _history_requests_quote_submission(history):
-        return False
+def _latest_created_at_by_followup_user(rows, user_fields):
+    """Group ``values()`` rows into {(followup_id, user_id): latest created_at}."""
+    latest = {}
+    for row in rows:
+        for user_field in user_fields:
+            user_id = row.get(user_field)
+            if not user_id:
+                continue
+            key = (row['followup_id'], user_id)
+            if key not in latest or row['latest'] > latest[key]:
+                latest[key] = row['latest']
+    return latest
 
-    created_at = history.created_at
-    quote_qs = Quote.objects.filter(
-        followup_id=history.followup_id,
-    ).filter(
-        Q(user_id=history.user_id) | Q(schedule__user_id=history.user_id)
-    ).exclude(stage__in=['draft', 'rejected', 'expired'])
-    if created_at:
-        quote_qs = quote_qs.filter(created_at__gte=created_at)
-    if quote_qs.exists():
-        return True
 
-    document_qs = DocumentGenerationLog.objects.filter(
-        schedule__followup_id=history.followup_id,
-        schedule__activity_type='quote',
-        document_type='quotation',
-    ).filter(
-        Q(user_id=history.user_id) | Q(schedule__user_id=history.user_id)
-    )
-    if created_at:
-        document_qs = document_qs.filter(created_at__gte=created_at)
-    if document_qs.exists():
-        return True
+def _quote_submission_evidence_ids(histories):
+    """견적 제출 후속조치 중 이미 제출 근거가 있는 History id 집합.
+
+    (followup_id, user_id) 쌍별로 Quote / 견적서 DocumentGenerationLog / 견적 History
+    의 최신 시각을 묶음 조회 3회로 가져온 뒤, 각 History 의 created_at 과 메모리에서
+    비교한다. 행마다 exists() 를 최대 3번 실행하던 방식과 판정 결과는 같다.
+    """
+    candidates = [
+        history for history in histories
+        if history and history.followup_id and history.user_id and _history_requests_quote_submission(history)
+    ]
+    if not candidates:
+        return set()
+
+    followup_ids = {history.followup_id for history in candidates}
+    user_ids = {history.user_id for history in candidates}
+    created_ats = [history.created_at for history in candidates if history.created_at]
+    since = min(created_ats) if len(created_ats) == len(candidates) else None
+    since_filter = {'created_at__gte': since} if since else {}
 
-    quote_history_qs = History.objects.filter(
-        user_id=history.user_id,
-        followup_id=history.followup_id,
+    latest_quote = _latest_created_at_by_followup_user(
+        Quote.objects.filter(
+            followup_id__in=followup_ids,
+            **since_filter,
+        ).filter(
+            Q(user_id__in=user_ids) | Q(schedule__user_id__in=user_ids)
+        ).exclude(
+            stage__in=['draft', 'rejected', 'expired'],
+        ).order_by().values('followup_id', 'user_id', 'schedule__user_id').annotate(latest=Max('created_at')),
+        ('user_id', 'schedule__user_id'),
+    )
+    latest_document = _latest_created_at_by_followup_user(
+        DocumentGenerationLog.objects.filter(
+            schedule__followup_id__in=followup_ids,
+            schedule__activity_type='quote',
+            document_type='quotation',
+            **since_filter,
+        ).filter(
+            Q(user_id__in=user_ids) | Q(schedule__user_id__in=user_ids)
+        ).order_by().values(
+            'user_id', 'schedule__user_id', followup_id=F('schedule__followup_id'),
+        ).annotate(latest=Max('created_at')),
+        ('user_id', 'schedule__user_id'),
+    )
+    # 자기 자신은 근거에서 제외해야 하므로 쌍별 최신 2건(id 포함)을 유지한다.
+    quote_histories = {}
+    for row in History.objects.filter(
+        user_id__in=user_ids,
+        followup_id__in=followup_ids,
         parent_history__isnull=True,
         action_type='quote',
-    ).exclude(pk=history.pk)
-    if created_at:
-        quote_history_qs = quote_history_qs.filter(created_at__gte=created_at)
-    return quote_history_qs.exists()
+        **since_filter,
+    ).order_by('-created_at', '-id').values('id', 'user_id', 'followup_id', 'created_at'):
+        top = quote_histories.setdefault((row['followup_id'], row['user_id']), [])
+        if len(top) < 2:
+            top.append(row)
+
+    evidence_ids = set()
+    for history in candidates:
+        key = (history.followup_id, history.user_id)
+        created_at = history.created_at
+
+        def is_after(value):
+            return value is not None and (not created_at or value >= created_at)
+
+        if is_after(latest_quote.get(key)) or is_after(latest_document.get(key)):
+            evidence_ids.add(history.id)
+            continue
+        other_quote_history = next(
+            (row for row in quote_histories.get(key, []) if row['id'] != history.pk),
+            None,
+        )
+        if other_quote_history and is_after(other_quote_history['created_at']):
+            evidence_ids.add(history.id)
+    return evidence_ids
+
+
+def _history_has_quote_submission_evidence(history):
+    if not history:
+        return False
+    return history.id in _quote_submission_evidence_ids([history])
 
 
 def _histories_excluding_stale_quote_submission(histories):
+    histories = list(histories)
+    evidence_ids = _quote_submission_evidence_ids(histories)
     return [
         history for history in histories
-        if not _history_has_quote_submission_evidence(history)
+        if history.id not in evidence_ids
     ]
 
 
@@ -3308,6 +3400,7 @@ def _dashboard_followup_payload(followup, latest_history=None, overdue=False):
     }
 
 
+@read_only_view
 @never_cache
 @require_http_methods(["GET"])
 def dashboard_summary_api(request):
@@ -3323,6 +3416,7 @@ def dashboard_summary_api(request):
 
     user_profile = get_user_profile(request.user)
     scope_users, selected_user = _dashboard_scope_users(request, user_profile)
+    scope_ids = scope_user_ids(scope_users)
     today = timezone.localdate()
     week_end = today + timedelta(days=6)
     year_start = date(today.year, 1, 1)
@@ -3340,10 +3434,10 @@ def dashboard_summary_api(request):
     else:
         month_end = date(today.year, today.month + 1, 1)
 
-    followups = FollowUp.objects.filter(user__in=scope_users)
-    schedules = Schedule.objects.filter(user__in=scope_users)
-    histories = History.objects.filter(user__in=scope_users, parent_history__isnull=True)
-    personal_schedules = PersonalSchedule.objects.filter(user__in=scope_users)
+    followups = FollowUp.objects.filter(user_id__in=scope_ids)
+    schedules = Schedule.objects.filter(user_id__in=scope_ids)
+    histories = History.objects.filter(user_id__in=scope_ids, parent_history__isnull=True)
+    personal_schedules = PersonalSchedule.objects.filter(user_id__in=scope_ids)
 
     today_business_schedules_qs = schedules.filter(
         visit_date=today,
@@ -3436,28 +3530,46 @@ def dashboard_summary_api(request):
 
     pipeline_stage_labels = dict(FollowUp.PIPELINE_STAGE_CHOICES)
     pipeline_stage_order = ['potential', 'contact', 'quote', 'negotiation', 'won', 'lost']
-    pipeline_counts = {
-        item['pipeline_stage']: item['count']
-        for item in followups.values('pipeline_stage').annotate(count=Count('id'))
-    }
+    followup_metrics = aggregate_metrics(
+        followups,
+        total=count_metric(),
+        active=count_metric(status='active'),
+        **{stage: count_metric(pipeline_stage=stage) for stage in pipeline_stage_order},
+    )
     pipeline_summary = [
         {
             'stage': stage,
             'label': pipeline_stage_labels.get(stage, stage),
-            'count': pipeline_counts.get(stage, 0),
+            'count': followup_metrics[stage],
         }
         for stage in pipeline_stage_order
     ]
 
     thirty_days_ago = today - timedelta(days=30)
-    pending_review_count = 0
-    team_activity = []
-    if user_profile.can_view_all_users():
-        pending_review_count = histories.filter(
+    history_metrics = aggregate_metrics(
+        histories.exclude(action_type='memo'),
+        recent=count_metric(),
+        monthly=count_metric(created_at__date__gte=month_start, created_at__date__lt=month_end),
+        pending_review=count_metric(
             action_type__in=['customer_meeting', 'delivery_schedule', 'quote', 'service'],
             reviewed_at__isnull=True,
             created_at__date__gte=thirty_days_ago,
-        ).exclude(action_type='memo').count()
+        ),
+    )
+    business_schedule_metrics = aggregate_metrics(
+        schedules.filter(visit_date__gte=today, visit_date__lte=week_end).exclude(status='cancelled'),
+        today=count_metric(visit_date=today),
+        upcoming=count_metric(visit_date__gt=today),
+    )
+    personal_schedule_metrics = aggregate_metrics(
+        personal_schedules.filter(schedule_date__gte=today, schedule_date__lte=week_end),
+        today=count_metric(schedule_date=today),
+        upcoming=count_metric(schedule_date__gt=today),
+    )
+    pending_review_count = 0
+    team_activity = []
+    if user_profile.can_view_all_users():
+        pending_review_count = history_metrics['pending_review']
         team_users = list(scope_users.filter(userprofile__role='salesman')[:8])
         activity_counts = {
             item['user_id']: item['count']
@@ -3493,41 +3605,27 @@ def dashboard_summary_api(request):
         schedule__status='completed',
     )
     prepayment_revenue_items = Prepayment.objects.filter(
-        created_by__in=scope_users,
+        created_by_id__in=scope_ids,
     ).exclude(status='cancelled')
-    yearly_delivery_revenue = revenue_items.filter(
-        schedule__visit_date__gte=year_start,
-        schedule__visit_date__lt=next_year_start,
-    ).aggregate(total=Sum('total_price'))['total'] or 0
-    quarterly_delivery_revenue = revenue_items.filter(
-        schedule__visit_date__gte=quarter_start,
-        schedule__visit_date__lt=quarter_end,
-    ).aggregate(total=Sum('total_price'))['total'] or 0
-    monthly_delivery_revenue = revenue_items.filter(
-        schedule__visit_date__gte=month_start,
-        schedule__visit_date__lt=month_end,
-    ).aggregate(total=Sum('total_price'))['total'] or 0
-    yearly_prepayment_revenue = prepayment_revenue_items.filter(
-        payment_date__gte=year_start,
-        payment_date__lt=next_year_start,
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    quarterly_prepayment_revenue = prepayment_revenue_items.filter(
-        payment_date__gte=quarter_start,
-        payment_date__lt=quarter_end,
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    monthly_prepayment_revenue = prepayment_revenue_items.filter(
-        payment_date__gte=month_start,
-        payment_date__lt=month_end,
-    ).aggregate(total=Sum('amount'))['total'] or 0
-    yearly_revenue = yearly_delivery_revenue + yearly_prepayment_revenue
-    quarterly_revenue = quarterly_delivery_revenue + quarterly_prepayment_revenue
-    monthly_revenue = monthly_delivery_revenue + monthly_prepayment_revenue
-    monthly_activity_count = histories.exclude(action_type='memo').filter(
-        created_at__date__gte=month_start,
-        created_at__date__lt=month_end,
-    ).count()
+    # 분기·월은 모두 당해년도 안이므로 연 범위로 좁힌 뒤 한 번에 합산한다.
+    delivery_revenue = aggregate_metrics(
+        revenue_items.filter(schedule__visit_date__gte=year_start, schedule__visit_date__lt=next_year_start),
+        year=sum_metric('total_price'),
+        quarter=sum_metric('total_price', schedule__visit_date__gte=quarter_start, schedule__visit_date__lt=quarter_end),
+        month=sum_metric('total_price', schedule__visit_date__gte=month_start, schedule__visit_date__lt=month_end),
+    )
+    prepayment_revenue = aggregate_metrics(
+        prepayment_revenue_items.filter(payment_date__gte=year_start, payment_date__lt=next_year_start),
+        year=sum_metric('amount'),
+        quarter=sum_metric('amount', payment_date__gte=quarter_start, payment_date__lt=quarter_end),
+        month=sum_metric('amount', payment_date__gte=month_start, payment_date__lt=month_end),
+    )
+    yearly_revenue = delivery_revenue['year'] + prepayment_revenue['year']
+    quarterly_revenue = delivery_revenue['quarter'] + prepayment_revenue['quarter']
+    monthly_revenue = delivery_revenue['month'] + prepayment_revenue['month']
+    monthly_activity_count = history_metrics['monthly']
 
-    scope_user_count = scope_users.count()
+    scope_user_count = len(scope_ids)
     scope_label = '전체'
     if selected_user:
         scope_label = _user_display_name(selected_user)
@@ -3554,18 +3652,18 @@ def dashboard_summary_api(request):
             'company': user_profile.company.name if user_profile.company else '',
         },
         'metrics': {
-            'totalCustomers': followups.count(),
-            'activeCustomers': followups.filter(status='active').count(),
-            'todaySchedules': today_business_schedules_qs.count() + today_personal_qs.count(),
+            'totalCustomers': followup_metrics['total'],
+            'activeCustomers': followup_metrics['active'],
+            'todaySchedules': business_schedule_metrics['today'] + personal_schedule_metrics['today'],
             'weeklySchedules': (
-                today_business_schedules_qs.count() +
-                today_personal_qs.count() +
-                upcoming_business_schedules_qs.count() +
-                upcoming_personal_qs.count()
+                business_schedule_metrics['today'] +
+                personal_schedule_metrics['today'] +
+                business_schedule_metrics['upcoming'] +
+                personal_schedule_metrics['upcoming']
             ),
             'overdueActions': len(overdue_actions_all),
             'dueTodayActions': len(due_today_actions_all),
-            'recentNotes': histories.exclude(action_type='memo').count(),
+            'recentNotes': history_metrics['recent'],
             'pendingReviews': pending_review_count,
             'monthlyActivity': monthly_activity_count,
             'yearRevenue': _money_int(yearly_revenue),
@@ -4425,34 +4523,42 @@ def _attach_department_management_counts(departments):
             setattr(department, attr_name, count_map.get(department.id, 0))
 
 
-def _company_salesmen_payload(company, scope_users):
-    salesmen = list(
-        FollowUp.objects.filter(
-            Q(company=company) | Q(department__company=company),
-            user__in=scope_users,
-        ).values(
-            'user_id',
-            'user__username',
-            'user__first_name',
-            'user__last_name',
-            'user__userprofile__role',
-        ).annotate(
-            contact_count=Count('id', distinct=True),
-        ).order_by('user__username')
+def _company_management_salesmen_map(company_ids, scope_users):
+    """페이지 업체별 담당 영업사원 목록을 한 번의 조회로 만든다."""
+    page_company_ids = set(company_ids)
+    if not page_company_ids:
+        return {}
+    rows = FollowUp.objects.filter(
+        Q(company_id__in=page_company_ids) | Q(department__company_id__in=page_company_ids),
+        user__in=scope_users,
+    ).values_list(
+        'id',
+        'company_id',
+        'department__company_id',
+        'user_id',
+        'user__username',
+        'user__first_name',
+        'user__last_name',
+        'user__userprofile__role',
     )
-    return [
-        {
-            'id': row['user_id'],
-            'name': (
-                f"{row['user__last_name']}{row['user__first_name']}".strip()
-                or row['user__username']
-            ),
-            'username': row['user__username'],
-            'role': row['user__userprofile__role'] or '',
-            'contactCount': row['contact_count'] or 0,
+    users = {}
+    contact_ids = {}
+    for followup_id, company_id, department_company_id, user_id, username, first_name, last_name, role in rows:
+        users[user_id] = {
+            'id': user_id,
+            'name': f"{last_name}{first_name}".strip() or username,
+            'username': username,
+            'role': role or '',
         }
-        for row in salesmen
-    ]
+        for related_company_id in {company_id, department_company_id} & page_company_ids:
+            contact_ids.setdefault(related_company_id, {}).setdefault(user_id, set()).add(followup_id)
+    return {
+        company_id: [
+            {**users[user_id], 'contactCount': len(followup_ids)}
+            for user_id, followup_ids in sorted(by_user.items(), key=lambda item: users[item[0]]['username'])
+        ]
+        for company_id, by_user in contact_ids.items()
+    }
 
 
 def _company_management_department_payload(department, request_user):
@@ -4493,7 +4599,17 @@ def _company_management_move_target_payload(company, request_user):
     }
 
 
-def _company_management_company_payload(company, request_user, scope_users, departments):
+def _company_management_department_payloads(company_id, request_user):
+    departments = list(
+        Department.objects.filter(company_id=company_id).select_related(
+            'company', 'created_by',
+        ).order_by('name', 'id')
+    )
+    _attach_department_management_counts(departments)
+    return [_company_management_department_payload(department, request_user) for department in departments]
+
+
+def _company_management_company_payload(company, request_user, salesmen, departments):
     blockers = _company_delete_blockers(company)
     can_manage = _can_manage_customer_company(request_user, company)
     delete_message = _customer_delete_message(blockers)
@@ -4513,7 +4629,7 @@ def _company_management_company_payload(company, request_user, scope_users, depa
         'departmentCount': blockers[0][1],
         'followupCount': blockers[1][1],
         'prepaymentCount': blockers[2][1],
-        'salesmen': _company_salesmen_payload(company, scope_users),
+        'salesmen': salesmen,
         'departments': departments,
     }
 
@@ -4532,44 +4648,73 @@ def companies_management_api(request):
     q = (request.GET.get('q') or request.GET.get('search') or '').strip()
     selected_department_id = request.GET.get('department_id') or ''
 
+    try:
+        page_size = min(max(int(request.GET.get('page_size') or request.GET.get('pageSize') or 50), 10), 200)
+    except (TypeError, ValueError):
+        page_size = 50
+
     base_company_ids = list(base_companies_qs.values_list('id', flat=True).distinct())
     total_company_count = len(base_company_ids)
     total_department_count = Department.objects.filter(company_id__in=base_company_ids).count()
     filtered_company_ids = _company_management_search_company_ids(base_company_ids, q)
-
-    companies = list(
-        Company.objects.filter(id__in=filtered_company_ids).select_related('created_by').order_by('name')
-    )
+    filtered_companies_qs = Company.objects.filter(id__in=filtered_company_ids).order_by('name', 'id')
+
+    # 선택 부서가 있으면 그 업체가 있는 페이지를 열고 부서 목록을 펼친다.
+    selected_department = None
+    if str(selected_department_id).isdigit():
+        selected_department = Department.objects.filter(
+            id=selected_department_id,
+            company_id__in=filtered_company_ids,
+        ).select_related('company').first()
+    page_number = request.GET.get('page')
+    if not page_number and selected_department:
+        selected_company = selected_department.company
+        position = filtered_companies_qs.filter(
+            Q(name__lt=selected_company.name) | Q(name=selected_company.name, id__lt=selected_company.id)
+        ).count()
+        page_number = position // page_size + 1
+    paginator = Paginator(filtered_companies_qs.select_related('created_by'), page_size)
+    page_obj = paginator.get_page(page_number or 1)
+    companies = list(page_obj)
     _attach_company_management_counts(companies)
-    departments = list(
-        Department.objects.filter(company_id__in=filtered_company_ids).select_related(
-            'company', 'created_by',
-        ).order_by('company__name', 'name')
+
+    # 부서는 펼친 업체 하나만 싣고, 나머지는 company_management_departments_api 로 불러온다.
+    expand_id = request.GET.get('expand') or ''
+    if str(expand_id).isdigit() and int(expand_id) in set(filtered_company_ids):
+        expanded_company_id = int(expand_id)
+    elif selected_department:
+        expanded_company_id = selected_department.company_id
+    else:
+        expanded_company_id = companies[0].id if companies else None
+    department_payloads = (
+        _company_management_department_payloads(expanded_company_id, request.user)
+        if expanded_company_id else []
     )
-    _attach_department_management_counts(departments)
-    departments_by_company = {}
-    for department in departments:
-        departments_by_company.setdefault(department.company_id, []).append(
-            _company_management_department_payload(department, request.user)
-        )
+
+    salesmen_by_company = _company_management_salesmen_map([company.id for company in companies], scope_users)
     company_payloads = [
         _company_management_company_payload(
             company,
             request.user,
-            scope_users,
-            departments_by_company.get(company.id, []),
+            salesmen_by_company.get(company.id, []),
+            department_payloads if company.id == expanded_company_id else [],
         )
         for company in companies
     ]
-    department_move_companies = [
-        _company_management_move_target_payload(company, request.user)
-        for company in Company.objects.filter(id__in=base_company_ids).order_by('name')
-    ]
-    department_payloads = [
-        department
-        for company in company_payloads
-        for department in company['departments']
-    ]
+
+    filtered_departments = Department.objects.filter(company_id__in=filtered_company_ids)
+    filtered_department_count = filtered_departments.count() if q else total_department_count
+    blocked_company_count = Company.objects.filter(id__in=filtered_company_ids).filter(
+        Exists(Department.objects.filter(company_id=OuterRef('pk')))
+        | Exists(FollowUp.objects.filter(company_id=OuterRef('pk')))
+        | Exists(Prepayment.objects.filter(company_id=OuterRef('pk')))
+    ).count()
+    blocked_department_count = filtered_departments.filter(
+        Exists(FollowUp.objects.filter(department_id=OuterRef('pk')))
+        | Exists(Prepayment.objects.filter(department_id=OuterRef('pk')))
+        | Exists(DepartmentMemo.objects.filter(department_id=OuterRef('pk')))
+        | Exists(FunnelTarget.objects.filter(department_id=OuterRef('pk')))
+    ).count()
 
     return JsonResponse({
         'success': True,
@@ -4594,12 +4739,20 @@ def companies_management_api(request):
         },
         'metrics': {
             'totalCompanies': total_company_count,
-            'filteredCompanies': len(company_payloads),
+            'filteredCompanies': paginator.count,
             'totalDepartments': total_department_count,
-            'filteredDepartments': len(department_payloads),
-            'totalContacts': sum(company['followupCount'] for company in company_payloads),
-            'blockedCompanies': sum(1 for company in company_payloads if company['deleteMessage']),
-            'blockedDepartments': sum(1 for department in department_payloads if department['deleteMessage']),
+            'filteredDepartments': filtered_department_count,
+            'totalContacts': FollowUp.objects.filter(company_id__in=filtered_company_ids).count(),
+            'blockedCompanies': blocked_company_count,
+            'blockedDepartments': blocked_department_count,
+        },
+        'pagination': {
+            'page': page_obj.number,
+            'pageSize': page_size,
+            'totalPages': paginator.num_pages,
+            'totalCount': paginator.count,
+            'hasNext': page_obj.has_next(),
+            'hasPrevious': page_obj.has_previous(),
         },
         'links': {
             'companies': '/companies/',
@@ -4609,9 +4762,63 @@ def companies_management_api(request):
             'legacyCompanies': reverse('reporting:company_list'),
             'legacyManagerCompanies': reverse('reporting:manager_company_list'),
         },
+        'expandedCompanyId': expanded_company_id,
         'companies': company_payloads,
         'departments': department_payloads,
-        'departmentMoveCompanies': department_move_companies,
+    })
+
+
+@never_cache
+@require_http_methods(["GET"])
+def company_management_departments_api(request, company_id):
+    """업체/부서 관리 화면에서 펼친 업체의 부서/연구실 목록."""
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    user_profile = get_user_profile(request.user)
+    _scope_users, base_companies_qs, _scope_label = _company_management_scope(request, user_profile)
+    if not base_companies_qs.filter(id=company_id).exists():
+        return JsonResponse({'success': False, 'error': '업체/학교를 찾을 수 없습니다.'}, status=404)
+
+    return JsonResponse({
+        'success': True,
+        'source': 'django',
+        'companyId': company_id,
+        'departments': _company_management_department_payloads(company_id, request.user),
+    })
+
+
+@never_cache
+@require_http_methods(["GET"])
+def company_management_move_targets_api(request):
+    """부서/연구실 이동 대상 업체 검색 (이름 검색, 최대 limit 건)."""
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    user_profile = get_user_profile(request.user)
+    _scope_users, base_companies_qs, _scope_label = _company_management_scope(request, user_profile)
+    q = (request.GET.get('q') or '').strip()
+    try:
+        limit = min(max(int(request.GET.get('limit') or 20), 1), 50)
+    except (TypeError, ValueError):
+        limit = 20
+
+    companies_qs = Company.objects.filter(id__in=base_companies_qs.values('id')).select_related('created_by')
+    if q:
+        companies_qs = companies_qs.filter(name__icontains=q)
+    companies = list(companies_qs.order_by('name', 'id')[:limit + 1])
+
+    return JsonResponse({
+        'success': True,
+        'source': 'django',
+        'q': q,
+        'companies': [
+            _company_management_move_target_payload(company, request.user)
+            for company in companies[:limit]
+        ],
+        'hasMore': len(companies) > limit,
     })
 
 
@@ -4705,12 +4912,15 @@ def _customer_account_contact_payload(followup, can_manage=False):
     }
 
 
-def _customer_account_payload(followup, shared_followups, scope_users, request=None, user_profile=None):
-    contacts = list(
-        shared_followups.filter(user__in=scope_users).select_related(
-            'user', 'company', 'department',
+def _customer_account_payload(followup, shared_followups, scope_users, request=None, user_profile=None, contacts=None):
+    if contacts is None:
+        contacts = list(
+            shared_followups.filter(user__in=scope_users).select_related(
+                'user', 'company', 'department',
+            )
         )
-    )
+    else:
+        contacts = list(contacts)
     role_order = {
         FollowUp.CONTACT_ROLE_PI: 0,
         FollowUp.CONTACT_ROLE_PRACTITIONER: 1,
@@ -4873,6 +5083,7 @@ def _customers_edit_config(request, user_profile, followup, can_edit):
     }
 
 
+@read_only_view
 @ensure_csrf_cookie
 @never_cache
 @require_http_methods(["GET"])
@@ -5314,7 +5525,6 @@ def _customer_shared_followups_queryset(followup):
 
 
 def _customer_detail_prepayment_summary_payload(followup, scope_users, actor):
-    shared_followups = _customer_shared_followups_queryset(followup)
     account_prepayments_href = (
         f'/prepayments/account/{followup.department_id}/'
         if followup.department_id else f'/prepayments/customer/{followup.id}/'
@@ -5478,29 +5688,13 @@ def _customer_delivery_record_payload(schedule):
 
 
 def _customer_delivery_record_payloads(followup, scope_users, limit=50):
-    service_history_prefetch = Prefetch(
-        'histories',
-        queryset=History.objects.filter(parent_history__isnull=True).prefetch_related('delivery_items_set').order_by('-created_at'),
-        to_attr='_customer_record_histories',
+    ledger = account_operational_ledger_for_followups(
+        _customer_shared_followups_queryset(followup).select_related('company', 'department'),
+        scope_users,
+        record_limit=limit,
+        sections=('delivery',),
     )
-    shared_followups = _customer_shared_followups_queryset(followup)
-    delivery_schedules_qs = Schedule.objects.filter(
-        followup__in=shared_followups,
-        user__in=scope_users,
-        activity_type='delivery',
-    ).exclude(status='cancelled').select_related(
-        'user', 'followup', 'followup__company', 'followup__department', 'prepayment'
-    ).prefetch_related(
-        'delivery_items_set',
-        service_history_prefetch,
-        Prefetch(
-            'prepayment_usages',
-            queryset=PrepaymentUsage.objects.select_related('prepayment', 'prepayment__customer').order_by('id'),
-        ),
-    ).order_by('-visit_date', '-visit_time', '-id')
-    if limit is not None:
-        delivery_schedules_qs = delivery_schedules_qs[:limit]
-    return [_customer_delivery_record_payload(schedule) for schedule in list(delivery_schedules_qs)]
+    return ledger['deliveryRecords']
 
 
 def _customer_quote_item_payload(item):
@@ -5560,10 +5754,14 @@ def _customer_service_schedule_record_payload(schedule):
     }
 
 
-def _customer_operational_records_payload(followup, scope_users, actor):
-    shared_followups = _customer_shared_followups_queryset(followup)
+def _customer_operational_records_payload(followup, scope_users, actor, account_followups=None):
+    if account_followups is None:
+        account_followups = list(
+            _customer_shared_followups_queryset(followup).select_related('user', 'company', 'department')
+        )
+    shared_followups = [item.id for item in account_followups]
     account_ledger = account_operational_ledger_for_followups(
-        list(shared_followups.select_related('user', 'company', 'department')),
+        account_followups,
         scope_users,
         actor=actor,
         record_limit=50,
@@ -5711,12 +5909,149 @@ def _customer_detail_attachments_payload(followup, shared_followups, scope_users
     }
 
 
+CUSTOMER_DETAIL_CORE_SECTION = 'core'
+CUSTOMER_DETAIL_LAZY_SECTIONS = ('records', 'files', 'ledger')
+CUSTOMER_DETAIL_SECTIONS = (CUSTOMER_DETAIL_CORE_SECTION, *CUSTOMER_DETAIL_LAZY_SECTIONS)
+
+
+def _customer_detail_requested_sections(request):
+    """``sections=core,records`` 처럼 요청한 상세 구간만 돌려준다. 값이 없으면 전체."""
+    raw_sections = request.GET.get('sections')
+    if raw_sections is None:
+        return set(CUSTOMER_DETAIL_SECTIONS)
+    sections = {
+        token.strip().lower()
+        for token in raw_sections.split(',')
+        if token.strip().lower() in CUSTOMER_DETAIL_SECTIONS
+    }
+    return sections or {CUSTOMER_DETAIL_CORE_SECTION}
+
+
+class _CustomerDetailLoader:
+    """고객 상세 API의 의존 쿼리를 계정 단위로 묶어 실행한다.
+
+    공유 계정 followup 과 조회 범위 사용자를 한 번만 id 목록으로 풀어 두고,
+    이후 노트·일정·첨부·원장 쿼리는 중첩 서브쿼리 대신 그 id 목록으로 거른다.
+    후속 조치(지연/예정)와 예정 일정은 한 번의 쿼리로 가져와 메모리에서 나눈다.
+    """
+
+    ACTION_WINDOW_DAYS = 14
+    ACTION_LIMIT = 8
+    NOTE_LIMIT = 12
+    SCHEDULE_LIMIT = 8
+
+    def __init__(self, followup, scope_users, today):
+        self.followup = followup
+        self.scope_users = scope_users
+        self.today = today
+        self.account_followups = list(
+            _customer_shared_followups_queryset(followup).select_related('user', 'company', 'department')
+        )
+        self.followup_ids = [item.id for item in self.account_followups]
+        self.scope_user_ids = scope_user_ids(scope_users)
+
+    @property
+    def contacts(self):
+        scope_user_ids = set(self.scope_user_ids)
+        return [item for item in self.account_followups if item.user_id in scope_user_ids]
+
+    def detail_followup(self, priority_order):
+        recent_histories_qs = History.objects.filter(
+            user_id__in=self.scope_user_ids,
+            parent_history__isnull=True,
+        ).exclude(action_type='memo').order_by('-created_at')
+        upcoming_schedules_qs = Schedule.objects.filter(
+            user_id__in=self.scope_user_ids,
+            status='scheduled',
+            visit_date__gte=self.today,
+        ).order_by('visit_date', 'visit_time')
+        return _customers_enriched_queryset(
+            FollowUp.objects.filter(pk=self.followup.pk),
+            self.today,
+            priority_order,
+            recent_histories_qs,
+            upcoming_schedules_qs,
+        ).first()
+
+    @cached_property
+    def notes_qs(self):
+        return _customer_account_notes_queryset(
+            self.scope_user_ids,
+            followups=self.followup_ids,
+            department=self.followup.department if self.followup.department_id else None,
+        )
+
+    @cached_property
+    def note_actions(self):
+        """지연 후속 조치와 14일 내 예정 후속 조치를 한 쿼리로 읽어 나눈다."""
+        action_histories = _histories_excluding_stale_quote_submission(list(
+            self.notes_qs.filter(
+                next_action_date__isnull=False,
+                next_action_date__lte=self.today + timedelta(days=self.ACTION_WINDOW_DAYS),
+                reviewed_at__isnull=True,
+            ).order_by('next_action_date', '-created_at')
+        ))
+        overdue = [history for history in action_histories if history.next_action_date < self.today]
+        upcoming = [history for history in action_histories if history.next_action_date >= self.today]
+        return overdue, upcoming
+
+    def _schedule_queryset(self):
+        return Schedule.objects.filter(
+            followup_id__in=self.followup_ids,
+            user_id__in=self.scope_user_ids,
+        ).select_related(
+            'user', 'followup', 'followup__company', 'followup__department'
+        ).annotate(
+            history_count=Count('histories', filter=Q(histories__parent_history__isnull=True), distinct=True)
+        )
+
+    def _upcoming_schedule_filter(self):
+        return Q(status='scheduled', visit_date__gte=self.today)
+
+    @cached_property
+    def upcoming_schedule_count(self):
+        return Schedule.objects.filter(
+            self._upcoming_schedule_filter(),
+            followup_id__in=self.followup_ids,
+            user_id__in=self.scope_user_ids,
+        ).count()
+
+    @cached_property
+    def upcoming_schedules(self):
+        return list(
+            self._schedule_queryset().filter(
+                self._upcoming_schedule_filter(),
+            ).order_by('visit_date', 'visit_time')[:self.SCHEDULE_LIMIT]
+        )
+
+    @cached_property
+    def recent_schedules(self):
+        return list(self._schedule_queryset().order_by('-visit_date', '-visit_time')[:self.SCHEDULE_LIMIT])
+
+    def operational_records(self, actor):
+        return _customer_operational_records_payload(
+            self.followup,
+            self.scope_user_ids,
+            actor,
+            account_followups=self.account_followups,
+        )
+
+    def attachments(self):
+        return _customer_detail_attachments_payload(self.followup, self.followup_ids, self.scope_user_ids)
+
+    def prepayment_summary(self, actor):
+        return _customer_detail_prepayment_summary_payload(self.followup, self.scope_user_ids, actor)
+
+
 @ensure_csrf_cookie
 @never_cache
 @require_http_methods(["GET"])
 def customer_detail_summary_api(request, followup_id):
-    """React CRM customer detail 화면용 읽기 전용 API."""
-    from datetime import timedelta
+    """React CRM customer detail 화면용 읽기 전용 API.
+
+    ``sections`` 파라미터로 무거운 구간(records: 납품/견적 원장, files: 첨부,
+    ledger: 선결제)을 나눠 요청할 수 있다. 파라미터가 없으면 전체를 돌려준다.
+    """
     from django.db.models import Case, IntegerField, Value, When
 
     auth_response = _api_login_required_response(request)
@@ -5734,156 +6069,123 @@ def customer_detail_summary_api(request, followup_id):
             'error': '접근 권한이 없습니다.',
         }, status=403)
 
+    sections = _customer_detail_requested_sections(request)
     scope_users, selected_user = _dashboard_scope_users(request, user_profile)
     today = timezone.localdate()
-    shared_followups = _customer_shared_followups_queryset(followup)
+    loader = _CustomerDetailLoader(followup, scope_users, today)
+    payload = {
+        'success': True,
+        'source': 'django',
+        'generatedAt': timezone.now().isoformat(),
+        'sections': [section for section in CUSTOMER_DETAIL_SECTIONS if section in sections],
+    }
 
-    priority_order = Case(
-        When(priority='urgent', then=Value(0)),
-        When(priority='followup', then=Value(1)),
-        When(priority='scheduled', then=Value(2)),
-        When(priority='long_term', then=Value(3)),
-        default=Value(4),
-        output_field=IntegerField(),
-    )
-    recent_histories_qs = History.objects.filter(
-        user__in=scope_users,
-        parent_history__isnull=True,
-    ).exclude(action_type='memo').order_by('-created_at')
-    upcoming_schedules_qs = Schedule.objects.filter(
-        user__in=scope_users,
-        status='scheduled',
-        visit_date__gte=today,
-    ).order_by('visit_date', 'visit_time')
-    detail_followup = _customers_enriched_queryset(
-        FollowUp.objects.filter(pk=followup.pk),
-        today,
-        priority_order,
-        recent_histories_qs,
-        upcoming_schedules_qs,
-    ).first()
-    if detail_followup is None:
-        return JsonResponse({
-            'success': False,
-            'error': '고객을 찾을 수 없습니다.',
-        }, status=404)
-
-    notes_qs = _customer_account_notes_queryset(
-        scope_users,
-        followups=shared_followups,
-        department=followup.department if followup.department_id else None,
-    )
-
-    overdue_actions_qs = notes_qs.filter(
-        next_action_date__lt=today,
-        next_action_date__isnull=False,
-        reviewed_at__isnull=True,
-    ).order_by('next_action_date', '-created_at')
-    upcoming_actions_qs = notes_qs.filter(
-        next_action_date__gte=today,
-        next_action_date__lte=today + timedelta(days=14),
-        next_action_date__isnull=False,
-        reviewed_at__isnull=True,
-    ).order_by('next_action_date', '-created_at')
-    overdue_actions = _histories_excluding_stale_quote_submission(list(overdue_actions_qs))
-    upcoming_actions = _histories_excluding_stale_quote_submission(list(upcoming_actions_qs))
-    upcoming_schedules = Schedule.objects.filter(
-        followup__in=shared_followups,
-        user__in=scope_users,
-        status='scheduled',
-        visit_date__gte=today,
-    ).select_related(
-        'user', 'followup', 'followup__company', 'followup__department'
-    ).annotate(
-        history_count=Count('histories', filter=Q(histories__parent_history__isnull=True), distinct=True)
-    ).order_by('visit_date', 'visit_time')
-    recent_schedules = Schedule.objects.filter(
-        followup__in=shared_followups,
-        user__in=scope_users,
-    ).select_related(
-        'user', 'followup', 'followup__company', 'followup__department'
-    ).annotate(
-        history_count=Count('histories', filter=Q(histories__parent_history__isnull=True), distinct=True)
-    ).order_by('-visit_date', '-visit_time')
-    can_review_notes = _can_review_notes(user_profile)
-    can_edit_customer = can_modify_user_data(request.user, followup.user)
-    can_create_activity = bool(request.user.id == followup.user_id and not user_profile.is_manager())
-    can_manage_account = bool(followup.department_id and _can_manage_department_account(request.user, followup.department))
-    from reporting.api.demos import demo_customer_summary_payload
+    if CUSTOMER_DETAIL_CORE_SECTION in sections:
+        priority_order = Case(
+            When(priority='urgent', then=Value(0)),
+            When(priority='followup', then=Value(1)),
+            When(priority='scheduled', then=Value(2)),
+            When(priority='long_term', then=Value(3)),
+            default=Value(4),
+            output_field=IntegerField(),
+        )
+        detail_followup = loader.detail_followup(priority_order)
+        if detail_followup is None:
+            return JsonResponse({
+                'success': False,
+                'error': '고객을 찾을 수 없습니다.',
+            }, status=404)
 
-    demo_summary = demo_customer_summary_payload(
-        request,
-        scope_users,
-        followup=followup,
-        can_manage=can_manage_account or can_edit_customer,
-    )
+        notes_qs = loader.notes_qs
+        overdue_actions, upcoming_actions = loader.note_actions
+        can_review_notes = _can_review_notes(user_profile)
+        can_edit_customer = can_modify_user_data(request.user, followup.user)
+        can_create_activity = bool(request.user.id == followup.user_id and not user_profile.is_manager())
+        can_manage_account = bool(followup.department_id and _can_manage_department_account(request.user, followup.department))
+        from reporting.api.demos import demo_customer_summary_payload
 
-    return JsonResponse({
-        'success': True,
-        'source': 'django',
-        'generatedAt': timezone.now().isoformat(),
-        'scope': {
-            'label': _user_display_name(selected_user) if selected_user else (
-                _user_display_name(request.user) if not user_profile.can_view_all_users()
-                else f'{user_profile.company.name} 팀' if user_profile.company else '전체'
+        demo_summary = demo_customer_summary_payload(
+            request,
+            scope_users,
+            followup=followup,
+            can_manage=can_manage_account or can_edit_customer,
+        )
+        payload.update({
+            'scope': {
+                'label': _user_display_name(selected_user) if selected_user else (
+                    _user_display_name(request.user) if not user_profile.can_view_all_users()
+                    else f'{user_profile.company.name} 팀' if user_profile.company else '전체'
+                ),
+                'userCount': len(loader.scope_user_ids),
+                'canViewAll': user_profile.can_view_all_users(),
+                'selectedUserId': selected_user.id if selected_user else None,
+            },
+            'customer': _customers_followup_payload(detail_followup, today),
+            'account': _customer_account_payload(
+                followup,
+                None,
+                scope_users,
+                request,
+                user_profile,
+                contacts=loader.contacts,
             ),
-            'userCount': scope_users.count(),
-            'canViewAll': user_profile.can_view_all_users(),
-            'selectedUserId': selected_user.id if selected_user else None,
-        },
-        'customer': _customers_followup_payload(detail_followup, today),
-        'account': _customer_account_payload(followup, shared_followups, scope_users, request, user_profile),
-        'metrics': {
-            'recentNotes': notes_qs.count(),
-            'upcomingSchedules': upcoming_schedules.count(),
-            'overdueActions': len(overdue_actions),
-            'upcomingActions': len(upcoming_actions),
-        },
-        'links': {
-            'customers': '/customers/',
-            'accountDetail': f'/accounts/{followup.department_id}/' if followup.department_id else f'/customers/{followup.id}/',
-            'accountDeliveryRecordsXlsx': reverse('reporting:account_delivery_records_xlsx_export_api', args=[followup.department_id]) if followup.department_id else reverse('reporting:customer_delivery_records_xlsx_export_api', args=[followup.id]),
-            'djangoDetail': reverse('reporting:followup_detail', args=[followup.id]),
-            'djangoEdit': reverse('reporting:followup_edit', args=[followup.id]),
-            'createSchedule': f'/schedules/?create=1&customer={followup.id}',
-            'createNote': f'/notes/?create=1&customer={followup.id}',
-            'deliveryRecordsXlsx': reverse('reporting:customer_delivery_records_xlsx_export_api', args=[followup.id]),
-            'pipeline': '/pipeline/',
-        },
-        'permissions': {
-            'canCreateNote': can_create_activity,
-            'canCreateSchedule': can_create_activity,
-            'canManageAccount': can_manage_account,
-            'canEditRepresentative': can_edit_customer,
-            'canDeleteRepresentative': can_edit_customer,
-            'readOnlyMessage': '' if can_manage_account or can_create_activity else '이 계정은 현재 사용자에게 읽기 전용입니다.',
-        },
-        'prepaymentSummary': _customer_detail_prepayment_summary_payload(followup, scope_users, request.user),
-        'operationalRecords': _customer_operational_records_payload(followup, scope_users, request.user),
-        'demoSummary': demo_summary,
-        'attachments': _customer_detail_attachments_payload(followup, shared_followups, scope_users),
-        'edit': _customers_edit_config(request, user_profile, followup, can_edit_customer),
-        'recentNotes': [
-            _notes_history_payload(note, today, can_review_notes)
-            for note in list(notes_qs[:12])
-        ],
-        'overdueActions': [
-            _notes_history_payload(note, today, can_review_notes)
-            for note in overdue_actions[:8]
-        ],
-        'upcomingActions': [
-            _notes_history_payload(note, today, can_review_notes)
-            for note in upcoming_actions[:8]
-        ],
-        'upcomingSchedules': [
-            _schedules_schedule_payload(schedule, today, _schedules_can_edit(request.user, schedule))
-            for schedule in list(upcoming_schedules[:8])
-        ],
-        'recentSchedules': [
-            _schedules_schedule_payload(schedule, today, _schedules_can_edit(request.user, schedule))
-            for schedule in list(recent_schedules[:8])
-        ],
-    })
+            'metrics': {
+                'recentNotes': notes_qs.count(),
+                'upcomingSchedules': loader.upcoming_schedule_count,
+                'overdueActions': len(overdue_actions),
+                'upcomingActions': len(upcoming_actions),
+            },
+            'links': {
+                'customers': '/customers/',
+                'accountDetail': f'/accounts/{followup.department_id}/' if followup.department_id else f'/customers/{followup.id}/',
+                'accountDeliveryRecordsXlsx': reverse('reporting:account_delivery_records_xlsx_export_api', args=[followup.department_id]) if followup.department_id else reverse('reporting:customer_delivery_records_xlsx_export_api', args=[followup.id]),
+                'djangoDetail': reverse('reporting:followup_detail', args=[followup.id]),
+                'djangoEdit': reverse('reporting:followup_edit', args=[followup.id]),
+                'createSchedule': f'/schedules/?create=1&customer={followup.id}',
+                'createNote': f'/notes/?create=1&customer={followup.id}',
+                'deliveryRecordsXlsx': reverse('reporting:customer_delivery_records_xlsx_export_api', args=[followup.id]),
+                'pipeline': '/pipeline/',
+                'sections': f"{reverse('reporting:customer_detail_summary_api', args=[followup.id])}?sections={','.join(CUSTOMER_DETAIL_LAZY_SECTIONS)}",
+            },
+            'permissions': {
+                'canCreateNote': can_create_activity,
+                'canCreateSchedule': can_create_activity,
+                'canManageAccount': can_manage_account,
+                'canEditRepresentative': can_edit_customer,
+                'canDeleteRepresentative': can_edit_customer,
+                'readOnlyMessage': '' if can_manage_account or can_create_activity else '이 계정은 현재 사용자에게 읽기 전용입니다.',
+            },
+            'demoSummary': demo_summary,
+            'edit': _customers_edit_config(request, user_profile, followup, can_edit_customer),
+            'recentNotes': [
+                _notes_history_payload(note, today, can_review_notes)
+                for note in list(notes_qs[:loader.NOTE_LIMIT])
+            ],
+            'overdueActions': [
+                _notes_history_payload(note, today, can_review_notes)
+                for note in overdue_actions[:loader.ACTION_LIMIT]
+            ],
+            'upcomingActions': [
+                _notes_history_payload(note, today, can_review_notes)
+                for note in upcoming_actions[:loader.ACTION_LIMIT]
+            ],
+            'upcomingSchedules': [
+                _schedules_schedule_payload(schedule, today, _schedules_can_edit(request.user, schedule))
+                for schedule in loader.upcoming_schedules
+            ],
+            'recentSchedules': [
+                _schedules_schedule_payload(schedule, today, _schedules_can_edit(request.user, schedule))
+                for schedule in loader.recent_schedules
+            ],
+        })
+
+    if 'ledger' in sections:
+        payload['prepaymentSummary'] = loader.prepayment_summary(request.user)
+    if 'records' in sections:
+        payload['operationalRecords'] = loader.operational_records(request.user)
+    if 'files' in sections:
+        payload['attachments'] = loader.attachments()
+    return JsonResponse(payload)
 
 
 def _empty_department_account_detail_response(request, department, user_profile, scope_users, selected_user):
@@ -6231,6 +6533,7 @@ def account_contact_save_api(request, department_id, followup_id=None):
     })
 
 
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
 def customer_delivery_records_xlsx_export_api(request, followup_id):
     """React 고객 상세의 고객별 납품 기록만 XLSX로 다운로드."""
     from django.http import HttpResponse
@@ -6349,6 +6652,7 @@ def customer_delivery_records_xlsx_export_api(request, followup_id):
 @never_cache
 @login_required
 @require_http_methods(["GET"])
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
 def account_delivery_records_xlsx_export_api(request, department_id):
     user_profile = get_user_profile(request.user)
     scope_users, _selected_user = _dashboard_scope_users(request, user_profile)
@@ -7429,60 +7733,62 @@ def notes_delete_api(request, history_id):
     })
 
 
-@never_cache
-@ensure_csrf_cookie
-@require_http_methods(["GET"])
-def notes_summary_api(request):
-    """React CRM notes 화면용 읽기 전용 API."""
-    from django.db.models import Case, DateField, F, When
-
-    auth_response = _api_login_required_response(request)
-    if auth_response:
-        return auth_response
+NOTES_REVIEW_REQUIRED_TYPES = ['customer_meeting', 'delivery_schedule', 'quote', 'service']
+NOTES_SUMMARY_LIST_LIMIT = 80
+NOTES_FEED_PAGE_SIZE = 30
+NOTES_FEED_MAX_PAGE_SIZE = 100
+NOTES_METRICS_CACHE_TIMEOUT = 60
 
-    user_profile = get_user_profile(request.user)
-    scope_users, selected_user = _dashboard_scope_users(request, user_profile)
-    can_review_notes = _can_review_notes(user_profile)
-    today = timezone.localdate()
 
-    q = request.GET.get('q', '').strip()
-    date_to = _parse_iso_date_or_none(request.GET.get('date_to') or request.GET.get('dateTo')) or today
-    date_from = _parse_iso_date_or_none(request.GET.get('date_from') or request.GET.get('dateFrom')) or _date_one_month_before(date_to)
-    if date_from > date_to:
+def _notes_filter_params(request, today, default_window=True):
+    """목록 필터. ``default_window`` 가 False 면 기간을 지정하지 않았을 때 전체 기간이다."""
+    date_to = _parse_iso_date_or_none(request.GET.get('date_to') or request.GET.get('dateTo'))
+    date_from = _parse_iso_date_or_none(request.GET.get('date_from') or request.GET.get('dateFrom'))
+    if default_window:
+        date_to = date_to or today
+        date_from = date_from or _date_one_month_before(date_to)
+    if date_from and date_to and date_from > date_to:
         date_from, date_to = date_to, date_from
-    owner = request.GET.get('owner', '').strip()
-    action_type = request.GET.get('actionType', '').strip()
-    review = request.GET.get('review', '').strip()
-    next_action = request.GET.get('nextAction', '').strip()
+    return {
+        'q': request.GET.get('q', '').strip(),
+        'date_from': date_from,
+        'date_to': date_to,
+        'owner': request.GET.get('owner', '').strip(),
+        'action_type': request.GET.get('actionType', '').strip(),
+        'review': request.GET.get('review', '').strip(),
+        'next_action': request.GET.get('nextAction', '').strip(),
+    }
 
-    base_notes = History.objects.filter(
-        user__in=scope_users,
+
+def _notes_ranged_queryset(scope_users, filters):
+    """기간 필터만 적용한 영업노트(최상위 History) 쿼리셋.
+
+    기간이 없으면(피드의 전체 기간) 일정일 ``CASE`` 를 붙이지 않아, 커서 조회가
+    ``hist_top_created_id_idx`` 를 그대로 탄다.
+    """
+    from django.db.models import DateField, F
+
+    notes = History.objects.filter(
+        user_id__in=scope_user_ids(scope_users),
         parent_history__isnull=True,
     )
-    sort_date_expression = Case(
+    if filters['date_from'] is None and filters['date_to'] is None:
+        return notes
+    notes = notes.annotate(sort_date=Case(
         When(schedule__isnull=False, then=F('schedule__visit_date')),
         When(personal_schedule__isnull=False, then=F('personal_schedule__schedule_date')),
         default=F('created_at__date'),
         output_field=DateField(),
-    )
-    ranged_base_notes = base_notes.annotate(sort_date=sort_date_expression).filter(
-        sort_date__gte=date_from,
-        sort_date__lte=date_to,
-    )
-    notes = ranged_base_notes.select_related(
-        'user',
-        'followup',
-        'followup__company',
-        'followup__department',
-        'department',
-        'department__company',
-        'schedule',
-        'schedule__department',
-        'schedule__department__company',
-        'personal_schedule',
-        'reviewer',
-    )
+    ))
+    if filters['date_from'] is not None:
+        notes = notes.filter(sort_date__gte=filters['date_from'])
+    if filters['date_to'] is not None:
+        notes = notes.filter(sort_date__lte=filters['date_to'])
+    return notes
+
 
+def _notes_apply_filters(notes, filters, scope_users, today):
+    q = filters['q']
     if q:
         notes = notes.filter(
             Q(content__icontains=q) |
@@ -7511,24 +7817,26 @@ def notes_summary_api(request):
             Q(reviewer__last_name__icontains=q)
         ).distinct()
 
+    owner = filters['owner']
     if owner:
         try:
             owner_id = int(owner)
-            if scope_users.filter(id=owner_id).exists():
+            if owner_id in scope_user_ids(scope_users):
                 notes = notes.filter(user_id=owner_id)
         except ValueError:
             pass
 
     valid_action_types = {value for value, _label in History.ACTION_CHOICES}
-    if action_type in valid_action_types:
-        notes = notes.filter(action_type=action_type)
+    if filters['action_type'] in valid_action_types:
+        notes = notes.filter(action_type=filters['action_type'])
 
-    review_required_types = ['customer_meeting', 'delivery_schedule', 'quote', 'service']
+    review = filters['review']
     if review == 'unreviewed':
-        notes = notes.filter(action_type__in=review_required_types, reviewed_at__isnull=True)
+        notes = notes.filter(action_type__in=NOTES_REVIEW_REQUIRED_TYPES, reviewed_at__isnull=True)
     elif review == 'reviewed':
         notes = notes.filter(reviewed_at__isnull=False)
 
+    next_action = filters['next_action']
     if next_action == 'overdue':
         notes = notes.filter(next_action_date__lt=today, next_action_date__isnull=False)
     elif next_action == 'upcoming':
@@ -7540,19 +7848,48 @@ def notes_summary_api(request):
         )
     elif next_action == 'has_date':
         notes = notes.filter(next_action_date__isnull=False)
+    return notes
 
-    notes = notes.annotate(
-        reply_count=Count('reply_memos', distinct=True),
-        file_count=Count('files', distinct=True),
-    ).order_by('-sort_date', '-created_at')
 
-    owner_options = [
-        {
-            'id': user.id,
-            'name': _user_display_name(user),
-        }
-        for user in scope_users.order_by('username')
-    ]
+def _notes_metrics_payload(ranged_base_notes, filtered_notes, today):
+    """영업노트 지표와 활동 유형별 건수 (집계 쿼리 2회 + 필터 건수 1회)."""
+    not_memo = ~Q(action_type='memo')
+    counts = ranged_base_notes.aggregate(
+        total=Count('id'),
+        activity=Count('id', filter=not_memo),
+        unreviewed=Count('id', filter=Q(action_type__in=NOTES_REVIEW_REQUIRED_TYPES, reviewed_at__isnull=True)),
+        overdue=Count('id', filter=not_memo & Q(next_action_date__lt=today, next_action_date__isnull=False)),
+        upcoming=Count('id', filter=not_memo & Q(
+            next_action_date__gte=today,
+            next_action_date__lte=today + timedelta(days=7),
+            next_action_date__isnull=False,
+        )),
+    )
+    action_counts = {
+        item['action_type']: item['count']
+        for item in ranged_base_notes.order_by().values('action_type').annotate(count=Count('id'))
+    }
+    return {
+        'metrics': {
+            'totalNotes': counts['total'],
+            'activityNotes': counts['activity'],
+            'filteredNotes': filtered_notes.count(),
+            'unreviewedNotes': counts['unreviewed'],
+            'overdueActions': counts['overdue'],
+            'upcomingActions': counts['upcoming'],
+        },
+        'actionCounts': [
+            {
+                'value': value,
+                'label': label,
+                'count': action_counts.get(value, 0),
+            }
+            for value, label in History.ACTION_CHOICES
+        ],
+    }
+
+
+def _notes_create_config_payload(request, user_profile):
     can_create_note = not user_profile.is_manager()
     create_targets = _notes_create_targets(request.user) if can_create_note else []
     create_departments = _department_create_targets(request.user) if can_create_note else []
@@ -7578,6 +7915,135 @@ def notes_summary_api(request):
             'delivery_items_set',
         ).order_by('-visit_date', '-visit_time', '-id')[:160])
 
+    return {
+        'canCreate': can_create_note,
+        'message': '' if can_create_note else 'Manager는 영업노트를 직접 작성할 수 없습니다.',
+        'submitUrl': reverse('reporting:notes_create_api'),
+        'actionTypes': _notes_create_action_types(request),
+        'departments': [
+            _department_create_target_payload(department, create_department_search_map.get(department.id, ''))
+            for department in create_departments
+        ],
+        'customers': [_notes_create_target_payload(followup) for followup in create_targets],
+        'schedules': [_notes_create_schedule_payload(schedule) for schedule in create_schedules],
+    }
+
+
+def _notes_feed_row_payload(history, today, can_review=False, reply_count=0, file_count=0):
+    """무한 스크롤 목록용 경량 행. 본문·첨부·납품 품목은 notes_detail_api 에서 조회한다."""
+    followup = history.followup
+    department = history.department or (followup.department if followup and followup.department else None)
+    company = followup.company if followup and followup.company else (department.company if department and department.company else None)
+    customer = (
+        followup.customer_name or followup.manager or '고객명 미정'
+    ) if followup else ('담당자 미등록' if department else '일반 메모')
+    activity_date = history.meeting_date or history.delivery_date
+    if not activity_date and history.schedule_id and history.schedule:
+        activity_date = history.schedule.visit_date
+    if not activity_date and history.personal_schedule_id and history.personal_schedule:
+        activity_date = history.personal_schedule.schedule_date
+    if not activity_date:
+        activity_date = history.created_at.date()
+
+    next_action = (history.next_action or history.meeting_next_action or '').strip()
+    next_action_date = history.next_action_date
+    review_required = history.action_type in NOTES_REVIEW_REQUIRED_TYPES
+    reviewed_at = history.reviewed_at
+    return {
+        'id': history.id,
+        'customer': customer,
+        'company': company.name if company else '',
+        'department': department.name if department else '',
+        'owner': _user_display_name(history.user),
+        'ownerId': history.user_id,
+        'actionType': history.action_type,
+        'actionLabel': history.get_action_type_display(),
+        'summary': (_history_activity_content(history) or history.delivery_items or '').strip()[:180],
+        'nextActionDisplay': (next_action or ('후속 예정' if next_action_date else ''))[:160],
+        'nextActionDate': _date_or_none(next_action_date),
+        'overdue': bool(next_action_date and next_action_date < today and not reviewed_at),
+        'activityDate': _date_or_none(activity_date),
+        'createdAt': _datetime_or_none(history.created_at),
+        'reviewed': bool(reviewed_at),
+        'reviewRequired': review_required,
+        'canReview': bool(can_review and review_required),
+        'replyCount': reply_count,
+        'fileCount': file_count,
+        'href': f'/notes/{history.id}/',
+        'detailUrl': reverse('reporting:notes_detail_api', args=[history.id]),
+        'customerHref': f'/customers/{followup.id}/' if followup else (f'/accounts/{department.id}/' if department else ''),
+    }
+
+
+def _notes_page_counts(history_ids):
+    """페이지에 실린 노트들의 ``(답글 수, 첨부 수)`` 딕셔너리 (그룹 쿼리 2회)."""
+    if not history_ids:
+        return {}, {}
+    reply_counts = dict(
+        History.objects.filter(parent_history_id__in=history_ids).order_by().values('parent_history_id')
+        .annotate(count=Count('id')).values_list('parent_history_id', 'count')
+    )
+    file_counts = dict(
+        HistoryFile.objects.filter(history_id__in=history_ids).order_by().values('history_id')
+        .annotate(count=Count('id')).values_list('history_id', 'count')
+    )
+    return reply_counts, file_counts
+
+
+def _notes_request_context(request, default_window=True):
+    user_profile = get_user_profile(request.user)
+    scope_users, selected_user = _dashboard_scope_users(request, user_profile)
+    today = timezone.localdate()
+    filters = _notes_filter_params(request, today, default_window=default_window)
+    ranged_base_notes = _notes_ranged_queryset(scope_users, filters)
+    filtered_notes = _notes_apply_filters(ranged_base_notes, filters, scope_users, today)
+    return user_profile, scope_users, selected_user, today, filters, ranged_base_notes, filtered_notes
+
+
+@never_cache
+@ensure_csrf_cookie
+@require_http_methods(["GET"])
+def notes_summary_api(request):
+    """React CRM notes 화면용 읽기 전용 API.
+
+    목록은 기존 화면 호환을 위해 상위 80건을 유지한다. 전체 이력 탐색은
+    ``notes_feed_api`` (커서 페이지), 지표/작성 설정은 각각 별도 엔드포인트를 쓴다.
+    """
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    user_profile, scope_users, selected_user, today, filters, ranged_base_notes, filtered_notes = _notes_request_context(request)
+    can_review_notes = _can_review_notes(user_profile)
+
+    notes = filtered_notes.select_related(
+        'user',
+        'followup',
+        'followup__company',
+        'followup__department',
+        'department',
+        'department__company',
+        'schedule',
+        'schedule__department',
+        'schedule__department__company',
+        'personal_schedule',
+        'reviewer',
+    ).order_by('-sort_date', '-created_at')[:NOTES_SUMMARY_LIST_LIMIT]
+    # 답글·첨부 수는 전체 결과를 조인·집계하지 않고 잘라낸 목록에 대해서만 센다.
+    notes = list(notes)
+    reply_counts, file_counts = _notes_page_counts([note.id for note in notes])
+    for note in notes:
+        note.reply_count = reply_counts.get(note.id, 0)
+        note.file_count = file_counts.get(note.id, 0)
+
+    owner_options = [
+        {
+            'id': user.id,
+            'name': _user_display_name(user),
+        }
+        for user in scope_users.order_by('username')
+    ]
+
     scope_label = '전체'
     if selected_user:
         scope_label = _user_display_name(selected_user)
@@ -7586,26 +8052,7 @@ def notes_summary_api(request):
     elif user_profile.company:
         scope_label = f'{user_profile.company.name} 팀'
 
-    filtered_count = notes.count()
-    base_non_memo = ranged_base_notes.exclude(action_type='memo')
-    unreviewed_count = ranged_base_notes.filter(
-        action_type__in=review_required_types,
-        reviewed_at__isnull=True,
-    ).count()
-    overdue_count = ranged_base_notes.filter(
-        next_action_date__lt=today,
-        next_action_date__isnull=False,
-    ).exclude(action_type='memo').count()
-    upcoming_count = ranged_base_notes.filter(
-        next_action_date__gte=today,
-        next_action_date__lte=today + timedelta(days=7),
-        next_action_date__isnull=False,
-    ).exclude(action_type='memo').count()
-
-    action_counts = {
-        item['action_type']: item['count']
-        for item in ranged_base_notes.values('action_type').annotate(count=Count('id'))
-    }
+    metrics_payload = _notes_metrics_payload(ranged_base_notes, filtered_notes, today)
 
     return JsonResponse({
         'success': True,
@@ -7613,19 +8060,19 @@ def notes_summary_api(request):
         'generatedAt': timezone.now().isoformat(),
         'scope': {
             'label': scope_label,
-            'userCount': scope_users.count(),
+            'userCount': len(scope_user_ids(scope_users)),
             'canViewAll': user_profile.can_view_all_users(),
             'canReview': can_review_notes,
             'selectedUserId': selected_user.id if selected_user else None,
         },
         'filters': {
-            'q': q,
-            'dateFrom': date_from.isoformat(),
-            'dateTo': date_to.isoformat(),
-            'owner': owner,
-            'actionType': action_type,
-            'review': review,
-            'nextAction': next_action,
+            'q': filters['q'],
+            'dateFrom': filters['date_from'].isoformat(),
+            'dateTo': filters['date_to'].isoformat(),
+            'owner': filters['owner'],
+            'actionType': filters['action_type'],
+            'review': filters['review'],
+            'nextAction': filters['next_action'],
         },
         'options': {
             'owners': owner_options,
@@ -7636,49 +8083,125 @@ def notes_summary_api(request):
             'reviewStates': [
                 {'value': 'unreviewed', 'label': '미검토'},
                 {'value': 'reviewed', 'label': '검토 완료'},
-            ],
-            'nextActionStates': [
-                {'value': 'upcoming', 'label': '7일 이내'},
-                {'value': 'has_date', 'label': '예정일 있음'},
-            ],
-        },
-        'metrics': {
-            'totalNotes': ranged_base_notes.count(),
-            'activityNotes': base_non_memo.count(),
-            'filteredNotes': filtered_count,
-            'unreviewedNotes': unreviewed_count,
-            'overdueActions': overdue_count,
-            'upcomingActions': upcoming_count,
-        },
-        'actionCounts': [
-            {
-                'value': value,
-                'label': label,
-                'count': action_counts.get(value, 0),
-            }
-            for value, label in History.ACTION_CHOICES
-        ],
+            ],
+            'nextActionStates': [
+                {'value': 'upcoming', 'label': '7일 이내'},
+                {'value': 'has_date', 'label': '예정일 있음'},
+            ],
+        },
+        **metrics_payload,
         'links': {
             'createNote': '/notes/?create=1',
             'notes': '/notes/',
             'unreviewed': '/notes/?review=unreviewed',
+            'feed': reverse('reporting:notes_feed_api'),
+            'metrics': reverse('reporting:notes_metrics_api'),
+            'createConfig': reverse('reporting:notes_create_config_api'),
         },
-        'create': {
-            'canCreate': can_create_note,
-            'message': '' if can_create_note else 'Manager는 영업노트를 직접 작성할 수 없습니다.',
-            'submitUrl': reverse('reporting:notes_create_api'),
-            'actionTypes': _notes_create_action_types(request),
-            'departments': [
-                _department_create_target_payload(department, create_department_search_map.get(department.id, ''))
-                for department in create_departments
-            ],
-            'customers': [_notes_create_target_payload(followup) for followup in create_targets],
-            'schedules': [_notes_create_schedule_payload(schedule) for schedule in create_schedules],
-        },
+        'create': _notes_create_config_payload(request, user_profile),
         'notes': [
             _notes_history_payload(note, today, can_review_notes)
-            for note in list(notes[:80])
+            for note in notes
+        ],
+    })
+
+
+@read_only_view
+@never_cache
+@require_http_methods(["GET"])
+def notes_feed_api(request):
+    """영업노트 무한 스크롤 피드 (created_at, id 커서 페이지).
+
+    ``cursor`` 는 직전 응답의 ``nextCursor`` 이며, 페이지마다 같은 비용으로
+    전체 이력까지 내려갈 수 있다. 필터 파라미터는 ``notes_summary_api`` 와 같지만,
+    기간(``dateFrom``/``dateTo``)을 주지 않으면 최근 한 달이 아니라 전체 기간이다.
+    """
+    from .services.keyset_pagination import keyset_page
+
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    user_profile, _scope_users, _selected_user, today, _filters, _ranged, filtered_notes = _notes_request_context(
+        request, default_window=False,
+    )
+    can_review_notes = _can_review_notes(user_profile)
+    try:
+        limit = int(request.GET.get('limit') or NOTES_FEED_PAGE_SIZE)
+    except ValueError:
+        limit = NOTES_FEED_PAGE_SIZE
+    limit = max(1, min(limit, NOTES_FEED_MAX_PAGE_SIZE))
+
+    rows, next_cursor = keyset_page(
+        filtered_notes.select_related(
+            'user',
+            'followup',
+            'followup__company',
+            'followup__department',
+            'department',
+            'department__company',
+            'schedule',
+            'personal_schedule',
+        ),
+        request.GET.get('cursor'),
+        limit,
+    )
+    reply_counts, file_counts = _notes_page_counts([history.id for history in rows])
+
+    return JsonResponse({
+        'success': True,
+        'notes': [
+            _notes_feed_row_payload(
+                history,
+                today,
+                can_review_notes,
+                reply_count=reply_counts.get(history.id, 0),
+                file_count=file_counts.get(history.id, 0),
+            )
+            for history in rows
         ],
+        'nextCursor': next_cursor,
+        'hasMore': next_cursor is not None,
+    })
+
+
+@never_cache
+@require_http_methods(["GET"])
+def notes_metrics_api(request):
+    """영업노트 지표/활동 유형별 건수. 같은 범위·필터는 짧게 공유 캐시에 보관한다."""
+    import hashlib
+
+    from django.core.cache import cache
+
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    _profile, scope_users, _selected_user, today, filters, ranged_base_notes, filtered_notes = _notes_request_context(request)
+    fingerprint = hashlib.sha1(json.dumps(
+        [scope_user_ids(scope_users), today, sorted(filters.items())],
+        cls=DjangoJSONEncoder,
+    ).encode('utf-8')).hexdigest()
+    cache_key = f'reporting:notes-metrics:{request.user.id}:{fingerprint}'
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = _notes_metrics_payload(ranged_base_notes, filtered_notes, today)
+        cache.set(cache_key, payload, NOTES_METRICS_CACHE_TIMEOUT)
+
+    return JsonResponse({'success': True, **payload})
+
+
+@never_cache
+@require_http_methods(["GET"])
+def notes_create_config_api(request):
+    """영업노트 작성 폼 설정 (대상 고객·부서·일정). 작성 폼을 열 때만 조회한다."""
+    auth_response = _api_login_required_response(request)
+    if auth_response:
+        return auth_response
+
+    return JsonResponse({
+        'success': True,
+        'create': _notes_create_config_payload(request, get_user_profile(request.user)),
     })
 
 
@@ -8906,10 +9429,15 @@ def schedules_calendar_api(request):
         history_count=Count('histories', distinct=True)
     ).order_by('schedule_date', 'schedule_time')
 
-    scheduled_count = base_schedules.filter(status='scheduled').count()
-    completed_count = base_schedules.filter(status='completed').count()
-    cancelled_count = base_schedules.filter(status='cancelled').count()
-    overdue_count = base_schedules.filter(visit_date__lt=today, status='scheduled').count()
+    schedule_metrics = aggregate_metrics(
+        base_schedules,
+        total=count_metric(),
+        scheduled=count_metric(status='scheduled'),
+        completed=count_metric(status='completed'),
+        cancelled=count_metric(status='cancelled'),
+        overdue=count_metric(visit_date__lt=today, status='scheduled'),
+    )
+    personal_schedule_count = base_personal_schedules.count()
     can_create_schedule = not user_profile.is_manager()
     create_targets = _schedules_create_targets(request.user) if can_create_schedule else []
     create_departments = _department_create_targets(request.user) if can_create_schedule else []
@@ -8931,13 +9459,13 @@ def schedules_calendar_api(request):
         },
         'options': options_payload,
         'metrics': {
-            'totalSchedules': base_schedules.count() + base_personal_schedules.count(),
-            'customerSchedules': base_schedules.count(),
-            'personalSchedules': base_personal_schedules.count(),
-            'scheduledSchedules': scheduled_count,
-            'completedSchedules': completed_count,
-            'cancelledSchedules': cancelled_count,
-            'overdueSchedules': overdue_count,
+            'totalSchedules': schedule_metrics['total'] + personal_schedule_count,
+            'customerSchedules': schedule_metrics['total'],
+            'personalSchedules': personal_schedule_count,
+            'scheduledSchedules': schedule_metrics['scheduled'],
+            'completedSchedules': schedule_metrics['completed'],
+            'cancelledSchedules': schedule_metrics['cancelled'],
+            'overdueSchedules': schedule_metrics['overdue'],
         },
         'links': {
             'schedules': '/schedules/',
@@ -9910,15 +10438,7 @@ def _schedules_quote_matches_delivery_target(quote_schedule, delivery_schedule):
 
 
 def _schedules_quote_item_identity(item):
-    return (
-        item.product_id or 0,
-        (item.item_name or '').strip().lower(),
-        (item.unit or '').strip().lower(),
-        str(item.unit_price or ''),
-        str(item.discount_rate or ''),
-        str(item.discount_unit_price or ''),
-        _quote_group_key(getattr(item, 'quote_group', '')),
-    )
+    return quote_item_identity(item)
 
 
 def _schedules_quote_item_total_for_quantity(item, quantity):
@@ -9948,81 +10468,20 @@ def _schedules_quote_item_imported_quantities(
     include_legacy_matches=False,
     exclude_delivery_schedule_id=None,
 ):
+    """견적 품목별 납품 수량 (QuoteItemAllocation 합계)."""
     from decimal import Decimal
 
-    quote_item_ids = [item.id for item in quote_items if item.id]
-    imported_quantities = {item.id: Decimal('0') for item in quote_items if item.id}
-    has_import_activity = False
-
-    if quote_item_ids:
-        linked_queryset = DeliveryItem.objects.filter(
-            source_quote_item_id__in=quote_item_ids,
-            schedule__activity_type='delivery',
-        ).exclude(
-            schedule__status='cancelled',
-        )
-        if exclude_delivery_schedule_id:
-            linked_queryset = linked_queryset.exclude(schedule_id=exclude_delivery_schedule_id)
-        linked_rows = linked_queryset.values('source_quote_item_id').annotate(total=Sum('quantity'))
-        for row in linked_rows:
-            source_item_id = row['source_quote_item_id']
-            if source_item_id in imported_quantities:
-                imported_quantities[source_item_id] += Decimal(str(row['total'] or 0))
-                if row['total']:
-                    has_import_activity = True
-
-    schedule_linked_items = DeliveryItem.objects.filter(
-        source_quote_schedule=quote_schedule,
-        source_quote_item__isnull=True,
-        schedule__activity_type='delivery',
-    ).exclude(
-        schedule__status='cancelled',
-    ).select_related('schedule')
-    if exclude_delivery_schedule_id:
-        schedule_linked_items = schedule_linked_items.exclude(schedule_id=exclude_delivery_schedule_id)
-    if schedule_linked_items.exists():
-        has_import_activity = True
-        items_by_identity = {}
-        for item in quote_items:
-            items_by_identity.setdefault(_schedules_quote_item_identity(item), []).append(item)
-        for delivered_item in schedule_linked_items:
-            for quote_item in items_by_identity.get(_schedules_quote_item_identity(delivered_item), []):
-                if quote_item.id in imported_quantities:
-                    imported_quantities[quote_item.id] += Decimal(str(delivered_item.quantity or 0))
-                    break
-
-    if include_legacy_matches:
-        legacy_delivery_schedules = Schedule.objects.filter(
-            user_id=quote_schedule.user_id,
-            activity_type='delivery',
-        ).exclude(status='cancelled')
-        if exclude_delivery_schedule_id:
-            legacy_delivery_schedules = legacy_delivery_schedules.exclude(id=exclude_delivery_schedule_id)
-        if quote_schedule.followup_id:
-            legacy_delivery_schedules = legacy_delivery_schedules.filter(followup_id=quote_schedule.followup_id)
-        legacy_delivery_items = DeliveryItem.objects.filter(
-            schedule__in=legacy_delivery_schedules,
-            source_quote_schedule__isnull=True,
-            source_quote_item__isnull=True,
-        )
-        if legacy_delivery_items.exists():
-            remaining_by_identity = {}
-            for quote_item in quote_items:
-                remaining_by_identity.setdefault(_schedules_quote_item_identity(quote_item), []).append(quote_item)
-            for delivered_item in legacy_delivery_items:
-                candidates = remaining_by_identity.get(_schedules_quote_item_identity(delivered_item), [])
-                for quote_item in candidates:
-                    if quote_item.id not in imported_quantities:
-                        continue
-                    quote_quantity = Decimal(str(quote_item.quantity or 0))
-                    already_imported = imported_quantities[quote_item.id]
-                    if already_imported >= quote_quantity:
-                        continue
-                    imported_quantities[quote_item.id] += Decimal(str(delivered_item.quantity or 0))
-                    has_import_activity = True
-                    break
-
-    return imported_quantities, has_import_activity
+    allocated, active_schedule_ids = allocated_quantities(
+        [quote_schedule.id],
+        exclude_delivery_schedule_id=exclude_delivery_schedule_id,
+        legacy_quote_schedule_ids=None if include_legacy_matches else (),
+    )
+    imported_quantities = {
+        item.id: allocated.get(item.id, Decimal('0'))
+        for item in quote_items
+        if item.id
+    }
+    return imported_quantities, quote_schedule.id in active_schedule_ids
 
 
 def _schedules_quote_item_progress_entries(
@@ -10070,7 +10529,6 @@ def _schedules_quote_item_progress_entries_for_schedules(
     exclude_delivery_schedule_id=None,
 ):
     """Return quote item delivery progress for many quote schedules with bulk queries."""
-    from collections import defaultdict
     from decimal import Decimal
 
     schedules = list(quote_schedules)
@@ -10078,109 +10536,27 @@ def _schedules_quote_item_progress_entries_for_schedules(
         return {}
 
     quote_items_by_schedule_id = {}
-    imported_quantities = {}
-    item_schedule_id_by_item_id = {}
-    identity_items_by_schedule = defaultdict(list)
-    has_import_activity_by_schedule_id = {schedule.id: False for schedule in schedules}
-
     for schedule in schedules:
         quote_items = list(schedule.delivery_items_set.all())
         quote_items.sort(key=lambda item: item.id or 0)
         quote_items_by_schedule_id[schedule.id] = quote_items
-        for item in quote_items:
-            if not item.id:
-                continue
-            imported_quantities[item.id] = Decimal('0')
-            item_schedule_id_by_item_id[item.id] = schedule.id
-            identity_items_by_schedule[(schedule.id, _schedules_quote_item_identity(item))].append(item)
-
-    quote_item_ids = list(imported_quantities)
-    if quote_item_ids:
-        linked_queryset = DeliveryItem.objects.filter(
-            source_quote_item_id__in=quote_item_ids,
-            schedule__activity_type='delivery',
-        ).exclude(
-            schedule__status='cancelled',
-        )
-        if exclude_delivery_schedule_id:
-            linked_queryset = linked_queryset.exclude(schedule_id=exclude_delivery_schedule_id)
-        for row in linked_queryset.values('source_quote_item_id').annotate(total=Sum('quantity')):
-            source_item_id = row['source_quote_item_id']
-            if source_item_id not in imported_quantities:
-                continue
-            quantity = Decimal(str(row['total'] or 0))
-            imported_quantities[source_item_id] += quantity
-            schedule_id = item_schedule_id_by_item_id.get(source_item_id)
-            if schedule_id and quantity:
-                has_import_activity_by_schedule_id[schedule_id] = True
-
-    schedule_ids = [schedule.id for schedule in schedules]
-    schedule_linked_items = DeliveryItem.objects.filter(
-        source_quote_schedule_id__in=schedule_ids,
-        source_quote_item__isnull=True,
-        schedule__activity_type='delivery',
-    ).exclude(
-        schedule__status='cancelled',
-    ).select_related('schedule')
-    if exclude_delivery_schedule_id:
-        schedule_linked_items = schedule_linked_items.exclude(schedule_id=exclude_delivery_schedule_id)
-    for delivered_item in schedule_linked_items:
-        source_schedule_id = delivered_item.source_quote_schedule_id
-        if not source_schedule_id:
-            continue
-        has_import_activity_by_schedule_id[source_schedule_id] = True
-        candidates = identity_items_by_schedule.get((
-            source_schedule_id,
-            _schedules_quote_item_identity(delivered_item),
-        ), [])
-        for quote_item in candidates:
-            if quote_item.id in imported_quantities:
-                imported_quantities[quote_item.id] += Decimal(str(delivered_item.quantity or 0))
-                break
 
+    legacy_quote_schedule_ids = ()
     if include_legacy_matches_for_completed:
-        completed_schedules = [
-            schedule
+        legacy_quote_schedule_ids = {
+            schedule.id
             for schedule in schedules
             if schedule.status == 'completed' and schedule.followup_id
-        ]
-        completed_schedule_ids_by_owner_followup = defaultdict(list)
-        for schedule in completed_schedules:
-            completed_schedule_ids_by_owner_followup[(schedule.user_id, schedule.followup_id)].append(schedule.id)
-
-        if completed_schedule_ids_by_owner_followup:
-            owner_ids = {owner_id for owner_id, _followup_id in completed_schedule_ids_by_owner_followup}
-            followup_ids = {followup_id for _owner_id, followup_id in completed_schedule_ids_by_owner_followup}
-            legacy_delivery_items = DeliveryItem.objects.filter(
-                schedule__user_id__in=owner_ids,
-                schedule__followup_id__in=followup_ids,
-                schedule__activity_type='delivery',
-                source_quote_schedule__isnull=True,
-                source_quote_item__isnull=True,
-            ).exclude(
-                schedule__status='cancelled',
-            ).select_related('schedule')
-            if exclude_delivery_schedule_id:
-                legacy_delivery_items = legacy_delivery_items.exclude(schedule_id=exclude_delivery_schedule_id)
-
-            for delivered_item in legacy_delivery_items:
-                candidate_schedule_ids = completed_schedule_ids_by_owner_followup.get((
-                    delivered_item.schedule.user_id,
-                    delivered_item.schedule.followup_id,
-                ), [])
-                delivered_identity = _schedules_quote_item_identity(delivered_item)
-                for schedule_id in candidate_schedule_ids:
-                    candidates = identity_items_by_schedule.get((schedule_id, delivered_identity), [])
-                    for quote_item in candidates:
-                        if quote_item.id not in imported_quantities:
-                            continue
-                        quote_quantity = Decimal(str(quote_item.quantity or 0))
-                        already_imported = imported_quantities[quote_item.id]
-                        if already_imported >= quote_quantity:
-                            continue
-                        imported_quantities[quote_item.id] += Decimal(str(delivered_item.quantity or 0))
-                        has_import_activity_by_schedule_id[schedule_id] = True
-                        break
+        }
+    imported_quantities, active_schedule_ids = allocated_quantities(
+        [schedule.id for schedule in schedules],
+        exclude_delivery_schedule_id=exclude_delivery_schedule_id,
+        legacy_quote_schedule_ids=legacy_quote_schedule_ids,
+    )
+    has_import_activity_by_schedule_id = {
+        schedule.id: schedule.id in active_schedule_ids
+        for schedule in schedules
+    }
 
     progress_by_schedule_id = {}
     for schedule in schedules:
@@ -10379,12 +10755,14 @@ def _schedules_delivery_items_summary(schedule):
     return '\n'.join(delivery_lines), int(total_amount) if total_amount > 0 else 0
 
 
-def _schedule_quote_group_summaries(schedule):
+def _schedule_quote_group_summaries(schedule, items=None):
     from decimal import Decimal
 
     groups = {}
     notes_map = _schedule_quote_group_notes_map(schedule)
-    for item in schedule.delivery_items_set.all().order_by('id'):
+    if items is None:
+        items = schedule.delivery_items_set.all().order_by('id')
+    for item in items:
         group_key = _quote_group_key(getattr(item, 'quote_group', ''))
         if group_key not in groups:
             groups[group_key] = {
@@ -10472,7 +10850,21 @@ def _schedule_registered_quote_documents(schedule):
     )
 
 
-def _schedules_document_actions(schedule, user):
+def _schedules_document_context(schedule, user):
+    """상세 화면 서류 작업·상업 점검이 함께 쓰는 조회 결과를 일정당 한 번 읽는다."""
+    registered_documents = []
+    if schedule.activity_type in ['quote', 'delivery']:
+        registered_documents = list(_schedule_registered_documents(schedule))
+    company_id = getattr(getattr(user, 'userprofile', None), 'company_id', None)
+    return {
+        # 상세 조회는 delivery_items_set 을 prefetch 하므로 추가 쿼리 없이 정렬한다.
+        'items': sorted(schedule.delivery_items_set.all(), key=lambda item: item.id),
+        'registered_documents': registered_documents,
+        'template_counts': company_template_counts(company_id),
+    }
+
+
+def _schedules_document_actions(schedule, user, context=None):
     document_configs = {
         'quotation': {
             'label': '견적서',
@@ -10492,19 +10884,21 @@ def _schedules_document_actions(schedule, user):
         'delivery': ['transaction_statement', 'delivery_note'],
     }
     document_types = activity_documents.get(schedule.activity_type, [])
-    company = getattr(getattr(user, 'userprofile', None), 'company', None)
+    context = context or _schedules_document_context(schedule, user)
     can_delete_documents = _schedules_can_edit(user, schedule)
     registered_documents = [
         _document_generation_file_payload(log, can_delete=can_delete_documents)
-        for log in _schedule_registered_documents(schedule)
-    ] if schedule.activity_type in ['quote', 'delivery'] else []
+        for log in context['registered_documents']
+    ]
     registered_quotations = [
-        _document_generation_file_payload(log, can_delete=can_delete_documents)
-        for log in _schedule_registered_quote_documents(schedule)
+        payload
+        for log, payload in zip(context['registered_documents'], registered_documents)
+        if log.document_type == 'quotation'
     ] if schedule.activity_type == 'quote' else []
     registered_transaction_statements = [
-        _document_generation_file_payload(log, can_delete=can_delete_documents)
-        for log in _schedule_registered_documents(schedule).filter(document_type='transaction_statement')
+        payload
+        for log, payload in zip(context['registered_documents'], registered_documents)
+        if log.document_type == 'transaction_statement'
     ] if schedule.activity_type == 'delivery' else []
     if schedule.activity_type == 'quote':
         auto_attach_label = (
@@ -10518,18 +10912,11 @@ def _schedules_document_actions(schedule, user):
         )
     else:
         auto_attach_label = ''
-    quote_groups = _schedule_quote_group_summaries(schedule) if schedule.activity_type == 'quote' else []
-
-    template_counts = {}
-    if company and document_types:
-        template_counts = {
-            item['document_type']: item['count']
-            for item in DocumentTemplate.objects.filter(
-                company=company,
-                document_type__in=document_types,
-                is_active=True,
-            ).values('document_type').annotate(count=Count('id'))
-        }
+    quote_groups = (
+        _schedule_quote_group_summaries(schedule, context['items'])
+        if schedule.activity_type == 'quote' else []
+    )
+    template_counts = context['template_counts']
 
     document_items = []
     for document_type in document_types:
@@ -10640,34 +11027,36 @@ def _commercial_auto_attach_status(registered_count, template_count):
 
 
 def _commercial_template_counts(user, document_types):
-    company = getattr(getattr(user, 'userprofile', None), 'company', None)
-    if not company or not document_types:
+    company_id = getattr(getattr(user, 'userprofile', None), 'company_id', None)
+    if not company_id or not document_types:
         return {}
-    return {
-        row['document_type']: row['count']
-        for row in DocumentTemplate.objects.filter(
-            company=company,
-            document_type__in=document_types,
-            is_active=True,
-        ).values('document_type').annotate(count=Count('id'))
-    }
+    counts = company_template_counts(company_id)
+    return {document_type: counts[document_type] for document_type in document_types if document_type in counts}
 
 
-def _commercial_registered_quote_counts(schedule):
-    return {
-        _quote_group_key(row['quote_group']): row['count']
-        for row in _schedule_registered_quote_documents(schedule)
-        .values('quote_group')
-        .annotate(count=Count('id'))
-    }
+def _commercial_registered_quote_counts(schedule, registered_documents=None):
+    if registered_documents is None:
+        return {
+            _quote_group_key(row['quote_group']): row['count']
+            for row in _schedule_registered_quote_documents(schedule)
+            .values('quote_group')
+            .annotate(count=Count('id'))
+        }
+    counts = {}
+    for log in registered_documents:
+        if log.document_type == 'quotation':
+            group_key = _quote_group_key(log.quote_group)
+            counts[group_key] = counts.get(group_key, 0) + 1
+    return counts
 
 
-def _commercial_quote_checks(schedule, user, documents, email_thread_count):
+def _commercial_quote_checks(schedule, user, documents, email_thread_count, context=None):
     from decimal import Decimal
 
-    items = list(schedule.delivery_items_set.all().order_by('id'))
-    template_count = _commercial_template_counts(user, ['quotation']).get('quotation', 0)
-    registered_quote_counts = _commercial_registered_quote_counts(schedule)
+    context = context or _schedules_document_context(schedule, user)
+    items = context['items']
+    template_count = context['template_counts'].get('quotation', 0)
+    registered_quote_counts = _commercial_registered_quote_counts(schedule, context['registered_documents'])
     registered_total = sum(registered_quote_counts.values())
     imported_quantities, has_import_activity = _schedules_quote_item_imported_quantities(
         schedule,
@@ -10844,14 +11233,15 @@ def _commercial_quote_checks(schedule, user, documents, email_thread_count):
     }
 
 
-def _commercial_delivery_checks(schedule, user, documents, email_thread_count):
+def _commercial_delivery_checks(schedule, user, documents, email_thread_count, context=None):
     from decimal import Decimal
 
-    items = list(schedule.delivery_items_set.all().order_by('id'))
-    template_count = _commercial_template_counts(user, ['transaction_statement']).get('transaction_statement', 0)
-    registered_statement_count = _schedule_registered_documents(schedule).filter(
-        document_type='transaction_statement',
-    ).count()
+    context = context or _schedules_document_context(schedule, user)
+    items = context['items']
+    template_count = context['template_counts'].get('transaction_statement', 0)
+    registered_statement_count = sum(
+        1 for log in context['registered_documents'] if log.document_type == 'transaction_statement'
+    )
     auto_status, auto_label = _commercial_auto_attach_status(registered_statement_count, template_count)
     total_amount = Decimal('0')
     source_quotes = {}
@@ -10955,11 +11345,11 @@ def _commercial_delivery_checks(schedule, user, documents, email_thread_count):
     }
 
 
-def _schedules_commercial_checks(schedule, user, documents, email_thread_count):
+def _schedules_commercial_checks(schedule, user, documents, email_thread_count, context=None):
     if schedule.activity_type == 'quote':
-        return _commercial_quote_checks(schedule, user, documents, email_thread_count)
+        return _commercial_quote_checks(schedule, user, documents, email_thread_count, context)
     if schedule.activity_type == 'delivery':
-        return _commercial_delivery_checks(schedule, user, documents, email_thread_count)
+        return _commercial_delivery_checks(schedule, user, documents, email_thread_count, context)
     return {
         'applies': False,
         'kind': schedule.activity_type,
@@ -11045,7 +11435,7 @@ def _schedules_detail_payload(request, schedule, user_profile):
             'canDelete': can_edit,
             'uploadedAt': _datetime_or_none(file.uploaded_at),
         }
-        for file in schedule.files.all().order_by('-uploaded_at')
+        for file in sorted(schedule.files.all(), key=lambda file: file.uploaded_at, reverse=True)
     ]
     related_notes_qs = History.objects.filter(
         schedule=schedule,
@@ -11067,24 +11457,26 @@ def _schedules_detail_payload(request, schedule, user_profile):
         for history in related_notes_qs
         if can_access_user_data(request.user, history.user)
     ]
+    document_context = _schedules_document_context(schedule, request.user)
     delivery_items = [
         _schedules_delivery_item_payload(item)
-        for item in schedule.delivery_items_set.all().order_by('id')
+        for item in document_context['items']
     ]
     prepayment_usages = [
         _schedules_prepayment_usage_payload(usage)
-        for usage in schedule.prepayment_usages.all().order_by('id')
+        for usage in sorted(schedule.prepayment_usages.all(), key=lambda usage: usage.id)
     ]
     email_thread_count = EmailLog.objects.filter(
         schedule=schedule,
         gmail_thread_id__isnull=False,
     ).exclude(gmail_thread_id='').values('gmail_thread_id').distinct().count()
-    documents = _schedules_document_actions(schedule, request.user)
+    documents = _schedules_document_actions(schedule, request.user, document_context)
     commercial_checks = _schedules_commercial_checks(
         schedule,
         request.user,
         documents,
         email_thread_count,
+        document_context,
     )
     tax_invoice = _schedules_tax_invoice_payload(schedule, can_edit)
 
@@ -11398,12 +11790,11 @@ def schedules_delivery_items_update_api(request, schedule_id):
                 if source_id not in source_quote_schedule_ids:
                     source_quote_schedule_ids.append(source_id)
             _schedules_validate_source_quote_item_quantities(delivery_items, schedule)
-            schedule.delivery_items_set.all().delete()
             for item_data in delivery_items:
-                existing_item_id = item_data.pop('_existing_item_id', None)
+                existing_item_id = item_data.get('_existing_item_id')
                 if existing_item_id in existing_receivable_status:
                     item_data.update(existing_receivable_status[existing_item_id])
-                DeliveryItem.objects.create(schedule=schedule, **item_data)
+            persist_delivery_items(schedule, delivery_items)
             _save_schedule_quote_group_notes(schedule, quote_group_notes)
             schedule.save(update_fields=['quote_extra_notes', 'updated_at'])
             _schedules_sync_delivery_histories(schedule, request.user, len(delivery_items))
@@ -12369,9 +12760,7 @@ def _ai_workspace_build_action_queue(user, week_start, week_end, limit=20, depar
         'followup__company',
         'followup__department',
     ).order_by('next_action_date', '-created_at')[:10]
-    for history in pending_history_qs:
-        if _history_has_quote_submission_evidence(history):
-            continue
+    for history in _histories_excluding_stale_quote_submission(pending_history_qs):
         followup = history.followup
         due_date = history.next_action_date
         score = 46 + _ai_workspace_score_date(due_date, today)
@@ -15578,175 +15967,9 @@ def _email_thread_identifier(email):
     return email.gmail_thread_id or email.thread_id or email.gmail_message_id or email.message_id or str(email.id)
 
 
-def _strip_html_style_blocks(value):
-    import re
-
-    text = str(value or '')
-    text = re.sub(r'(?is)<\s*style\b[^>]*>.*?<\s*/\s*style\s*>', ' ', text)
-    text = re.sub(r'(?is)<\s*script\b[^>]*>.*?<\s*/\s*script\s*>', ' ', text)
-    return text
-
-
-def _strip_css_text_artifacts(value):
-    import re
-
-    text = str(value or '')
-    selector_pattern = r'(?:p|div|span|body|td|table|tr|a|li|ul|ol)'
-    css_prop_pattern = r'(?:margin|padding|font|color|line-height|mso-|text-|background|border|white-space)'
-    text = re.sub(
-        rf'(?im)^\s*{selector_pattern}\s*\{{[^{{}}\n]*{css_prop_pattern}[^{{}}\n]*\}}\s*$',
-        '',
-        text,
-    )
-    text = re.sub(
-        rf'(?i)\b{selector_pattern}\s*\{{[^{{}}]*(?:margin|padding|font|mso-)[^{{}}]*\}}\s*',
-        '',
-        text,
-    )
-    return text
-
-
-def _looks_like_email_html(value):
-    import html
-    import re
-
-    text = str(value or '')
-    if not text.strip():
-        return False
-    candidates = [text]
-    unescaped = html.unescape(text)
-    if unescaped != text:
-        candidates.append(unescaped)
-    html_pattern = re.compile(
-        r'(?is)<\s*(?:!doctype|html|head|body|style|script|meta|div|p|br|span|table|tbody|tr|td|blockquote)\b'
-    )
-    return any(html_pattern.search(candidate) for candidate in candidates)
-
-
-def _strip_quoted_html_for_display(raw_html):
-    """React 메일 상세 표시에서는 Gmail/Outlook 인용 체인을 숨긴다."""
-    import re
-
-    quote_patterns = [
-        r'(?is)<div[^>]+class=["\'][^"\']*gmail_quote[^"\']*["\'][^>]*>.*$',
-        r'(?is)<div[^>]+id=["\']mail-editor-reference-message-container["\'][^>]*>.*$',
-        r'(?is)<div[^>]+class=["\'][^"\']*ms-outlook-mobile-reference-message[^"\']*["\'][^>]*>.*$',
-        r'(?is)<blockquote\b[^>]*>.*$',
-    ]
-    cut_positions = []
-    for pattern in quote_patterns:
-        match = re.search(pattern, raw_html)
-        if match and match.start() >= 20:
-            cut_positions.append(match.start())
-
-    if not cut_positions:
-        return raw_html
-    return raw_html[:min(cut_positions)]
-
-
-def _strip_quoted_text_for_display(text):
-    import re
-
-    quote_patterns = [
-        r'\n\s*\d{4}년\s+\d{1,2}월\s+\d{1,2}일.{0,500}?(님이 작성:|wrote:)',
-        r'\n\s*On .{1,500}? wrote:',
-        r'\n\s*-{2,}\s*Original Message\s*-{2,}',
-        r'\n\s*-----Original Message-----',
-        r'\n\s*보낸 사람\s*:',
-        r'\n\s*From\s*:',
-        r'\n\s*Sent\s*:',
-        r'\n\s*받는 사람\s*:',
-        r'\n\s*To\s*:',
-        r'\n\s*Get Outlook for',
-        r'\n\s*받기 Mac용 Outlook',
-    ]
-    cut_positions = []
-    for pattern in quote_patterns:
-        match = re.search(pattern, text, flags=re.IGNORECASE)
-        if match and match.start() >= 20:
-            cut_positions.append(match.start())
-
-    if not cut_positions:
-        return text
-    return text[:min(cut_positions)].rstrip()
-
-
-def _email_html_to_display_text(value, limit=12000, strip_quotes=True):
-    import html
-    import re
-    from django.utils.html import strip_tags
-    from django.utils.text import Truncator
-
-    raw = html.unescape(str(value or ''))
-    raw = _strip_html_style_blocks(raw)
-    if strip_quotes:
-        raw = _strip_quoted_html_for_display(raw)
-    text = re.sub(r'(?i)<\s*br\s*/?\s*>', '\n', raw)
-    text = re.sub(r'(?i)<\s*/\s*(p|div|li|tr|h[1-6]|blockquote|section|article|table|head|body|html)\s*>', '\n', text)
-    text = re.sub(r'(?i)<\s*li(?:\s[^>]*)?>', '- ', text)
-    text = strip_tags(text)
-    text = html.unescape(text).replace('\xa0', ' ')
-    text = _strip_css_text_artifacts(text)
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    lines = [' '.join(line.split()) for line in text.split('\n')]
-    normalized = []
-    previous_blank = False
-    for line in lines:
-        if not line:
-            if not previous_blank and normalized:
-                normalized.append('')
-            previous_blank = True
-            continue
-        normalized.append(line)
-        previous_blank = False
-    return Truncator(_strip_quoted_text_for_display('\n'.join(normalized).strip())).chars(limit)
-
-
-def _email_text_preview(email, limit=160):
-    from django.utils.html import strip_tags
-    from django.utils.text import Truncator
-
-    raw = email.body_html or email.body or ''
-    if email.body_html or _looks_like_email_html(raw):
-        text = _email_html_to_display_text(raw, limit=limit)
-    else:
-        raw = _strip_html_style_blocks(raw)
-        text = strip_tags(raw).replace('\xa0', ' ')
-        text = _strip_css_text_artifacts(text)
-    text = ' '.join(text.split())
-    return Truncator(text).chars(limit)
-
-
-def _email_body_text(email, limit=12000):
-    import html
-    from django.utils.text import Truncator
-
-    raw = email.body_html or email.body or ''
-    if email.body_html or _looks_like_email_html(raw):
-        return _email_html_to_display_text(raw, limit=limit)
-
-    text = raw
-    text = html.unescape(text).replace('\xa0', ' ')
-    text = _strip_css_text_artifacts(text)
-    text = text.replace('\r\n', '\n').replace('\r', '\n')
-    lines = [' '.join(line.split()) for line in text.split('\n')]
-    normalized = []
-    previous_blank = False
-    for line in lines:
-        if not line:
-            if not previous_blank and normalized:
-                normalized.append('')
-            previous_blank = True
-            continue
-        normalized.append(line)
-        previous_blank = False
-
-    return Truncator(_strip_quoted_text_for_display('\n'.join(normalized).strip())).chars(limit)
-
-
 def _ai_workspace_email_context_payload(email):
-    body_text = _email_body_text(email, limit=1600)
-    preview = _email_text_preview(email, limit=220)
+    body_text = email_body_text(email, limit=1600)
+    preview = email_text_preview(email, limit=220)
     thread_id = _email_thread_identifier(email)
 
     followup = _ai_workspace_email_followup(email)
@@ -15794,23 +16017,16 @@ def _ai_workspace_email_context_payload(email):
 
 def _ai_workspace_recent_email_context(user, followup_ids=None, department_id=None, limit=10):
     followup_ids = [item for item in (followup_ids or []) if item]
-    owned_q = Q(user=user) | Q(sender=user) | Q(followup__user=user) | Q(schedule__user=user)
-    queryset = EmailLog.objects.filter(owned_q, is_trashed=False)
-
-    if followup_ids:
-        queryset = queryset.filter(
-            Q(followup_id__in=followup_ids) |
-            Q(schedule__followup_id__in=followup_ids)
-        )
-    elif department_id:
-        queryset = queryset.filter(
-            Q(followup__department_id=department_id) |
-            Q(schedule__followup__department_id=department_id) |
-            Q(schedule__department_id=department_id)
-        )
-
-    emails = list(
-        queryset.select_related(
+    email_ids = recent_email_ids(
+        user,
+        visible_in=VISIBLE_IN_WORKSPACE,
+        followup_ids=followup_ids,
+        department_id=None if followup_ids else department_id,
+        limit=limit,
+    )
+    emails = emails_in_order(
+        email_ids,
+        EmailLog.objects.select_related(
             'followup',
             'followup__company',
             'followup__department',
@@ -15820,13 +16036,9 @@ def _ai_workspace_recent_email_context(user, followup_ids=None, department_id=No
             'schedule__followup',
             'schedule__followup__company',
             'schedule__followup__department',
-        ).distinct().order_by('-received_at', '-sent_at', '-created_at')[:max(limit * 3, limit)]
+        ),
     )
-    emails.sort(key=lambda email: _ai_workspace_email_happened_at(email), reverse=True)
-    return [
-        _ai_workspace_email_context_payload(email)
-        for email in emails[:limit]
-    ]
+    return [_ai_workspace_email_context_payload(email) for email in emails]
 
 
 def _ai_workspace_contact_evidence_date(value):
@@ -17856,12 +18068,14 @@ def _schedule_ai_coach_context(schedule, actor):
         gmail_thread_id__isnull=False,
     ).exclude(gmail_thread_id='').values('gmail_thread_id').distinct().count()
     delivery_text, delivery_total = _schedules_delivery_items_summary(schedule)
-    documents = _schedules_document_actions(schedule, actor)
+    document_context = _schedules_document_context(schedule, actor)
+    documents = _schedules_document_actions(schedule, actor, document_context)
     commercial_checks = _schedules_commercial_checks(
         schedule,
         actor,
         documents,
         email_thread_count,
+        document_context,
     )
 
     related_notes = []
@@ -19946,19 +20160,17 @@ def history_edit_view(request, pk):
             
             # History에 연결된 Schedule이 있다면 Schedule의 DeliveryItem도 동기화
             if history.schedule:
-                # Schedule의 기존 DeliveryItem들 삭제
-                history.schedule.delivery_items_set.all().delete()
-                
-                # History의 새로운 DeliveryItem들을 Schedule에도 복사
-                history_delivery_items = history.delivery_items_set.all()
-                for history_item in history_delivery_items:
-                    DeliveryItem.objects.create(
-                        schedule=history.schedule,
-                        item_name=history_item.item_name,
-                        quantity=history_item.quantity,
-                        unit=history_item.unit,
-                        unit_price=history_item.unit_price
-                    )
+                # History의 새로운 DeliveryItem들로 Schedule 품목을 교체
+                with transaction.atomic():
+                    persist_delivery_items(history.schedule, [
+                        {
+                            'item_name': history_item.item_name,
+                            'quantity': history_item.quantity,
+                            'unit': history_item.unit,
+                            'unit_price': history_item.unit_price,
+                        }
+                        for history_item in history.delivery_items_set.order_by('id')
+                    ])
             
             # 새로운 파일 업로드 처리
             uploaded_files = request.FILES.getlist('files')
@@ -22717,117 +22929,68 @@ def schedule_add_memo_api(request, schedule_id):
         return JsonResponse({'error': f'메모 추가 중 오류가 발생했습니다: {str(e)}'}, status=500)
 
 # 자동완성 API 뷰들
+def _autocomplete_scope(request):
+    """자동완성 인덱스 범위: (검색 가능 여부, UserCompany id). Admin 은 전체(None)."""
+    user_profile = getattr(request.user, 'userprofile', None)
+    if getattr(request, 'is_admin', False) or (user_profile is not None and user_profile.role == 'admin'):
+        return True, None
+    # 일반 사용자: 같은 회사 소속 사용자들이 생성한 업체/부서만 검색 가능
+    user_company = getattr(request, 'user_company', None) or getattr(user_profile, 'company', None)
+    if user_company is None:
+        return False, None
+    return True, user_company.pk
+
+
 @login_required
 def company_autocomplete(request):
-    """업체/학교명 자동완성 API"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
+    """업체/학교명 자동완성 API (초성 검색 지원)"""
     query = request.GET.get('q', '').strip()
-    
+
     if len(query) < 1:
         return JsonResponse({'results': []})
-    
-    # Admin 사용자는 모든 업체 검색 가능
-    if getattr(request, 'is_admin', False) or (hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'admin'):
-        companies = Company.objects.filter(name__icontains=query).order_by('name')[:10]
-    else:
-        # 일반 사용자: 같은 회사 소속 사용자들이 생성한 업체만 검색 가능
-        user_company = getattr(request, 'user_company', None)
-        user_profile = getattr(request.user, 'userprofile', None)
-        
-        if user_company:
-            # 미들웨어에서 설정한 user_company 사용
-            same_company_users = User.objects.filter(userprofile__company=user_company)
-            
-            companies = Company.objects.filter(
-                name__icontains=query,
-                created_by__in=same_company_users
-            ).order_by('name')[:10]
-            
-        elif user_profile and user_profile.company:
-            # 백업: UserProfile에서 직접 가져오기
-            same_company_users = User.objects.filter(userprofile__company=user_profile.company)
-            
-            companies = Company.objects.filter(
-                name__icontains=query,
-                created_by__in=same_company_users
-            ).order_by('name')[:10]
-        else:
-            companies = Company.objects.none()
-    
-    results = []
-    for company in companies:
-        results.append({
-            'id': company.id,
-            'text': company.name
-        })
-    
+
+    allowed, user_company_id = _autocomplete_scope(request)
+    if not allowed:
+        return JsonResponse({'results': []})
+
+    results = [
+        {'id': entry.id, 'text': entry.name}
+        for entry in search_companies(user_company_id, query)
+    ]
     return JsonResponse({'results': results})
 
 @login_required
 def department_autocomplete(request):
-    """부서/연구실명 자동완성 API"""
-    import logging
-    logger = logging.getLogger(__name__)
-    
+    """부서/연구실명 자동완성 API (담당자명·이메일, 초성 검색 지원)"""
     query = request.GET.get('q', '').strip()
     company_id = request.GET.get('company') or request.GET.get('company_id')  # 둘 다 지원
-    
+
     if len(query) < 1:
         return JsonResponse({'results': []})
-    
-    # Admin 사용자는 모든 부서 검색 가능
-    if getattr(request, 'is_admin', False) or (hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'admin'):
-        departments = Department.objects.filter(
-            Q(name__icontains=query) |
-            Q(followup_departments__manager__icontains=query) |
-            Q(followup_departments__customer_name__icontains=query) |
-            Q(followup_departments__email__icontains=query)
-        )
-    else:
-        # 일반 사용자: 같은 회사 사용자들이 생성한 업체의 부서만 검색
-        user_company = getattr(request, 'user_company', None)
-        user_profile = getattr(request.user, 'userprofile', None)
-        
-        if user_company:
-            same_company_users = User.objects.filter(userprofile__company=user_company)
-            # 같은 회사 사용자들이 생성한 업체의 부서만 필터링
-            departments = Department.objects.filter(
-                Q(name__icontains=query) |
-                Q(followup_departments__manager__icontains=query) |
-                Q(followup_departments__customer_name__icontains=query) |
-                Q(followup_departments__email__icontains=query),
-                company__created_by__in=same_company_users
-            )
-        elif user_profile and user_profile.company:
-            same_company_users = User.objects.filter(userprofile__company=user_profile.company)
-            departments = Department.objects.filter(
-                Q(name__icontains=query) |
-                Q(followup_departments__manager__icontains=query) |
-                Q(followup_departments__customer_name__icontains=query) |
-                Q(followup_departments__email__icontains=query),
-                company__created_by__in=same_company_users
-            )
-        else:
-            departments = Department.objects.none()
-    
+
+    allowed, user_company_id = _autocomplete_scope(request)
+    if not allowed:
+        return JsonResponse({'results': []})
+
     # 회사가 선택된 경우 해당 회사의 부서만 필터링
     if company_id:
-        departments = departments.filter(company_id=company_id)
-    
-    departments = departments.select_related('company').distinct().order_by('company__name', 'name')[:10]
-    
+        try:
+            company_id = int(company_id)
+        except (TypeError, ValueError):
+            return JsonResponse({'results': []})
+    else:
+        company_id = None
+
     results = []
-    for dept in departments:
+    for entry in search_departments(user_company_id, query, company_id=company_id):
         results.append({
-            'id': dept.id,
-            'text': f"{dept.company.name} - {dept.name}",
-            'company_id': dept.company.id,
-            'company_name': dept.company.name,
-            'department_name': dept.name
+            'id': entry.id,
+            'text': f"{entry.company_name} - {entry.name}",
+            'company_id': entry.company_id,
+            'company_name': entry.company_name,
+            'department_name': entry.name
         })
-    
+
     return JsonResponse({'results': results})
 
 @login_required
@@ -23845,8 +24008,8 @@ def history_update_api(request, history_id):
                 )
                 for file_obj in files_to_delete:
                     # 실제 파일 삭제
-                    if file_obj.file and os.path.exists(file_obj.file.path):
-                        os.remove(file_obj.file.path)
+                    if file_obj.file:
+                        file_obj.file.delete(save=False)
                     # DB에서 삭제
                     file_obj.delete()
                     
@@ -24106,6 +24269,7 @@ def history_update_memo(request, pk):
 
 
 @login_required
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
 def followup_excel_download(request):
     """팔로우업 전체 정보 엑셀 다운로드 (부서별 그룹화)"""
     user_profile = get_user_profile(request.user)
@@ -24494,6 +24658,7 @@ def followup_excel_download(request):
 
 
 @login_required
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
 def followup_basic_excel_download(request):
     """팔로우업 기본 정보 엑셀 다운로드 (권한 체크)"""
     user_profile = get_user_profile(request.user)
@@ -28849,6 +29014,7 @@ def product_replace_reference_api(request):
 
 
 @login_required
+@statement_timeout(EXPORT_STATEMENT_TIMEOUT_MS)
 def products_excel_export_api(request):
     """접근 가능한 전체 제품 XLSX 다운로드."""
     from django.http import HttpResponse
@@ -3,11 +3,23 @@ import mimetypes
 from pathlib import Path
 
 from django.conf import settings
-from django.http import FileResponse, Http404, HttpResponse
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
 from django.views.decorators.http import require_safe
 
+from reporting.services.file_delivery import BytesLRU
+
 
 COMPRESSIBLE_EXTENSIONS = {'.css', '.html', '.js', '.json', '.map', '.svg', '.txt'}
+# frontend/scripts/precompress-assets.mjs 가 빌드 때 만드는 형제 파일. 선호 순서대로.
+PRECOMPRESSED_SUFFIXES = (('br', '.br'), ('gzip', '.gz'))
+DEFAULT_ASSET_CACHE_BYTES = 32 * 1024 * 1024
+ASSET_HEADERS = {
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'X-Content-Type-Options': 'nosniff',
+}
+
+
+_asset_cache = BytesLRU()
 
 
 def _frontend_dist_dir():
@@ -34,17 +46,92 @@ def _content_type(path):
     return guessed or 'application/octet-stream'
 
 
-def _accepts_gzip(request):
-    encodings = request.headers.get('Accept-Encoding', '').lower()
-    return 'gzip' in {part.strip().split(';', 1)[0] for part in encodings.split(',')}
+def _accepted_encodings(request):
+    """Accept-Encoding 중 q=0 이 아닌 인코딩 이름 집합."""
+    accepted = set()
+    for part in request.headers.get('Accept-Encoding', '').lower().split(','):
+        name, _, params = part.strip().partition(';')
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if name:
+            accepted.add(name)
+    return accepted
+
+
+def _etag(stat, encoding=''):
+    """파일 mtime·크기 기반 강한 ETag. 인코딩마다 표현이 다르므로 접미사를 붙인다."""
+    suffix = f'-{encoding}' if encoding else ''
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{suffix}"'
+
+
+def _etag_matches(request, etag):
+    header = request.headers.get('If-None-Match', '')
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    candidates = {value.strip().removeprefix('W/') for value in header.split(',')}
+    return etag in candidates
+
+
+def _not_modified(etag, headers):
+    response = HttpResponseNotModified()
+    response['ETag'] = etag
+    for name, value in headers.items():
+        if name != 'Content-Type':
+            response[name] = value
+    return response
+
+
+def _asset_cache_limit():
+    return int(getattr(settings, 'FRONTEND_ASSET_CACHE_BYTES', DEFAULT_ASSET_CACHE_BYTES))
+
+
+def _compressed_asset(asset_path, stat, accepted):
+    """``(encoding, bytes)`` 또는 압축본을 줄 수 없으면 ``None``.
+
+    빌드 때 만든 ``.br``/``.gz`` 가 원본보다 새로우면 그것을, 없으면 gzip 을 한 번만
+    만들어 메모리 LRU 에 둔다. 두 경우 모두 이후 요청은 메모리에서 바로 나간다.
+    """
+    max_bytes = _asset_cache_limit()
+    for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+        if encoding not in accepted:
+            continue
+        key = (str(asset_path), stat.st_mtime_ns, encoding)
+        content = _asset_cache.get(key)
+        if content is not None:
+            return encoding, content
+        sibling = asset_path.with_name(asset_path.name + suffix)
+        try:
+            sibling_stat = sibling.stat()
+        except OSError:
+            sibling_stat = None
+        if sibling_stat is not None and sibling_stat.st_mtime_ns >= stat.st_mtime_ns:
+            content = sibling.read_bytes()
+        elif encoding == 'gzip':
+            content = gzip.compress(asset_path.read_bytes(), compresslevel=6)
+        else:
+            continue
+        _asset_cache.put(key, content, max_bytes)
+        return encoding, content
+    return None
 
 
 @require_safe
 def react_index(request, path=''):
     index_path = _safe_frontend_file('index.html')
-    response = FileResponse(index_path.open('rb'), content_type='text/html; charset=utf-8')
-    response['Cache-Control'] = 'no-cache'
-    response['X-Content-Type-Options'] = 'nosniff'
+    stat = index_path.stat()
+    etag = _etag(stat)
+    headers = {'Cache-Control': 'no-cache', 'X-Content-Type-Options': 'nosniff'}
+    if _etag_matches(request, etag):
+        return _not_modified(etag, headers)
+    response = FileResponse(index_path.open('rb'), content_type='text/html; charset=utf-8', headers=headers)
+    response['ETag'] = etag
     return response
 
 
@@ -52,19 +139,25 @@ def react_index(request, path=''):
 def react_asset(request, path):
     safe_parts = [part for part in Path(path).parts if part not in ('', '.', '..')]
     asset_path = _safe_frontend_file('assets', *safe_parts)
-    content_type = _content_type(asset_path)
-    headers = {
-        'Cache-Control': 'public, max-age=31536000, immutable',
-        'Content-Type': content_type,
-        'Vary': 'Accept-Encoding',
-        'X-Content-Type-Options': 'nosniff',
-    }
-    if asset_path.suffix.lower() in COMPRESSIBLE_EXTENSIONS and _accepts_gzip(request):
-        content = gzip.compress(asset_path.read_bytes(), compresslevel=6)
+    stat = asset_path.stat()
+    headers = {**ASSET_HEADERS, 'Content-Type': _content_type(asset_path)}
+
+    compressed = None
+    if asset_path.suffix.lower() in COMPRESSIBLE_EXTENSIONS:
+        headers['Vary'] = 'Accept-Encoding'
+        compressed = _compressed_asset(asset_path, stat, _accepted_encodings(request))
+
+    etag = _etag(stat, compressed[0] if compressed else '')
+    if _etag_matches(request, etag):
+        return _not_modified(etag, headers)
+    if compressed:
+        encoding, content = compressed
         response = HttpResponse(content, headers=headers)
-        response['Content-Encoding'] = 'gzip'
-        return response
-    return FileResponse(asset_path.open('rb'), headers=headers)
+        response['Content-Encoding'] = encoding
+    else:
+        response = FileResponse(asset_path.open('rb'), headers=headers)
+    response['ETag'] = etag
+    return response
 
 
 @require_safe
@@ -8,6 +8,8 @@ from django.utils import timezone
 from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_safe
 
+from reporting.services.db_pool import pool_stats, statement_timeout_counts
+
 
 SERVICE_NAME = 'sales-note-backend'
 
@@ -72,6 +74,15 @@ def readyz(request):
         ready = False
         checks['migrations'] = {'status': 'error', 'error': exc.__class__.__name__}
 
+    # 풀 지표는 이 프로세스 것이다. 포화(대기 중인 요청)는 준비 실패로 보지 않는다.
+    stats = pool_stats()
+    if stats is None:
+        checks['databasePool'] = {'status': 'disabled'}
+    else:
+        saturated = stats['waiting'] > 0 and stats['available'] == 0
+        checks['databasePool'] = {'status': 'saturated' if saturated else 'ok', **stats}
+    checks['databasePool']['statementTimeouts'] = statement_timeout_counts()
+
     payload = _base_payload('ok' if ready else 'degraded')
     payload['debug'] = bool(settings.DEBUG)
     payload['checks'] = checks
@@ -0,0 +1,63 @@
+import os
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import Http404
+from django.views.decorators.http import require_safe
+
+from reporting.services.file_delivery import BytesLRU, serve_file
+
+
+# 업로드 경로는 FileSystemStorage 가 충돌 시 새 이름을 붙이므로 같은 이름이 다른
+# 내용으로 바뀌지 않는다. 서류 템플릿·로고처럼 교체될 수 있는 경로는 넣지 않는다.
+DEFAULT_IMMUTABLE_PREFIXES = (
+    'history_files/',
+    'schedule_files/',
+    'service_reports/',
+    'calibration_certificates/',
+    'email_attachments/',
+    'scheduled_email_attachments/',
+    'generated_documents/',
+)
+IMMUTABLE_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'private, no-cache'
+
+_media_cache = BytesLRU()
+
+
+def _media_path(name):
+    """저장소 이름을 로컬 파일 경로로. 콘텐츠 주소 저장소면 blob 경로가 된다."""
+    try:
+        path = default_storage.path(name)
+    except (FileNotFoundError, NotImplementedError, SuspiciousFileOperation, ValueError):
+        raise Http404('Media file not found')
+    if not path or not os.path.isfile(path):
+        raise Http404('Media file not found')
+    return path
+
+
+def media_cache_control(name):
+    prefixes = getattr(settings, 'MEDIA_IMMUTABLE_PREFIXES', DEFAULT_IMMUTABLE_PREFIXES)
+    if name.startswith(tuple(prefixes)):
+        return IMMUTABLE_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+
+@require_safe
+def media_file(request, path):
+    """``/media/<path>`` 전송: sendfile/Range/ETag, 프록시 위임, 작은 파일 메모리 캐시."""
+    name = path.replace('\\', '/').lstrip('/')
+    if not name or any(part in ('', '.', '..') for part in name.split('/')):
+        raise Http404('Media file not found')
+    file_path = _media_path(name)
+    return serve_file(
+        request,
+        file_path,
+        filename=os.path.basename(name),
+        as_attachment=False,
+        cache_control=media_cache_control(name),
+        memory_cache=_media_cache,
+        memory_cache_bytes=int(getattr(settings, 'MEDIA_MEMORY_CACHE_BYTES', 0) or 0),
+        memory_cache_max_file=int(getattr(settings, 'MEDIA_MEMORY_CACHE_MAX_FILE_BYTES', 256 * 1024)),
+    )
@@ -37,6 +37,7 @@ else:
         "django.middleware.csrf.CsrfViewMiddleware",
         "django.contrib.auth.middleware.AuthenticationMiddleware",
         "reporting.write_api.WriteBearerMiddleware",
+        "reporting.db_routing.ReadReplicaMiddleware",
         "django.contrib.messages.middleware.MessageMiddleware",
         "django.middleware.clickjacking.XFrameOptionsMiddleware",
         "reporting.middleware.TimezoneMiddleware",
@@ -57,6 +58,18 @@ else:
     else:
         _sqlite_database_name = BASE_DIR / "db.sqlite3"
     DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": _sqlite_database_name}}
+    # 읽기 복제본 라우팅 (reporting.db_routing). settings_production 과 같은 값.
+    READ_REPLICA_ALIAS = "replica"
+    READ_REPLICA_STICKY_SECONDS = int(os.environ.get("READ_REPLICA_STICKY_SECONDS", "10"))
+    DATABASE_ROUTERS = ["reporting.db_routing.ReadReplicaRouter"]
+    # 로컬에서 라우팅을 확인할 때: db.sqlite3 를 복사한 파일을 복제본으로 쓴다.
+    _replica_sqlite_database = os.environ.get('REPLICA_SQLITE_DATABASE')
+    if _replica_sqlite_database:
+        DATABASES[READ_REPLICA_ALIAS] = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / _replica_sqlite_database,
+            "TEST": {"MIRROR": "default"},
+        }
     AUTH_PASSWORD_VALIDATORS = [{"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"}, {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"}, {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"}, {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"}]
     
     # 최적화된 인증 백엔드 (UserProfile select_related)
@@ -140,3 +153,6 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Seoul'
 CELERY_ENABLE_UTC = False
+
+# 테스트 러너: 프로세스별 임시 MEDIA_ROOT, 병렬 실행, 느린 테스트 클래스 리포트
+TEST_RUNNER = 'reporting.tests.runner.ReportingTestRunner'
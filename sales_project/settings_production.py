@@ -111,6 +111,7 @@ MIDDLEWARE = [
     'django.middleware.csrf.CsrfViewMiddleware',  # CSRF 미들웨어 재활성화
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'reporting.write_api.WriteBearerMiddleware',  # 쓰기 토큰 인증 (Auth 뒤, CompanyFilter 앞)
+    'reporting.db_routing.ReadReplicaMiddleware',  # 읽기 전용 요청을 복제본으로 (REPLICA_DATABASE_URL)
     'reporting.middleware.TimezoneMiddleware',  # 한국 시간대 미들웨어
     'reporting.middleware.CompanyFilterMiddleware',  # 회사 필터링 미들웨어 추가
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -141,15 +142,59 @@ WSGI_APPLICATION = 'sales_project.wsgi.application'
 # Database
 # Railway/Production PostgreSQL
 
+# 읽기 복제본 라우팅 (reporting.db_routing). DATABASES 에 READ_REPLICA_ALIAS 가 있을 때만 동작하고,
+# 쓰기 요청 뒤 READ_REPLICA_STICKY_SECONDS 동안 같은 브라우저의 읽기는 primary 에 고정한다.
+READ_REPLICA_ALIAS = 'replica'
+READ_REPLICA_STICKY_SECONDS = int(os.environ.get('READ_REPLICA_STICKY_SECONDS', '10'))
+DATABASE_ROUTERS = ['reporting.db_routing.ReadReplicaRouter']
+
+# 풀 크기는 gunicorn 스레드 수에 맞춘다 (railway.toml 의 --threads 와 같은 GUNICORN_THREADS).
+# 스레드마다 영구 연결을 잡던 방식과 달리 요청 동안만 연결을 빌리고, 모자라면
+# DB_POOL_TIMEOUT 초까지 기다린 뒤 실패한다. DB_POOL=0 이면 예전 영구 연결로 돌아간다
+# (PgBouncer 등 외부 풀러를 앞에 둘 때).
+GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', '4'))
+DB_POOL_ENABLED = os.environ.get('DB_POOL', '1') == '1'
+DB_POOL_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', '1'))
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', str(GUNICORN_THREADS)))
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', '10'))
+# 웹 요청 연결의 기본 statement_timeout. 무거운 export/파이프라인 뷰는
+# reporting.services.db_pool.statement_timeout 으로 따로 늘린다.
+# wsgi/asgi 진입점만 SALES_NOTE_WEB_PROCESS=1 을 켠다. startCommand 의 migrate, 백필·재계산·백업 같은
+# 관리 명령과 Celery 작업은 전체 테이블을 훑으므로 이 제한 없이(0) 연결한다.
+WEB_PROCESS = os.environ.get('SALES_NOTE_WEB_PROCESS') == '1'
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', '30000')) if WEB_PROCESS else 0
+
+def _postgres_database(url):
+    database = dj_database_url.parse(
+        url,
+        conn_max_age=0 if DB_POOL_ENABLED else 600,
+        conn_health_checks=True,
+    )
+    options = database.setdefault('OPTIONS', {})
+    if DB_STATEMENT_TIMEOUT_MS > 0:
+        options['options'] = ' '.join(filter(None, [
+            options.get('options', ''),
+            f'-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}',
+        ]))
+    if DB_POOL_ENABLED:
+        options['pool'] = {
+            'min_size': DB_POOL_MIN_SIZE,
+            'max_size': max(DB_POOL_MAX_SIZE, DB_POOL_MIN_SIZE),
+            'timeout': DB_POOL_TIMEOUT,
+        }
+    return database
+
+
 if 'DATABASE_URL' in os.environ:
     # Use DATABASE_URL from environment (PostgreSQL plugin in Railway)
-    DATABASES = {
-        'default': dj_database_url.parse(
-            os.environ.get('DATABASE_URL'),
-            conn_max_age=600,
-            conn_health_checks=True,
-        )
-    }
+    DATABASES = {'default': _postgres_database(os.environ.get('DATABASE_URL'))}
+    # 읽기 복제본: 읽기 토큰(MCP) 요청과 read_only_view 리포트 GET 을 이쪽으로 보낸다
+    # (reporting.db_routing). 없으면 모든 요청이 primary 를 쓴다.
+    if os.environ.get('REPLICA_DATABASE_URL'):
+        DATABASES[READ_REPLICA_ALIAS] = {
+            **_postgres_database(os.environ['REPLICA_DATABASE_URL']),
+            'TEST': {'MIRROR': 'default'},
+        }
 else:
     # Local SQLite for development
     DATABASES = {
@@ -159,6 +204,18 @@ else:
         }
     }
 
+# Cache
+# 사용자 범위·신원 캐시는 워커 간에 공유되어야 버전 무효화가 모든 프로세스에 반영됩니다.
+# REDIS_URL 이 없으면 Django 기본(LocMem, 프로세스별) 캐시를 그대로 사용합니다.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+            'KEY_PREFIX': 'sales-note',
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -270,6 +327,40 @@ MEDIA_ROOT = '/data/media'
 # 기본 파일 저장소 (로컬 파일 시스템)
 DEFAULT_FILE_STORAGE = 'django.core.files.storage.FileSystemStorage'
 
+# 다중 레플리카용 콘텐츠 주소 미디어 저장소 (MEDIA_STORAGE=cas 일 때만 사용)
+# 기존 파일은 `python manage.py migrate_media_to_cas` 로 옮긴다.
+if os.environ.get('MEDIA_STORAGE', '').lower() == 'cas':
+    if os.environ.get('MEDIA_BLOB_BACKEND', 'local').lower() == 's3':
+        MEDIA_BLOB_STORE = {
+            'BACKEND': 's3',
+            'ENDPOINT_URL': os.environ.get('MEDIA_S3_ENDPOINT_URL', ''),
+            'BUCKET': os.environ.get('MEDIA_S3_BUCKET', ''),
+            'ACCESS_KEY_ID': os.environ.get('MEDIA_S3_ACCESS_KEY_ID', ''),
+            'SECRET_ACCESS_KEY': os.environ.get('MEDIA_S3_SECRET_ACCESS_KEY', ''),
+            'REGION': os.environ.get('MEDIA_S3_REGION', 'us-east-1'),
+            'PREFIX': os.environ.get('MEDIA_S3_PREFIX', ''),
+            'CACHE_DIR': os.path.join(MEDIA_ROOT, 'blob-cache'),
+        }
+    else:
+        MEDIA_BLOB_STORE = {
+            'BACKEND': 'local',
+            'LOCATION': os.environ.get('MEDIA_BLOB_DIR', os.path.join(MEDIA_ROOT, 'blobs')),
+        }
+    STORAGES = {
+        'default': {'BACKEND': 'reporting.services.media_storage.ContentAddressedStorage'},
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+
+# 첨부파일 전송 위임: 'x-accel'(nginx) / 'x-sendfile'(Apache 등) / 빈 값이면 앱이 직접 전송
+FILE_DELIVERY_BACKEND = os.environ.get('FILE_DELIVERY_BACKEND', '')
+# nginx internal location 접두사 (MEDIA_ROOT 를 alias 로 가리켜야 한다)
+FILE_DELIVERY_ACCEL_PREFIX = os.environ.get('FILE_DELIVERY_ACCEL_PREFIX', '/protected-media/')
+# /media/ 전송: 'django-static' 이면 예전 django.views.static.serve (비교·롤백용)
+MEDIA_SERVE_BACKEND = os.environ.get('MEDIA_SERVE_BACKEND', '')
+# 작은 미디어 파일 메모리 캐시 (0 이면 끔)
+MEDIA_MEMORY_CACHE_BYTES = int(os.environ.get('MEDIA_MEMORY_CACHE_BYTES', '0') or 0)
+MEDIA_MEMORY_CACHE_MAX_FILE_BYTES = int(os.environ.get('MEDIA_MEMORY_CACHE_MAX_FILE_BYTES', str(256 * 1024)))
+
 # 파일 정리 정책 설정
 FILE_CLEANUP_SETTINGS = {
     # 영구 보관 파일 (삭제하지 않음)
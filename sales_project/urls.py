@@ -23,7 +23,7 @@ from django.views.static import serve
 from django.shortcuts import redirect
 from urllib.parse import urljoin
 
-from . import frontend_views, health
+from . import frontend_views, health, media_views
 
 
 DEFAULT_FRONTEND_URL = 'https://sales-note-frontend-production.up.railway.app/'
@@ -67,8 +67,14 @@ if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 
 # 프로덕션 환경에서 미디어 파일 서빙 (Railway Volume 사용)
-# static() 함수는 DEBUG=True일 때만 작동하므로, re_path + serve 사용
+# static() 함수는 DEBUG=True일 때만 작동하므로 전용 뷰(sendfile·Range·ETag·프록시 위임)를 쓴다.
+# MEDIA_SERVE_BACKEND='django-static' 이면 비교·롤백용으로 예전 static.serve 경로를 쓴다.
 if not settings.DEBUG and settings.MEDIA_ROOT:
-    urlpatterns += [
-        re_path(r'^media/(?P<path>.*)$', serve, {'document_root': settings.MEDIA_ROOT}),
-    ]
+    if getattr(settings, 'MEDIA_SERVE_BACKEND', '') == 'django-static':
+        urlpatterns += [
+            re_path(r'^media/(?P<path>.*)$', serve, {'document_root': settings.MEDIA_ROOT}),
+        ]
+    else:
+        urlpatterns += [
+            re_path(r'^media/(?P<path>.+)$', media_views.media_file, name='media_file'),
+        ]
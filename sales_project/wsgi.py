@@ -12,5 +12,7 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sales_project.settings')
+# 웹 요청 연결에만 기본 statement_timeout 을 건다 (settings_production.DB_STATEMENT_TIMEOUT_MS).
+os.environ.setdefault('SALES_NOTE_WEB_PROCESS', '1')
 
 application = get_wsgi_application()
@@ -4,6 +4,7 @@ import os
 import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
 
@@ -23,10 +24,42 @@ def require_binary(name):
         raise RuntimeError(f'{name} is not available on PATH.')
 
 
-def run_command(command, env=None):
-    printable = ' '.join(command)
+def run_command(command, env=None, printable=None):
+    printable = printable or ' '.join(command)
     print(f'RUN {printable}')
+    started = time.perf_counter()
     subprocess.run(command, check=True, env=env)
+    elapsed = time.perf_counter() - started
+    print(f'TIME {elapsed:.2f}s {printable}')
+    return elapsed
+
+
+def database_env(database_url):
+    env = os.environ.copy()
+    env['DATABASE_URL'] = database_url
+    return env
+
+
+def jsonl_commands(source_url, target_url, output_dir):
+    # simple_backup/restore_backup 은 DATABASE_URL 로 대상 DB 를 고른다.
+    return [
+        (
+            [sys.executable, 'manage.py', 'simple_backup', '--format=jsonl', '--keep=1', '--output-dir', str(output_dir)],
+            source_url,
+        ),
+        ([sys.executable, 'manage.py', 'migrate', '--noinput'], target_url),
+        ([sys.executable, 'manage.py', 'flush', '--noinput'], target_url),
+        ([sys.executable, 'manage.py', 'restore_backup', '<latest-jsonl-backup>'], target_url),
+    ]
+
+
+def latest_jsonl_backup(output_dir):
+    candidates = sorted(
+        path for path in Path(output_dir).glob('sales_note_backup_*') if (path / 'manifest.json').is_file()
+    )
+    if not candidates:
+        raise RuntimeError(f'No JSONL backup found in {output_dir}.')
+    return candidates[-1]
 
 
 def main():
@@ -37,6 +70,12 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Print planned commands without running them.')
     parser.add_argument('--allow-target-reset', action='store_true', help='Allow pg_restore --clean against the target DB.')
     parser.add_argument('--skip-checks', action='store_true', help='Skip manage.py check and runtime audit on restored target.')
+    parser.add_argument(
+        '--format',
+        choices=('pgdump', 'jsonl'),
+        default='pgdump',
+        help='pgdump uses pg_dump/pg_restore; jsonl uses simple_backup --format=jsonl and restore_backup.',
+    )
     args = parser.parse_args()
 
     if args.dry_run and not args.source_url:
@@ -77,6 +116,9 @@ def main():
         ],
     ]
 
+    if args.format == 'jsonl':
+        return run_jsonl_rehearsal(args, output_dir)
+
     if args.dry_run:
         print('Backup/restore rehearsal dry-run')
         print(f'Source: {redact_url(args.source_url)}')
@@ -113,11 +155,45 @@ def main():
     ])
 
     if not args.skip_checks:
-        env = os.environ.copy()
-        env['DATABASE_URL'] = args.target_url
-        run_command([sys.executable, 'manage.py', 'check'], env=env)
-        run_command([sys.executable, 'manage.py', 'audit_runtime_config', '--json'], env=env)
+        run_target_checks(args.target_url)
+
+    print('Backup/restore rehearsal completed.')
+    return 0
+
+
+def run_target_checks(target_url):
+    env = database_env(target_url)
+    run_command([sys.executable, 'manage.py', 'check'], env=env)
+    run_command([sys.executable, 'manage.py', 'audit_runtime_config', '--json'], env=env)
+
+
+def run_jsonl_rehearsal(args, output_dir):
+    jsonl_dir = output_dir / 'jsonl'
+    commands = jsonl_commands(args.source_url, args.target_url, jsonl_dir)
+    if args.dry_run:
+        print('Backup/restore rehearsal dry-run (jsonl)')
+        print(f'Source: {redact_url(args.source_url)}')
+        print(f'Target: {redact_url(args.target_url)}')
+        for command, database_url in commands:
+            print(f'PLAN DATABASE_URL={redact_url(database_url)} ' + ' '.join(command))
+        if not args.skip_checks:
+            print('PLAN python manage.py check')
+            print('PLAN python manage.py audit_runtime_config --json')
+        return 0
+
+    jsonl_dir.mkdir(parents=True, exist_ok=True)
+    timings = []
+    for command, database_url in commands:
+        if '<latest-jsonl-backup>' in command:
+            command = [str(latest_jsonl_backup(jsonl_dir)) if part == '<latest-jsonl-backup>' else part for part in command]
+        printable = f'DATABASE_URL={redact_url(database_url)} ' + ' '.join(command)
+        timings.append((command[2], run_command(command, env=database_env(database_url), printable=printable)))
+
+    if not args.skip_checks:
+        run_target_checks(args.target_url)
 
+    for name, elapsed in timings:
+        print(f'SUMMARY {name} {elapsed:.2f}s')
     print('Backup/restore rehearsal completed.')
     return 0
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+"""Local load generator for /media/ delivery.
+
+Start the backend twice against the same MEDIA_ROOT, once with the old
+``django.views.static.serve`` path and once with the dedicated view, e.g.
+
+    MEDIA_SERVE_BACKEND=django-static gunicorn sales_project.wsgi --bind 127.0.0.1:8001 --threads 4
+    gunicorn sales_project.wsgi --bind 127.0.0.1:8002 --threads 4
+
+then compare them with the same load:
+
+    python scripts/benchmark_media_serving.py \
+        --target static=http://127.0.0.1:8001 --target media=http://127.0.0.1:8002 \
+        --path /media/generated_documents/2026/01/quote.pdf --requests 2000 --concurrency 16
+"""
+import argparse
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+import requests
+
+
+@dataclass
+class TargetResult:
+    name: str
+    requests: int = 0
+    errors: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+    latencies: list = field(default_factory=list)
+    statuses: dict = field(default_factory=dict)
+
+    def summary(self):
+        latencies = sorted(self.latencies)
+
+        def percentile(value):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(len(latencies) * value))] * 1000
+
+        return {
+            'target': self.name,
+            'requests': self.requests,
+            'errors': self.errors,
+            'statuses': self.statuses,
+            'rps': round(self.requests / self.elapsed, 1) if self.elapsed else 0.0,
+            'mbPerSecond': round(self.bytes / self.elapsed / 1024 / 1024, 2) if self.elapsed else 0.0,
+            'p50Ms': round(percentile(0.50), 2),
+            'p95Ms': round(percentile(0.95), 2),
+            'p99Ms': round(percentile(0.99), 2),
+            'meanMs': round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+        }
+
+
+def parse_target(value):
+    name, separator, url = value.partition('=')
+    if not separator:
+        return value, value
+    return name, url
+
+
+def run_target(name, base_url, paths, args):
+    result = TargetResult(name=name)
+    lock = threading.Lock()
+    local = threading.local()
+    headers = {}
+    if args.range:
+        headers['Range'] = args.range
+    urls = [urljoin(f'{base_url.rstrip("/")}/', path.lstrip('/')) for path in paths]
+
+    def session():
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+        return local.session
+
+    def one(index):
+        url = urls[index % len(urls)]
+        request_headers = dict(headers)
+        if args.revalidate and hasattr(local, 'etags') and url in local.etags:
+            request_headers['If-None-Match'] = local.etags[url]
+        started = time.perf_counter()
+        try:
+            response = session().get(url, headers=request_headers, timeout=args.timeout)
+            size = len(response.content)
+            ok = response.status_code < 400
+            if args.revalidate and response.headers.get('ETag'):
+                local.etags = getattr(local, 'etags', {})
+                local.etags[url] = response.headers['ETag']
+            status = response.status_code
+        except requests.RequestException as exc:
+            size, ok, status = 0, False, exc.__class__.__name__
+        latency = time.perf_counter() - started
+        with lock:
+            result.requests += 1
+            result.bytes += size
+            result.latencies.append(latency)
+            result.statuses[str(status)] = result.statuses.get(str(status), 0) + 1
+            if not ok:
+                result.errors += 1
+
+    for index in range(min(args.warmup, args.requests)):
+        one(index)
+    result = TargetResult(name=name)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(one, range(args.requests)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare /media/ delivery throughput and latency between backends.')
+    parser.add_argument('--target', action='append', required=True, help='name=base URL (repeatable).')
+    parser.add_argument('--path', action='append', required=True, help='Media path to request (repeatable).')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--warmup', type=int, default=20)
+    parser.add_argument('--timeout', type=float, default=30.0)
+    parser.add_argument('--range', default='', help='Send this Range header, e.g. bytes=0-65535.')
+    parser.add_argument('--revalidate', action='store_true', help='Replay ETags with If-None-Match after the first hit.')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    summaries = []
+    for value in args.target:
+        name, base_url = parse_target(value)
+        summaries.append(run_target(name, base_url, args.path, args).summary())
+
+    if args.json:
+        print(json.dumps(summaries, ensure_ascii=False, indent=2))
+    else:
+        for summary in summaries:
+            print(
+                f"{summary['target']}: {summary['rps']} req/s, {summary['mbPerSecond']} MB/s, "
+                f"p50 {summary['p50Ms']}ms, p95 {summary['p95Ms']}ms, p99 {summary['p99Ms']}ms, "
+                f"errors {summary['errors']} {summary['statuses']}"
+            )
+    return 0 if all(summary['errors'] == 0 for summary in summaries) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
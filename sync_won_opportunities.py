@@ -7,59 +7,68 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sales_project.settings')
 django.setup()
 
-from reporting.models import OpportunityTracking, Schedule
+from decimal import Decimal
+
+from reporting.models import FollowUp, OpportunityTracking, Schedule
+from reporting.services.opportunity_revenue import recompute_opportunity_revenue
 from django.utils import timezone
 
 def sync_won_opportunities():
     """수주 완료된 일정이 있는 영업기회를 수주 상태로 변경"""
     
     # 수주 상태가 아닌 영업기회 중에서 수주 완료된 일정이 있는 것들 찾기
-    opportunities = OpportunityTracking.objects.exclude(current_stage='won')
+    opportunities = list(OpportunityTracking.objects.exclude(current_stage='won').select_related('followup'))
     
-    total = opportunities.count()
+    total = len(opportunities)
     print(f"총 {total}개의 영업기회를 확인합니다...\n")
     
-    updated_count = 0
+    # 고객별 가장 늦은 수주 완료 일정을 한 번에 읽는다 (방문일이 같으면 나중에 만든 일정)
+    latest_won_by_followup = {}
+    won_schedules = Schedule.objects.filter(
+        followup_id__in={opp.followup_id for opp in opportunities},
+        activity_type='won',  # 수주 일정
+        status='completed'  # 완료된 상태
+    ).order_by('followup_id', 'visit_date', 'id')
+    for schedule in won_schedules:
+        latest_won_by_followup[schedule.followup_id] = schedule
+    
+    changed = []
     skipped_count = 0
+    now = timezone.now()
     
     for opp in opportunities:
-        # 해당 팔로우업의 수주 완료된 일정 찾기
-        won_schedules = Schedule.objects.filter(
-            followup=opp.followup,
-            activity_type='won',  # 수주 일정
-            status='completed'  # 완료된 상태
-        ).order_by('visit_date')
-        
-        if won_schedules.exists():
-            # 수주 완료된 일정이 있으면 영업기회를 수주 상태로 변경
-            latest_won = won_schedules.last()
-            
-            # 실제 매출액 계산 (수주 일정의 금액 또는 예상 매출액)
-            if latest_won.amount and latest_won.amount > 0:
-                actual_revenue = latest_won.amount
-            else:
-                actual_revenue = opp.expected_revenue
-            
-            # 백로그 금액 (실제 매출액과 동일하게 설정)
-            backlog_amount = actual_revenue
-            
-            # 상태 업데이트
-            old_stage = opp.current_stage
-            opp.current_stage = 'won'
-            opp.probability = 100
-            opp.actual_revenue = actual_revenue
-            opp.backlog_amount = backlog_amount
-            opp.won_date = latest_won.visit_date
-            opp.save()
-            
-            updated_count += 1
-            print(f"[{updated_count}] ✓ {opp.followup.customer_name or '고객명 미정'}")
-            print(f"   - 단계: {old_stage} → won")
-            print(f"   - 수주일: {latest_won.visit_date}")
-            print(f"   - 매출액: {actual_revenue:,}원")
-            print()
-        else:
+        latest_won = latest_won_by_followup.get(opp.followup_id)
+        if latest_won is None:
             skipped_count += 1
+            continue
+        
+        # 상태 업데이트 (save() 가 하던 가중 매출 계산을 그대로 한다)
+        old_stage = opp.current_stage
+        opp.current_stage = 'won'
+        opp.probability = 100
+        opp.weighted_revenue = opp.expected_revenue or Decimal('0')
+        opp.won_date = latest_won.visit_date
+        opp.updated_at = now
+        changed.append(opp)
+        
+        print(f"[{len(changed)}] ✓ {opp.followup.customer_name or '고객명 미정'}")
+        print(f"   - 단계: {old_stage} → won")
+        print(f"   - 수주일: {latest_won.visit_date}")
+        print()
+    
+    updated_count = len(changed)
+    if changed:
+        OpportunityTracking.objects.bulk_update(
+            changed,
+            ['current_stage', 'probability', 'weighted_revenue', 'won_date', 'updated_at'],
+            batch_size=500,
+        )
+        # 실제 매출·백로그는 일정 저장 때와 같은 규칙(완료 납품 기준)으로 한 번에 다시 계산한다
+        recalculated = recompute_opportunity_revenue([opp.id for opp in changed])
+        print(f"매출 재계산: {recalculated}건")
+        # 수주 전환은 save() 처럼 고객 등급을 다시 계산한다
+        for followup in FollowUp.objects.filter(id__in={opp.followup_id for opp in changed}):
+            followup.calculate_customer_grade()
     
     print(f"\n{'='*50}")
     print(f"완료: {updated_count}건 수주로 변경, {skipped_count}건 변경 없음")